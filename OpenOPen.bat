@@ -1,3 +1,3 @@
 @echo off
-python main.py
+python main.py %*
 pause
\ No newline at end of file
@@ -7,8 +7,7 @@ a = Analysis(
     pathex=['.'],  # Ensure current directory is set
     binaries=[],
     datas=[
-        ('icons', 'icons'),  # Copy the icons folder
-        ('styles', 'styles'),  # Copy the styles folder
+        # icons/ and styles/ are compiled into resources_rc.py
         ('resources', 'resources'),  # Copy the resources folder
         ('app_icon_multi.ico', '.'),  # Copy the icon to the root of the output folder
     ],
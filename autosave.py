@@ -0,0 +1,512 @@
+import json
+import os
+import shutil
+import time
+from PyQt5 import sip
+from PyQt5.QtCore import (
+    QByteArray, QDataStream, QIODevice, QObject, QTimer, QThreadPool, QLockFile, QStandardPaths, pyqtSignal
+)
+from PyQt5.QtGui import QTextCursor, QTextDocument, QTextDocumentFragment, QTextFormat
+from document_io import kept_on_this_thread, new_document, read_text, to_html
+from jobs import Job
+
+AUTOSAVE_INTERVAL = 3000  # ms between journal flushes
+COMPACT_INTERVAL = 5 * 60 * 1000  # ms between snapshots while there are edits
+COMPACT_JOURNAL_BYTES = 4 << 20  # snapshot early once the journal gets this big
+LARGE_EDIT_CHARS = 1 << 20  # edits bigger than this are folded into a snapshot straight away
+COMPACT_RETRY_DELAY = 30 * 1000  # ms before a failed snapshot is tried again
+
+
+def autosave_root():
+    base = QStandardPaths.writableLocation(QStandardPaths.GenericDataLocation)
+    return os.path.join(base or os.path.expanduser('~'), 'OpenOPen', 'autosave')
+
+
+def snapshot_path(session_dir, generation):
+    return os.path.join(session_dir, f'snapshot-{generation}.html')
+
+
+def journal_path(session_dir, generation):
+    return os.path.join(session_dir, f'journal-{generation}.jsonl')
+
+
+def base_path(session_dir, generation, extension):
+    return os.path.join(session_dir, f'base-{generation}{extension.lower()}')
+
+
+def generations(session_dir, prefix):
+    found = []
+    for name in os.listdir(session_dir):
+        if name.startswith(prefix + '-') and '.tmp' not in name:
+            try:
+                found.append(int(name[len(prefix) + 1:].split('.')[0]))
+            except ValueError:
+                pass
+    return sorted(found)
+
+
+def write_snapshot(document, path, progress=None):
+    """Write a full snapshot; runs on a pool thread with a document nothing else is using."""
+    html = to_html(document)
+    tmp = path + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as file:
+        file.write(html)
+        file.flush()
+        os.fsync(file.fileno())
+    os.replace(tmp, path)
+    return path
+
+
+def copy_base(source, path, progress=None):
+    """Keep a copy of the file a document was opened from, as it was then; runs on a pool thread."""
+    tmp = path + '.tmp'
+    shutil.copyfile(source, tmp)
+    os.replace(tmp, path)
+    return path
+
+
+def load_base(path):
+    """Open a base file with the loader the editor used for its original."""
+    extension = os.path.splitext(path)[1]
+    if extension == '.docx':
+        from docx_importer import import_docx
+        return import_docx(path)
+    if extension == '.rtf':
+        from document_io import load_rtf
+        return load_rtf(path)
+    if extension == '.oop':
+        from native_format import load_native
+        return load_native(path)
+    document = new_document()
+    document.setPlainText(read_text(path))
+    return document
+
+
+def compact_files(session_dir, last, path, progress=None):
+    """Write the document as of the end of journal last as a new snapshot; runs on a pool thread."""
+    return write_snapshot(recover(session_dir, last), path)
+
+
+def select(document, position, length):
+    """A cursor over length characters from position, short of the final paragraph separator."""
+    cursor = QTextCursor(document)
+    end = min(position + length, document.characterCount() - 1)
+    cursor.setPosition(min(position, end))
+    cursor.setPosition(end, QTextCursor.KeepAnchor)
+    return cursor
+
+
+def fragment_document(entry):
+    """The entry's new content as a document of its own.
+
+    A selection that starts with a list item comes back from HTML with an
+    empty paragraph in front, which would otherwise be inserted as well.
+    """
+    source = QTextDocument()
+    source.setHtml(entry['h'])
+    if 'n' in entry:
+        # What was selected when the entry was made: short of the final paragraph separator
+        length = min(entry['a'], entry['n'] - 1 - entry['p'])
+        if source.characterCount() - 1 == length + 1 and source.begin().length() == 1:
+            QTextCursor(source).deleteChar()
+    return source
+
+
+def format_data(text_format):
+    """A format as base64 QDataStream data."""
+    data = QByteArray()
+    QDataStream(data, QIODevice.WriteOnly) << text_format
+    return bytes(data.toBase64()).decode('ascii')
+
+
+def read_format(data):
+    text_format = QTextFormat()
+    QDataStream(QByteArray.fromBase64(data.encode('ascii'))) >> text_format
+    return text_format
+
+
+class FormatTable:
+    """Numbers the formats an entry uses, each streamed once, like native_format's table."""
+
+    def __init__(self, document):
+        self.all = document.allFormats()
+        self.indexes = {}  # (document format index, stripped) -> table index
+        self.table = []
+
+    def add(self, index, strip=False):
+        key = (index, strip)
+        found = self.indexes.get(key)
+        if found is None:
+            text_format = self.all[index]
+            if strip:
+                # List membership is recorded per paragraph; the list object itself isn't
+                text_format = QTextFormat(text_format)
+                text_format.clearProperty(QTextFormat.ObjectIndex)
+            found = self.indexes[key] = len(self.table)
+            self.table.append(format_data(text_format))
+        return found
+
+    def addFormat(self, text_format):
+        self.table.append(format_data(text_format))
+        return len(self.table) - 1
+
+
+def record_blocks(document, table, position, added):
+    """The formats of the paragraphs that start in the range, and of the lists they're in.
+
+    Lists are keyed by object index; each notes whether it carries on from
+    the paragraph before the range or into the one after, which replay
+    joins it to instead of starting a new list.
+    """
+    block = document.findBlock(position)
+    if block.position() < position:
+        block = block.next()
+    blocks, lists, objects = [], {}, {}
+    first = last = None
+    while block.isValid() and block.position() <= position + added:
+        text_list = block.textList()
+        key = None
+        if text_list is not None:
+            key = str(text_list.objectIndex())
+            if key not in lists:
+                lists[key] = [table.addFormat(text_list.format())]
+                objects[key] = text_list
+        blocks.append([block.position() - position, table.add(block.blockFormatIndex(), True),
+                       table.add(block.charFormatIndex()), key])
+        first = first or block
+        last = block
+        block = block.next()
+    for key, text_list in objects.items():
+        if first.previous().isValid() and first.previous().textList() == text_list:
+            lists[key].append('before')
+        elif last.next().isValid() and last.next().textList() == text_list:
+            lists[key].append('after')
+        else:
+            lists[key].append(None)
+    return blocks, lists
+
+
+def record_chars(document, table, position, added):
+    """(offset, length, format) for each stretch of one char format in the range."""
+    runs = []
+    block = document.findBlock(position)
+    end = position + added
+    while block.isValid() and block.position() < end:
+        it = block.begin()
+        while not it.atEnd():
+            fragment = it.fragment()
+            start, stop = max(fragment.position(), position), min(fragment.position() + fragment.length(), end)
+            if fragment.isValid() and start < stop:
+                runs.append([start - position, stop - start, table.add(fragment.charFormatIndex())])
+            it += 1
+        block = block.next()
+    return runs
+
+
+def apply_blocks(document, formats, position, blocks, lists):
+    cursor = QTextCursor(document)
+    found = {}  # list key -> list in document
+    before = document.findBlock(position + blocks[0][0]).previous()
+    after = document.findBlock(position + blocks[-1][0]).next()
+    for offset, block_format, char_format, key in blocks:
+        block = document.findBlock(position + offset)
+        if block.position() != position + offset:
+            raise ValueError(f"The journal expected a paragraph to start at {position + offset}")
+        cursor.setPosition(block.position())
+        cursor.setBlockFormat(formats[block_format].toBlockFormat())
+        cursor.setBlockCharFormat(formats[char_format].toCharFormat())
+        if key is None:
+            continue
+        text_list = found.get(key)
+        if text_list is None:
+            list_format, joins = lists[key]
+            neighbour = {'before': before, 'after': after}.get(joins)
+            if neighbour is not None and neighbour.isValid() and neighbour.textList() is not None:
+                text_list = neighbour.textList()
+            else:
+                text_list = cursor.createList(formats[list_format].toListFormat())
+            found[key] = text_list
+        if block.textList() is None:
+            text_list.add(block)
+
+
+def apply_chars(document, formats, position, runs):
+    cursor = QTextCursor(document)
+    for offset, length, char_format in runs:
+        cursor.setPosition(position + offset)
+        cursor.setPosition(position + offset + length, QTextCursor.KeepAnchor)
+        cursor.setCharFormat(formats[char_format].toCharFormat())
+
+
+def apply_entry(document, entry):
+    cursor = select(document, entry['p'], entry['r'])
+    formats = [read_format(data) for data in entry.get('f', ())]
+    if 'c' in entry and entry.get('t') == cursor.selectedText():
+        # Only the formats changed, e.g. a paragraph made into a list item; inserting
+        # the text again would merge and split paragraphs on the way
+        apply_chars(document, formats, entry['p'], entry['c'])
+    elif entry['h']:
+        cursor.insertFragment(QTextDocumentFragment(fragment_document(entry)))
+    else:
+        cursor.removeSelectedText()
+    # HTML leaves out the formats of a paragraph the range starts with, and
+    # gives list items lists of their own
+    if entry.get('b'):
+        apply_blocks(document, formats, entry['p'], entry['b'], entry['l'])
+    if 'n' in entry and document.characterCount() != entry['n']:
+        raise ValueError(f"The journal entry at {entry['p']} left the document {document.characterCount()} "
+                         f"characters long instead of {entry['n']}; the journal doesn't match its snapshot")
+
+
+def recover(session_dir, last=None):
+    """Rebuild the document of a session from its latest snapshot or base and the journals since.
+
+    With last, only the journals up to generation last are replayed.
+    """
+    def found(prefix):
+        return [generation for generation in generations(session_dir, prefix) if last is None or generation <= last]
+
+    snapshots, bases = found('snapshot'), found('base')
+    generation = max(snapshots[-1:] + bases[-1:], default=0)
+    if snapshots and snapshots[-1] == generation:
+        document = QTextDocument()
+        with open(snapshot_path(session_dir, generation), 'r', encoding='utf-8') as file:
+            document.setHtml(file.read())
+    elif bases:
+        name = next(name for name in os.listdir(session_dir)
+                    if name.startswith(f'base-{generation}.') and not name.endswith('.tmp'))
+        with kept_on_this_thread():
+            document = load_base(os.path.join(session_dir, name))
+    else:
+        document = QTextDocument()
+    for journal in found('journal'):
+        if journal < generation:
+            continue
+        with open(journal_path(session_dir, journal), 'r', encoding='utf-8') as file:
+            for line in file:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    break  # Torn write at the moment of the crash
+                apply_entry(document, entry)
+    document.setModified(True)
+    return document
+
+
+def orphaned_sessions():
+    """Session directories left behind by editors that didn't exit cleanly."""
+    root = autosave_root()
+    if not os.path.isdir(root):
+        return []
+    sessions = []
+    for name in sorted(os.listdir(root)):
+        session_dir = os.path.join(root, name)
+        lock = QLockFile(os.path.join(session_dir, 'lock'))
+        # A live editor holds its lock; a crashed one leaves a stale lock we can take
+        if os.path.isdir(session_dir) and lock.tryLock(0):
+            lock.unlock()
+            if generations(session_dir, 'snapshot') or generations(session_dir, 'journal'):
+                sessions.append(session_dir)
+            else:
+                shutil.rmtree(session_dir, ignore_errors=True)
+    return sessions
+
+
+def discard_session(session_dir):
+    shutil.rmtree(session_dir, ignore_errors=True)
+
+
+class Autosave(QObject):
+    """Journals edits to disk so unsaved work survives a crash.
+
+    Every contentsChange is recorded as the replaced range plus the new
+    content as an HTML fragment, so the cost of an entry follows the size of
+    the edit. HTML drops some paragraph and list formats, so entries that
+    take in whole paragraphs carry those formats too, and a change of
+    formats alone replays as formats rather than as new text. Every entry
+    notes the length it left the document at, so a journal that doesn't
+    fit its snapshot fails to recover instead of drifting. Entries are appended to the current journal every few seconds.
+    A document starts from a base: a copy of the file it was opened from, the
+    files of the session it was recovered from, or nothing for a new one.
+    Now and then the journal is compacted: a pool thread replays the journal
+    onto the last snapshot or base and writes the result as a new snapshot,
+    after which the older files are deleted. The GUI thread never reads the
+    document as a whole.
+    """
+    failed = pyqtSignal(str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        root = autosave_root()
+        self.sessionDir = os.path.join(root, f'{os.getpid()}-{int(time.time() * 1000)}')
+        os.makedirs(self.sessionDir, exist_ok=True)
+        self.lock = QLockFile(os.path.join(self.sessionDir, 'lock'))
+        self.lock.tryLock(0)
+
+        self.document = None
+        self.generation = 0
+        self.pending = []
+        self.journal = None
+        self.journalBytes = 0
+        self.compacting = None
+
+        self.flushTimer = QTimer(self)
+        self.flushTimer.setSingleShot(True)
+        self.flushTimer.setInterval(AUTOSAVE_INTERVAL)
+        self.flushTimer.timeout.connect(self.flush)
+        self.compactTimer = QTimer(self)
+        self.compactTimer.setInterval(COMPACT_INTERVAL)
+        self.compactTimer.timeout.connect(self.compactIfDirty)
+        self.compactTimer.start()
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+
+    def setDocument(self, document, source=None):
+        """Journal edits to document from now on.
+
+        source is the file document was just opened from, or the session
+        directory it was recovered from; without one, document is taken to
+        be new and empty.
+        """
+        # The view deletes the document it owned when it is handed a new one
+        if self.document is not None and not sip.isdeleted(self.document):
+            self.document.contentsChange.disconnect(self.recordChange)
+        self.document = document
+        document.documentLayout()  # contentsChange is only emitted once a layout exists
+        document.contentsChange.connect(self.recordChange)
+        # A different document starts over from a base of its own
+        self.startGeneration()
+        if source is not None and os.path.isdir(source):
+            self.adoptSession(source)
+        elif source is not None:
+            job = Job(copy_base, source, base_path(self.sessionDir, self.generation, os.path.splitext(source)[1]))
+            job.signals.finished.connect(lambda path, generation=self.generation: self.dropBefore(generation))
+            job.signals.failed.connect(self.baseFailed)
+            self.pool.start(job)
+        else:
+            open(base_path(self.sessionDir, self.generation, '.txt'), 'w').close()
+            self.dropBefore(self.generation)
+
+    def adoptSession(self, session_dir):
+        """Take over the files of a recovered session, which describe the document as it is now."""
+        offset = self.generation
+        last = offset
+        for name in os.listdir(session_dir):
+            prefix, _, rest = name.partition('-')
+            if prefix in ('snapshot', 'journal', 'base') and '.tmp' not in name:
+                number, dot, extension = rest.partition('.')
+                generation = offset + int(number)
+                os.replace(os.path.join(session_dir, name),
+                           os.path.join(self.sessionDir, f'{prefix}-{generation}{dot}{extension}'))
+                last = max(last, generation)
+        self.dropBefore(offset)
+        # Edits go to a journal after everything that was recovered
+        self.generation = last
+        self.startGeneration()
+
+    def startGeneration(self):
+        self.flush()
+        if self.journal is not None:
+            self.journal.close()
+            self.journal = None
+        self.generation += 1
+        self.journalBytes = 0
+
+    def recordChange(self, position, removed, added):
+        document = self.document
+        entry = {'p': position, 'r': removed, 'a': added, 'h': '', 'n': document.characterCount()}
+        if added:
+            cursor = select(document, position, added)
+            entry['h'] = cursor.selection().toHtml()
+            table = FormatTable(document)
+            if added == removed:
+                # Tells a change of formats from new text of the same length on replay
+                entry['t'] = cursor.selectedText()
+                entry['c'] = record_chars(document, table, position, cursor.selectionEnd() - position)
+            if added == removed or document.findBlock(position) != document.findBlock(position + added):
+                entry['b'], entry['l'] = record_blocks(document, table, position, added)
+            if table.table:
+                entry['f'] = table.table
+        self.pending.append(json.dumps(entry))
+        if added > LARGE_EDIT_CHARS:
+            self.compact()
+        elif not self.flushTimer.isActive():
+            self.flushTimer.start()
+
+    def openJournal(self):
+        if self.journal is None:
+            self.journal = open(journal_path(self.sessionDir, self.generation), 'a', encoding='utf-8')
+
+    def flush(self):
+        if not self.pending:
+            return
+        self.openJournal()
+        data = '\n'.join(self.pending) + '\n'
+        self.pending = []
+        self.journal.write(data)
+        self.journal.flush()
+        os.fsync(self.journal.fileno())
+        self.journalBytes += len(data)
+        if self.journalBytes > COMPACT_JOURNAL_BYTES:
+            self.compact()
+
+    def compactIfDirty(self):
+        if self.journalBytes or self.pending:
+            self.compact()
+
+    def compact(self):
+        """Start writing a new snapshot; edits from now on go to a new journal."""
+        if self.document is None or self.compacting is not None:
+            return
+        self.startGeneration()
+        generation = self.generation
+        job = Job(compact_files, self.sessionDir, generation - 1, snapshot_path(self.sessionDir, generation))
+        job.signals.finished.connect(lambda path: self.compacted(generation))
+        job.signals.failed.connect(self.compactFailed)
+        self.compacting = job
+        self.pool.start(job)
+
+    def compacted(self, generation):
+        self.compacting = None
+        self.dropBefore(generation)
+
+    def dropBefore(self, generation):
+        """Delete the files the snapshot or base of generation has made redundant."""
+        for prefix in ('snapshot', 'journal', 'base'):
+            for name in os.listdir(self.sessionDir):
+                if name.startswith(prefix + '-') and '.tmp' not in name:
+                    try:
+                        if int(name[len(prefix) + 1:].split('.')[0]) < generation:
+                            os.remove(os.path.join(self.sessionDir, name))
+                    except (ValueError, OSError):
+                        pass
+
+    def compactFailed(self, message):
+        self.compacting = None
+        # Nothing is lost: the older files stay until a snapshot succeeds
+        self.failed.emit(message)
+        QTimer.singleShot(COMPACT_RETRY_DELAY, self.compact)
+
+    def baseFailed(self, message):
+        """The opened file couldn't be copied, e.g. it's already gone; snapshot the document itself once."""
+        self.failed.emit(message)
+        if self.document is None or sip.isdeleted(self.document):
+            return
+        self.startGeneration()
+        generation = self.generation
+        job = Job(write_snapshot, self.document.clone(), snapshot_path(self.sessionDir, generation))
+        job.signals.finished.connect(lambda path: self.compacted(generation))
+        job.signals.failed.connect(self.compactFailed)
+        self.compacting = job
+        self.pool.start(job)
+
+    def close(self):
+        """Clean shutdown: nothing to recover, so drop the session."""
+        self.flushTimer.stop()
+        self.compactTimer.stop()
+        self.pool.waitForDone()
+        if self.journal is not None:
+            self.journal.close()
+            self.journal = None
+        self.lock.unlock()
+        discard_session(self.sessionDir)
@@ -0,0 +1,141 @@
+"""Benchmark for docx_exporter.export_to_docx.
+
+Generates large synthetic documents under the offscreen Qt platform and
+reports export time and runs-per-paragraph for the streaming exporter
+next to the old per-character loop. The streaming exporter's run
+properties are checked against the order the schema requires, which Word
+is stricter about than python-docx.
+
+    python benchmarks/bench_docx_export.py --paragraphs 2000 5000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import zipfile
+from xml.etree import ElementTree
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from docx import Document
+from docx.shared import Pt, RGBColor
+from PyQt5.QtWidgets import QApplication, QTextEdit
+from PyQt5.QtGui import QColor, QFont, QTextCharFormat, QTextCursor
+
+from docx_exporter import export_to_docx
+
+W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+# The sequence of CT_RPr in ECMA-376 Part 1
+RPR_ORDER = ('rStyle rFonts b bCs i iCs caps smallCaps strike dstrike outline shadow emboss imprint noProof '
+             'snapToGrid vanish webHidden color spacing w kern position sz szCs highlight u effect bdr shd '
+             'fitText vertAlign rtl cs em lang eastAsianLayout specVanish oMath').split()
+
+WORDS = "lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor".split()
+
+
+def build_document(text_edit, paragraphs):
+    """Fill text_edit with paragraphs of mixed bold/italic/underlined/colored runs."""
+    styles = [
+        (QFont.Normal, False, False, QColor(0, 0, 0)),
+        (QFont.Bold, False, False, QColor(0, 0, 0)),
+        (QFont.Normal, True, False, QColor(200, 0, 0)),
+        (QFont.Normal, False, True, QColor(0, 0, 0)),
+    ]
+    cursor = QTextCursor(text_edit.document())
+    cursor.beginEditBlock()
+    for p in range(paragraphs):
+        if p:
+            cursor.insertBlock()
+        for i in range(8):
+            weight, italic, underline, color = styles[(p + i) % len(styles)]
+            char_format = QTextCharFormat()
+            char_format.setFontWeight(weight)
+            char_format.setFontItalic(italic)
+            char_format.setFontUnderline(underline)
+            char_format.setForeground(color)
+            cursor.insertText(' '.join(WORDS[i:i + 4]) + ' ', char_format)
+    cursor.endEditBlock()
+
+
+def legacy_export_to_docx(text_edit, filename):
+    """The original per-character exporter, kept here as the baseline."""
+    doc = Document()
+    cursor = text_edit.textCursor()
+    for block_num in range(text_edit.document().blockCount()):
+        block = text_edit.document().findBlockByNumber(block_num)
+        cursor.setPosition(block.position())
+        cursor.movePosition(QTextCursor.EndOfBlock, QTextCursor.KeepAnchor)
+        paragraph = doc.add_paragraph()
+        for char_index in range(cursor.selectionStart(), cursor.selectionEnd()):
+            cursor.setPosition(char_index)
+            cursor.movePosition(QTextCursor.NextCharacter, QTextCursor.KeepAnchor)
+            char_format = cursor.charFormat()
+            run = paragraph.add_run(cursor.selectedText())
+            run.font.name = char_format.font().family()
+            run.font.size = Pt(char_format.font().pointSize())
+            run.bold = char_format.font().bold()
+            run.italic = char_format.font().italic()
+            run.underline = char_format.font().underline()
+            color = char_format.foreground().color()
+            run.font.color.rgb = RGBColor(color.red(), color.green(), color.blue())
+        paragraph.add_run('\n')
+    doc.save(filename)
+
+
+def property_order_errors(filename):
+    """Every w:rPr in the package whose children are out of schema order, as part: tags."""
+    errors = []
+    with zipfile.ZipFile(filename) as archive:
+        for part in ('word/styles.xml', 'word/document.xml'):
+            for properties in ElementTree.fromstring(archive.read(part)).iter(W + 'rPr'):
+                tags = [child.tag[len(W):] for child in properties]
+                if tags != sorted(tags, key=RPR_ORDER.index):
+                    errors.append(f"{part}: {' '.join(tags)}")
+    return errors
+
+
+def measure(exporter, text_edit, filename):
+    start = time.perf_counter()
+    exporter(text_edit, filename)
+    elapsed = time.perf_counter() - start
+    with zipfile.ZipFile(filename) as archive:
+        xml_size = archive.getinfo('word/document.xml').file_size
+    doc = Document(filename)
+    paragraphs = doc.paragraphs
+    runs = sum(len(p.runs) for p in paragraphs)
+    return elapsed, runs / max(len(paragraphs), 1), xml_size
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--paragraphs', type=int, nargs='+', default=[200, 1000])
+    parser.add_argument('--skip-legacy', action='store_true',
+                        help="don't run the per-character baseline (it is very slow)")
+    args = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    exporters = [('streaming', export_to_docx)]
+    if not args.skip_legacy:
+        exporters.append(('legacy', legacy_export_to_docx))
+
+    failed = False
+    print(f"{'paragraphs':>10} {'exporter':>9} {'seconds':>9} {'runs/para':>10} {'document.xml':>13}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for count in args.paragraphs:
+            text_edit = QTextEdit()
+            build_document(text_edit, count)
+            for name, exporter in exporters:
+                filename = os.path.join(tmp, f'{name}_{count}.docx')
+                elapsed, runs, xml_size = measure(exporter, text_edit, filename)
+                print(f"{count:>10} {name:>9} {elapsed:>9.3f} {runs:>10.1f} {xml_size:>13,}")
+                if exporter is export_to_docx:
+                    for error in property_order_errors(filename):
+                        print(f"run properties out of schema order in {error}")
+                        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,124 @@
+"""Benchmark for docx_importer.import_docx.
+
+Exports large synthetic documents with export_to_docx under the offscreen
+Qt platform and times loading them back with the iterparse importer, in
+process and spread over a process pool, next to the old python-docx loop:
+
+    python benchmarks/bench_docx_import.py --paragraphs 20000 100000 --workers 4
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import zipfile
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from docx import Document
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtGui import QTextCursor, QTextListFormat
+
+from document_io import new_document
+from docx_exporter import export_to_docx
+from docx_importer import char_format_for, import_docx, list_style_for
+from docx_reader import read_docx
+from synthetic import build_document
+
+
+def legacy_import_docx(filename):
+    """The python-docx importer, kept here as the baseline."""
+    doc = Document(filename)
+    document = new_document()
+    document.setUndoRedoEnabled(False)
+    cursor = QTextCursor(document)
+    cursor.beginEditBlock()
+    current_list = None
+    style_fonts = {}
+    for index, para in enumerate(doc.paragraphs):
+        list_style = list_style_for(para.style.name)
+        if index:
+            cursor.insertBlock()
+        if current_list is None or current_list.format().style() != list_style:
+            block = cursor.block()
+            if block.textList() is not None:
+                block.textList().remove(block)
+                block_format = cursor.blockFormat()
+                block_format.setIndent(0)
+                cursor.setBlockFormat(block_format)
+            current_list = None
+            if list_style is not None:
+                list_format = QTextListFormat()
+                list_format.setStyle(list_style)
+                current_list = cursor.createList(list_format)
+        for run in para.runs:
+            font = run.font
+            style_id = run._r.style
+            if style_id not in style_fonts:
+                style_fonts[style_id] = run.style.font if style_id is not None and run.style is not None else None
+            style = style_fonts[style_id]
+
+            def inherited(value, name):
+                return getattr(style, name) if value is None and style is not None else value
+            size = inherited(font.size, 'size')
+            rgb = font.color.rgb if font.color else None
+            if rgb is None and style is not None and style.color is not None:
+                rgb = style.color.rgb
+            cursor.insertText(run.text, char_format_for(
+                inherited(font.name, 'name'), size.pt if size else None,
+                bool(inherited(run.bold, 'bold')), bool(inherited(run.italic, 'italic')),
+                bool(inherited(run.underline, 'underline')), tuple(rgb) if rgb else None))
+    cursor.endEditBlock()
+    document.setUndoRedoEnabled(True)
+    return document
+
+
+def parse_only(filename, workers):
+    # Just the XML side, without filling a QTextDocument
+    for future in read_docx(filename, workers):
+        future.result()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--paragraphs', type=int, nargs='+', default=[20000, 100000])
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help="processes for the pooled runs")
+    parser.add_argument('--skip-legacy', action='store_true', help="don't run the python-docx baseline")
+    args = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    importers = [
+        ('iterparse', lambda f: import_docx(f, workers=1)),
+        (f'pool x{args.workers}', lambda f: import_docx(f, workers=args.workers)),
+        ('parse only', lambda f: parse_only(f, 1)),
+        (f'parse x{args.workers}', lambda f: parse_only(f, args.workers)),
+    ]
+    if not args.skip_legacy:
+        importers.insert(0, ('python-docx', legacy_import_docx))
+
+    print(f"{'paragraphs':>10} {'document.xml':>13} {'importer':>12} {'seconds':>9} {'speedup':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for count in args.paragraphs:
+            source = build_document(count)
+            filename = os.path.join(tmp, f'{count}.docx')
+            export_to_docx(source, filename)
+            with zipfile.ZipFile(filename) as archive:
+                xml_size = archive.getinfo('word/document.xml').file_size
+            expected = source.toPlainText()
+            baseline = None
+            for name, importer in importers:
+                start = time.perf_counter()
+                document = importer(filename)
+                elapsed = time.perf_counter() - start
+                if document is not None and document.toPlainText() != expected:
+                    print(f"{name}: text differs from the exported document", file=sys.stderr)
+                baseline = baseline or elapsed
+                print(f"{count:>10} {xml_size:>13,} {name:>12} {elapsed:>9.3f} {baseline / elapsed:>7.1f}x")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,171 @@
+"""Export benchmark and regression check.
+
+Exports synthetic documents of --pages pages through each exporter and
+records wall time, memory and output size:
+
+    python benchmarks/bench_exporters.py --pages 10 100 --save baseline.json
+    python benchmarks/bench_exporters.py --pages 10 100 --compare baseline.json
+
+Every case runs in a fresh process so peak RSS belongs to that export alone.
+peak_rss_kb is the process high-water mark after the export and rss_growth_kb
+how far the export raised it; python_peak_kb is tracemalloc's peak for
+Python-level allocations made during the export. --compare exits with status 1
+when a metric is worse than the baseline by more than --threshold.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BENCH_DIR)
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# name -> (module, function, file extension)
+EXPORTERS = {
+    'docx': ('docx_exporter', 'export_to_docx', 'docx'),
+    'pdf-reportlab': ('pdf_exporter', 'export_to_pdf', 'pdf'),
+    'pdf-qprinter': ('document_io', 'export_pdf', 'pdf'),
+}
+
+# Metrics compared against a baseline; lower is better for all of them
+METRICS = ('seconds', 'python_peak_kb', 'rss_growth_kb', 'bytes')
+# Differences smaller than this are noise, whatever the relative change
+NOISE_FLOOR = {'seconds': 0.05, 'python_peak_kb': 256, 'rss_growth_kb': 2048, 'bytes': 0}
+
+
+def max_rss_kb():
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss // 1024 if sys.platform == 'darwin' else rss  # bytes on macOS, KB elsewhere
+
+
+def run_case(exporter, pages, repeat, out_dir):
+    """Build a document and export it; runs in its own process."""
+    from PyQt5.QtWidgets import QApplication
+    from synthetic import PARAGRAPHS_PER_PAGE, build_document
+
+    app = QApplication.instance() or QApplication(['bench'])
+    module, name, ext = EXPORTERS[exporter]
+    export = getattr(__import__(module), name)
+    document = build_document(pages * PARAGRAPHS_PER_PAGE)
+    filename = os.path.join(out_dir, f'{exporter}_{pages}.{ext}')
+
+    rss_before = max_rss_kb()
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        export(document, filename)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    rss_after = max_rss_kb()
+
+    # tracemalloc slows Python code down a lot, so it gets a run of its own
+    tracemalloc.start()
+    export(document, filename)
+    python_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {
+        'seconds': round(best, 4),
+        'python_peak_kb': python_peak // 1024,
+        'peak_rss_kb': rss_after,
+        'rss_growth_kb': rss_after - rss_before if rss_after is not None else None,
+        'bytes': os.path.getsize(filename),
+    }
+
+
+def available(exporter):
+    try:
+        __import__(EXPORTERS[exporter][0])
+    except ImportError:
+        return False
+    return True
+
+
+def run(exporters, pages_list, repeat):
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        # One task per process: max_tasks_per_child needs 3.11, so use a pool per case
+        for pages in pages_list:
+            for exporter in exporters:
+                with ProcessPoolExecutor(max_workers=1, mp_context=get_context('spawn')) as pool:
+                    results[f'{exporter}/{pages}'] = pool.submit(run_case, exporter, pages, repeat, tmp).result()
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Print a comparison table; returns the list of regressed case/metric names."""
+    regressions = []
+    print(f"{'case':>20} {'metric':>15} {'baseline':>12} {'current':>12} {'change':>8}")
+    for case, current in results.items():
+        before = baseline.get(case)
+        if before is None:
+            print(f"{case:>20} {'(new case)':>15}")
+            continue
+        for metric in METRICS:
+            old, new = before.get(metric), current.get(metric)
+            if old is None or new is None:
+                continue
+            change = (new - old) / old if old else 0.0
+            flag = ''
+            if change > threshold and new - old > NOISE_FLOOR[metric]:
+                regressions.append(f'{case} {metric}')
+                flag = '  REGRESSED'
+            print(f"{case:>20} {metric:>15} {old:>12,} {new:>12,} {change:>+8.1%}{flag}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--pages', type=int, nargs='+', default=[10, 100])
+    parser.add_argument('--exporters', nargs='+', choices=sorted(EXPORTERS), default=sorted(EXPORTERS))
+    parser.add_argument('--repeat', type=int, default=1, help="exports per case; the fastest time is kept")
+    parser.add_argument('--save', metavar='JSON', help="write the results as a baseline")
+    parser.add_argument('--compare', metavar='JSON', help="compare against a saved baseline")
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help="allowed relative regression per metric (default 0.25)")
+    args = parser.parse_args(argv)
+
+    exporters = [name for name in args.exporters if available(name)]
+    for name in sorted(set(args.exporters) - set(exporters)):
+        print(f"skipping {name}: {EXPORTERS[name][0]} can't be imported", file=sys.stderr)
+
+    results = run(exporters, args.pages, args.repeat)
+    print(f"{'case':>20} {'seconds':>9} {'py peak KB':>11} {'RSS +KB':>9} {'bytes':>12}")
+    for case, result in results.items():
+        print(f"{case:>20} {result['seconds']:>9.3f} {result['python_peak_kb']:>11,} "
+              f"{result['rss_growth_kb'] if result['rss_growth_kb'] is not None else '-':>9} {result['bytes']:>12,}")
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as file:
+            json.dump({
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'results': results,
+            }, file, indent=2, sort_keys=True)
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as file:
+            baseline = json.load(file)['results']
+        print()
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) over {args.threshold:.0%}: {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
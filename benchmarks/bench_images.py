@@ -0,0 +1,111 @@
+"""Benchmark for opening and showing picture-heavy DOCX files.
+
+Writes a DOCX with --pictures large JPEGs under the offscreen Qt platform,
+then opens it in a ZoomableTextEdit and paints every page twice, once
+with the view's ImageHandler and once with Qt's own image handling, which
+decodes each picture at full size every time it's drawn. Reports open and
+paint times and how much resident memory each way took:
+
+    python benchmarks/bench_images.py --pictures 100 --size 3000x2000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtCore import QBuffer, QByteArray, QIODevice
+from PyQt5.QtGui import QColor, QImage, QPainter, QTextCursor
+from PyQt5.QtWidgets import QApplication
+
+import images
+import zoomable_text_edit
+from bench_tabs import resident_bytes
+from document_io import new_document
+from docx_exporter import export_to_docx
+from docx_importer import import_docx
+from zoomable_text_edit import ZoomableTextEdit
+
+
+def jpeg(width, height, seed):
+    image = QImage(width, height, QImage.Format_RGB32)
+    painter = QPainter(image)
+    for band in range(16):
+        painter.fillRect(0, band * height // 16, width, height // 16 + 1,
+                         QColor.fromHsv((seed * 37 + band * 15) % 360, 160, 220))
+    painter.end()
+    data = QByteArray()
+    buffer = QBuffer(data)
+    buffer.open(QIODevice.WriteOnly)
+    image.save(buffer, 'JPEG', 85)
+    return bytes(data)
+
+
+def build_docx(filename, pictures, width, height):
+    document = new_document()
+    cursor = QTextCursor(document)
+    for number in range(pictures):
+        if number:
+            cursor.insertBlock()
+        cursor.insertText(f"Figure {number + 1}")
+        cursor.insertBlock()
+        name = images.add_image(document, jpeg(width, height, number), 'jpeg')
+        # Sized to fit the page, as a word processor would show it
+        cursor.insertImage(images.image_format(name, 600, 600 * height // width))
+    export_to_docx(document, filename)
+    return os.path.getsize(filename)
+
+
+def paint_all(view):
+    layout = view.document().documentLayout()
+    view.setPageCount(layout.pageCount())
+    target = QImage(view.textEdit.pageWidth, view.textEdit.pageHeight, QImage.Format_ARGB32)
+    for page in view.pages:
+        painter = QPainter(target)
+        page.paintContents(painter, page.boundingRect())
+        painter.end()
+
+
+def measure(filename, handler):
+    zoomable_text_edit.install_handler = handler
+    images.thumbnails.clear()
+    rss = resident_bytes()
+    start = time.perf_counter()
+    document = import_docx(filename)
+    view = ZoomableTextEdit()
+    view.setDocument(document)
+    opened = time.perf_counter()
+    paint_all(view)
+    painted = time.perf_counter()
+    paint_all(view)
+    repainted = time.perf_counter()
+    return opened - start, painted - opened, repainted - painted, (resident_bytes() - rss) / (1 << 20)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--pictures', type=int, default=100)
+    parser.add_argument('--size', default='3000x2000', help="picture size in pixels")
+    args = parser.parse_args(argv)
+    width, height = map(int, args.size.split('x'))
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = os.path.join(tmp, 'pictures.docx')
+        size = build_docx(filename, args.pictures, width, height)
+        print(f"{args.pictures} pictures of {width}x{height}, {size / (1 << 20):.1f} MB file")
+        print(f"{'handler':>10} {'open s':>8} {'paint s':>8} {'repaint s':>10} {'rss MB':>8}")
+        # Qt's handler first, so memory the first run frees can't flatter the thumbnails
+        for name, handler in (('thumbnail', images.install_handler), ('qt', lambda layout: None))[::-1]:
+            opened, painted, repainted, rss = measure(filename, handler)
+            print(f"{name:>10} {opened:>8.3f} {painted:>8.3f} {repainted:>10.3f} {rss:>8.1f}")
+        print(f"thumbnail cache: {len(images.thumbnails.images)} images, {images.thumbnails.used / (1 << 20):.1f} MB")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
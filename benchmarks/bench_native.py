@@ -0,0 +1,109 @@
+"""Benchmark for the native .oop format against RTF and HTML.
+
+Builds synthetic documents under the offscreen Qt platform and times a save
+and load round trip through native_format, once reading the document and
+once reading the editor's DocumentModel mirror, next to rtf_exporter/
+rtf_importer and the toHtml()/setHtml() round trip. First checks that
+formats come back where they were in text with characters outside the
+BMP, which Qt counts as two:
+
+    python benchmarks/bench_native.py --paragraphs 10000 100000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtGui import QFont, QTextCharFormat, QTextCursor
+from PyQt5.QtWidgets import QApplication
+
+from document_io import load_html, new_document, save_html
+from document_model import DocumentModel
+from native_format import load_native, read_model, save_native, write_native
+from rtf_exporter import export_to_rtf
+from rtf_importer import import_rtf
+from synthetic import build_document
+
+
+def save_from_model(document, filename):
+    # What Editor.saveFile does for the document on screen
+    return write_native(read_model(document.findChild(DocumentModel)), filename)
+
+
+def bold_runs(document):
+    """(text, bold) for each fragment of the document."""
+    runs = []
+    block = document.begin()
+    while block.isValid():
+        it = block.begin()
+        while not it.atEnd():
+            fragment = it.fragment()
+            runs.append((fragment.text(), fragment.charFormat().fontWeight() == QFont.Bold))
+            it += 1
+        block = block.next()
+    return runs
+
+
+def check_astral_round_trip(tmp):
+    document = new_document()
+    cursor = QTextCursor(document)
+    bold = QTextCharFormat()
+    bold.setFontWeight(QFont.Bold)
+    cursor.insertText("Smile \U0001F600 ok ")
+    cursor.insertText("BOLD", bold)
+    cursor.insertBlock()
+    cursor.insertText("\U0001D400\U0001D401 math ")
+    cursor.insertText("and \U00020000 too", bold)
+    model = DocumentModel(document)
+    model.setDocument(document)
+    cursor.insertText(" \U0001F600 typed")  # So the model's pieces split around the emoji
+    for name, save in (('document', save_native), ('model', save_from_model)):
+        filename = os.path.join(tmp, f'astral-{name}.oop')
+        save(document, filename)
+        loaded = bold_runs(load_native(filename))
+        if loaded != bold_runs(document):
+            raise AssertionError(f"Formats moved in the round trip from the {name}: {loaded}")
+
+
+def measure(save, load, document, filename):
+    start = time.perf_counter()
+    save(document, filename)
+    saved = time.perf_counter()
+    loaded = load(filename)
+    end = time.perf_counter()
+    if loaded.toPlainText() != document.toPlainText():
+        raise AssertionError(f"{filename} did not round-trip")
+    return saved - start, end - saved, os.path.getsize(filename)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--paragraphs', type=int, nargs='+', default=[1000, 10000])
+    args = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    formats = [('oop', save_native, load_native), ('oop-model', save_from_model, load_native),
+               ('rtf', export_to_rtf, import_rtf), ('html', save_html, load_html)]
+
+    print(f"{'paragraphs':>10} {'format':>9} {'save s':>8} {'load s':>8} {'bytes':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        check_astral_round_trip(tmp)
+        for count in args.paragraphs:
+            document = build_document(count)
+            # The editor has one attached to every document it shows
+            model = DocumentModel(document)
+            model.setDocument(document)
+            for name, save, load in formats:
+                filename = os.path.join(tmp, f'{name}_{count}.{name.split("-")[0]}')
+                save_seconds, load_seconds, size = measure(save, load, document, filename)
+                print(f"{count:>10} {name:>9} {save_seconds:>8.3f} {load_seconds:>8.3f} {size:>12,}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
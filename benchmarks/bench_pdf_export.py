@@ -0,0 +1,52 @@
+"""Benchmark for the two PDF export engines.
+
+Exports the same synthetic documents through Qt's printer
+(document_io.export_pdf, what Save as PDF uses by default) and through
+reportlab (pdf_exporter.export_to_pdf) and reports time and file size.
+
+    python benchmarks/bench_pdf_export.py --paragraphs 500 5000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtWidgets import QApplication
+
+from document_io import export_pdf
+from pdf_exporter import export_to_pdf
+from synthetic import build_document
+
+
+def measure(exporter, document, filename):
+    start = time.perf_counter()
+    exporter(document, filename)
+    return time.perf_counter() - start, os.path.getsize(filename)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--paragraphs', type=int, nargs='+', default=[500, 5000])
+    args = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    engines = [('qprinter', export_pdf), ('reportlab', export_to_pdf)]
+
+    print(f"{'paragraphs':>10} {'engine':>10} {'seconds':>9} {'bytes':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for count in args.paragraphs:
+            document = build_document(count)
+            for name, exporter in engines:
+                filename = os.path.join(tmp, f'{name}_{count}.pdf')
+                elapsed, size = measure(exporter, document, filename)
+                print(f"{count:>10} {name:>10} {elapsed:>9.3f} {size:>12,}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,58 @@
+"""Benchmark for the RTF reader and writer.
+
+Builds synthetic documents under the offscreen Qt platform and times a save
+and load round trip through rtf_exporter/rtf_importer next to the HTML round
+trip .rtf files used to go through (toHtml() on save, setHtml() on load).
+
+    python benchmarks/bench_rtf.py --paragraphs 2000 20000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtWidgets import QApplication
+
+from document_io import load_html, save_html
+from rtf_exporter import export_to_rtf
+from rtf_importer import import_rtf
+from synthetic import build_document
+
+
+def measure(save, load, document, filename):
+    start = time.perf_counter()
+    save(document, filename)
+    saved = time.perf_counter()
+    loaded = load(filename)
+    end = time.perf_counter()
+    if loaded.toPlainText() != document.toPlainText():
+        raise AssertionError(f"{filename} did not round-trip")
+    return saved - start, end - saved, os.path.getsize(filename)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--paragraphs', type=int, nargs='+', default=[1000, 10000])
+    args = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    formats = [('rtf', export_to_rtf, import_rtf), ('html', save_html, load_html)]
+
+    print(f"{'paragraphs':>10} {'format':>7} {'save s':>8} {'load s':>8} {'bytes':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for count in args.paragraphs:
+            document = build_document(count)
+            for name, save, load in formats:
+                filename = os.path.join(tmp, f'{name}_{count}.rtf')
+                save_seconds, load_seconds, size = measure(save, load, document, filename)
+                print(f"{count:>10} {name:>7} {save_seconds:>8.3f} {load_seconds:>8.3f} {size:>12,}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,145 @@
+"""Benchmark for spell checking a large document while typing into it.
+
+Compiles a synthetic dictionary of --words words and compares opening it
+against reading the word list into a set. Then opens a --paragraphs
+paragraph document in a ZoomableTextEdit and types into the middle of it
+three times: without checking, with a QSyntaxHighlighter that checks every
+word of the blocks it's given against the set, and with a SpellChecker.
+Reports the time turning checking on takes on the GUI thread and the time
+each keystroke spends in the edit:
+
+    python benchmarks/bench_spellcheck.py --words 200000 --paragraphs 20000
+"""
+import argparse
+import os
+import random
+import string
+import sys
+import tempfile
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt5.QtGui import QSyntaxHighlighter, QTextCursor
+from PyQt5.QtWidgets import QApplication
+
+import spellcheck
+from spellcheck import MISSPELLED, NOT_A_WORD, WORD, Dictionary, SpellChecker, compile_dictionary, read_word_list
+from synthetic import WORDS, build_document
+from zoomable_text_edit import ZoomableTextEdit
+
+KEYSTROKES = 200
+
+
+def write_word_list(filename, count):
+    rng = random.Random(1)
+    words = set(WORDS)
+    while len(words) < count:
+        words.add(''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 12))))
+    # Leave one of the document's words out, so there's something to underline
+    words.discard('tempor')
+    with open(filename, 'w', encoding='utf-8') as file:
+        file.write('\n'.join(sorted(words)))
+
+
+class NaiveHighlighter(QSyntaxHighlighter):
+    def __init__(self, document, words):
+        self.words = words
+        super().__init__(document)
+
+    def highlightBlock(self, text):
+        for match in WORD.finditer(text):
+            word = match.group()
+            if len(word) > 1 and not word.isupper() and not NOT_A_WORD.search(word) and word not in self.words \
+                    and word.lower() not in self.words:
+                self.setFormat(match.start(), len(word), MISSPELLED)
+
+
+def pump(app, until):
+    while not until():
+        app.processEvents()
+        time.sleep(0.001)
+
+
+def type_into(app, view, settle):
+    """Seconds per keystroke spent in the edit itself, and the worst one."""
+    cursor = QTextCursor(view.document())
+    cursor.setPosition(view.document().characterCount() // 2)
+    view.textEdit.setTextCursor(cursor)
+    view.followCursor()
+    settle()
+    times = []
+    for number in range(KEYSTROKES):
+        start = time.perf_counter()
+        cursor.insertText(' ' if number % 6 == 5 else 'e')
+        times.append(time.perf_counter() - start)
+        app.processEvents()
+    settle()
+    return sum(times) / len(times), max(times)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--words', type=int, default=200000)
+    parser.add_argument('--paragraphs', type=int, default=20000)
+    args = parser.parse_args(argv)
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, 'words')
+        target = os.path.join(tmp, 'dictionary.oopd')
+        write_word_list(source, args.words)
+        start = time.perf_counter()
+        compile_dictionary([source], target)
+        compiled = time.perf_counter() - start
+        start = time.perf_counter()
+        words = set(read_word_list(source))
+        loaded = time.perf_counter() - start
+        start = time.perf_counter()
+        dictionary = Dictionary(target)
+        opened = time.perf_counter() - start
+        print(f"{args.words:,} words, {os.path.getsize(target) / (1 << 20):.1f} MB compiled in {compiled:.2f} s")
+        print(f"load into a set {loaded * 1000:.1f} ms, open compiled {opened * 1000:.3f} ms")
+        probes = [random.Random(2).choice(WORDS) + suffix for suffix in ('', 'x')] * 5000
+        start = time.perf_counter()
+        for word in probes:
+            word in dictionary
+        print(f"lookups: {len(probes) / (time.perf_counter() - start):,.0f}/s")
+
+        print(f"{args.paragraphs:,} paragraphs, {KEYSTROKES} keystrokes in the middle")
+        print(f"{'checker':>12} {'enable s':>9} {'key ms':>8} {'worst ms':>9}")
+
+        view = ZoomableTextEdit()
+        view.resize(1200, 900)
+        view.show()
+        view.setDocument(build_document(args.paragraphs))
+        key, worst = type_into(app, view, app.processEvents)
+        print(f"{'none':>12} {0:>9.3f} {key * 1000:>8.3f} {worst * 1000:>9.3f}")
+
+        view.setDocument(build_document(args.paragraphs))
+        start = time.perf_counter()
+        highlighter = NaiveHighlighter(view.document(), words)
+        highlighter.rehighlight()  # What it would otherwise do on the next pass of the event loop
+        enabled = time.perf_counter() - start
+        key, worst = type_into(app, view, app.processEvents)
+        print(f"{'highlighter':>12} {enabled:>9.3f} {key * 1000:>8.3f} {worst * 1000:>9.3f}")
+        highlighter.setDocument(None)
+
+        spellcheck._dictionary = dictionary
+        view.setDocument(build_document(args.paragraphs))
+        checker = SpellChecker(view)
+        start = time.perf_counter()
+        checker.setEnabled(True)
+        pump(app, lambda: checker.dictionary is not None)
+        checker.refresh()
+        enabled = time.perf_counter() - start  # on the GUI thread; the checking itself is on the worker
+        key, worst = type_into(app, view, lambda: pump(app, lambda: checker.job is None and not checker.timer.isActive()))
+        print(f"{'spellcheck':>12} {enabled:>9.3f} {key * 1000:>8.3f} {worst * 1000:>9.3f}")
+        print(f"blocks checked: {len(spellcheck.results.results):,} of {view.document().blockCount():,}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,87 @@
+"""Benchmark for tab switching and the memory each open tab costs.
+
+Writes a synthetic document to RTF, opens it --tabs times in the editor
+under the offscreen Qt platform, then cycles through the tabs timing each
+switch. Resident memory is sampled after every tab is opened:
+
+    python benchmarks/bench_tabs.py --tabs 20 --paragraphs 2000 --max-ms 50
+
+With --max-ms it exits with status 1 when the median switch is slower.
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def resident_bytes():
+    """Current resident set size; Linux only, 0 elsewhere."""
+    try:
+        with open('/proc/self/statm') as file:
+            return int(file.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError):
+        return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--tabs', type=int, default=20)
+    parser.add_argument('--paragraphs', type=int, default=2000)
+    parser.add_argument('--max-ms', type=float, help="fail when the median switch takes longer")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as data:
+        # Keep autosave sessions out of the user's data directory
+        os.environ['XDG_DATA_HOME'] = data
+        memory, switches = run(args.tabs, args.paragraphs, data)
+
+    print(f"{'tabs':>6} {'RSS MB':>8} {'per tab MB':>11}")
+    for count in sorted({1, 2, 5, 10, args.tabs} & set(memory)):
+        grown = (memory[count] - memory[1]) / max(count - 1, 1)
+        print(f"{count:>6} {memory[count] / 2**20:>8.1f} {grown / 2**20:>11.2f}")
+    median = statistics.median(switches) * 1000
+    print(f"\nswitch: median {median:.2f} ms, max {max(switches) * 1000:.2f} ms")
+    if args.max_ms is not None and median > args.max_ms:
+        print(f"median switch {median:.2f} ms is over {args.max_ms:g} ms")
+        return 1
+    return 0
+
+
+def run(tabs, paragraphs, tmp):
+    from PyQt5.QtWidgets import QApplication
+    from editor import Editor
+    from rtf_exporter import export_to_rtf
+    from rtf_importer import import_rtf
+    from synthetic import build_document
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    filename = os.path.join(tmp, 'tab.rtf')
+    export_to_rtf(build_document(paragraphs), filename)
+    editor = Editor()
+    editor.show()
+    app.processEvents()
+
+    memory = {}
+    for count in range(1, tabs + 1):
+        editor.applyDocument(import_rtf(filename), filename)
+        app.processEvents()
+        memory[count] = resident_bytes()
+
+    switches = []
+    for step in range(tabs * 2):
+        start = time.perf_counter()
+        editor.tabBar.setCurrentIndex(step % tabs)
+        app.processEvents()
+        switches.append(time.perf_counter() - start)
+    editor.close()
+    return memory, switches
+
+
+if __name__ == '__main__':
+    sys.exit(main())
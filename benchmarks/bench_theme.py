@@ -0,0 +1,66 @@
+"""Timing test for switching between the light and dark themes.
+
+Opens the editor under the offscreen Qt platform and toggles dark mode
+--toggles times, timing the toggle itself and the repaint that follows:
+
+    python benchmarks/bench_theme.py --toggles 20 --max-ms 50
+
+With --max-ms it exits with status 1 when the median toggle is slower.
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--toggles', type=int, default=20)
+    parser.add_argument('--max-ms', type=float, help="fail when the median toggle takes longer")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as data:
+        # Keep autosave sessions out of the user's data directory
+        os.environ['XDG_DATA_HOME'] = data
+        toggles, repaints = run(args.toggles)
+
+    median = statistics.median(toggles) * 1000
+    print(f"{'':>8} {'median ms':>10} {'max ms':>8}")
+    print(f"{'toggle':>8} {median:>10.2f} {max(toggles) * 1000:>8.2f}")
+    print(f"{'repaint':>8} {statistics.median(repaints) * 1000:>10.2f} {max(repaints) * 1000:>8.2f}")
+    if args.max_ms is not None and median > args.max_ms:
+        print(f"median toggle {median:.2f} ms is over {args.max_ms:g} ms")
+        return 1
+    return 0
+
+
+def run(count):
+    from PyQt5.QtWidgets import QApplication
+    from editor import Editor
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    editor = Editor()
+    editor.show()
+    app.processEvents()
+
+    toggles = []
+    repaints = []
+    for _ in range(count):
+        start = time.perf_counter()
+        editor.toggleDarkMode()
+        toggled = time.perf_counter()
+        app.processEvents()
+        editor.repaint()
+        toggles.append(toggled - start)
+        repaints.append(time.perf_counter() - toggled)
+    editor.close()
+    return toggles, repaints
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,46 @@
+"""Synthetic documents shared by the benchmarks."""
+from PyQt5.QtGui import QColor, QFont, QTextCharFormat, QTextCursor, QTextListFormat
+
+from document_io import new_document
+
+WORDS = "lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod tempor".split()
+PARAGRAPHS_PER_PAGE = 12  # roughly, for these 8-run paragraphs at the default font
+
+STYLES = [
+    (QFont.Normal, False, QColor(0, 0, 0)),
+    (QFont.Bold, False, QColor(0, 0, 0)),
+    (QFont.Normal, True, QColor(200, 0, 0)),
+    (QFont.Normal, False, QColor(0, 0, 0)),
+]
+
+
+def build_document(paragraphs):
+    """Paragraphs of mixed bold/italic/colored runs.
+
+    Every 20 paragraphs end with a five item list, alternating between
+    bullets and numbers.
+    """
+    document = new_document()
+    cursor = QTextCursor(document)
+    cursor.beginEditBlock()
+    for p in range(paragraphs):
+        if p:
+            cursor.insertBlock()
+        if p % 20 == 15:
+            list_format = QTextListFormat()
+            list_format.setStyle(QTextListFormat.ListDisc if p % 40 == 15 else QTextListFormat.ListDecimal)
+            cursor.createList(list_format)
+        elif p % 20 == 0 and cursor.currentList() is not None:
+            cursor.currentList().remove(cursor.block())
+            block_format = cursor.blockFormat()
+            block_format.setIndent(0)  # remove() leaves the list's indent behind
+            cursor.setBlockFormat(block_format)
+        for i in range(8):
+            weight, italic, color = STYLES[(p + i) % len(STYLES)]
+            char_format = QTextCharFormat()
+            char_format.setFontWeight(weight)
+            char_format.setFontItalic(italic)
+            char_format.setForeground(color)
+            cursor.insertText(' '.join(WORDS[i:i + 4]) + ' ', char_format)
+    cursor.endEditBlock()
+    return document
@@ -5,5 +5,31 @@ DEFAULT_FONT_SIZE = 12
 WINDOW_TITLE = 'OpenOPen (v.1.0.0)'
 ICON_PATH = 'icons/app_icon.png'
 README_PATH = os.path.join('resources', 'README.md')
-LIGHT_STYLE_PATH = 'styles/style.qss'
-DARK_STYLE_PATH = 'styles/dark_style.qss'
\ No newline at end of file
+LIGHT_STYLE_PATH = ':/styles/style.qss'  # In the resources_rc bundle
+DARK_STYLE_PATH = ':/styles/dark_style.qss'
+
+PAGE_WIDTH = 1240  # A4 at 96 DPI
+PAGE_HEIGHT = 1754
+PAGE_MARGIN = 72
+PAGE_GAP = 30
+
+MAX_SEARCH_HIGHLIGHTS = 10000
+
+# Plain text files at least this big open in the memory-mapped large file view
+LARGE_FILE_THRESHOLD = 64 * 1024 * 1024
+
+# Keep undo history in a piece table mirror of the document instead of QTextDocument's stack
+USE_DOCUMENT_MODEL = True
+
+NATIVE_FILTER = "OpenOPen Documents (*.oop)"
+
+COMPACT_PDF_FILTER = "Compact PDF (*.pdf)"  # reportlab export engine
+
+# Word lists spell checking is compiled from, the first one found: plain lists of one word per line or hunspell .dic files
+DICTIONARY_SOURCES = [
+    '/usr/share/dict/words',
+    '/usr/share/hunspell/en_US.dic',
+    '/usr/share/myspell/en_US.dic',
+    '/usr/share/myspell/dicts/en_US.dic',
+    '/Library/Spelling/en_US.dic',
+]
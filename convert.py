@@ -0,0 +1,147 @@
+"""Headless batch conversion.
+
+    python main.py convert --to pdf --jobs 8 in/*.docx out/
+
+Each input is loaded with the same loaders the editor uses and written with
+the same exporters, under the offscreen Qt platform and without creating an
+Editor window. Files are spread across a process pool and one JSON object is
+printed per file as it finishes. Inputs with the same name from different
+directories are written as name-2, name-3 and so on rather than over each other.
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import get_context
+
+LOADERS = {
+    '.oop': ('native_format', 'load_native'),
+    '.docx': ('docx_importer', 'import_docx'),
+    '.rtf': ('document_io', 'load_rtf'),
+    '.html': ('document_io', 'load_html'),
+    '.htm': ('document_io', 'load_html'),
+}
+
+EXPORTERS = {
+    'oop': ('native_format', 'save_native'),
+    'docx': ('docx_exporter', 'export_to_docx'),
+    'pdf': ('document_io', 'export_pdf'),
+    'pdf-compact': ('pdf_exporter', 'export_to_pdf'),
+    'rtf': ('rtf_exporter', 'export_to_rtf'),
+}
+
+_app = None
+
+
+def init_worker():
+    """Start a windowless QApplication once per worker process."""
+    global _app
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    from PyQt5.QtWidgets import QApplication
+    _app = QApplication.instance() or QApplication(['openopen-convert'])
+
+
+def resolve(spec):
+    module, name = spec
+    return getattr(__import__(module), name)
+
+
+def output_paths(inputs, out_dir, fmt):
+    """An output path for each input, numbering names that would otherwise overwrite each other.
+
+    Inputs with the same name from different directories get "-2", "-3"
+    and so on, in the order they were given. Names are compared
+    case-insensitively, as the filesystems on Windows and macOS do.
+    """
+    extension = fmt.split('-')[0]
+    bases = [os.path.splitext(os.path.basename(fname))[0] for fname in inputs]
+    used = {base.casefold() for base in bases}
+    taken = set()
+    paths = []
+    for base in bases:
+        name = base
+        if name.casefold() in taken:
+            number = 2
+            while f"{base}-{number}".casefold() in used:
+                number += 1
+            name = f"{base}-{number}"
+            used.add(name.casefold())
+        taken.add(name.casefold())
+        paths.append(os.path.join(out_dir, f"{name}.{extension}"))
+    return paths
+
+
+def convert_file(fname, output, fmt):
+    """Convert one file to output; returns the JSON-ready result record."""
+    if _app is None:
+        init_worker()
+    record = {'input': fname, 'output': output, 'ok': False}
+    start = time.perf_counter()
+    try:
+        ext = os.path.splitext(fname)[1].lower()
+        if ext not in LOADERS:
+            raise ValueError(f"Unsupported input format: {ext or fname}")
+        document = resolve(LOADERS[ext])(fname)
+        record['load_seconds'] = round(time.perf_counter() - start, 4)
+        resolve(EXPORTERS[fmt])(document, record['output'])
+        record['ok'] = True
+    except Exception as e:
+        record['error'] = f"{type(e).__name__}: {e}"
+    record['seconds'] = round(time.perf_counter() - start, 4)
+    return record
+
+
+def expand_inputs(patterns):
+    # Windows shells don't expand wildcards, so do it here for everyone
+    files = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern))
+        files.extend(matches if matches else [pattern])
+    return files
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog='main.py convert', description="Convert documents without opening the editor.")
+    parser.add_argument('--to', dest='fmt', choices=sorted(EXPORTERS), required=True, help="output format")
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1, help="number of worker processes")
+    parser.add_argument('inputs', nargs='+', help="input .docx/.rtf/.html files or glob patterns")
+    parser.add_argument('out_dir', help="directory for the converted files")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    inputs = expand_inputs(args.inputs)
+    os.makedirs(args.out_dir, exist_ok=True)
+
+    failures = 0
+    start = time.perf_counter()
+
+    def emit(record):
+        nonlocal failures
+        failures += not record['ok']
+        print(json.dumps(record), flush=True)
+
+    outputs = output_paths(inputs, args.out_dir, args.fmt)
+    if args.jobs <= 1:
+        for fname, output in zip(inputs, outputs):
+            emit(convert_file(fname, output, args.fmt))
+    else:
+        # spawn keeps Qt state out of the children on every platform
+        with ProcessPoolExecutor(max_workers=args.jobs, mp_context=get_context('spawn'),
+                                 initializer=init_worker) as pool:
+            futures = {pool.submit(convert_file, fname, output, args.fmt): fname
+                       for fname, output in zip(inputs, outputs)}
+            for future in as_completed(futures):
+                try:
+                    emit(future.result())
+                except Exception as e:
+                    # The worker process itself died (e.g. a crash inside Qt)
+                    emit({'input': futures[future], 'ok': False, 'error': f"{type(e).__name__}: {e}"})
+
+    print(json.dumps({'summary': True, 'files': len(inputs), 'failed': failures,
+                      'seconds': round(time.perf_counter() - start, 4)}), flush=True)
+    return 1 if failures else 0
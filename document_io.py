@@ -0,0 +1,139 @@
+import os
+import threading
+from contextlib import contextmanager
+from PyQt5.QtCore import QCoreApplication, QThread
+from PyQt5.QtGui import QTextDocument, QTextFrame
+from formats import font
+from constants import DEFAULT_FONT, DEFAULT_FONT_SIZE
+
+READ_CHUNK_SIZE = 1 << 20
+QT_DOCUMENT_MARGIN = 4  # QTextDocument's default documentMargin
+
+
+_building = threading.local()
+
+
+def to_gui_thread(document):
+    """Hand a document built on a worker thread over to the GUI thread."""
+    app = QCoreApplication.instance()
+    if app is not None and not getattr(_building, 'keep', False):
+        document.moveToThread(app.thread())
+    return document
+
+
+@contextmanager
+def kept_on_this_thread():
+    """Have the loaders called inside leave their documents with the calling thread.
+
+    For a worker that goes on editing the document itself, which Qt only
+    allows on the thread the document belongs to.
+    """
+    _building.keep = True
+    try:
+        yield
+    finally:
+        _building.keep = False
+
+
+def new_document():
+    document = QTextDocument()
+    document.setDefaultFont(font(DEFAULT_FONT, DEFAULT_FONT_SIZE))
+    return document
+
+
+def report(progress, percent):
+    if progress is not None:
+        progress(percent)
+
+
+def frame_items(frame):
+    """Yield the blocks and child frames directly inside frame, in document order."""
+    it = frame.begin()
+    while not it.atEnd():
+        child = it.currentFrame()
+        yield child if child is not None else it.currentBlock()
+        it += 1
+
+
+def table_cells(table):
+    """frame_items() of each cell of table, by (row, column), in one pass over the table."""
+    cells = {}
+    for item in frame_items(table):
+        # A nested frame starts with a marker character that sits in the cell
+        cell = table.cellAt(item.firstPosition() - 1 if isinstance(item, QTextFrame) else item.position())
+        cells.setdefault((cell.row(), cell.column()), []).append(item)
+    return cells
+
+
+def read_text(fname, progress=None, encoding='utf-8', errors='strict'):
+    """Read a text file in chunks, reporting progress as it goes."""
+    total = os.path.getsize(fname) or 1
+    chunks = []
+    done = 0
+    with open(fname, 'r', encoding=encoding, errors=errors) as file:
+        while True:
+            chunk = file.read(READ_CHUNK_SIZE)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            done += len(chunk)
+            report(progress, min(done * 100 // total, 99))
+    return ''.join(chunks)
+
+
+def load_html(fname, progress=None):
+    html = read_text(fname, progress, errors='ignore')
+    document = new_document()
+    document.setHtml(html)
+    report(progress, 100)
+    return to_gui_thread(document)
+
+
+def load_rtf(fname, progress=None):
+    with open(fname, 'rb') as file:
+        is_rtf = file.read(5) == b'{\\rtf'
+    if not is_rtf:
+        # Older versions of OpenOPen wrote HTML into .rtf files
+        return load_html(fname, progress)
+    from rtf_importer import import_rtf  # rtf_importer imports this module
+    return import_rtf(fname, progress)
+
+
+def to_html(document):
+    """toHtml() without the editor's page margin.
+
+    Qt writes a non-default root frame margin out as a table wrapped around
+    the whole body, which would come back as a table when the file is read.
+    """
+    frameFormat = document.rootFrame().frameFormat()
+    if frameFormat.topMargin() != QT_DOCUMENT_MARGIN:
+        # clone() turns documentMargin into per-side root frame margins
+        document = document.clone()
+        frameFormat.setMargin(QT_DOCUMENT_MARGIN)
+        document.rootFrame().setFrameFormat(frameFormat)
+    return document.toHtml()
+
+
+def save_html(document, fname, progress=None):
+    html = to_html(document)
+    report(progress, 50)
+    with open(fname, 'w', encoding='utf-8') as file:
+        file.write(html)
+    report(progress, 100)
+    return fname
+
+
+def export_pdf(document, fname, progress=None):
+    """Print document to a PDF through QPrinter, as Editor.exportPDF always has."""
+    from PyQt5.QtPrintSupport import QPrinter  # Loaded on first use; it slows down startup
+    printer = QPrinter(QPrinter.HighResolution)
+    printer.setOutputFormat(QPrinter.PdfFormat)
+    printer.setOutputFileName(fname)
+    report(progress, 10)
+    # print_() parents its layout clone to the document, so work on a copy
+    # owned by the current thread when called from a worker
+    if document.thread() is not QThread.currentThread():
+        document = document.clone()
+    document.print_(printer)
+    report(progress, 100)
+    return fname
@@ -0,0 +1,573 @@
+import re
+import sys
+from array import array
+from PyQt5 import sip
+from PyQt5.QtCore import QObject, QTimer
+from PyQt5.QtGui import QTextCursor
+
+PARAGRAPH_SEPARATOR = '\u2029'
+FRAME_CHARACTERS = ('\ufdd0', '\ufdd1')  # Table and frame boundaries, which can't be replayed as text
+RUN_BYTES = 72  # a length in the array, a list slot and the value tuple
+CHUNK_RUNS = 128  # runs per Runs chunk; an edit scans the chunks it touches
+ASTRAL = re.compile('[\U00010000-\U0010ffff]')  # characters that take two UTF-16 code units
+SURROGATE = re.compile('[\ud800-\udfff]')
+
+
+def utf16_units(text):
+    """text with each character outside the BMP split into its two surrogates.
+
+    len() and slicing then count UTF-16 code units, as Qt's positions do.
+    """
+    if not ASTRAL.search(text):
+        return text
+    def split(match):
+        point = ord(match.group()) - 0x10000
+        return chr(0xD800 + (point >> 10)) + chr(0xDC00 + (point & 0x3FF))
+    return ASTRAL.sub(split, text)
+
+
+def from_utf16_units(text):
+    """The text utf16_units was given: surrogate pairs joined up again."""
+    if not SURROGATE.search(text):
+        return text
+    return text.encode('utf-16-le', 'surrogatepass').decode('utf-16-le')
+
+
+class Chunk:
+    """A stretch of consecutive runs: parallel arrays of run lengths and run values."""
+    __slots__ = ('lengths', 'values', 'total')
+
+    def __init__(self, lengths, values):
+        self.lengths = lengths
+        self.values = values
+        self.total = sum(lengths)
+
+
+class Runs:
+    """A sequence stored as runs of (length, value), in chunks of at most CHUNK_RUNS runs.
+
+    Replacing a range only splits the runs at its two ends, and what it
+    returns is the runs that were cut out, so an undo step holds references
+    to the runs it touched rather than a copy of the document. The chunks'
+    lengths are kept in a Fenwick tree, so finding a position takes a walk
+    down the tree and a scan of one chunk, and an edit only rewrites the
+    chunks it covers: O(log n + edit size) however long the document is.
+    """
+
+    def __init__(self, lengths=(), values=()):
+        lengths = array('q', lengths)
+        values = list(values)
+        self.chunks = [Chunk(lengths[i:i + CHUNK_RUNS], values[i:i + CHUNK_RUNS])
+                       for i in range(0, len(values), CHUNK_RUNS)]
+        self.total = sum(chunk.total for chunk in self.chunks)
+        self.reindex()
+
+    def tail(self, value, offset):
+        """Value of the part of a run from offset on."""
+        return value
+
+    def joined(self, left, length, right):
+        """Value of two neighbouring runs as one, or None if they can't be merged."""
+        return left if left == right else None
+
+    # The Fenwick tree over chunk lengths
+
+    def reindex(self):
+        count = len(self.chunks)
+        tree = array('q', bytes(8 * (count + 1)))
+        for number, chunk in enumerate(self.chunks, 1):
+            tree[number] += chunk.total
+            parent = number + (number & -number)
+            if parent <= count:
+                tree[parent] += tree[number]
+        self.tree = tree
+
+    def grow(self, index, delta):
+        tree = self.tree
+        number = index + 1
+        while number < len(tree):
+            tree[number] += delta
+            number += number & -number
+
+    def prefix(self, count):
+        """Total length of the first count chunks."""
+        tree = self.tree
+        total = 0
+        while count:
+            total += tree[count]
+            count -= count & -count
+        return total
+
+    def locate(self, position):
+        """(chunk index, chunk start) of the chunk holding position; past the end, (chunk count, total)."""
+        tree = self.tree
+        count = len(tree) - 1
+        index = start = 0
+        step = 1 << count.bit_length()
+        while step:
+            if index + step <= count and start + tree[index + step] <= position:
+                index += step
+                start += tree[index]
+            step >>= 1
+        return index, start
+
+    # Editing
+
+    def replace(self, start, end, runs):
+        """Put runs in place of [start, end); returns the runs taken out."""
+        chunks = self.chunks
+        first, offset = self.locate(start)
+        last, _ = self.locate(end)
+        # The chunk before joins in, so the new runs can merge with the run they follow
+        if first and (first == len(chunks) or offset == start):
+            first -= 1
+            offset -= chunks[first].total
+        last = min(last, len(chunks) - 1)
+        lengths = array('q')
+        values = []
+        for chunk in chunks[first:last + 1]:
+            lengths.extend(chunk.lengths)
+            values.extend(chunk.values)
+
+        head = self.cut(lengths, values, start - offset)
+        stop = self.cut(lengths, values, end - offset)
+        removed = type(self)(lengths[head:stop], values[head:stop])
+        lengths[head:stop] = array('q', runs.lengths)
+        values[head:stop] = runs.values
+        self.merge(lengths, values, head + len(runs))
+        self.merge(lengths, values, head)
+
+        # Split evenly, so a chunk that's just filled up doesn't leave a one-run chunk behind
+        count = -(-len(values) // CHUNK_RUNS)
+        size = -(-len(values) // count) if count else 1
+        replacement = [Chunk(lengths[i:i + size], values[i:i + size]) for i in range(0, len(values), size)]
+        old = chunks[first:last + 1]
+        chunks[first:last + 1] = replacement
+        self.total += runs.total - removed.total
+        if len(replacement) == len(old):
+            for index, (before, after) in enumerate(zip(old, replacement), first):
+                if after.total != before.total:
+                    self.grow(index, after.total - before.total)
+        else:
+            self.reindex()
+        return removed
+
+    def cut(self, lengths, values, position):
+        """Split the runs at position; returns the index of the run starting there."""
+        start = 0
+        for index, length in enumerate(lengths):
+            if start + length > position:
+                if start == position:
+                    return index
+                value = values[index]
+                head = position - start
+                lengths[index:index + 1] = array('q', (head, length - head))
+                values[index:index + 1] = [value, self.tail(value, head)]
+                return index + 1
+            start += length
+        return len(values)
+
+    def merge(self, lengths, values, index):
+        """Merge run index into the run before it when their values allow."""
+        if 0 < index < len(values):
+            value = self.joined(values[index - 1], lengths[index - 1], values[index])
+            if value is not None:
+                lengths[index - 1:index + 1] = array('q', (lengths[index - 1] + lengths[index],))
+                values[index - 1:index + 1] = [value]
+
+    def slice(self, start, end):
+        """The runs of [start, end), as new Runs."""
+        copy = type(self)()
+        first, offset = self.locate(start)
+        for chunk in self.chunks[first:]:
+            if offset >= end:
+                break
+            for length, value in zip(chunk.lengths, chunk.values):
+                lo, hi = max(start, offset), min(end, offset + length)
+                if lo < hi:
+                    copy.append(hi - lo, self.tail(value, lo - offset) if lo > offset else value)
+                offset += length
+        return copy
+
+    def append(self, length, value):
+        chunks = self.chunks
+        self.total += length
+        if chunks:
+            chunk = chunks[-1]
+            merged = self.joined(chunk.values[-1], chunk.lengths[-1], value)
+            if merged is not None:
+                chunk.lengths[-1] += length
+                chunk.values[-1] = merged
+            elif len(chunk.values) < CHUNK_RUNS:
+                chunk.lengths.append(length)
+                chunk.values.append(value)
+            else:
+                chunks.append(Chunk(array('q', (length,)), [value]))
+                # The new node covers the chunks from just after its parent's range
+                number = len(chunks)
+                self.tree.append(self.prefix(number - 1) - self.prefix(number - (number & -number)) + length)
+                return
+            chunk.total += length
+            self.grow(len(chunks) - 1, length)
+        else:
+            chunks.append(Chunk(array('q', (length,)), [value]))
+            self.reindex()
+
+    def extend(self, runs):
+        for length, value in runs:
+            self.append(length, value)
+
+    @property
+    def lengths(self):
+        """All the run lengths, as one array; O(n)."""
+        lengths = array('q')
+        for chunk in self.chunks:
+            lengths.extend(chunk.lengths)
+        return lengths
+
+    @property
+    def values(self):
+        """All the run values, as one list; O(n)."""
+        return [value for chunk in self.chunks for value in chunk.values]
+
+    def __len__(self):
+        return sum(len(chunk.values) for chunk in self.chunks)
+
+    def __iter__(self):
+        for chunk in self.chunks:
+            yield from zip(chunk.lengths, chunk.values)
+
+
+class TextRuns(Runs):
+    """Pieces of text; each value is (string, start) into a string that's never changed.
+
+    The strings are in UTF-16 units (see utf16_units), so lengths and
+    offsets are document positions.
+    """
+
+    def tail(self, value, offset):
+        return value[0], value[1] + offset
+
+    def joined(self, left, length, right):
+        return left if left[0] is right[0] and left[1] + length == right[1] else None
+
+    def text(self):
+        return ''.join(string[start:start + length] for length, (string, start) in self)
+
+    def count(self, character):
+        return sum(string.count(character, start, start + length) for length, (string, start) in self)
+
+
+class Change:
+    """One undo step: the content of [position, position + length) before or after the edit.
+
+    text is None for format-only changes. blocks covers the blocks from
+    block on that the change touched; blockLength is how many blocks
+    the range spans in the document now.
+    """
+    __slots__ = ('position', 'length', 'text', 'formats', 'block', 'blockLength', 'blocks')
+
+    def __init__(self, position, length, text, formats, block, blockLength, blocks):
+        self.position = position
+        self.length = length
+        self.text = text
+        self.formats = formats
+        self.block = block
+        self.blockLength = blockLength
+        self.blocks = blocks
+
+    def isTyping(self):
+        """True for a plain insertion or deletion inside one block."""
+        return (self.text is not None and self.blockLength == 1 and self.blocks.total == 1
+                and (self.length == 0) != (self.text.total == 0))
+
+
+class DocumentModel(QObject):
+    """Piece table mirror of a QTextDocument that keeps the undo history.
+
+    The text is a table of pieces, character formats and block formats are
+    run-length spans holding the document's own format indexes. Every
+    contentsChange is recorded as the content it replaced, so an undo step
+    costs memory in proportion to the edit and a format change over a long
+    selection only keeps its format runs. Undo and redo patch just the
+    affected range back into the document through a cursor. The document's
+    own undo stack is switched off while the model is attached.
+
+    Documents with tables or frames fall back to Qt's undo stack, since
+    their boundaries can't be inserted back as text.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.document = None
+        self.formatCache = []
+        self.undoStack = []
+        self.redoStack = []
+        self.applying = False
+        self.stale = False
+        self.merging = False
+        self.text = None
+
+    def setDocument(self, document):
+        if self.document is not None and not sip.isdeleted(self.document):
+            self.document.contentsChange.disconnect(self.onContentsChange)
+        self.document = document
+        document.documentLayout()  # contentsChange is only emitted once there's a layout
+        document.contentsChange.connect(self.onContentsChange)
+        self.rebuild()
+
+    def rebuild(self):
+        """Mirror the whole document again and start a new history."""
+        document = self.document
+        self.stale = False
+        self.merging = False
+        self.formatCache = document.allFormats()
+        self.undoStack = []
+        self.redoStack = []
+        if self.hasFrames():
+            self.text = None
+            document.setUndoRedoEnabled(True)
+            return
+        # Clearing the stack loses the document's record of its saved state
+        modified = document.isModified()
+        document.setUndoRedoEnabled(False)
+        document.setModified(modified)
+        self.text, self.formats = self.read(0, document.characterCount() - 1)
+        self.blocks = self.readBlocks(0, document.blockCount())
+
+    def hasFrames(self):
+        return bool(self.document.rootFrame().childFrames())
+
+    def isAvailable(self):
+        return self.text is not None
+
+    def fallBack(self):
+        """Hand the history back to the document for good, e.g. once it has a table."""
+        self.text = None
+        self.undoStack = []
+        self.redoStack = []
+        self.document.setUndoRedoEnabled(True)
+
+    def memoryUsage(self):
+        """Estimated bytes held by the mirror and its history.
+
+        Pieces share their strings, so each string is counted once however
+        many runs and undo steps refer to it.
+        """
+        if self.text is None:
+            return 0
+        strings = {}
+        runs = 0
+        for text, formats, blocks in [(self.text, self.formats, self.blocks)] + \
+                [(change.text, change.formats, change.blocks) for change in self.undoStack + self.redoStack]:
+            for part in (text, formats, blocks):
+                if part is not None:
+                    runs += len(part)
+            if text is not None:
+                for _, (string, _) in text:
+                    strings[id(string)] = string
+        return sum(sys.getsizeof(string) for string in strings.values()) + runs * RUN_BYTES
+
+    # Reading from the document
+
+    def format(self, index):
+        if index >= len(self.formatCache):
+            self.formatCache = self.document.allFormats()
+        return self.formatCache[index]
+
+    def read(self, position, length):
+        """Text and character format runs of [position, position + length) in the document."""
+        end = position + length
+        texts = []
+        formats = Runs()
+        block = self.document.findBlock(position)
+        while block.isValid() and block.position() < end:
+            last = block.charFormatIndex()
+            it = block.begin()
+            while not it.atEnd():
+                fragment = it.fragment()
+                start = fragment.position()
+                stop = start + fragment.length()
+                last = fragment.charFormatIndex()
+                if stop > position and start < end:
+                    lo, hi = max(position, start), min(end, stop)
+                    fragmentText = utf16_units(fragment.text())
+                    texts.append(fragmentText[lo - start:hi - start] if hi - lo < stop - start else fragmentText)
+                    formats.append(hi - lo, last)
+                it += 1
+            separator = block.position() + block.length() - 1
+            if position <= separator < end:
+                # The separator has no fragment of its own; the block's char format goes in the block runs
+                texts.append(PARAGRAPH_SEPARATOR)
+                formats.append(1, last)
+            block = block.next()
+        text = ''.join(texts)
+        return TextRuns((len(text),), ((text, 0),)) if text else TextRuns(), formats
+
+    def readBlocks(self, first, count):
+        """Block and block char format indexes of count blocks from block number first."""
+        blocks = Runs()
+        block = self.document.findBlockByNumber(first)
+        for _ in range(count):
+            blocks.append(1, (block.blockFormatIndex(), block.charFormatIndex()))
+            block = block.next()
+        return blocks
+
+    # Recording
+
+    def onContentsChange(self, position, removed, added):
+        if self.applying or self.stale or self.text is None:
+            return
+        document = self.document
+        oldLength = self.text.total
+        newLength = document.characterCount() - 1  # The model leaves out the final separator
+        if position == 0 and removed >= oldLength:
+            formats = document.allFormats()
+            if len(formats) < len(self.formatCache):
+                # Cleared by setPlainText or setHtml, which renumbers the formats;
+                # mirror the new content once it's all in, like Qt starting a new history
+                self.stale = True
+                QTimer.singleShot(0, self.rebuild)
+                return
+            self.formatCache = formats
+        # Changes at the end of the document count the final separator in removed and added
+        removed = max(min(removed, oldLength - position), 0)
+        added = max(min(added, newLength - position), 0)
+        if oldLength - removed + added != newLength:
+            # The mirror has lost track of the document; its history can't be trusted
+            self.fallBack()
+            return
+
+        text, formats = self.read(position, added)
+        if any(character in text.text() for character in FRAME_CHARACTERS) or self.hasFrames():
+            self.fallBack()
+            return
+        block = document.findBlock(position).blockNumber()
+        blockLength = text.count(PARAGRAPH_SEPARATOR) + 1
+        blocks = self.readBlocks(block, blockLength)
+
+        if removed == added and self.sameText(position, text):
+            text = None  # Only formats changed; keep the pieces
+        change = self.replace(Change(position, removed, text, formats, block, blockLength, blocks))
+        self.redoStack = []
+        if not (self.merging and self.mergeTyping(self.undoStack[-1], change)):
+            self.undoStack.append(change)
+        self.merging = True
+
+    def sameText(self, position, text):
+        return self.text.slice(position, position + text.total).text() == text.text()
+
+    def mergeTyping(self, previous, change):
+        """Fold a typed or deleted character into the step before it, as Qt does."""
+        if not (previous.isTyping() and change.isTyping() and previous.block == change.block
+                and change.length + change.text.total == 1):
+            return False
+        if previous.length and change.length and change.position == previous.position + previous.length:
+            previous.length += 1
+            return True
+        if not previous.length and not change.length:
+            if change.position + 1 == previous.position:  # Backspace
+                change.text.extend(previous.text)
+                change.formats.extend(previous.formats)
+                previous.text, previous.formats = change.text, change.formats
+                previous.position = change.position
+                return True
+            if change.position == previous.position:  # Delete
+                previous.text.extend(change.text)
+                previous.formats.extend(change.formats)
+                return True
+        return False
+
+    def replace(self, change):
+        """Swap change's content into the model; returns a change holding what it replaced."""
+        start, end = change.position, change.position + change.length
+        text = None
+        if change.text is not None:
+            text = self.text.replace(start, end, change.text)
+            blockLength = text.count(PARAGRAPH_SEPARATOR) + 1
+        else:
+            blockLength = change.blockLength
+        formats = self.formats.replace(start, end, change.formats)
+        blocks = self.blocks.replace(change.block, change.block + blockLength, change.blocks)
+        return Change(start, change.formats.total, text, formats, change.block, change.blocks.total, blocks)
+
+    # Undo and redo
+
+    def undo(self):
+        """Undo the last change; returns the cursor position to restore, or None."""
+        return self.restore(self.undoStack, self.redoStack)
+
+    def redo(self):
+        return self.restore(self.redoStack, self.undoStack)
+
+    def restore(self, source, target):
+        if not source or self.text is None:
+            return None
+        change = source.pop()
+        self.merging = False
+        current = self.replace(change)
+        self.applying = True
+        try:
+            self.apply(change)
+        finally:
+            self.applying = False
+        target.append(current)
+        return change.position + change.formats.total
+
+    def apply(self, change):
+        """Write change's content over the range it replaces in the document."""
+        document = self.document
+        cursor = QTextCursor(document)
+        cursor.beginEditBlock()
+        position = change.position
+        if change.text is not None:
+            cursor.setPosition(position)
+            cursor.setPosition(position + change.length, QTextCursor.KeepAnchor)
+            cursor.removeSelectedText()
+            for string, index in self.segments(change.text, change.formats):
+                cursor.insertText(from_utf16_units(string), self.format(index).toCharFormat())
+        else:
+            for runLength, index in change.formats:
+                cursor.setPosition(position)
+                cursor.setPosition(position + runLength, QTextCursor.KeepAnchor)
+                cursor.setCharFormat(self.format(index).toCharFormat())
+                position += runLength
+
+        block = document.findBlockByNumber(change.block)
+        for runLength, (blockFormat, charFormat) in change.blocks:
+            for _ in range(runLength):
+                self.applyBlock(block, blockFormat, charFormat)
+                block = block.next()
+        cursor.endEditBlock()
+
+    def applyBlock(self, block, blockFormat, charFormat):
+        cursor = QTextCursor(block)
+        if block.blockFormatIndex() != blockFormat:
+            target = self.format(blockFormat).toBlockFormat()
+            # setBlockFormat keeps list membership, so lists are joined and left explicitly
+            objectIndex = target.objectIndex()
+            current = block.textList()
+            if current is not None and current.objectIndex() != objectIndex:
+                current.remove(block)
+                current = None
+            if current is None and objectIndex >= 0:
+                self.document.object(objectIndex).add(block)
+            cursor.setBlockFormat(target)
+        if block.charFormatIndex() != charFormat:
+            cursor.setBlockCharFormat(self.format(charFormat).toCharFormat())
+
+    def segments(self, text, formats):
+        """Split text runs at format run boundaries: (string, format index) pairs."""
+        pieces = iter(text)
+        length, (string, start) = 0, ('', 0)
+        for runLength, index in formats:
+            parts = []
+            while runLength:
+                if not length:
+                    length, (string, start) = next(pieces)
+                take = min(length, runLength)
+                parts.append(string[start:start + take])
+                start += take
+                length -= take
+                runLength -= take
+            yield ''.join(parts), index
@@ -0,0 +1,176 @@
+"""Word, character, paragraph and page counts kept up to date as the text changes.
+
+Every block carries its own counts as QTextBlockUserData. The totals are
+the sum of the counts of the blocks that exist: a block's counts are added
+when they're attached to it and taken off again when Qt deletes them, either
+because the block was recounted or because an edit removed the block. So a
+contentsChange only has to recount the blocks it touched, and selection
+counts only have to read the text of the two blocks at its ends.
+"""
+from collections import namedtuple
+from math import ceil
+from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtGui import QFontMetricsF, QTextBlockUserData
+from constants import DEFAULT_FONT, DEFAULT_FONT_SIZE, PAGE_HEIGHT, PAGE_MARGIN, PAGE_WIDTH
+from formats import font
+
+Counts = namedtuple('Counts', 'words characters paragraphs pages')
+
+_page_metrics = None  # (characters per line, lines per page), once there's a font database
+
+
+def page_metrics():
+    """How much default-font text fits on one of the view's pages, roughly."""
+    global _page_metrics
+    if _page_metrics is None:
+        metrics = QFontMetricsF(font(DEFAULT_FONT, DEFAULT_FONT_SIZE))
+        _page_metrics = (max(1, int((PAGE_WIDTH - 2 * PAGE_MARGIN) / metrics.averageCharWidth())),
+                         max(1, int((PAGE_HEIGHT - 2 * PAGE_MARGIN) / metrics.lineSpacing())))
+    return _page_metrics
+
+
+def count_text(text):
+    """(words, characters, non-empty paragraphs) of one block's text."""
+    words = len(text.split())
+    return words, len(text), 1 if words else 0
+
+
+class Totals:
+    """Running sums over the blocks of one document."""
+
+    def __init__(self):
+        self.words = 0
+        self.characters = 0
+        self.paragraphs = 0
+        self.lines = 0
+
+
+class BlockStats(QTextBlockUserData):
+    """Counts of one block, added to the totals while the block holds them."""
+
+    def __init__(self, totals, text):
+        super().__init__()
+        self.totals = totals
+        self.words, self.characters, self.paragraphs = count_text(text)
+        self.lines = max(1, ceil(self.characters / page_metrics()[0]))
+        totals.words += self.words
+        totals.characters += self.characters
+        totals.paragraphs += self.paragraphs
+        totals.lines += self.lines
+
+    def __dtor__(self):
+        # Called by Qt when the block is deleted or given new counts
+        totals = self.totals
+        totals.words -= self.words
+        totals.characters -= self.characters
+        totals.paragraphs -= self.paragraphs
+        totals.lines -= self.lines
+
+
+class DocumentStats(QObject):
+    """Counts for one document; a child of the document, found with document_stats()."""
+    changed = pyqtSignal()
+
+    def __init__(self, document):
+        super().__init__(document)
+        self.document = document
+        self.totals = Totals()
+        self.released = False
+        self.recount(document.begin(), document.lastBlock())
+        document.contentsChange.connect(self.onContentsChange)
+
+    def release(self):
+        """Note that the document's layout was deleted, and its blocks' counts with it.
+
+        Deleting a document's layout deletes the user data of every block
+        along with its line layout. The blocks are counted again the next
+        time document_stats() is asked for the document.
+        """
+        self.released = True
+
+    def recountAll(self):
+        self.released = False
+        self.recount(self.document.begin(), self.document.lastBlock())
+
+    def recount(self, first, last):
+        totals = self.totals
+        end = last.next()
+        block = first
+        while block.isValid() and block != end:
+            block.setUserData(BlockStats(totals, block.text()))
+            block = block.next()
+
+    def onContentsChange(self, position, removed, added):
+        if self.released:
+            return
+        document = self.document
+        first = document.findBlock(position)
+        last = document.findBlock(min(position + added, document.characterCount() - 1))
+        if not first.isValid() or not last.isValid():
+            return
+        self.recount(first, last)
+        self.changed.emit()
+
+    def counts(self):
+        totals = self.totals
+        return Counts(totals.words, totals.characters, totals.paragraphs, self.pages(totals.lines))
+
+    def selectionCounts(self, cursor):
+        """Counts for the selection of cursor, or None when nothing is selected.
+
+        Only the blocks at either end of the selection are read; the counts of
+        the fully selected blocks in between come from their cached counts.
+        """
+        if not cursor.hasSelection():
+            return None
+        start, end = cursor.selectionStart(), cursor.selectionEnd()
+        document = self.document
+        first = document.findBlock(start)
+        last = document.findBlock(end)
+        if first == last:
+            text = first.text()[start - first.position():end - first.position()]
+            words, characters, paragraphs = count_text(text)
+            return Counts(words, characters, paragraphs, self.pages(ceil(characters / page_metrics()[0])))
+
+        words, characters, paragraphs = count_text(first.text()[start - first.position():])
+        lines = ceil(characters / page_metrics()[0])
+        block = first.next()
+        while block.isValid() and block != last:
+            data = block.userData()
+            if data is not None:
+                words += data.words
+                characters += data.characters
+                paragraphs += data.paragraphs
+                lines += data.lines
+            else:  # Only while an edit is still being announced
+                counted = count_text(block.text())
+                words += counted[0]
+                characters += counted[1]
+                paragraphs += counted[2]
+                lines += max(1, ceil(counted[1] / page_metrics()[0]))
+            block = block.next()
+        tail = count_text(last.text()[:end - last.position()])
+        return Counts(words + tail[0], characters + tail[1], paragraphs + tail[2],
+                      self.pages(lines + ceil(tail[1] / page_metrics()[0])))
+
+    @staticmethod
+    def pages(lines):
+        return max(1, ceil(lines / page_metrics()[1]))
+
+
+def document_stats(document):
+    """The DocumentStats of document, counting it the first time it's asked for."""
+    stats = document.findChild(DocumentStats)
+    if stats is None:
+        stats = DocumentStats(document)
+    elif stats.released:
+        stats.recountAll()
+    return stats
+
+
+def format_counts(counts, selected=None):
+    if selected is not None:
+        return f"{selected.words:,} of {counts.words:,} words | {selected.characters:,} characters"
+    pages = 'page' if counts.pages == 1 else 'pages'
+    return (f"{counts.words:,} words | {counts.characters:,} characters | "
+            f"{counts.paragraphs:,} paragraphs | ~{counts.pages:,} {pages}")
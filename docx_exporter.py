@@ -1,50 +1,355 @@
-from docx import Document
-from docx.shared import Pt, RGBColor
-from PyQt5.QtGui import QTextCursor,QTextListFormat
-
-def export_to_docx(text_edit, filename):
-    doc = Document()
-    cursor = text_edit.textCursor()
-
-    for block_num in range(text_edit.document().blockCount()):
-        block = text_edit.document().findBlockByNumber(block_num)
-        cursor.setPosition(block.position())
-        cursor.movePosition(QTextCursor.EndOfBlock, QTextCursor.KeepAnchor)
-        
-        block_text = cursor.selectedText()
-
-        # Create a new paragraph for each block
-        if block.textList():
-            list_format = block.textList().format()
-            if list_format.style() == QTextListFormat.ListDisc:
-                paragraph = doc.add_paragraph(style='List Bullet')
-            elif list_format.style() == QTextListFormat.ListDecimal:
-                paragraph = doc.add_paragraph(style='List Number')
+"""DOCX export that streams word/document.xml into the zip as the blocks are walked.
+
+Nothing is built for the document as a whole: each paragraph becomes a few
+lines of XML that go straight to the compressed zip entry, so memory stays
+flat however long the document is. Runs don't repeat their formatting; every
+font, size, color and emphasis combination in use becomes one character
+style, and the runs refer to it by id. The styles and numbering parts are
+written once the body is done and all the combinations and lists are known,
+and so are the pictures: each goes into word/media as the bytes it was
+opened with, one at a time.
+"""
+import posixpath
+import re
+import zipfile
+from xml.sax.saxutils import escape, quoteattr
+from PyQt5.QtGui import QTextDocument, QTextFrame, QTextListFormat, QTextTable
+from constants import DEFAULT_FONT, DEFAULT_FONT_SIZE, PAGE_MARGIN
+from document_io import frame_items, report, table_cells
+from images import display_size, image_bytes, image_resource, image_type
+from instrumentation import timed
+
+LINE_SEPARATOR = '\u2028'  # QTextFragment text uses U+2028 for soft line breaks
+PROGRESS_INTERVAL = 500  # blocks between progress reports
+FLUSH_SIZE = 1 << 16  # characters of XML collected before they go into the zip
+TWIPS_PER_PIXEL = 15
+EMU_PER_PIXEL = 9525
+PAGE_WIDTH_TWIPS = 11906  # A4
+OBJECT_REPLACEMENT = '\ufffc'
+
+# Characters XML 1.0 can't hold, and the object replacement character
+# images and other inline objects leave in the text
+UNWRITABLE = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f\ud800-\udfff\ufffc\ufffe\uffff]')
+BREAKS = re.compile('([\u2028\t])')
+
+# QTextListFormat style -> (w:numFmt, w:lvlText, paragraph style)
+LIST_KINDS = {
+    QTextListFormat.ListDisc: ('bullet', '\u2022', 'ListBullet'),
+    QTextListFormat.ListCircle: ('bullet', '\u25e6', 'ListBullet'),
+    QTextListFormat.ListSquare: ('bullet', '\u25aa', 'ListBullet'),
+    QTextListFormat.ListDecimal: ('decimal', '%{level}.', 'ListNumber'),
+    QTextListFormat.ListLowerAlpha: ('lowerLetter', '%{level}.', 'ListNumber'),
+    QTextListFormat.ListUpperAlpha: ('upperLetter', '%{level}.', 'ListNumber'),
+    QTextListFormat.ListLowerRoman: ('lowerRoman', '%{level}.', 'ListNumber'),
+    QTextListFormat.ListUpperRoman: ('upperRoman', '%{level}.', 'ListNumber'),
+}
+LIST_LEVELS = 9
+
+NAMESPACE = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+DOCUMENT_NAMESPACES = NAMESPACE + (
+    ' xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"'
+    ' xmlns:wp="http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing"'
+    ' xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main"'
+    ' xmlns:pic="http://schemas.openxmlformats.org/drawingml/2006/picture"')
+PACKAGE_NAMESPACE = 'http://schemas.openxmlformats.org/package/2006'
+OFFICE_RELATIONSHIPS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+XML_DECLARATION = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+
+MEDIA_TYPES = {'png': 'image/png', 'jpeg': 'image/jpeg', 'gif': 'image/gif', 'bmp': 'image/bmp', 'tiff': 'image/tiff'}
+
+
+def content_types(extensions):
+    defaults = ''.join(f'<Default Extension="{extension}" ContentType="{MEDIA_TYPES[extension]}"/>'
+                       for extension in sorted(extensions))
+    return XML_DECLARATION + (
+        f'<Types xmlns="{PACKAGE_NAMESPACE}/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        f'<Default Extension="xml" ContentType="application/xml"/>{defaults}'
+        '<Override PartName="/word/document.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+        '<Override PartName="/word/styles.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.styles+xml"/>'
+        '<Override PartName="/word/numbering.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.numbering+xml"/>'
+        '</Types>')
+
+
+PACKAGE_RELATIONSHIPS = XML_DECLARATION + (
+    f'<Relationships xmlns="{PACKAGE_NAMESPACE}/relationships">'
+    f'<Relationship Id="rId1" Type="{OFFICE_RELATIONSHIPS}/officeDocument" Target="word/document.xml"/>'
+    '</Relationships>')
+
+
+def document_relationships(media):
+    images = ''.join(f'<Relationship Id="{relationship}" Type="{OFFICE_RELATIONSHIPS}/image" Target="{target}"/>'
+                     for relationship, target, _ in media.values())
+    return XML_DECLARATION + (
+        f'<Relationships xmlns="{PACKAGE_NAMESPACE}/relationships">'
+        f'<Relationship Id="rId1" Type="{OFFICE_RELATIONSHIPS}/styles" Target="styles.xml"/>'
+        f'<Relationship Id="rId2" Type="{OFFICE_RELATIONSHIPS}/numbering" Target="numbering.xml"/>'
+        f'{images}</Relationships>')
+
+
+PICTURE = (
+    '<w:r><w:drawing><wp:inline distT="0" distB="0" distL="0" distR="0">'
+    '<wp:extent cx="{cx}" cy="{cy}"/><wp:docPr id="{id}" name="Picture {id}"/>'
+    '<a:graphic><a:graphicData uri="http://schemas.openxmlformats.org/drawingml/2006/picture">'
+    '<pic:pic><pic:nvPicPr><pic:cNvPr id="0" name="{name}"/><pic:cNvPicPr/></pic:nvPicPr>'
+    '<pic:blipFill><a:blip r:embed="{relationship}"/><a:stretch><a:fillRect/></a:stretch></pic:blipFill>'
+    '<pic:spPr><a:xfrm><a:off x="0" y="0"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm>'
+    '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom></pic:spPr></pic:pic>'
+    '</a:graphicData></a:graphic></wp:inline></w:drawing></w:r>')
+
+TABLE_BORDERS = '<w:tblBorders>' + ''.join(
+    f'<w:{side} w:val="single" w:sz="4" w:space="0" w:color="auto"/>'
+    for side in ('top', 'left', 'bottom', 'right', 'insideH', 'insideV')) + '</w:tblBorders>'
+
+# A4, with the editor's page margin
+SECTION = ('<w:sectPr><w:pgSz w:w="11906" w:h="16838"/>'
+           '<w:pgMar w:top="{0}" w:right="{0}" w:bottom="{0}" w:left="{0}" '
+           'w:header="720" w:footer="720" w:gutter="0"/></w:sectPr>').format(PAGE_MARGIN * TWIPS_PER_PIXEL)
+
+
+def iter_fragments(block):
+    """Yield the non-empty QTextFragments of a block in document order."""
+    it = block.begin()
+    while not it.atEnd():
+        fragment = it.fragment()
+        if fragment.isValid():
+            yield fragment
+        it += 1
+
+
+def run_properties(char_format):
+    """The properties OpenOPen writes for a run: (family, half-points, bold, italic, underline, RRGGBB)."""
+    font = char_format.font()
+    color = char_format.foreground().color()
+    size = font.pointSize()
+    return (
+        font.family(),
+        size * 2 if size > 0 else None,
+        font.bold(),
+        font.italic(),
+        font.underline(),
+        f"{color.red():02X}{color.green():02X}{color.blue():02X}",
+    )
+
+
+def run_xml(properties):
+    """The children of a w:rPr, in the order CT_RPr requires them."""
+    family, size, bold, italic, underline, color = properties
+    parts = []
+    if family:
+        name = quoteattr(family)
+        parts.append(f'<w:rFonts w:ascii={name} w:hAnsi={name} w:cs={name}/>')
+    if bold:
+        parts.append('<w:b/>')
+    if italic:
+        parts.append('<w:i/>')
+    parts.append(f'<w:color w:val="{color}"/>')
+    if size:
+        parts.append(f'<w:sz w:val="{size}"/><w:szCs w:val="{size}"/>')
+    if underline:
+        parts.append('<w:u w:val="single"/>')
+    return ''.join(parts)
+
+
+def text_xml(text):
+    """w:t, w:br and w:tab elements for a run's text."""
+    parts = []
+    for piece in BREAKS.split(UNWRITABLE.sub('', text)):
+        if piece == LINE_SEPARATOR:
+            parts.append('<w:br/>')
+        elif piece == '\t':
+            parts.append('<w:tab/>')
+        elif piece:
+            parts.append(f'<w:t xml:space="preserve">{escape(piece)}</w:t>')
+    return ''.join(parts)
+
+
+class DocxWriter:
+    """Writes the paragraphs of a document as they come, keeping only the styles and lists seen."""
+
+    def __init__(self, stream, document, progress=None):
+        self.stream = stream
+        self.document = document
+        self.progress = progress
+        self.blockCount = document.blockCount()
+        self.pending = []
+        self.pendingSize = 0
+        self.styles = {}  # run properties -> style id
+        self.formatStyles = {}  # document format index -> style id
+        self.lists = {}  # list object index -> (numId, list kind)
+        self.drawings = 0
+        self.pictures = {}  # document format index -> PICTURE fields, for image formats
+        self.media = {}  # resource name -> (relationship id, target in word/, extension)
+
+    def write(self, xml):
+        self.pending.append(xml)
+        self.pendingSize += len(xml)
+        if self.pendingSize >= FLUSH_SIZE:
+            self.flush()
+
+    def flush(self):
+        self.stream.write(''.join(self.pending).encode('utf-8'))
+        self.pending = []
+        self.pendingSize = 0
+
+    def styleFor(self, fragment):
+        index = fragment.charFormatIndex()
+        style = self.formatStyles.get(index)
+        if style is None:
+            properties = run_properties(fragment.charFormat())
+            style = self.styles.get(properties)
+            if style is None:
+                style = self.styles[properties] = f"Run{len(self.styles) + 1}"
+            self.formatStyles[index] = style
+        return style
+
+    def paragraphProperties(self, block):
+        textList = block.textList()
+        if textList is None:
+            return ''
+        entry = self.lists.get(textList.objectIndex())
+        if entry is None:
+            kind = LIST_KINDS.get(textList.format().style(), LIST_KINDS[QTextListFormat.ListDisc])
+            entry = self.lists[textList.objectIndex()] = (len(self.lists) + 1, kind)
+        numId, kind = entry
+        level = min(max(textList.format().indent() - 1, 0), LIST_LEVELS - 1)
+        return (f'<w:pPr><w:pStyle w:val="{kind[2]}"/>'
+                f'<w:numPr><w:ilvl w:val="{level}"/><w:numId w:val="{numId}"/></w:numPr></w:pPr>')
+
+    def picture(self, fragment):
+        """PICTURE's fields for an image fragment, or None if the document hasn't got the picture."""
+        index = fragment.charFormatIndex()
+        if index not in self.pictures:
+            image_format = fragment.charFormat().toImageFormat()
+            name = image_format.name()
+            fields = None
+            if image_resource(self.document, name) is not None:
+                entry = self.media.get(name)
+                if entry is None:
+                    number = len(self.media) + 1
+                    extension = image_type(self.document, name)
+                    entry = self.media[name] = (f"rImage{number}", f"media/image{number}.{extension}", extension)
+                size = display_size(self.document, image_format)
+                fields = {'cx': round(size.width() * EMU_PER_PIXEL), 'cy': round(size.height() * EMU_PER_PIXEL),
+                          'name': posixpath.basename(entry[1]), 'relationship': entry[0]}
+            self.pictures[index] = fields
+        return self.pictures[index]
+
+    def paragraph(self, block):
+        if block.blockNumber() % PROGRESS_INTERVAL == 0:
+            report(self.progress, block.blockNumber() * 100 // self.blockCount)
+        parts = ['<w:p>', self.paragraphProperties(block)]
+        for fragment in iter_fragments(block):
+            if fragment.charFormat().isImageFormat():
+                fields = self.picture(fragment)
+                for _ in range(fragment.text().count(OBJECT_REPLACEMENT) if fields else 0):
+                    self.drawings += 1
+                    parts.append(PICTURE.format(id=self.drawings, **fields))
+                continue
+            parts.append(f'<w:r><w:rPr><w:rStyle w:val="{self.styleFor(fragment)}"/></w:rPr>'
+                         f'{text_xml(fragment.text())}</w:r>')
+        parts.append('</w:p>')
+        self.write(''.join(parts))
+
+    def frame(self, items):
+        """Write the paragraphs and tables of a frame or table cell; other frames are flattened."""
+        for item in items:
+            if isinstance(item, QTextTable):
+                self.table(item)
+            elif isinstance(item, QTextFrame):
+                self.frame(frame_items(item))
             else:
-                paragraph = doc.add_paragraph()
-        else:
-            paragraph = doc.add_paragraph()
-
-        # Iterate over each character to apply formatting
-        for char_index in range(cursor.selectionStart(), cursor.selectionEnd()):
-            cursor.setPosition(char_index)
-            cursor.movePosition(QTextCursor.NextCharacter, QTextCursor.KeepAnchor)
-            char_format = cursor.charFormat()
-            run = paragraph.add_run(cursor.selectedText())
-
-            # Set font properties
-            run.font.name = char_format.font().family()
-            run.font.size = Pt(char_format.font().pointSize())
-            
-            # Set bold, italic, underline
-            run.bold = char_format.font().bold()
-            run.italic = char_format.font().italic()
-            run.underline = char_format.font().underline()
-
-            # Set text color
-            color = char_format.foreground().color()
-            run.font.color.rgb = RGBColor(color.red(), color.green(), color.blue())
-
-        paragraph.add_run('\n')  # Add a new line after each block
-
-    doc.save(filename)
+                self.paragraph(item)
+
+    def table(self, table):
+        rows, columns = table.rows(), table.columns()
+        cells = table_cells(table)
+        width = (PAGE_WIDTH_TWIPS - 2 * PAGE_MARGIN * TWIPS_PER_PIXEL) // columns
+        self.write('<w:tbl><w:tblPr><w:tblW w:w="0" w:type="auto"/>' + TABLE_BORDERS + '</w:tblPr><w:tblGrid>'
+                   + f'<w:gridCol w:w="{width}"/>' * columns + '</w:tblGrid>')
+        for row in range(rows):
+            self.write('<w:tr>')
+            for column in range(columns):
+                cell = table.cellAt(row, column)
+                if cell.column() != column:
+                    continue  # Covered by the gridSpan of a cell to the left
+                properties = f'<w:tcW w:w="{width * cell.columnSpan()}" w:type="dxa"/>'
+                if cell.columnSpan() > 1:
+                    properties += f'<w:gridSpan w:val="{cell.columnSpan()}"/>'
+                if cell.rowSpan() > 1:
+                    properties += '<w:vMerge w:val="restart"/>' if cell.row() == row else '<w:vMerge/>'
+                self.write(f'<w:tc><w:tcPr>{properties}</w:tcPr>')
+                if cell.row() == row:
+                    self.frame(cells.get((row, column), ()))
+                else:
+                    self.write('<w:p/>')
+                self.write('</w:tc>')
+            self.write('</w:tr>')
+        self.write('</w:tbl>')
+
+    def stylesXml(self):
+        default = DEFAULT_FONT_SIZE * 2
+        parts = [XML_DECLARATION, f'<w:styles {NAMESPACE}>',
+                 '<w:docDefaults><w:rPrDefault><w:rPr>',
+                 run_xml((DEFAULT_FONT, default, False, False, False, '000000')),
+                 '</w:rPr></w:rPrDefault><w:pPrDefault><w:pPr>',
+                 '<w:spacing w:after="0" w:line="240" w:lineRule="auto"/>',
+                 '</w:pPr></w:pPrDefault></w:docDefaults>',
+                 '<w:style w:type="paragraph" w:default="1" w:styleId="Normal"><w:name w:val="Normal"/><w:qFormat/></w:style>',
+                 '<w:style w:type="character" w:default="1" w:styleId="DefaultParagraphFont">'
+                 '<w:name w:val="Default Paragraph Font"/><w:uiPriority w:val="1"/><w:semiHidden/></w:style>']
+        for styleId, name in (('ListBullet', 'List Bullet'), ('ListNumber', 'List Number')):
+            parts.append(f'<w:style w:type="paragraph" w:styleId="{styleId}"><w:name w:val="{name}"/>'
+                         '<w:basedOn w:val="Normal"/><w:pPr><w:contextualSpacing/></w:pPr></w:style>')
+        for properties, styleId in self.styles.items():
+            parts.append(f'<w:style w:type="character" w:customStyle="1" w:styleId="{styleId}">'
+                         f'<w:name w:val="OpenOPen {styleId}"/><w:basedOn w:val="DefaultParagraphFont"/>'
+                         f'<w:rPr>{run_xml(properties)}</w:rPr></w:style>')
+        parts.append('</w:styles>')
+        return ''.join(parts)
+
+    def numberingXml(self):
+        kinds = list(dict.fromkeys(kind for _, kind in self.lists.values()))
+        parts = [XML_DECLARATION, f'<w:numbering {NAMESPACE}>']
+        for abstractId, (numberFormat, text, _) in enumerate(kinds):
+            parts.append(f'<w:abstractNum w:abstractNumId="{abstractId}"><w:multiLevelType w:val="multilevel"/>')
+            for level in range(LIST_LEVELS):
+                label = escape(text.format(level=level + 1))
+                parts.append(f'<w:lvl w:ilvl="{level}"><w:start w:val="1"/><w:numFmt w:val="{numberFormat}"/>'
+                             f'<w:lvlText w:val="{label}"/><w:lvlJc w:val="left"/>'
+                             f'<w:pPr><w:ind w:left="{720 * (level + 1)}" w:hanging="360"/></w:pPr></w:lvl>')
+            parts.append('</w:abstractNum>')
+        # One numbering instance per list, so every numbered list starts again at 1
+        for numId, kind in sorted(self.lists.values()):
+            parts.append(f'<w:num w:numId="{numId}"><w:abstractNumId w:val="{kinds.index(kind)}"/>'
+                         '<w:lvlOverride w:ilvl="0"><w:startOverride w:val="1"/></w:lvlOverride></w:num>')
+        parts.append('</w:numbering>')
+        return ''.join(parts)
+
+
+@timed('export_to_docx', 'io')
+def export_to_docx(text_edit, filename, progress=None):
+    # Accept a bare QTextDocument too, e.g. a clone exported on a worker thread
+    document = text_edit if isinstance(text_edit, QTextDocument) else text_edit.document()
+
+    with zipfile.ZipFile(filename, 'w', zipfile.ZIP_DEFLATED) as package:
+        package.writestr('_rels/.rels', PACKAGE_RELATIONSHIPS)
+        with package.open('word/document.xml', 'w') as stream:
+            writer = DocxWriter(stream, document, progress)
+            writer.write(f'{XML_DECLARATION}<w:document {DOCUMENT_NAMESPACES}><w:body>')
+            writer.frame(frame_items(document.rootFrame()))
+            writer.write(f'{SECTION}</w:body></w:document>')
+            writer.flush()
+        package.writestr('word/styles.xml', writer.stylesXml())
+        package.writestr('word/numbering.xml', writer.numberingXml())
+        for name, (_, target, _) in writer.media.items():
+            # Already compressed; deflating it again would only cost time
+            data = image_bytes(document, name)
+            package.writestr(f'word/{target}', data[0] if data else b'', zipfile.ZIP_STORED)
+        package.writestr('word/_rels/document.xml.rels', document_relationships(writer.media))
+        package.writestr('[Content_Types].xml', content_types({extension for _, _, extension in writer.media.values()}))
+    report(progress, 100)
+    return filename
@@ -0,0 +1,173 @@
+import posixpath
+import zipfile
+from PyQt5.QtGui import QColor, QFont, QTextCursor, QTextListFormat
+import formats
+from document_io import new_document, report, to_gui_thread
+from docx_reader import Table, read_docx
+from images import add_image, image_format
+from instrumentation import timed
+
+PROGRESS_INTERVAL = 500  # paragraphs between progress reports
+
+
+def char_format_for(name, size, bold, italic, underline, rgb):
+    """The shared QTextCharFormat for a set of run properties."""
+    def build(char_format):
+        if name:
+            char_format.setFontFamily(name)
+        if size:
+            char_format.setFontPointSize(size)
+        char_format.setFontWeight(QFont.Bold if bold else QFont.Normal)
+        char_format.setFontItalic(bool(italic))
+        char_format.setFontUnderline(bool(underline))
+        if rgb is not None:
+            char_format.setForeground(QColor(*rgb))
+    return formats.char_format(('docx', name, size, bold, italic, underline, rgb), build)
+
+
+def list_style_for(style_name):
+    if style_name.startswith('List'):
+        if 'Bullet' in style_name:
+            return QTextListFormat.ListDisc
+        elif 'Number' in style_name:
+            return QTextListFormat.ListDecimal
+    return None
+
+
+class DocxBuilder:
+    """Fills a QTextDocument from docx_reader's items, one chunk's worth at a time."""
+
+    def __init__(self, document, package):
+        self.document = document
+        self.package = package
+        self.cursor = QTextCursor(document)
+        self.currentList = None
+        self.fresh = True  # the cursor's block is empty and has nothing carried over into it
+        self.charFormats = []
+        self.images = {}  # part name -> resource name
+
+    def startChunk(self, run_formats):
+        self.charFormats = [char_format_for(*key) for key in run_formats]
+
+    def add(self, item):
+        if isinstance(item, Table):
+            self.table(item)
+        else:
+            self.paragraph(*item)
+
+    def paragraph(self, style_name, runs):
+        cursor = self.cursor
+        list_style = list_style_for(style_name)
+        if not self.fresh:
+            cursor.insertBlock()
+        self.fresh = False
+
+        # insertBlock() carries the previous block's list membership over, so a
+        # paragraph continuing the current list needs no work of its own
+        if self.currentList is None or self.currentList.format().style() != list_style:
+            block = cursor.block()
+            if block.textList() is not None:
+                block.textList().remove(block)
+                block_format = cursor.blockFormat()
+                block_format.setIndent(0)
+                cursor.setBlockFormat(block_format)
+            self.currentList = None
+            if list_style is not None:
+                list_format = QTextListFormat()
+                list_format.setStyle(list_style)
+                self.currentList = cursor.createList(list_format)
+
+        charFormats = self.charFormats
+        for piece, format_id in runs:
+            if isinstance(piece, str):
+                cursor.insertText(piece, charFormats[format_id])
+            else:
+                self.image(piece)
+
+    def image(self, image):
+        name = self.images.get(image.part)
+        if name is None:
+            try:
+                data = self.package.read(image.part)
+            except KeyError:
+                return
+            extension = posixpath.splitext(image.part)[1].lstrip('.') or 'png'
+            name = self.images[image.part] = add_image(self.document, data, extension)
+        self.cursor.insertImage(image_format(name, image.width, image.height))
+
+    def table(self, table):
+        grid = [[] for _ in table.rows]  # per row, the grid column of each cell
+        columns = 0
+        for row, cells in enumerate(table.rows):
+            column = 0
+            for cell in cells:
+                grid[row].append(column)
+                column += cell.span
+            columns = max(columns, column)
+        if not columns:
+            return
+        # The table goes in after the cursor's block, which is left before it
+        text_table = self.cursor.insertTable(len(table.rows), columns)
+        outer = (self.cursor, self.currentList)
+        merges = []
+        for row, cells in enumerate(table.rows):
+            for cell, column in zip(cells, grid[row]):
+                if cell.merge == 'continue':
+                    continue
+                rows = 1
+                if cell.merge == 'restart':
+                    while (row + rows < len(table.rows)
+                           and any(below.merge == 'continue' and start == column
+                                   for below, start in zip(table.rows[row + rows], grid[row + rows]))):
+                        rows += 1
+                if rows > 1 or cell.span > 1:
+                    merges.append((row, column, rows, cell.span))
+                self.cursor = text_table.cellAt(row, column).firstCursorPosition()
+                self.currentList = None
+                self.fresh = True
+                for item in cell.items:
+                    self.add(item)
+        for merge in merges:
+            text_table.mergeCells(*merge)
+        # Carry on in the block Qt leaves after the table
+        self.cursor, _ = outer
+        self.cursor.setPosition(text_table.lastPosition() + 1)
+        self.currentList = None
+        self.fresh = True
+
+
+@timed('import_docx', 'io')
+def import_docx(filename, progress=None, workers=None):
+    """Load a DOCX file into a new, detached QTextDocument.
+
+    The document is built off-screen with undo disabled and a single edit
+    block, so nothing is laid out or signalled until the caller swaps it
+    into a view. It is safe to call from a worker thread; progress, if
+    given, is called with a percentage as paragraphs are consumed.
+    Large files are parsed in a process pool; see docx_reader.read_docx
+    for workers. Pictures are added as their encoded bytes; see images.
+    """
+    futures = read_docx(filename, workers)
+    document = new_document()
+    document.setUndoRedoEnabled(False)
+
+    with zipfile.ZipFile(filename) as package:
+        builder = DocxBuilder(document, package)
+        builder.cursor.beginEditBlock()
+        try:
+            for chunk, future in enumerate(futures):
+                run_formats, items = future.result()
+                builder.startChunk(run_formats)
+                for index, item in enumerate(items):
+                    if index % PROGRESS_INTERVAL == 0:
+                        report(progress, (chunk + index / len(items)) * 100 // len(futures))
+                    builder.add(item)
+        finally:
+            # Chunks still waiting for a process aren't needed once the import is cancelled
+            for future in futures:
+                future.cancel()
+        builder.cursor.endEditBlock()
+
+    document.setUndoRedoEnabled(True)
+    document.setModified(False)
+    return to_gui_thread(document)
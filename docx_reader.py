@@ -0,0 +1,352 @@
+"""Reads the paragraphs of a DOCX file straight from its XML, for docx_importer.
+
+word/document.xml is read with an incremental iterparse: each body
+paragraph is turned into a list of (text, format id) runs as soon as its
+end tag is seen and then dropped, so the tree never holds more than one
+paragraph. Tables come out the same way, as rows of cells holding
+paragraphs, and pictures as Image runs naming their part in the package;
+the picture bytes themselves are left for the importer to read as they're
+needed. Styles are resolved from word/styles.xml once, up front.
+
+Large documents are cut at top-level paragraph boundaries into chunks
+that are parsed in a process pool, so docx_importer can fill its
+QTextDocument from the first chunk while the rest are still being
+parsed. There are no Qt imports here, which keeps the pool's processes
+quick to start.
+"""
+import io
+import os
+import re
+import zipfile
+import posixpath
+import xml.etree.ElementTree as ElementTree
+from bisect import bisect_right
+from collections import namedtuple
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing import get_context, parent_process
+
+W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+R = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+A = '{http://schemas.openxmlformats.org/drawingml/2006/main}'
+WP = '{http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing}'
+V = '{urn:schemas-microsoft-com:vml}'
+RELATIONSHIPS = '{http://schemas.openxmlformats.org/package/2006/relationships}'
+IMAGE_RELATIONSHIP = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/image'
+EMU_PER_PIXEL = 9525
+PARALLEL_THRESHOLD = 4 << 20  # bytes of document.xml worth spreading across processes
+CHUNK_SIZE = 1 << 20  # bytes of document.xml per chunk
+PARAGRAPH_END = b'</w:p>'
+# Elements that can hold paragraphs of their own, which a chunk mustn't be cut inside
+CONTAINER = re.compile(rb'<(/?)w:(?:tbl|sdt|txbxContent)[\s>/]')
+
+# Run children that stand for text
+BREAKS = {W + 'tab': '\t', W + 'br': '\u2028', W + 'cr': '\u2028',
+          W + 'noBreakHyphen': '\u2011', W + 'softHyphen': '\u00ad'}
+OFF = {'0', 'false', 'off', 'none'}
+# Run children that hold a picture
+PICTURES = {W + 'drawing', W + 'pict', '{http://schemas.openxmlformats.org/markup-compatibility/2006}AlternateContent'}
+
+Image = namedtuple('Image', 'part width height')  # width and height in pixels, or None
+Table = namedtuple('Table', 'rows')  # rows of Cells
+Cell = namedtuple('Cell', 'items span merge')  # merge is None, 'restart' or 'continue'
+
+_pool = None
+
+
+class Styles:
+    """Paragraph style names and resolved character style properties, by style id."""
+
+    def __init__(self, paragraphs=None, characters=None, defaultParagraph='Normal'):
+        self.paragraphs = paragraphs or {}
+        self.characters = characters or {}
+        self.defaultParagraph = defaultParagraph
+
+
+def attribute(element, name):
+    return element.get(W + name) if element is not None else None
+
+
+def toggle(rPr, name):
+    element = rPr.find(W + name)
+    if element is None:
+        return None
+    return attribute(element, 'val') not in OFF
+
+
+def run_properties(rPr):
+    """(font, size in points, bold, italic, underline, (r, g, b)) set by an rPr; None where unset."""
+    if rPr is None:
+        return (None,) * 6
+    size = attribute(rPr.find(W + 'sz'), 'val')
+    color = attribute(rPr.find(W + 'color'), 'val')
+    underline = rPr.find(W + 'u')
+    rgb = None
+    if color and len(color) == 6 and color != 'auto':
+        try:
+            rgb = (int(color[0:2], 16), int(color[2:4], 16), int(color[4:6], 16))
+        except ValueError:
+            pass
+    return (
+        attribute(rPr.find(W + 'rFonts'), 'ascii'),
+        int(size) / 2 if size and size.isdigit() else None,
+        toggle(rPr, 'b'),
+        toggle(rPr, 'i'),
+        None if underline is None else attribute(underline, 'val') not in OFF,
+        rgb,
+    )
+
+
+def inherit(properties, base):
+    return tuple(base[i] if value is None else value for i, value in enumerate(properties))
+
+
+def read_styles(package):
+    try:
+        root = ElementTree.fromstring(package.read('word/styles.xml'))
+    except KeyError:
+        return Styles()
+    paragraphs = {}
+    defaultParagraph = 'Normal'
+    declared = {}  # character style id -> (basedOn, own properties)
+    for style in root.iter(W + 'style'):
+        styleId = attribute(style, 'styleId')
+        kind = attribute(style, 'type')
+        name = attribute(style.find(W + 'name'), 'val') or styleId
+        if kind == 'paragraph':
+            paragraphs[styleId] = name
+            if attribute(style, 'default') in ('1', 'true'):
+                defaultParagraph = name
+        elif kind == 'character':
+            declared[styleId] = (attribute(style.find(W + 'basedOn'), 'val'), run_properties(style.find(W + 'rPr')))
+
+    characters = {}
+
+    def resolve(styleId, seen=()):
+        if styleId not in declared or styleId in seen:
+            return (None,) * 6
+        if styleId not in characters:
+            basedOn, own = declared[styleId]
+            characters[styleId] = inherit(own, resolve(basedOn, seen + (styleId,)))
+        return characters[styleId]
+    for styleId in declared:
+        resolve(styleId)
+    return Styles(paragraphs, characters, defaultParagraph)
+
+
+def read_images(package):
+    """Package part of every picture relationship of the main document, by relationship id."""
+    try:
+        root = ElementTree.fromstring(package.read('word/_rels/document.xml.rels'))
+    except KeyError:
+        return {}
+    images = {}
+    for relationship in root.iter(RELATIONSHIPS + 'Relationship'):
+        if relationship.get('Type') == IMAGE_RELATIONSHIP and relationship.get('TargetMode') != 'External':
+            target = relationship.get('Target', '')
+            part = target.lstrip('/') if target.startswith('/') else posixpath.normpath(posixpath.join('word', target))
+            images[relationship.get('Id')] = part
+    return images
+
+
+def picture(element, images):
+    """The Image of a w:drawing or w:pict, or None if it doesn't refer to a picture in the package."""
+    blip = next(element.iter(A + 'blip'), None)
+    if blip is not None:
+        part = images.get(blip.get(R + 'embed'))
+        extent = next(element.iter(WP + 'extent'), None)
+        if part is None:
+            return None
+        if extent is None:
+            return Image(part, None, None)
+        try:
+            return Image(part, round(int(extent.get('cx')) / EMU_PER_PIXEL), round(int(extent.get('cy')) / EMU_PER_PIXEL))
+        except (TypeError, ValueError):
+            return Image(part, None, None)
+    data = next(element.iter(V + 'imagedata'), None)
+    if data is not None and data.get(R + 'id') in images:
+        return Image(images[data.get(R + 'id')], None, None)
+    return None
+
+
+def run_pieces(run, images):
+    """The text of a run, split around its pictures: strings and Images in order."""
+    parts = []
+    for child in run:
+        tag = child.tag
+        if tag == W + 't':
+            parts.append(child.text or '')
+        elif tag in BREAKS:
+            parts.append(BREAKS[tag])
+        elif tag in PICTURES:
+            image = picture(child, images)
+            if image is not None:
+                if parts:
+                    yield ''.join(parts)
+                    parts = []
+                yield image
+    if parts:
+        yield ''.join(parts)
+
+
+def paragraph_runs(element):
+    """The w:r elements of a paragraph, including those in hyperlinks, insertions and fields.
+
+    Runs inside a run, such as the paragraphs of a text box, aren't part of the paragraph's text.
+    """
+    for child in element:
+        if child.tag == W + 'r':
+            yield child
+        elif child.tag != W + 'pPr':
+            yield from paragraph_runs(child)
+
+
+def parse_paragraphs(data, styles, images=None):
+    """Parse a document.xml, or a chunk of one, into (formats, items).
+
+    formats lists the run property tuples in use. Each item is a paragraph,
+    (style name, [(text or Image, index into formats), ...]), or a Table
+    whose cells hold items of their own.
+    """
+    images = images or {}
+    formats = {}
+    items = []
+    depth = 0
+    body = None
+    for event, element in ElementTree.iterparse(io.BytesIO(data), events=('start', 'end')):
+        if event == 'start':
+            depth += 1
+            if depth == 2:
+                body = element
+            continue
+        if depth == 3:
+            if element.tag == W + 'p':
+                items.append(read_paragraph(element, styles, images, formats))
+            elif element.tag == W + 'tbl':
+                items.append(read_table(element, styles, images, formats))
+            # Only the paragraph or table being read is ever in the tree
+            body.remove(element)
+        depth -= 1
+    return list(formats), items
+
+
+def read_paragraph(element, styles, images, formats):
+    pPr = element.find(W + 'pPr')
+    styleId = attribute(pPr.find(W + 'pStyle'), 'val') if pPr is not None else None
+    style = styles.paragraphs.get(styleId, styleId) if styleId else styles.defaultParagraph
+    runs = []
+    for run in paragraph_runs(element):
+        pieces = list(run_pieces(run, images))
+        if not pieces:
+            continue
+        rPr = run.find(W + 'rPr')
+        properties = run_properties(rPr)
+        characterStyle = attribute(rPr.find(W + 'rStyle'), 'val') if rPr is not None else None
+        if characterStyle in styles.characters:
+            properties = inherit(properties, styles.characters[characterStyle])
+        name, size, bold, italic, underline, rgb = properties
+        properties = (name, size, bool(bold), bool(italic), bool(underline), rgb)
+        index = formats.get(properties)
+        if index is None:
+            index = formats[properties] = len(formats)
+        runs.extend((piece, index) for piece in pieces)
+    return style, runs
+
+
+def read_table(element, styles, images, formats):
+    rows = [read_row(row, styles, images, formats) for row in element.findall(W + 'tr')]
+    return Table([row for row in rows if row])
+
+
+def read_row(row, styles, images, formats):
+    cells = []
+    for cell in row.findall(W + 'tc'):
+        tcPr = cell.find(W + 'tcPr')
+        span = attribute(tcPr.find(W + 'gridSpan'), 'val') if tcPr is not None else None
+        merge = tcPr.find(W + 'vMerge') if tcPr is not None else None
+        if merge is not None:
+            merge = 'restart' if attribute(merge, 'val') == 'restart' else 'continue'
+        items = []
+        for child in cell:
+            if child.tag == W + 'p':
+                items.append(read_paragraph(child, styles, images, formats))
+            elif child.tag == W + 'tbl':
+                items.append(read_table(child, styles, images, formats))
+        cells.append(Cell(items, int(span) if span and span.isdigit() else 1, merge))
+    return cells
+
+
+def split_chunks(data, size):
+    """Cut document.xml into standalone documents of about size bytes each.
+
+    Cuts are made after a paragraph end tag that isn't inside a table,
+    content control or text box, and every chunk gets the original root
+    and body tags around it. Returns [data] when there's nothing to cut.
+    """
+    bodyStart = data.find(b'<w:body')
+    bodyEnd = data.rfind(b'</w:body>')
+    if bodyStart < 0 or bodyEnd < 0 or len(data) <= size:
+        return [data]
+    contentStart = data.index(b'>', bodyStart) + 1
+    regions = []  # (start, end) of top-level containers
+    depth = 0
+    for match in CONTAINER.finditer(data, contentStart, bodyEnd):
+        if not match.group(1):
+            if not depth:
+                start = match.start()
+            depth += 1
+        else:
+            depth -= 1
+            if not depth:
+                regions.append((start, match.end()))
+    starts = [start for start, _ in regions]
+
+    cuts = [contentStart]
+    target = contentStart + size
+    while target < bodyEnd:
+        position = data.find(PARAGRAPH_END, target, bodyEnd)
+        while position >= 0:
+            region = bisect_right(starts, position) - 1
+            if region < 0 or regions[region][1] <= position:
+                break
+            position = data.find(PARAGRAPH_END, regions[region][1], bodyEnd)
+        if position < 0:
+            break
+        cuts.append(position + len(PARAGRAPH_END))
+        target = cuts[-1] + size
+    cuts.append(bodyEnd)
+
+    head = data[:contentStart]
+    return [head + data[start:end] + b'</w:body></w:document>' for start, end in zip(cuts, cuts[1:]) if end > start]
+
+
+def pool():
+    global _pool
+    if _pool is None:
+        # Spawned, not forked: the importing process has Qt and worker threads running
+        _pool = ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=get_context('spawn'))
+    return _pool
+
+
+def read_docx(filename, workers=None):
+    """Start reading a DOCX file; returns futures of (formats, items) per chunk, in document order.
+
+    workers is the number of processes to spread a large document over;
+    by default one per CPU, and none for small documents, a single CPU or
+    when this is already a worker process, in which case the one chunk
+    has been parsed by the time this returns.
+    """
+    with zipfile.ZipFile(filename) as package:
+        styles = read_styles(package)
+        images = read_images(package)
+        data = package.read('word/document.xml')
+    if workers is None:
+        workers = (os.cpu_count() or 1) if len(data) >= PARALLEL_THRESHOLD else 1
+        if parent_process() is not None:
+            # Already one of convert's workers, which spread whole files across the CPUs
+            workers = 1
+    if workers <= 1:
+        future = Future()
+        future.set_result(parse_paragraphs(data, styles, images))
+        return [future]
+    chunks = split_chunks(data, max(CHUNK_SIZE, len(data) // (workers * 4)))
+    return [pool().submit(parse_paragraphs, chunk, styles, images) for chunk in chunks]
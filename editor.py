@@ -1,23 +1,35 @@
 import os
+import re
 import sys
 from typing import Optional
-from docx_exporter import export_to_docx
+from document_io import new_document, read_text, load_rtf, export_pdf
+from rtf_exporter import export_to_rtf
+from native_format import load_native, read_model, save_native, write_native
+from jobs import JobManager
+from large_file import LargeFileView, open_large_file, save_large_file
+from autosave import Autosave, orphaned_sessions, recover, discard_session
+from search import SearchIndex
+from spellcheck import SpellChecker
+from document_stats import document_stats, format_counts
+from toolbar_state import ToolbarState
+from startup_profile import phase
+from themes import theme
+import instrumentation
+from instrumentation import timed
+from performance_overlay import PerformanceOverlay
+from tabs import DocumentTab, format_bytes, release_layout, restore_layout
 
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QAction, QFileDialog,
     QToolBar, QComboBox, QFontComboBox, QMessageBox, QMenu, QMenuBar, QToolButton,
-    QShortcut, QLabel, QDialog, QTextEdit
+    QShortcut, QLabel, QDialog, QTextEdit, QTabBar
 )
 from PyQt5.QtGui import (
     QIcon, QFont, QColor, QPalette, QTextCursor, QTextDocument,
     QKeySequence, QTextListFormat, QTextCharFormat
 )
+from PyQt5 import sip
 from PyQt5.QtCore import Qt, QSize, QTimer,QFile
-from PyQt5.QtPrintSupport import QPrinter, QPrintDialog
-
-from docx import Document
-from docx.shared import Pt, RGBColor
-from docx.enum.style import WD_STYLE_TYPE
 
 from zoomable_text_edit import ZoomableTextEdit
 from color_wheel import ColorWheel
@@ -31,26 +43,44 @@ class Editor(QMainWindow):
         self.update_timer = QTimer(self)
         self.update_timer.setSingleShot(True)
         self.update_timer.timeout.connect(self.updateFontControls)
+        self.update_timer.timeout.connect(self.updateStatistics)
+        self.findDialog = None
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.timeout.connect(self.refreshSearchResults)
         self.initUI()
 
+    def icon(self, name):
+        return theme(self.dark_mode).icon(name)
+
     def get_resource_path(self, relative_path):
         """ Get absolute path to resource, works for dev and for PyInstaller """
         base_path = getattr(sys, '_MEIPASS', os.path.dirname(os.path.abspath(__file__)))
         return os.path.join(base_path, relative_path)
 
     def initUI(self):
-        self.setupCentralWidget()
-        self.setWindowProperties()
-        self.setupActions()
-        self.setupMenus()
-        self.setupToolbar()
-        self.setupShortcuts()
-        self.setLightModePalette()
-        self.loadStyleSheet(self.get_resource_path('styles/style.qss'))
-        self.show()
-        self.textEdit.textEdit.cursorPositionChanged.connect(self.updateFontControls)
+        for step in (self.setupCentralWidget, self.setWindowProperties, self.setupActions,
+                     self.setupMenus, self.setupToolbar, self.setupShortcuts):
+            with phase(step.__name__):
+                step()
+        self.jobs = JobManager(self.statusBar(), self)
+        self.statsLabel = QLabel(self)
+        self.statusBar().addPermanentWidget(self.statsLabel)
+        self.performanceOverlay = PerformanceOverlay(self)
+        self.statusBar().addPermanentWidget(self.performanceOverlay)
+        self.pendingPaths = []
+        self.jobs.idle.connect(self.openPendingPaths)
+        self.newTab()
+        self.spellCheckAction.setChecked(True)
+        with phase('styles'):
+            self.applyTheme()
+        # All of these funnel into one debounced updateFontControls and updateStatistics call
         self.textEdit.textEdit.textChanged.connect(self.scheduleUpdate)
         self.textEdit.textEdit.cursorPositionChanged.connect(self.scheduleUpdate)
+        self.textEdit.textEdit.selectionChanged.connect(self.scheduleUpdate)
+        self.textEdit.textEdit.currentCharFormatChanged.connect(self.scheduleUpdate)
+        self.textEdit.documentChanged.connect(self.scheduleUpdate)
+        QTimer.singleShot(0, self.offerRecovery)
 
     def setWindowProperties(self):
         self.setWindowTitle('OpenOPen (v.1.0.0)')
@@ -68,36 +98,12 @@ class Editor(QMainWindow):
         # Schedule an update in 100ms
         self.update_timer.start(100)
     
-    def updateFontControls(self):
+    def formattingState(self):
+        """Which formatting buttons should be active for the text at the cursor."""
         cursor = self.textEdit.textEdit.textCursor()
         char_format = cursor.charFormat()
-        block_format = cursor.blockFormat()
-
-        # Update bold button
-        is_bold = char_format.fontWeight() == QFont.Bold
-        self.boldAction.setChecked(is_bold)
-        self.updateButtonStyle(self.boldAction, is_bold)
-
-        # Update italic button
-        is_italic = char_format.fontItalic()
-        self.italicAction.setChecked(is_italic)
-        self.updateButtonStyle(self.italicAction, is_italic)
-
-        # Update underline button
-        is_underline = char_format.fontUnderline()
-        self.underlineAction.setChecked(is_underline)
-        self.updateButtonStyle(self.underlineAction, is_underline)
-
-        # Update alignment buttons
-        alignment = block_format.alignment()
-        self.alignLeftAction.setChecked(alignment == Qt.AlignLeft)
-        self.updateButtonStyle(self.alignLeftAction, alignment == Qt.AlignLeft)
-        self.alignCenterAction.setChecked(alignment == Qt.AlignCenter)
-        self.updateButtonStyle(self.alignCenterAction, alignment == Qt.AlignCenter)
-        self.alignRightAction.setChecked(alignment == Qt.AlignRight)
-        self.updateButtonStyle(self.alignRightAction, alignment == Qt.AlignRight)
-
-        # Update list buttons
+        alignment = cursor.blockFormat().alignment()
+
         current_list = cursor.currentList()
         if current_list:
             list_format = current_list.format()
@@ -105,154 +111,189 @@ class Editor(QMainWindow):
             is_numbered = list_format.style() == QTextListFormat.ListDecimal
         else:
             is_bullet = is_numbered = False
-        
-        self.bulletListAction.setChecked(is_bullet)
-        self.updateButtonStyle(self.bulletListAction, is_bullet)
-        self.numberedListAction.setChecked(is_numbered)
-        self.updateButtonStyle(self.numberedListAction, is_numbered)
+
+        return {
+            self.boldAction: char_format.fontWeight() == QFont.Bold,
+            self.italicAction: char_format.fontItalic(),
+            self.underlineAction: char_format.fontUnderline(),
+            self.alignLeftAction: alignment == Qt.AlignLeft,
+            self.alignCenterAction: alignment == Qt.AlignCenter,
+            self.alignRightAction: alignment == Qt.AlignRight,
+            self.bulletListAction: is_bullet,
+            self.numberedListAction: is_numbered,
+        }
+
+    @timed('Editor.updateFontControls', 'ui')
+    def updateFontControls(self):
+        self.toolbarState.apply(self.formattingState())
 
         # Update font family and size
-        current_font = char_format.font().family()
-        current_font_size = char_format.font().pointSize()
+        font = self.textEdit.textEdit.textCursor().charFormat().font()
+        current_font = font.family()
+        current_font_size = font.pointSize()
 
-        if current_font:
+        # Only sync the combos, don't let them apply their value back to the text
+        if current_font and current_font != self.fontFamily.currentFont().family():
+            self.fontFamily.blockSignals(True)
             self.fontFamily.setCurrentFont(QFont(current_font))
-        if current_font_size > 0:
+            self.fontFamily.blockSignals(False)
+        if current_font_size > 0 and str(current_font_size) != self.fontSize.currentText():
+            self.fontSize.blockSignals(True)
             self.fontSize.setCurrentText(str(current_font_size))
+            self.fontSize.blockSignals(False)
 
-    def updateButtonStyle(self, action, is_active):
-        for widget in self.toolbar.children():
-            if isinstance(widget, QToolButton) and widget.defaultAction() == action:
-                if is_active:
-                    if self.dark_mode:
-                        color = QColor(80, 80, 80)  # Dark gray for dark mode
-                    else:
-                        color = QColor(224, 224, 224)  # #e0e0e0 for light mode
-                    widget.setStyleSheet(f"background-color: {color.name()};")
-                else:
-                    widget.setStyleSheet("")
-                break
-    
-    def updateAllButtonStyles(self):
-        actions_to_update = [
-            (self.boldAction, self.textEdit.textEdit.fontWeight() == QFont.Bold),
-            (self.italicAction, self.textEdit.textEdit.fontItalic()),
-            (self.underlineAction, self.textEdit.textEdit.fontUnderline()),
-            (self.alignLeftAction, self.textEdit.textEdit.alignment() == Qt.AlignLeft),
-            (self.alignCenterAction, self.textEdit.textEdit.alignment() == Qt.AlignCenter),
-            (self.alignRightAction, self.textEdit.textEdit.alignment() == Qt.AlignRight),
-        ]
+    @timed('Editor.updateStatistics', 'ui')
+    def updateStatistics(self):
+        if self.activeTab is None or self.activeTab.largeView is not None:
+            self.statsLabel.clear()
+            return
+        # Kept current by the document's own counts, so this is cheap on every keystroke
+        stats = document_stats(self.activeTab.document)
+        selected = stats.selectionCounts(self.textEdit.textEdit.textCursor())
+        self.statsLabel.setText(format_counts(stats.counts(), selected))
 
-        cursor = self.textEdit.textEdit.textCursor()
-        if cursor.currentList():
-            list_format = cursor.currentList().format()
-            actions_to_update.extend([
-                (self.bulletListAction, list_format.style() == QTextListFormat.ListDisc),
-                (self.numberedListAction, list_format.style() == QTextListFormat.ListDecimal),
-            ])
-        else:
-            actions_to_update.extend([
-                (self.bulletListAction, False),
-                (self.numberedListAction, False),
-            ])
+    @timed('Editor.updateButtonStyle', 'ui')
+    def updateButtonStyle(self, action, is_active):
+        self.toolbarState.apply({action: is_active})
 
-        for action, is_active in actions_to_update:
-            self.updateButtonStyle(action, is_active)
-                
+    def updateAllButtonStyles(self):
+        self.toolbarState.apply(self.formattingState())
+        self.toolbarState.repolish()
 
     def setupCentralWidget(self):
         centralWidget = QWidget(self)
         self.setCentralWidget(centralWidget)
         layout = QVBoxLayout(centralWidget)
         layout.setContentsMargins(0, 0, 0, 0)
+        self.tabBar = QTabBar(centralWidget)
+        self.tabBar.setDocumentMode(True)
+        self.tabBar.setTabsClosable(True)
+        self.tabBar.setMovable(True)
+        self.tabBar.setExpanding(False)
+        layout.addWidget(self.tabBar)
+        # One view for all tabs; switching tabs swaps the document inside it
         self.textEdit = ZoomableTextEdit(centralWidget)
         layout.addWidget(self.textEdit)
+        self.search = SearchIndex(self)
+        self.search.setDocument(self.textEdit.document())
+        self.textEdit.documentChanged.connect(self.search.setDocument)
+        self.search.changed.connect(self.scheduleSearchRefresh)
+        self.spellChecker = SpellChecker(self.textEdit, self)
+        self.spellChecker.unavailable.connect(self.spellCheckUnavailable)
+        self.spellChecker.failed.connect(lambda error: self.statusBar().showMessage(f"Spell check failed: {error}", 5000))
+        self.activeTab = None
+        self.tabBar.currentChanged.connect(self.activateTab)
+        self.tabBar.tabCloseRequested.connect(self.closeTab)
 
     def setWindowProperties(self):
         self.setWindowTitle('OpenOPen (v.1.0.0)')
-        self.setWindowIcon(QIcon('icons/app_icon.png'))
+        self.setWindowIcon(self.icon('app_icon'))
         self.setGeometry(500, 100, 1750, 1200)
 
     def setupActions(self):
-        self.openAction = QAction(QIcon(self.get_resource_path('icons/open.png')), 'Open', self)
+        self.openAction = QAction(self.icon('open'), 'Open', self)
         self.openAction.setShortcut('Ctrl+O')
         self.openAction.triggered.connect(self.openFile)
 
-        self.saveAction = QAction(QIcon(self.get_resource_path('icons/save.png')), 'Save', self)
+        self.saveAction = QAction(self.icon('save'), 'Save', self)
         self.saveAction.setShortcut('Ctrl+S')
         self.saveAction.triggered.connect(self.saveFile)
 
-        self.docxAction = QAction(QIcon(self.get_resource_path('icons/docx.png')), 'Save as DOCX', self)
+        self.docxAction = QAction(self.icon('docx'), 'Save as DOCX', self)
         self.docxAction.triggered.connect(self.exportDOCX)
 
-        self.pdfAction = QAction(QIcon(self.get_resource_path('icons/pdf.png')), 'Save as PDF', self)
+        self.pdfAction = QAction(self.icon('pdf'), 'Save as PDF', self)
         self.pdfAction.triggered.connect(self.exportPDF)
 
-        self.printAction = QAction(QIcon(self.get_resource_path('icons/print.png')), 'Print', self)
+        self.printAction = QAction(self.icon('print'), 'Print', self)
         self.printAction.setShortcut('Ctrl+P')
         self.printAction.triggered.connect(self.printDocument)
 
-        self.boldAction = QAction(QIcon(self.get_resource_path('icons/bold.png')), 'Bold', self)
+        self.newTabAction = QAction('New Tab', self)
+        self.newTabAction.setShortcut('Ctrl+T')
+        self.newTabAction.triggered.connect(lambda: self.newTab())
+
+        self.closeTabAction = QAction('Close Tab', self)
+        self.closeTabAction.setShortcut('Ctrl+W')
+        self.closeTabAction.triggered.connect(lambda: self.closeTab(self.tabBar.currentIndex()))
+
+        self.memoryAction = QAction('Memory Usage', self)
+        self.memoryAction.triggered.connect(self.showMemoryUsage)
+
+        self.overlayAction = QAction('Performance Overlay', self)
+        self.overlayAction.setShortcut('Ctrl+Shift+P')
+        self.overlayAction.setCheckable(True)
+        self.overlayAction.toggled.connect(self.togglePerformanceOverlay)
+
+        self.traceAction = QAction('Export Trace...', self)
+        self.traceAction.triggered.connect(self.exportTrace)
+
+        self.spellCheckAction = QAction('Check Spelling', self)
+        self.spellCheckAction.setShortcut('F7')
+        self.spellCheckAction.setCheckable(True)
+        self.spellCheckAction.toggled.connect(self.spellChecker.setEnabled)
+
+        self.boldAction = QAction(self.icon('bold'), 'Bold', self)
         self.boldAction.setShortcut('Ctrl+B')
         self.boldAction.triggered.connect(self.setBold)
         self.boldAction.setCheckable(True)
 
-        self.italicAction = QAction(QIcon(self.get_resource_path('icons/italic.png')), 'Italic', self)
+        self.italicAction = QAction(self.icon('italic'), 'Italic', self)
         self.italicAction.setShortcut('Ctrl+I')
         self.italicAction.triggered.connect(self.setItalic)
         self.italicAction.setCheckable(True)
 
-        self.underlineAction = QAction(QIcon(self.get_resource_path('icons/underline.png')), 'Underline', self)
+        self.underlineAction = QAction(self.icon('underline'), 'Underline', self)
         self.underlineAction.setShortcut('Ctrl+U')
         self.underlineAction.triggered.connect(self.setUnderline)
         self.underlineAction.setCheckable(True)
 
-        self.bulletListAction = QAction(QIcon(self.get_resource_path('icons/bullet_list.png')), 'Bullet List', self)
+        self.bulletListAction = QAction(self.icon('bullet_list'), 'Bullet List', self)
         self.bulletListAction.triggered.connect(self.toggleBulletList)
         self.bulletListAction.setCheckable(True)
 
-        self.numberedListAction = QAction(QIcon(self.get_resource_path('icons/numbered_list.png')), 'Numbered List', self)
+        self.numberedListAction = QAction(self.icon('numbered_list'), 'Numbered List', self)
         self.numberedListAction.triggered.connect(self.toggleNumberedList)
         self.numberedListAction.setCheckable(True)
 
-        self.findAction = QAction(QIcon(self.get_resource_path('icons/find.png')), 'Find', self)
+        self.findAction = QAction(self.icon('find'), 'Find', self)
         self.findAction.setShortcut('Ctrl+F')
         self.findAction.triggered.connect(self.openFindDialog)
 
-        self.colorAction = QAction(QIcon(self.get_resource_path('icons/color.png')), 'Color', self)
+        self.colorAction = QAction(self.icon('color'), 'Color', self)
         self.colorAction.triggered.connect(self.setColor)
 
-        self.darkModeAction = QAction(QIcon(self.get_resource_path('icons/dark_mode.png')), 'Toggle Dark Mode', self)
+        self.darkModeAction = QAction(self.icon('dark_mode'), 'Toggle Dark Mode', self)
         self.darkModeAction.triggered.connect(self.toggleDarkMode)
 
-        self.undoAction = QAction(QIcon(self.get_resource_path('icons/undo.png')), 'Undo', self)
+        self.undoAction = QAction(self.icon('undo'), 'Undo', self)
         self.undoAction.setShortcut('Ctrl+Z')
-        self.undoAction.triggered.connect(self.textEdit.undo)
+        self.undoAction.triggered.connect(self.undo)
 
-        self.redoAction = QAction(QIcon(self.get_resource_path('icons/redo.png')), 'Redo', self)
+        self.redoAction = QAction(self.icon('redo'), 'Redo', self)
         self.redoAction.setShortcut('Ctrl+Y')
-        self.redoAction.triggered.connect(self.textEdit.redo)
+        self.redoAction.triggered.connect(self.redo)
 
-        self.alignLeftAction = QAction(QIcon(self.get_resource_path('icons/align_left.png')), 'Align Left', self)
+        self.alignLeftAction = QAction(self.icon('align_left'), 'Align Left', self)
         self.alignLeftAction.setShortcut('Ctrl+L')
         self.alignLeftAction.triggered.connect(lambda: self.textEdit.setAlignment(Qt.AlignLeft))
         self.alignLeftAction.setCheckable(True)
 
-        self.alignCenterAction = QAction(QIcon(self.get_resource_path('icons/align_center.png')), 'Align Center', self)
+        self.alignCenterAction = QAction(self.icon('align_center'), 'Align Center', self)
         self.alignCenterAction.setShortcut('Ctrl+E')
         self.alignCenterAction.triggered.connect(lambda: self.textEdit.setAlignment(Qt.AlignCenter))
         self.alignCenterAction.setCheckable(True)
 
-        self.alignRightAction = QAction(QIcon(self.get_resource_path('icons/align_right.png')), 'Align Right', self)
+        self.alignRightAction = QAction(self.icon('align_right'), 'Align Right', self)
         self.alignRightAction.setShortcut('Ctrl+R')
         self.alignRightAction.triggered.connect(lambda: self.textEdit.setAlignment(Qt.AlignRight))
         self.alignRightAction.setCheckable(True)
 
-        self.zoomInAction = QAction(QIcon(self.get_resource_path('icons/zoom_in.png')), 'Zoom In', self)
+        self.zoomInAction = QAction(self.icon('zoom_in'), 'Zoom In', self)
         self.zoomInAction.setShortcut('Ctrl++')
         self.zoomInAction.triggered.connect(self.textEdit.zoomIn)
 
-        self.zoomOutAction = QAction(QIcon(self.get_resource_path('icons/zoom_out.png')), 'Zoom Out', self)
+        self.zoomOutAction = QAction(self.icon('zoom_out'), 'Zoom Out', self)
         self.zoomOutAction.setShortcut('Ctrl+-')
         self.zoomOutAction.triggered.connect(self.textEdit.zoomOut)
 
@@ -262,7 +303,8 @@ class Editor(QMainWindow):
         menubar.customContextMenuRequested.connect(self.showMenuBarContextMenu)
 
         fileMenu = menubar.addMenu('&File')
-        fileMenu.addActions([self.openAction, self.saveAction, self.docxAction, self.pdfAction, self.printAction])
+        fileMenu.addActions([self.newTabAction, self.openAction, self.saveAction, self.docxAction, self.pdfAction,
+                             self.printAction, self.closeTabAction])
 
         editMenu = menubar.addMenu('&Edit')
         editMenu.addActions([
@@ -276,10 +318,14 @@ class Editor(QMainWindow):
         ])
 
         viewMenu = self.menuBar().addMenu('&View')
-        viewMenu.addActions([self.zoomInAction, self.zoomOutAction])
+        viewMenu.addActions([self.zoomInAction, self.zoomOutAction, self.memoryAction])
+        viewMenu.addSeparator()
+        viewMenu.addAction(self.spellCheckAction)
+        viewMenu.addSeparator()
+        viewMenu.addActions([self.overlayAction, self.traceAction])
         
         helpMenu = menubar.addMenu('&Help')
-        readmeAction = QAction(QIcon('icons/help.png'), 'Open README', self)
+        readmeAction = QAction(self.icon('help'), 'Open README', self)
         readmeAction.triggered.connect(self.openReadme)
         helpMenu.addAction(readmeAction)
 
@@ -319,6 +365,12 @@ class Editor(QMainWindow):
         widget = self.toolbar.widgetForAction(self.darkModeAction)
         widget.setFixedSize(60, 60)
 
+        self.toolbarState = ToolbarState(self.toolbar, [
+            self.boldAction, self.italicAction, self.underlineAction,
+            self.alignLeftAction, self.alignCenterAction, self.alignRightAction,
+            self.bulletListAction, self.numberedListAction,
+        ])
+
         self.setupFontControls()
         self.setupZoomLabel()
 
@@ -330,12 +382,14 @@ class Editor(QMainWindow):
 
     def setupFontControls(self):
         self.fontFamily = QFontComboBox(self)
+        self.fontFamily.setObjectName('fontFamily')
         self.fontFamily.setCurrentFont(QFont("Times New Roman"))
         self.fontFamily.setFixedSize(200, 40)
         self.fontFamily.currentFontChanged.connect(self.setFontFamily)
         self.toolbar.addWidget(self.fontFamily)
 
         self.fontSize = QComboBox(self)
+        self.fontSize.setObjectName('fontSize')
         self.fontSize.addItems([str(i) for i in range(8, 73, 2)])
         self.fontSize.setCurrentText('12')
         self.fontSize.setFixedSize(70, 40)
@@ -345,7 +399,7 @@ class Editor(QMainWindow):
     def setupZoomLabel(self):
         self.toolbar.addAction(self.zoomOutAction)
         self.zoomLabel = QLabel("100%")
-        self.zoomLabel.setStyleSheet("font-weight: bold;font-size: 10pt;")
+        self.zoomLabel.setObjectName('zoomLabel')  # Styled by the theme
         self.toolbar.addWidget(self.zoomLabel)
         self.toolbar.addAction(self.zoomInAction)
 
@@ -353,47 +407,20 @@ class Editor(QMainWindow):
         QShortcut(QKeySequence('Ctrl+Q'), self, self.close)
         QShortcut(QKeySequence('Ctrl+='), self, self.increaseFontSize)
         QShortcut(QKeySequence('Ctrl+-'), self, self.decreaseFontSize)
+        QShortcut(QKeySequence('Ctrl+Tab'), self, lambda: self.cycleTabs(1))
+        QShortcut(QKeySequence('Ctrl+Shift+Tab'), self, lambda: self.cycleTabs(-1))
         self.textEdit.zoomChanged.connect(self.updateZoomLabel)
 
-    def setLightModePalette(self):
-        palette = self.palette()
-        palette.setColor(QPalette.Window, Qt.white)
-        palette.setColor(QPalette.WindowText, Qt.black)
-        palette.setColor(QPalette.Base, Qt.white)
-        palette.setColor(QPalette.AlternateBase, Qt.lightGray)
-        palette.setColor(QPalette.ToolTipBase, Qt.white)
-        palette.setColor(QPalette.ToolTipText, Qt.black)
-        palette.setColor(QPalette.Text, Qt.black)
-        palette.setColor(QPalette.Button, Qt.lightGray)
-        palette.setColor(QPalette.ButtonText, Qt.black)
-        palette.setColor(QPalette.BrightText, Qt.red)
-        palette.setColor(QPalette.Link, QColor(0, 0, 255))
-        palette.setColor(QPalette.Highlight, QColor(0, 120, 215))
-        palette.setColor(QPalette.HighlightedText, Qt.white)
-
+    def applyTheme(self):
+        """Apply the current theme's cached palette and stylesheet."""
+        current = theme(self.dark_mode)
+        palette = current.palette
         self.setPalette(palette)
         QApplication.instance().setPalette(palette)
         self.textEdit.setPalette(palette)
         self.textEdit.textEdit.setPalette(palette)
         self.textEdit.setBackgroundBrush(palette.color(QPalette.Window))
-
-    def loadStyleSheet(self, path):
-        with open(path, 'r') as file:
-            stylesheet = file.read()
-
-        custom_styles = """
-        QMenuBar {
-            padding: 5px;
-            margin: 0px;
-        }
-        QToolBar {
-            padding: 5px;
-            margin: 0px;
-        }
-        """
-        
-        stylesheet += custom_styles
-        self.setStyleSheet(stylesheet)
+        self.setStyleSheet(current.styleSheet)
 
     def showToolbarContextMenu(self, pos):
         contextMenu = QMenu(self)
@@ -422,66 +449,19 @@ class Editor(QMainWindow):
             self.textEdit.textEdit.setFontPointSize(currentSize - 1)
 
     def toggleDarkMode(self):
+        # Everything a theme needs is built once, so switching back and forth is a swap
         self.dark_mode = not self.dark_mode
         self.updateIcons(dark=self.dark_mode)
-
-        style_path = self.get_resource_path('styles/dark_style.qss' if self.dark_mode else 'styles/style.qss')
-        self.loadStyleSheet(style_path)
-        
-        
-        palette = self.palette()
-        if self.dark_mode:
-            palette.setColor(QPalette.Window, QColor(53, 53, 53))
-            palette.setColor(QPalette.WindowText, Qt.white)
-            palette.setColor(QPalette.Base, QColor(53, 53, 53))
-            palette.setColor(QPalette.AlternateBase, QColor(53, 53, 53))
-            palette.setColor(QPalette.ToolTipBase, Qt.white)
-            palette.setColor(QPalette.ToolTipText, Qt.white)
-            palette.setColor(QPalette.Text, Qt.white)
-            palette.setColor(QPalette.Button, QColor(53, 53, 53))
-            palette.setColor(QPalette.ButtonText, Qt.white)
-            palette.setColor(QPalette.BrightText, Qt.red)
-            palette.setColor(QPalette.Link, QColor(42, 130, 218))
-            palette.setColor(QPalette.Highlight, QColor(42, 130, 218))
-            palette.setColor(QPalette.HighlightedText, Qt.black)
-        else:
-            palette.setColor(QPalette.Window, Qt.white)
-            palette.setColor(QPalette.WindowText, Qt.black)
-            palette.setColor(QPalette.Base, Qt.white)
-            palette.setColor(QPalette.AlternateBase, Qt.lightGray)
-            palette.setColor(QPalette.ToolTipBase, Qt.white)
-            palette.setColor(QPalette.ToolTipText, Qt.black)
-            palette.setColor(QPalette.Text, Qt.black)
-            palette.setColor(QPalette.Button, Qt.lightGray)
-            palette.setColor(QPalette.ButtonText, Qt.black)
-            palette.setColor(QPalette.BrightText, Qt.red)
-            palette.setColor(QPalette.Link, QColor(0, 0, 255))
-            palette.setColor(QPalette.Highlight, QColor(0, 120, 215))
-            palette.setColor(QPalette.HighlightedText, Qt.white)
-        
-        self.setPalette(palette)
-        QApplication.instance().setPalette(palette)
-        self.textEdit.setPalette(palette)
-        self.textEdit.textEdit.setPalette(palette)
-        self.textEdit.setBackgroundBrush(palette.color(QPalette.Window))
-
-        self.repaint()
-        for widget in self.findChildren(QWidget):
-            widget.update()
-
+        self.applyTheme()
         self.updateAllButtonStyles()
 
         menubar = self.menuBar()
         menubar_palette = menubar.palette()
         menubar_palette.setColor(QPalette.ButtonText, Qt.white if self.dark_mode else Qt.black)
         menubar.setPalette(menubar_palette)
-        
-        self.zoomLabel.setStyleSheet(f"font-weight: bold; color: {'white' if self.dark_mode else 'black'};font-size: 10pt;")
-        self.fontFamily.setStyleSheet(f"color: {'white' if self.dark_mode else 'black'};")
-        self.fontSize.setStyleSheet(f"color: {'white' if self.dark_mode else 'black'};")
 
     def updateIcons(self, dark):
-        icon_suffix = '_dark' if dark else ''
+        current = theme(dark)
         icons_to_update = {
             self.printAction: 'print',
             self.boldAction: 'bold',
@@ -495,7 +475,7 @@ class Editor(QMainWindow):
             self.numberedListAction: 'numbered_list'
         }
         for action, icon_name in icons_to_update.items():
-            action.setIcon(QIcon(self.get_resource_path(f'icons/{icon_name}{icon_suffix}.png')))
+            action.setIcon(current.icon(icon_name))
 
     def openReadme(self):
         readme_path = self.get_resource_path(os.path.join('resources', 'README.txt'))
@@ -527,118 +507,361 @@ class Editor(QMainWindow):
         else:
             QMessageBox.warning(self, "Error", "README file not found.")
     def openFile(self):
-        fname, _ = QFileDialog.getOpenFileName(self, 'Open file', '/', "Rich Text Files (*.rtf);;Word Documents (*.docx);;All Files (*)")
+        fname, _ = QFileDialog.getOpenFileName(self, 'Open file', '/', f"{NATIVE_FILTER};;Rich Text Files (*.rtf);;Word Documents (*.docx);;All Files (*)")
         if fname:
-            if fname.lower().endswith('.docx'):
-                self.openDocx(fname)
-            elif fname.lower().endswith('.rtf'):
-                self.openRtf(fname)
-            else:
-                with open(fname, 'r') as file:
-                    self.textEdit.setText(file.read())
+            self.openPath(fname)
+
+    def openPendingPaths(self):
+        while self.pendingPaths and not self.jobs.isBusy():
+            self.openPath(self.pendingPaths.pop(0))
+
+    def openPath(self, fname):
+        if fname.lower().endswith('.docx'):
+            self.openDocx(fname)
+        elif fname.lower().endswith('.rtf'):
+            self.openRtf(fname)
+        elif fname.lower().endswith('.oop'):
+            self.openNative(fname)
+        elif os.path.getsize(fname) >= LARGE_FILE_THRESHOLD:
+            self.openLargeFile(fname)
+        else:
+            self.jobs.start(f"Opening {os.path.basename(fname)}", read_text, fname,
+                            onFinished=lambda text: self.applyPlainText(text, fname),
+                            onFailed=lambda e: QMessageBox.warning(self, "Open Error", f"Failed to open file: {e}"))
+
+    def openPaths(self, paths):
+        """Open files named on the command line or handed over by a later launch."""
+        missing = [path for path in paths if not os.path.isfile(path)]
+        # Only one file job runs at a time, so the rest wait their turn
+        self.pendingPaths.extend(path for path in paths if path not in missing)
+        self.openPendingPaths()
+        # A launch from the file manager should bring this window up
+        self.setWindowState(self.windowState() & ~Qt.WindowMinimized)
+        self.raise_()
+        self.activateWindow()
+        if missing:
+            QMessageBox.warning(self, "Open Error", "File not found:\n" + '\n'.join(missing))
+
+    def applyPlainText(self, text, fname):
+        document = new_document()
+        document.setPlainText(text)
+        self.applyDocument(document, fname)
+
+    def openLargeFile(self, fname):
+        # Only the line index is built up front; lines are read from the mapping as they're shown
+        self.jobs.start(f"Indexing {os.path.basename(fname)}", open_large_file, fname,
+                        onFinished=lambda table: self.applyLargeFile(table, fname),
+                        onFailed=lambda e: QMessageBox.warning(self, "Open Error", f"Failed to open file: {e}"))
+
+    def applyLargeFile(self, table, fname):
+        tab = self.activeTab if self.activeTab.isPristine() else self.newTab()
+        # Takes the place of textEdit while this tab is active
+        view = tab.largeView = LargeFileView(self.centralWidget())
+        view.hide()
+        self.centralWidget().layout().addWidget(view)
+        view.modificationChanged.connect(lambda _: self.updateTabTitle(tab))
+        view.setTable(table, fname)
+        tab.fileName = fname
+        self.updateTabTitle(tab)
+        self.showActiveView()
+        self.statusBar().showMessage(f"{os.path.basename(fname)}: {table.lineCount():,} lines (large file mode)", 5000)
+
+    def isLargeFileMode(self):
+        return self.activeTab is not None and self.activeTab.largeView is not None
+
+    def showActiveView(self):
+        """Show the rich text editor or the active tab's large-file view."""
+        large = self.activeTab.largeView
+        for tab in self.tabs():
+            if tab.largeView is not None and tab.largeView is not large:
+                tab.largeView.hide()
+        enabled = large is not None
+        if large is not None:
+            large.show()
+        self.textEdit.setVisible(not enabled)
+        # Formatting, exports and search only apply to the rich text document
+        for action in (self.docxAction, self.pdfAction, self.printAction,
+                       self.boldAction, self.italicAction, self.underlineAction,
+                       self.alignLeftAction, self.alignCenterAction, self.alignRightAction,
+                       self.bulletListAction, self.numberedListAction, self.colorAction,
+                       self.findAction, self.zoomInAction, self.zoomOutAction, self.spellCheckAction):
+            action.setEnabled(not enabled)
+        self.fontFamily.setEnabled(not enabled)
+        self.fontSize.setEnabled(not enabled)
+        (large if enabled else self.textEdit.textEdit).setFocus()
+        self.scheduleUpdate()
+
+    def undo(self):
+        (self.activeTab.largeView if self.isLargeFileMode() else self.textEdit).undo()
+
+    def redo(self):
+        (self.activeTab.largeView if self.isLargeFileMode() else self.textEdit).redo()
+
+    # Tabs
+
+    def tabs(self):
+        return [self.tabBar.tabData(index) for index in range(self.tabBar.count())]
+
+    def tabIndex(self, tab):
+        for index in range(self.tabBar.count()):
+            if self.tabBar.tabData(index) is tab:
+                return index
+        return -1
+
+    def newTab(self, document=None, fname=None, source=None):
+        """Open document, or a new empty one, in a new tab and switch to it.
+
+        source is what document was loaded from, for autosave: fname, or a
+        recovered session's directory.
+        """
+        if document is None:
+            document = new_document()
+        autosave = Autosave(self)
+        autosave.failed.connect(lambda message: self.statusBar().showMessage(f"Autosave failed: {message}", 5000))
+        tab = DocumentTab(document, autosave, fname)
+        self.adoptDocument(tab, document)
+        index = self.tabBar.addTab(tab.title())
+        self.tabBar.setTabData(index, tab)
+        # Adding the first tab makes it current before its data is set
+        if self.tabBar.currentIndex() == index:
+            self.activateTab(index)
+        else:
+            self.tabBar.setCurrentIndex(index)
+        # Once the view has set the page margins, so they aren't journaled as an edit
+        tab.autosave.setDocument(document, source or fname)
+        return tab
+
+    def adoptDocument(self, tab, document):
+        # The tabs keep their documents alive; the view never owns them
+        document.setParent(self)
+        document.modificationChanged.connect(lambda _: self.updateTabTitle(tab))
+
+    def applyDocument(self, document, fname=None, source=None):
+        """Show a document loaded in the background, in the current tab if that's still empty."""
+        if fname is not None:
+            document.setModified(False)
+        tab = self.activeTab
+        if not tab.isPristine():
+            self.newTab(document, fname, source)
+            return
+        previous = tab.document
+        tab.document = document
+        tab.fileName = fname
+        tab.cursor = QTextCursor(document)
+        self.adoptDocument(tab, document)
+        self.textEdit.setDocument(document)
+        self.textEdit.textEdit.setTextCursor(tab.cursor)
+        tab.autosave.setDocument(document, source or fname)
+        previous.deleteLater()
+        self.updateTabTitle(tab)
+
+    def activateTab(self, index):
+        tab = self.tabBar.tabData(index)
+        if tab is None or tab is self.activeTab:
+            return
+        previous = self.activeTab
+        if previous is not None and previous.largeView is None:
+            previous.cursor = self.textEdit.textEdit.textCursor()
+            previous.scroll = (self.textEdit.horizontalScrollBar().value(), self.textEdit.verticalScrollBar().value())
+            self.clearSearchHighlights()
+        self.activeTab = tab
+        if tab.largeView is None:
+            restore_layout(tab.document)
+            self.textEdit.setDocument(tab.document)
+            self.textEdit.textEdit.setTextCursor(tab.cursor)
+            self.textEdit.horizontalScrollBar().setValue(tab.scroll[0])
+            self.textEdit.verticalScrollBar().setValue(tab.scroll[1])
+        self.showActiveView()
+        if previous is not None and previous.largeView is None:
+            # After the switch has painted, so it doesn't hold the switch up
+            QTimer.singleShot(0, lambda: self.releaseTab(previous))
+
+    def releaseTab(self, tab):
+        if tab is not self.activeTab and not sip.isdeleted(tab.document):
+            release_layout(tab.document)
+
+    def cycleTabs(self, step):
+        self.tabBar.setCurrentIndex((self.tabBar.currentIndex() + step) % self.tabBar.count())
+
+    def closeTab(self, index):
+        tab = self.tabBar.tabData(index)
+        if tab.isModified():
+            reply = QMessageBox.question(self, "Close Tab", f"{tab.title().rstrip('*')} has unsaved changes. Close it anyway?",
+                                         QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
+            if reply != QMessageBox.Yes:
+                return
+        if self.tabBar.count() == 1:
+            self.newTab()  # There's always a document to type into
+        self.tabBar.removeTab(self.tabIndex(tab))
+        tab.autosave.close()
+        tab.autosave.deleteLater()
+        if tab.largeView is not None:
+            tab.largeView.closeTable()
+            tab.largeView.deleteLater()
+        tab.document.deleteLater()
+
+    def updateTabTitle(self, tab):
+        index = self.tabIndex(tab)
+        if index >= 0:
+            self.tabBar.setTabText(index, tab.title())
+            self.tabBar.setTabToolTip(index, tab.fileName or '')
+
+    def showMemoryUsage(self):
+        lines = []
+        for tab in self.tabs():
+            document, history = tab.memoryUsage(tab is self.activeTab)
+            state = 'active' if tab is self.activeTab else 'background'
+            lines.append(f"{tab.title()} ({state}): document {format_bytes(document)}, undo history {format_bytes(history)}")
+        QMessageBox.information(self, "Memory Usage", "Estimated memory per tab:\n\n" + '\n'.join(lines))
+
+    def togglePerformanceOverlay(self, enabled):
+        if enabled:
+            self.performanceOverlay.start()
+        else:
+            self.performanceOverlay.stop()
 
-    def openDocx(self, fname):
-        try:
-            doc = Document(fname)
-            self.textEdit.textEdit.clear()
-            cursor = self.textEdit.textEdit.textCursor()
-            
-            for para in doc.paragraphs:
-                if para.style.name.startswith('List'):
-                    list_format = QTextListFormat()
-                    if 'Bullet' in para.style.name:
-                        list_format.setStyle(QTextListFormat.ListDisc)
-                    elif 'Number' in para.style.name:
-                        list_format.setStyle(QTextListFormat.ListDecimal)
-                    cursor.insertList(list_format)
-                else:
-                    if cursor.position() != 0:
-                        cursor.insertBlock()
-
-                for run in para.runs:
-                    char_format = QTextCharFormat()
-                    
-                    # Font family
-                    if run.font.name:
-                        char_format.setFontFamily(run.font.name)
-                    
-                    # Font size
-                    if run.font.size:
-                        char_format.setFontPointSize(run.font.size.pt)
-                    
-                    # Bold
-                    char_format.setFontWeight(QFont.Bold if run.bold else QFont.Normal)
-                    
-                    # Italic
-                    italic_value = False if run.italic is None else run.italic
-                    char_format.setFontItalic(italic_value)
-                    
-                    # Underline
-                    underline_value = False if run.underline is None else run.underline
-                    char_format.setFontUnderline(underline_value)
-                    
-                    # Color
-                    if run.font.color and run.font.color.rgb:
-                        r, g, b = run.font.color.rgb
-                        color = QColor(r, g, b)
-                        char_format.setForeground(color)
-                    
-                    cursor.setCharFormat(char_format)
-                    cursor.insertText(run.text)
-
-            self.textEdit.textEdit.setTextCursor(cursor)
-            self.textEdit.textEdit.document().setModified(False)
-            
-        except Exception as e:
-            QMessageBox.warning(self, "Open Error", f"Failed to open DOCX file: {str(e)}")
-            print(f"Error details: {str(e)}")  # For debugging
+    def spellCheckUnavailable(self):
+        self.spellCheckAction.setChecked(False)
+        self.statusBar().showMessage("Spell checking is off: no dictionary was found", 5000)
+
+    def exportTrace(self):
+        recorder = self.performanceOverlay.recorder
+        if recorder is None:
+            self.statusBar().showMessage("Nothing recorded yet: turn on View > Performance Overlay first", 3000)
+            return
+        fname, _ = QFileDialog.getSaveFileName(self, 'Export Trace', 'trace.json', "Chrome Trace (*.json)")
+        if fname:
+            try:
+                instrumentation.export_trace(recorder, fname)
+            except OSError as e:
+                QMessageBox.warning(self, "Export Error", f"Failed to export the trace: {e}")
+                return
+            self.statusBar().showMessage(f"Trace saved to {fname}", 3000)
 
+    def openDocx(self, fname):
+        from docx_importer import import_docx  # Only loaded once it's needed
+        # Timed from here until the document is shown or the import fails,
+        # since the import itself runs on the job's thread
+        span = instrumentation.Span('Editor.openDocx', 'io')
+        span.begin()
+
+        def finished(document):
+            self.applyDocument(document, fname)
+            span.extend()
+            span.finish()
+
+        def failed(error):
+            span.extend()
+            span.finish()
+            self.openDocxFailed(error)
+
+        # Build the document detached from the view and swap it in at once,
+        # so the import doesn't relayout or signal on every run
+        self.jobs.start(f"Opening {os.path.basename(fname)}", import_docx, fname,
+                        onFinished=finished, onFailed=failed)
+
+    def openDocxFailed(self, error):
+        QMessageBox.warning(self, "Open Error", f"Failed to open DOCX file: {error}")
+        print(f"Error details: {error}")  # For debugging
 
     def openRtf(self, fname):
-        try:
-            with open(fname, 'r', encoding='utf-8', errors='ignore') as file:
-                rtf_text = file.read()
-            document = QTextDocument()
-            document.setHtml(rtf_text)
-            self.textEdit.setDocument(document)
-        except Exception as e:
-            QMessageBox.warning(self, "Error", f"Failed to open RTF file: {str(e)}")
+        self.jobs.start(f"Opening {os.path.basename(fname)}", load_rtf, fname,
+                        onFinished=lambda document: self.applyDocument(document, fname),
+                        onFailed=lambda e: QMessageBox.warning(self, "Error", f"Failed to open RTF file: {e}"))
+
+    def openNative(self, fname):
+        self.jobs.start(f"Opening {os.path.basename(fname)}", load_native, fname,
+                        onFinished=lambda document: self.applyDocument(document, fname),
+                        onFailed=lambda e: QMessageBox.warning(self, "Error", f"Failed to open OpenOPen document: {e}"))
 
     def saveFile(self):
-        fname, _ = QFileDialog.getSaveFileName(self, 'Save file', '/', "Rich Text Files (*.rtf)")
+        if self.isLargeFileMode():
+            self.saveLargeFile()
+            return
+        fname, selected = QFileDialog.getSaveFileName(self, 'Save file', '/', f"{NATIVE_FILTER};;Rich Text Files (*.rtf)")
         if fname:
-            if not fname.lower().endswith('.rtf'):
-                fname += '.rtf'
-            try:
-                with open(fname, 'w', encoding='utf-8') as file:
-                    file.write(self.textEdit.toHtml())
-                QMessageBox.information(self, "Save Successful", "File saved successfully.")
-            except Exception as e:
-                QMessageBox.warning(self, "Save Error", f"Failed to save the file: {str(e)}")
+            if not fname.lower().endswith(('.oop', '.rtf')):
+                fname += '.oop' if selected == NATIVE_FILTER else '.rtf'
+            # Workers get a snapshot, so editing can carry on while the file is written
+            tab = self.activeTab
+            revision = tab.document.revision()
+            model = self.textEdit.textEdit.model
+            if not fname.lower().endswith('.oop'):
+                save, content = export_to_rtf, self.textEdit.snapshot()
+            elif self.textEdit.textEdit.hasModelHistory() and not model.stale:
+                # The model already holds the document as runs, so the snapshot is a copy of those
+                save, content = write_native, read_model(model)
+            else:
+                save, content = save_native, self.textEdit.snapshot()
+            self.jobs.start("Saving", save, content, fname,
+                            onFinished=lambda _: self.fileSaved(tab, fname, revision),
+                            onFailed=lambda e: QMessageBox.warning(self, "Save Error", f"Failed to save the file: {e}"))
+
+    def fileSaved(self, tab, fname, revision):
+        if not sip.isdeleted(tab.document):
+            tab.fileName = fname
+            # Edits made while the file was being written aren't in it
+            if tab.document.revision() == revision:
+                tab.document.setModified(False)
+            self.updateTabTitle(tab)
+        QMessageBox.information(self, "Save Successful", "File saved successfully.")
+
+    def saveLargeFile(self):
+        view = self.activeTab.largeView
+        fname, _ = QFileDialog.getSaveFileName(self, 'Save file', view.fileName, "All Files (*)")
+        # The view can't be edited while the pieces are being written out
+        if fname and self.jobs.start("Saving", save_large_file, view.table, fname,
+                                     onFinished=lambda tmp: self.finishLargeSave(view, tmp, fname),
+                                     onFailed=lambda e: self.largeSaveFailed(view, e)):
+            view.setEnabled(False)
+
+    def finishLargeSave(self, view, tmp, fname):
+        original = view.fileName
+        # The old mapping has to go before the file under it can be replaced
+        view.closeTable()
+        view.setEnabled(True)
+        try:
+            os.replace(tmp, fname)
+        except OSError as e:
+            QMessageBox.warning(self, "Save Error", f"Failed to save the file: {e}\n\nThe edited text was kept in {tmp}")
+            fname = original
+        self.reopenLargeFile(view, fname)
+
+    def reopenLargeFile(self, view, fname):
+        self.jobs.start(f"Indexing {os.path.basename(fname)}", open_large_file, fname,
+                        onFinished=lambda table: view.setTable(table, fname),
+                        onFailed=lambda e: QMessageBox.warning(self, "Open Error", f"Failed to open file: {e}"))
+
+    def largeSaveFailed(self, view, error):
+        view.setEnabled(True)
+        QMessageBox.warning(self, "Save Error", f"Failed to save the file: {error}")
 
     def exportDOCX(self):
         fname, _ = QFileDialog.getSaveFileName(self, 'Export DOCX', '/', filter="Word Documents (*.docx)")
         if fname:
-            try:
-                # Call the export_to_docx function from docx_exporter.py
-                export_to_docx(self.textEdit.textEdit, fname)
-                QMessageBox.information(self, "Export Successful", "File exported successfully.")
-            except Exception as e:
-                QMessageBox.warning(self, "Export Error", f"Failed to export DOCX: {str(e)}")
+            from docx_exporter import export_to_docx
+            self.jobs.start("Exporting DOCX", export_to_docx, self.textEdit.snapshot(), fname,
+                            onFinished=lambda _: QMessageBox.information(self, "Export Successful", "File exported successfully."),
+                            onFailed=lambda e: QMessageBox.warning(self, "Export Error", f"Failed to export DOCX: {e}"))
 
     def exportPDF(self):
-        fname, _ = QFileDialog.getSaveFileName(self, 'Export PDF', '/', filter="PDF Files (*.pdf)")
+        fname, selected = QFileDialog.getSaveFileName(self, 'Export PDF', '/',
+                                                      filter=f"PDF Files (*.pdf);;{COMPACT_PDF_FILTER}")
         if fname:
-            try:
-                printer = QPrinter(QPrinter.HighResolution)
-                printer.setOutputFormat(QPrinter.PdfFormat)
-                printer.setOutputFileName(fname)
-                self.textEdit.textEdit.document().print_(printer)
-                QMessageBox.information(self, "Export Successful", "File exported successfully.")
-            except Exception as e:
-                QMessageBox.warning(self, "Export Error", f"Failed to export PDF: {str(e)}")
+            exporter = export_pdf
+            if selected == COMPACT_PDF_FILTER:
+                try:
+                    from pdf_exporter import export_to_pdf
+                except ImportError:
+                    QMessageBox.warning(self, "Export Error", "Compact PDF export needs the reportlab package.")
+                    return
+                exporter = export_to_pdf
+            self.jobs.start("Exporting PDF", exporter, self.textEdit.snapshot(), fname,
+                            onFinished=lambda _: QMessageBox.information(self, "Export Successful", "File exported successfully."),
+                            onFailed=lambda e: QMessageBox.warning(self, "Export Error", f"Failed to export PDF: {e}"))
 
     def printDocument(self):
+        from PyQt5.QtPrintSupport import QPrinter, QPrintDialog
         printer = QPrinter(QPrinter.HighResolution)
         dialog = QPrintDialog(printer, self)
         if dialog.exec_() == QPrintDialog.Accepted:
@@ -712,22 +935,143 @@ class Editor(QMainWindow):
             cursor.createList(list_format)
         self.textEdit.textEdit.setTextCursor(cursor)
 
+    def closeEvent(self, event):
+        self.jobs.shutdown()
+        for tab in self.tabs():
+            tab.autosave.close()
+        super().closeEvent(event)
+
+    def offerRecovery(self):
+        sessions = orphaned_sessions()
+        if not sessions:
+            return
+        reply = QMessageBox.question(self, "Recover Unsaved Work",
+                                     "OpenOPen didn't shut down properly last time. Recover the unsaved documents?",
+                                     QMessageBox.Yes | QMessageBox.No, QMessageBox.Yes)
+        if reply == QMessageBox.Yes:
+            # One session per tab; directory names end with a timestamp, so open them in order
+            for session in sorted(sessions, key=lambda path: int(os.path.basename(path).split('-')[-1])):
+                try:
+                    # The tab's autosave takes the session's files over as its starting point
+                    self.applyDocument(recover(session), source=session)
+                except Exception as e:
+                    QMessageBox.warning(self, "Recovery Error", f"Failed to recover the document: {e}")
+                    return
+        for session in sessions:
+            discard_session(session)
+
     def openFindDialog(self):
-        self.findDialog = FindDialog(self)
-        self.findDialog.findBtn.clicked.connect(self.findNext)
+        if self.findDialog is None:
+            self.findDialog = FindDialog(self)
+            self.findDialog.findBtn.clicked.connect(self.findNext)
+            self.findDialog.findPrevBtn.clicked.connect(self.findPrevious)
+            self.findDialog.replaceBtn.clicked.connect(self.replaceNext)
+            self.findDialog.replaceAllBtn.clicked.connect(self.replaceAll)
+            self.findDialog.input.textChanged.connect(self.updateSearch)
+            self.findDialog.input.returnPressed.connect(self.findNext)
+            for option in (self.findDialog.matchCase, self.findDialog.wholeWord, self.findDialog.regex):
+                option.toggled.connect(self.updateSearch)
+            self.findDialog.finished.connect(self.clearSearchHighlights)
+        selected = self.textEdit.textEdit.textCursor().selectedText()
+        if selected and '\u2029' not in selected:
+            self.findDialog.input.setText(selected)
         self.findDialog.show()
+        self.findDialog.raise_()
+        self.findDialog.activateWindow()
+        self.updateSearch()
 
-    def findNext(self):
-        searchText = self.findDialog.input.text()
-        if not searchText:
+    def updateSearch(self):
+        dialog = self.findDialog
+        try:
+            self.search.setQuery(dialog.input.text(), regex=dialog.regex.isChecked(),
+                                 wholeWord=dialog.wholeWord.isChecked(),
+                                 caseSensitive=dialog.matchCase.isChecked())
+        except re.error as e:
+            self.search.setQuery('')
+            dialog.countLabel.setText(f"Invalid pattern: {e}")
+
+    def scheduleSearchRefresh(self):
+        # Coalesce keystrokes and query edits into one highlight pass
+        if self.findDialog is not None and self.findDialog.isVisible():
+            self.search_timer.start(150)
+
+    def refreshSearchResults(self):
+        if self.findDialog is None or not self.findDialog.isVisible() or self.search.pattern is None:
+            self.clearSearchHighlights()
             return
+        selections = []
+        for start, end in self.search.matches(limit=MAX_SEARCH_HIGHLIGHTS):
+            selection = QTextEdit.ExtraSelection()
+            selection.cursor = QTextCursor(self.textEdit.document())
+            selection.cursor.setPosition(start)
+            selection.cursor.setPosition(end, QTextCursor.KeepAnchor)
+            selection.format.setBackground(QColor(255, 210, 0, 140))
+            selections.append(selection)
+        self.textEdit.setExtraSelections(selections)
+        self.updateSearchCount()
+
+    def clearSearchHighlights(self):
+        self.search_timer.stop()
+        if self.textEdit.layoutSelections:
+            self.textEdit.setExtraSelections([])
+
+    def currentMatch(self):
+        """The search result if the current selection is exactly one, else None."""
         cursor = self.textEdit.textEdit.textCursor()
-        document = self.textEdit.textEdit.document()
-        cursor = document.find(searchText, cursor)
-        if cursor.isNull():
-            cursor = document.find(searchText, QTextCursor(document.begin()))
-        if not cursor.isNull():
-            self.textEdit.textEdit.setTextCursor(cursor)
+        if not cursor.hasSelection():
+            return None
+        result = self.search.find(cursor.selectionStart())
+        if result and result[1] == cursor.selectionStart() and result[2] == cursor.selectionEnd():
+            return result
+        return None
+
+    def updateSearchCount(self):
+        total = self.search.count()
+        if not total:
+            self.findDialog.countLabel.setText("No matches")
+            return
+        current = self.currentMatch()
+        if current:
+            self.findDialog.countLabel.setText(f"{current[0] + 1} of {total}")
         else:
+            self.findDialog.countLabel.setText(f"{total} matches")
+
+    def selectMatch(self, result):
+        searchText = self.findDialog.input.text()
+        if result is None:
             self.statusBar().showMessage(f"Cannot find '{searchText}'", 2000)
+            return
+        _, start, end = result
+        cursor = self.textEdit.textEdit.textCursor()
+        cursor.setPosition(start)
+        cursor.setPosition(end, QTextCursor.KeepAnchor)
+        self.textEdit.textEdit.setTextCursor(cursor)
+        self.updateSearchCount()
 
+    def findNext(self):
+        if not self.findDialog.input.text() or self.search.pattern is None:
+            return
+        self.selectMatch(self.search.find(self.textEdit.textEdit.textCursor().position()))
+
+    def findPrevious(self):
+        if not self.findDialog.input.text() or self.search.pattern is None:
+            return
+        cursor = self.textEdit.textEdit.textCursor()
+        self.selectMatch(self.search.find(cursor.selectionStart(), backward=True))
+
+    def replaceNext(self):
+        current = self.currentMatch()
+        if current:
+            _, start, end = current
+            text = self.search.replacement(start, end, self.findDialog.replaceInput.text(),
+                                           self.findDialog.regex.isChecked())
+            self.textEdit.textEdit.textCursor().insertText(text)
+        self.findNext()
+
+    def replaceAll(self):
+        if self.search.pattern is None:
+            return
+        # Every highlight is a cursor the document must update on each edit
+        self.clearSearchHighlights()
+        count = self.search.replaceAll(self.findDialog.replaceInput.text(), self.findDialog.regex.isChecked())
+        self.statusBar().showMessage(f"Replaced {count} occurrence{'s' if count != 1 else ''}", 2000)
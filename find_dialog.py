@@ -1,4 +1,4 @@
-from PyQt5.QtWidgets import QDialog, QVBoxLayout, QLineEdit, QPushButton
+from PyQt5.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLineEdit, QPushButton, QCheckBox, QLabel
 
 class FindDialog(QDialog):
     def __init__(self, parent=None):
@@ -7,7 +7,35 @@ class FindDialog(QDialog):
         self.setGeometry(100, 100, 300, 100)
         layout = QVBoxLayout()
         self.input = QLineEdit(self)
+        self.input.setPlaceholderText('Find')
         layout.addWidget(self.input)
+        self.replaceInput = QLineEdit(self)
+        self.replaceInput.setPlaceholderText('Replace with')
+        layout.addWidget(self.replaceInput)
+
+        options = QHBoxLayout()
+        self.matchCase = QCheckBox('Match case', self)
+        options.addWidget(self.matchCase)
+        self.wholeWord = QCheckBox('Whole word', self)
+        options.addWidget(self.wholeWord)
+        self.regex = QCheckBox('Regex', self)
+        options.addWidget(self.regex)
+        layout.addLayout(options)
+
+        self.countLabel = QLabel(self)
+        layout.addWidget(self.countLabel)
+
+        buttons = QHBoxLayout()
+        self.findPrevBtn = QPushButton('Find Previous', self)
+        buttons.addWidget(self.findPrevBtn)
         self.findBtn = QPushButton('Find Next', self)
-        layout.addWidget(self.findBtn)
-        self.setLayout(layout)
\ No newline at end of file
+        buttons.addWidget(self.findBtn)
+        layout.addLayout(buttons)
+
+        replaceButtons = QHBoxLayout()
+        self.replaceBtn = QPushButton('Replace', self)
+        replaceButtons.addWidget(self.replaceBtn)
+        self.replaceAllBtn = QPushButton('Replace All', self)
+        replaceButtons.addWidget(self.replaceAllBtn)
+        layout.addLayout(replaceButtons)
+        self.setLayout(layout)
@@ -0,0 +1,41 @@
+"""Process-wide interning of fonts and text formats.
+
+QFont and QTextFormat are implicitly shared: copies share one private
+block until they're changed. Building every format through these tables
+means identical formats in different documents, and in the documents of
+different tabs, are copies of the same object rather than equal objects
+built separately. The tables are only ever added to, and a lost race
+between two importer threads just builds one format twice.
+"""
+from PyQt5.QtGui import QFont, QTextBlockFormat, QTextCharFormat
+
+_fonts = {}
+_char_formats = {}
+_block_formats = {}
+
+
+def font(family, size):
+    found = _fonts.get((family, size))
+    if found is None:
+        found = _fonts[(family, size)] = QFont(family, size)
+    return found
+
+
+def char_format(key, build):
+    """The shared QTextCharFormat for key, made by build(char_format) the first time."""
+    found = _char_formats.get(key)
+    if found is None:
+        found = QTextCharFormat()
+        build(found)
+        _char_formats[key] = found
+    return found
+
+
+def block_format(key, build):
+    """The shared QTextBlockFormat for key, made by build(block_format) the first time."""
+    found = _block_formats.get(key)
+    if found is None:
+        found = QTextBlockFormat()
+        build(found)
+        _block_formats[key] = found
+    return found
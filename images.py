@@ -0,0 +1,224 @@
+"""Pictures in documents: stored as the file's own bytes, decoded only to be drawn.
+
+Importers add each picture to its QTextDocument as an image resource holding
+the original encoded bytes, named after their hash, and size the picture in
+its QTextImageFormat, so opening a document decodes nothing. Exporters read
+the same bytes back and write them out as they are.
+
+On screen, ImageHandler takes over drawing pictures from Qt, which would
+decode each one at full size and keep it in the document. It decodes a
+thumbnail at the size the picture is drawn at instead, with QImageReader
+scaling while it decodes, and keeps thumbnails in a least recently used
+cache shared by all views, keyed by picture and zoom level and bounded in
+bytes.
+"""
+import hashlib
+import math
+from collections import OrderedDict
+from PyQt5.QtCore import Qt, QBuffer, QByteArray, QIODevice, QObject, QSize, QSizeF, QUrl
+from PyQt5.QtGui import (
+    QColor, QImage, QImageReader, QPainter, QPixmap, QTextDocument, QTextFormat, QTextImageFormat,
+    QTextObjectInterface
+)
+
+THUMBNAIL_BUDGET = 64 << 20  # bytes of decoded thumbnails kept across all views
+DEFAULT_DPI = 96  # what a picture's size in its format is measured at
+PLACEHOLDER = QColor('#ddd')
+
+# Content-sniffed QImageReader formats -> file extension
+EXTENSIONS = {'jpeg': 'jpeg', 'jpg': 'jpeg', 'png': 'png', 'gif': 'gif', 'bmp': 'bmp', 'tiff': 'tiff', 'tif': 'tiff'}
+
+
+class ThumbnailCache:
+    """Decoded thumbnails by (picture name, encoded size, zoom level), least recently used first out."""
+
+    def __init__(self, budget=THUMBNAIL_BUDGET):
+        self.budget = budget
+        self.used = 0
+        self.images = OrderedDict()
+
+    def get(self, key):
+        image = self.images.get(key)
+        if image is not None:
+            self.images.move_to_end(key)
+        return image
+
+    def put(self, key, image):
+        self.images[key] = image
+        self.used += image.sizeInBytes()
+        while self.used > self.budget and len(self.images) > 1:
+            _, dropped = self.images.popitem(last=False)
+            self.used -= dropped.sizeInBytes()
+
+    def clear(self):
+        self.images.clear()
+        self.used = 0
+
+
+thumbnails = ThumbnailCache()
+_natural_sizes = {}  # (picture name, resource size or cache key) -> QSize read from the encoded header
+
+
+def reader(data):
+    buffer = QBuffer()
+    buffer.setData(data)
+    buffer.open(QIODevice.ReadOnly)
+    image_reader = QImageReader(buffer)
+    image_reader.buffer = buffer  # QImageReader doesn't own its device
+    return image_reader
+
+
+def image_resource(document, name):
+    """The image resource of a picture: a QByteArray of the encoded file, or a decoded QImage or QPixmap."""
+    return document.resource(QTextDocument.ImageResource, QUrl(name))
+
+
+def natural_size(document, name):
+    """Size of a picture in pixels, read from its header without decoding it."""
+    data = image_resource(document, name)
+    if isinstance(data, QByteArray):
+        key = (name, data.size())
+    elif isinstance(data, (QImage, QPixmap)):
+        key = (name, data.cacheKey())
+    else:
+        return QSize()  # Not loaded yet, so it isn't remembered
+    size = _natural_sizes.get(key)
+    if size is None:
+        size = reader(data).size() if isinstance(data, QByteArray) else data.size()
+        if size.isValid():
+            _natural_sizes[key] = size
+    return size
+
+
+def add_image(document, data, extension='png'):
+    """Add the encoded bytes of a picture to document; returns the name to use in its format."""
+    name = f"image-{hashlib.sha1(data).hexdigest()[:20]}.{extension.lower()}"
+    document.addResource(QTextDocument.ImageResource, QUrl(name), QByteArray(data))
+    return name
+
+
+def image_format(name, width=None, height=None):
+    image_format = QTextImageFormat()
+    image_format.setName(name)
+    if width:
+        image_format.setWidth(width)
+    if height:
+        image_format.setHeight(height)
+    return image_format
+
+
+def image_type(document, name):
+    """The extension image_bytes() will give a picture, read from its header."""
+    data = image_resource(document, name)
+    if isinstance(data, QByteArray):
+        return EXTENSIONS.get(bytes(reader(data).format()).decode('ascii', 'ignore').lower(), 'png')
+    return 'png'
+
+
+def image_bytes(document, name):
+    """(encoded bytes, extension) of a picture, or None if the document hasn't got it.
+
+    Pictures that came in encoded are returned untouched; only ones that
+    are held decoded, such as pasted images, are encoded, as PNG.
+    """
+    data = image_resource(document, name)
+    if isinstance(data, QByteArray):
+        extension = EXTENSIONS.get(bytes(reader(data).format()).decode('ascii', 'ignore').lower())
+        if extension is not None:
+            return bytes(data), extension
+        data = QImage.fromData(data)
+    if isinstance(data, QPixmap):
+        data = data.toImage()
+    if not isinstance(data, QImage) or data.isNull():
+        return None
+    encoded = QByteArray()
+    buffer = QBuffer(encoded)
+    buffer.open(QIODevice.WriteOnly)
+    data.save(buffer, 'PNG')
+    return bytes(encoded), 'png'
+
+
+def display_size(document, image_format):
+    """Size of a picture at 100%, from its format where it's set and its header where it isn't."""
+    width = image_format.width() if image_format.hasProperty(QTextFormat.ImageWidth) else 0
+    height = image_format.height() if image_format.hasProperty(QTextFormat.ImageHeight) else 0
+    if width > 0 and height > 0:
+        return QSizeF(width, height)
+    natural = natural_size(document, image_format.name())
+    if natural.isEmpty():
+        return QSizeF(width or 16, height or 16)
+    if width > 0:
+        return QSizeF(width, width * natural.height() / natural.width())
+    if height > 0:
+        return QSizeF(height * natural.width() / natural.height(), height)
+    return QSizeF(natural)
+
+
+def thumbnail(document, name, zoom, size):
+    """The picture decoded at size, which is what it takes up at zoom percent, or at its own size if that's smaller."""
+    data = image_resource(document, name)
+    if data is None:
+        return None
+    natural = natural_size(document, name)
+    if not natural.isValid() or size.width() >= natural.width():
+        zoom = 0  # Full size, which every larger zoom level shares
+    key = (name, data.size() if isinstance(data, QByteArray) else data.cacheKey(), zoom)
+    image = thumbnails.get(key)
+    if image is None:
+        if isinstance(data, QByteArray):
+            image_reader = reader(data)
+            if zoom:
+                image_reader.setScaledSize(natural.scaled(size, Qt.KeepAspectRatio))
+            image = image_reader.read()
+        else:
+            image = data.toImage() if isinstance(data, QPixmap) else data
+            if zoom:
+                image = image.scaled(size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        if image.isNull():
+            return None
+        thumbnails.put(key, image)
+    return image
+
+
+class ImageHandler(QObject, QTextObjectInterface):
+    """Lays pictures out from their formats and draws them from cached thumbnails.
+
+    Registered on a view's document layout in place of Qt's own image
+    handler. A picture's zoom level is how large it's drawn against its
+    size at 100%: ZoomableTextEdit's zoom factor for the editing page,
+    and the scale of the pixmap for cached pages.
+    """
+
+    def intrinsicSize(self, document, position, text_format):
+        size = display_size(document, text_format.toImageFormat())
+        device = document.documentLayout().paintDevice()
+        if device is not None:
+            # Zooming lays the document out for a device with a scaled DPI
+            size *= device.logicalDpiY() / DEFAULT_DPI
+        return size
+
+    def drawObject(self, painter, rect, document, position, text_format):
+        image_format = text_format.toImageFormat()
+        base = display_size(document, image_format)
+        drawn = painter.combinedTransform().mapRect(rect)
+        device = painter.device()
+        ratio = device.devicePixelRatioF() if device is not None else 1.0
+        zoom = max(1, round(100 * drawn.width() * ratio / max(base.width(), 1)))
+        size = QSize(math.ceil(base.width() * zoom / 100), math.ceil(base.height() * zoom / 100))
+        image = thumbnail(document, image_format.name(), zoom, size)
+        if image is None:
+            painter.fillRect(rect, PLACEHOLDER)
+            return
+        painter.save()
+        painter.setRenderHint(QPainter.SmoothPixmapTransform)
+        painter.drawImage(rect, image)
+        painter.restore()
+
+
+def install_handler(layout):
+    """Have layout draw pictures with an ImageHandler; the handler lives as long as the layout."""
+    handler = layout.findChild(ImageHandler)
+    if handler is None:
+        handler = ImageHandler(layout)
+        layout.registerHandler(QTextFormat.ImageObject, handler)
+    return handler
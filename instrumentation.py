@@ -0,0 +1,126 @@
+"""Timing hooks for the hot paths and Chrome trace export.
+
+Functions decorated with @timed record how long each call took, but only
+while recording is on; when it's off the hook is one global lookup and a
+None check. Recorded spans export as Chrome trace-event JSON, which loads
+in chrome://tracing, Perfetto or speedscope. The module has no Qt imports,
+so the exporters can use it in convert's worker processes.
+"""
+import functools
+import json
+import threading
+import time
+from collections import deque
+
+MAX_EVENTS = 500000  # the oldest spans are dropped past this
+RECENT_FRAMES = 60  # frame times averaged for the overlay
+
+_recorder = None  # Set while recording; the hooks check nothing else
+
+
+class Recorder:
+    """Collects complete ('X') and counter ('C') trace events from any thread."""
+
+    def __init__(self):
+        self.start = time.perf_counter_ns()
+        self.events = deque(maxlen=MAX_EVENTS)
+        self.threads = {}  # thread ident -> name
+        self.frames = deque(maxlen=RECENT_FRAMES)  # ms
+        self.latest = {}  # category -> ms of the last span
+        self.latency = 0.0  # ms, worst event loop delay since the overlay last looked
+
+    def complete(self, name, category, start, end):
+        ident = threading.get_ident()
+        if ident not in self.threads:
+            self.threads[ident] = threading.current_thread().name
+        duration = (end - start) / 1e6
+        self.events.append(('X', name, category, start, end - start, ident))
+        self.latest[category] = duration
+        if category == 'frame':
+            self.frames.append(duration)
+
+    def counter(self, name, value):
+        self.events.append(('C', name, 'counter', time.perf_counter_ns(), value, threading.get_ident()))
+
+    def traceEvents(self):
+        events = [{'ph': 'M', 'name': 'thread_name', 'pid': 1, 'tid': ident, 'args': {'name': name}}
+                  for ident, name in self.threads.items()]
+        for phase, name, category, start, value, ident in list(self.events):
+            event = {'ph': phase, 'name': name, 'cat': category, 'pid': 1, 'tid': ident,
+                     'ts': (start - self.start) / 1000}
+            if phase == 'X':
+                event['dur'] = value / 1000
+            else:
+                event['args'] = {name: value}
+            events.append(event)
+        return events
+
+
+def timed(name, category='app'):
+    """Decorator recording a span for every call while recording is on."""
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            recorder = _recorder
+            if recorder is None:
+                return fn(*args, **kwargs)
+            start = time.perf_counter_ns()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                recorder.complete(name, category, start, time.perf_counter_ns())
+        return wrapper
+    return decorate
+
+
+class Span:
+    """A span that ends after the call that began it, such as a layout that goes on in steps.
+
+    begin() opens it while recording is on, extend() moves its end up to
+    now, and finish() records it from the first begin() to the last
+    extend(). The owner decides when it's over.
+    """
+
+    def __init__(self, name, category='app'):
+        self.name = name
+        self.category = category
+        self.start = self.end = None
+
+    def begin(self):
+        """Open the span if recording and it isn't open already."""
+        if _recorder is not None and self.start is None:
+            self.start = time.perf_counter_ns()
+        self.extend()
+
+    def extend(self):
+        if self.start is not None:
+            self.end = time.perf_counter_ns()
+
+    def finish(self):
+        recorder = _recorder
+        if recorder is not None and self.start is not None:
+            recorder.complete(self.name, self.category, self.start, self.end)
+        self.start = self.end = None
+
+
+def recording():
+    return _recorder is not None
+
+
+def enable():
+    """Start a new recording."""
+    global _recorder
+    _recorder = Recorder()
+    return _recorder
+
+
+def disable():
+    """Stop recording; returns the finished recording."""
+    global _recorder
+    recorder, _recorder = _recorder, None
+    return recorder
+
+
+def export_trace(recorder, filename):
+    with open(filename, 'w', encoding='utf-8') as file:
+        json.dump({'traceEvents': recorder.traceEvents(), 'displayTimeUnit': 'ms'}, file)
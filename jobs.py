@@ -0,0 +1,131 @@
+from PyQt5.QtWidgets import QWidget, QHBoxLayout, QLabel, QProgressBar, QToolButton
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+
+class JobCancelled(Exception):
+    """Raised inside a worker when its job has been cancelled."""
+
+
+class JobSignals(QObject):
+    progress = pyqtSignal(int)
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+    cancelled = pyqtSignal()
+
+
+class Job(QRunnable):
+    """Runs fn(*args, progress=...) on a pool thread.
+
+    fn reports its percentage through the progress callback it is given; the
+    callback raises JobCancelled once cancel() has been called, which is how
+    long-running work stops early. Signals are delivered on the GUI thread.
+    """
+
+    def __init__(self, fn, *args):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.signals = JobSignals()
+        self.is_cancelled = False
+
+    def cancel(self):
+        self.is_cancelled = True
+
+    def report(self, percent):
+        if self.is_cancelled:
+            raise JobCancelled()
+        self.signals.progress.emit(int(percent))
+
+    def run(self):
+        try:
+            result = self.fn(*self.args, progress=self.report)
+            if self.is_cancelled:
+                raise JobCancelled()
+        except JobCancelled:
+            self.signals.cancelled.emit()
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
+
+
+class JobProgressWidget(QWidget):
+    """Status bar widget showing the running job with a cancel button."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.label = QLabel(self)
+        layout.addWidget(self.label)
+        self.progressBar = QProgressBar(self)
+        self.progressBar.setFixedWidth(200)
+        layout.addWidget(self.progressBar)
+        self.cancelBtn = QToolButton(self)
+        self.cancelBtn.setText('Cancel')
+        layout.addWidget(self.cancelBtn)
+        self.hide()
+
+    def start(self, label):
+        self.label.setText(label)
+        self.progressBar.setRange(0, 0)  # Busy until the job reports progress
+        self.cancelBtn.setEnabled(True)
+        self.show()
+
+    def setProgress(self, percent):
+        if self.progressBar.maximum() == 0:
+            self.progressBar.setRange(0, 100)
+        self.progressBar.setValue(percent)
+
+
+class JobManager(QObject):
+    """Runs one file job at a time off the GUI thread for an Editor."""
+    idle = pyqtSignal()  # A job has ended and its callback has run
+
+    def __init__(self, statusBar, parent=None):
+        super().__init__(parent)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+        self.statusBar = statusBar
+        self.widget = JobProgressWidget()
+        self.widget.cancelBtn.clicked.connect(self.cancel)
+        statusBar.addPermanentWidget(self.widget)
+        self.job = None
+
+    def isBusy(self):
+        return self.job is not None
+
+    def start(self, label, fn, *args, onFinished=None, onFailed=None):
+        """Start fn(*args) in the background; returns False if a job is already running."""
+        if self.job is not None:
+            self.statusBar.showMessage("Please wait for the current operation to finish", 2000)
+            return False
+
+        job = Job(fn, *args)
+        job.signals.progress.connect(self.widget.setProgress)
+        job.signals.finished.connect(lambda result: self._done(onFinished, result))
+        job.signals.failed.connect(lambda message: self._done(onFailed, message))
+        job.signals.cancelled.connect(lambda: self._done(None, None, f"{label} cancelled"))
+        self.job = job
+        self.widget.start(label)
+        self.pool.start(job)
+        return True
+
+    def cancel(self):
+        if self.job is not None:
+            self.job.cancel()
+            self.widget.cancelBtn.setEnabled(False)
+
+    def shutdown(self):
+        self.cancel()
+        self.pool.waitForDone()
+
+    def _done(self, callback, value, message=None):
+        # Keep the job (and the arguments it holds) alive until we're back on the GUI thread
+        self.job = None
+        self.widget.hide()
+        if message:
+            self.statusBar.showMessage(message, 2000)
+        if callback is not None:
+            callback(value)
+        self.idle.emit()
@@ -0,0 +1,480 @@
+import mmap
+import os
+import re
+from array import array
+from bisect import bisect_left
+from PyQt5.QtWidgets import QAbstractScrollArea, QApplication
+from PyQt5.QtGui import QFontDatabase, QFontMetrics, QPainter, QPalette
+from PyQt5.QtCore import Qt, QRect, pyqtSignal
+from document_io import report
+
+INDEX_CHUNK_SIZE = 16 << 20  # bytes scanned between progress reports
+SAVE_CHUNK_SIZE = 16 << 20
+MAX_LINE_BYTES = 64 << 10  # longer lines are cut off for display
+TAB_SIZE = 4
+ENCODING = 'utf-8'
+ERRORS = 'surrogateescape'  # Round-trips bytes that aren't valid UTF-8 unchanged
+NEWLINE = re.compile(b'\n')
+
+ORIGINAL, ADDED = 0, 1
+
+
+def newline_index(data, start=0, end=None, progress=None):
+    """Offsets of every b'\\n' in data, as a compact array."""
+    end = len(data) if end is None else end
+    offsets = array('I' if end < 1 << 32 else 'Q')
+    for chunk_start in range(start, end, INDEX_CHUNK_SIZE):
+        chunk = data[chunk_start:min(chunk_start + INDEX_CHUNK_SIZE, end)]
+        offsets.extend(chunk_start + match.start() for match in NEWLINE.finditer(chunk))
+        report(progress, min((chunk_start - start) * 100 // max(end - start, 1), 99))
+    return offsets
+
+
+class PieceTable:
+    """Text stored as pieces of an immutable original buffer and an append-only add buffer.
+
+    The original is the memory-mapped file, so opening costs only the line
+    index. Offsets are byte offsets into the UTF-8 text. Both buffers keep a
+    sorted array of their newline offsets, which makes counting or finding
+    lines inside any piece a binary search.
+    """
+
+    def __init__(self, original=b'', newlines=None, file=None):
+        self.file = file
+        self.buffers = (original, bytearray())
+        self.newlines = (newlines if newlines is not None else newline_index(original), array('Q'))
+        self.pieces = [(ORIGINAL, 0, len(original))] if len(original) else []
+        self.length = len(original)
+        self.lineTotal = len(self.newlines[ORIGINAL]) + 1
+        self.undoStack = []
+        self.redoStack = []
+
+    def close(self):
+        if isinstance(self.buffers[ORIGINAL], mmap.mmap):
+            self.buffers[ORIGINAL].close()
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    # Queries
+
+    def lineCount(self):
+        return self.lineTotal
+
+    def memoryUsage(self):
+        """Bytes held outside the mapping: line indexes, the add buffer and the pieces."""
+        indexes = sum(len(newlines) * newlines.itemsize for newlines in self.newlines)
+        return indexes + len(self.buffers[ADDED]) + len(self.pieces) * 80
+
+    def countNewlines(self, source, start, end):
+        newlines = self.newlines[source]
+        return bisect_left(newlines, end) - bisect_left(newlines, start)
+
+    def lineOffset(self, line):
+        """Byte offset where line starts."""
+        if line <= 0:
+            return 0
+        position = 0
+        remaining = line
+        for source, start, length in self.pieces:
+            count = self.countNewlines(source, start, start + length)
+            if remaining <= count:
+                newlines = self.newlines[source]
+                newline = newlines[bisect_left(newlines, start) + remaining - 1]
+                return position + newline - start + 1
+            remaining -= count
+            position += length
+        return self.length
+
+    def read(self, begin, end):
+        parts = []
+        position = 0
+        for source, start, length in self.pieces:
+            if position >= end:
+                break
+            if position + length > begin:
+                lo = max(begin - position, 0)
+                hi = min(end - position, length)
+                parts.append(bytes(self.buffers[source][start + lo:start + hi]))
+            position += length
+        return b''.join(parts)
+
+    def lines(self, first, count):
+        """Text of up to count lines from first, without their newlines."""
+        first = max(min(first, self.lineTotal - 1), 0)
+        begin = self.lineOffset(first)
+        end = self.lineOffset(first + count)
+        limit = begin + MAX_LINE_BYTES * count
+        lines = self.read(begin, min(end, limit)).split(b'\n')
+        if end <= limit and first + count < self.lineTotal:
+            lines.pop()  # The empty remainder after the newline ending the last line
+        return [line[:MAX_LINE_BYTES].decode(ENCODING, ERRORS) for line in lines[:count]]
+
+    def line(self, number):
+        found = self.lines(number, 1)
+        return found[0] if found else ''
+
+    # Edits
+
+    def locate(self, offset):
+        """Index of the piece containing offset and the offset where that piece starts."""
+        position = 0
+        for index, (source, start, length) in enumerate(self.pieces):
+            if offset < position + length:
+                return index, position
+            position += length
+        return len(self.pieces), position
+
+    def saveUndo(self, cursor):
+        self.undoStack.append((list(self.pieces), self.length, self.lineTotal, cursor))
+        self.redoStack.clear()
+
+    def insert(self, offset, data):
+        if not data:
+            return
+        added = self.buffers[ADDED]
+        add_start = len(added)
+        added += data
+        self.newlines[ADDED].extend(add_start + match.start() for match in NEWLINE.finditer(data))
+
+        index, position = self.locate(offset)
+        if index < len(self.pieces) and offset > position:
+            # Split the piece the insertion lands in
+            source, start, length = self.pieces[index]
+            head = offset - position
+            self.pieces[index:index + 1] = [(source, start, head), (ADDED, add_start, len(data)),
+                                            (source, start + head, length - head)]
+        elif index and self.pieces[index - 1][0] == ADDED and sum(self.pieces[index - 1][1:]) == add_start:
+            # Typing straight after the previous insertion just grows that piece
+            source, start, length = self.pieces[index - 1]
+            self.pieces[index - 1] = (source, start, length + len(data))
+        else:
+            self.pieces.insert(index, (ADDED, add_start, len(data)))
+        self.length += len(data)
+        self.lineTotal += data.count(b'\n')
+
+    def delete(self, offset, count):
+        end = min(offset + count, self.length)
+        if end <= offset:
+            return
+        kept = []
+        position = 0
+        for source, start, length in self.pieces:
+            piece_end = position + length
+            if piece_end <= offset or position >= end:
+                kept.append((source, start, length))
+            else:
+                if position < offset:
+                    kept.append((source, start, offset - position))
+                if piece_end > end:
+                    kept.append((source, start + end - position, piece_end - end))
+                cut_start = max(offset, position) - position + start
+                cut_end = min(end, piece_end) - position + start
+                self.lineTotal -= self.countNewlines(source, cut_start, cut_end)
+            position = piece_end
+        self.pieces = kept
+        self.length -= end - offset
+
+    def undo(self, cursor):
+        return self.restore(self.undoStack, self.redoStack, cursor)
+
+    def redo(self, cursor):
+        return self.restore(self.redoStack, self.undoStack, cursor)
+
+    def restore(self, source, target, cursor):
+        """Pop a piece list snapshot; returns the cursor saved with it, or None."""
+        if not source:
+            return None
+        target.append((list(self.pieces), self.length, self.lineTotal, cursor))
+        pieces, self.length, self.lineTotal, saved = source.pop()
+        self.pieces = pieces
+        return saved
+
+
+def open_large_file(fname, progress=None):
+    """Memory-map fname and index its lines; meant to run as a background job."""
+    file = open(fname, 'rb')
+    try:
+        size = os.fstat(file.fileno()).st_size
+        data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+        table = PieceTable(data, newline_index(data, progress=progress), file=file)
+    except BaseException:
+        file.close()
+        raise
+    report(progress, 100)
+    return table
+
+
+def save_large_file(table, fname, progress=None):
+    """Write the pieces out to a temporary file next to fname and return its path.
+
+    The caller moves it into place once the table's mapping of the original
+    file has been closed, which Windows requires before replacing it.
+    """
+    tmp = fname + '.tmp'
+    written = 0
+    with open(tmp, 'wb') as file:
+        for source, start, length in table.pieces:
+            buffer = table.buffers[source]
+            for chunk_start in range(start, start + length, SAVE_CHUNK_SIZE):
+                file.write(buffer[chunk_start:min(chunk_start + SAVE_CHUNK_SIZE, start + length)])
+            written += length
+            report(progress, min(written * 100 // max(table.length, 1), 99))
+    return tmp
+
+
+class LargeFileView(QAbstractScrollArea):
+    """Plain-text view that only ever decodes and paints the visible lines.
+
+    Scrolling is by whole lines, so the vertical scroll bar covers the line
+    count rather than pixels. The cursor is a (line, column) pair; edits are
+    translated to byte offsets and applied to the PieceTable.
+    """
+    modificationChanged = pyqtSignal(bool)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.table = None
+        self.fileName = None
+        self.line = 0
+        self.column = 0
+        self.modified = False
+        self.newline = b'\n'
+        self.setFont(QFontDatabase.systemFont(QFontDatabase.FixedFont))
+        self.setFocusPolicy(Qt.StrongFocus)
+        self.viewport().setCursor(Qt.IBeamCursor)
+        self.verticalScrollBar().valueChanged.connect(self.viewport().update)
+        self.horizontalScrollBar().valueChanged.connect(self.viewport().update)
+
+    def setTable(self, table, fileName):
+        if self.table is not None:
+            self.table.close()
+        self.table = table
+        self.fileName = fileName
+        self.line = self.column = 0
+        first = table.line(0)
+        self.newline = b'\r\n' if first.endswith('\r') else b'\n'
+        self.setModified(False)
+        self.updateScrollBars()
+        self.verticalScrollBar().setValue(0)
+        self.horizontalScrollBar().setValue(0)
+        self.viewport().update()
+
+    def closeTable(self):
+        if self.table is not None:
+            self.table.close()
+            self.table = None
+
+    def setModified(self, modified):
+        if modified != self.modified:
+            self.modified = modified
+            self.modificationChanged.emit(modified)
+
+    # Geometry
+
+    def lineHeight(self):
+        return QFontMetrics(self.font()).lineSpacing()
+
+    def visibleLines(self):
+        return max(self.viewport().height() // self.lineHeight(), 1)
+
+    def gutterWidth(self):
+        digits = len(str(self.table.lineCount())) if self.table is not None else 1
+        return QFontMetrics(self.font()).horizontalAdvance('9') * (digits + 2)
+
+    def updateScrollBars(self):
+        if self.table is None:
+            return
+        visible = self.visibleLines()
+        bar = self.verticalScrollBar()
+        bar.setRange(0, max(self.table.lineCount() - visible, 0))
+        bar.setPageStep(visible)
+        self.horizontalScrollBar().setPageStep(self.viewport().width())
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.updateScrollBars()
+
+    def displayText(self, text):
+        return text.rstrip('\r').expandtabs(TAB_SIZE)
+
+    def paintEvent(self, event):
+        painter = QPainter(self.viewport())
+        palette = self.palette()
+        painter.fillRect(self.viewport().rect(), palette.color(QPalette.Base))
+        if self.table is None:
+            return
+        metrics = QFontMetrics(self.font())
+        height = metrics.lineSpacing()
+        gutter = self.gutterWidth()
+        scroll_x = self.horizontalScrollBar().value()
+        first = self.verticalScrollBar().value()
+        lines = self.table.lines(first, self.visibleLines() + 1)
+
+        widest = 0
+        painter.setClipRect(QRect(gutter, 0, self.viewport().width() - gutter, self.viewport().height()))
+        painter.setPen(palette.color(QPalette.Text))
+        for i, text in enumerate(lines):
+            shown = self.displayText(text)
+            widest = max(widest, metrics.horizontalAdvance(shown))
+            painter.drawText(gutter + 4 - scroll_x, i * height + metrics.ascent(), shown)
+            if first + i == self.line and self.hasFocus():
+                x = gutter + 4 - scroll_x + metrics.horizontalAdvance(text[:self.column].expandtabs(TAB_SIZE))
+                painter.drawLine(x, i * height, x, (i + 1) * height - 1)
+
+        painter.setClipping(False)
+        painter.fillRect(0, 0, gutter, self.viewport().height(), palette.color(QPalette.AlternateBase))
+        painter.setPen(palette.color(QPalette.PlaceholderText))
+        for i in range(len(lines)):
+            painter.drawText(QRect(0, i * height, gutter - 8, height), Qt.AlignRight, str(first + i + 1))
+        self.horizontalScrollBar().setRange(0, max(widest + 8 - (self.viewport().width() - gutter), 0))
+
+    # Cursor
+
+    def currentText(self):
+        return self.table.line(self.line)
+
+    def offset(self, line, column):
+        text = self.table.line(line)
+        return self.table.lineOffset(line) + len(text[:column].encode(ENCODING, ERRORS))
+
+    def moveTo(self, line, column):
+        self.line = max(min(line, self.table.lineCount() - 1), 0)
+        self.column = max(min(column, len(self.currentText().rstrip('\r'))), 0)
+        self.ensureCursorVisible()
+        self.viewport().update()
+
+    def ensureCursorVisible(self):
+        bar = self.verticalScrollBar()
+        if self.line < bar.value():
+            bar.setValue(self.line)
+        elif self.line >= bar.value() + self.visibleLines():
+            bar.setValue(self.line - self.visibleLines() + 1)
+        metrics = QFontMetrics(self.font())
+        x = metrics.horizontalAdvance(self.currentText()[:self.column].expandtabs(TAB_SIZE))
+        hbar = self.horizontalScrollBar()
+        width = self.viewport().width() - self.gutterWidth() - 8
+        if x < hbar.value():
+            hbar.setValue(x)
+        elif x > hbar.value() + width:
+            hbar.setMaximum(max(hbar.maximum(), x - width))
+            hbar.setValue(x - width)
+
+    def mousePressEvent(self, event):
+        if self.table is None or event.button() != Qt.LeftButton:
+            return
+        line = self.verticalScrollBar().value() + event.pos().y() // self.lineHeight()
+        x = event.pos().x() - self.gutterWidth() - 4 + self.horizontalScrollBar().value()
+        text = self.table.line(min(line, self.table.lineCount() - 1)).rstrip('\r')
+        metrics = QFontMetrics(self.font())
+        # Binary search for the column whose left edge is nearest x
+        lo, hi = 0, len(text)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if metrics.horizontalAdvance(text[:mid + 1].expandtabs(TAB_SIZE)) <= x:
+                lo = mid + 1
+            else:
+                hi = mid
+        self.moveTo(line, lo)
+
+    # Editing
+
+    def insertText(self, text):
+        self.table.saveUndo((self.line, self.column))
+        data = text.replace('\r\n', '\n').encode(ENCODING, ERRORS)
+        if self.newline != b'\n':
+            data = data.replace(b'\n', self.newline)
+        self.table.insert(self.offset(self.line, self.column), data)
+        lines = text.replace('\r\n', '\n').split('\n')
+        if len(lines) > 1:
+            self.line += len(lines) - 1
+            self.column = len(lines[-1])
+        else:
+            self.column += len(text)
+        self.edited()
+
+    def deleteBackward(self):
+        if self.column == 0 and self.line == 0:
+            return
+        self.table.saveUndo((self.line, self.column))
+        end = self.offset(self.line, self.column)
+        if self.column:
+            self.column -= 1
+            start = self.offset(self.line, self.column)
+        else:
+            self.line -= 1
+            self.column = len(self.currentText().rstrip('\r'))
+            start = self.offset(self.line, self.column)
+        self.table.delete(start, end - start)
+        self.edited()
+
+    def deleteForward(self):
+        text = self.currentText().rstrip('\r')
+        if self.column >= len(text) and self.line >= self.table.lineCount() - 1:
+            return
+        self.table.saveUndo((self.line, self.column))
+        start = self.offset(self.line, self.column)
+        if self.column < len(text):
+            end = self.offset(self.line, self.column + 1)
+        else:
+            end = self.table.lineOffset(self.line + 1)
+        self.table.delete(start, end - start)
+        self.edited()
+
+    def edited(self):
+        self.setModified(True)
+        self.updateScrollBars()
+        self.moveTo(self.line, self.column)
+
+    def undo(self):
+        if self.table is not None:
+            self.restoreCursor(self.table.undo((self.line, self.column)))
+
+    def redo(self):
+        if self.table is not None:
+            self.restoreCursor(self.table.redo((self.line, self.column)))
+
+    def restoreCursor(self, cursor):
+        if cursor is not None:
+            self.setModified(True)
+            self.updateScrollBars()
+            self.moveTo(*cursor)
+
+    def keyPressEvent(self, event):
+        if self.table is None:
+            return
+        key = event.key()
+        ctrl = event.modifiers() & Qt.ControlModifier
+        page = self.visibleLines()
+        moves = {
+            Qt.Key_Up: (self.line - 1, self.column),
+            Qt.Key_Down: (self.line + 1, self.column),
+            Qt.Key_PageUp: (self.line - page, self.column),
+            Qt.Key_PageDown: (self.line + page, self.column),
+            Qt.Key_Home: (0, 0) if ctrl else (self.line, 0),
+            Qt.Key_End: (self.table.lineCount() - 1, 1 << 30) if ctrl else (self.line, 1 << 30),
+        }
+        if key in moves:
+            self.moveTo(*moves[key])
+        elif key == Qt.Key_Left:
+            if self.column:
+                self.moveTo(self.line, self.column - 1)
+            elif self.line:
+                self.moveTo(self.line - 1, 1 << 30)
+        elif key == Qt.Key_Right:
+            if self.column < len(self.currentText().rstrip('\r')):
+                self.moveTo(self.line, self.column + 1)
+            elif self.line < self.table.lineCount() - 1:
+                self.moveTo(self.line + 1, 0)
+        elif key == Qt.Key_Backspace:
+            self.deleteBackward()
+        elif key == Qt.Key_Delete:
+            self.deleteForward()
+        elif key in (Qt.Key_Return, Qt.Key_Enter):
+            self.insertText('\n')
+        elif ctrl and key == Qt.Key_V:
+            self.insertText(QApplication.clipboard().text())
+        elif event.text() and event.text().isprintable() or event.text() == '\t':
+            self.insertText(event.text())
+        else:
+            super().keyPressEvent(event)
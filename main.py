@@ -1,12 +1,34 @@
-import ctypes
 import sys
 import os
-from PyQt5.QtWidgets import QApplication
-from PyQt5.QtGui import QIcon
-from editor import Editor
+import startup_profile
 
 def main():
-    app = QApplication(sys.argv)
+    if len(sys.argv) > 1 and sys.argv[1] == 'convert':
+        import convert
+        return convert.main(sys.argv[2:])
+
+    # A separate process, e.g. to profile a cold start or run a second editor on purpose
+    new_instance = '--profile-startup' in sys.argv or '--new-instance' in sys.argv
+    if '--new-instance' in sys.argv:
+        sys.argv.remove('--new-instance')
+    if '--profile-startup' in sys.argv:
+        sys.argv.remove('--profile-startup')
+        startup_profile.enable()
+
+    paths = [arg for arg in sys.argv[1:] if not arg.startswith('-')]
+    if not new_instance:
+        from single_instance import send_to_running
+        if send_to_running(paths):
+            return 0
+
+    with startup_profile.phase('import PyQt5'):
+        from PyQt5.QtWidgets import QApplication
+        from PyQt5.QtGui import QIcon
+    with startup_profile.phase('import editor'):
+        from editor import Editor
+
+    with startup_profile.phase('QApplication'):
+        app = QApplication(sys.argv)
 
     if getattr(sys, 'frozen', False):
         base_path = os.path.dirname(sys.executable)
@@ -22,16 +44,33 @@ def main():
         print("Icon set successfully")
 
         # Force set the taskbar icon using Windows API (for taskbar icon issue)
-        ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID('mycompany.myproduct.subproduct.version')
-        hwnd = ctypes.windll.user32.GetActiveWindow()
-        ctypes.windll.user32.SendMessageW(hwnd, 0x0080, 0, icon_path)
+        if sys.platform == 'win32':
+            import ctypes
+            ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID('mycompany.myproduct.subproduct.version')
+            hwnd = ctypes.windll.user32.GetActiveWindow()
+            ctypes.windll.user32.SendMessageW(hwnd, 0x0080, 0, icon_path)
     else:
         print("Warning: Icon file not found!")
 
-    ex = Editor()
+    with startup_profile.phase('Editor()'):
+        ex = Editor()
     ex.show()
-    
+    startup_profile.report_on_first_paint(ex)
+
+    if not new_instance:
+        from single_instance import InstanceServer
+        server = InstanceServer(ex)
+        if server.listen():
+            server.filesReceived.connect(ex.openPaths)
+    if paths:
+        ex.openPaths(paths)
+
     return app.exec_()
 
 if __name__ == '__main__':
+    if getattr(sys, 'frozen', False):
+        # Needed by convert's process pool in the frozen build; the import is
+        # skipped otherwise to keep handing files to a running editor quick
+        import multiprocessing
+        multiprocessing.freeze_support()
     sys.exit(main())
@@ -0,0 +1,340 @@
+"""OpenOPen's own document format (.oop): the document's structure, stored as it is.
+
+A file is a short header followed by one compressed payload of sections:
+
+    formats  every distinct format, serialized with QDataStream
+    lists    the format of each list, as an index into formats
+    blocks   runs of (count, block format, block char format, list or -1)
+    runs     runs of (length, char format) over the text, in UTF-16 code units as Qt counts
+    text     the paragraphs as UTF-8, separated by U+2029
+    images   the encoded bytes of each picture, by name (optional)
+
+Runs cover the paragraph separators too, which is how DocumentModel keeps
+them, so the editor can save from its model without walking the document.
+Loading builds the QTextDocument straight from these tables with a cursor,
+with each format read once and interned, instead of parsing markup.
+"""
+import struct
+import sys
+import zlib
+from array import array
+from PyQt5.QtCore import QByteArray, QDataStream, QIODevice, QUrl
+from PyQt5.QtGui import QTextCursor, QTextDocument, QTextFormat
+import formats
+from document_io import new_document, report, to_gui_thread
+from document_model import ASTRAL, PARAGRAPH_SEPARATOR, Runs, from_utf16_units
+from images import image_bytes
+
+MAGIC = b'OOPN'
+VERSION = 1
+COMPRESSION_NONE = 0
+COMPRESSION_ZLIB = 1
+COMPRESSION_LEVEL = 6
+HEADER = struct.Struct('<4sBB')
+SECTION = struct.Struct('<Q')
+PROGRESS_INTERVAL = 1 << 12  # paragraphs between progress reports
+
+
+class NativeFormatError(ValueError):
+    """The file isn't an OpenOPen document this version can read."""
+
+
+class Content:
+    """What a file holds, still numbered with the document's own format indexes.
+
+    formats is the document's allFormats(), lists maps a list's object
+    index to its format index, runs holds char format indexes over text,
+    and blocks holds (block format, block char format) per paragraph.
+    images holds (name, encoded bytes) for the pictures the formats use.
+    """
+
+    def __init__(self, formats, lists, text, runs, blocks, images=()):
+        self.formats = formats
+        self.lists = lists
+        self.text = text
+        self.runs = runs
+        self.blocks = blocks
+        self.images = images
+
+
+def read_images(document, allFormats):
+    images = []
+    for text_format in allFormats:
+        if text_format.isImageFormat():
+            name = text_format.toImageFormat().name()
+            found = image_bytes(document, name)
+            if found is not None:
+                images.append((name, found[0]))
+    return images
+
+
+def read_document(document):
+    """Content of document, read fragment by fragment; safe on a worker thread."""
+    if document.rootFrame().childFrames():
+        raise ValueError("Documents with tables or frames can't be saved as OpenOPen documents yet")
+    lists = {}
+    texts = []
+    lengths, values = [], []
+    blocks = []
+    block = document.begin()
+    while block.isValid():
+        textList = block.textList()
+        if textList is not None and textList.objectIndex() not in lists:
+            lists[textList.objectIndex()] = textList.formatIndex()
+        last = block.charFormatIndex()
+        blocks.append((block.blockFormatIndex(), last))
+        it = block.begin()
+        while not it.atEnd():
+            fragment = it.fragment()
+            last = fragment.charFormatIndex()
+            lengths.append(fragment.length())
+            values.append(last)
+            it += 1
+        texts.append(block.text())
+        block = block.next()
+        if block.isValid():
+            # The separator takes the format of the text before it
+            lengths.append(1)
+            values.append(last)
+    allFormats = document.allFormats()
+    return Content(allFormats, lists, PARAGRAPH_SEPARATOR.join(texts),
+                   Runs(lengths, values), Runs([1] * len(blocks), blocks), read_images(document, allFormats))
+
+
+def read_model(model):
+    """Content of a DocumentModel's mirror, as copies of its runs.
+
+    Must be called on the GUI thread; the copies can then be written out
+    on a worker while the document carries on changing.
+    """
+    document = model.document
+    allFormats = document.allFormats()
+    lists = {}
+    for blockFormat, _ in set(model.blocks.values):
+        objectIndex = allFormats[blockFormat].objectIndex()
+        if objectIndex >= 0 and objectIndex not in lists:
+            lists[objectIndex] = document.object(objectIndex).formatIndex()
+    runs = Runs(model.formats.lengths, model.formats.values)
+    blocks = Runs(model.blocks.lengths, model.blocks.values)
+    return Content(allFormats, lists, from_utf16_units(model.text.text()), runs, blocks,
+                   read_images(document, allFormats))
+
+
+def little_endian(values):
+    if sys.byteorder == 'big':
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def from_little_endian(typecode, data):
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values
+
+
+class FormatTable:
+    """Numbers the distinct formats of a document as they're first used."""
+
+    def __init__(self, allFormats):
+        self.all = allFormats
+        self.indexes = {}  # (document format index, stripped) -> table index
+        self.data = QByteArray()
+        self.stream = QDataStream(self.data, QIODevice.WriteOnly)
+        self.count = 0
+
+    def add(self, index, strip=False):
+        key = (index, strip)
+        found = self.indexes.get(key)
+        if found is None:
+            text_format = self.all[index]
+            if strip:
+                # List membership is stored per paragraph; the list object itself isn't saved
+                text_format = QTextFormat(text_format)
+                text_format.clearProperty(QTextFormat.ObjectIndex)
+            self.stream << text_format
+            found = self.indexes[key] = self.count
+            self.count += 1
+        return found
+
+
+def write_native(content, filename, progress=None):
+    table = FormatTable(content.formats)
+    listNumbers = {objectIndex: number for number, objectIndex in enumerate(content.lists)}
+    listFormats = array('i', (table.add(index) for index in content.lists.values()))
+    report(progress, 10)
+
+    blocks = array('i')
+    for count, (blockFormat, charFormat) in content.blocks:
+        listNumber = listNumbers.get(content.formats[blockFormat].objectIndex(), -1)
+        blocks.extend((count, table.add(blockFormat, True), table.add(charFormat), listNumber))
+    charFormats = {index: table.add(index) for index in set(content.runs.values)}
+    runs = array('I', bytes(8 * len(content.runs.values)))
+    runs[0::2] = array('I', content.runs.lengths)
+    runs[1::2] = array('I', [charFormats[index] for index in content.runs.values])
+    report(progress, 40)
+
+    payload = b''.join(SECTION.pack(len(section)) + section for section in (
+        struct.pack('<I', table.count) + bytes(table.data),
+        little_endian(listFormats),
+        little_endian(blocks),
+        little_endian(runs),
+        content.text.encode('utf-8'),
+        write_images(content.images),
+    ))
+    report(progress, 60)
+    with open(filename, 'wb') as file:
+        file.write(HEADER.pack(MAGIC, VERSION, COMPRESSION_ZLIB))
+        file.write(zlib.compress(payload, COMPRESSION_LEVEL))
+    report(progress, 100)
+    return filename
+
+
+def write_images(images):
+    parts = [struct.pack('<I', len(images))]
+    for name, data in images:
+        name = name.encode('utf-8')
+        parts.append(struct.pack('<I', len(name)) + name + struct.pack('<I', len(data)))
+        parts.append(data)
+    return b''.join(parts)
+
+
+def add_images(document, data):
+    count, = struct.unpack_from('<I', data)
+    offset = 4
+    for _ in range(count):
+        length, = struct.unpack_from('<I', data, offset)
+        name = data[offset + 4:offset + 4 + length].decode('utf-8')
+        offset += 4 + length
+        length, = struct.unpack_from('<I', data, offset)
+        document.addResource(QTextDocument.ImageResource, QUrl(name), QByteArray(data[offset + 4:offset + 4 + length]))
+        offset += 4 + length
+
+
+def save_native(document, filename, progress=None):
+    return write_native(read_document(document), filename, progress)
+
+
+def read_sections(filename):
+    with open(filename, 'rb') as file:
+        data = file.read()
+    if len(data) < HEADER.size:
+        raise NativeFormatError(f"{filename} is not an OpenOPen document")
+    magic, version, compression = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise NativeFormatError(f"{filename} is not an OpenOPen document")
+    if version > VERSION:
+        raise NativeFormatError(f"{filename} was saved by a newer version of OpenOPen")
+    payload = data[HEADER.size:]
+    if compression == COMPRESSION_ZLIB:
+        payload = zlib.decompress(payload)
+    elif compression != COMPRESSION_NONE:
+        raise NativeFormatError(f"{filename} uses an unknown compression method")
+    sections = []
+    offset = 0
+    while offset < len(payload):
+        length, = SECTION.unpack_from(payload, offset)
+        offset += SECTION.size
+        sections.append(payload[offset:offset + length])
+        offset += length
+    if len(sections) < 5:
+        raise NativeFormatError(f"{filename} is incomplete")
+    return sections
+
+
+def read_formats(data):
+    """(format, its serialized bytes) for each entry of the formats section."""
+    count, = struct.unpack_from('<I', data)
+    data = data[4:]
+    stream = QDataStream(QByteArray(data))
+    table = []
+    start = 0
+    for _ in range(count):
+        text_format = QTextFormat()
+        stream >> text_format
+        end = stream.device().pos()
+        table.append((text_format, data[start:end]))
+        start = end
+    if stream.status() != QDataStream.Ok:
+        raise NativeFormatError("The format table is damaged")
+    return table
+
+
+def load_native(filename, progress=None):
+    """Load an OpenOPen document into a new, detached QTextDocument.
+
+    Like import_rtf, the document is built with undo disabled inside one
+    edit block and is safe to build on a worker thread.
+    """
+    sections = read_sections(filename)
+    formatData, listData, blockData, runData, textData = sections[:5]
+    table = read_formats(formatData)
+    # Interned by their serialized form, so equal formats are shared across documents
+    charFormats = [formats.char_format(('native', data), lambda f, t=text_format: f.merge(t))
+                   if text_format.isCharFormat() else None for text_format, data in table]
+    blockFormats = [formats.block_format(('native', data), lambda f, t=text_format: f.merge(t))
+                    if text_format.isBlockFormat() else None for text_format, data in table]
+    listFormats = [table[index][0].toListFormat() for index in from_little_endian('i', listData)]
+    blocks = from_little_endian('i', blockData)
+    runs = from_little_endian('I', runData)
+    paragraphs = textData.decode('utf-8').split(PARAGRAPH_SEPARATOR)
+    report(progress, 10)
+
+    document = new_document()
+    if len(sections) > 5:
+        add_images(document, sections[5])
+    document.setUndoRedoEnabled(False)
+    cursor = QTextCursor(document)
+    cursor.beginEditBlock()
+    insertText = cursor.insertText
+    textLists = {}
+    run = -2
+    left = 0  # characters left in the current run
+    paragraph = 0
+    total = len(paragraphs) or 1
+    for descriptor in range(0, len(blocks), 4):
+        count, blockFormat, blockCharFormat, listNumber = blocks[descriptor:descriptor + 4]
+        for _ in range(count):
+            if paragraph:
+                cursor.insertBlock(blockFormats[blockFormat], charFormats[blockCharFormat])
+            else:
+                cursor.setBlockFormat(blockFormats[blockFormat])
+                cursor.setBlockCharFormat(charFormats[blockCharFormat])
+            if listNumber >= 0:
+                textList = textLists.get(listNumber)
+                if textList is None:
+                    textLists[listNumber] = cursor.createList(listFormats[listNumber])
+                else:
+                    textList.add(cursor.block())
+
+            text = paragraphs[paragraph]
+            # Run lengths count UTF-16 code units, so a paragraph with emoji and the
+            # like is cut up in those rather than in Python characters
+            units = text.encode('utf-16-le') if ASTRAL.search(text) else None
+            offset, length = 0, len(text) if units is None else len(units) // 2
+            while offset < length:
+                if not left:
+                    run += 2
+                    left = runs[run]
+                take = min(left, length - offset)
+                if units is None:
+                    insertText(text[offset:offset + take], charFormats[runs[run + 1]])
+                else:
+                    insertText(units[2 * offset:2 * (offset + take)].decode('utf-16-le'), charFormats[runs[run + 1]])
+                offset += take
+                left -= take
+            # Step over the separator's character in the runs
+            if not left:
+                run += 2
+                left = runs[run] if run < len(runs) else 1
+            left -= 1
+            paragraph += 1
+            if paragraph % PROGRESS_INTERVAL == 0:
+                report(progress, 10 + paragraph * 90 // total)
+    cursor.endEditBlock()
+    document.setUndoRedoEnabled(True)
+    document.setModified(False)
+    report(progress, 100)
+    return to_gui_thread(document)
@@ -1,41 +1,317 @@
-from reportlab.lib.pagesizes import letter
-from reportlab.platypus import SimpleDocTemplate, Paragraph
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.colors import Color
-from PyQt5.QtGui import QTextDocument, QTextCursor
-
-def export_to_pdf(text_edit, filename):
-    doc = SimpleDocTemplate(filename, pagesize=letter)
-    styles = getSampleStyleSheet()
-    flowables = []
-
-    cursor = text_edit.textCursor()
-    for block_num in range(text_edit.document().blockCount()):
-        block = text_edit.document().findBlockByNumber(block_num)
-        cursor.setPosition(block.position())
-        cursor.movePosition(QTextCursor.EndOfBlock, QTextCursor.KeepAnchor)
-        
-        text = cursor.selectedText()
-        if not text:  # Skip empty paragraphs
-            continue
-
-        style = ParagraphStyle('Custom')
-        char_format = cursor.charFormat()
-        
-        style.fontName = char_format.font().family() or 'Times-Roman'
-        style.fontSize = char_format.font().pointSize() or 12
-        style.textColor = Color(char_format.foreground().color().redF(),
-                                char_format.foreground().color().greenF(),
-                                char_format.foreground().color().blueF())
-        
-        if char_format.font().bold():
-            style.bold = True
-        if char_format.font().italic():
-            style.italic = True
-        if char_format.font().underline():
-            style.underline = True
-        
-        para = Paragraph(text, style)
-        flowables.append(para)
-
-    doc.build(flowables)
\ No newline at end of file
+import io
+import os
+import re
+import sys
+from xml.sax.saxutils import escape
+from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY, TA_LEFT, TA_RIGHT
+from reportlab.lib.fonts import addMapping
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.platypus import Image, Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QTextCharFormat, QTextDocument, QTextFormat, QTextFrame, QTextListFormat, QTextTable
+from constants import PAGE_MARGIN, PAGE_WIDTH
+from document_io import frame_items, report, table_cells
+from images import display_size, image_bytes
+
+PROGRESS_INTERVAL = 500  # blocks between progress reports
+POINTS_PER_PIXEL = 0.75  # Qt lays documents out at 96 dpi
+LINE_HEIGHT = 1.2
+LIST_INDENT = 18  # points per list level
+SPACES = re.compile('  +')
+OBJECT_REPLACEMENT = '\ufffc'
+CELL_PADDING = 6  # points reportlab leaves inside each side of a table cell
+
+ALIGNMENTS = {Qt.AlignHCenter: TA_CENTER, Qt.AlignRight: TA_RIGHT, Qt.AlignJustify: TA_JUSTIFY}
+
+BULLETS = {
+    QTextListFormat.ListDisc: '\u2022',
+    QTextListFormat.ListCircle: 'o',
+    QTextListFormat.ListSquare: '\u25aa',
+}
+
+# Standard PDF fonts, used when no TrueType file is found for a family
+BASE_FONTS = (
+    (('times', 'serif', 'georgia', 'garamond', 'cambria', 'book'), 'Times-Roman'),
+    (('courier', 'mono', 'consol', 'code'), 'Courier'),
+)
+
+FONT_DIRS = {
+    'win32': [os.path.join(os.environ.get('WINDIR', 'C:\\Windows'), 'Fonts')],
+    'darwin': ['/Library/Fonts', '/System/Library/Fonts', os.path.expanduser('~/Library/Fonts')],
+}.get(sys.platform, ['/usr/share/fonts', '/usr/local/share/fonts', os.path.expanduser('~/.fonts'),
+                     os.path.expanduser('~/.local/share/fonts')])
+
+# File name suffixes used for the styled faces of a family, e.g. arialbd.ttf
+FACE_SUFFIXES = {
+    'bold': ('bd', 'b', '-bold', 'bold'),
+    'italic': ('i', '-italic', 'italic', '-oblique'),
+    'boldItalic': ('bi', 'z', '-bolditalic', 'bolditalic', '-boldoblique'),
+}
+
+# Font names registered with reportlab, by Qt family. reportlab's registry is
+# process-wide, so each family is looked up and registered once per process.
+_font_names = {}
+_font_files = None
+
+
+def font_files():
+    """Map of lower-cased .ttf file stems to paths, built on first use."""
+    global _font_files
+    if _font_files is None:
+        _font_files = {}
+        for font_dir in FONT_DIRS:
+            for root, _, names in os.walk(font_dir):
+                for name in names:
+                    stem, ext = os.path.splitext(name)
+                    if ext.lower() == '.ttf':
+                        _font_files.setdefault(stem.lower(), os.path.join(root, name))
+    return _font_files
+
+
+def base_font(family):
+    lowered = family.lower()
+    for keywords, name in BASE_FONTS:
+        if any(keyword in lowered for keyword in keywords):
+            return name
+    return 'Helvetica'
+
+
+def register_family(family):
+    """Register a TrueType family with reportlab; returns its font name or None."""
+    files = font_files()
+    stem = family.lower().replace(' ', '')
+    regular = files.get(stem) or files.get(stem + '-regular')
+    if regular is None:
+        return None
+    name = family.replace(' ', '')
+    try:
+        pdfmetrics.registerFont(TTFont(name, regular))
+    except Exception:
+        return None
+    faces = {'normal': name}
+    for face, suffixes in FACE_SUFFIXES.items():
+        faces[face] = name
+        for suffix in suffixes:
+            path = files.get(stem + suffix)
+            if path is not None:
+                try:
+                    pdfmetrics.registerFont(TTFont(f'{name}-{face}', path))
+                except Exception:
+                    continue
+                faces[face] = f'{name}-{face}'
+                break
+    addMapping(name, 0, 0, faces['normal'])
+    addMapping(name, 1, 0, faces['bold'])
+    addMapping(name, 0, 1, faces['italic'])
+    addMapping(name, 1, 1, faces['boldItalic'])
+    return name
+
+
+def font_name(family):
+    name = _font_names.get(family)
+    if name is None:
+        name = _font_names[family] = register_family(family) or base_font(family)
+    return name
+
+
+def color_hex(color):
+    return '#%02x%02x%02x' % (color.red(), color.green(), color.blue())
+
+
+def run_markup(char_format, default_size):
+    """Opening and closing inline tags for a character format, plus its point size."""
+    size = char_format.fontPointSize() or default_size
+    attributes = [f'size="{size:g}"']
+    family = char_format.fontFamily()
+    if family:
+        attributes.append(f'name="{font_name(family)}"')
+    if char_format.hasProperty(QTextFormat.ForegroundBrush):
+        attributes.append(f'color="{color_hex(char_format.foreground().color())}"')
+    if char_format.hasProperty(QTextFormat.BackgroundBrush):
+        attributes.append(f'backColor="{color_hex(char_format.background().color())}"')
+    tags = []
+    if char_format.fontWeight() > QTextCharFormat().fontWeight():
+        tags.append('b')
+    if char_format.fontItalic():
+        tags.append('i')
+    if char_format.fontUnderline():
+        tags.append('u')
+    if char_format.fontStrikeOut():
+        tags.append('strike')
+    valign = char_format.verticalAlignment()
+    if valign == QTextCharFormat.AlignSuperScript:
+        tags.append('super')
+    elif valign == QTextCharFormat.AlignSubScript:
+        tags.append('sub')
+    opening = f'<font {" ".join(attributes)}>' + ''.join(f'<{tag}>' for tag in tags)
+    closing = ''.join(f'</{tag}>' for tag in reversed(tags)) + '</font>'
+    return opening, closing, size
+
+
+def run_text(text):
+    text = escape(text).replace('\u2028', '<br/>').replace('\t', '\u00a0' * 4).replace('\ufffc', '')
+    # reportlab collapses whitespace like HTML does, so keep runs of spaces
+    return SPACES.sub(lambda m: ' ' + '\u00a0' * (len(m.group()) - 1), text)
+
+
+def list_bullet(block):
+    text_list = block.textList()
+    style = text_list.format().style()
+    if style in BULLETS:
+        return BULLETS[style]
+    return text_list.itemText(block) or f'{text_list.itemNumber(block) + 1}.'
+
+
+class StyleCache:
+    """ParagraphStyles interned by the block properties they were built from."""
+
+    def __init__(self, font, size, indent_width):
+        self.font = font
+        self.size = size
+        self.indent_width = indent_width
+        self.styles = {}
+
+    def get(self, block_format, list_level, leading_size):
+        alignment = ALIGNMENTS.get(int(block_format.alignment() & Qt.AlignHorizontal_Mask), TA_LEFT)
+        left = (block_format.leftMargin() + block_format.indent() * self.indent_width) * POINTS_PER_PIXEL
+        key = (alignment, left, block_format.textIndent(), block_format.topMargin(),
+               block_format.bottomMargin(), list_level, leading_size)
+        style = self.styles.get(key)
+        if style is None:
+            style = ParagraphStyle(
+                f'block{len(self.styles)}',
+                fontName=self.font,
+                fontSize=self.size,
+                leading=leading_size * LINE_HEIGHT,
+                alignment=alignment,
+                leftIndent=left + list_level * LIST_INDENT,
+                firstLineIndent=block_format.textIndent() * POINTS_PER_PIXEL,
+                spaceBefore=block_format.topMargin() * POINTS_PER_PIXEL,
+                spaceAfter=block_format.bottomMargin() * POINTS_PER_PIXEL,
+                bulletIndent=left + (list_level - 1) * LIST_INDENT + 4,
+                bulletFontName=self.font,
+                bulletFontSize=self.size,
+            )
+            self.styles[key] = style
+        return style
+
+
+class FlowableBuilder:
+    """Turns the blocks and tables of a document into reportlab flowables."""
+
+    def __init__(self, document, progress=None):
+        self.document = document
+        self.progress = progress
+        self.blockCount = document.blockCount()
+        default_font = document.defaultFont()
+        self.defaultSize = default_font.pointSizeF() if default_font.pointSizeF() > 0 else 12
+        self.styles = StyleCache(font_name(default_font.family()), self.defaultSize, document.indentWidth())
+        self.markup = {}  # format index -> run_markup()
+        self.pictures = {}  # image name -> encoded bytes, or None when the document hasn't got it
+
+    def frame(self, items, width):
+        """Flowables for the blocks, tables and frames in items, to fit width points."""
+        flowables = []
+        for item in items:
+            if isinstance(item, QTextTable):
+                flowables.append(self.table(item, width))
+            elif isinstance(item, QTextFrame):
+                flowables.extend(self.frame(frame_items(item), width))
+            else:
+                flowables.extend(self.block(item, width))
+        return flowables
+
+    def block(self, block, width):
+        """A Paragraph for a block, split around any pictures in it, which follow as Images."""
+        if block.blockNumber() % PROGRESS_INTERVAL == 0:
+            report(self.progress, block.blockNumber() * 80 // self.blockCount)
+        pieces = []  # lists of markup, and Images between them
+        parts = []
+        largest = self.defaultSize
+        it = block.begin()
+        while not it.atEnd():
+            fragment = it.fragment()
+            if fragment.isValid():
+                char_format = fragment.charFormat()
+                if char_format.isImageFormat():
+                    for _ in range(fragment.text().count(OBJECT_REPLACEMENT)):
+                        image = self.image(char_format.toImageFormat(), width)
+                        if image is not None:
+                            pieces.append(parts)
+                            pieces.append(image)
+                            parts = []
+                else:
+                    index = fragment.charFormatIndex()
+                    markup = self.markup.get(index)
+                    if markup is None:
+                        markup = self.markup[index] = run_markup(char_format, self.defaultSize)
+                    opening, closing, size = markup
+                    largest = max(largest, size)
+                    parts.append(opening + run_text(fragment.text()) + closing)
+            it += 1
+        pieces.append(parts)
+
+        text_list = block.textList()
+        level = text_list.format().indent() if text_list is not None else 0
+        style = self.styles.get(block.blockFormat(), level, largest)
+        flowables = []
+        for number, piece in enumerate(pieces):
+            if isinstance(piece, Image):
+                flowables.append(piece)
+            elif piece:
+                bullet = list_bullet(block) if text_list is not None and not number else None
+                flowables.append(Paragraph(''.join(piece), style, bulletText=bullet))
+        if not flowables:
+            flowables.append(Spacer(1, style.leading))
+        return flowables
+
+    def image(self, image_format, width):
+        """An Image of a picture's original bytes, at its size in the document but no wider than width."""
+        name = image_format.name()
+        if name not in self.pictures:
+            found = image_bytes(self.document, name)
+            self.pictures[name] = found[0] if found else None
+        data = self.pictures[name]
+        if data is None:
+            return None
+        size = display_size(self.document, image_format)
+        scale = min(POINTS_PER_PIXEL, width / max(size.width(), 1))
+        return Image(io.BytesIO(data), size.width() * scale, size.height() * scale)
+
+    def table(self, table, width):
+        rows, columns = table.rows(), table.columns()
+        column_width = width / columns
+        inner = column_width - 2 * CELL_PADDING
+        cells = table_cells(table)
+        data = [[''] * columns for _ in range(rows)]
+        commands = [('GRID', (0, 0), (-1, -1), 0.5, 'black'), ('VALIGN', (0, 0), (-1, -1), 'TOP')]
+        for (row, column), items in cells.items():
+            cell = table.cellAt(row, column)
+            data[row][column] = self.frame(items, inner * cell.columnSpan())
+            if cell.rowSpan() > 1 or cell.columnSpan() > 1:
+                commands.append(('SPAN', (column, row), (column + cell.columnSpan() - 1, row + cell.rowSpan() - 1)))
+        return Table(data, colWidths=[column_width] * columns, style=TableStyle(commands))
+
+
+def export_to_pdf(text_edit, filename, progress=None):
+    """Write the document to a PDF with reportlab, one Paragraph per block.
+
+    Each fragment becomes a run of inline markup; the tags for a format are
+    built once per format index and paragraph styles once per distinct set
+    of block properties, so cost follows the number of fragments. Tables
+    become reportlab Tables and pictures Images of their original bytes.
+    """
+    document = text_edit if isinstance(text_edit, QTextDocument) else text_edit.document()
+    margin = PAGE_MARGIN * A4[0] / PAGE_WIDTH
+    builder = FlowableBuilder(document, progress)
+    flowables = builder.frame(frame_items(document.rootFrame()), A4[0] - 2 * margin)
+
+    report(progress, 80)
+    doc = SimpleDocTemplate(filename, pagesize=A4, leftMargin=margin, rightMargin=margin,
+                            topMargin=margin, bottomMargin=margin)
+    doc.build(flowables)
+    report(progress, 100)
+    return filename
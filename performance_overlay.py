@@ -0,0 +1,59 @@
+import time
+from PyQt5.QtCore import QTimer
+from PyQt5.QtWidgets import QLabel
+import instrumentation
+
+PROBE_INTERVAL = 50  # ms between event loop latency samples
+OVERLAY_INTERVAL = 250  # ms between refreshes
+
+
+class PerformanceOverlay(QLabel):
+    """Status-bar readout of frame time, relayout time and event loop latency.
+
+    Showing it starts a recording and hiding it stops one; the last
+    recording stays available for export.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.recorder = None
+        self.expected = 0.0
+        self.probe = QTimer(self)
+        self.probe.setSingleShot(True)
+        self.probe.timeout.connect(self.sampleLatency)
+        self.refreshTimer = QTimer(self)
+        self.refreshTimer.setInterval(OVERLAY_INTERVAL)
+        self.refreshTimer.timeout.connect(self.refresh)
+        self.hide()
+
+    def start(self):
+        self.recorder = instrumentation.enable()
+        self.scheduleProbe()
+        self.refreshTimer.start()
+        self.refresh()
+        self.show()
+
+    def stop(self):
+        instrumentation.disable()
+        self.probe.stop()
+        self.refreshTimer.stop()
+        self.hide()
+
+    def scheduleProbe(self):
+        self.expected = time.perf_counter() + PROBE_INTERVAL / 1000
+        self.probe.start(PROBE_INTERVAL)
+
+    def sampleLatency(self):
+        # How late the timer fired is how long the event loop was busy elsewhere
+        late = max((time.perf_counter() - self.expected) * 1000, 0.0)
+        self.recorder.counter('event loop latency ms', late)
+        self.recorder.latency = max(self.recorder.latency, late)
+        self.scheduleProbe()
+
+    def refresh(self):
+        recorder = self.recorder
+        frames = recorder.frames
+        frame = sum(frames) / len(frames) if frames else 0.0
+        relayout = recorder.latest.get('relayout', 0.0)
+        self.setText(f"frame {frame:.1f} ms | relayout {relayout:.1f} ms | latency {recorder.latency:.0f} ms")
+        recorder.latency = 0.0
@@ -0,0 +1,6056 @@
+# -*- coding: utf-8 -*-
+
+# Resource object code
+#
+# Created by: The Resource Compiler for PyQt5 (Qt v5.15.14)
+#
+# WARNING! All changes made in this file will be lost!
+
+from PyQt5 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x03\x43\
+\x00\
+\x00\x0d\x68\x78\x9c\xcd\x56\xdf\x6f\xd3\x30\x10\x7e\xef\x5f\x61\
+\x75\x2f\x80\x16\x2d\x1d\x14\xa6\x54\x3c\xb0\x5f\x12\xd2\x86\x28\
+\x9b\xc4\x03\xe2\xc1\x49\xdc\xc6\x5a\x62\x47\xb6\xb3\xae\x20\xfe\
+\x77\xee\x92\x38\x73\xd2\xa6\x3f\xb6\x09\x11\x4b\x6d\xea\xb3\xef\
+\xbe\xfb\xee\xf3\xb9\xd3\x6b\xca\xc5\x77\x2e\x62\xb9\x20\xbf\x07\
+\x04\x9e\x90\x46\x77\x73\x25\x0b\x11\x7b\x91\x4c\xa5\x0a\xc8\xc1\
+\xcc\xc7\x31\x19\xfc\x19\x0c\xa6\xb7\xec\xc1\x5c\xc4\xdc\x6c\x58\
+\x5d\x3e\x93\xca\x2c\x55\xcc\x60\x72\x94\x3f\x10\x2d\x53\x1e\x93\
+\x83\xd8\xc7\x51\x99\x67\x52\x18\x6f\x46\x33\x9e\x2e\x03\x32\xbc\
+\xe5\x19\xd3\xe4\x0b\x5b\x90\x6f\x32\xa3\x62\xe8\xac\xd1\xfc\x17\
+\x03\x2f\xc7\xb9\xa9\x50\x5c\x33\x51\x9c\x52\xb5\x01\xc4\x09\x0e\
+\x17\x84\x17\x4a\x63\x64\xd6\xc2\xc2\x7c\x1c\x2d\x97\x41\xc0\x0d\
+\xcb\x6a\xc7\x39\x8d\x63\x2e\xe6\xb0\xc7\x87\x4d\xf8\xb1\x66\x6d\
+\xa0\x59\xca\x22\xc3\xe2\x7e\x34\xdd\x38\xcf\x26\xcf\x3a\x5a\x8f\
+\x76\x0c\x1b\xde\x22\xe2\x71\x83\x1a\xed\x19\x17\xde\x82\xc7\x26\
+\x01\x97\x63\x9c\x25\x47\x6f\xc8\x85\xd0\x85\x02\xda\xc1\xc8\xb3\
+\x22\x23\xe5\x02\x20\x5d\x11\x03\x95\x26\x6f\x8e\x3a\xb1\xf6\xcc\
+\xf6\x56\xca\xf4\x05\x0b\xd5\x4a\xf3\xd8\x26\xa6\x73\x1a\x3d\xce\
+\x34\x61\x0b\x70\x23\x7a\x23\x1b\x45\x05\x6c\x54\x4c\x98\x3e\xba\
+\x57\x96\x34\xa1\x4f\x90\x3d\xa4\xef\xb3\x88\x14\xa3\x1a\xe8\xa8\
+\x6d\x25\x75\x29\x55\x73\xa6\x48\x94\xf2\xe8\x8e\x86\x29\x23\xe0\
+\x83\x22\x97\xeb\x04\x8d\x6e\xae\xaa\x0d\x68\x2a\x1d\x84\xcc\x18\
+\xf8\x0d\xbb\x62\x1a\xf2\x94\x9b\xa5\xdd\x5d\x73\xa4\x68\xcc\x0b\
+\xbd\x36\xe3\x20\x91\xf7\x6c\x03\xe3\x2e\x97\x6b\x24\x16\xf9\x38\
+\x56\x9c\xe6\x20\x12\xbd\xa9\xea\x8e\x34\x21\xa1\x4b\xa9\x32\x6a\
+\x0c\x12\x12\x96\x0e\x34\x31\x09\x35\x04\x26\xa3\x04\x5e\x59\x25\
+\x2f\x98\xc1\xf7\xa8\x50\x1a\xb2\x7e\xa5\x99\x21\xe1\x92\x60\xd8\
+\x90\xaa\x1b\x43\x0d\x7b\x8d\x89\x3b\x40\x7e\xd0\xc8\xf0\x7b\xf6\
+\x71\x68\x54\xc1\x86\x3f\x77\x53\x21\x7a\x2a\xf4\xce\x3a\xb4\x73\
+\x63\x1f\x47\xe5\xe2\x12\x4a\x73\x26\xb3\x50\x9e\xca\x87\x43\x32\
+\xb5\xaf\x4f\x3e\xc9\x96\xe6\xee\xc1\x9d\x3c\x51\x55\xce\xe1\x7e\
+\xcf\xb2\xca\x6f\xc2\xf8\x3c\x31\x41\xd9\x0b\x3a\x7e\x2b\x93\xab\
+\xb5\x42\x3b\x4a\xeb\x66\x1c\x04\xb1\x92\xb9\x07\xb7\x84\x70\x92\
+\x77\x66\x6b\x1e\x74\x11\x46\xb0\x4d\xc9\xd4\x93\x8a\xcf\xb9\x08\
+\x6c\x06\x93\xae\x3d\x97\x9a\x1b\x0e\xca\x22\x46\xe6\x44\x21\x9c\
+\x6a\x4d\x9d\xc5\xf1\x2a\xe8\xc7\x68\x95\xa6\x08\x9e\xa2\xce\xc1\
+\x48\xd9\xcc\x34\x5d\xce\x36\x08\xd7\x66\xeb\xe3\x16\xc0\xb5\x6b\
+\xb3\x4c\xe1\x68\x96\x65\xaa\x4a\xff\xb5\xd0\xc9\x96\x66\xd2\x5c\
+\x91\xfb\x54\x7b\xb4\x9a\xe1\x3f\x6a\x22\xee\x4d\xe0\xaf\xa2\x68\
+\xdf\x05\xb5\x1c\x1e\x59\xd8\xb5\xc1\x74\x76\xed\xd3\x41\xa6\xe7\
+\x9c\xa6\x72\xbe\xfd\xb8\xe2\xda\x2b\x2e\xd8\xb3\xfe\x92\xf4\x9e\
+\x45\x74\x4f\xa6\x37\x11\xe8\x15\x6f\xb1\x00\xd2\x36\x3c\xa2\x69\
+\x1d\xc9\x3e\xd6\xa5\x90\x82\x4d\xda\x96\x06\x0b\xa0\xb8\xf4\x71\
+\xb4\x17\xd8\x2a\xbc\xb3\x52\xb5\x4f\x06\xc5\xc4\xe3\x33\xc2\x3b\
+\xdc\xaf\xbf\x26\x6b\xc2\x36\x57\x81\xef\xba\x40\xe0\xf5\xe3\xe0\
+\x0f\x12\x2a\x62\x50\x77\x5f\x1e\xab\xcc\x9d\x9d\xe3\xe8\x40\x03\
+\xf5\xb4\x5a\xcb\x26\x54\x1f\xf6\x47\xd5\xd2\xd7\x06\x6c\x9f\x4e\
+\x70\x6c\xf5\x0e\x3d\xc7\x4b\x41\x22\xcf\xa9\x5e\x13\x73\x5d\x0d\
+\x2d\x17\xa3\x71\x97\x8b\xbe\x76\xd7\xbb\xca\x36\xcd\xaa\xfa\x5b\
+\x53\x03\xad\xfe\x57\xa9\x55\xff\xdc\x5e\x2a\xbb\x22\xf7\xa8\x52\
+\x72\xd1\x64\x77\xd8\x32\xe3\x45\xd0\x59\xd0\xab\x99\x2e\x05\x1b\
+\xf8\xcc\xe9\x9c\xf5\x44\x44\x25\xb5\xcc\xbb\xc7\xfb\x0b\x25\xa4\
+\x0e\x32\
+\x00\x00\x03\x4f\
+\x00\
+\x00\x0d\xeb\x78\x9c\xcd\x56\x5b\x6f\x9b\x30\x14\x7e\xcf\xaf\xb0\
+\xd2\x97\xad\x2a\x6a\x92\x36\xdd\x04\xda\x43\xbb\xae\x4f\xeb\xb4\
+\x6c\xd5\xfa\x30\xed\xc1\x80\x03\x56\xc1\x46\xb6\x69\x9a\x4d\xfb\
+\xef\x3b\x06\xcc\x2d\x40\x48\xb6\x87\xd9\x52\x82\xec\x73\xf9\xce\
+\x77\x2e\xb0\xba\xc7\x94\x3d\x52\xe6\xf3\x0d\xfa\x35\x41\xb0\x5c\
+\xec\x3d\x05\x82\xa7\xcc\xb7\x3c\x1e\x71\x61\xa3\x93\x8b\x6c\x39\
+\x08\x9d\x9f\xa2\x5b\x2c\x9e\x50\x20\xf0\xb6\x26\x88\x4e\xcf\x27\
+\xbf\x27\x93\xd5\x03\x79\x51\x1f\x7c\xaa\xfa\x2d\xcd\x89\xde\xb9\
+\xa5\x6f\x44\x6c\x91\x6f\xcc\x9d\x21\x1c\xc5\x5c\x2a\xe4\x46\xa0\
+\xa6\x2d\x66\x26\xb8\xf0\x09\x28\xce\x93\x17\x24\x79\x44\x7d\x74\
+\xb2\xcc\x56\x05\x86\x88\x42\x0a\xad\xb9\x40\x1e\x67\x4a\x60\x30\
+\x53\x18\x30\x8e\xd7\xd9\x72\x50\x7d\x81\x81\xc7\x90\x2a\x82\x14\
+\xe0\xce\xb4\x05\xc1\x3e\x76\x69\x44\xd5\xd6\x18\x58\x83\x41\x6b\
+\x8d\x63\x1a\x6d\x6d\x34\x7d\xa0\x31\x91\xe8\x13\xd9\xa0\x2f\x3c\
+\xc6\x6c\xea\x54\x32\x92\xfe\x24\x00\x74\x91\x28\x27\x23\xe3\x9e\
+\xb0\xf4\x06\x8b\x7e\x2e\x16\xae\xde\x35\x56\x6b\x84\x6a\x30\x31\
+\x18\x80\x33\xd1\xe4\xc2\x72\xb9\x52\x3c\x6e\x50\x72\x99\xad\x86\
+\x5b\xdb\x86\xc0\xe2\xc2\x79\x82\x7d\x9f\xb2\x00\x74\x66\xa0\xa4\
+\x7f\x9c\x6e\x72\x9a\x8c\x14\x59\x6d\x58\xb4\x25\x89\x88\xa7\x88\
+\xdf\x1f\x57\x91\xa0\x52\xf7\x78\x06\x7c\xc1\x13\x28\x4c\x26\x07\
+\xca\xa1\x1d\x7b\x77\xe0\x4b\x50\xb8\xd0\xc1\x2f\x1b\x04\xc4\x94\
+\x59\x1b\xea\xab\x10\x4c\x2e\x8f\xa0\xe5\x28\x4e\x1e\x38\x8f\xc6\
+\x14\xc6\xc8\xa4\x37\xe2\x5c\x98\x18\x64\x82\xbd\xea\xa4\x74\x9b\
+\x82\x19\xd6\xeb\x19\x3a\x87\x81\xa2\x20\x4c\x39\x3d\x7c\xef\x88\
+\x94\xae\xdf\x1a\xd7\x3b\xdd\x50\x8b\x43\x60\x9f\xa6\xb2\x86\x73\
+\x1c\xd7\x15\x76\x3b\xe4\xcf\x64\x80\x3b\x43\x74\x4f\xb5\x5c\x65\
+\xab\x4d\x88\x9d\x08\x22\xe5\x50\xfe\x6a\x7a\x00\xf0\x8e\x8b\x18\
+\x2b\x05\x61\x23\x37\x33\x20\x91\x0a\xb1\x42\x70\xe8\x85\xf0\x58\
+\x80\x87\x13\xfd\xec\xa5\x42\x42\x31\xbf\x92\x04\x86\xdb\x16\x69\
+\xb7\xd0\xd5\x5f\x15\x56\xe4\xb5\x0e\xb0\x06\xe4\x3b\xf6\x14\x7d\
+\x26\xef\xa6\x4a\xa4\x64\xfa\x63\x20\xcc\x99\xde\x79\x1c\xda\x52\
+\x2a\x47\x57\xd4\x38\xc6\xef\x20\x89\xef\x79\xec\xf2\x1b\xfe\x72\
+\x86\x56\xe6\xf1\x90\xa2\xed\x9a\xda\x3b\x5d\xb9\xd3\x87\x57\x24\
+\xce\xcf\x42\x42\x83\x50\xd9\x59\xdb\x1e\x8b\xdc\xb6\xf5\x08\xb1\
+\xf4\x0c\xa9\x05\x51\x3b\x2d\xe2\x91\xa9\x9b\xbd\x38\x78\x64\x71\
+\x41\x03\xca\x6c\x03\xd2\x69\xdf\x27\x5c\x52\x45\xa1\x66\x90\xe2\
+\x09\x12\x1a\x63\x2e\x53\xe0\x5f\x94\x70\x8b\x92\x8f\xc8\x5a\x95\
+\x43\xa6\xeb\xae\xbf\x74\xf3\x7b\xa9\xb6\x11\xf4\x52\x46\x64\x9e\
+\xf1\xcf\xa9\x0c\xf7\xb4\xf2\xc9\x05\xd6\xbb\x3e\x5b\x73\x85\x4a\
+\x74\x68\xaa\x76\xa6\xab\x9a\x9b\x9d\x2d\x5e\x1f\xa6\xb3\x03\x93\
+\x56\x45\x34\xb6\xc1\x5b\x5a\x87\x74\xf0\xea\x96\xe2\x88\x07\x7b\
+\xbf\x77\x32\xd9\x8f\x94\x91\x51\xdf\x34\xc7\x55\xfe\x28\x7a\xa0\
+\xc7\x3d\xa8\x3d\xfd\xd6\xb0\x81\x1c\x45\x3d\x1c\x15\x78\xcc\x32\
+\x8e\x19\x67\x05\x94\xf2\xa6\x44\xac\xbb\xf4\x5a\xef\xa6\x80\xc9\
+\xd9\xa5\xc1\x64\x56\x8c\x45\xd6\x0a\x73\xfd\xd2\x9c\x15\x7f\x4e\
+\x87\xdb\x72\xac\xcf\xea\x26\x00\xb8\x79\xac\xe1\xb7\x43\xcc\x7c\
+\xa8\xe7\xbe\x38\x3a\x32\x7e\xad\x77\x0b\x1a\xd4\xda\xee\x80\xe8\
+\x41\xf5\xe6\x70\x54\x8d\x2a\x1c\xc0\x76\x75\xad\xf7\x5e\xeb\x30\
+\x3f\xac\x08\x0a\xe9\x6f\xb2\x57\x4d\xda\x8e\x1c\x1a\x2e\xe6\xcb\
+\x36\x17\x7d\xa3\xab\x57\xca\x0c\xc0\x3c\xfb\x7b\x43\x83\x8a\xfe\
+\xaf\x42\xcb\xbf\x94\xfe\x55\x74\x69\x62\x61\x21\xf8\xa6\x8c\xee\
+\xac\x71\xad\x5f\x21\x2d\x81\xde\x9a\x69\x53\x30\xc0\x67\x82\x03\
+\xd2\xe3\x51\x57\x52\xe3\x7a\xbc\xbf\x3f\xaa\x50\x1a\xb2\
+\x00\x00\x08\xab\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x60\x00\x00\x00\x60\x08\x06\x00\x00\x00\xe2\x98\x77\x38\
+\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x08\
+\x65\x49\x44\x41\x54\x78\x5e\xed\x9d\x69\x8c\x14\x45\x14\xc7\x7f\
+\x3d\x80\x4a\xf7\x2c\x62\x8c\x51\x41\x03\x18\xa3\x22\x12\x15\xd4\
+\x78\xc5\x28\xe0\x8d\x1a\x34\x59\x89\x17\x1e\x40\xa2\xa8\x9f\x8c\
+\xb7\xf1\x16\x35\x7e\x43\xf9\xe0\x8d\x8a\x21\x59\x6f\x45\x8d\x0a\
+\x31\xc6\x2b\xe2\x81\x01\x85\xa0\x11\x11\xc1\x78\x45\x60\xa7\x67\
+\x55\x96\x69\xf7\xf5\xf4\x72\xee\x76\xd7\x54\x57\x4f\xcf\xb8\x55\
+\xc9\x24\x24\xfb\xea\x55\xd5\xff\xd7\xd5\xc7\xab\x57\x85\x83\x2d\
+\xb9\x2a\xe0\xe4\xda\xba\x6d\x1c\x0b\x20\xe7\x8b\xc0\x02\xb0\x00\
+\x72\x56\x20\xe7\xe6\xed\x0c\xb0\x00\x72\x56\x20\xe7\xe6\xed\x0c\
+\xb0\x00\x72\x56\x20\xe7\xe6\xed\x0c\xb0\x00\x72\x56\x20\xe7\xe6\
+\xed\x0c\xe8\xbb\x00\x3a\x86\x41\xe5\x30\xa8\x0c\x81\xc2\xde\xc0\
+\x10\x60\x9f\xea\x2f\xd8\xb7\xaa\x8b\xb3\x1a\xf8\x39\xfa\xad\x85\
+\xca\x2f\x50\x58\x0b\x85\xc5\x30\x70\x55\xce\xda\x19\x69\x3e\x87\
+\x19\xd0\x3e\x0e\x0a\x93\x21\x98\x0c\x4e\x8b\xde\x28\x82\x76\x70\
+\xe6\x41\x65\x1e\xb4\x2c\xd4\xf3\xd1\x18\xb5\xea\x04\x20\x68\x81\
+\xb2\x08\x2e\xc2\x8f\x33\x3b\x74\x67\x21\x04\xf3\xc0\x9d\x07\x4e\
+\xbb\x59\xdf\xd9\x7b\xab\x03\x00\xff\x2a\xe0\x7a\x60\x58\xc6\xc3\
+\x91\x5b\xd2\x83\xe0\xcd\xce\xb8\x1d\xa3\xee\x33\x06\xe0\x3f\x01\
+\x5c\x6e\xb4\xc7\xc9\xce\x9e\x04\xef\x8a\x64\xb3\xc6\xb0\xc8\x08\
+\x80\x2f\x0f\xd5\xb7\x80\x43\x73\x1a\xe6\xd7\xc0\xe9\xe0\xfd\x92\
+\x53\xfb\xca\xcd\x66\x00\xc0\x9f\x08\xbc\xae\xdc\x83\x6c\x0d\xcf\
+\x02\xef\x8d\x6c\x9b\x48\xe7\xdd\x30\x80\xf6\x3b\xa0\x70\x7b\xba\
+\x2e\x99\xae\x5d\xb9\x13\x5a\xee\x30\xed\xd5\x94\x3f\x83\x00\xfc\
+\xc3\x81\x2f\x35\x3a\xb6\x08\x82\x97\x81\x35\xd5\xdf\x80\x35\xb0\
+\x93\xfc\x1b\xf8\x77\x28\x6c\x1c\x0a\x44\x3f\x67\x12\x70\xa4\x46\
+\x1b\x63\xc0\xfb\x4a\xa3\x5e\xe6\x55\x0c\x01\x08\x06\x43\xf9\x2f\
+\xf5\xde\x3a\x3e\x04\x4f\x41\xe7\x5c\xd8\xf5\x53\xf5\x7a\x62\xb9\
+\xfe\x68\xe8\x7f\x21\x38\x97\x41\xe0\xa9\xd7\x75\x77\x03\x67\x9d\
+\xba\x7d\x7d\x2c\x0d\x01\xf0\xe7\x03\x67\x28\x76\x79\x0e\x38\xb7\
+\x81\x2b\x5f\xb9\x29\x4a\x79\x5f\x08\xee\x06\xa6\x28\x3a\x79\x13\
+\xbc\x33\x15\x6d\xeb\x66\x66\x00\x40\xfb\x3d\x50\xb8\x45\xad\xc7\
+\xce\x03\xe0\xde\xa8\x66\xab\x6a\x55\xbe\x1f\x82\x1b\xd4\xac\x2b\
+\xf7\x42\xcb\xad\x6a\xb6\xf5\xb1\x4a\x09\xc0\x97\xf7\xed\xc7\x15\
+\xbb\x7a\x0e\x78\xaf\x29\xda\xd6\x68\xe6\x9f\x0d\xbc\xaa\x58\x69\
+\x2a\x78\xf2\x7d\xd2\x10\x25\x05\x80\x30\xbc\xb0\x44\xed\x0b\xd7\
+\x4b\xd1\x4e\x2d\x3a\xf9\x81\x82\xf5\x2a\x70\x47\x37\x4a\xd8\x22\
+\x85\x30\xfe\xb4\xae\x08\xe6\xa3\x0a\x03\x1e\x0b\x9e\xce\xdb\x91\
+\x82\xeb\xed\x4d\xfc\x31\xc0\x17\x0a\x15\xa7\x83\xf7\x98\x82\x5d\
+\xe6\x26\x29\x00\x94\x17\x28\x04\xd6\xa6\x81\xa7\x7a\x8b\x32\x34\
+\x58\x7f\x6a\xd7\x6b\x6b\x82\xb8\x12\xc0\x73\xc7\x1b\x6a\x30\x95\
+\x1b\x4d\x00\x61\x48\x79\x41\x42\xcb\xb3\xc1\x9b\x91\xaa\x77\xda\
+\x95\xfd\x47\x00\x09\x02\xc6\x94\xca\xf8\x46\x08\x65\x6b\x02\xf0\
+\xe5\xd6\x23\xb7\xa0\xde\x4a\x07\x6c\x1c\x05\x83\x57\x6a\x6b\x98\
+\xaa\xe2\xba\x11\x30\xe0\x1b\x60\x60\x8c\x9b\xc7\xc0\x9b\x9e\xaa\
+\x19\x03\x95\x35\x00\xc8\x4a\xd6\xa6\x25\xf1\x8b\x29\xce\x73\xe0\
+\x5e\x6c\xa0\x7f\x29\x5c\x94\x9f\x85\xe0\xa2\xde\x1d\xc8\xa2\x4e\
+\xbf\xd1\x79\xaf\xac\x69\x00\xd8\x30\x09\xfa\xbd\x14\xaf\x4c\x70\
+\x32\x14\xdf\x4b\xa1\x9e\x81\xaa\xa5\x09\xe0\xbc\x1b\xef\x68\xd3\
+\xb9\x30\x48\xc2\x20\xb9\x15\x0d\x00\xbe\xdc\xd7\x1f\x8e\xb9\xb2\
+\x96\x42\x71\x74\x6e\x23\xda\xa6\xe1\x92\xcc\xd4\x43\x62\xfa\x72\
+\x35\x78\xf2\xbc\xc8\xad\xe8\x00\xb8\x0f\xb8\x29\x06\xc0\xcd\x50\
+\x9c\x99\xdb\x88\xb6\x05\x70\x13\x38\xd2\xdf\xde\xca\x4c\xf0\x6e\
+\xce\xb3\xaf\x3a\x00\xe6\x00\x97\xc4\x00\x98\x02\xc5\x67\xf2\x1c\
+\xd4\x96\xb6\x4b\x97\x80\x23\xfd\xed\xad\x3c\x03\x9e\x6a\x2c\x29\
+\x93\x21\x69\x00\x28\xbf\x07\x41\xcc\x3b\x74\x30\x01\x8a\x49\xaf\
+\xa8\x99\x0c\x66\x47\xa7\xa5\xf1\xe0\xc4\x3c\x8b\x9c\x05\xe0\x4e\
+\xa8\x53\x67\x7a\x6c\x46\x03\x40\x69\x59\x57\x4a\xc8\x41\xbd\x77\
+\xba\xff\x48\xd8\x79\x79\x9e\x83\xda\xd2\xf6\x3f\x07\x41\xe7\xb2\
+\x98\xd9\xba\x1c\x8a\x23\xf3\xec\xab\x0e\x80\x0d\xf1\xaf\xa0\xee\
+\xa0\x46\x89\xb3\x40\x18\xaf\xda\x10\x03\xa0\x1d\x8a\x83\x9a\x0d\
+\xc0\x7a\x70\x62\x3a\xdd\x4c\x00\x9c\xbf\xc1\x8d\xfb\x58\xcb\x9c\
+\x8d\xc6\x0c\xf0\x97\x02\xa3\xfe\x1f\xb7\x20\x7e\x05\x6f\xaf\xcc\
+\x55\x8e\x69\x40\x07\xc0\xdb\xc0\xa9\x31\xd3\xba\x99\x1e\xc2\x2b\
+\xc0\x3d\xb0\xd9\x00\x48\x74\x33\x26\xf1\x29\x68\xa2\xd7\x50\x67\
+\x11\xb8\x47\x35\x1b\x80\xbb\x80\xdb\x62\x66\x40\x33\x7d\x88\xb5\
+\x81\xd7\xda\x64\x00\xda\xaf\x84\x42\x5c\xfe\xe5\x22\xf0\x72\xbd\
+\xaa\xb6\x08\xea\x7f\x16\x9f\xc6\xe2\xb4\x82\xdb\xd6\x64\x00\xfc\
+\x73\x80\x57\xe2\x3b\xdd\x79\x4c\xed\xe9\x26\xa6\x65\x08\xd3\x57\
+\x3e\x89\xf7\xba\x69\x0f\x18\xf4\x87\xe9\x96\x6b\xf1\xa7\xf1\x10\
+\x56\x09\x47\x4b\xb0\xce\xbb\xa6\x96\x8e\x98\xb7\xf5\x67\x01\x57\
+\xc7\xf8\x7d\xad\x2b\x59\x4b\x2e\xa6\x5c\x8b\x06\x00\xe9\x6f\xd2\
+\x82\x8c\x24\x5e\x31\x32\x7d\xee\x8f\xae\x36\x92\x33\xc4\xb2\x84\
+\xc4\xad\x19\x8d\x90\xca\xae\x09\x40\x69\x49\x72\x0e\x78\x97\xea\
+\x4a\x98\xae\x9e\xff\x74\x42\xc2\xd6\xef\x50\x19\x05\x2d\xbf\xa7\
+\x6b\x27\x7d\x6d\x4d\x00\xd2\xb0\xca\xa2\x7c\x16\x89\x58\x49\x83\
+\x56\x4a\xd4\xca\x71\xbd\x7a\xdb\xfe\xa7\x00\xa0\x9c\x96\x92\x61\
+\x42\xd6\xf6\x30\x54\x13\xb4\x2a\x27\x41\xcb\xfb\x49\x28\xeb\xf1\
+\xf7\x14\x00\x9a\x36\x31\xab\x21\x16\xe3\xbb\xe1\xa6\x00\x10\x3e\
+\x8c\x25\xf5\x43\x75\x49\x2f\xc3\x04\x2d\xe5\x84\xac\xaf\xc1\x99\
+\x08\xae\x6c\x7d\x6d\x88\x92\x12\x40\x08\xa1\x96\x7d\x60\x19\x24\
+\x6a\xa9\x24\x62\x6d\xbe\xde\x72\xff\xf0\xda\x9e\xba\x01\x00\x21\
+\x84\xc5\x35\xec\x07\x9b\x0d\x1b\x1f\x4a\x9f\x33\x14\xe6\xfe\x5c\
+\x97\x9c\x80\xb5\x79\xc8\xdf\x42\xa5\x15\x5a\x24\x5f\xa8\x61\x8a\
+\x29\x00\xb2\x29\x6f\x6d\x0d\xa3\xea\x00\xe7\x45\xa8\xcc\xa9\x3d\
+\x7d\x45\xd2\x4d\x0a\x53\x20\x38\x2f\x21\xf1\xaa\x87\xee\x04\xb2\
+\x52\xd7\x0a\x45\x49\x2a\x6e\x88\x62\x08\x40\x38\x0b\x34\x37\xe7\
+\x05\xb2\xbe\xf0\xbc\xda\x16\x25\x2e\x48\x48\x33\x51\x10\x35\x58\
+\x11\x41\x90\x9d\x94\xb9\x17\x83\x00\x64\x2c\x8d\xb8\x49\xaf\x47\
+\x8d\xbf\xaf\x42\xc8\x7f\xdf\x98\x61\x00\xe1\x4c\xd0\xdd\xac\x57\
+\xef\xab\xf1\x87\x08\x82\x4a\x3a\x7b\x66\x7d\xcb\x00\x80\xf4\x35\
+\xdc\xb4\x37\xb7\x86\x7d\x63\xa6\x07\xf8\x2d\x70\x70\xb2\x53\x67\
+\x25\x04\x32\x13\x3e\x4f\xb6\xcd\xc6\x22\x23\x00\xdd\x9d\xad\x65\
+\xff\x98\x91\x01\x7e\x03\xc1\x4c\x08\x16\x77\x3d\x2b\x5e\x88\x4f\
+\x9f\xd9\xfc\x6a\x2a\x67\x4c\xc8\xeb\xa9\xac\x1d\xd4\xbd\x64\x0c\
+\x20\xbc\x25\xc9\xf2\xa5\xac\xa0\x65\x7d\x58\xc7\xd3\x50\xb8\x13\
+\x06\xfe\x58\x55\xb1\x24\xf9\xa9\x02\xe1\x00\x05\x55\x57\x43\xb8\
+\x38\x53\xe3\x96\x59\x05\xcf\x09\x26\x75\x00\x10\xde\x92\xb2\x3a\
+\xae\x46\xa2\x99\x6d\x5d\x91\xcd\xb6\x9e\x63\x3b\xa5\x43\xab\x33\
+\x81\xfd\x15\xa4\x5a\x13\x41\xf8\x58\xc1\xd6\x98\x49\x9d\x00\x6c\
+\xdd\x5f\x13\x07\x36\x85\x07\x81\xbc\x11\x09\x9f\x10\x52\x0e\x5f\
+\x0a\x04\xc2\x7e\x0a\xaa\xc9\x89\x5c\xad\x30\xf0\x43\x05\x5b\x23\
+\x26\x39\x00\xe8\xee\xb7\xac\xac\x6d\x1c\x03\xfd\xe4\xa8\xb2\xee\
+\xa3\x08\x86\x42\x25\xfa\x77\x61\x00\x04\x92\x04\xb6\x5e\xb6\xc7\
+\x77\x1d\x7b\xf3\x13\x38\xf3\x61\x97\xf9\xe0\xfc\x56\xdb\xe8\xfd\
+\xb1\xe0\xb4\x41\x30\x42\xa1\xde\xaf\x11\x84\x0f\x14\x6c\x53\x9b\
+\xe4\x08\x20\x75\xdf\x6b\x74\xe0\x1f\x51\xbd\x1d\x05\x2a\xcf\x22\
+\x59\xb0\x91\xb0\x45\xe6\x21\xeb\x3e\x04\x40\x78\x95\x8f\x82\x40\
+\x6e\x47\xd1\xa1\x80\x71\x0c\x83\x3f\xab\xaf\xa8\xd9\x9e\x49\xd7\
+\xc7\x00\x84\x10\x8e\x8e\x20\xc8\xad\x2e\xa1\x04\x72\x00\x89\xc4\
+\x8e\x32\xdb\x6e\xd5\x07\x01\x84\x10\x8e\x8d\x20\x48\x10\x31\xa9\
+\xac\x83\xe0\x7c\x28\xbe\x93\x64\xa8\xf3\xf7\x3e\x0a\x40\xa4\xea\
+\x38\x1e\x2a\x72\x3b\xda\x53\x41\xb8\x0d\x11\x04\xc9\x8b\x35\x5a\
+\xfa\x30\x80\x10\xc2\x09\x11\x84\x3d\x92\x55\x75\x4a\x55\x08\xde\
+\x9b\xc9\xb6\xea\x16\x7d\x1c\x80\x08\xd5\x7e\x62\x14\xb6\xd8\x5d\
+\x41\xb6\x72\x57\xbe\x91\x40\x30\x76\x0e\x9d\x05\x10\xaa\x2e\x1f\
+\x87\x61\xec\x68\x37\x05\x08\x7f\x47\x51\x54\x23\x07\x13\x5a\x00\
+\x9b\x15\x0f\x37\x76\x4b\xa2\xee\x60\x05\x08\xff\x46\x10\x54\xcf\
+\x28\xea\xd5\xa5\x05\xb0\x8d\x34\xa5\x53\x22\x08\x2a\xfb\xc6\x3a\
+\xa3\xd8\x51\xaa\x9d\xf6\x16\xc0\x0e\xd7\x66\xe9\x34\x28\x48\xd8\
+\xa2\xa8\x30\x13\x2a\x11\x84\x17\x15\x6c\x7b\x34\xb1\x00\x7a\x94\
+\xc5\x97\x03\x08\xe5\x76\xe4\x2a\x0a\xab\x9d\xfd\x67\x01\xf4\xaa\
+\x70\x98\x64\x20\x10\x76\x51\x80\xf0\x11\x78\xc7\x2b\xd8\xed\x60\
+\x62\x01\xc4\xaa\xe6\x9f\x15\x85\xb2\x77\x4a\x16\xb7\x30\x62\xcb\
+\x62\x50\xb2\x75\xb7\x85\x05\x90\xa8\x55\xb8\x23\x48\xbe\x98\xfb\
+\xc7\x9b\xea\x25\xfc\x5a\x00\x89\x00\xc4\xa0\x3c\x29\x8a\x1d\x15\
+\x62\xcc\x87\xe8\x9c\xd6\x6e\x01\x28\x01\x08\x21\x9c\x17\x41\xe8\
+\xa1\x86\xf3\x3e\xb8\x27\x29\xbb\xda\xca\xd0\x02\xa8\x49\xb5\x70\
+\xff\x81\xfc\x6f\x20\xc7\x6d\x55\x6d\x16\x78\xd7\xd6\xe4\xc6\x02\
+\xd0\x95\xab\xbb\x5e\xc7\x70\xe8\x1c\x0e\xfd\xbe\x03\x37\x3a\xe9\
+\x5d\xcf\xa7\x9d\x01\x7a\xba\x19\xab\x65\x01\x18\x93\x52\xcf\x91\
+\x05\xa0\xa7\x9b\xb1\x5a\x16\x80\x31\x29\xf5\x1c\x59\x00\x7a\xba\
+\x19\xab\x65\x01\x18\x93\x52\xcf\x91\x05\xa0\xa7\x9b\xb1\x5a\x16\
+\x80\x31\x29\xf5\x1c\x59\x00\x7a\xba\x19\xab\x65\x01\x18\x93\x52\
+\xcf\x91\x05\xa0\xa7\x9b\xb1\x5a\x16\x80\x31\x29\xf5\x1c\x59\x00\
+\x7a\xba\x19\xab\xf5\x1f\x31\x16\xea\x70\x56\x61\x84\xa6\x00\x00\
+\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x04\x6b\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x60\x00\x00\x00\x60\x08\x06\x00\x00\x00\xe2\x98\x77\x38\
+\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x04\
+\x25\x49\x44\x41\x54\x78\x5e\xed\x9c\xbb\xaf\x4d\x41\x14\x87\xbf\
+\xfb\x47\x78\x25\x3a\x12\x41\x21\x6a\x22\x51\x90\x68\xa8\x88\x20\
+\x51\x88\x4a\xd0\x08\x25\x4a\x54\x14\x2a\x51\xd1\xd0\x78\x24\x44\
+\x77\x1b\x95\x44\x42\x42\x48\x74\x12\x21\x14\xa2\xd1\x61\x8f\x9c\
+\xc2\xe3\x9e\x3d\x6b\xcd\xcc\x9a\x75\xef\xb9\x6b\x92\x13\x85\xf5\
+\xfc\x7d\x7b\xf6\xdd\x67\x66\x9f\x99\x23\x86\xab\x02\x73\xae\xd9\
+\x23\x39\x01\xc0\xf9\x22\x08\x00\x01\xc0\x59\x01\xe7\xf4\x31\x03\
+\x02\x80\xb3\x02\xce\xe9\x63\x06\x04\x00\x67\x05\x9c\xd3\xc7\x0c\
+\x08\x00\xce\x0a\x38\xa7\x8f\x19\xb0\x0c\x01\x6c\x03\x0e\x01\x9b\
+\x80\xcd\xc0\x0a\x67\x0d\x3e\x01\x2f\x80\xb7\xc0\xe3\xc9\xa7\x5b\
+\x49\xbd\x67\xc0\x29\xe0\x6a\xb7\xee\xca\x12\xdd\x06\x8e\x94\xb9\
+\xea\xbd\x7a\x02\xf8\xa9\x2f\xcf\xd5\xa3\x8b\x36\x5d\x92\x00\xb7\
+\x80\xc3\xae\x72\xea\x93\x9f\x06\xae\xe9\xdd\x74\x1e\x3d\x00\xec\
+\x01\x1e\xe9\xca\x5a\x34\xd6\xdb\x81\xa7\x96\xd5\xf4\x00\x90\xae\
+\xa2\x93\x96\x4d\x18\xc6\xbe\x0e\x9c\x30\x8c\xdf\x65\x3f\xe0\x09\
+\xb0\xdb\xb2\x09\xc3\xd8\xf3\xc0\x4e\xc3\xf8\x5d\x00\x7c\x04\x56\
+\x59\x36\x61\x18\xfb\x33\xb0\xd2\x30\x7e\x17\x00\x4b\xed\xe9\xe7\
+\x5f\xbd\x4d\x6f\xd3\xa6\xc1\x27\x9d\x04\x80\x91\x29\x14\x00\xf2\
+\xf7\x17\x53\x8d\x4c\x83\xc7\x0c\x70\xa6\x1b\x00\x02\x40\x5e\x81\
+\xbc\x85\xe9\x5d\xc2\x34\x78\xcc\x00\x67\xba\x01\x60\x71\x00\xc8\
+\x57\xb1\x8c\x2d\x7a\xdc\x82\x96\xb1\xbc\xf9\xd6\x03\x40\x5e\x23\
+\x53\x8b\x00\x60\x2a\x6f\x3e\x78\x2d\x80\x5d\xc0\xc6\xc9\xfe\x6e\
+\xfa\x37\x7d\xbc\xf7\x78\xf3\x5d\xd7\x59\xa4\x05\xba\x57\xc0\xeb\
+\x61\xeb\xf2\xdd\xe4\xf3\xb0\x34\x64\x0d\x80\x0b\xc0\xf9\xd2\xc4\
+\x33\xe6\x77\x0f\x38\x0a\x7c\xd3\xf6\x55\x02\x60\xdd\xf0\x36\xc3\
+\x5d\x60\xab\x36\xd9\x8c\xdb\x7f\x05\x0e\x02\x69\xff\x43\x3c\xb4\
+\x00\xe2\xaa\xcf\x4b\x7b\x71\x30\x49\x3a\x89\x86\x06\x40\xba\xe2\
+\x9f\x8b\xa2\x86\xd1\x16\xe0\xa5\x44\x06\x0d\x80\x37\xc0\x06\x49\
+\xd0\xb0\xe1\xc3\xf0\x26\xc8\x7a\xe0\x7b\x4e\x0b\x29\x80\x4b\xc0\
+\xd9\x5c\xb0\xf8\xff\xbf\x14\xb8\x01\x1c\xcf\x69\x22\x01\x90\xf6\
+\x73\xd3\xbe\x6e\x0c\xbd\x02\xfb\x80\x07\x63\x6e\x12\x00\xe9\x8d\
+\x06\xd5\x5f\x76\x7d\x9d\x33\xeb\x71\x0e\xb8\x5c\x0b\xe0\x0c\x70\
+\x65\x66\x25\xb2\x6d\xec\x26\x70\xac\x16\xc0\x9d\xe1\x9b\xdf\x7e\
+\xdb\x3a\x17\x65\xf4\x74\xfb\x78\x06\xfc\x00\x76\x0c\xdf\xf6\x93\
+\x0e\xda\x91\xde\xaa\x4b\x6f\xd7\x4d\x1d\x92\x5b\xd0\x7b\x60\xad\
+\x36\xf3\x12\xb7\x9f\xa6\x8b\xf6\x0d\x8f\x2f\xb9\xa5\x19\x09\x00\
+\x6d\xd2\x25\xae\x3d\x07\x26\xdf\xf4\x17\xea\x63\xef\xb0\x02\x70\
+\x5f\xd9\xe0\xa8\xc6\x01\xe0\x7f\x35\x57\x03\xe9\x47\x1b\x0b\x8d\
+\x35\xf0\xfb\x19\x5f\x33\x02\x80\x46\x2d\x20\x00\x28\x05\x6b\x6d\
+\x1e\xb7\xa0\xd6\x8a\x16\xc4\x6b\xf5\x47\x38\xa5\x8e\x5b\x50\x01\
+\x80\xe4\xd2\xe2\x31\x34\x00\x14\x8a\xdf\xd2\x2d\x66\x40\x4b\x35\
+\x0b\x62\x05\x80\x02\xd1\x5a\xba\x04\x80\x96\x6a\x16\xc4\x0a\x00\
+\x05\xa2\xb5\x74\x09\x00\x2d\xd5\x2c\x88\x15\x00\x0a\x44\x6b\xe9\
+\x12\x00\x5a\xaa\x59\x10\x2b\x00\x14\x88\xd6\xd2\x25\x00\xb4\x54\
+\xb3\x20\x56\x35\x00\xeb\x1f\x5a\x4b\x96\xc4\x0b\xfa\x16\xbb\x58\
+\xee\x77\x64\x7f\xe8\x2d\x69\xde\xfa\xa8\x01\x49\x0d\x62\x35\x0b\
+\x0c\x2d\x01\x64\x8f\x3a\x90\x34\x6f\x7d\xd8\x86\xa4\x86\x02\x5d\
+\xc5\x2e\x96\x00\xb2\x87\x7d\x48\x9a\xb7\x3e\x6e\x46\x52\x83\x58\
+\xcd\x02\x43\x4b\x00\xd9\xe3\x6e\xa4\xcd\x5b\x1e\xb8\x24\xad\xa1\
+\x40\x5b\x91\x8b\x15\x00\xd1\x81\x4f\x9a\xe6\xad\x0a\xd5\xd4\x20\
+\x52\x54\x69\xe4\xda\x97\xb6\x79\x8b\x43\xf7\xb4\x35\x28\xf5\xcd\
+\x9a\xb7\x06\xa0\x3a\xf4\xaf\xa4\xf9\xd6\xc7\x4e\x96\xd4\x90\x55\
+\x55\x61\x50\x0b\xa0\xea\xd8\xcb\x1e\xcd\xe7\x1a\xec\x51\xc3\x18\
+\x0f\xd7\xfa\x7a\x34\xef\xda\xa0\x60\x26\xb8\xd6\x17\x00\x20\x00\
+\x08\xae\x52\x4b\x93\x00\x60\xa9\xae\x20\x76\x00\x10\x88\x64\x69\
+\x12\x00\x2c\xd5\x15\xc4\x0e\x00\x02\x91\x2c\x4d\x66\x1e\x80\xf5\
+\x7e\x82\x25\x9c\xec\x7a\x7e\x6d\xf2\x1e\x8f\xa1\xd6\xfb\x09\xb5\
+\x1a\x8c\xf9\x67\xd7\xf3\x6b\x93\xf7\x00\x60\xbd\x9f\x50\xab\xc1\
+\x98\x7f\x76\x3d\xbf\x36\x79\x0f\x00\xd6\xfb\x09\xb5\x1a\x8c\xf9\
+\x67\xd7\xf3\x6b\x93\xf7\x00\x90\x6a\xb4\xdc\x4f\xa8\xd5\x60\x9a\
+\xbf\x68\x3d\xbf\x36\x79\x2f\x00\xa9\xce\xdc\xd3\x46\x6d\x2f\xad\
+\xfd\xbb\x68\xd3\x25\xc9\x1f\xca\x58\xec\x27\xb4\x16\x5e\xb5\x9e\
+\x5f\x9b\xbc\x37\x80\x54\x6f\xeb\xfd\x84\x5a\x0d\xaa\xd6\xf3\x6b\
+\x93\x7b\x00\xa8\xad\x79\xa6\xfc\x03\x80\x33\xce\x00\x10\x00\x9c\
+\x15\x70\x4e\x1f\x33\x20\x00\x38\x2b\xe0\x9c\x3e\x66\x40\x00\x70\
+\x56\xc0\x39\x7d\xcc\x80\x00\xe0\xac\x80\x73\xfa\x98\x01\x01\xc0\
+\x59\x01\xe7\xf4\xbf\x00\x62\x4c\x95\x61\x84\x73\x2d\xf3\x00\x00\
+\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x08\x60\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x60\x00\x00\x00\x60\x08\x06\x00\x00\x00\xe2\x98\x77\x38\
+\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x08\
+\x1a\x49\x44\x41\x54\x78\x5e\xed\x9c\x7f\x8c\x1c\x65\x19\xc7\xbf\
+\xcf\xec\x61\xa9\x41\xa2\x20\x12\x81\xe2\xaf\x12\xc8\xa1\xdd\x19\
+\x9b\x22\x12\x45\xaa\xed\xed\x6c\x5b\xd3\x90\x48\x73\x82\x3f\x22\
+\x18\xb1\x96\x9d\x6d\x6d\xb5\x7f\x14\xb0\x20\x26\x24\xa0\xbd\x99\
+\x2d\x8a\x8a\x89\x47\x2b\x60\x31\x91\x80\xbd\xdd\x6d\xef\x34\x26\
+\x48\x55\x6c\xf7\xbd\x46\x7e\x48\x42\x82\x92\x18\x8b\xbd\x40\x24\
+\xb6\xb4\xde\xee\xa3\x73\xed\x69\xbd\xf4\xca\xbe\xef\xcc\xfb\xbe\
+\x73\xc7\x6c\xd2\xa4\xc9\x3d\xcf\xf3\xfd\x3e\xcf\x67\xdf\xd9\x99\
+\x77\x66\x97\x90\xbf\xac\x4e\x80\xac\xaa\xe7\xe2\xc8\x01\x58\x7e\
+\x13\xe4\x00\x72\x00\x96\x27\x60\x59\x3e\x5f\x01\x39\x00\xcb\x13\
+\xb0\x2c\x9f\xaf\x80\x1c\x80\xe5\x09\x58\x96\xcf\x57\x40\x0e\xc0\
+\xf2\x04\x2c\xcb\xe7\x2b\x20\x07\x70\xea\x09\x34\xef\x59\x34\xaf\
+\xd3\x39\xda\x4b\x1d\x2a\x32\xd8\x23\xa2\xd3\x99\xf9\x45\x72\xe8\
+\xb7\x7e\x45\x3c\x60\x79\x7e\x89\xe5\x33\xb7\x02\x76\x0e\x78\x57\
+\xf6\x38\xbc\x82\x81\x5e\x80\x17\x00\x34\x6f\xba\x2e\x89\xf1\xb5\
+\x52\x55\xdc\x9d\x78\x0a\x16\x0b\x64\x02\xc0\x8e\xef\x7c\x78\xee\
+\x99\x85\x43\xfd\x4c\xd4\x4f\x40\x9f\xcc\x3c\x7a\x40\x97\x2e\x09\
+\x5a\x4f\xcb\xe4\x64\x29\xd6\x2a\x80\x66\xb8\xe0\xfd\xec\x38\xfd\
+\x60\xf4\x03\x78\x9f\xca\x60\x88\xe8\x8b\xa5\x4a\xeb\x47\x2a\xb9\
+\x59\xc8\xb1\x02\x60\xe2\x1d\x7f\xda\xe1\x4d\x60\x6c\x4a\x3a\x04\
+\x26\xac\x2a\x57\xc4\xc3\x49\xeb\xd8\xca\x37\x0e\xa0\x11\xba\x2b\
+\x41\x13\x83\x5f\x94\x46\xd3\x73\xe6\x14\xce\x59\x7c\xe3\xde\x83\
+\x69\xd4\xb2\x51\xc3\x18\x80\x5d\x35\xef\x3c\x06\x6f\x62\xc6\x57\
+\x52\x6b\x94\xf0\x0b\xbf\x22\x3e\x99\x5a\x3d\x0b\x85\x8c\x00\x68\
+\x86\x5e\x3f\x13\xdf\xa1\x7a\x9c\x9f\x6e\x2e\x33\xfd\xf0\x13\xf7\
+\xa5\x1d\x40\x23\x74\xd7\x80\xb0\x35\xf5\x37\x17\x61\x8f\x5f\x11\
+\x57\xa4\x5e\xd7\x70\x41\xad\x00\x1a\x35\xef\x16\x30\xdf\xae\xa5\
+\x27\xa6\xd5\x7e\xb5\x75\xaf\x96\xda\x06\x8b\x6a\x03\x50\x0f\xdd\
+\xcd\x44\xf8\x86\xa6\x5e\x9e\x3b\x73\x7c\xae\x7b\xc5\x57\xf7\x1c\
+\xd6\x54\xdf\x58\x59\x2d\x00\x34\x0f\x1f\xc4\xb8\xb9\x54\x15\xdf\
+\x32\x36\x25\x8d\x42\xa9\x03\xa8\xd7\xdc\x6b\x88\xb1\x43\xa3\x67\
+\x70\x07\x97\x95\xd7\x8a\x27\x75\x6a\x98\xaa\x9d\x2a\x80\xdd\x03\
+\x0b\x2f\x6c\x3b\xed\x3f\xeb\x36\x4f\xa7\x75\xce\x2d\xad\xde\xff\
+\x92\x6e\x1d\x13\xf5\x53\x05\xd0\xa8\xb9\x7f\x04\xe3\x52\xcd\xc6\
+\xc7\xfc\x40\xbc\x5d\xb3\x86\xb1\xf2\xa9\x01\x68\x44\xee\x16\x00\
+\x6b\xb5\x3b\x67\x08\xbf\x2a\x3c\xed\x3a\x86\x04\x52\x01\xd0\x88\
+\x8a\x37\x01\x54\x33\xe2\x99\xf0\xa8\x5f\x11\x2b\x8d\x68\x19\x10\
+\x49\x0c\x60\x77\x54\xf4\xda\xa0\x7d\x06\xbc\x1e\x93\x20\x84\x7e\
+\x45\xe8\x5f\x69\x86\x1a\x4a\x0c\xa0\x11\xb9\xf1\x55\xee\x1a\x43\
+\x7e\xe3\x4b\xf7\xbb\x4a\x81\xf8\xba\x29\x3d\xdd\x3a\x89\x00\x34\
+\x6b\x0b\x2f\x01\xb7\xf7\x31\x30\x57\xb7\xd1\x13\xea\xff\xd8\x0f\
+\xc4\x17\x0c\xea\x69\x95\x4a\x04\xa0\x1e\xba\x77\x11\x61\x83\x56\
+\x87\x53\x8a\x33\x63\xa8\x5c\x15\xcb\x4d\x6a\xea\xd4\x52\x06\x30\
+\xb2\xd5\x7b\xd7\xbf\x3a\x1c\x1f\xfb\xcf\xd2\x69\xf0\x24\xb5\x9f\
+\xf4\x03\x71\x99\x61\x4d\x6d\x72\xca\x00\x1a\x61\xf1\x76\x10\xdd\
+\xa2\xcd\xd9\xf4\x85\x5f\xf0\x03\xf1\x1e\x0b\xba\x5a\x24\x13\x00\
+\x70\x9f\x05\xe1\x62\x2d\xae\x4e\x5d\xf4\x9f\x7e\x20\xce\xb0\xa0\
+\xab\x45\x52\x09\xc0\xee\xe8\x83\x97\xb7\xd1\xd9\xa3\xc5\x51\x57\
+\x45\xe9\xf3\x7e\xd0\xba\xbf\xab\xd0\x8c\x07\x29\x01\x68\x86\xee\
+\x26\x26\xc4\x77\xb8\x6c\xbd\x86\xfd\x40\x2c\xb5\x25\x9e\xa6\xae\
+\x12\x80\x7a\x54\x1c\x26\xd0\x27\xd2\x34\x22\x5b\x8b\x88\x96\x95\
+\x2a\xad\xba\x6c\x5e\xd6\xe2\xa5\x01\x0c\x45\xf3\xe7\x10\xce\x38\
+\x44\x80\x63\xb3\x19\x66\x7e\xa8\x5c\x1d\xfd\xb4\x4d\x0f\x69\x68\
+\x4b\x03\x68\x6e\x2d\xae\xe0\x0e\x3d\x96\x86\x78\xd2\x1a\x0e\xd1\
+\xa2\xbe\x4a\xeb\x0f\x49\xeb\xd8\xcc\x97\x06\xd0\xa8\xb9\x77\xa4\
+\xf1\x40\x55\x4a\x4d\x3f\xee\x07\xe2\xa3\x29\xd5\xb2\x52\x46\x01\
+\x40\xf1\x7b\x60\xfa\xb2\x15\xb7\x27\x13\x65\x3c\xe0\x57\xc5\x75\
+\x99\xf1\x23\x69\x44\x1a\x40\x33\x72\x77\x30\x70\x8d\xa4\x8e\xd6\
+\x70\x22\xdc\x5c\xaa\xcc\xcc\x7b\xc4\xd2\x00\xea\x91\x37\x42\xe0\
+\x8f\x6b\x9d\xa8\x42\xf1\x42\xc1\xe9\x5d\xba\x66\xdf\x33\x0a\xa9\
+\x56\x53\xa4\x01\x34\x22\x57\x00\x28\x5a\x75\x3d\x8d\xb8\x43\x74\
+\x7e\x5f\xa5\xf5\xd7\x2c\x7a\x9b\xce\x93\x0a\x80\x17\x01\x5c\x90\
+\xd5\x26\x99\x68\x65\xb9\xd2\x7a\x34\xab\xfe\xa6\xfa\x92\x06\x50\
+\x8f\xdc\xf8\x1a\xc0\xe4\xfe\xbf\xfc\x2c\x99\xbf\xe9\x57\x47\x6f\
+\x95\x4f\xec\x3e\x63\x28\x5a\x70\x81\xc3\xb4\xc2\x01\x0e\x8c\x53\
+\xcf\xfe\x65\xc1\xde\xe7\xbb\xcf\xfe\x5f\xa4\x3c\x80\xd0\xfd\x07\
+\x11\xde\xa2\x22\x66\x38\xa7\xee\x10\xdd\x9a\xf6\x75\x42\x3d\x2c\
+\x5e\x4d\xa0\xeb\x41\x58\x71\x62\x3f\xcc\xb8\xad\x5c\x15\x9b\x65\
+\x7b\x94\x06\xd0\x88\xbc\x67\x00\xbe\x44\x56\xc8\x56\x7c\x7c\xc5\
+\xec\x38\xce\xfd\x49\xb7\x2d\x86\x22\xf7\xba\x78\xf0\xa7\x3a\x01\
+\x51\x81\x20\x0d\x20\xab\x67\x41\x5d\x00\x1e\x06\x68\x5b\xb7\xbb\
+\xa8\x3f\xdf\xe2\xbe\xf5\xf4\x39\xce\x85\x34\xde\xf9\x10\x83\xaf\
+\x27\xd0\xe5\x5d\x68\xfc\xd0\x0f\xc4\x97\xba\x88\xfb\x6f\x88\x3c\
+\x80\xd0\xdd\x46\x84\xcf\xc8\x88\x64\x2c\xf6\xd0\x7f\x1e\x22\xf8\
+\x3b\xc0\x07\x19\xce\x41\x02\x5e\x62\xe2\x03\xc4\xe8\x01\xf0\x6e\
+\x80\xe7\x01\x14\x9f\x64\x9c\xab\xe0\x7b\xa7\x1f\x88\xff\x3b\x34\
+\xbd\x5e\x0d\x69\x00\x8d\xc8\xbb\x13\xe0\x8d\xaf\x57\xf8\x0d\xfa\
+\xf7\x07\xfd\x40\x5c\x2b\xd3\xbb\x34\x80\x7a\xe4\x05\x04\x0e\x65\
+\x44\xde\x38\xb1\xb4\xc1\x0f\x5a\xdf\x96\xe9\x57\x1a\xc0\x50\xe4\
+\x7d\xca\x01\xcf\xd8\x6f\x25\xca\x0c\x47\x36\x96\x99\x96\x94\xab\
+\xad\x11\x99\x3c\x69\x00\x8d\xc8\x2b\x02\x1c\x5f\x0d\xe7\xaf\x29\
+\x13\x68\x17\x8e\xbe\x73\xf9\x9a\xa7\xff\x26\x33\x18\x69\x00\x71\
+\xf1\x46\xe4\x1e\x00\xf0\x0e\x19\xa1\xd9\x1e\xcb\xc0\x73\xe5\x40\
+\x48\x3f\xa4\xa0\x04\xa0\x19\xb9\xdb\x19\x98\xb1\x5b\xc0\x3a\xde\
+\x0c\x0c\xfc\xac\x1c\x08\xe9\x5d\x62\x35\x00\x35\xef\x06\x66\xbe\
+\x4f\x47\x23\x33\xb5\x26\x11\x36\x97\x2a\xe2\x36\x59\xff\x4a\x00\
+\x86\x23\xaf\x77\x1c\xfc\x94\xac\xd8\xac\x8e\x6f\x77\x16\xfa\xeb\
+\xf6\x4b\x3f\x25\xae\x04\xe0\xf8\xe7\x40\x0c\xa0\x77\x56\x0f\xb5\
+\xeb\xe6\x78\xc4\x0f\x46\x97\x74\x1d\x7e\x42\xa0\x32\x80\x7a\x58\
+\xbc\x8f\x88\x6e\x50\x11\x9d\x6d\x39\x04\xaa\x96\x82\x56\xa4\xd2\
+\x97\x32\x80\xa1\xa8\xd8\xe7\x80\x9a\x2a\xa2\xb3\x29\x87\x19\x47\
+\xf1\x26\x5c\x5c\x5e\x2d\x5e\x50\xe9\x4b\x19\x40\x2c\xd6\x8c\xbc\
+\x7b\x19\x7c\xa3\x8a\xf0\x6c\xc9\x51\x3d\xfb\x99\xec\x3f\x11\x80\
+\x5d\xa1\x7b\x51\x87\xf0\x1b\x00\xe7\xcc\x96\x81\x4a\xf7\xc1\xfc\
+\x39\xbf\x3a\xba\x4d\x3a\xef\x78\x42\x22\x00\xc7\x3e\x8c\x8b\x1b\
+\x01\xba\x53\xd5\xc0\x0c\xcf\x7b\xc4\x0f\xc4\xd5\x49\x7a\x48\x0c\
+\xe0\x57\x9b\xaf\xea\x79\xed\x6d\xaf\x3c\x41\x94\xce\x0f\x30\x25\
+\x69\xc6\x70\xee\x2b\xed\x36\x16\x2f\x5f\x27\x12\x6d\xcb\x24\x06\
+\x30\xb1\x0a\xc2\xe2\x2a\x10\xfd\xd4\xf0\x00\xac\xca\x75\x80\x75\
+\xcb\x02\x31\x90\xd4\x44\x2a\x00\x8e\x5f\x17\x18\xfd\xb6\x64\xd2\
+\xc6\x13\xe6\x27\x3e\xf4\xa4\xf2\x21\x3c\xb5\x89\x46\xe4\xfe\x12\
+\xc0\xe2\x84\xcd\x65\x3d\x3d\x95\x43\x8f\x16\x00\xf1\x7d\xd4\xb9\
+\x05\x3c\xab\x78\x3b\x2f\xeb\x83\x9f\xf0\xe7\x10\x7f\xb6\xaf\x32\
+\xba\x3d\x2d\xb3\xa9\x1d\x82\x26\x0d\xd5\x07\xdc\x45\xe4\xe0\xf7\
+\x69\x19\xcc\x52\x1d\x06\x55\xcb\x8a\x57\xbc\xd3\xf5\x91\x3a\x80\
+\x89\xcf\x83\x9a\x7b\x2d\x18\x3f\xc9\xd2\xf0\x92\x7a\x51\x79\xe4\
+\xa4\x1b\x4d\x2d\x00\x62\x61\xdd\xbf\x9a\xd5\x4d\x73\x69\xc5\xe8\
+\x1a\x7e\xec\x4f\x1b\x80\xb8\x78\x73\xab\x77\x25\x77\xf8\xd7\x69\
+\x0d\xc2\x46\x1d\x9d\xc3\xd7\x0e\x20\x16\x18\xfe\xee\x07\xde\x3b\
+\x3e\x5e\x88\x37\xed\xe6\xdb\x18\x60\x12\x4d\x13\xbf\x4b\xaa\x75\
+\x05\x4c\x36\xff\xd8\xf7\x17\xbe\xb9\xe7\x48\xfb\x07\x34\x53\x6e\
+\x63\x12\x9e\x2a\xb4\x0b\xcb\x96\xae\xdd\xfb\x97\x24\x00\xbb\xc9\
+\x35\x02\x60\xd2\x48\x23\x2a\xde\x0d\xd0\xfa\x6e\x8c\x59\x8c\x19\
+\xf0\x03\xb1\xce\x94\xbe\x51\x00\x13\x67\x48\x61\x71\x15\x83\x36\
+\x64\x73\xef\x88\x2b\x7e\x30\x9a\xfe\xaf\xfc\x9e\x82\xa6\x71\x00\
+\xb1\x97\x78\x03\xef\xc8\x59\x2f\xaf\x3f\xbe\x1a\x6c\x6f\x65\xbf\
+\x0c\x60\xb0\xdd\xc6\x60\xd2\x8d\x35\x95\x55\x63\x05\xc0\xa4\xd1\
+\xf8\x7e\x02\x13\xad\xb7\x74\x53\xe7\x79\x10\x0d\x16\xda\xce\xa0\
+\x89\x63\xbd\xd1\x0b\x31\xd9\x77\xc2\xc4\xed\x4d\xa6\x7e\x10\x3e\
+\x02\xe0\x22\xd9\x7c\xa9\x78\xc6\xef\x40\xbc\xfd\xc8\xe1\xd7\x06\
+\x57\x6e\xfc\xd3\xab\x52\xb9\x1a\x82\xad\xae\x80\x93\xf5\xb3\x73\
+\x8b\xeb\x52\x01\x57\x39\xc0\xc7\x00\xc4\x5f\xc2\x3e\x3b\x61\xdf\
+\x47\xe2\xb3\x61\x22\x1e\x61\xc2\x2e\xff\xa6\xd1\x4c\x3d\x4e\x93\
+\x39\x00\x53\x87\x7d\x0c\x08\xcd\x27\xe0\xbc\xf8\x1f\x33\x9f\x0f\
+\xa2\x13\xfe\x8f\x1e\x02\xc6\x00\x8c\x31\x68\xcc\x01\x8f\x31\xf1\
+\x18\x40\x63\xdc\xc1\x13\xaf\x3e\x2e\x9a\xab\x1e\x46\x3b\x21\x44\
+\x6d\xe9\x99\x07\xa0\xad\xf3\x8c\x14\xce\x01\x58\x06\x91\x03\xc8\
+\x01\x58\x9e\x80\x65\xf9\x7c\x05\xe4\x00\x2c\x4f\xc0\xb2\x7c\xbe\
+\x02\x72\x00\x96\x27\x60\x59\x3e\x5f\x01\x39\x00\xcb\x13\xb0\x2c\
+\x9f\xaf\x80\x1c\x80\xe5\x09\x58\x96\xff\x37\x1a\xce\x47\x7f\x18\
+\xaf\x5c\x15\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x03\x01\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x60\x00\x00\x00\x60\x08\x06\x00\x00\x00\xe2\x98\x77\x38\
+\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x02\
+\xbb\x49\x44\x41\x54\x78\x5e\xed\x9b\x31\x4e\xc5\x40\x0c\x44\xe7\
+\x9f\x02\x04\xd7\xa0\xe6\x08\x50\xc1\x21\xa1\x82\x23\x50\x73\x0d\
+\x10\x9c\x02\x94\x02\x29\x45\x3e\xb2\x37\x1a\x4f\xac\x1d\x6a\xaf\
+\x9d\xcc\x5b\xc7\x5f\x1e\x71\x82\xff\xa4\x0a\x9c\xa4\xd5\x5d\x1c\
+\x06\x20\xbe\x04\x06\x60\x00\x62\x05\xc4\xe5\xdd\x01\x06\x20\x56\
+\x40\x5c\xde\x1d\x60\x00\x62\x05\xc4\xe5\xdd\x01\x06\x20\x56\x40\
+\x5c\xde\x1d\xd0\x18\xc0\x0b\x80\x1b\x00\x57\xe2\x77\x50\x97\xff\
+\x04\xf0\x0e\xe0\x7e\xe4\x41\x46\x3b\xe0\x67\xa4\xd8\x04\x67\xd2\
+\x7a\xa6\x0f\x00\x78\x02\xf0\x30\x81\x98\x23\xaf\xf8\x0c\xe0\x31\
+\x73\x70\x04\xc0\x17\x80\x8b\x4c\x91\x89\x62\xbf\x01\x5c\x66\xde\
+\x77\x04\xc0\x87\xbf\xfb\x67\x25\x5e\xe6\xc1\x35\x1b\xc0\x32\x7c\
+\xef\x32\x45\x26\x8a\x7d\xcd\x0e\xe3\x91\x0e\x58\xf4\xf4\x10\xde\
+\xbe\x55\x69\x3d\xd3\x07\x56\x75\x97\x61\x7c\xeb\x79\x80\xe5\xbb\
+\xff\x96\x1d\xbe\x7f\x3a\xee\x01\x30\xd1\x97\x85\xf7\xaa\x06\xc0\
+\xd3\x36\x94\xd9\x00\x42\x32\xf1\x82\x0c\x80\xa7\x6d\x28\xb3\x01\
+\x84\x64\xe2\x05\x19\x00\x4f\xdb\x50\x66\x03\x08\xc9\xc4\x0b\x32\
+\x00\x9e\xb6\xa1\xcc\x47\x06\xd0\xc5\x6f\x90\xf8\x01\x21\xba\x3b\
+\x82\xba\xae\x3a\xd2\x17\x3a\x7d\x60\x87\xa8\xd1\xa3\x9d\xfd\x86\
+\x12\x3f\x20\x2a\xe4\x68\x5c\x67\xbf\xa1\xc4\x0f\x18\x15\x36\x7a\
+\xae\xb3\xdf\x50\xe2\x07\x44\x85\x1c\x8d\xeb\xec\x37\x94\xf9\x01\
+\xa3\xe2\x46\xcf\x79\x08\x47\x95\x22\xc6\x75\xf1\x1b\xec\x07\x10\
+\x2f\x01\x3d\xf5\x11\x7f\x86\xd2\x5f\xfa\x48\x05\x0c\x40\x4c\xc3\
+\x00\x0c\x40\xac\x80\xb8\xbc\x3b\xc0\x00\xc4\x0a\x88\xcb\xbb\x03\
+\x1a\x03\xe8\xb2\xaf\x67\x4b\x2c\xf1\x03\xba\xae\x0a\xd8\x30\xd2\
+\x5f\x94\xf4\x01\xff\x7f\xc0\xbf\x0c\x4b\xfc\x80\xce\xfb\x7a\x76\
+\x07\x94\xf8\x01\x9d\xf7\xf5\x6c\x00\x25\x7e\x40\xe7\x7d\x3d\x1b\
+\x40\x99\x1f\xe0\x21\xbc\x8d\x32\x3d\x53\xd3\x07\x56\x75\xbb\xec\
+\xeb\xd9\xb7\xde\x7e\x00\x5b\x61\x66\xfe\x3d\x1d\xc0\x7c\xae\x69\
+\x72\x1b\x80\x18\xb5\x01\x18\x80\x58\x01\x71\x79\x77\x80\x01\x88\
+\x15\x10\x97\x77\x07\x18\xc0\x59\x05\xba\xf8\x0d\x12\x3f\x80\x7d\
+\x6f\xba\xae\x3a\xd2\x5f\x94\xf4\x01\xb6\xf2\xcd\xfd\x86\x12\x3f\
+\x80\xcd\xa0\xb3\xdf\x50\xe2\x07\xb0\x01\x74\xf6\x1b\x4a\xfc\x00\
+\x36\x80\xce\x7e\x43\x99\x1f\xc0\x86\xe0\x21\xcc\x56\x38\x90\xbf\
+\x8b\xdf\x60\x3f\x20\x00\xf3\xb0\x21\x47\xfc\x19\x7a\x58\xb1\x18\
+\x0f\x66\x00\x0c\x55\x13\x39\x0d\x20\x21\x16\x23\xd4\x00\x18\xaa\
+\x26\x72\x1a\x40\x42\x2c\x46\xa8\x01\x30\x54\x4d\xe4\x34\x80\x84\
+\x58\x8c\xd0\x3d\x00\xba\xec\xeb\x19\xba\xad\x73\x4a\xfc\x80\xae\
+\xab\x02\x36\x8c\xf4\x85\x4e\x1f\x68\xbe\xaf\x67\x03\x28\xf1\x03\
+\x3a\xef\xeb\xd9\x00\x4a\xfc\x80\xce\xfb\x7a\x36\x80\x12\x3f\xa0\
+\xf3\xbe\x9e\x0d\xa0\xcc\x0f\xf0\x10\xde\x46\x99\x9e\xa9\xe9\x03\
+\xab\xba\x5d\xf6\xf5\xec\x5b\x6f\x3f\x80\xad\x30\x33\xff\x9e\x0e\
+\x60\x3e\xd7\x34\xb9\x0d\x40\x8c\xda\x00\x0c\x40\xac\x80\xb8\xbc\
+\x3b\xc0\x00\xc4\x0a\x88\xcb\xbb\x03\x0c\x40\xac\x80\xb8\xbc\x3b\
+\xc0\x00\xc4\x0a\x88\xcb\xbb\x03\xc4\x00\x7e\x01\xad\xeb\x50\x61\
+\x10\x60\xa1\x8b\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\
+\x00\x00\x08\x59\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x60\x00\x00\x00\x60\x08\x06\x00\x00\x00\xe2\x98\x77\x38\
+\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x08\
+\x13\x49\x44\x41\x54\x78\x5e\xed\x9d\x69\xac\x5d\x53\x14\xc7\xff\
+\x7f\x41\x8c\x8d\x46\x1a\x14\xa1\x22\x28\x1a\xb4\x88\x29\xa2\x5a\
+\x73\xab\x41\x52\x62\xaa\xa1\x6d\x42\xcb\x27\x31\x14\x31\x2b\xe2\
+\x5b\xab\x1f\xd4\xd4\x52\x91\xd4\x58\x5a\x82\x36\x8d\x98\xa2\x86\
+\x8a\xa2\x29\x31\x0f\xa9\x21\x86\x1a\x1a\x11\xcb\xfd\xc7\xbe\xf2\
+\xde\xf3\xde\x39\xfb\xec\xb3\xcf\x3d\xf7\xba\x7b\x25\x37\x2f\xcd\
+\x5d\x7b\xef\xb5\xd7\xef\xee\x79\xed\x5d\x22\x49\xad\x1e\x60\xad\
+\xa5\xa7\xc2\x91\x00\xd4\xfc\x23\x48\x00\x12\x80\x9a\x3d\x50\x73\
+\xf1\xa9\x05\x24\x00\x35\x7b\xa0\xe6\xe2\x53\x0b\x48\x00\x6a\xf6\
+\x40\xcd\xc5\xa7\x16\x90\x00\xd4\xec\x81\x9a\x8b\x4f\x2d\xa0\x5b\
+\x01\x98\xd9\x4e\x00\xf6\x05\x30\x14\xc0\x76\xee\xef\x0e\x00\xf4\
+\xd9\xd1\xf9\xe5\x73\x00\x5f\xb8\xcf\x57\x00\xbe\x06\xa0\xbf\x2b\
+\x49\x7e\x5a\xb3\xef\xa2\x14\xdf\xf2\x16\x60\x66\x47\x02\x38\xcd\
+\x7d\xb6\x0c\xac\xc5\x3a\x00\x0f\xe9\x43\x72\x59\x60\x1e\x6d\x91\
+\xac\x25\x00\xcc\x4c\x8e\x6e\x3a\x5d\x00\x62\x8a\x00\x34\x61\x08\
+\x4c\x47\x49\xe5\x00\xcc\xec\x42\x00\x97\x02\x50\x97\x53\xa5\xa8\
+\x4b\xba\x8d\xe4\x9c\x2a\x0b\x89\x9d\x77\xa5\x00\xcc\xec\x6e\x00\
+\xe7\xc5\x36\x3a\x27\xbf\x7b\x48\x9e\xdf\xe2\x32\x83\x8b\xab\x04\
+\x80\x99\x69\x50\x7d\x1a\xc0\x3e\xc1\x96\x95\x4b\xf8\x36\x80\xe3\
+\x48\x6a\xd0\x6e\x6b\x89\x0e\xc0\xcc\xc6\x01\x78\xb2\x4d\x6a\x3d\
+\x9e\xe4\x53\x6d\x62\x4b\xbf\x66\x44\x05\x60\x66\xd7\x02\xb8\xa6\
+\xcd\x2a\x7c\x1d\x49\xd9\xd5\x96\x12\x0d\x80\x99\xed\x07\xe0\xcd\
+\x80\x5a\xae\x68\x74\x55\x8f\x01\xf8\xb2\xcf\x47\x59\x6d\xdf\xe7\
+\x73\x12\x80\x03\x02\xca\x18\x49\xf2\xad\x80\x74\x95\x27\x89\x02\
+\xc0\xcc\xb6\x02\xf0\x43\x01\x6b\x7f\x6d\xcc\x8a\xee\x05\xb0\x80\
+\xe4\xab\x05\xd2\xc1\xcc\x0e\x02\x70\x06\x80\x73\x01\x6c\x5e\x20\
+\xed\x60\x92\x3f\x16\xd0\x6f\x89\x6a\x2c\x00\x8b\x01\x1c\xef\x69\
+\xf1\x3c\x00\x57\x37\x66\x2a\x5a\xe5\x06\x4b\x63\x86\xa5\xd5\xf2\
+\x0d\x00\x26\x79\x66\xb2\x84\xe4\x09\x9e\xba\x2d\x53\x2b\x0d\xc0\
+\xcc\x6e\x04\x70\xa5\xa7\xc5\xb7\x92\xbc\xdc\x53\xd7\x4b\xcd\xcc\
+\x6e\x01\x70\x99\x97\x32\x70\x13\xc9\xab\x3c\x75\x5b\xa2\x56\x0a\
+\x80\x99\x69\xbe\x7d\x97\xa7\xa5\x13\x48\x2e\xf2\xd4\x2d\xa4\x66\
+\x66\x27\x02\x78\xc2\x33\xd1\x64\x92\x5a\x9f\xb4\x85\x04\x03\x70\
+\xdb\x0b\xef\xf8\xac\x70\xd9\x98\x86\xb4\xa2\xb6\xd6\x98\x86\x79\
+\x94\xa3\x15\xf3\x08\x92\x6d\xb1\x6d\x11\xec\x18\x33\x9b\xd2\xd8\
+\xc1\xbc\xd3\xa3\xc2\xa3\x48\x86\xcc\x8e\x3c\xb2\xee\xad\x62\x66\
+\x23\x01\xbc\xe1\x91\x70\x2a\xc9\xb9\x1e\x7a\x95\xab\x94\x01\xb0\
+\x14\x40\xde\xc6\xda\x14\x92\xbe\x5d\x54\x94\xca\x9a\xd9\xe4\xc6\
+\xd4\x35\xcf\xb9\xcb\x48\x8e\x89\x52\x60\xc9\x4c\x82\x00\xb8\x2d\
+\x65\x01\xc8\x92\x39\x24\xa7\x95\xb4\x2f\x28\xb9\x99\xdd\x01\x40\
+\x9b\x80\x59\x32\xa6\x1d\xb6\xb2\x43\x01\xa8\xeb\x51\x17\x34\x90\
+\xfc\x0e\x60\x2f\x92\x1f\x07\x79\xb0\x64\x22\x33\x1b\x06\xe0\x5d\
+\x00\x9b\x66\x64\x35\x97\xe4\xd4\x92\x45\x95\x4e\x5e\x18\x80\x3b\
+\xc9\xd2\xe0\x9b\x75\x98\xf2\x00\xc9\xb3\x4a\x5b\x57\x22\x03\x33\
+\xbb\x1f\xc0\x99\x19\x59\x68\x10\xd6\x60\x5c\xeb\xc9\x5a\x08\x00\
+\x6d\x07\x3c\x9a\xe3\x9b\xa3\x48\x3e\x5f\xc2\x7f\xa5\x93\x9a\xd9\
+\x58\x00\xcf\xe5\x64\x74\x32\x49\x6d\x83\xd4\x26\x21\x00\xd4\xaf\
+\xcf\xce\xb0\x78\x15\xc9\x11\xb5\xd5\xa8\x47\xc1\x66\xa6\x96\xba\
+\x77\x86\x2d\xd3\x49\x6a\xbc\xa8\x4d\x42\x00\xdc\x0c\xe0\x8a\x0c\
+\x8b\x67\x90\x9c\x59\x5b\x8d\x7a\x03\x90\x9d\xb2\x77\x20\x99\x49\
+\x72\x46\x9d\xb6\x86\x00\xd0\x5e\xce\xd9\x19\x46\x4f\x22\x39\xbf\
+\xce\x4a\x35\xcb\x36\x33\xd9\x29\x7b\x07\x92\xf9\x8d\x89\x82\xef\
+\x5e\x52\x25\x55\x0a\x01\xa0\xbe\x3d\x6b\x0e\x3d\x96\x64\xde\x14\
+\xb5\x92\xca\xf4\xcd\xd4\xcc\x64\x67\xd6\x58\xb4\x94\xa4\xc6\x8a\
+\xda\x24\x04\xc0\xfb\x8d\x28\x84\x3d\x32\x2c\x1e\x4e\x72\x75\x6d\
+\x35\xea\xdd\x05\xc9\x4e\xd9\x3b\x90\xac\x26\x39\xbc\x4e\x5b\x43\
+\x00\xfc\x9c\x33\x05\x1d\xd4\x2e\xfb\x2c\x6e\xbf\x4a\xf6\x0e\x24\
+\xeb\x48\x0e\xea\x34\x00\x3f\x01\xc8\x32\xba\x93\x00\xac\x27\x99\
+\xb5\x58\xab\x9c\x4d\x48\x0b\x58\xa5\x55\xee\xff\xa4\x0b\x5a\x4b\
+\x72\xdb\xca\xbd\x9c\x51\x40\x08\x80\x67\x00\x1c\x93\x91\x67\x27\
+\x0d\xc2\x6b\x48\xee\xde\x69\x00\xb4\xbb\x99\x15\xf8\xd4\x49\xd3\
+\xd0\x15\x24\x0f\xec\x34\x00\xd7\xeb\x4c\x37\xc3\xe8\x4e\x5a\x88\
+\x2d\x24\x39\xb1\xd3\x00\x5c\x00\x20\x2b\xfe\xb2\xf6\x5f\x55\xd3\
+\xa1\x66\xf6\x5a\x4e\x18\xcb\x44\x92\x0b\x3b\x0d\xc0\x84\x46\x5c\
+\xff\xe3\x39\x46\x1f\x5c\x34\xdc\x24\xb6\x13\x5c\xf8\xca\x2b\x39\
+\xf9\x0e\x21\xf9\x5d\xec\xb2\x8b\xe4\x17\x32\x08\x2b\xca\x39\x6f\
+\x3b\x7a\x36\xc9\x8b\x8a\x18\x12\x5b\xd7\xcc\x66\x01\x98\x9e\x91\
+\xef\xa2\x46\xb0\x96\x7e\x4c\xb5\x4a\x61\x00\xb2\xd6\xcc\xf2\x0e\
+\x64\x14\x78\xa5\x15\x71\xa9\xd8\x9f\x50\xcf\xb8\x98\x21\xad\x80\
+\xb3\x02\xb7\xa6\xb5\x43\x28\x7b\x28\x00\x9d\x05\xe7\xed\xf7\xcc\
+\x23\x79\x4e\xa8\x13\xcb\xa4\x33\xb3\xfb\x72\x02\xb6\xbe\x75\x27\
+\x76\xfa\x5b\xab\x04\x01\x70\xad\xc0\xe7\x50\x3e\x7a\x20\x56\x9e\
+\xb7\x3c\x03\xb5\x6a\x3b\xaf\xee\x6b\x7f\x19\x00\xbe\x61\x29\x95\
+\x05\x64\xf5\xad\x4c\x81\x00\xad\xd1\x24\x97\xe7\xc1\x6c\xc5\xf7\
+\x65\x00\xe8\x4c\xb8\x13\x03\xb3\xda\xe2\x30\xbe\x09\x37\x18\x80\
+\xeb\x86\x14\xfa\xe1\x7b\xa4\x57\x59\x80\x56\x81\x80\x2c\xdd\x9c\
+\x19\x47\x52\x57\x5f\xdb\x42\x4a\x01\x70\x10\x8a\xdc\x03\x8b\x1e\
+\xa8\xe5\x19\x88\xd5\x74\x76\xed\x0b\xaf\x68\x63\x40\xcf\x8c\xcc\
+\x6c\x65\x81\xfb\x60\x5a\x45\xdf\x5e\x36\x66\xc8\xc5\xfe\x5c\xe2\
+\x11\x80\xd5\x34\xf5\x3d\x00\x02\xa0\x78\xa1\xb6\x91\xd2\x2d\xc0\
+\xb5\x02\x5d\xca\xd3\x0d\x76\x5f\x51\xe0\xd6\x23\x3a\xaf\x2d\x1a\
+\xbe\xe2\xc2\x4d\x74\x8e\x7b\x4a\x4e\xe0\x55\x7f\xb6\xe8\xa4\x4e\
+\x10\x34\x76\xb5\x85\x44\x01\xe0\x20\x84\x5e\xce\xd3\xf9\xc2\x83\
+\x9e\x57\x94\x4e\xcf\x09\x33\xf1\x71\xea\x1a\x07\x41\xe3\x41\xed\
+\x12\x0d\x80\x83\xd0\x8e\x97\xf4\xfa\x73\xf2\x87\x0e\x42\xed\xf7\
+\xc6\xa2\x02\x70\x10\x42\x2f\xeb\xb5\xfa\xd7\xf8\x91\x83\xe0\x13\
+\xce\x5e\x99\x6d\xd1\x01\x38\x08\xba\xb4\xb7\xa0\xc0\xbd\xb1\xd8\
+\x15\xd4\x80\xbb\xa7\x47\xa6\x0a\x1e\xd6\x98\xf0\xba\x87\x6e\x25\
+\x2a\x95\x00\x68\x5a\x5a\xf0\xfe\x58\x8c\x0a\x6a\x86\xa3\xa8\x3c\
+\xcd\xca\x1e\xce\x09\x9f\x69\x96\xa7\xe0\x5c\x41\xd0\xd9\x41\xcb\
+\xa5\x52\x00\xae\x35\xe8\xf8\x52\x27\x68\x55\x3f\xd6\xa1\x0d\x38\
+\x5d\xca\xfe\xc4\x95\xab\xf8\x54\x41\xd8\xcd\xc3\xab\xda\xb5\x15\
+\x84\x42\x57\x66\x3d\xf2\xcd\x55\xa9\x1c\x80\x73\x46\x55\xcf\xd5\
+\x68\x37\x53\x27\x5a\x3a\x5a\xfc\xcf\xde\x8e\x99\xe9\xad\x0a\x41\
+\xd8\x35\xd7\x13\xff\x5c\x14\x17\x84\x97\x3d\x74\xa3\xa9\xb4\x04\
+\x40\x4f\x6b\x23\x3d\xd8\xa4\x87\x40\xf4\x06\x84\x1c\x9f\xb9\xa5\
+\xec\x6e\xf0\x0b\xc2\x2e\x1e\x5e\xd3\xe3\x1e\x82\xf0\xa2\x87\x6e\
+\x14\x95\x96\x03\xe8\x31\x3e\xa8\x4b\xd2\xa5\x3a\x3d\x59\xd6\xf7\
+\x49\x02\xfd\x7b\x23\x00\x0a\x02\x6b\x7e\x3e\x6b\x9c\xef\xea\x42\
+\xf8\x62\x92\xdf\x14\xa9\xbd\x99\x8d\x72\x2d\x45\x37\x67\xf2\x64\
+\xad\x83\xf0\x42\x9e\x62\x8c\xef\x6b\x03\x10\xc3\xf8\x22\x79\x98\
+\xd9\xfe\xae\x3b\xf2\x19\x8b\xd4\xaa\xd4\x12\x2a\xdf\xb2\xee\x1a\
+\x00\x6e\x2c\x52\x0c\x90\xba\xa3\xe6\xa3\x80\x59\x0c\xbf\x77\x10\
+\x2a\x7d\x93\xae\xab\x00\x38\x08\x7a\xec\x43\x10\xd4\xcd\xe5\x89\
+\x1e\x20\x51\x4b\xa8\xec\xba\x55\xd7\x01\x70\x10\x0e\x71\x10\xb4\
+\x89\x98\x27\x7a\x61\xe5\x54\x92\xcf\xe6\x29\x86\x7c\xdf\x95\x00\
+\x1c\x84\xc3\x1c\x84\x6d\x3c\x1c\xa7\x10\x77\x41\x50\x5c\x6c\x54\
+\xe9\x5a\x00\x0e\xc2\xe1\x0e\xc2\x10\x0f\xaf\xfe\xe2\x20\x2c\xf1\
+\xd0\xf5\x56\xe9\x6a\x00\x0e\xc2\x11\x0e\xc2\xd6\x1e\x5e\xfb\xcd\
+\x41\x88\xf6\x0e\x5d\xd7\x03\x70\x10\x14\xe7\xa4\x81\x79\xb0\x07\
+\x84\xf5\x6e\x60\x8e\xf2\x30\x61\x02\xe0\x3c\xee\x4e\xda\xb4\xad\
+\xa1\x9d\xdc\x3c\xf9\xc3\x41\xf0\x7d\xa3\x68\xc0\xfc\x12\x80\x1e\
+\xae\x31\xb3\xa3\xdd\x8a\xd9\xe7\xde\xd8\x9f\x0e\x42\xa9\x9b\xf6\
+\x09\x40\x9f\xdf\xa6\x99\x1d\xeb\x20\x6c\x91\xd7\x0c\x00\xfc\xe5\
+\x20\xe8\x7c\x3b\x48\x12\x80\x7e\xdc\xd6\xb8\x57\xa0\x07\x08\xd5\
+\x1d\x6d\xe6\xe9\xd5\xe0\xe8\xbf\x04\x60\x00\x0f\xbb\x17\x80\x05\
+\x61\x13\x0f\x08\x2f\x35\x56\xcb\x5a\x57\x14\x96\x04\x20\xc3\x65\
+\x66\x36\xde\xcd\x8e\x36\xf6\xf0\xec\xb0\xe6\x61\x90\x87\xee\xbf\
+\x2a\x09\x40\x8e\xb7\xcc\x4c\x97\x38\x34\x45\xdd\x30\x47\x35\x28\
+\xe0\x37\x01\xf0\xf8\xb9\x9a\x99\xde\x48\x12\x84\x0d\x32\xd4\x87\
+\x86\xbc\xd6\x9e\x00\x78\x00\x70\x8b\x35\x45\xe2\x09\x42\x7f\xb2\
+\x9c\xe4\x68\xcf\xac\x7a\xa9\x25\x00\x05\xbc\xe6\xee\x1f\xe8\x7f\
+\x03\x39\xb4\x47\xb2\x59\x24\x2f\x2e\x90\x4d\x02\x10\xea\xac\x66\
+\xba\xc6\x15\xa8\x9d\x01\xe8\xf3\x01\x49\x1d\xe6\x07\x4b\x6a\x01\
+\xc1\xae\x8b\x93\x30\x01\x88\xe3\xc7\xe0\x5c\x12\x80\x60\xd7\xc5\
+\x49\x98\x00\xc4\xf1\x63\x70\x2e\x09\x40\xb0\xeb\xe2\x24\x4c\x00\
+\xe2\xf8\x31\x38\x97\x04\x20\xd8\x75\x71\x12\x26\x00\x71\xfc\x18\
+\x9c\x4b\x02\x10\xec\xba\x38\x09\x13\x80\x38\x7e\x0c\xce\x25\x01\
+\x08\x76\x5d\x9c\x84\x09\x40\x1c\x3f\x06\xe7\x92\x00\x04\xbb\x2e\
+\x4e\xc2\xbf\x01\xf2\x48\x67\x7f\xe6\x3a\x0b\x43\x00\x00\x00\x00\
+\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x04\x36\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x60\x00\x00\x00\x60\x08\x06\x00\x00\x00\xe2\x98\x77\x38\
+\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x03\
+\xf0\x49\x44\x41\x54\x78\x5e\xed\x9c\x59\xaa\x15\x49\x10\x86\xbf\
+\xbb\x04\x15\x44\x51\x71\x40\x41\x54\xc4\x46\x51\x5a\x51\xda\x45\
+\x28\xb8\x07\x71\xc4\x79\xee\x76\x96\x56\x51\x5c\x83\xa0\x8b\x50\
+\x9c\x70\x46\x71\xa2\xc5\x59\x54\x7c\x50\xb7\xe0\x0d\xb8\xde\xb7\
+\x26\xe2\xdc\x63\x9e\x88\xa0\x22\x5e\xf3\xaf\x13\x99\xff\x57\x59\
+\x95\x95\x99\x27\x87\xa8\x70\x75\x60\xc8\x35\x7b\x25\xa7\x00\x38\
+\xdf\x04\x05\xa0\x00\x38\x3b\xe0\x9c\xbe\x7a\x40\x01\x70\x76\xc0\
+\x39\x7d\xf5\x80\x02\xe0\xec\x80\x73\xfa\xea\x01\x05\xc0\xd9\x01\
+\xe7\xf4\xd5\x03\x0a\x80\xb3\x03\xce\xe9\xab\x07\x14\x00\x67\x07\
+\x9c\xd3\x57\x0f\x28\x00\xce\x0e\x38\xa7\xaf\x1e\x50\x00\x9c\x1d\
+\x70\x4e\x5f\x3d\xa0\x00\x8c\x3a\xb0\x09\x58\x07\xcc\x06\xc6\x3b\
+\xf9\xf2\x1d\x78\x05\x5c\x04\xce\x0e\xa2\x0e\x51\x7a\xc0\x41\xe0\
+\xc0\x20\x1a\xdc\x43\x8e\x43\xc3\x5a\xa9\x57\xd3\x88\x00\x60\x0d\
+\x70\xa9\x69\x2b\xc7\xfe\xe3\x6b\x81\xcb\x63\xbf\x5c\xbf\x32\x02\
+\x80\xfb\xc0\x62\xbd\xaa\x2e\x8a\x07\xc0\x92\x96\x99\x23\x00\x90\
+\xe7\xee\xb8\x96\x8d\xec\xe3\xb7\x7f\xb4\x7e\x1f\x45\x00\xf0\xad\
+\x75\x23\xfb\x00\x20\x37\xc7\x84\x3e\xae\x57\x2f\x8d\x00\xe0\x0e\
+\xb0\x54\xad\xa9\x8f\xe0\x2e\xb0\xac\x65\xea\x08\x00\x64\xf8\x79\
+\xa6\x65\x23\xfb\xf8\xed\xcd\xad\x87\xa3\x11\x00\x88\x3f\x35\x0c\
+\xed\xe3\x2e\xf9\x5d\x97\xca\x70\x74\x07\x30\xcb\xf1\xa5\x2c\x2f\
+\xdd\x37\xc0\x89\xd6\xc3\xcf\x5f\xa6\x45\xe9\x01\x63\x85\x28\xcf\
+\xe7\xdb\x86\x8b\x3f\x01\x53\x0d\xba\x81\x4b\xb2\x03\x90\xaf\xd5\
+\xfd\x06\xd7\x44\xf3\x8f\x41\x37\x70\x49\x76\x00\xf7\x8c\x1f\x4a\
+\x93\x80\xaf\x03\x77\xd7\x90\x30\x33\x80\xe5\xc0\x4d\x43\x1b\xdf\
+\x03\x33\x0c\x3a\x17\x49\x66\x00\x87\x81\x3d\x06\xd7\x76\x03\xc7\
+\x0c\x3a\x17\x49\x66\x00\x0f\x81\x3f\x0c\xae\x85\x7d\xfc\x48\xdd\
+\xb3\x02\x58\x09\x5c\x33\x98\xff\x7a\x64\x7d\xc1\x20\xf5\x91\x64\
+\x05\x20\x8f\x94\x9d\x06\xcb\xb6\x03\xa7\x0c\x3a\x37\x49\x56\x00\
+\x8f\x81\x85\x06\xd7\xa6\x00\x9f\x0d\x3a\x37\x49\x46\x00\x7f\x01\
+\x57\x0c\x8e\xfd\x07\xcc\x35\xe8\x5c\x25\x19\x01\x9c\x04\xb6\x19\
+\x5c\xdb\x12\x78\x92\x6f\xb4\xfa\x19\x01\x3c\x1d\x9e\xa7\x99\x6f\
+\x00\x30\x1d\xf8\x60\xd0\xb9\x4a\xb2\x01\x58\x01\xdc\x30\x38\xf6\
+\x0c\x58\x60\xd0\xb9\x4b\xb2\x01\xf8\x17\x90\x47\x8b\x16\x1b\x86\
+\x57\xb2\xce\x6b\xa2\x08\xe5\xd9\x00\xbc\x30\xbe\x58\x65\x4a\xfb\
+\x6d\x04\x83\xb5\x3a\x64\x02\x60\x9d\x7a\x96\x21\xea\x22\xad\xe1\
+\x51\xca\x33\x01\x90\x9d\x6a\x1b\x0d\xc6\xad\x07\x2e\x18\x74\x21\
+\x24\x99\x00\xbc\x04\xe6\x18\x5c\x13\x8d\x6c\x2f\x4c\x11\x59\x00\
+\xc8\xc6\x2d\xd9\xc0\xa5\x45\xf3\x8d\x54\x5a\x05\x7a\x2d\xcf\x02\
+\x40\x46\x34\xf2\x68\xd1\x42\x1e\x51\xe7\x34\x51\xa4\xf2\x2c\x00\
+\x64\x56\x53\x46\x36\x5a\xc8\xd4\x83\x4c\x41\xa4\x89\x0c\x00\x64\
+\xd2\x4d\x46\x36\x5a\xc8\xe2\xfc\x9f\x9a\x28\x5a\x79\x06\x00\xd6\
+\xc7\xcf\x56\xe0\x74\x34\x83\xb5\xfa\x64\x00\xf0\x0e\x90\x79\x1d\
+\x2d\x64\x7e\xe8\xb9\x26\x8a\x56\x1e\x1d\xc0\x3c\x40\xe6\x75\xb4\
+\x90\xf9\x21\x59\x25\x4b\x17\xd1\x01\xc8\x9e\x51\xd9\x3b\xaa\x45\
+\xf8\x95\xaf\xff\x6b\x40\x74\x00\x1f\x8d\x3b\xda\xe4\x45\xfd\x44\
+\xa3\x14\xb1\x3c\x32\x00\xf9\xa2\x95\xaf\x5f\x2d\xae\x02\xab\x35\
+\x51\xd4\xf2\xc8\x00\xac\x2b\x5f\xbb\x80\xe3\x51\x0d\xd6\xea\x15\
+\x19\x80\x2c\xa6\x4f\xd6\x1a\x30\xb2\x37\xe8\x91\x41\x17\x52\x12\
+\x15\xc0\xcc\x91\x6d\xe2\x9a\x69\xd7\x81\x55\x9a\x28\x72\x79\x54\
+\x00\x47\x01\x79\xb4\x68\xb1\x17\x38\xa2\x89\x22\x97\x47\x05\x20\
+\x3b\x99\x27\x1a\x8c\x93\xbf\x90\xca\x0c\x68\xda\x88\x08\x60\x9a\
+\x71\x37\xc3\x2d\x40\x16\xe9\x53\x47\x44\x00\x7f\x03\xfb\x0c\xae\
+\xca\xd1\x06\xa2\x4d\x1d\x11\x01\x7c\x01\x64\x47\xb3\x16\xb2\x46\
+\x2c\x7f\x23\x4d\x1d\x2d\x01\x74\xf2\xf4\x93\x5e\xef\x86\x56\x00\
+\x3a\xfb\xb7\xd3\x08\x00\x3a\x7d\xfa\x49\x04\x00\x9d\x3e\xfd\x24\
+\x02\x80\x4e\x9f\x7e\x12\x01\x40\xa7\x4f\x3f\x89\x00\xa0\xd3\xa7\
+\x9f\x44\x00\xd0\xe9\xd3\x4f\x22\x00\x90\x3a\xd4\x30\xd4\x48\xa2\
+\xd5\x77\x80\xa4\xef\xe4\xe9\x27\x46\xdf\x47\x65\x2d\x01\xf4\x5a\
+\x97\x4e\xea\x0b\x80\x33\xf6\x02\x50\x00\x9c\x1d\x70\x4e\x5f\x3d\
+\xa0\x00\x38\x3b\xe0\x9c\xbe\x7a\x40\x01\x70\x76\xc0\x39\x7d\xf5\
+\x80\x02\xe0\xec\x80\x73\xfa\xea\x01\x05\xc0\xd9\x01\xe7\xf4\xd5\
+\x03\x0a\x80\xb3\x03\xce\xe9\xab\x07\x14\x00\x67\x07\x9c\xd3\x57\
+\x0f\x28\x00\xce\x0e\x38\xa7\xaf\x1e\x50\x00\x9c\x1d\x70\x4e\xff\
+\x13\x6a\x21\x78\x61\xea\xe3\x0c\x76\x00\x00\x00\x00\x49\x45\x4e\
+\x44\xae\x42\x60\x82\
+\x00\x00\x09\xd0\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x60\x00\x00\x00\x60\x08\x06\x00\x00\x00\xe2\x98\x77\x38\
+\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x09\
+\x8a\x49\x44\x41\x54\x78\x5e\xed\x9d\x7d\x8c\x1c\x65\x1d\xc7\xbf\
+\xbf\xd9\xbb\xa3\x84\xde\xec\x5e\x4a\xec\x01\x89\x0a\x1a\x5b\x2d\
+\xc1\x3f\x5a\x73\x3b\x7b\x45\x11\xa1\xc4\x94\x42\x52\x2a\x09\x52\
+\xa0\x3b\x7b\xb5\x56\x45\xc0\x60\x44\xd2\x44\x8c\x31\x35\xbe\x62\
+\xe4\x25\xed\xdd\xce\xf5\x25\xc1\x28\x22\xb1\xe8\x1f\xad\x12\x89\
+\xed\xed\xec\xa1\x86\x44\xc4\x88\x6f\x6d\x89\xe1\x6a\x04\xbb\xbb\
+\x57\x13\xe9\xed\xce\xcf\xce\x72\xa7\x47\x7b\xb7\xf3\x3c\xf3\x3c\
+\xb3\x33\xbd\xdb\xf9\xeb\x92\xf9\xbd\x7c\x7f\xbf\xcf\x3e\x33\xcf\
+\x3c\xf3\x72\x84\xce\x16\x6b\x07\x28\xd6\xec\x9d\xe4\xe8\x00\x88\
+\xf9\x47\xd0\x01\xd0\x01\x10\x73\x07\x62\x4e\xdf\x19\x01\x1d\x00\
+\x31\x77\x20\xe6\xf4\x9d\x11\xd0\x01\xd0\xba\x03\x93\xce\xc0\xfb\
+\xea\x44\x2b\x8d\x86\xd1\x0f\x83\x97\x13\xd0\x0f\x50\x3f\x13\xf7\
+\x83\xfd\xbf\xd1\x4f\x84\x49\x66\x9c\x00\x30\x41\x84\x09\xcf\xc3\
+\x09\x22\x9e\x30\xc8\x98\xa8\xd7\xbd\x13\x7d\x5b\xcb\xcf\xc5\xdc\
+\xe7\x79\xd3\x27\x72\x04\x54\x8a\x83\x6b\x18\x8d\x1b\x53\x06\x6d\
+\x62\xc6\x2a\xd5\xe6\x11\xe8\x0d\x06\x1f\x02\x70\xc8\xf3\x30\xd6\
+\x37\xe4\xbe\xa0\x1a\x53\x97\x7f\x62\x00\x4c\xee\x1d\xfc\x30\x37\
+\xbc\xeb\x41\xb8\x49\x47\xd3\x5b\x36\x88\x70\x94\x98\xfd\x51\x51\
+\x4a\x75\x77\xff\xec\xa2\x3b\x0e\x4f\xe8\x6a\xa8\x6c\x9c\x58\x01\
+\xfc\x7b\xff\xd5\x97\x9c\x3e\x3d\xb5\xcd\x30\x8c\xdb\xc0\xfc\x1e\
+\x59\xf1\x3a\xec\x09\x78\xb5\xc1\x3c\xdc\xd3\xd3\xbd\x2b\x0e\x10\
+\xb1\x00\x98\x69\x7c\x8a\x68\x2b\x03\x97\xea\x68\xa4\x6a\x8c\xb8\
+\x40\xb4\x15\x40\x12\x1b\x7f\x36\xb8\x76\x83\x68\x0b\x00\x1e\xbd\
+\x66\x49\xc5\xfb\xcf\x03\x49\xfa\xc5\x07\x8e\x18\xc2\xd1\x14\xb0\
+\x63\x69\xde\x7d\x22\xd0\x56\xc1\x20\x72\x00\xfe\x34\x92\x61\x3c\
+\xc6\xc0\x87\x14\x74\xc6\xe7\x4a\x78\x34\x9d\x77\x3f\x13\x95\x80\
+\x48\x01\xd4\x1c\xeb\x46\x10\x76\x33\xe3\x92\xa8\x0a\x68\x47\x5c\
+\x66\xbc\x60\x74\x35\xae\x37\xef\x7a\xfe\x75\xdd\xf9\x22\x03\x50\
+\x75\x72\x9f\x05\xf8\xbb\xba\x05\xc7\x19\xcf\x63\x6c\xec\x2b\xb8\
+\x4f\xeb\xd4\x10\x09\x80\xc9\x51\xeb\x61\x8f\x71\x8f\x4e\xa1\x49\
+\x89\x45\xe0\x2f\x98\x76\xf9\xeb\xba\xf4\x68\x07\x50\x1b\xb5\x0e\
+\x30\x63\x83\x2e\x81\x49\x8c\xa3\x73\x24\x68\x05\x50\x75\xac\xbd\
+\x00\xee\x4c\x62\xd3\x74\x6b\x62\x0f\xd7\x65\x86\xdc\x67\x55\xe3\
+\x6a\x03\x50\x1d\xb5\xee\x05\xe3\x3b\xaa\x82\xce\x27\x7f\xf2\x78\
+\xad\x39\x54\x1e\x53\xd1\xac\x05\x40\xa5\x98\xbd\x95\x88\x7e\xa0\
+\x22\xe4\x7c\xf4\x65\xc6\x29\xa4\xbc\x6b\x32\x5b\xc6\x7f\x1b\x56\
+\xbf\x32\x80\x53\x7b\x72\xeb\x1a\x1e\x1f\x0c\x2b\x60\x01\xf8\xbd\
+\x6c\x18\xc6\x2d\xbd\x5b\xc6\x5e\x0a\x53\x8b\x12\x80\xaa\x93\x1d\
+\x60\xd0\x2f\x09\xb8\x30\x4c\xf2\x73\x7c\x08\xfb\x19\x78\xa6\xa7\
+\xdb\x73\x99\x7b\x1a\x8d\xa9\xfa\xea\x06\xf3\x1a\x83\xe8\x4b\xa1\
+\xe2\xeb\x8e\x37\x8f\x08\x06\x9e\xc8\xd8\xee\xed\x61\x34\x86\x06\
+\xf0\xda\x5e\xeb\xb2\xee\x06\x7e\x01\x60\x65\x98\xc4\x67\xfb\x30\
+\xe1\xd6\x4c\xde\x7d\x72\xae\x58\x95\x62\x6e\x1d\x91\xdc\x28\xd3\
+\x1d\x2f\xa8\x46\x83\xf8\x96\xde\x7c\xf9\xc7\x41\x76\x67\xef\x0f\
+\x0d\xa0\x52\xb4\x76\x12\xe1\x01\xd9\x84\x73\xd9\xb3\xe1\xad\x09\
+\x3a\x8e\x56\xf6\x0c\xac\x26\xcf\xf8\x8d\x48\x3e\xdd\xf1\x44\x72\
+\x12\x50\x32\x6d\x77\x50\xc4\x76\xb6\x4d\x28\x00\x93\xfb\xb2\xef\
+\xf5\xea\x34\x0e\xa0\x57\x36\xe1\x1c\xbf\x80\xdd\xa6\xed\x6e\x13\
+\x89\x53\x73\xac\x5d\x0c\x7c\xa2\x95\x2d\x01\x5a\xe3\x89\xe8\x9a\
+\xb1\x21\xa6\xfb\xcd\x42\xe9\x5b\x52\x3e\x32\xc6\x33\xb6\xd5\x62\
+\xf6\x51\x10\x7d\x2a\x8c\xef\x39\x3e\x1e\xdd\x99\x1e\x2a\xed\x17\
+\x89\x55\x1d\xc9\xdd\x01\x83\xf7\xb5\xb4\xd5\x1d\x4f\x44\xd8\xb4\
+\x4d\xf3\x7e\x74\xbd\x31\x98\xd9\xfa\xfc\x51\x51\x37\xe9\x11\x50\
+\x1d\x1e\xc8\x22\x65\xb8\xa2\x09\x82\xec\x3c\xe2\xcb\xfb\xf2\xe5\
+\x63\x41\x76\xfe\xfe\x93\xa3\xd9\x77\x1a\x4c\x2d\x8b\xd3\x1d\x4f\
+\x44\xd7\x5b\x6c\x24\x57\x4f\xe5\x01\x38\xb9\xfd\x00\x6f\x96\x16\
+\x36\x8f\x43\x57\x77\xd7\xa5\xa2\xb7\x02\xfd\x1b\x3a\xf5\xa9\xfa\
+\xab\xad\x72\xeb\x8e\x17\xa2\xce\x5a\x8a\xea\x2b\x96\xe6\x7f\xed\
+\x3f\xa5\x11\xb8\x49\x01\x08\x33\x1b\x09\x52\x40\xc0\x06\xd3\x76\
+\x7f\x1a\x64\xe7\xef\xf7\x97\xb7\xfd\x69\x6a\xc0\x39\x40\x6b\x3c\
+\x11\x5d\x73\x1c\x56\x3f\x9d\x1e\x2a\x3d\x26\xe2\x2b\x05\xa0\xea\
+\x58\x07\x00\xbd\x0b\x6d\x1e\xf3\x97\xfb\x0a\xe5\x87\x44\xc4\x9e\
+\x2c\x66\x1f\x0a\xba\x26\xd0\x1d\x4f\x44\xd7\x39\x36\x84\x43\xe9\
+\xbc\x7b\x83\x88\xaf\x30\x80\x5a\x71\x70\x05\x93\xf7\x47\x91\xa0\
+\xb2\x36\xcc\x74\x43\xa6\x50\xf2\x9f\xdb\x99\x77\x93\x19\x7d\xba\
+\xe3\xc9\xd6\xe3\xdb\x73\xa3\x71\x85\xc8\xc9\x58\x1c\xc0\x68\xee\
+\x73\xcc\x2c\x35\xc5\x92\x11\xde\x6a\xee\xee\xdf\xd6\xf4\x60\x48\
+\x5d\xea\xeb\x8e\x27\x53\x4b\x13\x00\xf0\x60\xc6\x76\x77\x06\xf9\
+\x89\x03\x70\xac\x67\x19\xb8\x36\x28\xa0\xca\x7e\x7f\x0e\xcf\x1e\
+\x1d\xf1\x52\xde\xe1\x0b\xba\xb9\x7e\x7a\xca\xb0\xd8\xe3\x55\x41\
+\x87\x9d\xf9\x72\xea\x8e\x27\x53\x1b\x33\x7e\x97\x29\xb8\xef\x0f\
+\xf2\x11\x02\x70\x72\x24\xf7\x0e\xc3\x60\xa1\xa9\x62\x50\xc2\xc5\
+\xb4\xbf\x0e\x6f\xd5\x32\x7b\xfc\x0f\x01\x93\x86\xe0\x96\x54\x9d\
+\xec\x7d\x00\x7d\x3b\xd8\xb2\x63\x31\xbb\x03\xcc\xb4\x29\x53\x28\
+\x3d\xa5\x0c\xa0\xe6\xe4\x0e\x33\x78\x6d\xa7\xbd\xd2\x1d\xb8\x3b\
+\x6d\xbb\x8f\x28\x01\xf8\xc7\xf0\xc0\xf2\x25\x29\x43\xe8\xa2\x42\
+\x5a\xde\x02\x77\x20\x60\xa7\x69\xbb\x0f\x2a\x01\x10\xb9\xf8\x99\
+\x37\x41\x9b\xd6\xe3\xb5\x71\xd4\xac\x97\x88\xf6\x98\xf9\x52\x5e\
+\x09\x40\xc5\xc9\x0e\x11\x68\x58\xb6\xc8\x76\xaf\xc7\xcb\xea\x3b\
+\xdb\x3e\x12\xbd\x02\x17\x64\x81\xb3\xa0\xaa\x93\xdb\x01\xf0\x57\
+\x64\x0a\x8c\x63\x3d\x5e\x46\xdf\x39\xcd\xd7\x7c\x3f\x62\x26\x3e\
+\x01\x2f\x9a\xb6\x7b\x95\xd2\x08\xa8\x3a\xd6\xf7\x00\x08\x3f\x1b\
+\x19\xe7\x7a\x7c\x18\x08\x11\xeb\x7d\xfd\xcc\x49\xf8\x62\x25\x00\
+\x35\xc7\x7a\x92\x81\x4d\xc2\xc5\xc5\xb8\x1e\x2f\xac\x71\xb6\x61\
+\x84\x7a\x09\x78\xc3\xb4\xdd\x25\x8a\x00\xe4\xa6\xa0\xb1\xaf\xc7\
+\x4b\x52\x88\x58\xef\xdf\xd2\xb6\xfb\x2e\x25\x00\x55\xc7\xfa\x33\
+\x80\x77\x8b\xd6\x95\x80\xf5\x78\x51\xa9\x4d\xbb\x88\xf5\x1e\x4e\
+\xdb\xee\x07\x55\x01\x4c\x02\x58\x2a\x5a\x95\xee\xf5\x7d\xd1\xbc\
+\x61\xed\x22\xd6\xfb\xfd\xb4\xed\x7e\xbc\xad\x00\x12\xb1\x1e\x2f\
+\x41\x23\x4a\xbd\x0c\x7c\x33\x63\xbb\x9f\x57\x05\x20\x75\x08\xf2\
+\x93\x25\x61\x3d\x5e\x82\x41\x64\x7a\x3d\xc6\x7d\x7d\x05\xf7\x61\
+\x25\x00\x61\xd7\x81\xe2\x5e\x8f\x97\x01\xd0\xfc\xd1\xb4\xb8\x16\
+\x08\x73\x3f\xc2\x8f\x69\x80\x3e\xd6\x6b\x97\x7e\xa4\x08\x40\x72\
+\x1a\x3a\x2b\x5b\x9c\xeb\xf1\xb2\x00\x7c\x7b\xdd\x7a\x89\x8d\x95\
+\x66\x61\xec\x65\x25\x00\xb2\x17\x62\x61\x0a\x5f\xa0\x3e\x81\x33\
+\xa0\x69\xe8\xad\xcb\x0f\xb3\x14\xb1\x40\x1b\x2a\x55\x16\x81\xb7\
+\x98\x76\xd9\x7f\x61\xa5\xe5\x16\xb8\x16\x14\x76\x31\x2e\x28\xf1\
+\x42\xde\x4f\x84\xd3\x5e\x4f\xaa\x3f\x73\xfb\x91\x93\x41\x75\x06\
+\x02\x50\x5a\x8e\x0e\xca\xbe\x40\xf7\x33\xa3\x98\x29\xb8\x43\x22\
+\xe5\x05\x03\xd8\xb5\xfa\x62\xee\xee\xf9\xa7\x48\xb0\x8e\xcd\x9b\
+\x1d\x20\xe6\x9b\xcd\x42\xd9\x7f\x86\x2a\x70\x0b\x04\xe0\x47\xa8\
+\x3a\xd6\xcf\x01\x5c\x17\x18\xad\x63\xe0\xb7\xff\x40\xda\x2e\xdd\
+\x2c\xda\x0a\x21\x00\x95\xa2\x55\x20\xc2\x88\x68\xd0\x45\x6c\xe7\
+\x52\xaa\xb1\x41\xe6\x8d\x7a\x21\x00\xaf\x3d\x6e\x5d\xd6\x7d\x01\
+\xfe\xbe\x88\x1b\x1b\x5c\x3a\xe3\x2f\xd4\x95\x5a\x6f\xde\x75\xe4\
+\x4f\xc1\xc6\xff\xb7\x10\x02\x30\x7d\x18\xd2\xfe\x5c\xa8\x8c\xd0\
+\x64\xdb\x52\x85\xc0\xeb\x4d\xdb\x2d\xc9\xea\x14\x06\x30\x39\x9a\
+\xfd\xa4\xc7\xf4\xb8\x6c\x82\x45\x60\x5f\x23\xe2\xcd\x66\xbe\xdc\
+\xf2\xa9\xed\xf9\xfa\x20\x0c\xa0\xe2\xac\xbd\x82\xd0\xf8\xeb\x22\
+\x68\xa8\x4c\x89\x07\x99\x8d\x1d\x99\xc2\x98\xd0\xbb\x6b\x73\x05\
+\x16\x06\xe0\x3b\xd7\x9c\xdc\x4f\x18\x7c\x93\x8c\xc2\x85\x6a\x2b\
+\xb3\x8c\xdd\xaa\x07\x52\x00\x2a\x23\xd6\x47\xc8\x68\xbe\x9a\xba\
+\x98\x37\xff\xd7\xbe\x23\x6d\xbb\x5a\x5e\x4e\x97\x02\x30\x3d\x0a\
+\x86\x19\x2c\x74\x95\xb7\x90\x28\x11\xf0\x1c\x83\x0f\xd4\x7b\xb8\
+\xb8\x6c\xf3\x78\x4d\x57\x6d\xd2\x00\x26\x47\x72\x57\x7a\x06\x97\
+\x01\x5c\xa4\x4b\x44\x52\xe3\x9c\x79\x1a\xe4\xf7\xcc\xfc\x54\x17\
+\xf1\x0f\x7b\x03\x9e\x72\x0e\x5b\x83\x34\x80\xe6\x28\x28\xe6\xbe\
+\xca\xc4\x2d\x9f\x79\x0c\x2b\x28\x06\xbf\x2a\x11\x8e\x03\x38\xce\
+\xc0\x2b\x04\x1c\xf7\x98\x5f\x49\x81\x5f\x8c\xaa\xe9\xb3\x6b\x0c\
+\x05\x60\x72\x5f\xee\x6d\xde\x14\x97\x41\xb8\x3c\x86\x86\x09\xa7\
+\x64\x60\x5b\xc6\x76\x77\x0b\x3b\xc4\x60\x18\x0a\x40\xf3\xc2\x6c\
+\xd4\xba\x07\x8c\x96\xf7\x3b\x63\xa8\xe7\x2d\x29\xd3\xb6\x1b\xba\
+\xbe\x76\x69\x57\x12\x58\x1d\xb5\x0e\x82\xb1\xae\x5d\x62\x65\xf3\
+\xb4\x7a\xe0\x56\x36\x56\x54\xf6\x4a\x00\x4e\xed\x1d\xb8\xaa\xd1\
+\x30\xfc\xb7\x1b\x97\x47\x25\x50\x25\x2e\x11\x9e\x31\xf3\x6e\xa2\
+\xaf\x5b\x94\x00\x34\x0f\x45\x22\xdf\x6f\x50\xe9\xa2\xa2\xaf\xcc\
+\x83\x57\x8a\xa9\x42\xb9\x2b\x03\xf0\xb3\x56\x1c\xeb\x1b\x04\xdc\
+\x1f\x4a\x41\xc4\x4e\x49\x1f\x05\x5a\x00\x4c\x9f\x94\x13\x7b\x3e\
+\x48\xf2\x28\xd0\x06\xa0\x09\xc1\xb1\xfc\x77\xc9\x12\x77\x3e\x48\
+\xf2\x28\xd0\x0a\x60\x7a\x24\x1c\x07\xe3\xed\x11\x1f\x59\xa4\xc2\
+\x13\xe1\x25\x33\xef\x5e\x29\xe5\xd4\x26\x63\xed\x00\xa6\x47\x82\
+\xff\xc9\xf7\xdb\xda\x54\x83\x48\x9a\x7f\xa5\x6d\x77\x99\x88\x61\
+\xbb\x6d\x22\x01\x90\xc0\x0b\xb5\x53\x69\xdb\x55\xfe\xbc\x5a\x14\
+\x70\x22\x03\x30\x3d\x12\xfc\x51\x10\xe9\x3f\x40\x10\x69\x0a\x81\
+\x8e\x98\x76\xe9\x6a\x11\xdb\x76\xdb\x44\x0a\xa0\x39\x45\xf5\xef\
+\x21\x10\x86\x63\x5e\x37\x7a\x24\x6d\xbb\x77\xb7\xbb\xb9\x22\xf9\
+\x22\x07\xe0\x8b\xf0\x97\xb0\x1b\xc4\xf7\x12\xa1\x20\x22\x2a\x02\
+\x9b\xc0\x4f\x06\x44\x90\x53\x28\x64\x5b\x00\xcc\x28\xa9\x39\x56\
+\x8e\xc1\xdb\x01\xd2\xf6\xcd\x39\x91\x2a\x99\xbc\x75\x99\xfc\xb8\
+\xff\x70\x59\xe2\xb6\xb6\x02\x98\xa9\xbe\xe2\xe4\xae\x05\x78\x3b\
+\xc9\xbc\xfe\x1a\xb2\x75\x04\xec\x35\x6d\x77\x4b\x48\xf7\xc8\xdd\
+\x62\x01\x30\x53\x55\xb5\x98\xfd\x28\x88\xb6\xeb\xfe\x0e\xdd\x4c\
+\x7c\xff\xeb\xe6\x99\x42\x32\x67\x3f\x33\x1a\x63\x05\xf0\xbf\x43\
+\x53\x71\x70\x05\x0c\x5e\x0f\xe6\xf5\x7a\xbf\xca\xc5\xd9\xb4\x5d\
+\xf6\xbf\xf0\x9b\xd8\x2d\x11\x00\x66\x77\xe7\xcd\xaf\x73\x79\x1b\
+\x09\xc6\xc6\xb0\xdf\x28\x22\xc6\x17\xcd\x82\xfb\xb5\xc4\x76\x7d\
+\x96\xb0\xc4\x01\x98\xdd\x34\xff\x5b\x45\x17\xa6\x8c\x0f\x78\xe0\
+\x7e\x82\xd1\x0f\xcc\xfa\x77\xb6\xe0\xe6\xbf\xb2\x3d\xf3\x88\x48\
+\x1d\xc0\x31\x22\x1c\x23\xe0\x18\x1a\xf4\x74\xef\x50\xe9\x57\xe7\
+\x43\xf3\x7d\x8d\x89\x06\x70\xbe\x34\x51\x45\x67\x07\x80\x4a\xf7\
+\x34\xf8\x76\x00\x68\x68\xa2\x4a\x88\x0e\x00\x95\xee\x69\xf0\xed\
+\x00\xd0\xd0\x44\x95\x10\x1d\x00\x2a\xdd\xd3\xe0\xdb\x01\xa0\xa1\
+\x89\x2a\x21\x3a\x00\x54\xba\xa7\xc1\xf7\xbf\x6d\x0a\x25\x9d\xe7\
+\xb4\xaf\x3d\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x05\x99\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x60\x00\x00\x00\x60\x08\x06\x00\x00\x00\xe2\x98\x77\x38\
+\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x05\
+\x53\x49\x44\x41\x54\x78\x5e\xed\x5d\x4b\xc8\x96\x45\x14\x7e\x9e\
+\xc4\x36\x15\xe9\xa2\x3b\x18\x64\x16\x45\x45\x91\x97\x4d\x48\x06\
+\x5e\x0a\x4b\x08\x6a\xd5\x05\xca\x72\x51\x41\xa6\x8b\x5c\x88\x42\
+\x8b\x02\x4b\x25\x6a\xa1\xe9\xc2\xcb\x2a\x57\xa9\x74\xb1\x45\x12\
+\xb4\xa8\x8c\xa2\x22\xd1\x32\x48\xca\x32\x82\x6e\xba\x28\xc9\xd3\
+\x1c\x78\x95\x2f\xff\xef\xf7\x3f\xef\xf7\xce\xcc\xf9\xd2\x33\xf0\
+\xf1\xff\xf0\x3f\x33\xe7\xcc\x79\xe6\x3c\xf3\xce\x7c\x33\xef\x4f\
+\x44\x71\x8d\x00\x5d\xad\x87\x71\x04\x01\xce\x83\x20\x08\x08\x02\
+\x9c\x23\xe0\x6c\x3e\x32\x20\x08\x70\x8e\x80\xb3\xf9\xc8\x80\x20\
+\xc0\x39\x02\xce\xe6\x23\x03\x82\x00\xe7\x08\x38\x9b\x8f\x0c\x38\
+\x1b\x09\x10\x91\xb9\x00\xee\x05\x70\x07\x80\xbf\x00\xec\x02\xb0\
+\x81\xe4\x57\x35\xe2\x21\x22\xd7\x03\x78\x04\xc0\x6d\x00\xa6\x00\
+\x78\x07\xc0\x6e\x92\xeb\x6b\xd8\xef\xb5\x51\x3d\x03\x44\x64\x03\
+\x80\x47\xfb\x74\xf4\x0f\x00\x6b\x48\xae\x2c\x19\x04\x11\x59\x91\
+\xda\x1f\xcd\xc6\x2e\x92\x3a\x38\xaa\x95\xaa\x04\x88\xc8\x52\x00\
+\xab\xc6\xe8\xdd\x5c\x92\x9a\x11\xd9\x8b\x88\x5c\x01\xe0\xfb\x31\
+\x1a\x5e\x54\x33\x13\xaa\x11\x20\x22\x13\x00\xfc\x6a\x88\xea\x07\
+\x24\x55\x1a\xb2\x17\x11\x79\x19\xc0\x53\x86\x86\x27\x92\xfc\xcd\
+\x80\xeb\x0c\xa9\x49\xc0\xcd\x00\x3e\x35\x78\xfc\x0b\xc9\x8b\x0c\
+\xb8\xd6\x10\x11\xf9\x1a\xc0\xd5\x86\x8a\xb7\x90\xfc\xcc\x80\xeb\
+\x0c\xa9\x49\xc0\xed\x00\xde\xb3\x78\xcc\x34\x11\x58\x70\x6d\x31\
+\x49\xff\xc5\x58\x67\x16\xc9\xdd\x46\x6c\x27\x58\x91\x8e\xf6\xf3\
+\x48\x44\x82\x80\x3e\x81\x09\x02\xfa\x8f\xdf\xc8\x80\x4e\x79\x3d\
+\x4a\xe5\x90\xa0\x98\x03\x46\x0c\x8d\x90\xa0\x90\xa0\x91\x11\x88\
+\xa7\xa0\x02\x02\x1c\x4f\x41\xfd\x83\x1a\x12\x14\x12\x14\x12\x54\
+\x40\x70\x46\x36\x19\x12\x14\x12\x84\x58\x07\xc4\x3a\x20\xd6\x01\
+\x46\xbd\x8d\xad\x08\x63\xa0\x5a\xc1\x42\x82\x42\x82\x42\x82\x8c\
+\x29\x13\x12\x64\x0c\x54\x2b\x58\x48\x50\x48\x50\x48\x90\x31\x65\
+\x42\x82\x8c\x81\x6a\x05\x0b\x09\x0a\x09\x0a\x09\x32\xa6\x4c\x48\
+\x90\x31\x50\xad\x60\x21\x41\x21\x41\x21\x41\xc6\x94\x09\x09\x32\
+\x06\xaa\x15\x2c\x24\x28\x24\xc8\x55\x82\xa6\x03\xf8\xd0\x32\x64\
+\x87\xe0\x54\xc4\x0c\x92\x1f\x59\x7c\xed\x8a\xa9\xf9\xa5\xfc\x55\
+\x00\x0e\x18\x1d\x9e\x42\xf2\x1b\x23\xd6\x04\x13\x11\x3d\x15\xad\
+\xa7\xa3\x2d\x65\x32\xc9\x6f\x2d\xc0\xae\x98\x9a\x04\x5c\x08\xc0\
+\x7a\xe6\x7e\x1e\x49\xbd\x36\x94\xad\x34\xd7\xa2\xde\x36\x36\x38\
+\x81\xe4\xef\x46\x6c\x27\x58\x35\x02\xd4\x4b\x11\xf9\x1b\xc0\x78\
+\x83\xc7\x4f\xa6\x3b\x02\xaf\x1a\x70\x66\x88\x88\x3c\x01\xe0\x15\
+\x43\x85\x63\x24\xcf\x35\xe0\xb2\x40\x6a\x13\x70\x08\xc0\x65\x06\
+\xcf\xf5\xae\xd8\x33\x06\x9c\x19\x22\x22\xab\x01\x2c\x36\x54\xf8\
+\x31\x5d\x51\xba\xdc\x80\xcb\x02\xa9\x4d\xc0\x17\x00\x6e\x30\x78\
+\xbe\x83\xe4\x3d\x06\x9c\x19\x22\x22\xdb\x01\xdc\x6d\xa8\xf0\x25\
+\xc9\x1b\x0d\xb8\x2c\x90\xda\x04\xe8\x0d\x19\xbd\xa8\x61\x29\x53\
+\x49\x7e\x62\x01\x8e\x85\x11\x91\x5b\x01\xec\x19\x0b\xd7\xfc\x5d\
+\xaf\xab\xce\x32\x62\x3b\xc3\x6a\x13\xf0\x10\x80\x4d\x46\xaf\xd7\
+\x93\x5c\x64\xc4\x9e\x16\x26\x22\xeb\x00\x3c\x6e\x6c\xeb\x61\x92\
+\x9b\x8d\xd8\xce\xb0\xda\x04\x9c\xdf\x3c\x09\x8d\x33\x7a\xde\x39\
+\x0b\x5a\x8e\xfe\x7f\x00\xe8\x13\xd0\x11\xa3\x7f\x9d\x61\x55\x09\
+\x50\x6f\xd3\x5d\xdd\xd7\xd2\x5d\xdd\x85\x46\xcf\x3b\x67\x41\xcb\
+\xd1\xaf\xb7\xf5\x1f\x33\xfa\x96\x05\xe6\x41\x80\x4e\xae\x6f\xb4\
+\xf0\x7e\x35\xc9\x25\x2d\xf0\x27\xa1\x22\xf2\x12\x80\x36\x4f\x53\
+\x0b\x48\xea\x64\x5d\xad\x78\x10\x70\x0e\x80\xfd\x00\x26\xb7\xe8\
+\xa5\x6a\xf2\x73\xd6\xd5\x71\xb3\xea\x5d\x0e\x40\xe7\x1c\x6b\xd1\
+\x55\xfa\x35\x24\x8f\x5b\x2b\xe4\xc0\x55\x27\xa0\x91\x21\x1d\xd1\
+\x2f\x0e\xd0\x81\xb7\x12\x71\x5b\x74\x4f\xe9\xd4\xad\x02\x11\xd1\
+\xad\x8e\x19\x69\xbb\xe3\xc1\xf4\xf7\x3b\x07\x68\x7b\x29\x49\xcd\
+\x98\xaa\xc5\x85\x80\x86\x04\x7d\x1f\xc4\xec\x0e\xbd\x3d\x06\x60\
+\x5f\x53\xff\x5a\xe3\x0a\x7b\x34\x73\xef\x92\x9c\xd3\xc1\x97\x81\
+\xab\x7a\x12\x60\xbe\xb8\x3d\x70\xef\xec\x15\xab\x7d\x01\x73\xaa\
+\x4b\x6e\x04\x34\x59\xf0\x3c\x80\x67\xed\x71\x2a\x82\x7c\x81\xe4\
+\xb2\x22\x2d\x1b\x1a\xf5\x26\xe0\x82\xf4\xd2\xa6\xf7\x01\xe8\x8b\
+\x3c\x3c\x8a\xbe\x90\x63\x66\x7a\xca\xfa\xd3\xc3\xb8\xda\x74\x25\
+\xa0\xc9\x82\x8b\x01\x6c\x4c\x5b\x05\xf3\x2b\x07\x61\xa7\xbe\x38\
+\x8a\xe4\xcf\x95\xed\xfe\xc7\x9c\x3b\x01\x27\xbc\x11\x91\x35\x69\
+\x95\xfc\x74\xa5\x60\xac\x4d\xfb\xfd\x96\x9d\xd1\xe2\xee\x0c\x0d\
+\x01\x4d\x36\x28\x01\x4a\x44\xc9\xb2\x98\xe4\xda\x92\x06\xda\xb4\
+\x3d\x54\x04\x34\x24\xdc\x05\xe0\xbe\xe6\x73\x5e\x9b\xce\x9c\x06\
+\x7b\x14\xc0\x36\xfd\x90\x7c\x33\x53\x9b\x59\x9a\x19\x3a\x02\x7a\
+\x24\x69\x62\xb3\xa8\x7a\x00\xc0\xb4\x01\x7b\xfb\x71\x7a\x43\xd6\
+\x56\x5d\xbc\x91\xb4\xbc\x2e\x6d\x40\x33\x83\x57\x1b\x5a\x02\x7a\
+\xbb\x24\x22\xd7\x01\xb8\x09\xc0\x24\x00\x57\xf6\xfc\xd4\xdf\xb5\
+\x7c\xd7\x7c\x0e\xf6\xfc\xfc\x9c\xe4\xde\xc1\x43\x53\xa7\xe6\xff\
+\x82\x80\x3a\xa1\xf0\xb1\x12\x04\xf8\xc4\xfd\xa4\xd5\x20\x20\x08\
+\x70\x8e\x80\xb3\xf9\xc8\x80\x20\xc0\x39\x02\xce\xe6\x23\x03\x82\
+\x00\xe7\x08\x38\x9b\x2f\x96\x01\x22\xa2\x5f\xbc\x4f\x05\x50\xed\
+\x98\x5f\xa1\x58\xea\x71\xca\x3d\x24\x17\x94\x68\xbf\x08\x01\x2d\
+\x6e\xa2\x94\xe8\x53\xb1\x36\x4b\xdc\x5b\xc8\x4e\x40\xfa\xef\x14\
+\xaf\x37\x1b\x69\xc5\x02\xe1\xd8\xb0\x6e\xe6\xdd\x9f\xd3\x7e\x09\
+\x02\x7e\x02\x70\x49\x4e\x27\x87\xa8\xad\xc3\x24\x2f\xcd\xe9\x4f\
+\x09\x02\x7e\x38\x03\x74\x7f\xb4\x18\x1f\x22\xa9\xff\x85\x23\x5b\
+\x29\x41\x80\x4e\xbe\x59\x8f\x96\x67\xeb\x6d\xf7\x86\xb6\xe7\x9e\
+\x8c\xb3\x13\xa0\x7d\x8c\x49\xd8\xce\x74\x11\x02\x1a\x12\x74\x32\
+\x9e\x79\x06\xcc\x07\x87\xf5\xe4\x46\xee\xc9\xf7\x04\x45\xc5\x08\
+\xb0\x8f\x81\xb3\x1b\x19\x04\x38\xf3\x1f\x04\x04\x01\xce\x11\x70\
+\x36\x1f\x19\x10\x04\x38\x47\xc0\xd9\x7c\x64\x40\x10\xe0\x1c\x01\
+\x67\xf3\x91\x01\x41\x80\x73\x04\x9c\xcd\x47\x06\x04\x01\xce\x11\
+\x70\x36\xff\x2f\x04\x49\x1f\x7f\x7d\xf7\xa2\xd0\x00\x00\x00\x00\
+\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x05\x7b\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x60\x00\x00\x00\x60\x08\x06\x00\x00\x00\xe2\x98\x77\x38\
+\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x05\
+\x35\x49\x44\x41\x54\x78\x5e\xed\x9c\x4d\x88\x1c\x45\x18\x86\xdf\
+\xaf\x47\x25\xe2\x41\xf4\x62\xec\xac\x38\x07\x33\x33\x18\x50\x41\
+\x50\x11\x22\x8a\x53\xd1\x48\xd4\xa0\x11\xc4\xdc\xc4\x83\x88\x78\
+\x11\x24\x87\x85\x6c\xc8\x41\xf0\xe0\x25\x42\x6e\xe6\xa4\x82\xa0\
+\xb0\xb2\x12\x27\xb3\xf8\x03\x8b\x3f\x98\x8b\x8a\xa6\x7b\x14\x9d\
+\x68\xa6\x36\x17\x43\x92\x93\x3f\xb3\x53\xd2\x19\x82\x1b\xd8\xd9\
+\xae\xda\xa9\xaa\xaf\xbb\xb7\xe6\xfc\x75\xbd\x55\xcf\x33\xd5\xdd\
+\x53\x5d\x3d\x84\xf0\x61\x25\x40\xac\xe9\x21\x1c\x41\x00\xf3\x97\
+\x20\x08\x08\x02\x98\x09\x30\xc7\x87\x19\x10\x04\x30\x13\x60\x8e\
+\x0f\x33\x20\x08\x60\x26\xc0\x1c\x1f\x66\x40\x10\xc0\x4c\x80\x39\
+\x3e\xcc\x80\x20\x80\x99\x00\x73\x7c\x98\x01\x41\x00\x33\x01\xe6\
+\xf8\x30\x03\x82\x00\x66\x02\xcc\xf1\x85\x99\x01\x5f\xce\xcc\x5c\
+\x7b\xe1\x3a\x6c\xbf\x7a\x65\x38\xac\x0d\xb7\xfc\xfa\x50\xbf\xff\
+\x17\x33\x1b\x2f\xf1\x85\x10\xd0\x6d\xc4\x2f\x2b\xe0\x35\x22\xdc\
+\x92\x8d\x5a\x29\xfc\x41\xc0\x1b\xa2\x27\xdf\xf2\x42\x81\x31\x84\
+\x5d\x40\xa7\x11\xcf\x45\x84\x83\x13\x18\x3c\x2f\x52\x79\x8c\x91\
+\x8f\xf3\x68\x56\x01\x39\xf0\xb3\xc1\x7f\x2f\x52\x79\xa7\x73\x0a\
+\x8c\x01\x6c\x02\x34\xe0\x5f\xc2\x22\x52\xc9\xd6\x47\x1f\x5e\x58\
+\x06\xa7\x0b\x1f\x40\x2a\x52\xd9\xf2\x01\x82\x2b\xc3\xbb\x00\x03\
+\xf8\x80\xc2\x9c\xe8\xc9\x43\x5c\x70\x7c\xe4\x7a\x15\x60\x04\x1f\
+\xf4\x85\x48\x07\x0f\xfa\x80\xc0\x99\xe1\x4d\x80\x21\xfc\x6f\x45\
+\x3a\xb8\x87\x13\x8c\xaf\x6c\x2f\x02\x8c\xe0\x93\xfa\x46\x24\xcb\
+\xf7\xf9\x02\xc0\x9d\xe3\x5c\x80\x11\x7c\x60\x49\xa4\x72\x27\x37\
+\x14\x9f\xf9\x4e\x05\x98\xc0\x27\xe0\xd3\x76\x2a\x1f\xf6\x39\xf8\
+\x22\x64\x39\x13\x60\x02\x1f\x40\x47\xa4\xf2\xd1\x22\x00\xf1\xdd\
+\x07\x27\x02\x8c\xe0\x2b\x2c\x88\x9e\x7c\xdc\xf7\xc0\x8b\x92\x67\
+\x5d\x80\x11\x7c\xa2\x0f\x45\x32\x78\xba\x28\x30\x38\xfa\x61\x55\
+\x80\x11\x7c\x8f\xa3\x25\xa0\xaf\xa0\xfa\xa4\xa8\xbf\x02\x9c\xa6\
+\x88\xfa\x84\x95\xbe\x48\xce\x7e\xee\xb1\x1b\x6b\x46\x59\x13\x90\
+\x2d\x29\x83\x70\x84\x7b\x40\x86\xf9\xbf\x01\xf4\x36\x88\xe6\x45\
+\x72\xe6\x07\xc3\x63\xad\x94\x5b\x11\xf0\x59\xbd\xbe\xe5\xdf\x6b\
+\xfe\xe9\x5d\x5e\xcf\xb7\xd2\x33\xdf\x8d\x10\x16\x95\x52\x0b\xc3\
+\x95\xbf\x8f\x3d\xf6\xcb\xb9\x8b\xbe\xe2\xad\x08\x58\xbc\x6d\xeb\
+\xed\xaa\x16\xfd\xe8\xab\xd3\x8e\x73\x4e\x82\xd4\xac\x48\x96\x3b\
+\x8e\x73\x2e\x35\x1f\x04\x4c\xa2\xec\x69\x21\xd0\x8a\x80\x4a\x9c\
+\x82\xd6\x16\xd1\x51\x50\xb3\xbb\xd2\xe5\x93\xae\x66\x83\x15\x01\
+\x59\xe7\x4a\x7a\x11\xd6\xe1\x7a\x91\x88\xf6\xb7\x93\xc1\x82\x4e\
+\xb1\x69\x8d\x35\x01\x59\x70\x51\x6f\x43\x4d\xa1\xac\x51\x7f\x1e\
+\x11\xed\x16\xa7\x06\x5f\x5b\x68\xeb\x8a\x26\xac\x0a\x30\x96\xe0\
+\xe9\x87\xd8\xf1\xd6\xd6\xfa\x55\x40\x5d\xa1\x56\x57\x23\x55\xaf\
+\x01\xfb\x14\x61\x87\x21\xcc\x9e\x8a\xa2\x3d\xbb\x4e\x9d\xf9\xd9\
+\xf0\xb8\x75\xcb\xad\x0b\x30\x96\xc0\xb4\x14\xd1\x69\xc5\xf7\xd7\
+\x46\x78\x4a\x11\xbd\x00\xa8\xeb\x35\xa1\x2e\x11\xd1\xde\x76\x32\
+\xf8\x53\xb3\x3e\xb7\xcc\x89\x00\x63\x09\x8c\x8b\x71\x9d\xd6\xcd\
+\x77\xd7\x54\x74\x58\x41\xed\xce\xa5\x35\x2e\x98\x17\xa9\xdc\xab\
+\x59\x9b\x5b\xe6\x4c\x80\xa9\x04\xee\xe5\xe8\x6e\x73\xdb\x2c\xa0\
+\x0e\xe7\x12\x1b\xdf\xbc\xef\x17\x89\x7c\x57\xab\x36\xa7\xc8\xa9\
+\x00\x53\x09\x60\x7e\x20\xd3\x6d\xc5\xcf\x41\xe1\x9d\x5c\xb0\x84\
+\x8f\x45\x22\xf7\xe4\xd6\x69\x14\x38\x17\x60\x2c\x81\xf9\x91\xe4\
+\x89\xe6\xb6\x17\x09\xea\x68\x2e\x3b\x85\x9d\xa2\x27\x97\x72\xeb\
+\xb8\x67\xc0\xe5\x7c\xb3\x5b\x54\x62\x7d\x28\xdf\x6d\xc4\x07\x40\
+\x78\x3d\x87\xdd\x51\x91\xca\x97\x4a\x23\xc0\x78\x26\x30\x6f\x4b\
+\xe9\x36\xe3\xe3\x00\xd6\x7b\x4a\x77\x01\x35\xdc\x21\x7e\x92\xbf\
+\x4f\x23\xc1\xcb\x29\x68\x75\x07\x4d\x66\xc2\x48\xe1\xd0\x23\x3d\
+\x39\x37\xcd\x00\x37\x7a\x6c\xa7\x11\x3f\x1b\x11\xde\x5b\xf7\x78\
+\x52\xfb\x44\xb2\xfc\xc1\x46\x33\xc6\xd7\x73\x86\x8f\x81\x04\xd6\
+\xad\x89\xdd\x46\xfc\x15\x08\x13\xb7\xc8\x10\xd1\xab\xed\x64\xf0\
+\xe6\x34\x08\x59\x04\x98\x9c\x8e\x38\x37\xe7\xe6\x5e\x0b\x14\x8e\
+\x88\x9e\x7c\xa5\x94\x02\x34\x25\xb0\x6e\x4f\xd7\xb8\x2d\xfd\x48\
+\xa4\xf2\xc9\xd2\x0a\xd0\x90\xc0\xfa\x82\x46\x67\xfb\xcc\xbd\x51\
+\x34\x9a\xb8\x00\x47\xc0\x77\xed\x54\xde\x55\x6a\x01\x59\xe7\x8b\
+\xfa\x8a\xd2\x27\x3b\x66\x6e\xac\x0d\x47\x13\xd7\x7d\x08\x38\xdf\
+\x4e\xe5\x0d\xa5\x17\x90\x0d\xa0\x88\x2f\xe9\x6d\x2a\x01\xd3\x7c\
+\x8b\x5c\x1d\xbb\x69\x4e\x41\xae\x00\x4e\xdb\xee\xa6\xb8\x08\x4f\
+\x0b\xc9\xe5\xf1\x95\xbf\x0d\x75\x09\xcf\x46\xdb\x95\xfe\x21\x66\
+\x03\x90\xcb\x36\x2a\xbd\x14\xe1\x12\x9c\xad\xb6\x2b\xbb\x18\x67\
+\x0b\x90\xcb\x76\x72\xcf\xfd\xe3\xf0\xf2\x2d\x47\xbb\x84\x66\xab\
+\xed\xca\x3e\x90\xb1\x05\xc8\x65\x3b\x1a\xb7\x9d\xe3\xf8\xb2\x3d\
+\x92\x74\x09\xcd\x56\xdb\x95\x7d\x28\x6f\x0b\x90\xab\x76\x2a\xbd\
+\x2d\xc5\x15\x34\x1b\xed\x56\x7e\x63\x96\x0d\x48\xb6\xda\x58\xbd\
+\x35\x91\x46\xea\x56\x02\x9e\xa9\xf4\xd6\x44\x1d\x70\x8b\xcd\xf8\
+\x7d\xa5\xf0\x00\x08\x37\xe9\xd4\x33\xd7\x94\x67\x73\xae\x0e\xa8\
+\x6e\x33\x56\x3a\x75\x05\xa9\x29\xcf\xf6\x74\x1d\x60\x27\x9a\xf1\
+\x3c\x01\x4f\xe8\xd4\x16\xa0\xa6\x3c\x2f\x68\xe8\xc2\xea\x36\xe3\
+\x01\x80\x58\xb7\x9e\xab\xce\xd7\x96\x18\xef\xbb\x22\x4a\x20\xa0\
+\x7c\x2f\xe9\x99\x7c\x4b\x0b\x7b\x0a\x2a\xf3\x6b\xaa\x26\x02\xb2\
+\xda\x02\x5d\x84\xab\xf1\xa2\xb6\xa9\x80\xac\xde\xe7\x6d\xe8\xea\
+\xbf\x2a\x50\xd9\xdf\x16\x44\x74\xba\x72\x7f\x55\xb0\x11\x09\xe1\
+\x18\xa6\xbd\xa1\x01\xfc\xff\x04\xbc\xdf\x05\x05\xf8\x57\x12\x08\
+\x02\x98\xbf\x11\x41\x40\x10\xc0\x4c\x80\x39\x3e\xcc\x80\x20\x80\
+\x99\x00\x73\x7c\x98\x01\x41\x00\x33\x01\xe6\xf8\x30\x03\x82\x00\
+\x66\x02\xcc\xf1\x61\x06\x04\x01\xcc\x04\x98\xe3\xc3\x0c\x08\x02\
+\x98\x09\x30\xc7\x87\x19\x10\x04\x30\x13\x60\x8e\x0f\x33\x20\x08\
+\x60\x26\xc0\x1c\xff\x1f\x43\x96\xfe\x70\xeb\x1d\x22\x41\x00\x00\
+\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x0b\x03\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x60\x00\x00\x00\x60\x08\x06\x00\x00\x00\xe2\x98\x77\x38\
+\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x0a\
+\xbd\x49\x44\x41\x54\x78\x5e\xed\x9c\x6b\x90\x14\xd5\x15\xc7\xff\
+\xa7\x1b\x56\xc4\x68\x69\xa5\xac\x04\x56\x4b\x49\xa5\x12\x09\xa1\
+\x4c\xd0\x58\x26\xb1\xac\x28\xe4\x65\x50\x0a\xa9\xcc\xce\xed\x59\
+\xc0\xa8\x58\x15\x30\xf9\x12\xc3\xf6\x42\xa8\x60\x12\x98\xde\x8d\
+\x7e\x52\xf9\x20\x6a\x78\xec\xf4\x1d\x5c\x08\xc1\x88\x5a\x89\x52\
+\x96\x95\x57\x05\x93\x40\x81\x86\x32\xa9\x18\xc3\x2b\x84\xa4\x54\
+\x08\xb0\xe2\x4e\x9f\xa4\x67\x76\x23\x59\xa6\xbb\xef\xed\xe9\x9e\
+\x59\x6a\x7b\xbe\xcc\x87\xfe\xdf\x73\xcf\x3d\xbf\xbe\x7d\x1f\x7d\
+\x6e\x13\xb2\x5f\x4b\x23\x40\x2d\xad\x3d\xab\x1c\x19\x80\x16\xdf\
+\x04\x19\x80\x0c\x40\x8b\x23\xd0\xe2\xea\xb3\x1e\x90\x01\x68\x71\
+\x04\x5a\x5c\x7d\xd6\x03\x32\x00\x2d\x8e\x40\x8b\xab\xcf\x7a\x40\
+\x06\xa0\xc5\x11\x68\x71\xf5\x59\x0f\x18\xab\x00\xbe\x55\xb2\xae\
+\x18\x67\xe2\x13\xa8\x60\x32\x19\x98\xc4\xc0\x64\x83\x70\x19\x33\
+\x2e\x03\x70\xf9\x50\x5c\xf6\x13\xe1\x80\xc7\x38\x40\xc0\x21\xf6\
+\x70\x18\x26\x0e\x0d\x56\xb0\xeb\xc1\x82\xfb\x46\x8b\x63\x97\x48\
+\xf5\x4d\xef\x01\xb6\x2b\x6e\x66\x42\x9e\x98\xf2\x20\x5c\x18\xab\
+\x15\x8c\xe3\x4c\x5c\x26\x46\xd9\xb1\xe4\x8e\x58\x36\x46\x49\xa1\
+\xa6\x00\x58\xba\xed\xce\x0b\xcd\x93\xef\xe4\x19\x9c\x07\x70\x73\
+\xc2\x6d\xdf\x41\xa0\x72\x65\xe2\x79\xe5\xde\x39\x4f\x1c\x4f\xd8\
+\x76\xea\xe6\x52\x07\x60\x97\xc5\x62\x62\x5a\xca\xc0\x15\x69\xb6\
+\x86\x80\x37\x98\xb8\xd7\xc9\xcb\x35\x69\xd6\x93\xb4\xed\x54\x01\
+\xd8\x52\x3c\x0e\xd0\x9d\x49\x3b\x1d\x6e\x8f\x9f\x70\x84\xbc\xab\
+\xb9\x75\xc6\xaf\x2d\x15\x00\xcb\xb6\x74\x4e\xf2\x4e\x57\x9e\x05\
+\xe8\xea\xf8\xae\x35\x52\x92\x77\x1b\x6d\xe6\x97\x57\xcf\xeb\x3b\
+\xdc\x88\x95\x66\x94\x4d\x1c\x40\x77\xb9\x30\x9b\x99\x7f\xda\x0c\
+\xe7\xa3\xea\x20\xa2\x5b\x8b\xf9\xd2\xd3\x51\xba\x56\x5e\x4f\x14\
+\x80\x5d\xb2\x56\xc2\xc0\x77\x5b\xd9\xa0\xb3\xea\xf6\x70\xbf\x53\
+\x70\x57\x8e\x2a\x9f\xce\x70\x26\x31\x00\xb6\xcc\x7f\x12\x30\x7e\
+\x1f\xa3\xa1\x3b\xc1\xb4\x95\x0d\x3e\x68\x32\x1d\x64\xf6\x0e\x56\
+\x2e\x38\xff\xa0\x6f\xc7\x3c\x71\xaa\x9d\xc8\x68\xaf\x10\xb7\x93\
+\x47\xed\x20\x9e\x0b\xe0\x53\xfa\x75\x78\x33\x1c\x51\xfe\x83\x7e\
+\xb9\xf4\x4b\x24\x02\x60\xe5\xd6\x3b\x2e\x1e\x18\x38\xfd\xa6\x86\
+\xbb\x27\x00\xfc\xc8\xab\x50\xa9\xb7\xb3\xf4\x1b\x8d\x72\x58\xda\
+\x57\xb8\xde\x30\xb9\x00\xe0\x6b\x00\x2e\x50\x2d\x3b\x61\x42\xdb\
+\x25\x2b\xe7\xae\x7b\x4b\x55\xdf\x2c\x5d\x22\x00\xec\xb2\xb5\x1d\
+\x8c\x5b\xd4\x9c\xa6\xf5\x26\x2a\x2b\x56\x89\xf2\x7e\x35\x7d\x7d\
+\xd5\x72\x99\xbf\xbc\x02\xf3\xfb\x00\x2f\x54\xb2\x43\x78\xc6\xc9\
+\xbb\x5f\x51\xd2\x36\x51\xd4\x30\x00\xdb\x15\x3f\x00\xd1\x72\x45\
+\x9f\x7b\x1c\xe1\xda\x8a\x5a\x25\x99\x2d\x2d\x07\x40\x97\x92\x98\
+\x79\x95\x63\xc9\xef\x28\x69\x9b\x24\x6a\x08\xc0\x52\x69\xdd\x65\
+\x00\x8f\xa9\xf8\x4a\x30\xe6\x14\x45\xdf\x53\x2a\x5a\x5d\x4d\xb7\
+\xec\xbc\x8d\xe1\x6d\x53\x29\xe7\x01\x77\xf7\x0a\xf7\x71\x15\x6d\
+\x33\x34\xb1\x01\xd4\xb6\x17\x06\xf6\xa8\xac\x70\x1d\xe1\xc6\xae\
+\x47\x27\x08\xb6\xb4\x38\x4a\xef\xaf\x98\x2b\x13\x27\x4c\x1f\x2d\
+\xdb\x16\xb1\x03\xd3\x2d\x0b\x8b\x18\xfc\x68\x54\x83\x2b\x64\x5c\
+\xf3\xc3\x7c\x9f\xf2\xec\xc8\x96\x62\x1b\x40\xd7\xd6\xec\xf2\xcb\
+\x8e\x90\x73\xa2\xea\x18\xbe\xfe\xed\x72\xe7\x0c\x93\xbd\xdf\x45\
+\xe9\x09\x74\x4f\x51\x94\xd6\x46\xe9\x9a\x71\x3d\x36\x00\x5b\x5a\
+\x2f\x44\x6e\xac\x31\x2f\x72\x2c\xa9\xf4\x88\xf2\x1b\x1b\x74\x07\
+\xeb\xf4\x20\xdb\x15\x77\x83\x28\x2a\xb8\x3b\x1c\xe1\xce\x6c\x46\
+\x80\xa3\xea\x88\x05\xc0\xdf\x52\x06\x91\x0f\x20\xf8\x47\xb4\xc6\
+\xc9\x97\x96\x44\x39\x30\x7c\xdd\x96\xd6\x93\x00\xbe\x1a\xa0\xef\
+\x77\x84\x9b\x53\xb6\x55\x2e\x3c\x02\xe6\xc5\xa1\x7a\xe6\x99\xa3\
+\x61\x2b\x3b\x16\x80\x2e\x29\x1e\x25\xd0\xa2\x90\x06\x9e\x1a\x7c\
+\xd7\x9c\xf6\xc0\x82\x8d\xaf\x2b\x07\x4d\x5a\x7f\x07\xf0\x81\x00\
+\xfd\x11\x47\xb8\x1f\x54\xb5\x75\xdf\x86\xf9\x53\xc6\x8d\xaf\xbc\
+\x02\xe0\xfc\xa0\x32\x0c\x5e\xdb\x23\xe4\x3d\xaa\x36\xd3\xd2\x69\
+\x03\xf0\xdf\x64\x8d\x27\xec\x09\x7f\x99\x42\x7d\x8e\x28\xcd\xd7\
+\x71\x3a\x6a\x00\xd5\x79\x0c\xd5\x1e\x67\x85\x8d\x00\x77\x06\xfa\
+\xc0\x38\xfe\x2e\x63\x7a\xab\xdf\xac\x69\x03\xb0\x65\x7e\x2e\x60\
+\xfc\x38\x34\xb8\x1e\x3e\xef\x14\xdc\xe7\x5b\x0a\xa0\x64\xcd\x82\
+\x81\x9f\x87\xfb\xe0\xdd\xee\x88\xf2\x56\x1d\x3f\x93\xd6\x6a\x03\
+\x58\x26\x0b\x4b\x3c\xf0\xc3\xc1\x8e\xf0\x5e\x47\xc8\xe9\xba\x8e\
+\x26\xdd\x03\x6a\xbd\x40\xec\x01\xe8\xe3\x41\xbe\x18\xa0\x7b\x57\
+\x8b\xd2\x23\xba\xbe\x26\xa9\xd7\x06\x60\x4b\xb1\x1a\xa0\xee\xe0\
+\xae\x4d\xcb\x1c\xab\x54\xd4\x75\x32\x15\x00\x6e\xa1\x1b\xc4\xab\
+\x43\x6e\x96\xa2\x23\xe4\x32\x5d\x5f\x93\xd4\xeb\x03\x70\xad\xf5\
+\x20\x2c\x08\x1c\xdc\x08\x0b\x7b\xf2\xee\x86\xa0\xeb\x67\xcc\xf3\
+\x27\x37\xd8\x90\x43\x51\xeb\x84\xae\xb2\xb5\x80\x18\xeb\x43\xc6\
+\x81\x0d\x8e\xe5\xaa\xed\x25\x35\xe8\x6c\x50\x71\x6d\x00\x5d\xd2\
+\x7a\x9e\x80\xc0\x39\xb4\x01\x9a\xb5\x5a\x94\xea\x4e\x51\xa3\xee\
+\xf2\xb8\x6d\x0c\x1a\xa0\x97\xc9\xc2\x4c\x0f\x1c\x38\x16\x31\xf0\
+\x42\x8f\x70\x67\xc5\xad\x37\x89\x72\xda\x00\x6c\x69\xfd\x11\xc0\
+\x55\x81\x44\x99\xa7\x16\x2d\xb9\x6f\xe4\xf5\x88\x79\x7e\xa3\x6d\
+\xa9\xbb\x4e\xe8\x76\xc5\x55\x4c\xe4\xfb\x1b\xf4\xdb\xe7\x08\x77\
+\x6a\xa3\x95\x37\x52\x5e\x1f\x80\x6b\x1d\x0b\x9b\x82\x7a\x13\x27\
+\x5c\x54\x6f\x9f\xc5\x0e\x9f\xe7\x37\xd2\x06\xbf\x6c\xdd\x75\x82\
+\xbf\x5f\x65\x9c\x1c\x38\x16\xf2\x08\x3a\xee\x58\xee\x45\x8d\x56\
+\xde\x48\x79\x7d\x00\xd2\x7a\x1b\x40\xa0\xd3\x21\x00\xfc\xb7\x5c\
+\x8d\x3e\xf7\x83\xda\x7a\xc8\x11\x6e\xfb\xc8\x8b\x91\x00\x80\x01\
+\x47\xb8\x81\x8b\xb5\x46\x02\xab\x5a\x36\x0e\x80\xbd\x00\xa6\xe9\
+\x3f\x82\xaa\x9b\x6c\xb7\xa9\x3a\xa6\xa7\xe3\xa7\xea\x6d\xda\x29\
+\x3c\x82\xb4\x56\xd8\x7a\x3e\xa9\xa9\xb5\x01\x74\x97\xad\xe7\x98\
+\xf1\xc5\x20\xf3\xe7\xd2\x20\x0c\xe0\x35\x47\xb8\x1f\x55\x0b\x55\
+\x3a\x2a\x6d\x00\x5d\xd2\x7a\x8c\x80\xc0\xc4\x27\x8e\x9c\x86\x56\
+\x37\xdd\x6e\x0c\xd9\xf7\x51\x6d\xe9\x91\xff\xee\xc6\xbe\x14\xb6\
+\x49\x17\x39\x0d\x25\xec\x74\xf2\xee\x75\xaa\x15\xa6\xa1\xd3\x06\
+\x60\x4b\xeb\x7b\x00\x56\x04\x0f\x6c\xe7\xd2\x42\x0c\x5a\xbb\xac\
+\xa3\x02\x40\x57\xc9\xfa\x3a\x19\x08\xcb\xbf\xdc\xe9\x08\xfd\xbb\
+\x2a\x6a\x8d\xa0\xbb\x19\xe7\x07\xcb\x96\xd6\x6f\x43\xd3\x58\x08\
+\x39\x27\xef\xf6\xa7\x11\x58\x55\x9b\xda\x3d\xa0\xab\x6c\xcd\x21\
+\xc6\x4f\xc2\x2a\xf0\x2a\xf4\x69\xdd\x74\x93\xa4\x01\x0c\xa5\xaf\
+\xfc\x3a\xcc\xcf\x77\x99\x2f\x7d\xd0\x92\xff\x54\x0d\x56\x1a\x3a\
+\x6d\x00\x6a\xdb\xd1\x78\xd8\x11\xee\x37\x74\x1c\x4e\x1a\x80\x2d\
+\xad\x87\x00\xdc\x1b\xec\x43\xfd\x99\x93\x8e\xcf\x49\x68\xb5\x01\
+\xf8\x95\x2a\xbc\x90\x39\x61\xc2\x9b\xaa\x93\xfb\x63\x4b\x2b\x6c\
+\x9d\x50\x77\x9e\x1f\x14\x80\x5a\xce\x90\xe1\xaf\x80\x83\x13\xb7\
+\x88\x97\x8c\x86\x54\xf6\x58\x00\x94\x5e\x49\x82\xd6\x3b\xa2\x74\
+\x87\xea\x5d\x32\xb4\x49\x17\xb0\x4e\xd0\xbb\x5b\x6d\x59\x58\x17\
+\x9e\xb0\xc5\x47\xc9\x1c\x9c\x56\xcc\xf5\x1f\x55\xf5\x2f\x2d\x5d\
+\x2c\x00\x43\x03\x5c\xf4\x4b\x79\x40\x2b\x11\x2b\x91\x97\xf2\x2a\
+\x89\x5a\xcc\x6b\x1c\x4b\x2a\xbf\xaf\x4e\x2b\xf8\xbe\xdd\xd8\x00\
+\x54\xd3\x52\x74\x13\xb2\x86\x36\xed\xfc\x75\x82\xff\x0b\x9d\xe7\
+\x8f\x0c\x8c\x7a\x82\x96\x77\x93\x23\xca\x2f\xa6\x19\x58\x55\xdb\
+\xb1\x01\x9c\xbb\x89\x59\xbc\xb6\x38\x0a\x5e\xc6\x0f\x03\x8a\x0d\
+\xa0\xfa\x18\x2a\x8b\xc5\x60\x52\x7a\xa5\xa7\x9b\xa0\xa5\x7a\x07\
+\xf9\x3a\xd5\x84\x2c\x80\x77\x7b\x6d\xc6\xec\xde\x79\xa5\x03\x3a\
+\xf6\xd3\xd4\x36\x04\xa0\x36\x16\x68\x9c\x03\xd3\x4c\xd4\x52\x69\
+\xb8\x62\x22\x56\xcd\xd4\x28\x58\x78\x8d\x6c\x53\xc3\x00\x86\x20\
+\xec\x52\x3e\x0f\x46\xb4\x66\xf0\xb4\xf1\x80\x4e\xce\x50\x3d\x10\
+\xd5\xdc\x9f\x36\xef\xbe\xc8\x04\xac\xe1\xc2\x8c\x57\x19\x9c\xeb\
+\xb1\xa4\x9f\x2f\x34\x6a\x7e\x89\x00\xa8\x1d\xca\xf3\x0e\x69\xb4\
+\xea\x14\x40\x5b\xe0\xf1\x7a\xed\xf4\x95\x6a\xba\x09\x2d\x04\x78\
+\x5e\x58\xe2\x55\x80\x2f\xfb\xb8\x42\xb9\x9e\xce\xd2\x1e\x0d\x5f\
+\x53\x95\x26\x02\xc0\xf7\x30\xfe\xe1\x3c\xde\x0b\x36\x5c\xb5\x23\
+\x4a\x9e\x15\x96\x66\xa2\x16\x29\x7e\x8d\xc9\xcb\xf5\xe4\x37\xed\
+\x56\xd3\xa7\xab\x4a\x0c\x40\xf5\x51\x34\x1a\x0f\xe9\xd5\x8f\xdf\
+\x9f\x01\x2f\x37\x1a\xce\x8d\x25\x0a\xa0\x36\x1e\xc4\x3e\xac\x97\
+\xee\xad\x36\xd2\x3a\xe3\x2f\x60\xe4\x9c\x82\x1b\x99\xce\x9e\xa6\
+\x63\x89\x03\xf0\x9d\xad\x1e\xda\x7b\xe7\x74\x49\xfd\xdc\x58\xc2\
+\x4d\x64\xbc\x0a\xc2\xc7\xa2\xac\x12\xe1\x75\x83\xcd\xdc\x2a\xb1\
+\xf1\xe5\x28\x6d\x5a\xd7\x53\x01\x30\xec\xac\xe6\xf9\xb1\x24\xda\
+\xf8\x0a\x08\x45\xf6\x78\x17\x11\x6d\x0e\x4b\x9f\x19\xae\xcc\x3f\
+\x31\x63\x98\xc8\xad\xca\xb9\xfe\xbb\x83\xa6\xff\x52\x05\xe0\xb7\
+\xc6\x3f\x47\x66\x02\x2b\x54\x8e\x32\x35\xd8\xfa\x75\x80\x77\xbf\
+\x23\xca\x7f\xf5\xed\x74\xf5\x15\xa6\x93\xe9\x6d\x06\xe8\x23\x0a\
+\x76\xf7\x7b\x44\xb9\xde\xbc\xde\x91\x59\x05\xbb\x91\x92\xd4\x01\
+\x54\x21\xa4\xf6\xb9\x1a\x3e\x0a\x46\x3f\x88\xfb\xeb\xed\xed\x74\
+\x95\x3b\xae\x26\x36\xfd\x9e\xf0\xe1\xc8\x48\x80\x0f\x32\xcc\x5c\
+\x8f\xe8\xfb\x55\xb4\x36\x39\x45\x53\x00\x9c\xe9\x6e\x22\x1f\x6c\
+\x02\x9e\x05\xf1\xd3\x64\x0c\xf6\x47\x6d\x29\x57\x27\x05\x6c\x6c\
+\x06\xe1\x43\x0a\x61\x3b\xcc\x5c\x5d\xac\xfd\x42\x41\x9b\x88\xa4\
+\xe9\x00\x86\xbd\xae\xbe\x59\x33\xbc\x19\x06\xcc\xc9\x1e\xbc\x76\
+\x30\xb5\x33\xa1\x9d\x80\x76\x30\xda\x41\x18\x0f\xc0\x4f\x02\x7b\
+\x1b\x54\xfd\xff\x1b\x81\xb7\x9f\xd7\x36\x6e\xfb\xca\xdb\x37\xfe\
+\x43\xa7\xf5\x76\xc9\xba\x86\x4c\xf4\x33\x63\x8a\x42\xb9\x23\x6c\
+\x20\xd7\xd3\xe1\xbe\xa4\xa0\x6d\x58\xd2\x32\x00\x0d\x7b\xae\x69\
+\x60\xb9\x9c\x7f\xad\x87\xca\x66\xb5\xb1\x88\x8f\x02\x66\xce\x11\
+\x7d\xa9\x6f\x59\x8f\x19\x00\x3e\xaf\xe5\x4f\x5a\xd7\x55\x2a\xf0\
+\xc7\x84\xe1\x8f\x02\x06\x63\x64\xfc\x0b\xe0\x5c\xda\x07\xf9\xc6\
+\x14\x80\xea\x84\xa0\x5c\xb8\xde\xe0\xea\xec\xe8\xac\x5c\xd2\x3a\
+\x34\xde\x84\x57\x5d\xac\x69\x1d\xb7\xd2\xe9\x9c\x63\x0e\x40\x75\
+\x8a\x2a\x3b\x3f\x43\xf0\x21\x60\x52\x54\xb0\x88\xf0\x16\x83\x3a\
+\x9c\x7c\xe9\x67\x51\xda\x38\xd7\xc7\x24\x80\x2a\x04\x57\xdc\x30\
+\xb4\x58\x0b\x3a\x1a\xfb\xbf\x78\x12\x70\x8c\x99\x3b\x1c\x4b\x3e\
+\x17\x27\xc8\x61\x65\xc6\x2c\x80\x2a\x84\x4d\xd6\x8d\xe4\xb1\xff\
+\x38\xba\x54\x21\xb0\xff\x26\x0f\x1d\xc5\x82\xfb\x8c\x82\x56\x59\
+\x32\xa6\x01\xf8\x51\xb2\x65\xe7\xe7\xe0\x8f\x09\x84\xf7\x47\x46\
+\x8d\x70\x92\x06\xa9\xa3\xd8\x99\xdc\x77\xe8\xc6\x3c\x80\x2a\x84\
+\xda\xa7\x17\xfc\x31\xe1\x92\x48\x08\xc0\x00\x1b\x9c\xeb\xe9\x90\
+\x89\x7c\x98\x30\x03\x30\x14\x71\xbb\x64\xcd\x1a\x5a\xac\x5d\xac\
+\x00\xe1\x34\x13\x72\x3d\x79\x57\xe9\x1b\x45\xd9\x18\xa0\x10\xd1\
+\x6a\x4f\x28\x17\xbe\x40\xcc\xfd\x1c\x72\x04\xeb\x3d\x53\x3c\x08\
+\x18\x39\x47\x94\x1a\x3a\x69\x9f\xf5\x80\x11\x70\x6c\x57\x7c\x09\
+\x44\x7e\xca\xfa\xfb\x22\xb9\x31\x3c\x98\x9c\x73\x3a\xe4\x96\x48\
+\x6d\x80\x20\x03\x50\x27\x30\xdd\x25\xeb\x16\x36\xd1\x0f\xc6\x44\
+\x95\xc0\xea\x66\xff\x9d\x69\x33\x03\x10\x10\xe1\xee\xbe\xc2\x6c\
+\x36\xd9\xef\x09\x13\x14\x20\xfc\xd2\x11\xee\x0d\x0a\xba\xb3\x24\
+\x19\x80\x90\xa8\x75\x6d\x12\xb7\x92\x57\x9d\x1d\xb5\x45\x07\xd7\
+\x9b\x32\xfc\x32\x28\x5a\xfb\x9e\x22\x03\x10\x11\xad\xda\x89\xa0\
+\xea\x62\x6d\x5c\xb8\x34\x5e\xc2\x6f\x06\x40\xe1\x76\xb5\x65\x61\
+\x2e\x7c\x08\x04\x23\x48\x6e\xb4\x19\x93\xe3\x7c\xad\x3d\x03\xa0\
+\x00\xa0\x3a\x45\xdd\x24\xe6\xa1\xf6\x38\xaa\xf3\xe3\x17\x1d\x21\
+\x6f\x52\x34\xf5\x7f\xb2\x0c\x80\x46\xd4\x86\xce\x1f\x2c\x05\xf0\
+\xd9\xe1\x62\xc4\xfc\x50\xd1\x92\xdf\xd4\x30\x93\x01\x88\x1b\xac\
+\xe1\x72\xb6\xcc\x5f\x09\xe0\x4a\xd3\x6c\xfb\xd3\xaa\xdc\x86\xea\
+\x97\xde\xe3\xfe\xb2\x1e\x10\x37\x72\x09\x95\xcb\x00\x24\x14\xc8\
+\xb8\x66\x32\x00\x71\x23\x97\x50\xb9\x0c\x40\x42\x81\x8c\x6b\x26\
+\x03\x10\x37\x72\x09\x95\xcb\x00\x24\x14\xc8\xb8\x66\x32\x00\x71\
+\x23\x97\x50\xb9\x0c\x40\x42\x81\x8c\x6b\x26\x03\x10\x37\x72\x09\
+\x95\xcb\x00\x24\x14\xc8\xb8\x66\x32\x00\x71\x23\x97\x50\xb9\x0c\
+\x40\x42\x81\x8c\x6b\x26\x03\x10\x37\x72\x09\x95\xfb\x0f\x49\x69\
+\xf8\x8e\x32\x83\xba\x49\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\
+\x60\x82\
+\x00\x00\x04\x80\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x60\x00\x00\x00\x60\x08\x06\x00\x00\x00\xe2\x98\x77\x38\
+\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x04\
+\x3a\x49\x44\x41\x54\x78\x5e\xed\x9d\xc1\x6a\x14\x41\x10\x86\xab\
+\x47\x82\xbe\x80\x24\x7a\xf3\x24\xe8\xc1\x93\x20\x88\xbb\x1b\x04\
+\x25\x0a\xc9\x26\xa0\x07\xf5\x09\x04\xe3\x4d\x21\x3b\x8b\x09\xd9\
+\xe4\xe2\xc9\x04\xdf\x40\x3d\x28\x6c\x26\x39\x44\xf4\x92\xdd\x55\
+\x41\xf0\x26\xe8\x21\x22\x78\x10\x4d\xf4\x05\xf4\xe0\x94\x34\x26\
+\x18\x15\x33\xd3\x53\xb5\xd3\xdd\x33\xb5\xd7\xa9\xae\xaa\xfe\xbf\
+\xee\xe9\x99\xae\x61\x5b\x81\xfc\xac\x2a\xa0\xac\x46\x97\xe0\x20\
+\x00\x2c\x0f\x02\x01\x20\x00\x2c\x2b\x60\x39\xbc\xcc\x00\x01\x60\
+\x59\x01\xcb\xe1\x65\x06\x14\x0d\x40\x7d\xae\x33\x02\x31\x8c\x80\
+\x52\x87\x01\xf0\x18\x80\x1a\xcc\xbf\x8f\xea\xbd\x02\x7c\x8d\x80\
+\xef\x82\x01\x5c\x6c\xdf\x1c\xfe\x98\x7f\x0e\xe9\x22\xb2\xce\x80\
+\xb1\x56\xf7\x9e\x02\xb8\x9c\x2e\x74\x6e\x56\xeb\x0a\x30\x5c\x0a\
+\x6b\x8f\x72\x8b\x68\x10\x88\x0d\x40\xbd\xd5\x45\x83\xb8\xf9\x9b\
+\x62\x3c\x13\x35\x87\xa7\xf3\x0f\xbc\x7b\x44\x16\x00\xe3\xad\x67\
+\x93\x08\xf1\x1d\xd7\x3a\xf7\x4f\x3e\x0a\xa6\xa3\x46\x75\xc6\xa5\
+\x3c\xc9\x00\x26\xe6\x7b\x27\xe3\x18\x9f\xbb\xd4\xa9\x5d\x73\x71\
+\x0c\x02\x19\x40\xbd\xd5\xbd\x0b\x00\x57\xbd\x01\xa0\x13\x75\x08\
+\x02\x03\x80\xde\x1a\x00\xd6\xbc\x02\xe0\x10\x04\x06\x00\xdd\x2f\
+\x00\xb0\xdf\x3b\x00\x8e\x40\xe0\x00\xe0\xd6\xd3\x0f\xc6\x33\xa0\
+\x82\x5b\xa9\x07\x84\xe5\xdb\x51\xe1\x00\x44\x61\x55\xd5\x67\xd7\
+\xa6\x7d\x81\x50\x48\x00\x7a\xf4\xfb\x02\xa1\xb0\x00\x7c\x81\x50\
+\x68\x00\x99\x20\xe4\xfc\xc6\x5c\x78\x00\xae\x43\x28\x05\x00\x97\
+\x21\x94\x06\x80\xab\x10\x4a\x05\xc0\x45\x08\xa5\x03\xe0\x1a\x84\
+\x52\x02\x70\x09\x42\x69\x01\xb8\x02\xa1\xd4\x00\x5c\x80\x50\x7a\
+\x00\xb6\x21\x08\x80\xad\x6d\x53\xd3\xbd\x23\x05\x78\x91\xa3\xd0\
+\x2f\x00\x76\xec\x5b\x1b\x42\x58\x0f\x06\xe2\xd3\xd4\x4f\x5e\x0a\
+\x07\x20\x56\x7b\x87\x56\x1a\x27\x36\x53\xd7\x03\xfe\x32\x34\x81\
+\x80\xa8\x6e\x2f\x37\x2b\x37\xb2\xc6\xfa\x55\x13\x22\xfe\x5c\xfb\
+\x1c\x85\xe3\xd6\x90\x1a\x02\xc2\x6a\xd4\xac\x9e\xa7\x48\x58\x38\
+\x00\x5a\x0c\x5d\x94\xa1\x88\x62\xb0\x30\x7f\x88\xc2\xea\x21\x4a\
+\x2c\x7a\xa2\x8e\x7e\x90\x15\x04\x30\x06\xa8\x5e\xb5\x1b\x95\xcf\
+\x59\x05\x4a\x33\x13\xa8\xb0\x0b\x0b\x20\xab\xe8\xa6\xed\x04\x80\
+\xa9\x62\xcc\xf6\x02\x80\x59\x50\x53\x77\x02\xc0\x54\x31\x66\x7b\
+\x01\xc0\x2c\xa8\xa9\x3b\x01\x60\xaa\x18\xb3\xbd\x00\x60\x16\xd4\
+\xd4\x9d\x00\x30\x55\x8c\xd9\x5e\x00\x30\x0b\x6a\xea\x4e\x00\x98\
+\x2a\xc6\x6c\x2f\x00\x98\x05\x35\x75\x27\x00\x4c\x15\x63\xb6\x2f\
+\x0c\x00\xbd\x8d\xfc\x43\xed\xeb\x51\xf6\xf2\xd3\x68\x3b\x3a\xf7\
+\x72\x70\x0f\x7e\xab\x20\xa8\x87\x69\xec\x93\x6c\x0a\x01\x80\xda\
+\x89\x24\x91\xfe\x77\x9d\xa3\x96\x41\xcd\xdd\xfa\x6e\xa8\xde\x36\
+\x6e\x4f\x55\x57\xb2\x8a\x48\x69\x37\x31\xdf\x1d\x8d\x63\x58\xa6\
+\xf8\xf0\x1f\x80\x52\x07\x29\x7b\xf6\x14\xf1\x26\xe6\x7a\x07\x62\
+\xc4\x4f\x14\x1f\xde\x03\xa0\xd6\x70\x29\xe2\xe9\xf5\x20\xc0\xef\
+\x1b\x14\x1f\xde\x03\xe0\xa8\xe1\x66\x15\x70\xbc\xd5\xb9\x40\x5d\
+\x8c\xbd\x07\xa0\xc5\xa3\x76\x22\x2b\x00\x59\x84\x77\x28\xc7\x51\
+\xc3\x4d\x03\x42\xdf\xf7\x41\xe1\x71\xea\xe2\xbb\x1d\x8b\x3a\x78\
+\xac\x3f\x05\xa5\x11\xcd\x65\x1b\x01\x60\x99\x8e\x00\x10\x00\x8e\
+\xff\x51\x53\x9f\x01\xc9\x0c\xe8\xb3\xc0\x49\xee\x05\x40\x92\x42\
+\x7d\xbe\x2e\x00\xfa\x2c\x70\x92\x7b\x01\x90\xa4\x50\x9f\xaf\x17\
+\x06\x80\xd4\x03\x32\x8e\x14\x17\x5e\xe7\x33\xa6\x0e\x2e\xe4\x6e\
+\xfd\x4d\x58\xea\x01\x59\x87\xcf\x56\x3b\xea\x28\x0a\xa4\x1e\x40\
+\x23\x40\x05\x20\xf5\x00\x9a\xfe\xe4\xfb\xa8\xd4\x03\x2c\x03\x90\
+\x7a\x80\x03\x00\x74\x0a\x52\x0f\xc8\x08\x82\xba\x06\x64\x0c\xeb\
+\x4c\xb3\xc2\xbc\x88\x39\xa3\xa8\x61\x22\x02\xc0\x50\x30\x6e\x73\
+\x01\xc0\xad\xa8\xa1\x3f\x01\x60\x28\x18\xb7\xb9\x00\xe0\x56\xd4\
+\xd0\x9f\x00\x30\x14\x8c\xdb\x5c\x00\x70\x2b\x6a\xe8\xcf\x01\x00\
+\x9d\x0d\x3b\x67\x85\x19\x2a\xd5\x17\x73\xdc\x8c\xc2\xda\x10\xc5\
+\x35\xc7\x76\xf4\x13\x00\x38\x43\x49\xc2\xe3\xb6\x4f\xa3\xb0\x7a\
+\x96\x92\x3f\x1d\xc0\x6c\x67\x01\x94\xba\x46\x49\xc2\xdb\xb6\x88\
+\x8b\x51\xb3\x36\x49\xc9\x9f\x0e\x40\x1f\x5d\x88\x6a\x95\x92\x84\
+\xb7\x6d\x15\x9e\x8b\x1a\xb5\xc7\x94\xfc\xc9\x00\x74\x70\x47\x8f\
+\x30\xa4\xe8\x92\xd8\x16\x01\xee\x2f\x87\xd5\x2b\x89\x86\x09\x06\
+\x2c\x00\x74\x8c\xb2\x6d\xca\x51\x9f\x7e\xb6\xb9\xb0\x01\xd0\x0e\
+\xbd\x39\xd2\x90\x30\x6c\x15\x04\xd7\x97\xc2\x53\x0b\x04\x17\x7f\
+\x34\x65\x05\xa0\x3d\x6f\x1d\x6d\x78\x09\x40\x1d\x01\xc0\xa3\xde\
+\x9e\x31\xf6\x5b\xa6\xaf\x00\xea\x0d\x00\xbe\x0d\x02\xf5\xa0\x3d\
+\x55\x79\xc1\x25\xbe\xf6\xc3\x0e\x80\x33\xb9\x32\xf8\x12\x00\x96\
+\x29\x0b\x00\x01\x60\x59\x01\xcb\xe1\x65\x06\x08\x00\xcb\x0a\x58\
+\x0e\x2f\x33\x40\x00\x58\x56\xc0\x72\xf8\x9f\x1b\x12\x6b\x7f\x72\
+\x0c\x82\xd6\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x05\x07\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x60\x00\x00\x00\x60\x08\x06\x00\x00\x00\xe2\x98\x77\x38\
+\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x04\
+\xc1\x49\x44\x41\x54\x78\x5e\xed\x9c\x5b\xc8\x56\x45\x14\x86\x1f\
+\x2f\xbb\x90\x0c\x3a\x59\x24\xd2\x09\x49\x8c\x0e\x98\x5e\x89\x1d\
+\x08\x3a\x07\x89\x42\x51\x21\x1d\x08\xa4\xa8\x0c\xa2\xcc\x0a\x2a\
+\x8a\xea\x26\x92\x2e\x2a\x82\xa2\x13\x78\x42\x33\x08\x2a\xea\xc6\
+\x8b\x88\x0a\x82\xa8\x30\x88\x4e\x10\x14\x04\x52\xd1\x4d\xd4\xbc\
+\xfd\xfb\xc7\x4f\x2d\xbf\x99\x7d\x98\x35\xcd\x5e\x0b\x3e\xfe\x8b\
+\x7f\xcd\xac\x99\xf7\x99\xb5\xf7\x9e\xd9\x33\x7b\x0e\x6e\xa6\x0a\
+\xcc\x31\x8d\xee\xc1\x71\x00\xc6\x83\xc0\x01\x38\x00\x63\x05\x8c\
+\xc3\x7b\x06\x38\x00\x63\x05\x8c\xc3\x7b\x06\x38\x00\x63\x05\x8c\
+\xc3\x7b\x06\x38\x00\x63\x05\x8c\xc3\x7b\x06\x38\x00\x63\x05\x8c\
+\xc3\x7b\x06\x38\x00\x63\x05\x8c\xc3\x7b\x06\x38\x00\x63\x05\x8c\
+\xc3\x7b\x06\x38\x00\x63\x05\x8c\xc3\x7b\x06\x8c\x1c\xc0\x22\x60\
+\x2d\x70\x0a\x70\x3a\x70\x52\x4b\x3d\xfe\x00\xbe\x9d\xf8\x7d\x17\
+\xea\xdb\x06\x7c\xda\xb2\xbe\x6c\xc5\x2c\x33\xe0\x1e\x60\x23\x70\
+\xd8\x80\xbd\xfd\x0c\x78\x13\x78\x0f\x78\x6b\xc0\x38\xad\xab\xb6\
+\x02\xb0\x05\xb8\xaa\x75\xab\xdb\x15\x7c\x01\x78\x1c\xf8\xb2\x5d\
+\xf1\x61\x4a\x59\x00\x58\xd9\x8c\xc8\x61\x7a\x74\xe8\x5a\x7f\x06\
+\x9e\x68\x40\x58\xc4\x3f\x28\x66\x6e\x00\x73\x81\x77\xc3\x65\x61\
+\xa9\x71\xef\x37\x03\xab\x8d\xdb\xf0\x4f\xf8\xdc\x00\xae\x0e\x37\
+\xdc\x57\x4a\xe8\x38\x50\x04\x84\xdc\x00\x1e\x06\x36\x14\x02\x40\
+\xcd\x30\x87\x90\x1b\x80\xc5\xcd\x77\x1a\x6f\x0d\x0a\x3d\x8d\x99\
+\x58\x6e\x00\x7a\x1c\xd4\x4d\xb8\x24\xfb\x05\x58\x06\xec\xb1\x68\
+\x94\x03\x98\x51\xfd\x29\xe0\x76\x07\x60\xa1\xc0\x4c\xcc\x3f\x81\
+\x73\x80\x8f\x73\x37\xa1\xf4\x0c\x38\x37\x5c\xb2\xde\x8f\x10\xe5\
+\x54\xe0\xec\xe6\xf2\x76\x73\x84\xff\xbf\xb9\x5c\x03\xbc\xda\xb2\
+\x6c\xeb\x62\xb5\x00\x98\x14\x40\x20\x1e\x00\x2e\x4b\x54\x45\x4b\
+\x23\x8f\x25\x96\xe9\xec\x5e\x23\x00\x89\xb2\x10\xd8\x0d\x1c\x97\
+\xa0\xd0\x33\xc0\xba\x04\xff\x5e\x5c\x6b\x05\x20\x71\xee\x6a\x96\
+\x1d\x62\x85\xda\x09\x5c\x11\xeb\xdc\x97\x5f\xcd\x00\x52\xd7\x9c\
+\x76\x00\x57\xf6\x25\x6c\x6c\x3d\x35\x03\x90\x06\x7f\xc5\x0a\x01\
+\x3c\x0d\xdc\x96\xe0\xdf\x8b\x6b\xcd\x00\x52\x33\xe0\x6e\x8b\x55\
+\xd2\x9a\x01\x3c\xd8\x3c\x0d\xc5\x8e\xd4\x6b\x81\x97\x63\x9d\xfb\
+\xf2\xab\x15\x80\x96\xbd\xf7\x26\x8a\x74\x41\xb3\x54\x9e\x58\xac\
+\x9b\x7b\x8d\x00\xe6\x03\xdb\x9b\xf5\x9d\x58\x75\xde\x08\xb3\xe0\
+\xcb\x63\x9d\xfb\xf4\xab\x05\x80\x5e\xe8\x2f\x69\x5e\xee\x6b\x12\
+\x96\x6a\x9a\xb4\xed\x4a\x2d\xd4\x87\x7f\xe9\x00\xfa\xe8\xe3\xb4\
+\x3a\xcc\x46\xbf\x1a\x36\x76\x00\xda\xbe\xa2\xc9\xd7\x27\xd3\x28\
+\x0d\xf5\xff\x31\x03\xf8\x3d\x2c\xbe\x69\x11\xef\x87\xa1\xc4\x8d\
+\xa9\x77\xac\x00\xbe\x07\x4e\x88\x11\x68\x68\x9f\x31\x02\x30\x7f\
+\x0f\x3c\x09\x75\x8c\x00\xb4\x5b\xee\xfa\xb0\x5c\xfd\xd1\xd0\xa3\
+\x3b\xa6\xfe\x31\x02\x98\xd5\xe5\xd9\x30\x59\xbb\x13\xf8\x2d\x46\
+\xa8\xa1\x7c\xc6\x0c\x40\x9a\x6a\xf3\xae\x56\x40\xbf\x1e\x4a\xe0\
+\x69\xf5\x8e\x1d\xc0\xac\x3e\xcb\x81\x0f\xa6\x89\x35\xc4\xff\x1d\
+\xc0\x3e\x55\x17\x00\x9a\x17\x64\xb5\xd2\x01\xc4\xbc\x90\x9f\x15\
+\xec\x28\xe0\x68\x40\x7f\xdb\x98\x6e\xca\x2b\x00\xcd\x0f\xb2\x59\
+\xe9\x00\x62\x77\x45\x4c\x0a\xa6\x75\x21\x2d\x2d\xeb\x77\x4c\xa2\
+\x92\x9b\x80\x5b\x13\xcb\x74\x72\xaf\x11\xc0\xac\x20\x67\x34\xdb\
+\xe0\xe7\x25\x28\xa4\x4b\x90\x2e\x45\xd9\xac\x66\x00\x12\x51\xbb\
+\x1c\x34\xaa\x53\xec\x42\xe0\xed\x94\x02\x5d\x7c\x6b\x07\x70\x3c\
+\xf0\x39\xa0\x17\x34\xb1\xf6\x08\x70\x5f\xac\x73\x57\xbf\xda\x01\
+\x48\x1f\x6d\x37\x49\xd9\xa4\x95\x75\x7f\xd0\x18\x00\x3c\x09\xac\
+\x4f\x18\xa9\xaf\x01\x3a\x48\x92\xc5\xc6\x00\xe0\x39\xe0\xc6\x04\
+\x35\x75\x9a\xf2\xa2\x04\xff\x4e\xae\x63\x00\xa0\x19\xae\x76\x3e\
+\xc7\xda\x56\x60\x55\xac\x73\x57\xbf\xda\x01\x9c\x0f\xbc\x93\x28\
+\xd2\xa3\xc0\xbd\x89\x65\x5a\xbb\xd7\x0e\xe0\x45\xe0\xba\x44\x75\
+\x6e\x08\x73\x01\x9d\x29\xce\x62\x35\x03\xd0\x4c\xf8\xa5\x16\x2a\
+\x9e\x97\xf3\x1c\xf3\xff\x01\x40\xac\x86\x47\x34\x4b\x0f\xc7\x86\
+\xf3\x5e\x3a\x6c\x71\x72\x6c\xc1\x03\xfc\x4e\xcc\xb9\x3c\x5d\x3a\
+\x80\x96\x1a\xb6\x2e\xa6\xdd\x11\x67\xb5\x2e\xdd\xa2\xa0\x03\xd8\
+\x5f\x34\xed\x8e\xd6\x2e\xe9\x6c\xe6\x00\xf6\x49\xfd\x15\x70\x66\
+\x38\xd8\xf1\x6b\x36\xf5\x0d\x36\x66\xbd\x1e\xd6\x66\xd6\xe4\xec\
+\x60\x42\x2c\x3d\x7a\xea\x11\x34\xab\xe5\xce\x00\x7d\xa6\x40\x27\
+\xd3\x4b\x33\x1d\x4f\xbd\x04\xf8\x31\x77\xc3\x72\x03\xd0\xe8\x57\
+\x16\x94\x64\x3a\x13\x70\x8b\xd5\xee\x88\xdc\x00\x8e\x0c\x23\xed\
+\xc3\xe6\x14\x63\x09\x10\xee\x07\x1e\xb2\x6c\x48\x6e\x00\xea\xeb\
+\x4d\xe1\xf8\xa8\xf6\xe4\x58\x9a\xde\x35\x3f\x5f\xc2\xa7\x73\x2c\
+\x00\x48\x78\x7d\xc7\xed\xe2\xcc\x04\x7e\x6a\x3e\x4f\xa3\xad\x89\
+\x29\x2f\xfb\x07\x6d\xa6\x15\x00\x75\xea\xd2\xe6\x4c\xd6\xe1\x83\
+\xf6\x70\x46\x6c\x89\xae\x9f\x20\x14\x65\x96\x00\x24\x84\x8e\x13\
+\xdd\x11\xc4\x59\x0c\x9c\xd6\xf1\xde\xa0\xef\xc1\xe9\xf5\xe3\xe4\
+\xef\x8b\xf0\x59\xcc\x6f\x8a\x52\xfc\x80\xc6\x58\x03\x28\x59\x9b\
+\x2c\x6d\x73\x00\x59\x64\xfe\xef\x20\x0e\xc0\x01\x18\x2b\x60\x1c\
+\xde\x33\xc0\x01\x18\x2b\x60\x1c\xde\x33\xc0\x01\x18\x2b\x60\x1c\
+\xde\x33\xc0\x01\x18\x2b\x60\x1c\xde\x33\xc0\x01\x18\x2b\x60\x1c\
+\xde\x33\xc0\x01\x18\x2b\x60\x1c\xde\x33\xc0\x01\x18\x2b\x60\x1c\
+\xde\x33\xc0\x01\x18\x2b\x60\x1c\xde\x33\xc0\x01\x18\x2b\x60\x1c\
+\xfe\x6f\xa7\xa0\xbc\x61\x50\xfc\x18\x73\x00\x00\x00\x00\x49\x45\
+\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x03\x3d\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x60\x00\x00\x00\x60\x08\x06\x00\x00\x00\xe2\x98\x77\x38\
+\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x02\
+\xf7\x49\x44\x41\x54\x78\x5e\xed\x9b\xc1\x4d\xc5\x40\x0c\x44\x4d\
+\x15\x20\x68\x83\x33\x25\xc0\x09\x8a\x84\x13\x94\xc0\x99\x36\x40\
+\x50\x05\x28\x42\x48\xff\x00\x28\xe3\xf1\x66\xbc\x3f\xc3\x39\xb6\
+\xb3\xef\xc5\x7f\x25\x5b\x9c\x84\xff\xa4\x04\x4e\xa4\xd5\x5d\x3c\
+\x2c\x40\xfc\x11\x58\x80\x05\x88\x09\x88\xcb\xbb\x03\x2c\x40\x4c\
+\x40\x5c\xde\x1d\x60\x01\x62\x02\xe2\xf2\xee\x00\x0b\x10\x13\x10\
+\x97\x77\x07\x4c\x2c\xe0\x31\x22\x2e\x23\xe2\x5c\x7c\x06\x75\xf9\
+\xb7\x88\x78\x89\x88\x9b\xcc\x8b\x64\x3b\xe0\x33\x53\x6c\x07\x31\
+\x30\x4f\x38\x20\x22\xee\x23\xe2\x76\x07\x30\x33\x47\x7c\x88\x88\
+\x3b\x24\x30\x23\xe0\x3d\x22\x4e\x91\x22\x3b\x7a\xf6\x23\x22\xce\
+\x90\xf3\x66\x04\xbc\xfa\x77\xff\x4f\xc4\xcb\x7d\x70\x31\x5a\xc0\
+\x72\xf9\x5e\x23\x45\x76\xf4\xec\x13\x7a\x19\x67\x3a\x60\xe1\xe9\
+\x4b\xf8\xf7\xaf\x0a\xe6\x09\x07\x1c\xd4\x5d\x2e\xe3\x2b\xdf\x07\
+\xb1\xfc\xee\x3f\xa3\x97\xef\x0f\x47\x46\xc0\x8e\x7e\x59\xc6\x1d\
+\xd5\x02\xc6\xb1\x5d\x95\xd9\x02\x56\x61\x1a\xf7\x90\x05\x8c\x63\
+\xbb\x2a\xb3\x05\xac\xc2\x34\xee\x21\x0b\x18\xc7\x76\x55\x66\x0b\
+\x58\x85\x69\xdc\x43\x16\x30\x8e\xed\xaa\xcc\x4a\x01\x5d\xf6\x09\
+\xd4\x3c\x7f\x15\xe5\x7f\x1e\x52\x09\xe8\x3a\xca\xd8\x9c\xc7\xe6\
+\x05\x9b\xef\x13\xe0\x79\xfe\x8c\x1d\xd0\x79\x9f\x00\xcf\xf3\x67\
+\x14\xd0\x79\x9f\x00\xcf\xf3\x67\x14\xd0\x79\x9f\x00\xcf\xf3\x67\
+\x14\xd0\x79\x9f\xb0\xf9\x9d\xb8\x79\xc1\x86\xfb\x04\x6a\x9e\x3f\
+\x6b\x07\xb0\xef\x7d\x34\xf1\xca\x0e\x38\x1a\x88\xcc\x41\x2c\x80\
+\xa1\x57\x10\x6b\x01\x05\x10\x99\x14\x16\xc0\xd0\x2b\x88\xb5\x80\
+\x02\x88\x4c\x0a\x0b\x60\xe8\x15\xc4\x5a\x40\x01\x44\x26\x05\x23\
+\xa0\xcb\x3c\x9f\x39\x7f\x45\x2c\xb5\x4f\xc8\x0a\xe8\x3a\xcf\xaf\
+\x00\xca\xe4\x80\x79\xc2\x01\xcd\xe7\xf9\x0c\xbc\x8a\x58\x78\x9f\
+\x90\x11\xd0\x79\x9e\x5f\x01\x91\xc9\x01\xef\x13\x32\x02\x3a\xcf\
+\xf3\x19\x78\x15\xb1\xf0\x3e\x21\x23\xa0\xf3\x3c\xbf\x02\x22\x93\
+\x03\xde\x27\x64\x04\x74\x9e\xe7\x33\xf0\x2a\x62\x61\x9e\x70\xc0\
+\xc1\x5b\xfa\xff\x03\xbe\x61\x50\xfb\x04\x46\x40\xc5\x17\xb3\xfb\
+\x1c\x16\x20\xfe\x04\x2c\xc0\x02\xc4\x04\xc4\xe5\xdd\x01\x16\x20\
+\x26\x20\x2e\xef\x0e\xb0\x00\x31\x01\x71\x79\x65\x07\x74\xd9\x27\
+\x50\xf3\x7c\xd6\x9f\x4a\x40\xd7\x7d\xc2\xe6\x3c\x36\x2f\xd8\x7c\
+\x9f\x00\xcf\xf3\x67\xec\x80\xce\xfb\x04\x78\x9e\x3f\xa3\x80\xce\
+\xfb\x04\x78\x9e\x3f\xa3\x80\xce\xfb\x04\x78\x9e\x3f\xa3\x80\xce\
+\xfb\x84\xcd\xef\xc4\xcd\x0b\x36\xdc\x27\x50\xf3\xfc\x59\x3b\x80\
+\x7d\xef\xa3\x89\x57\x76\xc0\xd1\x40\x64\x0e\x62\x01\x0c\xbd\x82\
+\x58\x0b\x28\x80\xc8\xa4\xb0\x00\x86\x5e\x41\xac\x05\x14\x40\x64\
+\x52\x58\x00\x43\xaf\x20\xd6\x02\x0a\x20\x32\x29\x18\x01\x5d\xe6\
+\xf9\xcc\xf9\x2b\x62\xa9\x7d\x42\x56\x40\xd7\x79\x7e\x05\x50\x26\
+\x07\xcc\x13\x0e\x68\x3e\xcf\x67\xe0\x55\xc4\xc2\xfb\x84\x8c\x80\
+\xce\xf3\xfc\x0a\x88\x4c\x0e\x78\x9f\x90\x11\xd0\x79\x9e\xcf\xc0\
+\xab\x88\x85\xf7\x09\x19\x01\x9d\xe7\xf9\x15\x10\x99\x1c\xf0\x3e\
+\x21\x23\xa0\xf3\x3c\x9f\x81\x57\x11\x0b\xf3\x84\x03\x0e\xde\xd2\
+\xff\x1f\xf0\x0d\x83\xda\x27\x30\x02\x2a\xbe\x98\xdd\xe7\xb0\x00\
+\xf1\x27\x60\x01\x16\x20\x26\x20\x2e\xef\x0e\xb0\x00\x31\x01\x71\
+\x79\x77\x80\x05\x88\x09\x88\xcb\xbb\x03\x2c\x40\x4c\x40\x5c\xde\
+\x1d\x60\x01\x62\x02\xe2\xf2\x5f\xb0\x45\x50\x61\xf9\x47\xfd\x32\
+\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x05\x00\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x60\x00\x00\x00\x60\x08\x06\x00\x00\x00\xe2\x98\x77\x38\
+\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x04\
+\xba\x49\x44\x41\x54\x78\x5e\xed\x9c\xcf\x4e\xd5\x40\x14\xc6\xbf\
+\x29\xfa\x08\xf2\xa7\x2c\xdc\x18\xaa\x60\xe2\x46\x57\x1a\x03\x86\
+\x42\x70\xa1\x2b\x58\xa8\x4f\xa0\x11\x1f\xc1\xf8\x08\x62\xf4\x09\
+\xd4\x05\xae\x74\x21\x81\x4b\x80\x10\xdd\xb9\x71\x01\xb1\xc4\x75\
+\xbd\xe8\x13\x98\xeb\xed\x98\x12\x6e\x72\x29\xf7\xde\x33\xd3\x76\
+\x3a\xb4\x3d\x2e\x9d\x99\x73\x66\xbe\xdf\x9c\x99\x9e\x19\xee\x08\
+\xf0\x3f\xab\x0a\x08\xab\xde\xd9\x39\x18\x80\xe5\x49\xc0\x00\x18\
+\x80\x65\x05\x2c\xbb\xe7\x08\x60\x00\x96\x15\xb0\xec\x9e\x23\xa0\
+\x6e\x00\xd6\x27\x46\x17\x1c\x38\x0b\x10\xf0\x20\x71\x0d\x02\x23\
+\x96\x35\xc8\xe6\x5e\xe2\x10\x02\xdf\x21\x11\x44\x88\xd6\xe6\x0f\
+\x9a\x6b\x3a\x06\x0b\x8d\x80\x86\xe7\xbe\x05\xf0\x50\xa7\x83\x25\
+\xac\xfb\xce\x0f\xc2\x47\xaa\xfd\x2e\x0c\x40\xc3\x73\xa5\x6a\xa7\
+\xaa\x50\xcf\x0f\x42\x25\x6d\x95\x2a\x65\x15\x64\xd3\x73\x97\x25\
+\xf0\x32\xab\x9d\x32\xb5\x17\xc0\xb3\xd9\x20\x5c\xa1\xfa\x6c\x1c\
+\xc0\x96\xe7\xde\x6c\x03\x5f\xa8\x8e\x54\xb1\x7c\x08\xb8\x75\x27\
+\x08\xbf\x0e\x1a\x9b\x71\x00\x0d\xcf\x7d\x0d\xe0\x71\x15\x05\x56\
+\x18\xd3\x1b\x3f\x08\x9f\x58\x06\x30\xb6\x0d\x88\x69\x85\xce\x56\
+\xb0\x8a\xdc\xf1\x83\x5f\x33\x56\x01\x6c\x78\xee\x6f\x01\x5c\xa8\
+\xa0\xba\xe4\x90\x24\xf0\x67\x2e\x08\x87\xad\x02\xa8\xdb\xd7\x4f\
+\x52\x6c\xea\x6b\xa8\x88\x3d\xa0\x56\x9f\x9f\x0c\x80\x5c\x18\x8a\
+\xad\xc0\x11\x50\xac\xde\xa7\xbc\x31\x00\x06\x50\xaf\x23\x08\xde\
+\x03\x2c\xcf\x78\x06\x50\x55\x00\x1b\x9e\xfb\x51\x00\xd7\xe3\xf1\
+\x49\xe0\xdb\x5c\x10\xde\x57\x19\x2b\xe7\x01\x83\x4f\x45\x95\xf2\
+\x80\x7e\x22\x52\x3b\x7c\x0c\x88\x01\x64\x04\xb0\xe9\xb9\xab\x12\
+\x58\xec\x35\xdb\x05\xf0\x61\x36\x08\x97\x06\x45\x02\x03\xc8\x08\
+\xa0\x31\xe1\x36\xfb\x5e\x1b\x4a\x1c\xfa\x07\xe1\x28\x03\xe8\xaf\
+\x00\xb5\x4a\x90\x4b\x10\x35\x83\x29\x07\x54\x7b\x95\x7d\xa4\xcc\
+\x75\x28\x7d\x18\x80\x61\xba\xa5\x03\x10\x49\xbc\x18\x8a\xa2\xd5\
+\xd9\x9f\xcd\xfd\x5e\xda\x6c\x5e\x1d\x1e\x89\x5a\xe7\x6f\x0b\xc8\
+\xd5\x5e\xe5\xa6\xda\x6f\x5e\x1a\x9d\x6c\x3b\xce\x92\x23\xf0\x5c\
+\x87\x59\xe9\x00\x40\x44\x33\xfe\x8f\xe6\x8e\xca\x20\x7b\x2e\x6f\
+\x06\xdb\x37\x2e\x8f\x4e\x43\x3a\xdb\x2a\x7d\xeb\xd4\x29\x1d\x00\
+\xaa\xc3\xdd\x83\xdf\xf2\xdc\x7b\x6d\xe0\x63\xf7\xff\x99\x6c\x1f\
+\x47\x81\x1c\x72\xf6\x18\xc0\xb1\x02\xbb\x57\x2e\x8e\xfd\x8d\x5a\
+\x61\x5a\x00\x3a\xed\xe3\xd9\x1f\x45\xce\x74\xe5\x97\xa0\xe4\x0c\
+\x4e\x2e\x33\xb6\xcb\x75\x66\x7f\x5c\x97\x8a\xc8\x33\xf7\x15\x64\
+\x5b\x60\xca\x3f\x03\x48\xfc\xc5\x59\xd1\x11\xc2\x00\x18\xc0\xc9\
+\x39\x40\xad\x71\xba\x99\x30\x65\xaf\xdb\x7b\x9c\x13\xc8\xd6\xb9\
+\xe6\xa0\x4d\x38\x6b\x84\x74\x6c\xd7\x26\x0f\xd0\x01\xb0\xe1\x8d\
+\x2f\x26\x13\x32\x6a\x0d\xd7\x2d\xef\x86\xcb\x79\x40\x62\x01\xee\
+\x15\x5d\xba\x02\x53\x11\x72\x22\xe2\x38\x0f\x00\xe2\x6f\xf7\x7f\
+\x51\xeb\x46\x32\x01\xeb\x97\x79\x52\x02\x53\xe5\x1d\xbb\x9c\x07\
+\x28\x7e\x7e\xe4\x1d\x01\xba\x7b\x58\xb2\x9b\xd4\x92\x5a\xba\x3c\
+\x80\xe2\xc0\x00\x14\xd6\xe9\x41\x22\x52\x02\x32\x80\x84\x02\x54\
+\x88\xe9\x86\x30\x03\xd0\x9c\xc1\x67\x1d\xc0\xa0\x88\x49\x93\x47\
+\x50\x11\xc8\x7b\x80\xe2\x8f\xe3\x62\xa1\xd2\xe4\x11\x95\x07\x20\
+\xda\xd1\x54\xe7\x36\x2c\xcd\xf9\x7b\x77\x7b\x4a\xac\x5e\xcb\x63\
+\x56\xff\xa5\x8f\x80\xf8\x4a\xd1\x71\xa2\xa3\x1b\xb1\x34\xe7\xef\
+\x9d\xf6\xfd\x6e\xd5\xa8\x3c\x22\xab\xff\xd2\x03\xa0\x66\x6d\xd9\
+\xca\xa9\x3d\xf2\xcc\xe5\x01\x65\x13\x98\xea\x2f\x03\xa0\x14\x32\
+\x5c\xce\x00\x0c\x0b\x4c\x99\x67\x00\x94\x42\x86\xcb\x19\x80\x61\
+\x81\x29\xf3\x0c\x80\x52\xc8\x70\x39\x03\x30\x2c\x30\x65\x9e\x01\
+\x50\x0a\x19\x2e\x67\x00\x86\x05\xa6\xcc\x33\x00\x4a\x21\xc3\xe5\
+\x0c\xc0\xb0\xc0\x94\x79\x06\x40\x29\x64\xb8\x9c\x01\x18\x16\x98\
+\x32\x6f\x1f\xc0\xa0\x1f\xf9\x51\xbd\x2f\x7b\xb9\xc2\x8f\x18\x8b\
+\x38\x0d\x5d\x07\x30\x57\x76\x2d\x53\xf6\x7f\xc3\x0f\xc2\xf9\x41\
+\x6d\xcd\x03\x98\x70\x57\x20\xf0\x34\xe5\x00\xca\xdd\x4c\xe2\x95\
+\x7f\x10\x2e\x5b\x05\x70\xf4\x54\xb1\x70\x3e\x97\x5b\xc9\x74\xbd\
+\x8f\x64\x74\x97\x7a\xca\xd8\x78\x04\xc4\x5d\xaf\xc9\x93\xc5\x49\
+\x4a\x4a\x4f\x18\x17\x02\xe0\x18\x42\xad\xde\x8e\xa3\xbe\x7e\x3a\
+\xb4\x0a\x03\x10\x3b\xac\xc3\x13\xc6\xaa\x4f\x16\x5b\x01\x10\x3b\
+\x3d\x7e\xca\xf8\x01\x20\x27\x25\xc4\x54\xd9\xdf\x14\x8d\xdf\x06\
+\x15\x90\x7b\x80\xd8\x1f\x02\xde\x53\x4f\x15\x27\xd7\xa9\x42\x23\
+\x20\xdd\x56\x56\xed\x56\x0c\xc0\x32\x5f\x06\xc0\x00\x2c\x2b\x60\
+\xd9\x3d\x47\x00\x03\xb0\xac\x80\x65\xf7\x1c\x01\x0c\xc0\xb2\x02\
+\x96\xdd\xd3\x11\x50\xbf\xf3\xfc\x50\xe7\x5d\xd4\xac\xfc\x68\x00\
+\x9e\x5b\xdb\xf3\x7c\xd5\xf3\x9c\x2c\x10\x68\x00\x35\x3e\xcf\x57\
+\x79\x17\x35\x8b\xf8\x71\x5b\x12\x40\x9d\xcf\xf3\xa1\x70\xa5\x68\
+\x1c\x40\x8d\xcf\xf3\xe3\xa1\x87\x7e\x10\x8e\x67\x15\x39\xd3\x8d\
+\x58\xa7\xb1\xee\xef\x7d\x4d\x76\xba\x28\xdb\x12\xf8\xa4\xfa\x48\
+\x79\xda\x3e\x91\x4b\x50\xb7\xe1\x3a\x9c\xe7\x77\x8f\xf7\x4c\x6c\
+\xc2\x49\xb2\x55\x3b\xcf\x3f\x35\x73\x25\x0e\x85\xc0\x2e\xf5\x28\
+\x79\xda\x19\xaf\x7d\x1f\x90\x97\x23\xb6\xd3\x5b\x01\xad\x25\x88\
+\x45\xcc\x5f\x01\x06\x90\xbf\xa6\x5a\x16\x19\x80\x96\x5c\xf9\x57\
+\x66\x00\xf9\x6b\xaa\x65\x91\x01\x68\xc9\x95\x7f\x65\x06\x90\xbf\
+\xa6\x5a\x16\x19\x80\x96\x5c\xf9\x57\xfe\x0f\xfc\x83\xc2\x8e\x8a\
+\x48\x30\x37\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x05\xaf\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x60\x00\x00\x00\x60\x08\x06\x00\x00\x00\xe2\x98\x77\x38\
+\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x05\
+\x69\x49\x44\x41\x54\x78\x5e\xed\x9d\x4d\x88\x1c\x45\x14\xc7\xff\
+\xaf\x37\x8e\xe6\xe0\x41\x45\x94\x08\x8a\x1e\x14\x4c\x40\x04\x61\
+\x0f\xf1\xa0\xa8\x91\x98\xc3\x0a\xcb\x8e\xd3\x3d\x78\x31\x87\x05\
+\xc1\x9c\xd4\x99\x09\x82\xb3\x20\x49\x6f\x56\x10\x0d\x5e\x82\xe6\
+\xe0\xce\x74\x4f\x92\x83\x98\x40\x82\x22\x08\xc1\x9b\x07\x45\x5c\
+\x64\x23\x7e\x20\x92\xf8\x45\x04\x15\x3f\xd0\xed\xd2\xde\xcd\xc6\
+\xd9\xd9\x19\xbb\x6b\xea\xcd\x74\xcd\xf4\xdb\x6b\xbf\x7a\xaf\xea\
+\xff\xab\x8f\x37\x5d\xb5\x5d\x04\xf9\xcb\x54\x01\xca\x34\xba\x04\
+\x87\x00\xc8\xb8\x13\x08\x00\x01\x90\xb1\x02\x19\x87\x97\x11\x20\
+\x00\x32\x56\x20\xe3\xf0\x32\x02\xc6\x0d\x40\xa5\x55\xde\xed\x44\
+\xd1\x6e\x45\x74\x07\x80\xbb\x00\xdc\x30\xec\x36\x12\xf0\xb9\x82\
+\xfa\x58\x29\x7c\xa6\xae\x74\x0e\x1f\x9a\x6e\x7e\x33\xec\x3a\xa4\
+\x8d\xc7\x3a\x02\xaa\x81\xd7\x00\xa1\x9c\x36\xf8\x90\xec\xce\x81\
+\xf0\x9c\x5f\x0a\x4e\x0c\x29\x9e\x56\x18\x36\x00\xd5\xd0\x53\x5a\
+\x91\x87\x6d\x1c\x61\xce\x2f\x07\xf5\x61\x87\x4d\x8a\xc7\x02\xa0\
+\x16\x7a\xfb\x14\xf0\x72\x52\x30\x0b\x9e\xd7\x7d\x37\x98\xb3\xa0\
+\x1e\x97\xab\x60\x0c\xa0\x76\xac\xbc\x53\x45\xea\x7d\x9b\x1a\x95\
+\x50\x17\xab\x20\x18\x03\xa8\x06\xee\xab\x20\x7a\x72\x84\x00\xc4\
+\x55\xb5\x06\x82\x39\x80\xd0\x7d\x0f\xa0\xfb\x46\x0c\x80\x35\x10\
+\x38\x00\x7c\x0f\xd0\xf5\x23\x08\xc0\x0a\x08\x0c\x00\x2c\xcb\x7e\
+\x22\xcc\xc1\xc1\xf3\x1a\x1d\x22\xd3\xe9\x68\xec\x00\xfc\x9b\xe5\
+\x50\xb5\xe9\xd5\x47\x05\xc2\x58\x02\x88\x7b\xff\xa8\x40\x18\x5b\
+\x00\xa3\x02\x61\xac\x01\xf4\x05\x61\xc8\xbf\x98\xc7\x1e\x80\xed\
+\x10\x72\x01\xc0\x66\x08\xb9\x01\x60\x2b\x84\x5c\x01\xb0\x11\x42\
+\xee\x00\xd8\x06\x21\x97\x00\x6c\x82\x90\x5b\x00\xb6\x40\xc8\x35\
+\x00\x1b\x20\xe4\x1e\x40\xd6\x10\x04\xc0\xa5\xd7\xa6\xda\xef\x8e\
+\x08\x45\x8e\x8d\x7e\x01\xd0\xf6\xde\x5a\x13\xc2\xb9\xa8\x40\x0f\
+\x98\x1e\x79\x19\x3b\x00\x8e\x52\x37\x1e\xf0\xc2\xef\x34\xf6\x03\
+\x36\x98\x6a\x41\x50\xb4\xe0\x7b\xcd\x67\xfb\x8d\x15\x97\x1b\x3b\
+\x00\x60\x98\x1a\x52\x43\x50\x38\xed\x7b\xc1\x1e\x01\xd0\xa1\x40\
+\xbc\x29\x63\x22\x8a\xc6\xc2\xfc\x95\xef\x06\xb7\x9a\xc4\x32\xaf\
+\xa8\xa5\x07\xb2\x08\xce\x14\x15\xf0\xc1\x81\xe9\xc6\x85\x7e\x05\
+\x4a\x33\x12\x4c\x61\x8f\x2d\x80\x7e\x45\xd7\x2d\x27\x00\x74\x15\
+\x63\xb6\x17\x00\xcc\x82\xea\xba\x13\x00\xba\x8a\x31\xdb\x0b\x00\
+\x66\x41\x75\xdd\x09\x00\x5d\xc5\x98\xed\x05\x00\xb3\xa0\xba\xee\
+\x04\x80\xae\x62\xcc\xf6\x02\x80\x59\x50\x5d\x77\x02\x40\x57\x31\
+\x66\x7b\x01\xc0\x2c\xa8\xae\x3b\x01\xa0\xab\x18\xb3\xbd\x00\x60\
+\x16\x54\xd7\x9d\x00\xd0\x55\x8c\xd9\x5e\x00\x30\x0b\xaa\xeb\x4e\
+\x00\xe8\x2a\xc6\x6c\x2f\x00\x98\x05\xd5\x74\x77\xde\x77\x83\x9b\
+\x34\xcb\x6c\x30\x97\x0d\x19\x13\xf5\xa0\x4e\xfa\x6e\x38\x65\xe2\
+\x42\x00\x18\xa8\x67\x3a\xfd\xc4\xa1\x05\x80\x3e\x80\xf8\xc8\xcb\
+\x59\xdf\x0d\x8a\xfa\x45\x37\x97\xc8\x2f\x00\x42\xd1\x89\xd4\x59\
+\x93\x33\x44\x02\xa0\x4f\x05\x38\xa6\x8e\x3e\x43\x6f\x2a\x96\xbb\
+\x11\x10\x1f\x57\x39\xe8\x36\x4e\x72\x09\x68\xea\x27\x77\x00\x9c\
+\x82\xb3\xcd\xe4\xac\x90\xa9\xe0\x9d\xe5\x73\x07\xc0\xa6\xe9\x27\
+\x97\x59\x90\x00\xe0\x1e\xc3\x9a\xfe\x04\x80\xa6\x60\xdc\xe6\x02\
+\x80\x5b\x51\x4d\x7f\x69\x01\x54\x43\xf7\x2d\x80\xee\x01\xb0\x4d\
+\x33\x44\xbb\xf9\x92\x02\xce\xcc\xbb\xc1\x33\xbd\x7c\xc8\x22\xdc\
+\x45\x19\xfe\x4f\x70\xaa\xa3\xbe\x1b\xee\xed\x06\x41\x00\x74\xa8\
+\x52\x0d\xbd\xe3\x00\x66\x0c\x7a\x7d\xf7\xa2\x44\x0f\xfb\xa5\xe6\
+\x3b\x92\x86\x26\xfc\xf3\x46\x35\xf4\xbe\x1d\xc4\xe7\x96\x15\xd1\
+\xbe\xf9\x52\xf3\xb0\x00\x48\x06\x30\x98\x2f\x00\x13\x66\xfd\x52\
+\x70\x44\x00\x64\x05\xc0\xc1\x43\xfe\x63\xc1\xbb\x02\x20\x13\x00\
+\xb2\x08\x5f\xee\x78\x49\x69\x28\x6b\x06\xa4\xb0\x4c\xa0\x37\x0f\
+\x7a\xcd\x9a\xa4\xa1\x97\x14\x18\x08\x00\xc2\xb2\x8a\xd4\xf4\xbc\
+\x17\x2e\xe9\x66\x4f\x92\x86\x6e\x4e\x43\xfb\x5b\x84\x15\xbe\x58\
+\x51\x98\x5e\x28\x07\x1f\xe9\x40\x10\x00\x5c\x00\xd6\xfc\x7c\x0d\
+\x44\x8f\xfa\x6e\xeb\xc3\xb4\x10\x04\x00\x2f\x80\xd8\xdb\xf9\x88\
+\x26\x1e\x3c\x54\x5a\xfc\x34\x0d\x04\x01\xc0\x0f\x20\xf6\xf8\xc3\
+\x96\x89\x89\xc9\x17\x8a\x8b\x5f\x26\x41\x10\x00\xda\x00\xd4\xdf\
+\x00\x6d\x49\x12\x16\xc0\x4f\x4e\xc1\xd9\x9e\xb4\xfb\x26\x00\x34\
+\x01\x44\x88\x66\x1c\x38\x6f\x00\xd8\x9a\x02\xc2\xaf\x7f\x4e\xfc\
+\x75\xcb\x4b\xc5\x13\x17\x25\x0d\x65\x4a\x43\xe3\x34\xb6\xd2\xf2\
+\xa6\x08\x58\x84\xc2\xd5\x29\x20\xfc\x71\xd5\xcf\xbf\x5c\x57\x9f\
+\x3d\xf5\xdb\xa0\xde\x86\x0e\xe4\xe5\x55\x8a\x86\xf5\x65\x62\xfa\
+\x3b\x60\xbd\x7c\x25\x2c\xed\x21\x38\x8b\x00\xae\x49\xaa\x88\x02\
+\x56\xb6\x2e\xdf\x5e\xa8\xd7\xeb\xd1\x20\x5e\x45\xbc\x0d\x60\x57\
+\x52\x25\x6c\x79\xce\x05\x20\x6e\x4f\xb5\x55\xde\x05\x15\x35\x52\
+\xde\x20\xd2\xf5\xd3\x36\xc6\x6b\x40\x2d\x70\x5f\x51\x44\x4f\xd9\
+\x22\x70\x52\x3d\x38\x01\xc4\xb1\xf6\x1f\xf3\xee\x8f\x22\x34\xd2\
+\xec\x9c\x29\xe0\xc5\xce\xdd\x31\x63\x00\xf1\xd5\x85\xa4\xd4\xe9\
+\xa4\x86\xdb\xf2\x3c\x05\x80\x4f\x00\x6c\xef\x51\xdf\x25\xdf\x0d\
+\x76\x74\x3e\xab\x04\xee\xbd\x44\xd4\x04\x70\x73\x42\x3b\xcf\xf8\
+\x6e\xf0\x48\xbb\x8d\x31\x80\xd5\xa1\x68\xe7\x15\x86\xdd\xb4\x48\
+\x3c\xcf\x5f\x09\xbd\x05\x02\x9e\xee\x56\xb8\x5b\x0f\x5e\xb7\xab\
+\x85\xa5\x49\x05\x27\x00\x70\xdb\xff\x40\x38\xe2\xbb\xc1\x2c\x3b\
+\x80\x55\x08\x96\x7e\x39\x6b\xa3\x18\xe9\xce\xf3\x57\x43\xf7\x75\
+\x80\x9e\xe8\x28\xdb\x73\x5f\x77\xdd\xae\x1a\x96\xee\x86\x72\x42\
+\x10\xe2\x8b\x4c\xbb\xfc\xd1\x5e\xdf\x6d\x1e\x1d\x08\x80\xd8\xa9\
+\xed\x57\x1a\x26\x4d\x3f\xed\xc2\xc4\x0b\xac\xc2\x9a\x90\x04\x2c\
+\x77\xdb\xcf\xed\x26\xf1\xfe\xd6\xe3\x3b\x22\x15\xbd\x06\xa8\xc9\
+\x0d\xcf\x7b\xdc\xcc\xc1\x32\x05\xb5\x07\x5a\xbd\xda\x70\x25\xf2\
+\x40\xb8\x73\x6d\x2e\xcd\xfc\x8e\x31\xd6\xf3\xfc\x69\xd6\xb2\xfa\
+\xf1\x99\x6b\x7f\x5f\xb9\xa2\x46\x6b\x6b\xc9\x8f\x20\x9c\xea\xf5\
+\x91\x57\x76\x00\x69\x2a\x28\x36\xff\x29\x20\x00\x32\xee\x0d\x02\
+\x40\x00\x64\xac\x40\xc6\xe1\x65\x04\x08\x80\x8c\x15\xc8\x38\xbc\
+\x8c\x00\x01\x90\xb1\x02\x19\x87\xff\x07\xd3\x04\xb7\x7f\xfa\x5a\
+\xac\xdf\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x0a\xc7\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x60\x00\x00\x00\x60\x08\x06\x00\x00\x00\xe2\x98\x77\x38\
+\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x0a\
+\x81\x49\x44\x41\x54\x78\x5e\xed\x5d\x6d\x90\x1c\x45\x19\x7e\xde\
+\xb9\xcb\x41\x54\x28\x28\xa5\x60\x67\x8f\x4a\xa2\x61\x67\x8f\x98\
+\x02\x02\x52\xa8\x54\x34\xb9\x9d\xbd\x80\x09\x54\xa4\xdc\xa4\xfc\
+\x20\x2a\x84\x2a\x09\xfa\xcb\x52\x41\x29\xc1\x0f\xa2\x96\xff\xc0\
+\xfc\x00\x54\x82\x62\xa5\x4c\x10\x41\x42\x92\xdd\xbd\x80\x29\xfc\
+\x28\x40\x0d\x05\x24\x3b\x9b\x20\xc4\x64\x67\x13\xc1\x82\x10\x31\
+\xc9\x5d\x76\x5e\xed\xb9\xbb\xd4\x11\x33\x33\x3d\xbd\x3d\xb7\x97\
+\xba\xe9\xbf\xf3\x7e\x3e\xcf\xf6\xf4\x74\xf7\xdb\xbd\x84\xb4\x75\
+\x14\x01\xea\xa8\xf7\xd4\x39\x52\x02\x3a\xfc\x23\x48\x09\x48\x09\
+\xe8\x30\x02\x1d\x76\x9f\xf6\x80\x94\x80\x0e\x23\xd0\x61\xf7\x69\
+\x0f\x48\x09\xe8\x30\x02\x1d\x76\x9f\xf6\x80\x94\x80\x0e\x23\xd0\
+\x61\xf7\x69\x0f\x98\xaa\x04\x0c\xf6\x65\x66\x78\x1e\x5d\x0c\x90\
+\xc9\xe0\x0c\x00\x93\x80\x5e\x62\xf4\x32\xe1\x7c\x81\x0b\x31\xf6\
+\x32\x61\x1f\x03\xfb\x00\xb8\x04\x6a\x02\xec\x1a\x06\x6f\xef\xdf\
+\xd9\xdc\xd3\x61\xec\xb4\xb8\x9f\xf0\x1e\xb0\xc5\xca\x2e\x34\x88\
+\x97\x83\xb1\x1c\xc0\x19\x8a\x59\x1c\x02\x61\x9d\xc7\xb4\x6e\xc0\
+\x69\x6c\x55\xb4\x31\x29\xd4\x26\x84\x80\xa7\xad\xf7\x9d\x71\x98\
+\xa7\x2d\x27\xa2\xe5\x0c\x2c\xd4\x99\x39\x01\x5b\x99\x79\xdd\x74\
+\x1a\x5e\x77\xa5\xf3\xfa\x21\x9d\xb6\x27\xc2\x56\xe2\x04\x54\x73\
+\xe6\xcd\x4c\xf8\x1a\x80\x19\x09\x27\xb4\x87\x18\x3f\x2a\xd4\xdd\
+\x35\x09\xfb\xd1\x6a\x3e\x51\x02\x2a\x96\xf9\x53\x00\x5f\xd4\x1a\
+\x71\xb4\xb1\x9f\xd9\x8e\x7b\x43\xb4\xd8\xe4\x90\x48\x84\x80\x6d\
+\x7d\x33\x32\x43\xde\xf0\x26\x06\x2e\xea\x44\x9a\x04\x3c\xdf\x63\
+\x4c\xbb\x6a\xfe\xce\x3d\xcd\x4e\xf8\x8f\xe3\x53\x3b\x01\xd5\x7c\
+\x76\x31\x33\xff\x2e\x4e\x10\x49\xc9\x12\xd1\x92\x42\xad\xf1\x78\
+\x52\xf6\x75\xd8\xd5\x4a\xc0\x96\x9c\x79\x87\x41\xf8\xb6\x8e\xc0\
+\x74\xd9\xf0\x18\x77\x0e\xd4\xdd\x3b\x74\xd9\xd3\x6d\x47\x1b\x01\
+\x95\x0b\xcd\x4b\xd0\xc2\x5f\xe3\x07\x48\xcf\x12\x7b\x8f\x30\x8c\
+\x06\x03\x8d\x69\xe0\xc6\x34\x1a\x6a\x08\x3b\xc3\xdc\x93\x1d\x06\
+\x65\x09\xc8\x12\xbc\x2c\x93\xb1\x14\xe0\x0f\xc5\xf6\xd1\x85\x79\
+\xf6\x0e\xf7\x6f\xb1\xf5\x26\x40\x41\x0b\x01\x4f\x5e\x3c\xf3\xac\
+\x63\x87\x87\xde\x88\x11\xef\xdb\x60\xfc\x1c\x1e\x3d\x64\xef\x6e\
+\xfc\x39\x86\x1e\x2a\xb3\xb3\x57\xc0\xe0\xcf\x80\xf0\x05\x00\xef\
+\x96\xd5\xed\x9e\xde\x73\xf6\x82\xed\xaf\xbe\x29\x2b\x3f\x51\x72\
+\x5a\x08\xa8\x58\x99\x8d\x00\x5d\x2d\x13\x34\x33\xd6\x9e\xd6\xc2\
+\xed\x1f\x7b\xd9\xdd\x2b\x23\x1f\x24\xf3\xfb\x0f\x98\xe7\x1f\xed\
+\xc2\x77\x89\xb0\x42\xce\x0e\x3f\x61\x3b\xcd\x4f\xc8\xc9\x4e\x9c\
+\x54\xdb\x04\x54\xac\xcc\xf7\x00\xfa\xa6\x4c\xc8\x04\xfc\xb0\xe0\
+\xb8\xdf\x90\x91\x95\x95\xa9\x5a\xe6\x0f\x18\xf8\xba\x9c\x3c\x7f\
+\xdf\x76\x9a\xdf\x92\x93\x9d\x18\xa9\xb6\x08\xd8\x62\x99\x37\x18\
+\xc0\xfd\x32\xa1\x76\x01\xd7\x2e\x74\xdc\xc7\x64\x64\xe3\xca\x6c\
+\xb5\xcc\x6b\x5a\xc0\xa3\x32\x7a\x1e\x70\xe3\x80\xe3\x8a\xf9\xc9\
+\xa4\x68\xca\x04\xf8\xcb\x0b\xe8\x79\x41\x66\x86\x6b\x3b\xae\xb2\
+\x9f\x38\x28\x55\x2c\x93\x25\xe4\xf7\x4c\xc7\xd0\xdc\xc9\xb2\x6c\
+\xa1\x0c\x4c\x25\x97\x59\x09\xa2\x7b\xa3\x12\x6e\x19\x7c\xe9\xa2\
+\x9d\x4d\x85\xaf\xa3\x28\xcb\xff\xff\x7c\x73\x5f\x66\x5e\x97\x47\
+\x7f\x89\xd4\x64\xbe\xc9\xae\x37\xef\x8b\x94\x9b\x00\x01\x65\x02\
+\xaa\x96\x39\x18\xb5\xb0\xc6\xcc\x2b\x8b\xf5\xa6\xd4\x2b\x4a\x57\
+\xae\xe5\x5c\xe6\x46\x22\x0a\x05\x57\x2c\xe0\x15\x1c\xb7\x5f\x97\
+\xcf\x76\xec\x28\x11\xe0\x2f\x29\x83\x07\x23\x1c\xaf\xb1\x1d\x77\
+\x55\x3b\xc1\xa9\xea\x56\x2c\xf3\x27\x00\x6e\x0e\xd3\xf7\x40\xfd\
+\x93\x61\x29\x5b\x89\x80\x4a\xde\xbc\x17\x8c\x95\x21\x09\x1e\xf6\
+\xd0\x9a\x33\xe0\x1c\x78\x45\x15\xc4\x76\xf4\xb6\x58\xe7\xce\x32\
+\xd0\xf5\x12\x80\xe9\x81\x76\x08\xf7\xd9\x35\xf7\xa6\x76\xfc\xe8\
+\xd0\x8d\x4d\xc0\xe8\x4e\x96\x18\x7c\x03\x37\x53\x08\xf4\xcb\x82\
+\xd3\xf8\x9c\x8e\x00\x55\x6d\x54\xad\xec\x2f\x18\xfc\xd9\x10\xfd\
+\x43\x86\xc1\x73\x3b\xbd\xb3\x16\x9b\x80\x72\x2e\xb3\x94\x88\x7e\
+\x13\x06\x0c\x79\xb0\x0b\xbb\xdc\xaa\x2a\x78\x3a\xf4\xaa\x17\x98\
+\x05\x36\x50\x09\xb3\xc5\xcc\x9f\x2c\xd6\x9b\x8f\xe8\xf0\xa7\x6a\
+\x23\x36\x01\xd5\x9c\xb9\x8a\x09\xf7\x04\x39\x64\xf0\x8b\x45\xa7\
+\x39\x57\x35\x20\x9d\x7a\x65\x2b\xf3\x02\x81\x3e\x18\x64\x93\x18\
+\xb7\x14\xea\xae\x18\x2f\x3a\xd6\x62\x13\x50\xce\x67\xef\x22\xe6\
+\x5b\x83\x93\xe2\xdb\x0a\xf5\xe6\xea\x8e\x65\x34\xce\x71\x35\x97\
+\xb9\x95\x89\xee\x0a\xfc\xb1\x10\xad\x2e\xd6\x1a\xb7\x75\x32\xd6\
+\xd8\x04\x54\xf2\x99\xb5\x60\xba\x3e\x30\x68\xa6\x15\x76\xbd\xf1\
+\x60\x54\x52\x65\xcb\x7c\x94\x80\xcb\x44\x35\x44\x94\xec\x09\xcf\
+\x5d\x06\x9e\x2b\x3a\xee\xb5\x51\x7a\x95\x5c\xf6\x7a\x10\xaf\x0d\
+\x1e\x88\xf9\x41\xbb\xd6\x94\x5c\x4b\x8a\xf2\xa6\xf6\x3c\x3e\x01\
+\x96\x29\xde\xed\x81\xdf\xd0\xcc\x54\x28\xd6\x1b\xa1\x9f\xa8\x92\
+\x33\xd6\xc8\x8c\xa2\x66\xd8\xe5\x5c\xb6\x9f\x88\xc3\xc6\xa2\x41\
+\xdb\x71\x0b\x91\x8e\x12\x14\x88\x4d\x40\xd9\x32\x77\x12\x90\x0f\
+\x8a\xa9\x9b\xd1\xb7\xa0\xee\xd6\x82\x9e\x57\x2d\xf3\xd7\x0c\x7c\
+\x4a\x47\x4e\x04\xac\x2f\x38\x6e\x29\xc8\xd6\x93\x39\x33\x7f\x8c\
+\xb0\x33\x78\xbc\x42\xad\xe8\xb8\x7d\x3a\x62\x51\xb5\x11\x9b\x80\
+\x8a\x65\xbe\x15\xf6\x09\x3a\x1d\x43\x67\x86\xad\xb3\x54\x72\xe6\
+\x7e\x10\xce\x55\x0d\xf8\x1d\x7a\x8c\x03\x76\xdd\x3d\x2f\xc8\xd6\
+\xe8\x7a\x95\x88\x37\xa8\x1d\xb2\x1d\xf7\x4c\x2d\xb1\x28\x1a\x51\
+\x21\xe0\x20\x80\xc0\xa0\x23\x09\xb0\x4c\xb1\xdb\x15\xf7\xbd\x1f\
+\x94\x9e\x6b\x3b\x6e\xb6\x0d\x02\x8e\xd8\x8e\x1b\x3c\x59\x53\x04\
+\x35\x8e\x5a\x6c\x02\xaa\x39\xf3\x45\x26\xcc\x51\x7d\x05\x8d\x0e\
+\xbe\xd7\xc4\x09\x32\xe4\x15\xf2\x58\xd8\x60\x1c\xf5\x0a\x02\xe1\
+\x80\x5d\x0b\xee\x41\x3a\x62\x8c\xb2\x11\x9b\x80\x8a\x65\x6e\x06\
+\x30\x10\x08\xca\xa9\x35\x08\xd7\x6d\xc7\xb5\xa2\x40\x4a\xf2\x79\
+\x6c\x02\xca\x96\x79\x3f\x01\xc1\x85\x4f\x92\x9f\xa1\xfe\x60\xcc\
+\x98\x1f\x7b\x3c\x60\x1c\x20\xc2\xb6\xb0\xc1\x77\x0c\xb0\xc8\xcf\
+\x50\xd0\xb3\xb6\xd3\xb8\x3c\x49\x80\xa3\x6c\xab\x10\xf0\x1d\x02\
+\x6e\x0f\x32\x4c\x7c\xea\x4c\xc4\xa2\xbe\xa2\xa2\xc0\xd3\xf1\x3c\
+\x36\x01\x15\x2b\xfb\x25\x80\x43\xea\x2f\x3b\xff\xab\x3a\xde\x03\
+\xac\xec\x33\x61\x65\x2c\x0c\x2a\x15\x9d\xc6\x7a\x1d\x40\xaa\xda\
+\x50\x20\xc0\x14\x33\xd0\xdf\x86\x3a\x6c\xd1\x87\xe3\x96\x9b\xa8\
+\x26\x10\xa4\xe7\x97\xaf\x74\xf1\x9f\xc2\xec\x1e\x61\x9c\xb3\xa4\
+\xee\xbe\xae\xdb\x77\x1c\x7b\xb1\x09\x90\x59\x8e\x06\xe3\x1e\xbb\
+\xee\x7e\x39\x4e\x20\xba\x65\x2b\x39\xf3\x6e\x10\x6e\x51\xfd\x82\
+\xd2\x1d\x4f\xe0\x2b\x5b\xc5\x91\xc4\x86\xcc\xdb\x3d\xc7\xd0\xd7\
+\x6e\xed\x8f\x4a\x6c\x42\x47\xd4\x0c\x0d\x75\xfb\x33\xe0\xc0\xc2\
+\x2d\x62\xac\x9a\x0c\xa5\xec\xb1\x7b\x80\x48\x50\x66\x4b\x52\x14\
+\x60\x15\xeb\xee\xe7\x55\x41\x6c\x47\xaf\x9c\x33\x1f\x08\x2b\xd8\
+\x62\xe0\xb5\xd3\x5b\xde\x9c\xf9\xbb\xf7\xbf\xd6\x8e\x1f\x1d\xba\
+\x4a\x04\x08\xc7\x32\x9b\xf2\x49\x14\x62\x45\x25\x2d\x59\xa8\xd5\
+\xb1\xfd\xea\x13\xe3\x57\x26\x40\xb6\x2c\x25\xc9\x82\xac\x13\x93\
+\x91\x2e\xd0\x22\x6f\x81\x5d\xdb\xff\x54\x14\x99\x13\xf1\x5c\x99\
+\x80\x53\xb6\x30\x6b\x92\x6c\xc6\x8f\x91\xab\x4c\x80\xff\x1a\x1a\
+\x39\xff\x25\xb5\xa5\x97\x64\x81\x96\x6c\x41\x96\x38\x39\xd3\xd5\
+\xa2\xc5\x0b\x76\x37\xc4\xb1\xd7\x49\xd1\xda\x22\x40\x64\x10\xe7\
+\x1c\x58\x12\x85\x5a\x32\x85\x58\x63\x48\x4f\x86\x89\x97\xb6\x31\
+\x60\xbc\xa1\xaa\x65\x6e\x8f\x71\x1e\x6c\x8d\x87\xd6\x8f\xdb\xad\
+\x19\x1a\xad\xfd\xf9\x6a\x54\x01\xd6\xf1\x38\x09\x3b\xba\x0c\xaf\
+\xb4\x70\xc7\x7e\x51\x2f\x34\x69\x5a\xdb\x3d\x40\x64\x22\x0e\xe5\
+\x1d\xf5\x86\xdd\x18\x59\x1d\x26\xd0\xc3\xf0\x78\x6d\xdc\xf2\x15\
+\x51\x6e\x02\x83\x56\x30\xf8\xba\xd0\xc2\xab\x93\x07\x53\x03\x19\
+\x25\xbb\xb6\x4f\xd4\x35\x4d\x8a\xa6\x85\x00\x7f\x3c\x50\x3c\x9c\
+\x27\xca\x58\x0c\xc6\xaf\x64\x8e\x28\x79\x84\x4f\x87\x95\x99\x48\
+\x22\x5a\x6f\x31\x95\x16\xd5\x1b\xcf\x4b\xca\x27\x2a\xa6\x8d\x00\
+\x11\xe5\x64\x3c\xa4\x77\x32\xf4\x98\xb1\x9b\x3c\x94\xec\xdd\x9d\
+\x3f\x37\xa6\x95\x00\x7f\x50\x56\x3e\xac\x97\xe8\x0f\xed\x24\xc6\
+\xf9\xef\x1e\xa1\x34\x50\x6b\x46\x97\xb3\x27\x18\x9a\x76\x02\x44\
+\xac\x23\x87\xf6\x8e\x3e\x24\x7b\x6e\x4c\x7b\x7e\x84\x1d\x60\x5c\
+\x28\x61\xf7\x15\x06\x97\x8a\x4e\xf3\x39\x09\xd9\x44\x44\x12\x21\
+\x60\x2c\xd2\x38\xe7\xc7\x74\x64\x47\x8c\x97\x40\xbc\xda\xe8\xe2\
+\xed\xad\x96\xb1\x01\x21\xe5\x33\xe3\xfc\xed\x31\xd8\x28\xf5\xd7\
+\xf7\x3d\xa3\x23\x86\xb8\x36\x12\x25\xc0\x1f\x17\x46\xce\x91\x89\
+\x1d\xb4\x44\x2f\xeb\x20\xc6\x03\xc3\x86\x77\xe7\x55\xb5\xfd\xaf\
+\xfa\xaf\xc2\x7c\xef\x5c\xb0\x27\x48\xc8\x49\x80\xb2\x17\x06\x95\
+\xec\x9d\xf1\x8e\xcc\x4a\xd8\x8d\x14\x49\x9c\x00\x11\x41\x52\xd7\
+\xd5\x88\x55\x4d\xb1\xad\x08\xf2\xd6\x9f\x6c\x6d\x67\x73\x2e\x7b\
+\x91\x01\xde\x40\x84\xd9\x91\x48\x00\x0d\x83\x50\xea\xaf\xb9\x7f\
+\x94\x90\xd5\x26\x32\x21\x04\x8c\x8f\x56\xc7\x85\x4d\x04\xda\x04\
+\xe6\xc7\x7b\x3c\x6f\x7d\xd4\x92\x72\x65\xb6\x79\x09\xba\x78\x03\
+\x40\xef\x97\x40\xad\x09\x46\xc9\xae\xbb\x4f\x4b\xc8\x6a\x11\x99\
+\x70\x02\xc6\xa2\x16\x3b\x6b\xad\x16\xe6\x19\x20\xd3\x33\xc4\x75\
+\x04\x5e\x16\x4c\x59\xf6\xaf\x25\x80\x28\xb6\x9a\x06\xc2\x41\x30\
+\x0e\x02\x74\x90\x80\x7f\x30\x78\xa3\x77\xac\xb5\x71\xe0\xe5\x03\
+\xff\x8c\x93\xfd\x96\x7c\xe6\x52\x83\x49\xec\xfd\xce\x8a\xd4\x63\
+\x1c\x30\x98\x4b\xfd\xbb\x9a\xdb\x22\x65\x35\x08\x74\x8c\x00\x0d\
+\xb1\xc7\x32\x51\xb6\x32\x97\xfd\x6f\x12\x27\xc6\x84\xc8\xb1\xc8\
+\x7f\xb5\x8d\xcc\x98\x13\x5f\xb2\x9e\x32\x04\x08\xb6\x06\x73\xbd\
+\x97\x7b\xe4\x0f\xcc\xfe\xa5\x80\x11\xed\x5f\x1e\xa8\x94\xf4\x41\
+\xbe\x29\x45\x80\xff\x75\xd4\x97\xbd\x02\x9e\x18\x13\xfc\xd7\x5c\
+\x68\x63\xe0\x0d\xc3\x43\x29\xee\x7a\x55\x94\xdd\xf1\xcf\xa7\x1c\
+\x01\x7e\x4f\xc8\x9b\x1f\xf1\x18\x82\x04\x71\x5d\x66\x68\x23\xe0\
+\x4d\x8f\xb0\xac\x58\x73\xcb\x51\xb2\x2a\xcf\xa7\x24\x01\x7e\x4f\
+\xc8\x99\x57\x02\xd8\x20\x59\x1a\xf9\x16\x81\x97\x15\x9c\xa6\xa8\
+\x8b\xd5\xda\xa6\x2c\x01\x7e\x4f\xb8\x20\x33\xbf\x65\xd0\x06\x02\
+\xce\x91\x40\xf5\xdf\xcc\xc6\xb2\x62\x7d\xdf\x13\x12\xb2\xd2\x22\
+\x53\x9a\x00\xbf\x27\xe4\x7b\x3f\x3e\x3a\x63\x7e\xaf\x04\x6a\xff\
+\xf1\x88\x96\x0d\x68\xbc\x87\x6e\xca\x13\x20\x40\x17\x93\x43\x12\
+\x33\x66\xe0\x6c\x09\x12\x8e\x8c\xce\x98\xb5\x5c\x4c\x98\x12\x30\
+\x8a\xf8\xc8\x4e\x1b\xd6\x33\x70\x56\x14\x09\x0c\x0c\x11\x50\xb2\
+\x1d\x57\xea\x8e\xa2\x30\x7b\x29\x01\xe3\xd0\x29\xe7\xcd\x22\x31\
+\xc4\x8c\x59\xe6\xdc\xd8\x31\x7f\xc6\xdc\xe6\x49\xfb\x94\x80\x13\
+\x7e\x9e\x55\x2b\xb3\x88\xe1\x2f\x5b\xbc\x47\xa2\x27\x78\x44\x5c\
+\xb2\x6b\xcd\x87\xa3\x64\x83\x9e\xa7\x04\x9c\x04\x99\x72\xae\xf7\
+\x6a\x22\x4f\x90\xf0\x2e\x19\x60\xdb\xa9\xfe\x4b\x09\x08\x40\x78\
+\x4b\x3e\xbb\xd8\x60\x16\x24\x9c\x2e\x41\xc2\x1f\x6c\xc7\x15\xf3\
+\x8a\xd8\x2d\x25\x20\x04\xb2\xc1\xbc\xb9\xa4\xc5\x10\x5f\x47\x3d\
+\x51\xc8\x1e\x23\x6f\xd6\xd8\x66\x50\x94\xec\xf8\xe7\x29\x01\x11\
+\x68\x55\x2c\xff\x44\x90\x58\xb6\xe8\x0e\x15\x55\x2c\xf8\x4d\x09\
+\x90\xf8\xb9\x0e\xe6\x32\x4b\x5b\xe4\xcf\x98\x8d\x20\xf1\xd3\x8c\
+\x69\xa6\xca\x6d\xed\x29\x01\x12\x04\x8c\xcc\x98\x33\xd7\x81\xfd\
+\xfd\x84\x93\x34\x7e\xca\x76\x9a\x0b\x24\x4d\xbd\x43\x2c\x25\x20\
+\x06\x6a\xa3\xe7\x0f\xc4\xbf\x81\x7c\xf4\xb8\x1a\xe3\x6e\xbb\xee\
+\x7e\x25\x86\x99\x94\x00\x55\xb0\xc6\xf4\x36\xe5\xcf\x9b\xd9\x0d\
+\xcc\x34\xbc\xee\x5d\xfd\xf5\x7d\xfe\x4d\xef\xaa\x2d\xed\x01\xaa\
+\xc8\x69\xd2\x4b\x09\xd0\x04\xa4\xaa\x99\x94\x00\x55\xe4\x34\xe9\
+\xa5\x04\x68\x02\x52\xd5\x4c\x4a\x80\x2a\x72\x9a\xf4\x52\x02\x34\
+\x01\xa9\x6a\x26\x25\x40\x15\x39\x4d\x7a\x29\x01\x9a\x80\x54\x35\
+\x93\x12\xa0\x8a\x9c\x26\xbd\x94\x00\x4d\x40\xaa\x9a\x49\x09\x50\
+\x45\x4e\x93\x5e\x4a\x80\x26\x20\x55\xcd\xa4\x04\xa8\x22\xa7\x49\
+\xef\xbf\x34\x99\xad\x8e\x9b\xf8\x85\x01\x00\x00\x00\x00\x49\x45\
+\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x03\x08\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x60\x00\x00\x00\x60\x08\x06\x00\x00\x00\xe2\x98\x77\x38\
+\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x02\
+\xc2\x49\x44\x41\x54\x78\x5e\xed\x9a\x3d\x8a\x15\x41\x14\x46\xcf\
+\x6c\x42\xc5\x25\x38\x4b\x50\x04\x13\xc1\x44\xb3\x09\xd4\x1d\x0c\
+\xea\x5a\x34\x70\x05\x9a\x68\x34\x89\x62\x66\x62\x66\x62\x38\x0b\
+\x18\x19\x71\x0f\xfe\x34\xf8\x40\x85\xa6\xbb\xea\x16\xfd\xbd\x19\
+\xce\x83\x97\xd5\xed\xaf\xea\x3b\x7d\xeb\xe7\x56\x1f\xe0\x2f\xea\
+\xc0\x41\x54\x5d\x71\x04\x10\x7e\x09\x04\x20\x80\xb0\x03\x61\x79\
+\x33\x40\x00\x61\x07\xc2\xf2\x66\x80\x00\xc2\x0e\x84\xe5\xcd\x00\
+\x01\x84\x1d\x08\xcb\x9b\x01\x02\x08\x3b\x10\x96\x37\x03\x04\x10\
+\x76\x20\x2c\x6f\x06\x5c\x02\x00\x37\x81\x87\xc0\x0d\xe0\x10\xf8\
+\x01\x7c\x01\x4e\x81\xf7\x7f\xfe\xe1\x61\xee\xaf\x7c\x35\x03\x9e\
+\x02\xcf\x17\x86\xf7\x1a\x78\xbc\xbf\x16\x64\x7b\x56\x01\xf0\xb3\
+\xb1\xeb\x15\xad\x46\xa9\x8b\xd3\xbc\xd7\x94\x57\xc0\xa3\xc6\x61\
+\x3e\x03\x5e\x34\xc6\x5c\xfa\xe6\x3d\x00\xee\x01\xef\x3a\x9d\xb9\
+\x05\x7c\x5a\x19\xfb\x06\xb8\x0d\x5c\x5d\xd9\x3e\xd5\xec\x2b\xf0\
+\x19\x78\xd0\xd3\x81\x1e\x00\xd3\x5b\xfc\xa4\x47\x0c\x78\x09\x1c\
+\xaf\x88\x6d\x9d\xde\x56\x3c\x72\x93\x26\xcd\x7e\x36\x07\x00\x1f\
+\x80\xbb\x9d\xc3\xf9\x08\xdc\x59\x88\x3d\x01\xee\x77\x3e\x3f\x1d\
+\xf6\x16\x38\x6a\xe9\x44\x0f\x80\xf3\xc2\xb4\xf0\xfd\x77\x16\x5c\
+\x59\xe8\xe0\x19\x70\xbd\x65\x10\x7b\xd4\xf6\x1b\x70\xad\xa5\x3f\
+\x02\x68\x71\x6b\xb9\xed\x26\x00\x9c\x82\xe6\x41\x6c\x32\x05\xb9\
+\x08\xcf\x03\x68\x9e\x51\x9a\x03\x00\xb7\xa1\xff\x02\xd8\x7c\x1b\
+\x3a\xc9\x7b\x10\x5b\x5e\x0f\x56\xb5\xe8\xc9\x80\xdd\x83\x5b\xf7\
+\xea\x15\xad\x55\x83\xb9\x88\x8d\xaa\xa6\x58\x8c\x2b\x52\xaf\x02\
+\x98\xe4\x2d\x47\x17\x20\x8c\x00\x50\x90\x37\x54\x00\xe1\x77\x40\
+\x00\x02\x08\x3b\x10\x96\x37\x03\x04\x10\x76\x20\x2c\x6f\x06\x08\
+\x20\xec\x40\x58\x7e\x44\x06\x78\x10\x2b\x40\xac\x02\xb0\x14\x51\
+\x30\x7f\x0a\xad\x00\xb0\x18\x57\x34\xbf\x02\xc0\x72\xf4\x00\xf3\
+\x7b\x01\x78\x21\x13\xbe\x90\xf1\x4a\x32\x7c\x25\xe9\xa5\xfc\x3c\
+\x80\x4d\x2e\xe5\xfd\x2e\x68\x1e\xc0\x26\x9f\xa5\x08\x20\x0c\xc0\
+\x29\x28\x3c\x05\xb9\x08\x87\x17\x61\xb7\xa1\xe1\x6d\xe8\x24\xef\
+\x41\x2c\x78\x10\xdb\x49\x5b\x8a\x18\x00\xa1\x52\x0b\x9a\xe4\x2d\
+\xc6\x15\x21\x54\x01\x4c\xf2\x96\xa3\x0b\x10\x46\x00\x28\xc8\x1b\
+\x2a\x80\xf0\x3b\x20\x00\x01\x84\x1d\x08\xcb\x9b\x01\x02\x08\x3b\
+\x10\x96\x37\x03\x04\x10\x76\x20\x2c\x3f\x22\x03\x3c\x88\x15\x20\
+\x56\x01\x58\x8a\x28\x98\xdf\xfb\x55\x84\xc5\xb8\xa2\xe9\x7f\x87\
+\xf7\x66\x80\xe5\xe8\x41\x10\x7a\x00\x78\x21\x13\xbe\x90\xf1\x4a\
+\x32\x7c\x25\xe9\xa5\x7c\xf8\x52\xde\xcf\x52\xe6\x01\xf8\x5d\xd0\
+\xa0\xb5\xb1\xf7\x31\x9b\x00\x70\x0a\x0a\x4f\x41\x2e\xc2\xe1\x45\
+\xd8\x6d\x68\x78\x1b\x3a\xc9\x7b\x10\xeb\x5d\x25\xfe\x8b\xeb\x39\
+\x88\x59\x8a\x18\x64\x7e\xb5\x16\x34\xc5\x5b\x8c\x2b\xc2\xa8\x64\
+\xc0\x4e\xda\x72\x74\x01\xc2\x08\x00\x05\x79\x43\x05\x10\x7e\x07\
+\x04\x20\x80\xb0\x03\x61\x79\x33\x40\x00\x61\x07\xc2\xf2\x66\x80\
+\x00\xc2\x0e\x84\xe5\xcd\x00\x01\x84\x1d\x08\xcb\x9b\x01\x02\x08\
+\x3b\x10\x96\x37\x03\x04\x10\x76\x20\x2c\x6f\x06\x08\x20\xec\x40\
+\x58\xfe\x17\x60\x30\x9c\x61\x3d\x49\x86\xfc\x00\x00\x00\x00\x49\
+\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\xa7\x8e\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x01\x00\x00\x00\x01\x00\x08\x06\x00\x00\x00\x5c\x72\xa8\x66\
+\x00\x00\xa7\x55\x49\x44\x41\x54\x78\x9c\xec\x7d\x69\x70\x1c\xc7\
+\x95\xe6\x97\x59\x47\xdf\xe8\xc6\x49\x80\xb8\x48\x10\x04\x6f\x4a\
+\xbc\x2f\x51\x14\x45\x52\xd6\x69\x5d\xa6\x3d\xbe\xed\xf5\xec\xcc\
+\x8e\x67\x77\x22\x26\x76\x63\x63\x22\x76\x76\x6c\xff\x99\xd8\xd8\
+\x89\x3d\x66\x62\xc3\x31\xf6\xce\xec\xf8\x90\x2c\x8f\x35\x92\xad\
+\xd3\xb6\x46\x17\x45\x4a\xe2\x21\x8a\xf7\x01\xe2\x20\x41\x10\xf7\
+\xd9\xdd\x40\x77\x75\x55\x65\xe6\xfe\xa8\xca\x42\xa1\x09\x92\x20\
+\x09\x90\x20\x85\x2f\x02\x41\x09\xa8\xae\xae\x23\xf3\xe5\xcb\xf7\
+\xbe\xf7\x3d\x60\x16\xb3\x98\xc5\x2c\x66\x31\x8b\x59\xcc\x62\x16\
+\xb3\x98\xc5\x2c\x66\x31\x8b\x59\xcc\x62\x16\xb3\x98\xc5\x2c\x66\
+\x31\x8b\x59\xcc\x62\x16\xb3\x98\xc5\x5d\x06\x72\xbb\x2f\x60\x16\
+\xb3\xf8\x8c\x80\x00\xa0\xee\x7f\x0b\xf7\x47\xfe\xde\x3f\x0f\x45\
+\xde\xdf\xa7\x15\xea\xad\xf8\x92\x59\xcc\x62\x16\x50\xdc\x1f\x02\
+\x80\x01\xe0\xbe\xdf\x53\xdf\x71\x02\x80\xed\x1e\x33\x8b\x59\xcc\
+\x62\x16\xd3\x87\xd9\x2d\xc0\x2c\x66\x71\x0b\x41\x08\x01\xa5\x14\
+\x94\xd2\x09\xff\x2e\x84\x00\xe7\x1c\x9c\x73\xe9\x9d\x33\x4c\xe3\
+\x76\x60\x76\x0b\x30\x8b\x59\xdc\x62\x10\x42\xbc\x9f\x7c\x08\x21\
+\x20\x84\x00\x9c\x6d\x81\x80\xb3\x48\x4f\x9b\x01\x98\xf5\x00\x66\
+\x26\xee\xd4\xf7\x72\x4b\x02\x57\x33\x18\xc4\xf7\xaf\xff\x59\x50\
+\x00\x85\x00\xe2\xee\xff\x27\x01\xa4\xe0\xec\xff\xe3\x00\x0a\x7c\
+\xc7\x1a\x00\xfa\x00\x64\x27\x38\xef\x94\x3f\xdf\x59\x0f\x60\xe6\
+\x81\x60\x2c\x60\x34\x95\xe0\x18\x8b\x2e\x93\xbc\x9f\xa9\x00\xc3\
+\x34\xbb\xab\x33\x1c\xf2\x9d\x51\xf7\x5f\x8e\xb1\x40\x5f\x00\xc0\
+\x66\x00\x1b\xe1\x3c\xef\x43\x00\x8e\x02\x08\xb9\xbf\xbb\xd7\x3d\
+\x8e\x00\xb8\x08\xe0\x0d\x00\xa7\x7c\xe7\x96\x63\xc2\xc6\x14\x3f\
+\xdf\x59\x03\x30\xf3\x20\x30\x36\x59\xa7\xfa\xbc\xf2\x5f\xff\x4a\
+\x35\xd5\xe7\xff\xac\x82\xfb\xfe\xa5\x18\x33\x88\x00\x10\x04\x70\
+\x0f\x80\xaf\xc2\x31\x06\xc5\xee\xef\x63\x00\x1e\x07\xb0\xcb\x77\
+\x9e\xd3\x00\x7a\x00\x9c\xf1\x9d\xd3\x9f\x42\x9c\x52\xcc\x1a\x80\
+\x5b\x87\x2b\xad\xb8\x22\xef\x77\x8c\x52\xca\x27\xda\x1f\x4e\x21\
+\xa6\x7c\xb2\xca\xe0\x15\xc6\x7b\x2e\xf9\xf7\x26\x7f\x77\xcb\xf2\
+\xdc\xd3\x0c\xff\xfb\xe4\x70\x27\x3c\xa5\xd4\x96\x7b\x7c\x4a\x29\
+\x18\x63\x49\x4a\x69\x98\x73\x5e\x13\x8b\xc5\x70\xcf\x3d\xf7\x6c\
+\xfb\xf2\x97\xbf\x6c\x11\x42\xf4\xa3\x47\x8f\xae\x4a\xa7\xd3\x91\
+\x91\x91\x11\x64\x32\x19\xa4\xd3\xe9\x7b\x52\xa9\xd4\xb6\xd6\xd6\
+\xd6\xe1\x6c\x36\xdb\x0e\xa0\x6d\xf7\xee\xdd\xc3\x00\xc4\x8b\x2f\
+\xbe\x08\x8c\xc5\x06\xa6\xe4\xf9\xcd\x1a\x80\x5b\x07\x0a\xe7\x79\
+\xe7\x93\x3e\xe0\xff\xdd\xf7\xbe\xf7\x3d\xf1\xd7\x7f\xfd\xd7\x5c\
+\x51\xa6\x7a\x07\x30\xbd\x60\x8c\x81\x31\x46\x08\x21\x9a\xef\xd7\
+\x97\xdd\x1f\xee\xae\x3c\xb7\x74\xcd\x09\x00\x13\x70\x02\x7c\x8a\
+\xa2\x40\x51\x14\x50\x4a\xa1\x69\x1a\x72\xb9\x1c\x82\xc1\x60\xca\
+\x30\x0c\x94\x97\x97\x63\xc7\x8e\x1d\x0d\xdf\xf8\xc6\x37\x48\x28\
+\x14\xb2\x3b\x3a\x3a\xe6\x64\xb3\x59\xf4\xf5\xf5\x61\x70\x70\x10\
+\xe7\xcf\x9f\xd7\xdf\x7b\xef\xbd\xfb\x5b\x5b\x5b\xab\x00\x1c\x00\
+\xf0\xeb\x5f\xfd\xea\x57\x83\x00\x04\xa5\x54\x08\x21\x54\x8c\x3d\
+\xc3\x9b\xc6\xac\x01\xb8\x75\xf0\xbb\x84\x57\xc4\x0f\x7e\xf0\x03\
+\x00\xd0\x2c\xcb\xd2\x70\xf9\xc4\xb9\x51\xb7\x40\x60\x8c\x7c\x22\
+\x5d\x54\xf9\x73\x23\x71\x80\xfc\x6b\x11\x00\x2c\x42\x88\x05\x27\
+\x88\xf5\x59\x81\x7f\x9f\xaf\x00\xd0\x85\x10\x8a\x65\x59\xba\x65\
+\x59\x36\x00\xf6\xb5\xaf\x7d\x0d\xcf\x3d\xf7\x5c\xd8\x30\x8c\x24\
+\x80\x4f\x2d\xcb\x6a\x88\xc7\xe3\xc1\x5c\x2e\xb7\x30\x10\x08\xd8\
+\xe5\xe5\xe5\x84\x10\xc2\xea\xeb\xeb\x2d\x00\xbc\xb3\xb3\x33\x74\
+\xe1\xc2\x85\x05\x8a\xa2\x2c\x00\xa0\x03\xf8\x58\x55\x55\xa1\xaa\
+\xaa\x34\xa6\xd4\xf7\x9d\x37\x8d\x59\x03\x30\x75\xf0\x4f\xa8\xcb\
+\x26\x08\xa5\xd4\xa6\x94\x5e\x96\xfa\x11\x42\x8c\xfb\x9d\x65\x59\
+\x00\xb0\x12\xc0\x1a\x38\x03\x00\x18\x9b\xc0\x93\x7d\x5f\x72\x92\
+\x4b\x30\x00\x97\xdc\x9f\x0c\x80\x28\x80\x52\x38\x7b\xd1\x28\x80\
+\xfc\x55\xfb\x5a\x06\xc1\xc6\xd8\xca\x07\x00\x16\x80\x23\x00\x0e\
+\x6a\xda\xd8\xa9\xf2\xef\x4d\xfe\xce\x97\xe7\x9e\xc8\xc0\xc9\x18\
+\xc8\x94\x0d\xf2\x29\x86\x5c\xf5\xc7\x5d\x63\x3c\x1e\xaf\xb1\x2c\
+\xeb\xbe\x4c\x26\x53\xe6\xfe\xca\x02\xc0\x9f\x7b\xee\x39\x79\x88\
+\x0a\xe0\xcd\xd6\xd6\xd6\x23\xc7\x8e\x1d\x5b\xfb\xb3\x9f\xfd\xec\
+\x1e\x4d\xd3\x54\x00\x28\x28\x28\x30\x76\xef\xde\x6d\xe8\xba\x8e\
+\xb9\x73\xe7\x86\xe7\xcf\x9f\x0f\xd7\x03\x2c\x03\x10\x92\x5b\x09\
+\xdf\xf7\x4f\xd9\xfe\x70\xd6\x00\x4c\x1d\x64\xa0\xc6\x9f\x02\xf2\
+\xd2\x37\xf2\x25\xfa\x27\x84\x9c\x20\xfe\xdf\x2d\x5a\xb4\x28\xd6\
+\xd8\xd8\xb8\x1d\x4e\xc0\x28\xec\xfe\x5a\x7a\x0f\xf9\x5e\xc1\x44\
+\x90\xc6\x22\x7f\x82\x7e\xea\xfe\x0c\xc2\x99\xfc\x0d\x00\xe6\xc3\
+\x1d\x64\xbe\xcf\x73\x5c\x7d\x90\x09\xf7\x7c\xfe\x4c\x45\x16\xc0\
+\x3f\x97\x97\x97\x9f\x1f\x1a\x1a\xea\xf3\xdf\x1f\x80\xcb\xee\xd9\
+\x97\xe7\xf6\xa7\xb7\xe4\x77\x72\x4c\xe1\x00\x9f\x26\x28\xc8\xdb\
+\x83\x9b\xa6\x79\xaf\x10\xe2\xeb\x94\xd2\x85\xdc\x09\x86\xf8\x33\
+\x22\x06\x80\xdf\x03\xf8\x48\x08\x11\x78\xed\xb5\xd7\x82\x6f\xbd\
+\xf5\xd6\x72\x21\x84\x02\x00\x05\x05\x05\x5a\x28\x14\xb2\x9f\x79\
+\xe6\x19\x0a\xc0\x3f\x26\x52\x00\x2c\xdf\x33\x93\x98\xb2\xf8\xc9\
+\xac\x01\xb8\x71\xe4\x0f\x52\x46\x08\xb9\xa2\x8b\xcf\x18\x0b\x31\
+\xc6\x4a\xe1\x44\x84\xfd\xe7\xd0\x01\xe4\xe4\x2f\x1a\x1b\x1b\x17\
+\x94\x97\x97\xdf\x17\x8d\x46\xef\x95\x56\x5f\x0e\x80\x2b\xb1\xc7\
+\x26\x03\x4d\xd3\xc2\xb1\x58\x2c\xac\xeb\xfa\x60\x2e\x97\x2b\xcd\
+\x64\x32\x0d\xa6\x69\xce\x17\x42\x84\xae\xfd\xe9\xf1\xe0\x9c\x8f\
+\x33\x5c\x9c\x73\x8c\x8c\x8c\x5c\xea\xee\xee\x3e\x8b\xf1\xe9\x2b\
+\x1d\xee\xde\xd8\x07\x03\x40\x1f\x21\x24\x8b\x2b\xc0\x1d\xec\x13\
+\x05\x0f\x6f\x27\x2e\x33\x4a\x55\x55\x55\xa1\x5c\x2e\x17\xef\xeb\
+\xeb\x2b\xce\x66\xb3\x1b\xe0\x44\xfa\xcb\x0a\x0b\x0b\x51\x5c\x5c\
+\x0c\x4a\xa9\x37\x71\xe3\xf1\x78\xcb\xba\x75\xeb\x8e\xe7\x72\x39\
+\xfb\xe3\x8f\x3f\xb6\xda\xdb\xdb\x47\x18\x63\x51\x00\x24\x97\xcb\
+\x91\x03\x07\x0e\x28\x65\x65\x65\x8a\x6d\xdb\xbc\xa9\xa9\x29\xc7\
+\x18\x1b\x51\x14\xa5\x15\x40\xca\xb6\x6d\xa2\xeb\xba\xbc\xff\x29\
+\xcd\x10\xcd\x1a\x80\xeb\x87\x5c\xe9\xfd\x2b\x2c\x57\x14\xc5\x52\
+\x14\x05\x84\x90\xcb\x5c\x5f\x21\x04\x4c\xd3\xac\x87\x93\xf2\x99\
+\xeb\x3b\x97\x0d\x67\x92\xf8\xdd\xdd\x92\x4d\x9b\x36\xdd\xbb\x79\
+\xf3\x66\x04\x83\x8e\xad\xe0\x9c\x83\x31\x06\x55\x55\x27\x64\x8f\
+\x4d\x06\x94\xd2\xaa\xe2\xe2\x62\x04\x83\xc1\x4c\x36\x9b\x8d\xa6\
+\x52\xa9\x52\xd3\x34\xaf\x7b\xf2\x0b\x21\x60\xdb\xb6\x17\xe4\x02\
+\x00\xc3\x30\xf0\xe1\x87\x1f\xde\xf3\x9b\xdf\xfc\xe6\x2b\x00\xba\
+\x7d\x87\xcb\xe0\x98\x7f\x8b\xd1\x09\xe0\x75\x4d\xd3\x4e\x4c\xe4\
+\x0d\x09\x21\x64\x40\xd1\xef\xed\xf8\x63\x18\xb7\xcb\x10\x48\xeb\
+\xeb\xad\xee\xc9\x64\xb2\x4a\x51\x94\x4d\x00\x96\x02\xd8\xe0\xfe\
+\x2d\xbb\x61\xc3\x86\xd0\x8e\x1d\x3b\x10\x0c\x06\x3d\xe3\x5d\x5a\
+\x5a\xba\x6c\xf3\xe6\xcd\x06\x00\xeb\x83\x0f\x3e\x58\x7c\xfa\xf4\
+\x69\x9d\x31\x06\x42\x88\x60\x8c\x51\xd3\x34\xb5\xbf\xff\xfb\xbf\
+\xa7\xc9\x64\x92\xf7\xf4\xf4\xa4\x29\xa5\xe7\x0b\x0b\x0b\x2f\x08\
+\x21\x46\x1e\x78\xe0\x01\xc5\x34\x4d\x4e\x08\xf1\x73\x39\xa6\x04\
+\xb3\x06\xe0\xfa\x21\xf7\xa8\xe3\x7e\xe7\xa6\xc0\x26\x84\x6d\xdb\
+\x94\x10\xb2\x0e\xc0\x6e\x38\xae\xb7\x84\x01\xc7\x00\x78\x4b\x7b\
+\x4d\x4d\x0d\xdd\xb4\x69\x93\xfe\x8d\x6f\x7c\x03\x91\x48\x04\x80\
+\x13\x61\xb7\x6d\x1b\xba\xae\xdf\xb0\x01\x00\xa0\x51\x4a\x6b\x08\
+\x21\x42\x08\x41\x38\xe7\x37\x94\x66\x70\x8d\x19\x54\x55\x95\xfb\
+\x54\x8c\x8e\x8e\x42\x08\x31\xf7\xf0\xe1\xc3\x8f\xb7\xb7\xb7\xfb\
+\xbd\x20\x0e\xc7\x00\xf8\xbd\x9e\x73\x00\x7a\x72\xb9\xdc\x29\x55\
+\x55\x27\x7c\x68\xee\xb3\xb4\x31\x7e\xd5\xbd\x9d\x93\x1f\x18\xdb\
+\xb2\x30\xb8\x11\x78\x21\x44\x85\x6d\xdb\xdb\x01\xdc\x0f\x20\x02\
+\x60\x70\xc1\x82\x05\xdd\x4f\x3e\xf9\xe4\x9c\x67\x9e\x79\xa6\xc2\
+\xff\xfe\x00\xcc\x0f\x87\xc3\xd5\x84\x10\xf1\xe4\x93\x4f\xaa\x8f\
+\x3f\xfe\xb8\xe6\x1a\x51\x9e\x4e\xa7\xc9\x0b\x2f\xbc\xa0\xbe\xf9\
+\xe6\x9b\x68\x69\x69\x61\x84\x10\x13\xc0\x60\x61\x61\xe1\xa0\xa2\
+\x28\xd9\x3d\x7b\xf6\xb0\xe9\x4a\x0b\xcf\x1a\x80\xab\x43\x3e\xf5\
+\x71\x01\x35\x42\x88\x20\x84\x78\x2f\xc5\x0d\x6c\x15\x33\xc6\x1a\
+\xe0\x50\x3b\x35\x38\x83\xc4\x02\x40\x09\x21\xe1\x9a\x9a\x9a\x6d\
+\x95\x95\x95\x2b\x0b\x0a\x0a\xfc\x13\x2f\xa2\x69\x9a\x0c\xfc\x01\
+\x00\xe6\xcd\x9b\x87\x8d\x1b\x37\xa2\xac\xac\xcc\xc4\x78\x43\x73\
+\x3d\x9c\xf0\xfc\x63\x09\x1c\x02\x4a\xfe\xa4\x97\x83\xf9\x7a\x27\
+\xd6\xb8\xf3\x47\x22\x11\xb2\x71\xe3\xc6\x40\x4b\x4b\x4b\xf0\xc2\
+\x85\x0b\xde\x41\xf9\xf7\x06\x00\xa9\x54\x6a\x65\x47\x47\xc7\x36\
+\x42\xc8\x20\x9c\x80\xa4\x80\x33\x0e\x55\x38\xcf\x6b\x00\x40\x33\
+\xa5\x74\xc8\xff\x7c\x7d\xfb\x60\xff\x3d\xc8\xe7\x73\x2b\x0c\x83\
+\x17\x17\x11\x42\x90\xef\x7f\xff\xfb\xe4\x6f\xfe\xe6\x6f\x0a\x28\
+\xa5\xf3\x74\x5d\xaf\x9b\x3b\x77\x2e\x5f\xb4\x68\x51\x72\xcb\x96\
+\x2d\xd6\xe7\x3e\xf7\x39\xa3\xac\xac\x2c\x83\xb1\x71\x23\x9f\xbf\
+\x06\x00\x05\x05\x1e\xf3\x57\x00\x40\x34\x1a\xc5\xd2\xa5\x4b\xb1\
+\x68\xd1\x22\x61\x18\x06\xe9\xe8\xe8\xd0\x18\x63\xd1\xbe\xbe\xbe\
+\x00\x9c\xec\x8a\x20\x84\x48\xc3\x38\x1b\x04\xbc\x85\xb8\x8c\x96\
+\xbb\x7b\xf7\x6e\xfc\xfa\xd7\xbf\x66\xd2\xdd\x07\x9c\x15\xcb\x34\
+\xcd\x65\x70\x02\x77\xb5\x18\x8b\x12\x1b\x70\x5e\xba\xbe\x78\xf1\
+\xe2\xba\x67\x9e\x79\x46\x99\x37\x6f\x9e\x77\x72\xcb\xb2\xe0\x8f\
+\x9a\x03\xce\xe0\x68\x68\x68\x00\x9c\x77\x93\x3f\x89\x6f\x74\xa0\
+\x5f\x69\xc0\xc8\x6d\xcc\x4d\x19\x00\x00\x64\xe9\xd2\xa5\xf8\xe6\
+\x37\xbf\x89\x54\x2a\x35\xee\xc0\xfc\x7b\xbc\x70\xe1\x82\xf2\xf2\
+\xcb\x2f\x6f\xbd\x78\xf1\x62\x25\x1c\xef\x80\x61\xcc\x0b\x62\x70\
+\x98\x70\x2f\xaa\xaa\xfa\xb1\x3f\x06\xc2\x18\xc3\xd3\x4f\x3f\xad\
+\xbc\xf8\xe2\x8b\xfe\x07\x76\x2b\xe9\xc7\x02\x00\x11\x42\x10\x00\
+\xca\x81\x03\x07\x14\x21\x84\x2a\x84\x50\xc2\xe1\x30\xd6\xac\x59\
+\x43\xbf\xf0\x85\x2f\xcc\x59\xbb\x76\x6d\xb4\xa6\xa6\x26\xe4\xde\
+\xd3\xb5\x18\x97\x1e\xc3\xef\x9e\x7b\xee\x61\xdf\xfd\xee\x77\xf9\
+\xd1\xa3\x47\x95\x97\x5f\x7e\x39\x76\xe8\xd0\xa1\x05\x00\xe6\x01\
+\x88\x4a\x6e\x81\x6b\x04\x67\x0d\xc0\x2d\x84\x4c\xf5\x78\xcb\x98\
+\xcb\xc6\x8a\xda\xb6\x2d\x23\xd6\x00\x10\xd1\x75\x7d\xa3\xaa\xaa\
+\x8f\x50\x4a\xab\x75\x5d\x87\x6d\xdb\xb0\x6d\x1b\x84\x10\x44\x22\
+\x11\xdc\x7b\xef\xbd\x78\xf4\xd1\x47\x45\x75\x75\xf5\x64\xd2\x5b\
+\x94\x73\x4e\xf3\x22\xbf\x37\x0b\x27\xb2\xe6\x6e\x01\xdc\xdf\x4d\
+\x09\xc5\x94\x10\x82\xe2\xe2\x62\xb1\x69\xd3\xa6\x6b\xee\x4f\xdb\
+\xdb\xdb\x69\x6b\x6b\xeb\xfc\xa3\x47\x8f\xce\x77\xb7\x0e\x50\x55\
+\x15\xaa\xaa\xc2\x34\x4d\x70\xce\xab\x6d\xdb\x6e\x33\x4d\xb3\x19\
+\x8e\x87\x00\xf7\x1a\xc5\x8b\x2f\xbe\x38\x82\xdb\x4c\x20\xa2\x94\
+\x0a\x5d\xd7\x6d\xdb\xb6\x6d\xc6\xd8\x08\x80\x91\x60\x30\xc8\x2b\
+\x2b\x2b\xc9\xa6\x4d\x9b\xe2\xb5\xb5\xb5\x61\x00\x84\x73\xae\x66\
+\xb3\x59\x68\x9a\x26\xb7\x4a\x82\x10\x22\x00\x78\x93\x98\x31\x06\
+\xcb\xb2\x48\x28\x14\x42\x45\x45\x05\xaf\xa8\xa8\xe0\x2b\x57\xae\
+\xd4\x92\xc9\x64\xb8\xad\xad\x2d\x9c\x4e\xa7\xeb\x08\x21\x73\xdf\
+\x78\xe3\x8d\xe3\x0f\x3c\xf0\x00\xa7\x94\x4e\x79\x6a\x74\xd6\x00\
+\x8c\xc1\x9f\xc7\x07\x00\x10\x42\xac\xfc\xda\x6d\xdb\xb6\x21\x84\
+\x58\x01\x27\xe2\x2b\x9f\x9f\xbe\x68\xd1\xa2\xad\xcb\x96\x2d\xab\
+\x2e\x2d\x2d\x85\xaa\xaa\x60\x8c\xc1\x34\x4d\x28\x8a\x82\x50\x28\
+\x84\xed\xdb\xb7\xa3\xba\xba\x3a\x9f\xc1\x35\x51\x95\x17\x71\xbf\
+\x47\xf1\x1b\x00\x19\x20\xbb\x51\xb8\x6e\xa4\x90\x06\xc0\xfd\xf1\
+\x5f\xc3\xf5\x9c\x0b\xf9\xd7\xa6\xeb\x7a\x7e\xea\xcb\xfb\xb3\xff\
+\x77\xd5\xd5\xd5\xda\xf6\xed\xdb\x09\xe7\x1c\xd9\x6c\x16\x8c\x31\
+\xe8\xba\x0e\x45\x51\x60\xdb\x36\x06\x06\x06\xea\x4f\x9e\x3c\xb9\
+\xed\xf8\xf1\xe3\x14\x63\x86\xd7\x06\x70\x8c\x10\xf2\xb1\xaa\x8e\
+\x0d\x59\x97\x4f\x00\x21\x44\x3e\x8f\x61\xba\x78\x04\x04\x80\x3f\
+\x9d\x3b\x04\xc0\x30\x0c\x43\xd8\xb6\x4d\x5c\xd7\x5e\x05\x20\x6c\
+\xdb\x86\x69\x3a\x09\x10\x21\x04\x14\x45\xf1\xae\x49\x08\x41\x19\
+\x63\x8a\xbc\x7e\xc6\x98\x37\xc6\xe6\xce\x9d\x8b\x07\x1e\x78\x00\
+\xd9\x6c\x16\xdd\xdd\xdd\xe5\x9d\x9d\x9d\x4b\x9e\x78\xe2\x89\xd6\
+\x35\x6b\xd6\xf4\xde\x7f\xff\xfd\xc3\xdf\xff\xfe\xf7\x59\x5f\x5f\
+\x9f\xf8\xe2\x17\xbf\xe8\x5d\x0f\x6e\xc2\x03\x9a\x35\x00\xe3\x31\
+\x6e\x45\xe4\x9c\x13\x4d\xd3\x84\xdf\x00\xac\x5b\xb7\xae\xe0\xe0\
+\xc1\x83\x5b\x01\x7c\x19\x63\x79\x7a\x2c\x5b\xb6\xac\xe0\x1b\xdf\
+\xf8\x06\x16\x2c\x58\xe0\xa5\x7f\x0c\xc3\x80\xaa\xaa\xd0\x34\x0d\
+\xc5\xc5\xc5\x70\xcf\xad\xe3\xda\x20\xf9\x5b\x83\x29\x80\xcc\x31\
+\xfb\x3d\x80\xa9\x44\xbe\xb4\xd5\x95\x40\x36\x6c\xd8\x80\xfa\xfa\
+\x7a\x58\x96\x05\xdb\xb6\x11\x0c\x06\x21\xf7\xb8\x2d\x2d\x2d\xfa\
+\xcf\x7e\xf6\xb3\x8d\xc7\x8f\x1f\x5f\x8a\xb1\x01\x9e\x01\xf0\xc2\
+\xba\x75\xeb\x4e\x1d\x3b\x76\xcc\xdb\x63\xb8\xb1\x17\x42\x08\xf1\
+\x7f\xef\xb4\x13\x88\x7c\xf1\x08\x19\xbb\x50\x4c\xd3\x44\x32\x99\
+\x44\x61\x61\xa1\x0d\xe7\xfd\xd1\x40\x20\xe0\x19\x37\x00\x8a\xbc\
+\x4e\x21\x04\x91\x2e\xbd\xef\xef\xde\xe2\xb3\x66\xcd\x1a\x54\x57\
+\x57\xe3\xe4\xc9\x93\x05\xaf\xbc\xf2\xca\x3d\x1f\x7e\xf8\xe1\xe0\
+\xa1\x43\x87\x3e\xcd\x64\x32\xd9\x07\x1e\x78\x20\xe3\xbb\x94\x9b\
+\xae\x0b\xf8\xac\x1b\x80\x71\x51\x66\x37\xcd\x32\xf6\x47\x42\x74\
+\x00\x73\x6d\xdb\xf6\x26\xed\xc1\x83\x07\xeb\x16\x2c\x58\xb0\x51\
+\x51\x94\x7b\xe5\xef\xc2\xe1\x30\x56\xaf\x5e\x8d\xad\x5b\xb7\xb2\
+\x68\x34\x3a\xd1\x0a\x0f\x38\x6e\xbd\x62\x59\x96\xdf\xc3\x00\x80\
+\xcb\x56\x53\xc9\x25\x9f\x26\x90\xe9\x88\x28\xcb\x5a\x80\xfc\x7b\
+\x01\xc6\xdf\x9f\xa6\x69\xa2\xb0\xb0\x90\x15\x16\x16\xca\xa8\xfe\
+\x38\x0f\xa1\xa2\xa2\x42\x3b\x79\xf2\x64\xc5\xd9\xb3\x67\x2b\x32\
+\x99\xb1\xb1\xce\x18\x3b\x7f\xf0\xe0\xc1\xe3\x00\x5a\x7d\x5f\x6b\
+\x12\x42\x3a\x09\x21\xb9\xfc\xef\xc1\xd4\xd5\xd0\x13\x00\x62\xdb\
+\xb6\x6d\xa2\xaf\xaf\x8f\x03\xd0\x2b\x2b\x2b\x13\x07\x0e\x1c\x28\
+\x28\x28\x28\x58\x16\x08\x04\x12\xd1\x68\x54\x54\x55\x55\x09\xd3\
+\x34\xe5\xb6\x90\xca\xf7\x98\x47\xfe\x22\xfe\xe7\xe2\x7f\x0f\xd9\
+\x6c\x96\xda\xb6\x2d\xa2\xd1\x28\x4a\x4a\x4a\x78\x49\x49\x09\x82\
+\xc1\x60\xf4\xad\xb7\xde\x5a\xc2\x39\x37\x32\x99\x4c\x12\x40\x7b\
+\x28\x14\x1a\xf5\x65\x9c\x64\xdc\xe4\x86\xf1\x59\x35\x00\x32\xb8\
+\xe7\x31\xf7\x28\xa5\xa6\x3f\xb7\x0d\x00\xb9\x5c\x2e\x01\xe0\x21\
+\x00\x2b\x7c\x9f\x8d\xaf\x5b\xb7\x6e\xe5\xba\x75\xeb\xa0\xeb\x8e\
+\x5d\x50\x55\x15\xf7\xde\x7b\x2f\xa2\xd1\xa8\xdc\x46\xf8\xbf\xc7\
+\x63\x05\xe6\x6f\x27\x26\xe2\x0c\x5c\x49\x29\x66\xa6\x43\x32\x1d\
+\xf3\xb7\x29\xf9\xdb\x05\xf7\xfe\x49\xde\x8f\x77\x40\x2c\x16\xa3\
+\x5b\xb7\x6e\x45\x2c\x16\x83\x6d\x3b\xb6\xd4\x34\x4d\x1c\x3a\x74\
+\x68\x65\x4b\x4b\xcb\x57\xe0\x88\x69\x48\x9c\x00\xf0\x1b\x5d\xd7\
+\x7b\x5d\x03\xe4\xff\x2e\xe9\x42\xd9\xb8\x71\xaf\x40\xf2\x3d\xac\
+\xf7\xdf\x7f\x9f\xc3\xd9\xc7\x17\x9f\x3f\x7f\xfe\x7e\xc3\x30\x36\
+\xae\x58\xb1\x62\xe1\xd6\xad\x5b\x6b\xe7\xcd\x9b\x27\x96\x2c\x59\
+\xc2\x8b\x8a\x8a\x14\xcb\xb2\x14\x4a\x29\x51\x14\xe5\xba\x78\x1b\
+\xd2\x2a\xbb\x71\x02\x06\x80\x06\x83\xc1\xb0\x69\x9a\xf3\xdc\x6b\
+\x68\x02\x70\x30\xef\x7c\x37\x5d\x17\xf0\x59\x35\x00\xc0\x18\xb1\
+\x84\x00\x10\xcf\x3e\xfb\xac\xf2\xd2\x4b\x2f\x31\x7f\x3e\x3f\x18\
+\x0c\x2e\x36\x4d\xf3\x61\xce\xf9\x43\xf2\x77\x35\x35\x35\xd6\xfa\
+\xf5\xeb\x83\x5f\xfd\xea\x57\xbd\x3c\xbd\x64\xc6\xb9\xe7\xba\xaa\
+\xef\x3e\x0d\xae\xfd\x8c\xc0\xd5\x74\xee\xf2\x70\x59\x66\x25\x1f\
+\xcb\x97\x2f\xc7\xb2\x65\xcb\xbc\xf3\x8d\x8e\x8e\x82\x10\x52\xf9\
+\xd1\x47\x1f\x3d\x71\xf1\xe2\x45\xef\x01\x52\x4a\xdf\x0a\x87\xc3\
+\x67\xb3\xd9\x6c\x6f\x1e\x5d\x96\x62\x2c\xd6\x72\x33\x1e\x80\xbc\
+\x56\x4b\xd7\x75\xee\x5e\x4f\x41\x36\x9b\xdd\x08\xe0\xeb\x91\x48\
+\xa4\x60\xf3\xe6\xcd\xda\xae\x5d\xbb\x44\x30\x18\x64\xae\x87\xa7\
+\x02\xb8\x6e\x2f\xce\xcd\x2a\xf9\x6b\x21\x68\x73\x73\xb3\x3e\x30\
+\x30\x50\x08\x67\x9e\x56\x00\x08\xb8\x31\x0f\xff\xf5\xdd\x14\x3e\
+\x4b\x06\xc0\x9f\x3e\x71\x12\xaa\x6e\x7e\x15\x00\x5e\x7c\xf1\xc5\
+\x39\x00\x16\xc3\x47\x5a\x89\xc7\xe3\x1b\xd7\xae\x5d\x7b\x6f\x44\
+\xce\x74\x00\xd5\xd5\xd5\x58\xb5\x6a\x55\x7e\x9e\x9e\x00\x50\x18\
+\x63\x97\xb9\xf8\xf2\x65\x5d\xef\x8a\x70\xb7\x42\x32\x09\x5d\x72\
+\xcc\x65\x1e\x82\xa6\x69\x22\x1a\x8d\x8e\x4b\xef\x45\x22\x11\xba\
+\x6a\xd5\xaa\xe0\x43\x0f\x3d\x14\x6c\x6f\x6f\xf7\x8e\x1d\x19\x19\
+\xb9\xf7\xd4\xa9\x53\xdb\x19\x63\x32\xed\xa6\x15\x16\x16\x66\xe6\
+\xcd\x9b\x77\xfc\xf8\xf1\xe3\x9d\xd2\x98\xbb\x25\xb4\xc0\x8d\xa5\
+\x0c\x3d\xb7\xdd\x30\x0c\x42\x08\x09\x12\x42\xca\x09\x21\x65\x91\
+\x48\x04\x55\x55\x55\x08\x06\x83\x0c\x8e\x17\x89\x3c\x43\x74\xcd\
+\x67\x91\x4f\xf1\x4e\xa5\x52\xe8\xe8\xe8\x10\xe7\xcf\x9f\xc7\xc1\
+\x83\x07\xd1\xd5\xd5\x45\x08\x21\x21\x4a\x69\xd0\x1f\x38\x9c\x2a\
+\x7c\x96\x0c\x80\xac\xc7\x97\x2e\x16\x23\x84\x40\x46\x95\x4d\xd3\
+\x5c\x0c\xe0\x6b\x00\x6a\xdc\x63\x30\x67\xce\x9c\xa2\x87\x1f\x7e\
+\xb8\x7c\xed\xda\xb5\xde\x49\x82\xc1\x20\x16\x2d\x5a\x04\x8c\xcf\
+\xd3\x13\x00\x44\x51\x94\x71\xb3\xdb\x3f\xb8\xef\x54\xd7\x7e\xaa\
+\xe1\xdf\x1b\xcb\xff\xf7\x4f\x18\xf7\x19\xfa\x69\xd6\x00\x40\x16\
+\x2f\x5e\x8c\xaf\x7d\xed\x6b\x30\x0c\xc3\x7b\x8e\x87\x0e\x1d\x2a\
+\x1f\x18\x18\x78\x6c\x78\x78\x78\x33\x80\x10\xa5\x34\xa8\xaa\xea\
+\x05\xdb\xb6\x7f\xac\x69\x5a\xa7\x6f\x5b\x20\x73\xf2\x59\x5c\xbf\
+\x01\x10\x00\x90\xcb\xe5\x28\x00\xaa\x69\x1a\x95\x24\x30\x42\x88\
+\x17\xe9\x87\xcf\x50\x4c\xf6\x3d\x4b\x63\x28\xb7\x92\x9c\x73\xf4\
+\xf5\xf5\xe1\xdd\x77\xdf\x25\xbf\xfb\xdd\xef\xd0\xd1\xd1\x21\x2e\
+\x5e\xbc\x28\x08\x21\xa6\xa6\x69\xb6\xa2\x28\xdc\xcd\x42\x5d\xe7\
+\x2d\x5c\x19\x9f\x25\x03\xe0\xd5\xe3\xd7\xd6\xd6\x06\xdb\xda\xda\
+\x54\xce\x39\x31\x4d\x93\x02\x88\x16\x16\x16\x6e\x20\x84\x7c\x2e\
+\x97\xcb\x55\xcb\x0f\x2c\x5e\xbc\x98\xdf\x7f\xff\xfd\xd8\xba\x75\
+\xab\x3f\xd0\x42\x18\x63\x24\x3f\x4f\x2f\x83\x3d\x77\x9a\x90\xc7\
+\xed\xc0\xb5\xb6\x0a\xf9\x54\x65\x42\x08\x4a\x4b\x4b\x45\x79\x79\
+\xf9\xb8\x88\x77\x28\x14\x0a\x1c\x3e\x7c\x78\xcd\xc5\x8b\x17\xa9\
+\x65\x59\xb0\x2c\x0b\x83\x83\x83\x45\x03\x03\x03\xf7\x72\xce\x8f\
+\xc3\xa9\xa6\xcb\xc1\xc9\x22\x68\xf0\x6d\xf9\xae\xf7\x9a\xdd\x2d\
+\x00\xb7\x2c\x6b\x14\x4e\xfa\x2f\x95\x4a\xa5\xa2\x03\x03\x03\x37\
+\x6c\xd5\x7d\x2a\x4a\xd0\x34\x0d\x9a\xa6\x41\x08\x81\xd3\xa7\x4f\
+\xe3\xcd\x37\xdf\x04\xe7\x5c\x2e\x2c\xd4\xc7\x93\xb8\xd1\xaf\x9b\
+\x10\x77\xbb\x01\x90\xab\x3e\x97\xf5\xf8\x94\x52\x7c\xeb\x5b\xdf\
+\x0a\x3f\xf7\xdc\x73\xf3\x5a\x5a\x5a\xaa\xe1\x94\xc6\x26\x6a\x6a\
+\x6a\x1e\x58\xb9\x72\x65\x75\x22\x91\x00\xe0\xbc\x9c\x15\x2b\x56\
+\x50\x77\xb5\xcf\xf9\xcf\xa9\x28\x8a\x62\x59\x16\x91\x2f\x43\x5a\
+\xfc\x89\xea\xfd\x67\x71\x7d\x90\x93\xc2\x1f\xd0\x73\x95\x75\x3c\
+\xcf\x0d\x6e\xf6\x60\xf1\xe2\xc5\xc1\xc7\x1f\x7f\x1c\xa5\xa5\xa5\
+\x38\x72\xe4\x48\xee\xd0\xa1\x43\x1d\x8c\xb1\x21\x00\xab\xdc\xd3\
+\x35\x03\xd8\xa3\x69\xda\x10\xe7\xdc\x72\xf7\xcf\x41\x5c\x2e\x90\
+\x72\x35\x83\x90\x9f\xb5\x49\x02\x18\x05\x60\x0d\x0d\x0d\x31\xc3\
+\x30\x14\x3f\xdb\xf1\x7a\x56\x67\xbf\x01\x90\x48\x24\x12\x10\x42\
+\x8c\xab\x2d\x71\xb7\x00\x51\x5c\x1e\x37\x99\x8d\x01\x5c\x03\xd2\
+\x00\xd8\xc0\x58\xa4\x7a\xdf\xbe\x7d\xb5\xe9\x74\x7a\x2b\x80\x75\
+\x70\x8a\x73\x0a\x1b\x1a\x1a\x8a\xbf\xf2\x95\xaf\x60\xc1\x82\x05\
+\x00\xe0\xe5\x68\x5d\x83\x90\x9f\xbb\x27\x7e\x42\x8a\x3c\xf7\x2c\
+\x6e\x1e\xf9\x5b\x04\x1f\x64\xc6\x46\xd2\xac\x69\x51\x51\x11\x1e\
+\x7d\xf4\x51\xac\x5e\xbd\x1a\xfb\xf6\xed\x3b\x76\xf1\xe2\xc5\x23\
+\x3d\x3d\x3d\x21\x38\x59\x9b\x0d\x00\x0e\x85\x42\xa1\x2e\xc6\xd8\
+\x01\x97\x67\x40\x08\x21\x2a\x2e\x57\x48\xbe\x1e\x8f\x40\x85\x4b\
+\xef\x56\x1d\x10\x4d\xd3\x6e\x28\x15\x37\xd1\x76\x41\x08\x81\x50\
+\x28\x34\x6e\x6b\xe4\x1a\x8a\x69\xa1\x3b\xdf\x8d\x06\xc0\x1f\xec\
+\xb3\x09\x21\x36\x00\x70\xce\x43\x9c\xf3\x52\xcb\xb2\x2a\xde\x79\
+\xe7\x9d\x75\x00\xb6\x28\x8a\xb2\xa6\xb4\xb4\xb4\xae\xbc\xbc\x1c\
+\xeb\xd7\xaf\xc7\x96\x2d\x5b\x78\x2c\x16\x33\x30\xbe\xe4\x97\xba\
+\xfb\x3f\x00\xce\x6a\x74\x85\x01\x7a\xdb\x31\xd9\xd5\xe7\x4e\x30\
+\x56\xf9\xd7\xe8\x7a\x05\xc4\xa7\x3d\x48\xc2\xe1\x30\x2f\x2f\x2f\
+\xe7\xe5\xe5\xe5\xd9\x86\x86\x86\x81\x4c\x26\x33\xf8\xda\x6b\xaf\
+\x95\x0e\x0c\x0c\x54\x30\xc6\xca\x19\x63\x81\xee\xee\xee\x4f\xb2\
+\xd9\x6c\x3f\x80\x21\x42\xc8\x20\xa5\x34\x3d\x41\xa0\xee\x8a\x9c\
+\x81\xfa\xfa\x7a\xde\xdc\xdc\x4c\xfe\xfd\xbf\xff\xf7\xc1\xf3\xe7\
+\xcf\x87\x0f\x1c\x38\xb0\x30\x14\x0a\xcd\x51\x14\x45\x59\xb6\x6c\
+\x19\x29\x2a\x2a\x1a\x77\x8e\xc9\x78\x81\xfe\xd4\xaf\x2b\x1a\x8a\
+\x54\x2a\x25\x92\xc9\x24\x9a\x9a\x9a\x30\x3c\x3c\x4c\xe3\xf1\x38\
+\x32\x99\xcc\xa8\x6d\xdb\xc3\x42\x88\x7e\x00\xad\xae\x86\x82\xff\
+\x5a\x6f\x7a\x3f\x70\x37\x19\x00\x39\x69\xa5\x85\x66\x94\xd2\xac\
+\x2c\xda\xf1\xd5\xe3\xd7\x03\xa8\x06\xb0\xa0\xa8\xa8\xa8\xfc\xd1\
+\x47\x1f\xc5\x86\x0d\x1b\xb0\x7a\xf5\x6a\xc4\x62\x31\x7f\x9d\xbf\
+\xf7\x93\x9f\xbb\x9f\x89\x60\x8c\x09\xce\xb9\xb8\x56\xc1\xc8\x2d\
+\x20\x1a\x4d\x1b\xa4\x07\x07\x5f\xda\xdc\xfd\x51\xc3\xe1\x70\xed\
+\xee\xdd\xbb\xd5\xd5\xab\x57\xc7\x5a\x5b\x5b\x0b\x4c\xd3\xc4\x89\
+\x13\x27\xe6\xbe\xf9\xe6\x9b\x8f\x8d\x8e\x8e\x56\x00\xd8\xf3\xf0\
+\xc3\x0f\xbf\xb5\x77\xef\xde\x9c\x65\x59\xfe\xe0\x1d\x30\xa6\xc9\
+\x20\x2b\x23\x29\xe0\x78\xe2\x70\x16\x11\xe5\x1f\xff\xf1\x1f\x2b\
+\x2d\xcb\x5a\x3a\x7f\xfe\xfc\x75\xdb\xb7\x6f\x5f\x5c\x5f\x5f\xaf\
+\xd5\xd5\xd5\xa1\xa6\xa6\x46\x5e\x07\x95\x0c\xbf\xab\x8d\x11\x59\
+\xd8\xe4\x2f\x74\xca\x64\x32\x38\x76\xec\x18\xdf\xb7\x6f\x9f\x38\
+\x77\xee\x9c\x7a\xf2\xe4\x49\xc5\x34\x4d\xaa\x28\xca\x45\x21\xc4\
+\x7b\x8c\xb1\xe3\x00\xce\xe4\x72\xb9\x61\x8c\xa9\x11\xc9\x4a\xce\
+\x59\x1e\x80\x0f\xf2\x25\x2a\x00\x98\x4f\x5c\x82\x06\x83\xc1\x75\
+\xb9\x5c\x6e\x37\x9c\x54\x9f\x02\x40\x59\xb6\x6c\x99\xf5\xf8\xe3\
+\x8f\xe3\x73\x9f\xfb\x9c\xb7\x87\x63\x8c\x05\xf2\xad\xf8\x9d\x90\
+\xbb\x77\x27\xf4\xa4\xac\xd3\x4c\xf4\x5e\xae\x05\x1f\xcf\x80\x08\
+\x21\xfc\x6c\x46\x05\x40\xd0\xb2\xac\x86\x39\x73\xe6\x2c\xa8\xac\
+\xac\x24\xdb\xb6\x6d\x13\xa6\x69\xe2\xad\xb7\xde\xa2\x8d\x8d\x8d\
+\x5b\x2e\x5d\xba\xb4\x1c\x80\xf6\xce\x3b\xef\xb4\xaa\xaa\x7a\x2a\
+\xef\xd4\x04\xe3\x4b\xa2\xe5\x42\xc2\x55\x55\xe5\xae\x7b\x1f\x48\
+\xa5\x52\x35\x00\xee\x57\x14\xe5\xbe\x65\xcb\x96\x35\x7c\xe1\x0b\
+\x5f\x50\x63\xb1\x18\x34\x4d\x93\x9e\x09\xf5\x15\xfe\x5c\x15\xae\
+\x10\x08\x28\xa5\xd0\x75\x1d\x96\x65\xe1\xdc\xb9\x73\xfc\xa5\x97\
+\x5e\xe2\x8d\x8d\x8d\xaa\x6d\xdb\x8a\x6d\xdb\x08\x85\x42\x1d\xaa\
+\xaa\xbe\x65\x59\xd6\xbf\x8e\x8c\x8c\xd8\xee\x75\xca\x60\xe6\xa4\
+\x44\x66\xaf\x85\x3b\xdd\x00\x4c\x94\xdb\x67\x8a\xa2\x64\x00\xc0\
+\xb6\x6d\x4d\x08\xb1\x98\x10\xb2\xa0\xbe\xbe\x7e\x5b\x65\x65\xe5\
+\xca\x60\x30\xe8\x15\xd9\xdc\x77\xdf\x7d\x6c\xe3\xc6\x8d\x46\x38\
+\x1c\x06\x00\x85\x73\xae\x8e\x8e\x8e\x12\x4a\xa9\x27\x78\x31\x53\
+\xdc\x7d\x7f\x4d\xfc\x44\xc5\x38\x92\x7d\x36\x59\xe4\x11\x4a\x26\
+\x2c\x36\x92\x7b\xd4\x99\xe6\xf5\xf8\xcb\xb0\x5d\xb6\x20\xd1\x75\
+\x5d\x95\x22\x9b\x00\x2c\x4d\xd3\x32\xab\x57\xaf\x0e\xef\xd8\xb1\
+\x43\x57\x55\xb5\xb4\xab\xab\x6b\xfd\xe9\xd3\xa7\xcf\x5b\x96\x55\
+\x0d\x20\xa0\xeb\xba\x5a\x5c\x5c\xdc\xfd\x07\x7f\xf0\x07\x9f\xfe\
+\xed\xdf\xfe\x6d\xd6\xb7\x2d\xd0\xe1\x18\x15\x13\x00\xb2\xd9\x2c\
+\x21\x8e\xd4\x79\x39\x80\x15\x42\x88\x25\xd1\x68\xb4\xa0\xb4\xb4\
+\x14\x70\xb3\x0a\xa6\x69\x12\xcb\xb2\x3c\x23\x75\xad\x67\xe6\x7f\
+\x8f\x84\x10\xc4\x62\x31\x58\x96\x85\x0b\x17\x2e\x20\x9b\xcd\x02\
+\x6e\x7c\x42\x55\xd5\xb4\xae\xeb\x17\xb3\xd9\xac\x9f\xff\x3f\x5b\
+\x0e\xec\x03\xc1\x98\xd6\xbe\x05\x87\xcf\xef\xe5\x55\x6d\xdb\xae\
+\x00\xf0\x24\x80\x07\xea\xeb\xeb\x17\x3c\xfb\xec\xb3\x4a\x4d\x4d\
+\x8d\x37\xd0\x8b\x8b\x8b\xb5\xa2\xa2\x22\x2f\x18\x44\x29\x25\xa1\
+\x90\xa3\x92\x75\x1d\xcc\xb6\x5b\x02\x39\xd8\x27\x32\x00\x72\x25\
+\xb9\x1e\xd8\xb6\x8d\xbc\x48\xf3\x65\x06\x40\x1a\xc2\x99\x66\x00\
+\x24\xfc\x3c\x8e\x3c\xa8\x00\x48\x45\x45\x05\x9e\x7a\xea\x29\xac\
+\x58\xb1\x02\xbf\xfd\xed\x6f\xeb\x1b\x1b\x1b\x77\x33\xc6\xb2\x00\
+\x22\x84\x10\x9d\x52\xfa\xfe\xb9\x73\xe7\xba\x34\x4d\x6b\x95\xa5\
+\xb9\x84\x90\x00\x9c\xf1\x64\xba\x25\xdf\x2a\x1c\xa3\x50\x08\xa7\
+\x2e\xa4\xc0\x30\x3c\xe5\x73\x1b\x80\x6a\x59\x16\xb1\x6d\x9b\xc8\
+\xf8\xd0\x8d\x6c\xb1\x42\xa1\x10\x09\x87\xc3\x18\x1e\x1e\x1e\x97\
+\xed\xe0\x9c\xe7\xbf\xd8\x59\x49\x30\x1f\xa4\xe4\x14\xe0\xb8\x46\
+\xe1\xea\xea\x6a\xfb\x5b\xdf\xfa\x16\xfd\xc1\x0f\x7e\x40\x00\xac\
+\x09\x85\x42\x0f\xc5\x62\xb1\xad\x2b\x57\xae\xc4\xe7\x3e\xf7\x39\
+\x51\x5d\x5d\x9d\x85\xab\xe1\xce\x39\x27\x42\x08\xe2\x77\xc9\x66\
+\xaa\xbb\x3f\x89\x41\xc5\x2c\xcb\xe2\x2e\x53\x8c\x72\xce\x95\x89\
+\x8a\x71\xa4\xb1\xb8\x5e\x83\x31\x13\x91\xb7\xd2\x0a\xc9\x92\x33\
+\x4d\x93\xa8\xaa\xaa\xea\xba\x2e\x56\xac\x58\x21\x56\xac\x58\x81\
+\xa1\xa1\xa1\xc2\x43\x87\x0e\x6d\x3e\x73\xe6\x0c\x4c\xd3\x44\x2e\
+\x97\x43\x6f\x6f\xef\xd0\x1b\x6f\xbc\xb1\x12\x4e\x2b\x2e\x8b\x38\
+\x52\x5c\x52\xa6\x0d\xaa\xaa\x0a\x4d\xd3\x2c\x8c\xe9\x12\xe8\x9c\
+\x73\xe4\x72\x39\x91\xc9\x64\x48\x38\x1c\xe6\x00\x44\x24\x12\x01\
+\x63\x6c\xd2\x93\x5e\x5e\xb7\x6b\x74\x44\x3a\x9d\xc6\xc8\xc8\x08\
+\x2f\x28\x28\x40\x4f\x4f\x0f\xe1\x9c\xab\x42\x08\xd5\xb6\xed\x02\
+\xdb\xb6\x8b\x31\xb6\xef\x9f\xd5\x03\xc0\x78\xbe\xbd\x17\xc9\xd9\
+\xbd\x7b\x77\xf8\xf0\xe1\xc3\xcb\x2f\x5c\xb8\x50\xf9\x83\x1f\xfc\
+\x20\x01\x40\x2f\x2c\x2c\x5c\xb5\x65\xcb\x96\xa5\x8b\x17\x2f\xf6\
+\xd7\xe3\x7b\xf5\xe2\x94\x52\x05\x00\x72\xb9\x9c\xe4\x62\xdf\xf6\
+\xd5\x4e\xba\x87\x92\x2a\x0b\x4c\xb8\xd2\xf9\xf7\xab\x00\xc0\x4c\
+\xd3\xec\x39\x79\xf2\x64\x6f\x77\x77\xb7\x18\x1e\x1e\x2e\x49\xa5\
+\x52\xa5\x9a\xa6\x29\x00\x60\x9a\xa6\x27\x44\x51\x5a\x5a\x8a\xcd\
+\x9b\x37\xa3\xb2\xb2\x52\x7e\x3e\x9f\x75\x77\x19\xfc\xb2\x5e\xd2\
+\x50\xce\x24\xef\xc8\x85\x90\xf9\x73\xce\xb9\xe2\x3e\x3f\x19\x13\
+\x22\x6b\xd7\xae\xd5\x77\xef\xde\x8d\x63\xc7\x8e\xe1\xd0\xa1\x43\
+\x9d\xad\xad\xad\xfd\x96\x73\x63\x3b\xe0\x08\xb5\x9e\x24\x84\x7c\
+\xa0\x28\x8a\xf5\x8b\x5f\xfc\x82\x7f\xf1\x8b\x5f\x54\x85\x10\xf2\
+\x25\x18\x9a\xa6\x8d\x00\x0e\x13\x34\x91\x48\xc0\xdd\x36\x7a\x1c\
+\x82\xfc\xc9\xef\x67\xec\xf9\xc7\x94\x34\xe4\x84\x10\x74\x76\x76\
+\xb2\xe3\xc7\x8f\xb3\xe6\xe6\x66\x7e\xf0\xe0\x41\x36\x3a\x3a\x4a\
+\xa5\x98\x8c\x1b\xa8\x2c\xa2\x94\x86\x30\x96\xca\x9e\x52\xf7\x1f\
+\xb8\x73\x0d\xc0\x65\xba\xec\x67\xcf\x9e\xad\xc9\x66\xb3\xdb\x28\
+\xa5\x1b\x38\xe7\x35\x00\xc2\xb5\xb5\xb5\x05\x8f\x3d\xf6\x58\xe1\
+\xae\x5d\xbb\xfc\xf5\xf8\x52\x09\xd7\x1b\xc1\x72\x35\xbc\xdd\x93\
+\x5f\x22\x4f\x03\x6f\xa2\xc9\x26\xf3\xd7\x12\xbc\xa5\xa5\xa5\xff\
+\x9f\xfe\xe9\x9f\x9a\x0f\x1f\x3e\x2c\x32\x99\x8c\x30\x0c\xa3\x28\
+\x1c\x0e\x13\x00\xc8\x64\x32\xd2\xf0\xd1\xfa\xfa\x7a\x84\xc3\x61\
+\x69\x00\xe8\x04\xe7\xba\x0c\xfe\xad\xc2\x0c\x9c\xf8\x12\x54\x51\
+\x14\x41\x29\xf5\x73\x34\xbc\xc2\xa3\xfa\xfa\x7a\x7c\xf5\xab\x5f\
+\xc5\xe6\xcd\x9b\x93\x0b\x16\x2c\xf8\xe0\xaf\xff\xfa\xaf\x9b\xe1\
+\x64\x83\xb6\x03\x78\x10\xc0\xab\x0b\x17\x2e\x3c\x7d\xe1\xc2\x85\
+\xfe\x2f\x7f\xf9\xcb\x0c\x80\xca\x18\xa3\xa1\x50\x88\x03\x00\x75\
+\x6e\x5c\xb8\x6e\x3e\xf1\x9d\x7f\xc2\x67\xe7\x27\xf9\xf8\xb7\x57\
+\x32\xb6\x44\x08\xc1\xc5\x8b\x17\xf9\x2b\xaf\xbc\x62\xbe\xff\xfe\
+\xfb\x2c\x99\x4c\x8a\xe1\xe1\xe1\x71\x6e\x19\x63\xcc\xb2\x6d\xdb\
+\x82\xb3\xd0\x7d\xe6\x79\x00\xf2\x61\x73\xb8\xbd\xd3\xbf\xf7\xbd\
+\xef\xd1\x1f\xfe\xf0\x87\x65\xc3\xc3\xc3\x25\x27\x4e\x9c\xd8\x02\
+\xa7\x05\xf3\x86\x44\x22\x51\x52\x5c\x5c\x8c\x4d\x9b\x36\xe1\xbe\
+\xfb\xee\xc3\x82\x05\x0b\x72\x00\x08\xe7\x5c\x1b\x1d\x1d\xa5\xfe\
+\x20\xdf\x4c\x5a\xcd\xe4\xfe\x7e\x22\x77\x3f\x93\xc9\xa0\xbf\xbf\
+\x5f\xb8\x2a\x3a\x42\xde\x83\x10\x02\xb9\x5c\x0e\x6f\xbc\xf1\x46\
+\xe0\xf9\xe7\x9f\x4f\x0c\x0d\x0d\x11\x00\x45\x70\x54\x6a\x2f\x43\
+\x67\x67\x27\x96\x2c\x59\x82\xca\xca\x4a\xb9\x8a\xc9\x14\x22\x74\
+\x5d\x97\xd7\x20\x00\x47\x9f\xb0\xa4\xa4\x84\x04\x02\x81\xcb\x06\
+\xf9\x44\xab\xdb\x0c\x00\xf1\x7b\x71\x72\x25\x55\x14\x85\x84\x42\
+\x21\x5e\x53\x53\xc3\x6a\x6a\x6a\x06\x97\x2f\x5f\x3e\x98\x4a\xa5\
+\x06\x0f\x1f\x3e\x3c\x6f\x70\x70\xb0\x5e\x08\x11\xc8\xe5\x72\x83\
+\xe7\xce\x9d\x3b\x00\xa7\x75\x77\x17\x80\x9c\xae\xeb\xf8\xf6\xb7\
+\xbf\x5d\xf2\xe3\x1f\xff\xb8\x32\x97\xcb\xd5\x02\xd0\x3a\x3a\x3a\
+\xd8\x27\x9f\x7c\x42\x6b\x6a\x6a\x48\x22\x91\xa0\x8c\x31\x62\x9a\
+\x26\x18\x63\xd0\x34\x0d\xe1\x70\x18\x73\xe7\xce\xf5\x0b\x7f\x7a\
+\xc8\xe5\x72\xe3\x62\x38\xc3\xc3\xc3\xe2\xc4\x89\x13\xe2\xdc\xb9\
+\x73\x80\x3b\xbe\x83\xc1\xa0\x09\x60\x18\x40\x4a\x08\x71\x0a\x4e\
+\x23\x17\x3f\x61\xe9\x33\xdb\x17\x40\x87\x73\xbd\x59\xb8\x7b\xa1\
+\x37\xdf\x7c\xb3\x30\x10\x08\x3c\xa2\x69\xda\x7a\xcb\xb2\xea\x00\
+\x2c\x01\x50\xb4\x61\xc3\x06\xec\xdc\xb9\x13\x2b\x57\xae\xc4\xfc\
+\xf9\xf3\x01\x97\x45\xe6\x0f\x6a\x4d\x26\x5a\x7b\x2b\x21\x0b\x57\
+\x54\x55\x9d\xd0\x20\xb5\xb6\xb6\xb2\x37\xdf\x7c\x93\x75\x76\x76\
+\x0a\xcb\xb2\xa0\xaa\x2a\x02\x81\x00\x6c\xdb\x86\x61\x18\xe2\xf0\
+\xe1\xc3\x73\x86\x86\x86\x4a\xe0\x6c\x8f\x2e\x1f\x7d\x2e\xd2\xe9\
+\x34\xde\x7b\xef\x3d\xa4\x52\x29\xcf\xf3\xa1\x94\x9a\x72\x9b\x21\
+\x6b\xf0\x01\x60\xd5\xaa\x55\xe4\xf1\xc7\x1f\x57\x8a\x8b\x8b\x2f\
+\xdb\xdc\x5a\x96\x75\x35\xd6\xde\x8c\x00\x21\x84\x50\x07\xc0\x58\
+\x7a\x2f\x56\x5c\x5c\xbc\xe2\xcf\xff\xfc\xcf\x2b\x1a\x1b\x1b\x6b\
+\x5a\x5b\x5b\x03\xb9\x5c\x0e\x1f\x7e\xf8\xe1\xe2\xb6\xb6\xb6\xaf\
+\xc0\x11\xe2\x7c\x41\xd3\xb4\x1e\x5d\xd7\xf1\xeb\x5f\xff\xfa\x7e\
+\x38\xdb\x84\x25\x00\x12\x7d\x7d\x7d\xec\xd7\xbf\xfe\xb5\x38\x7b\
+\xf6\xac\x1a\x0c\x06\x55\x45\x51\x88\x61\x18\xe0\x9c\x43\x51\x14\
+\xcc\x9b\x37\x0f\x5f\xf9\xca\x57\xb0\x61\xc3\x86\xcb\xae\xc7\x8d\
+\x4f\x78\x06\xc0\x0d\x1e\x52\x8c\x6d\x69\x15\x00\x43\x94\xd2\x3d\
+\x00\xf6\xc3\xa1\x32\x5f\xc4\x98\x5c\xdd\x94\x8b\xa0\xde\x49\x06\
+\x40\x20\x2f\x02\xda\xd4\xd4\xb4\x94\x73\xfe\x84\x61\x18\x9f\x83\
+\xf3\xf0\xb4\xea\xea\x6a\x7b\xc7\x8e\x1d\xea\x37\xbe\xf1\x0d\x9a\
+\x48\x24\xe4\x20\xd7\xe4\xa4\x91\xf2\x53\x33\x0d\xfe\x49\x94\x1f\
+\x50\xe2\x9c\xe3\xc0\x81\x03\xf4\x97\xbf\xfc\x25\x39\x77\xee\x9c\
+\x90\xab\x48\x30\x18\xf4\x64\xb5\x2c\xcb\x0a\x4e\x74\xde\x89\x70\
+\xfc\xf8\x71\x9c\x39\x73\xc6\xff\x1c\x54\xe9\x11\xe5\x72\x39\xa9\
+\x5b\xc8\x1f\x7e\xf8\x61\x5a\x5f\x5f\x4f\xb7\x6c\xd9\x32\xee\xf3\
+\xd2\x50\x01\x33\xce\x03\x18\x07\x45\x51\x08\xa5\xd4\x4f\x1a\x52\
+\x00\x14\xe5\x72\xb9\x0d\x55\x55\x55\xdc\x25\xf1\xe4\x06\x07\x07\
+\x03\xb6\x6d\x17\x1f\x3a\x74\xe8\x89\xf6\xf6\xf6\x0a\x00\x27\x19\
+\x63\x3d\x3b\x77\xee\x9c\xf7\xdb\xdf\xfe\xf6\x61\x38\xf2\x6f\x9a\
+\xfb\x63\x9d\x3f\x7f\x5e\x5c\xb8\x70\x01\xaa\xaa\x2a\x9a\xa6\xc1\
+\x30\x0c\x6f\x65\x5f\xb4\x68\x11\x96\x2f\x5f\x7e\x99\x01\xc8\xe5\
+\x9c\x72\x12\x7f\x2c\x27\x10\x08\xd0\xc2\xc2\x42\x05\x8e\x64\xb8\
+\xbc\xc6\x94\xaa\xaa\xfb\x73\xb9\xdc\xcf\x01\xa4\xe1\x64\xb7\xe4\
+\xb5\x4f\x49\xee\xdf\x8f\x99\x6e\x00\x24\x33\x8f\xc1\xd9\x07\x99\
+\x84\x10\xd4\xd4\xd4\xcc\x1b\x1e\x1e\xae\x1f\x1e\x1e\xde\x0e\x60\
+\x2d\x80\x70\x51\x51\x11\x1a\x1a\x1a\xb0\x6a\xd5\x2a\xf1\xc0\x03\
+\x0f\x64\xcb\xca\xca\xa4\xe2\x8f\x9a\xc9\x64\x28\x80\x19\xb7\x5a\
+\xc9\xa2\x17\x79\x5d\x72\xd2\x9f\x3b\x77\x0e\x6d\x6d\x6d\xd2\xd5\
+\x17\x86\x61\x60\xdf\xbe\x7d\xf4\xf8\xf1\xe3\xc4\x1f\x1c\x1c\x1d\
+\x1d\xf5\x9f\x6e\x84\x52\x7a\x3e\x18\x0c\xa6\xe0\x46\xb4\x19\x63\
+\x14\x4e\xd7\x22\x21\x84\xa0\x00\x88\x61\x18\x4c\x56\xce\xc1\x11\
+\x99\x58\x8c\xcb\x6b\x1d\x14\x00\xd9\x4f\x3f\xfd\x94\xbf\xf7\xde\
+\x7b\x3c\x93\xc9\x30\xb8\xaa\xb6\x6e\x39\x34\x2d\x2d\x2d\xf5\x2c\
+\x94\xf4\x1a\xae\xc5\x82\xbb\x1d\x90\xd7\x23\x9b\xab\xa8\xaa\x4a\
+\x03\x81\x80\xff\x7e\xb3\x65\x65\x65\xb9\x8d\x1b\x37\x06\x5a\x5b\
+\x5b\x83\x27\x4f\x9e\xbc\xb7\xbb\xbb\x7b\x67\x4b\x4b\x8b\xf6\xca\
+\x2b\xaf\xd4\x03\xb8\x3f\x18\x0c\x46\xab\xab\xab\x51\x51\x51\x01\
+\x4d\xd3\x48\x3a\x9d\x26\xa3\xa3\xa3\xe0\x9c\x7b\x02\xb0\x72\x55\
+\x2f\x2e\x2e\xc6\xb9\x73\xe7\xf0\xb3\x9f\xfd\xcc\x9b\xec\x8a\xa2\
+\xa0\xbe\xbe\x1e\xab\x56\xad\x1a\x37\xfe\xe2\xf1\x38\x89\xc5\x62\
+\x24\x18\x0c\x12\xf7\xfa\x04\x80\xac\xa2\x28\xdd\x00\xfa\x7c\xd7\
+\x78\xcd\x40\xed\x8d\x62\xa6\x1b\x00\x69\x1d\x4d\xf7\x07\xff\xfc\
+\xcf\xff\xac\xfc\xf9\x9f\xff\xf9\x56\x21\xc4\x6e\x00\x0b\xe0\x0c\
+\x62\x2c\x5b\xb6\x0c\x5f\xfd\xea\x57\x71\xcf\x3d\xf7\xe8\x0d\x0d\
+\x0d\xe3\xe8\xbc\x33\x2d\xc8\x27\xc1\x18\x43\x2e\x97\x1b\x97\x96\
+\x63\x8c\xe1\xa3\x8f\x3e\xc2\x6f\x7e\xf3\x1b\x64\xb3\x59\x41\x08\
+\xb1\x85\x10\xe2\xc2\x85\x0b\x01\xff\xe4\x9f\x00\x27\x38\xe7\xbf\
+\x14\x42\x5c\x20\x84\x30\x21\x84\xcd\x39\x0f\x00\xb0\x5c\x39\x69\
+\x55\x08\x41\x39\xe7\x7e\x0e\xec\x16\x38\xdb\x85\x79\x79\xe7\x22\
+\x00\x48\x57\x57\x17\x7f\xf5\xd5\x57\xd9\x47\x1f\x7d\xc4\x85\x10\
+\x9c\x10\xc2\x6a\x6b\x6b\xc9\xd7\xbf\xfe\x75\xad\xb4\xb4\xd4\x13\
+\xb1\x94\xb4\xda\x99\xea\x5d\x01\x5e\x45\xe1\x44\x0b\x80\x0e\x38\
+\xe3\xe7\x5b\xdf\xfa\x16\x8e\x1d\x3b\x16\x7d\xf5\xd5\x57\x1f\x6f\
+\x69\x69\x59\x05\xa7\x7b\xf2\xa2\x48\x24\x82\x8d\x1b\x37\x62\xc7\
+\x8e\x1d\x28\x2b\x2b\x53\x0d\xc3\x80\xfc\xf1\xf3\x4e\x00\x60\x70\
+\x70\x10\xc7\x8f\x1f\xc7\xdf\xfe\xed\xdf\x42\xf2\x05\xa2\xd1\x28\
+\xbe\xf6\xb5\xaf\x61\xf9\xf2\xe5\x08\x04\x02\xde\xb1\x94\x52\xe1\
+\xa6\x02\x21\x84\xe0\x42\x08\x9b\x10\xc2\x64\x76\x2a\x0f\x9f\xc9\
+\x20\x20\x83\x53\x8a\x6b\xc1\x59\xcd\x03\x5f\xfd\xea\x57\x17\x2b\
+\x8a\xf2\x80\x61\x18\x8f\x02\x50\xdc\x8a\x3d\x73\xeb\xd6\xad\xec\
+\xb1\xc7\x1e\x0b\x54\x55\x55\x51\x00\x2a\xe7\x1c\x86\x61\x40\xd7\
+\xf5\x2b\x91\x45\x6e\x3b\x14\x45\x41\x20\x10\x90\x74\x52\x98\xa6\
+\x89\xb3\x67\xcf\x62\xef\xde\xbd\x78\xed\xb5\xd7\xc0\x39\xf7\x54\
+\x84\x15\x45\xe1\xee\x5e\xdd\x86\x63\x0c\x55\x8c\x95\x87\x8e\x02\
+\xf8\x80\x31\xf6\x72\x36\x9b\xbd\x94\xff\x3d\x79\xbc\x77\x2f\xfe\
+\x11\x0a\x85\xb2\x86\x61\x2c\x17\x42\x94\xfa\xfe\x6c\xc1\x31\xba\
+\x21\xcb\xb2\x70\xf8\xf0\x61\x19\xcd\x36\x01\xd8\x35\x35\x35\x62\
+\xe1\xc2\x85\xa2\xbe\xbe\x1e\xf1\x78\x1c\x81\x40\x00\xe1\x70\xd8\
+\x8b\x09\xcc\x54\x4c\xc0\x19\x10\xb6\x6d\x13\xcb\xb2\x94\x50\x28\
+\x84\xe2\xe2\x62\x51\x5c\x5c\xcc\xab\xab\xab\x69\x57\x57\xd7\xb2\
+\xe3\xc7\x8f\x2f\xeb\xef\xef\x87\x61\x18\xcc\x30\x0c\xab\xbc\xbc\
+\x9c\x3e\xf8\xe0\x83\x6a\x75\x75\xf5\x55\x5d\xc8\x8e\x8e\x0e\x74\
+\x76\x76\xa2\xb5\xb5\xd5\x6b\x92\x12\x8b\xc5\x70\xe6\xcc\x19\x1c\
+\x3d\x7a\x14\x4b\x96\x2c\xf1\x9e\x7f\x7b\x7b\x3b\xd2\xe9\xb4\x70\
+\x0d\x3b\x05\xa0\x0b\x21\x62\x96\x65\x15\xc1\x31\xcc\x23\x98\xe6\
+\xa6\x27\x33\x71\x66\xf8\xd3\x7c\xb2\x66\x1b\x8b\x16\x2d\xaa\x19\
+\x1a\x1a\xda\xd4\xd7\xd7\xb7\xd2\xb2\xac\xf5\x00\x94\x48\x24\x82\
+\x2d\x5b\xb6\xb0\xd5\xab\x57\xb3\x5d\xbb\x76\x89\xaa\xaa\x2a\xaf\
+\xb5\xf5\x54\x2b\xa7\x4c\x15\x84\xdb\x5b\x0f\x00\x02\x81\x80\xb7\
+\x22\x5d\xba\x74\x09\x1f\x7f\xfc\x31\x8e\x1d\x3b\x26\x3e\xf9\xe4\
+\x13\xd3\x9d\x74\xde\x72\xc1\x18\xeb\xa1\x94\x1e\x0a\x85\x42\x17\
+\xe0\x32\xd0\x38\xe7\x1a\xa5\x94\x01\x30\x28\xa5\xef\xa5\xd3\xe9\
+\x4b\xd7\xba\x67\x19\x00\x55\x14\x05\x8f\x3c\xf2\xc8\x99\xb7\xdf\
+\x7e\xfb\x77\x96\x65\x75\xf8\x52\x56\x05\x8c\xb1\x8d\x42\x88\x06\
+\xb9\x6f\x75\xa1\x03\xb0\x2e\x5e\xbc\xc8\xde\x79\xe7\x1d\x70\xce\
+\xb1\x62\xc5\x0a\xdc\x77\xdf\x7d\x88\x44\x22\x9e\x98\x85\x61\x18\
+\x50\x14\x65\xc6\x12\xaa\xe0\x46\xd2\x5d\xce\x00\x95\x44\x30\xf7\
+\x39\xb2\xca\xca\xca\xc0\x93\x4f\x3e\x89\xc2\xc2\x42\xec\xd9\xb3\
+\x07\xaf\xbf\xfe\x7a\xf3\xe8\xe8\x68\x9f\x6d\xdb\xc5\x45\x45\x45\
+\xd5\x00\xa2\xbe\x73\x5d\xd6\x4a\xbd\xb2\xb2\x12\xab\x56\xad\xc2\
+\xc3\x0f\x3f\x2c\x69\xbd\x50\x14\x05\x86\x61\xe0\xb9\xe7\x9e\x43\
+\x34\x1a\x45\x41\x41\x01\xa2\xd1\x28\xce\x9e\x3d\x8b\xce\xce\xce\
+\x71\x2f\xcc\xb6\xed\x12\xce\x79\x14\x4e\xbc\xc1\x2f\xfa\xf9\x99\
+\xda\x02\xc8\x9a\x6f\xcf\xe7\x4d\x26\x93\xab\x4d\xd3\xfc\x26\xa5\
+\x74\x89\xdb\x66\x3b\x53\x5f\x5f\x6f\x7c\xe1\x0b\x5f\x08\xef\xd8\
+\xb1\x23\xe0\xe6\xf9\xbd\x87\xa4\x69\xda\x8c\xa4\xb1\x4a\x92\x4f\
+\xfe\x75\x1d\x3d\x7a\x14\x3f\xfb\xd9\xcf\x70\xea\xd4\x29\xd1\xd7\
+\xd7\xc7\x70\xf9\x0b\x3f\xc1\x39\xff\x95\x69\x9a\x07\xc9\x98\xb6\
+\xbf\x06\xb7\x2d\x79\x20\x10\x18\x9c\x8c\xc1\xf3\x15\x48\xa1\xb5\
+\xb5\x75\x38\x93\xc9\xbc\x25\x84\x78\x5f\xfe\x9d\x31\x36\x8f\x73\
+\x1e\xc4\xf8\x26\xa6\x12\x1a\x00\xe5\xa3\x8f\x3e\x52\x1b\x1b\x1b\
+\xc9\x43\x0f\x3d\x84\xca\xca\x4a\x2c\x5f\xbe\x1c\xc0\x38\x6e\xfe\
+\x4c\x36\x00\x04\x80\x22\x39\x03\xbe\x86\xab\xde\xca\xbe\x6a\xd5\
+\x2a\xd4\xd7\xd7\xa3\xac\xac\xac\xfb\xf8\xf1\xe3\x4d\x2d\x2d\x2d\
+\xfd\xa9\x54\x2a\x97\x4a\xa5\xca\x22\x91\x88\xdf\x00\x4c\xc8\xa1\
+\xd8\xb4\x69\x13\xea\xeb\xeb\x9d\x2f\x23\x04\xd9\x6c\x16\x6f\xbc\
+\xf1\x06\x5e\x7c\xf1\x45\x74\x75\x75\x21\x1a\x8d\x22\x1a\x8d\xc2\
+\xb6\x6d\xf4\xf7\xf7\x8f\xfb\x2c\x63\xcc\xe6\x9c\xcb\xdc\xbf\x4c\
+\xc9\x4c\x5b\xe9\xe6\x4c\x32\x00\xfe\x07\x29\x00\x58\xf5\xf5\xf5\
+\x81\xe1\xe1\xe1\xa2\x64\x32\x39\xa7\xbb\xbb\xfb\x3e\x00\x5b\x01\
+\x84\x13\x89\x04\xca\xca\xca\xba\x1f\x7e\xf8\xe1\xdc\x8e\x1d\x3b\
+\xf4\xba\xba\xba\x20\xe0\xec\x9f\xb3\xd9\xac\x98\x89\xd1\x7e\xbf\
+\x00\xa4\xcc\xbf\x4b\x0d\xb8\xae\xae\x2e\xec\xdd\xbb\x57\xec\xdb\
+\xb7\x4f\xa4\xd3\x69\x0a\x20\xac\x69\x1a\x42\xa1\x10\x67\x8c\xf5\
+\xda\xb6\xdd\x23\x84\xd8\x47\x29\xdd\x67\x18\x46\xdb\x44\xe7\x77\
+\x57\x6b\x7f\x4a\x09\x18\xcf\x18\xf4\xfe\x5b\x1a\x8a\xc3\x87\x0f\
+\x5b\x00\x2e\xe4\x9d\xaa\x0b\x4e\xbb\xeb\x5a\x4a\x69\xa1\x4c\x9d\
+\xaa\xaa\x9a\x20\x84\x94\x8d\x8e\x8e\x62\x78\x78\x18\xc3\xc3\xc3\
+\xd8\xbb\x77\x2f\x5f\xb1\x62\x05\x09\x85\x42\xa4\xb8\xb8\x18\x89\
+\x44\x02\xd1\x68\x74\xdc\xfd\xce\xa4\x54\x6b\x1e\xc6\x71\x06\x72\
+\xb9\x1c\x6c\xdb\x26\x84\x10\xce\x39\xb7\x15\x45\xe1\x73\xe7\xce\
+\x1d\xde\xb2\x65\x4b\xae\xa2\xa2\x82\xcc\x9f\x3f\xdf\xdb\xf7\xbb\
+\x1f\xf6\xda\xa4\xe7\x57\x8e\x56\x55\x55\xa1\xaa\xaa\x6a\xdc\x97\
+\xf5\xf4\xf4\xe0\xe3\x8f\x3f\xc6\xe0\xe0\x20\xba\xba\xba\xfc\x86\
+\x83\x12\xa7\x1f\x45\x52\x08\x91\x14\x42\x9c\x13\x42\x74\x62\x8c\
+\xf9\x27\xdf\xdb\xb4\x34\x3c\x99\x49\x06\x40\xe6\x3a\x6d\xb8\x2b\
+\x7f\x2e\x97\xab\x0a\x04\x02\x3b\x35\x4d\x5b\x6d\x59\xd6\x5a\xb8\
+\x9d\x78\x36\x6c\xd8\x80\xc7\x1f\x7f\x3c\xbc\x76\xed\x5a\xbd\xba\
+\xba\xda\x2f\x13\x3d\xae\x6d\xf5\x4c\x82\x8c\xbc\x87\x42\x21\xcf\
+\xed\x1f\x1a\x1a\xc2\x9b\x6f\xbe\x89\xfd\xfb\xf7\xe3\xf0\xe1\xc3\
+\x56\x3a\x9d\xb6\xe0\x30\x15\xa9\x9b\x27\x1e\xa2\x94\xbe\xa9\x69\
+\xda\x01\xc6\xd8\xf1\xf5\xeb\xd7\x77\xec\xd9\xb3\xe7\x6a\x5f\x93\
+\xdf\x12\x2b\x5f\xf1\xe6\x32\x06\xe1\x04\xe7\x48\x03\xf8\x08\xce\
+\xfe\x33\xa8\x28\x8a\x50\x14\x25\x20\x84\xd8\xc1\x18\x7b\xd4\xe7\
+\x65\x58\xe7\xcf\x9f\x37\x5f\x79\xe5\x95\x40\x6b\x6b\xab\xba\x73\
+\xe7\x4e\x7c\xee\x73\x9f\xbb\xec\x7e\x03\x81\xc0\x8c\x8d\xc1\x48\
+\xb6\x9e\xab\xe6\x4b\x38\xe7\x18\x18\x18\xe0\x07\x0e\x1c\x60\x97\
+\x2e\x5d\x62\xa9\x54\x2a\xb2\x76\xed\xda\xba\xaf\x7c\xe5\x2b\x76\
+\x71\x71\x71\xa2\xb0\xb0\x30\x28\x8d\x9a\x3b\xd6\x48\x7e\x50\xf1\
+\x4a\x59\xa6\x75\xeb\xd6\xe1\x4f\xfe\xe4\x4f\x70\xec\xd8\x31\xf1\
+\xc6\x1b\x6f\xb0\x23\x47\x8e\x78\x07\x12\x42\x32\xaa\xaa\x1e\xb1\
+\x2c\x6b\x9f\x10\xa2\x09\xc0\x71\x8c\x95\xb5\xfb\xdf\xe9\xcc\xdb\
+\xd3\x4e\x21\x34\x8c\xcf\x87\x22\x1e\x8f\xef\x28\x28\x28\xf8\x35\
+\xa5\x74\x14\x2e\x1d\xb2\xba\xba\xda\xfa\xef\xff\xfd\xbf\xdb\x3d\
+\x3d\x3d\xdc\x34\x4d\xe6\x46\x4f\x85\x69\x9a\x52\x10\x63\x46\xc2\
+\x2d\x20\x19\x77\x8d\x1f\x7c\xf0\x81\x78\xfa\xe9\xa7\x45\x38\x1c\
+\x16\xaa\xaa\xe6\x00\x64\x54\x55\xe5\xaa\xaa\x0a\x38\x69\xb7\x0f\
+\x00\x3c\x0d\xc7\xf0\xf9\xc9\x22\xd3\x9d\xcb\x8c\x00\x88\xb9\xff\
+\x86\x01\x94\x01\xf8\xcf\x84\x90\x76\x42\x88\xf0\xe9\xf3\x8d\xea\
+\xba\x6e\x95\x95\x95\x89\xff\xfc\x9f\xff\xb3\xb8\x78\xf1\xa2\x77\
+\x6f\x8c\x31\x31\x3a\x3a\x2a\x2c\xcb\xba\x1d\x8f\x7b\x52\xb0\x6d\
+\x5b\x18\x86\x21\x84\x70\xae\xd7\xb6\x6d\xfe\xe9\xa7\x9f\xf2\x2f\
+\x7d\xe9\x4b\x76\x22\x91\xb0\x57\xaf\x5e\x6d\x3d\xf7\xdc\x73\xb9\
+\x5c\x2e\x97\x33\x4d\xd3\x62\x8c\x71\xc3\x30\x84\x69\x9a\x93\xfe\
+\x0e\xff\xfd\x5b\x96\x25\x4e\x9e\x3c\xc9\xbf\xfb\xdd\xef\x1a\x81\
+\x40\x40\x8a\x79\x30\x45\x51\x52\x91\x48\xe4\x87\x9a\xa6\xdd\x03\
+\x67\x01\x90\xef\x3a\x88\x69\x74\xff\x81\x99\xe5\x01\x00\xae\xd8\
+\x83\xa6\x69\xe2\xbf\xfc\x97\xff\x12\xfc\xc1\x0f\x7e\x50\x0e\x47\
+\xc1\x47\xe6\xf9\xd9\xda\xb5\x6b\x33\xdb\xb6\x6d\xd3\xca\xca\xca\
+\x42\x70\x0d\x85\x6c\x21\x35\xd3\xf2\xd0\xfe\x3c\xbf\x3f\x55\x74\
+\xe1\xc2\x05\xb4\xb4\xb4\xe0\xfd\xf7\xdf\xe7\x87\x0f\x1f\x66\x99\
+\x4c\x46\x01\xa0\xcb\x46\xa2\xb6\x6d\x5f\xb0\x6d\xbb\x45\x38\x7b\
+\xf3\xc3\x18\xab\x46\x03\x9c\x49\xe9\x57\xaf\xf1\xe4\xcf\x70\xfd\
+\x2c\x31\xc9\xb3\xf0\x0f\x32\x0b\x4e\x56\xc1\x8f\x0c\x80\xfd\x42\
+\x88\x3a\x4a\xe9\x0a\x4d\xd3\x16\x69\x9a\x56\x9c\xc9\x64\xc2\xa6\
+\x69\xa2\xb7\xb7\x57\x7c\xfc\xf1\xc7\xa2\xae\xae\x8e\xde\x73\xcf\
+\x3d\x68\x68\x68\x40\x51\x51\x91\xb7\xd5\x11\x13\xe8\xdf\xcf\x04\
+\x08\x5f\xd1\x95\x64\x0b\x86\x42\x21\x74\x76\x76\x2a\xc3\xc3\xc3\
+\xb8\x74\xe9\x12\x62\xb1\xd8\xb8\x77\x27\xef\xe5\x6a\xe7\x94\x7d\
+\x0f\x38\xe7\xb0\x2c\x0b\xba\xae\x23\x93\xc9\x60\x74\x74\x14\x3d\
+\x3d\x3d\xb0\x2c\x4b\x84\xc3\x61\x01\x27\x58\x4d\x00\xc4\x84\x10\
+\x56\x38\x1c\x6e\x4b\x26\x93\x59\xdf\xe9\xa6\x7d\x30\xcf\x04\x03\
+\x30\x6e\x7f\xfa\xc8\x23\x8f\xe8\xed\xed\xed\xea\xd7\xbf\xfe\xf5\
+\xb9\x70\x72\xfc\x1a\xe0\xe5\xf9\x95\x75\xeb\xd6\xe9\xf5\xf5\xf5\
+\xe3\xac\xe2\x9d\x96\xe7\xdf\xbb\x77\x2f\x5e\x7e\xf9\x65\xb4\xb4\
+\xb4\xb0\xae\xae\xae\x1c\x9c\x08\xbb\xce\x18\x83\x61\x18\x4c\x08\
+\xb1\x17\xc0\xcb\x00\x5a\xe0\xec\xc9\xfd\x90\x03\xc4\xdf\x5b\x0f\
+\xb8\xb1\x3a\x71\x8f\xf5\xe7\xbf\xec\x2b\x1c\x7b\x0a\xc0\x4f\x01\
+\xac\xb0\x2c\xeb\x6b\x42\x88\xad\xbe\xbf\xf1\x53\xa7\x4e\xb1\x9f\
+\xfe\xf4\xa7\xda\xca\x95\x2b\xc9\x57\xbf\xfa\x55\x6c\xdd\x3a\xf6\
+\x67\x69\x08\x35\x4d\x9b\x71\xef\x28\x1f\x91\x48\x04\xf1\x78\x1c\
+\x80\xd3\xf3\x31\x9f\x7b\x31\x99\x98\x86\x70\xba\x01\x7b\x6d\xcf\
+\x6d\xdb\xc6\xe1\xc3\x87\xf1\xf6\xdb\x6f\xa3\xa9\xa9\x09\xe7\xce\
+\x9d\x83\xbf\xef\xa1\x5b\x62\x1c\xca\x64\x32\x61\x38\x75\x00\xb7\
+\x0c\xb7\xdb\x00\xc8\x94\x9f\x0d\x67\xe5\xb1\xb2\xd9\xac\xba\x75\
+\xeb\xd6\xaa\xe6\xe6\xe6\xd5\x00\x16\x04\x02\x01\xc4\xe3\x71\xb6\
+\x69\xd3\x26\xf2\xe8\xa3\x8f\xd2\xea\xea\x6a\x15\x4e\x61\xcf\x1d\
+\x95\xe7\x97\x3c\xf0\x33\x67\xce\xe0\xfd\xf7\xdf\xc7\xab\xaf\xbe\
+\x0a\x57\xfb\x3e\xa0\xeb\xba\xa6\x28\x0a\x37\x0c\xc3\xb4\x2c\xeb\
+\x0c\x80\xf7\x01\xbc\x8a\xb1\x89\x29\x55\x6a\x24\x27\x62\xaa\x20\
+\x0d\x46\xfe\xa4\x97\xbc\x79\x05\x8e\x01\xce\x02\x18\x00\xf0\x31\
+\xe7\xfc\x12\xe7\x7c\x01\x80\x45\xaa\xaa\xc6\x75\x5d\x57\x0d\xc3\
+\xc0\xe0\xe0\xa0\xf8\xf8\xe3\x8f\x71\xe9\xd2\x25\xd4\xd5\xd5\x61\
+\xd1\xa2\x45\x88\xc7\xe3\xde\xbb\xb9\xda\xaa\x79\xbb\xe0\xd3\x18\
+\x84\x6d\xdb\xb0\x6d\x9b\x77\x77\x77\xdb\x94\x52\x93\x52\xca\x63\
+\xb1\x18\xcd\xe5\x72\x3a\x63\x4c\x73\x27\xfe\xa4\xac\x97\x34\x00\
+\x32\x16\x65\x9a\x26\x4e\x9d\x3a\x85\x17\x5e\x78\x01\x97\x2e\x5d\
+\x02\xc6\x0a\x7f\x38\x1c\xe9\xba\x14\x63\x6c\x14\xce\xb6\xcb\xdf\
+\xf1\x77\xda\x1f\xda\xed\x9e\x39\x0a\x5c\xa2\x8b\xdb\xf9\x04\x1f\
+\x7c\xf0\x81\x2d\x84\x58\x08\x60\x57\x41\x41\xc1\xb2\x6d\xdb\xb6\
+\xc5\x97\x2e\x5d\x6a\x3d\xf4\xd0\x43\xa8\xae\xae\xd6\xe1\x16\xf6\
+\xd8\xb6\x2d\xc4\x0d\xf6\xb7\x9f\x4e\x48\xb7\x52\x56\x19\xe6\xe7\
+\xf9\x8f\x1e\x3d\x2a\x0e\x1e\x3c\xc8\x5c\x92\x0f\x85\x53\xc6\x0a\
+\x42\xc8\x25\x4a\xe9\xc7\x8c\xb1\xa3\x00\x0e\x62\xfc\xaa\x7c\x2b\
+\xa3\x9a\xfe\xc9\xaf\xf8\xfe\x5b\x5e\x4f\x3b\x80\xf7\xe0\x44\xaf\
+\x1b\x28\xa5\x2b\x54\x55\x9d\x2b\x35\x07\xda\xdb\xdb\xd9\x7b\xef\
+\xbd\x47\x28\xa5\xb4\xa1\xa1\x01\x2b\x56\xac\xc0\xdc\xb9\x73\x3d\
+\x03\xe0\x17\x5f\xb9\x5d\x60\x8c\x09\xd9\x8b\x4f\xae\xd0\x4d\x4d\
+\x4d\xa2\xa5\xa5\x25\x7d\xe9\xd2\xa5\x33\x23\x23\x23\x07\x39\xe7\
+\xdd\xd5\xd5\xd5\x73\xeb\xea\xea\xb6\x72\xce\x97\x53\x4a\x65\x73\
+\x57\x46\x29\x95\x0b\xd7\x84\x90\xf7\x2a\xdc\x20\xa3\x69\x9a\x18\
+\x19\x19\xb1\x7b\x7b\x7b\x19\xc6\xe4\xcd\x09\x21\x64\x08\x4e\xb7\
+\xe3\x66\x38\x5b\xbd\x51\x8c\x4f\x81\x4f\x69\xe1\xcf\x44\xb8\xdd\
+\x06\x40\x3e\x48\x2a\x5d\xa6\x95\x2b\x57\x16\x1c\x3c\x78\x70\x35\
+\x80\x07\xe7\xcd\x9b\x57\xf2\xf8\xe3\x8f\x07\x1f\x7a\xe8\x21\x52\
+\x56\x56\x26\x73\xe3\x04\x98\xb9\x79\x7e\x00\x13\xe6\xf9\x8f\x1c\
+\x39\x82\x9f\xfd\xec\x67\x38\x79\xf2\x24\xf2\xf3\xfc\x6e\x0a\xef\
+\x08\xe7\xfc\x67\x00\x4e\x62\x3c\x0f\x1c\x18\x6b\x4c\x32\x2d\xa9\
+\xa0\x3c\xf8\x09\x58\x92\x75\x98\xff\xbd\x07\x00\x34\x33\xc6\xb6\
+\x66\x32\x99\x98\x10\x62\x2e\xc6\x26\x04\x3b\x70\xe0\x00\x6d\x6e\
+\x6e\xf6\xba\xfc\xce\x9d\x3b\xd7\x5b\x0d\xfd\xc6\xf1\x76\x40\x8c\
+\x69\xec\x7b\x0a\xbe\x86\x61\xe0\xd4\xa9\x53\xe2\xa5\x97\x5e\x1a\
+\x39\x73\xe6\xcc\xc9\xc6\xc6\xc6\x5f\x01\x38\xf5\xd3\x9f\xfe\xf4\
+\xde\x92\x92\x92\x6a\x21\xc4\x3d\xf2\x7d\x2a\x8a\xc2\xdc\xf2\xc2\
+\x2b\x1a\x00\xbf\x12\x93\x24\x58\x45\x22\x11\x56\x5a\x5a\xca\x3a\
+\x3a\x3a\xa4\x81\x25\x00\x7a\x29\xa5\x1f\x32\xc6\xf6\x00\x38\x02\
+\xe7\xbd\xfb\x3d\xbc\x29\x2d\xfd\x9d\x08\xb7\xcb\x00\x50\x38\x51\
+\x6e\x8b\x10\x62\xb9\xee\x7c\x18\x40\xe9\xc1\x83\x07\x97\xce\x99\
+\x33\x67\x4d\x34\x1a\x9d\xbf\x65\xcb\x16\x6c\xde\xbc\x19\xf3\xe6\
+\xcd\x63\x80\x97\xe7\x9f\x91\x55\x7d\xf9\x2e\xae\x10\x02\x32\x67\
+\xde\xd7\xd7\x87\x7d\xfb\xf6\x89\xbd\x7b\xf7\x22\x9d\x4e\x03\x00\
+\x74\x5d\x17\xba\xae\x8f\xe6\x72\xb9\x61\xcb\xb2\xfa\x00\xec\x03\
+\xb0\x17\x4e\x1a\x0e\x70\xe3\x02\x98\x7a\xb7\x7f\xb2\xc8\x77\x41\
+\x65\x74\x7a\x04\x4e\x6b\xac\x21\xce\x79\x19\x1c\x23\x11\x08\x85\
+\x42\xd0\x34\x0d\x23\x23\x23\x7c\x68\x68\x08\x43\x43\x43\x28\x2b\
+\x2b\x83\x6d\xdb\x92\xff\x2e\x00\xf8\xf7\xd4\xb7\xed\xe5\xc9\xd4\
+\x1f\x30\x96\xcf\xbf\x70\xe1\x02\xf6\xec\xd9\x83\xae\xae\x2e\xac\
+\x59\xb3\x06\x9f\x7c\xf2\x89\x77\xbc\x2c\xf4\xb9\x5e\xcf\x45\x1a\
+\xba\xa2\xa2\x22\xc4\xe3\xf1\x40\x51\x51\x11\x7a\x7b\x7b\xbd\x98\
+\x08\x21\x64\x80\x52\x7a\x02\xc0\xc7\x70\x64\xc9\x80\xf1\x31\x9d\
+\x69\x37\xf8\xb7\xc3\x00\x78\x92\x5e\x84\x90\x9c\xec\x79\x06\xa7\
+\xb0\xe7\x71\x00\x2b\x37\x6f\xde\x7c\xef\xe6\xcd\x9b\xfd\xf5\xfc\
+\x92\xbd\x35\x63\xf3\xfc\x52\x65\xd7\xcd\x29\xc3\xb6\x6d\xb4\xb4\
+\xb4\x60\xef\xde\xbd\x38\x7e\xfc\x38\x0e\x1f\x3e\xcc\xd3\xe9\xb4\
+\xa7\x39\xcf\x39\xb7\x19\x63\x2d\x70\x26\xfd\x71\x38\x2e\x60\xda\
+\x7f\x4a\x4c\x81\xee\xfb\x14\xc2\x2f\xa7\x26\x41\xe1\x52\x63\x65\
+\x74\xdc\xdf\xc1\x86\x52\xea\x11\x83\xe0\x7a\x15\xae\xa1\x94\xfd\
+\x1b\x6e\x0b\x84\xc3\xa2\xf4\x26\xa2\x61\x18\x18\x1a\x1a\x22\xe9\
+\x74\x3a\x0a\x60\xf9\xb6\x6d\xdb\xbe\x08\xa0\x1b\x40\x25\x80\x05\
+\x52\x6b\xd0\xf5\x18\xae\x59\x99\x37\x51\xbc\x23\x1c\x0e\x7b\x63\
+\x43\xfe\x9d\x52\x3a\xe2\x7e\x4f\x8f\xef\x50\x3f\x0d\xfe\xae\x8d\
+\x01\x10\xb8\xdd\x79\x5d\x8b\x4a\xe1\xb4\xe9\xda\x5d\x5d\x5d\xbd\
+\x64\xd3\xa6\x4d\xda\x37\xbe\xf1\x0d\x94\x94\x94\x98\x94\x52\x15\
+\x00\xb5\x2c\x8b\xca\x95\x7f\x26\x42\x0e\x12\x55\x55\x3d\x65\x9d\
+\xee\xee\x6e\xbc\xf5\xd6\x5b\x78\xfb\xed\xb7\x61\x59\x16\x87\xa3\
+\x35\xaf\x0a\x21\x74\xdb\xb6\x05\x63\xac\x5b\x08\xf1\x16\x80\xb7\
+\x31\xb6\xca\xcb\xae\xc3\x37\x92\xd6\x9b\x4e\x4c\x74\x2d\x11\x38\
+\x22\x9a\xfe\x5e\x7e\x5e\x95\x60\x24\x12\x81\x4f\x41\x57\x01\xbc\
+\x26\x2b\xb7\x35\x1f\xe8\x09\x04\xb8\x82\x26\xaa\xaa\x82\x73\x4e\
+\x34\x4d\x8b\xc5\xe3\xf1\xd5\x81\x40\x60\xf9\xe8\xe8\x28\x8f\x44\
+\x22\x0a\x9c\x02\x1d\xbf\x46\xc3\x35\xe7\x4c\xbe\x67\xca\x39\x47\
+\x2a\x95\x82\x61\x18\xe3\x04\x57\xdc\xe7\x65\x8f\xff\xf4\xe5\x34\
+\xf8\xe9\xc4\xad\x34\x00\xf2\xa5\x73\x4a\xa9\x21\x84\xc0\x33\xcf\
+\x3c\x13\x6a\x6e\x6e\x5e\x78\xf1\xe2\xc5\xba\x9a\x9a\x9a\x6d\x91\
+\x48\x64\xe5\xb2\x65\xcb\x94\x8d\x1b\x37\xa2\xac\xac\x4c\x36\x42\
+\xa0\xfe\x7a\xfe\x99\xe4\xf6\xfb\x91\x67\xd9\x01\x38\x71\x8a\x9e\
+\x9e\x1e\x99\xf2\x11\x94\x52\x11\x89\x44\x60\x9a\x26\xcd\x66\xb3\
+\x10\x42\x68\x70\xac\xbf\xcc\x09\x51\x38\x93\xca\xc4\x8d\xb5\xb2\
+\x9e\x4e\xf8\x8b\x52\x64\xa1\x4a\x0a\x4e\x3c\x80\x71\xce\xe7\x02\
+\xa8\xa6\x94\xea\xb2\xec\x36\x95\x4a\xb1\xfd\xfb\xf7\x53\xce\x39\
+\xa9\xab\xab\x23\xf3\xe7\xcf\x57\xfc\x06\x5c\xc6\x03\x6e\xd7\x3b\
+\x95\x29\xbd\xc2\xc2\x42\xa8\xaa\x8a\x91\x91\x11\x4a\x08\xd1\x75\
+\x5d\xd7\x23\x91\x31\x45\xb5\x6b\xe5\xfe\xfd\xc7\xb8\xe7\xe4\x9c\
+\x73\x32\x30\x30\x40\x2e\x5e\xbc\x88\xae\xae\x2e\xbb\xb3\xb3\xb3\
+\x89\x73\xde\x46\x29\x0d\x0b\x21\xea\x84\x10\x95\xb6\x6d\x87\xc5\
+\x58\xeb\x72\x59\xf8\x33\xe5\xc2\x9f\x57\xc3\xad\x36\x00\x94\x10\
+\x62\x2a\x8a\x02\xc6\x18\xde\x7b\xef\xbd\x2a\xce\xf9\x53\x8a\xa2\
+\xdc\xbf\x62\xc5\x8a\xba\x6d\xdb\xb6\x29\x8b\x17\x2f\x86\xdb\x91\
+\x57\x66\x08\xe8\x4c\xcd\xf3\x5f\x0b\xa1\x50\xc8\x23\xc3\x00\x63\
+\xc5\x32\x3e\x91\xcd\x10\x5c\x7a\xb3\x3c\x04\x33\xcb\xed\xf7\x23\
+\x3f\x20\xc5\xe0\xf0\x14\x5e\x82\x93\x1e\xdc\x21\x84\x78\x5c\x08\
+\x51\x41\x08\xa1\xb6\x6d\xa3\xb9\xb9\xd9\x7e\xe9\xa5\x97\xd4\x83\
+\x07\x0f\x2a\x4f\x3f\xfd\x34\x6a\x6a\x6a\xc6\x6d\xdf\x5c\x81\x8e\
+\x5b\xbe\xa5\x9b\x68\x32\x13\x42\x3c\xf5\xe3\x3c\xa1\x95\x49\x41\
+\x7a\x80\x9a\xa6\x09\x45\x51\x98\x6d\xdb\x4a\x4b\x4b\x0b\x79\xf5\
+\xd5\x57\xf1\xe9\xa7\x9f\x9a\x8c\xb1\x0f\x39\xe7\xaf\x47\x22\x91\
+\x78\x36\x9b\xfd\x03\xdb\xb6\x2b\x2c\xcb\x4a\x10\x42\x42\xb8\x5c\
+\xeb\xef\x96\x19\xfe\x5b\x69\x00\x08\x9c\xfc\x3d\x01\x40\x7f\xfc\
+\xe3\x1f\xd3\x3f\xfe\xe3\x3f\x5e\x0a\x60\x47\x30\x18\xbc\x3f\x91\
+\x48\x60\xc7\x8e\x1d\xa2\xb6\xb6\x36\x0b\xa7\xd4\x55\xcf\x66\xb3\
+\xea\x4c\xe6\x92\xfb\x21\x57\x13\x39\xc9\x6d\xdb\x46\x6f\x6f\x2f\
+\x64\xbb\x28\xe1\x70\xcd\x89\x6d\xdb\x9c\x73\x2e\xbd\x9b\x5e\xb8\
+\x15\x76\x18\x1b\x04\x33\xd5\x00\x78\x0d\x54\xdc\x1f\x06\xe7\xfa\
+\x7b\xe1\xd4\x2e\xcc\x15\x42\x3c\x4a\x08\x09\xc9\xe8\x77\x5f\x5f\
+\x9f\xe8\xeb\xeb\xc3\x91\x23\x47\x44\x49\x49\x89\xb9\x71\xe3\x46\
+\xb3\xa1\xa1\x01\x70\x03\x9c\x72\x2f\x7e\xab\x91\x2f\x1a\x9a\x4c\
+\x26\x61\x59\x16\xca\xcb\xcb\x41\x29\x15\xa1\x50\x48\xa4\x52\x29\
+\x51\x50\x50\x20\xd3\x75\xd7\xa4\x00\x48\x03\x00\x38\xda\x0d\x8a\
+\xa2\xd0\x54\x2a\x85\x03\x07\x0e\xe0\xbd\xf7\xde\xb3\x00\x9c\x00\
+\xf0\xca\x9f\xfc\xc9\x9f\x14\xfe\xd3\x3f\xfd\xd3\x5a\xdb\xb6\x77\
+\x72\xce\x0b\xe0\x2c\x02\xf9\xf5\x1a\xb7\x0c\xd3\x3d\xb3\xfc\x4a\
+\xbe\x04\x00\xbd\xe7\x9e\x7b\xc2\xab\x56\xad\x2a\xdd\xbf\x7f\xff\
+\x5c\x38\x2d\x9c\x17\xca\xbd\x51\x22\x91\xf0\x34\xfb\xe5\x24\x9a\
+\xc1\x65\xa5\x5e\x9a\x47\xae\x60\x42\x08\x0c\x0c\x0c\xe0\xe4\xc9\
+\x93\x68\x6c\x6c\xc4\xa9\x53\xa7\x44\x77\x77\x37\xd7\x34\x4d\x11\
+\x8e\x0e\x80\x60\x8c\x0d\xc0\x49\xf5\x35\xc2\x61\xd7\x75\xc3\x31\
+\x02\x02\x8e\xeb\x3f\x93\xf6\xfd\x57\x82\xb7\xcf\x77\x21\x0b\x56\
+\x12\xc0\xb8\xb6\x63\x14\x8e\xd1\x37\x1b\x1b\x1b\xf7\xc5\x62\xb1\
+\x83\x70\xee\x6d\x3d\x80\xad\x94\xd2\x80\x3b\xb1\xe4\xe7\xa7\x4d\
+\xfa\xca\x1f\xa4\x95\x5b\xc9\x96\x96\x16\x7c\xf2\xc9\x27\xe8\xea\
+\xea\xc2\xf0\xf0\x30\x1e\x79\xe4\x11\x51\x5a\x5a\xca\xd7\xad\x5b\
+\xc7\x34\x4d\x13\x6e\x17\x62\x95\x10\x72\xcd\xb6\x6b\xfe\x94\x9f\
+\x7b\x8f\xc2\x17\x03\x11\x70\xd4\x7d\xf1\x93\x9f\xfc\x64\x48\x51\
+\x94\xa4\xfb\x3b\x0d\xb7\x39\x15\x7f\x2b\x0c\x80\xdc\xdb\x70\x00\
+\xa4\xa7\xa7\x27\xf6\xc9\x27\x9f\x2c\x1a\x18\x18\xd8\x08\xc7\x00\
+\x44\x01\x87\x2d\x35\x34\x34\x44\xe3\xf1\x78\x10\x00\xd1\x34\x0d\
+\xb6\x6d\xcf\x38\xfe\xb8\x1f\x32\xda\xef\x6f\x2a\x32\x34\x34\x84\
+\x3d\x7b\xf6\xe0\x37\xbf\xf9\x0d\x06\x06\x06\xc4\xd0\xd0\x90\x6d\
+\x59\x96\xe2\x6a\xc9\x13\xc6\xd8\x10\x21\x64\x0f\x80\xdf\xc0\x61\
+\xd7\x0d\xc1\x09\x00\x7a\x79\xf4\xdb\x73\x37\xd7\x85\xfc\x14\x21\
+\x81\xb3\x92\x09\xf9\x4c\x5c\xc8\xb6\x6d\xe6\xc9\x93\x27\x0f\xb6\
+\xb7\xb7\xff\xa4\xa2\xa2\x42\x1e\xbf\x41\x55\x55\x69\x00\x64\xd4\
+\x7b\xda\xf6\x02\xfe\x48\xbe\x7c\x5f\x8d\x8d\x8d\x78\xfe\xf9\xe7\
+\xd1\xd4\xd4\x84\x7b\xee\xb9\x07\xdf\xf8\xc6\x37\xc8\xd2\xa5\x4b\
+\x95\x78\x3c\x4e\x65\xd3\x4e\x4d\xd3\x88\xff\xfd\x5e\x0d\x79\x7f\
+\x27\xbe\x2c\x08\x81\xbb\xd5\xcb\x64\x32\x4a\x34\x1a\x95\x81\x90\
+\x5b\x42\xf6\xb9\x1a\x6e\x85\xf5\x91\xfd\x9c\x6d\x00\x76\x4f\x4f\
+\x8f\xd9\xd3\xd3\x53\x05\x60\x13\xa5\x74\x51\x59\x59\x99\x5a\x5e\
+\x5e\x9e\xab\xae\xae\xa6\xa6\x69\xaa\xb9\x5c\x6e\x5c\xba\x6f\xa6\
+\x1b\x00\x69\xf5\x25\xef\x5b\xd7\x75\x74\x74\x74\xe0\xd8\xb1\x63\
+\x80\xeb\xd6\xbb\xf7\xa1\xc2\xd1\xe5\xd3\x85\x10\x1d\x00\x8e\xf9\
+\x4e\xe5\xaf\xf0\x9b\xe9\xab\x3f\x30\xb6\x5f\x95\xe9\xbc\x30\x80\
+\x24\x80\xa3\x00\x16\x0a\x21\xe2\x00\x0a\x34\x4d\x53\x42\xa1\x10\
+\x0c\xc3\x10\x43\x43\x43\x62\xc3\x86\x0d\xf8\xde\xf7\xbe\x87\xef\
+\x7f\xff\xfb\x00\xc6\x97\xce\xfa\x73\xf3\xd3\x01\xff\xbb\x92\x79\
+\xfd\xbe\xbe\x3e\x7c\xfa\xe9\xa7\xe8\xee\xee\x86\x64\x2d\xce\x9b\
+\x37\x0f\xc8\xd3\x3a\x94\x9f\xb9\xd2\x79\xfd\xfc\x00\xd3\x34\x31\
+\x3a\x3a\x4a\x87\x86\x86\x70\xee\xdc\x39\xc9\x83\x50\x28\xa5\xb5\
+\x8c\xb1\x45\x95\x95\x95\x45\x96\x65\x55\xc1\x79\x76\x59\xdc\x1e\
+\x8e\x87\x87\x5b\xe5\x01\x78\xa4\x08\xcb\xb2\x0c\x38\x62\x8b\x0d\
+\x85\x85\x85\x65\x8f\x3e\xfa\xa8\xb2\x79\xf3\x66\x6b\xc9\x92\x25\
+\xac\xa8\xa8\x48\xe5\x9c\x7b\xfb\xad\x99\xca\xf4\x93\x98\x28\x3a\
+\x1c\x8f\xc7\xfd\xd5\x63\xb2\xac\xd7\x7f\x1f\x71\x5c\xae\xc2\x7b\
+\x4b\x23\xbf\x37\x09\x7f\x8e\x5a\xd2\x99\x4d\x38\x06\x8d\xc1\xa9\
+\xde\xbc\x0f\x4e\x5a\x37\xe4\xf6\x29\xd4\x00\xac\x06\x80\x7f\xfc\
+\xc7\x7f\xc4\xba\x75\xeb\xd6\x6e\xdb\xb6\x4d\x0b\x06\x83\xc2\xa5\
+\xd5\x12\xc6\x98\x72\x2b\x8c\xbd\x4c\xe9\x49\x31\x4e\x09\x69\xc0\
+\xaf\x07\xfe\x22\x27\x99\xcd\x18\x18\x18\xc0\xbe\x7d\xfb\xc8\x87\
+\x1f\x7e\x48\x5a\x5a\x5a\xd0\xd6\xd6\x06\x00\x0a\x21\xa4\xce\xb6\
+\xed\xad\xfd\xfd\xfd\x45\xb6\x6d\xd7\xc1\x55\x5e\xc6\x5d\x6e\x00\
+\x3c\xf8\xe8\x9f\x65\x70\x5a\x2d\x97\x2c\x5d\xba\x54\x7b\xfc\xf1\
+\xc7\xf1\xc8\x23\x8f\xa8\xc1\x60\xd0\x96\xe5\x93\x3e\xda\xe5\xad\
+\xba\xbc\x1b\xc2\x44\xcc\xb0\x54\x2a\xe5\x31\x15\x0d\xc3\x20\x70\
+\xc5\x3d\x7c\xfb\xc3\x14\x9c\xe7\x1e\x84\x9b\x43\xc7\x2d\x62\x7d\
+\x4d\x21\xf2\xb7\x29\x59\x38\x71\x8d\xb3\x70\xa4\xc4\x4a\x01\xac\
+\xe3\x9c\x53\xdb\xb6\x89\x6d\xdb\x1a\x9c\xae\x4d\x9b\x83\xc1\x20\
+\xb9\x70\xe1\x82\xb6\x75\xeb\xd6\x80\xd4\xec\x77\x8d\x04\x95\xab\
+\xe9\x74\x41\x9e\x5b\x4e\xd6\x70\x38\x8c\xc2\xc2\x42\xf4\xf6\xf6\
+\x02\x70\x14\x7d\xfd\x4a\x3e\x93\xa9\xfa\xf3\x1b\x00\xc0\x79\xff\
+\x1f\x7d\xf4\x11\xf9\xf9\xcf\x7f\x4e\xd2\xe9\xb4\x34\x32\x94\x52\
+\x9a\x10\x42\xd4\x98\xa6\x59\x04\xa7\xd3\x30\x81\x33\xf9\x6f\xeb\
+\x96\x6f\xba\x0c\x00\x05\x20\x76\xef\xde\x8d\xde\xde\x5e\xec\xd9\
+\xb3\x47\xaf\xab\xab\x9b\x6b\x9a\x66\x35\x80\x86\xf2\xf2\xf2\x45\
+\x91\x48\x24\xbc\x6d\xdb\x36\xbe\x66\xcd\x1a\xe2\xe6\x86\xc9\x4c\
+\xeb\xd6\x73\x25\x70\xce\xe5\x35\x0a\x42\x88\xb0\x6d\x5b\x74\x74\
+\x74\x90\x8b\x17\x2f\x92\xe6\xe6\x66\xd2\xd1\xd1\xc1\x83\xc1\x20\
+\x01\x40\x2c\xcb\xa2\xc2\x91\xe8\xee\x80\xd3\xe5\xa5\x19\x40\x07\
+\x1c\x03\x00\x38\x83\xe0\x4e\x33\x00\x12\xd2\xc3\x13\x70\xab\x39\
+\x01\xb4\xc1\xc9\x64\xc4\x7c\xc7\x51\x45\x51\x0a\x14\x45\xf1\x44\
+\x31\x27\x6a\x9d\x75\x2b\xe0\x1f\x5f\xf1\x78\xdc\x8b\x0d\xa4\xd3\
+\x69\xa4\xd3\x69\xaf\x51\xec\x64\xbd\x01\x7f\xe1\x8f\x10\x02\xd9\
+\x6c\x16\xdd\xdd\xdd\xa2\xaf\x6f\xac\x9c\xc3\xcd\x0a\x24\x09\x21\
+\x97\x84\x10\x19\x38\x25\xbf\x32\x08\x98\x9f\x05\xba\xa5\x98\x0e\
+\x03\x20\x0b\x7c\xd8\xee\xdd\xbb\x51\x5a\x5a\x8a\xed\xdb\xb7\x87\
+\xbb\xbb\xbb\xd7\x08\x21\x1e\xab\xa9\xa9\x69\x78\xe0\x81\x07\xe6\
+\x6d\xd8\xb0\x41\xa9\xaf\xaf\xb7\x2b\x2a\x2a\xa4\x1b\x49\x00\x90\
+\x99\x9e\xf2\xf3\xb3\xc2\x14\x45\xe1\x84\x10\x3b\x97\xcb\x89\x23\
+\x47\x8e\x28\xaf\xbe\xfa\xaa\xd2\xdc\xdc\x8c\xf6\xf6\x76\x96\xc9\
+\x64\x14\x59\x35\x26\x84\x30\x18\x63\x47\x84\x10\xaf\x01\x68\x82\
+\x53\x51\x97\xc1\xf8\x7d\xff\x9d\x10\xfd\x9f\x0c\xc2\x18\x6b\xc0\
+\xea\x4d\x36\x19\x85\xbf\x52\x1b\xed\xe9\x2e\x17\x9e\x68\xbb\xa6\
+\x28\x8a\xa7\xdc\x6b\x18\x86\xd7\x3b\xc0\x5f\xcc\x73\x2d\xf8\xef\
+\xcf\xd7\xde\xcd\x9f\x32\x05\x1c\xd6\xeb\x79\x55\x55\xf7\xb9\x1e\
+\xc0\xbd\x00\x56\xc1\x21\x7d\xc9\x1a\x8b\xdb\xf2\xfe\xa7\xd3\x03\
+\xe0\x5f\xfe\xf2\x97\x99\xa6\x69\x0c\x00\x92\xc9\x64\x25\x80\x07\
+\x0d\xc3\xa8\xad\xa9\xa9\xc1\x13\x4f\x3c\x21\x28\xa5\x16\x00\xdd\
+\x34\x4d\xca\x18\x23\xc1\x60\x70\x46\x07\xfd\x24\x7c\x01\x2b\x85\
+\x52\xaa\x10\xa7\xd3\x2b\xde\x7d\xf7\x5d\xb4\xb5\xb5\x49\x4b\x4e\
+\x83\xc1\x20\x85\x63\x00\x88\x10\xa2\x0d\x0e\xe5\xf7\xa2\xef\x54\
+\xd2\x0b\xb8\x25\xb5\xdf\xd3\x00\xff\xaa\x25\xbd\x81\x18\x9c\x9a\
+\x86\x3e\x38\x4a\x37\x1a\x00\x08\x21\x0c\x21\x84\x9a\xcd\x66\x49\
+\x4f\x4f\x0f\xfa\xfb\xfb\x49\x2c\x16\x83\xaa\xaa\x32\xd7\x3e\xad\
+\x17\xea\xe7\x69\xc8\x76\x6a\xfd\xfd\xfd\x28\x2c\x2c\xc4\xd0\xd0\
+\x10\xaa\xaa\xaa\x3c\xbe\xbe\xff\x33\x93\x85\xcc\x2e\xc4\x62\x31\
+\x14\x17\x17\x8b\x82\x82\x02\x31\x32\x32\x22\x8d\x08\xa7\x94\xf6\
+\xd7\xd4\xd4\xb4\x34\x37\x37\x0f\x61\xac\xe1\x27\x85\xe3\x35\x19\
+\x57\x39\xf5\xb4\x62\x3a\x0d\x00\xf1\xed\x91\x0d\x38\x6e\x61\xc1\
+\xf0\xf0\xb0\x3f\x1e\xc0\x01\x08\x29\xa1\x34\xdd\x7b\xc0\xa9\x82\
+\x2f\xcf\x0d\xc0\xe9\x88\xa3\xaa\xaa\xd7\x08\x02\xee\x7d\xf9\x68\
+\xae\x0a\x9c\x17\x3d\x9c\x77\xaa\x99\x7f\xb3\x57\x87\xac\x59\x00\
+\x9c\xb1\xa4\xc2\xa9\x69\x3f\x08\x27\x25\xb8\x80\x31\x76\x2f\x1c\
+\x8a\x30\x21\x84\xb0\x74\x3a\x6d\x1e\x3e\x7c\xd8\x0a\x85\x42\x58\
+\xb8\x70\xa1\xb2\x74\xe9\xd2\xd0\x9c\x39\x73\x74\x5f\xb9\xb0\x70\
+\xc7\xcd\x4d\x3f\x1b\x3f\x4f\x43\x08\x21\x38\xe7\xe8\xe9\xe9\xc1\
+\x91\x23\x47\x70\xe9\xd2\x25\xd2\xdc\xdc\x8c\x55\xab\x56\xe1\xfe\
+\xfb\xef\xc7\xf2\xe5\xcb\x51\x5c\x5c\x3c\x4e\xaf\x60\x32\xd4\xf3\
+\x7c\x2f\xa1\xa4\xa4\x04\xd1\x68\x54\xc6\x05\x38\x77\x82\x3f\x36\
+\x21\x24\xd8\xd1\xd1\x51\xa2\x69\x5a\x29\x21\x24\x21\x84\xa0\x42\
+\x88\xac\xa2\x28\x03\x79\xfd\x17\xee\x0a\x2a\xb0\x80\x9b\x13\xf6\
+\x3d\x20\x13\x40\x92\x10\x52\xe8\xf2\xe0\x09\x21\x84\x02\x4e\xeb\
+\xae\x99\xde\x59\xc6\x8f\x89\xe2\x14\xba\xae\x23\x1e\x8f\x63\x68\
+\x68\x08\x70\x5f\xa2\xef\xfe\x39\x9c\xc8\x7f\x1c\x4e\x10\x50\xe2\
+\x4e\x5c\xf5\xfd\xc8\xa7\x07\x73\x38\x2b\xff\xbb\x00\x3e\xe1\x9c\
+\x6f\x15\x42\x14\xc1\x91\x18\xd7\x28\xa5\x64\x68\x68\xc8\x7c\xe7\
+\x9d\x77\x8c\xc3\x87\x0f\x5b\xbb\x76\xed\xd2\xe2\xf1\xb8\x5a\x51\
+\x51\xa1\xcb\x67\x3a\x95\x7a\x01\x7e\x9e\x86\x7b\x3e\xd1\xd7\xd7\
+\x87\xd7\x5f\x7f\x9d\x7c\xf8\xe1\x87\x28\x29\x29\xc1\xb3\xcf\x3e\
+\x8b\x9d\x3b\x77\x22\x1a\x8d\x7a\x06\x40\x7e\xff\x8d\x64\xa1\x6c\
+\xdb\x86\x69\x9a\xd4\x34\x4d\xe2\xf2\x21\xb8\xa2\x28\xd4\xb6\xed\
+\xba\x5c\x2e\xb7\x0d\x40\xa9\xaa\xaa\x0b\x5c\x4d\x81\x2c\x26\x0e\
+\x02\xde\x91\x54\x60\xef\x49\x2d\x5d\xba\x94\x9f\x3e\x7d\x1a\x0f\
+\x3e\xf8\x60\xc4\x34\xcd\xc2\x63\xc7\x8e\x15\x17\x15\x15\x55\x2a\
+\x8a\x62\xce\x9f\x3f\x3f\x57\x58\x58\xa8\x24\x93\x49\x35\x91\x48\
+\x50\xb8\xc1\xbf\x99\x1e\xf1\x87\x4f\xb7\xd0\xb7\xb2\x0f\xc1\x29\
+\xe6\x31\x0c\xc3\x88\x07\x02\x81\xf2\x40\x20\x10\x64\x8c\x51\xdb\
+\xb6\x89\xcf\x53\x90\x26\x3e\x06\x67\xbf\x77\xcb\xaa\xbd\x6e\x01\
+\xf2\x09\x41\x06\xc6\x28\xc2\x45\x42\x08\xc7\x22\x3a\x9d\xba\x61\
+\x18\x06\xba\xbb\xbb\x45\x77\x77\x37\x4a\x4b\x4b\xf1\xc4\x13\x4f\
+\xc0\xfd\x3b\x80\x71\x01\xd6\x9b\xbf\xb0\xf1\x3c\x0d\x6f\xab\x71\
+\xf2\xe4\x49\x1c\x3f\x7e\x1c\x65\x65\x65\xf8\xee\x77\xbf\x0b\x97\
+\x9e\x0c\x00\xfe\xea\xc5\x6b\xe6\xfe\xdd\x63\x04\x63\x0c\xa9\x54\
+\x8a\x24\x93\x49\x9c\x3b\x77\x0e\x1d\x1d\x1d\xd4\xb6\x6d\x10\x42\
+\xa8\x5b\xec\xa3\x5b\x96\xb5\x5a\x08\xa1\x08\x21\x62\xa6\x69\x56\
+\xba\xcf\x2a\x00\x60\x21\x80\xf3\x70\x16\x06\xc9\x10\xf4\x2e\x01\
+\xd3\x6c\x0c\xa6\xd2\x00\x50\x38\xab\x1e\xfb\xbb\xbf\xfb\x3b\xf2\
+\xf2\xcb\x2f\x6b\x87\x0e\x1d\x5a\x40\x29\xbd\x5f\xd3\xb4\x65\xeb\
+\xd7\xaf\x5f\xb4\x6a\xd5\xaa\xc2\x9a\x9a\x1a\xb1\x6c\xd9\x32\xa1\
+\xeb\x3a\x4c\xd3\x54\xdd\x16\xce\x33\xba\xd2\xcf\x05\x07\xc0\x09\
+\x21\x9a\xef\x5a\x4f\xc2\x29\x86\xe9\xe8\xea\xea\x5a\x33\x3c\x3c\
+\xfc\x45\x42\x48\x9d\xac\x19\xb7\x1d\xdd\x32\x1b\x8e\x91\x18\x80\
+\x2b\x6d\x8e\xdb\xc4\xfb\x9e\x66\x4c\xf4\xf2\x3c\x0f\xc1\xf7\x6e\
+\x29\x5c\xfe\xbb\x69\x9a\xd4\xb2\xac\xcb\xb8\xde\x53\x15\x10\x9c\
+\x28\xf0\x17\x8b\xc5\x3c\x82\xcf\xd0\xd0\xd0\x38\x2e\xc0\x64\xbe\
+\xdb\x2f\xf9\x46\x08\xe1\x8a\xa2\x30\xcb\xb2\xc4\xf1\xe3\xc7\xe9\
+\x9e\x3d\x7b\xd4\xa6\xa6\x26\x72\xfc\xf8\x71\x2a\x3d\x0f\xa9\x0e\
+\x6c\xdb\xf6\x72\x21\x44\x18\x63\x71\x12\x0e\x27\x25\xfe\x28\x1c\
+\x2d\x8c\x43\x70\x44\x61\x06\x30\x16\x57\xc9\xef\x0b\x30\xe5\x98\
+\x6a\x03\x40\x29\xa5\x36\xe7\xdc\xfa\xb3\x3f\xfb\x33\xa2\xaa\x6a\
+\xb9\x10\x62\x57\x24\x12\xd9\x59\x5c\x5c\xac\x3e\xfc\xf0\xc3\xea\
+\xb2\x65\xcb\x2c\x77\x4f\x06\xc9\xfa\x93\x75\xd9\x33\x1c\xde\x8b\
+\xf0\x5d\x6b\x27\x80\x3d\x00\xce\xfd\xfd\xdf\xff\x3d\x1f\x1e\x1e\
+\xfe\x9c\x5b\xbb\xa0\x00\x80\x2b\xf4\xd8\x07\xa7\x10\xa4\x0d\x8e\
+\x9a\x8e\x9d\x77\xce\xbb\xc5\x08\x4c\x14\xc8\x4c\xc0\xed\xf5\xe0\
+\x9b\x8c\x2a\x5c\x0e\x7c\x2c\x16\xbb\x6c\xaf\x3f\x99\xc2\x9b\xc9\
+\x62\x22\x9e\xc6\xe8\xe8\x28\xdc\x36\x72\xa8\xaa\xaa\x1a\x57\x9f\
+\x0f\x8c\x71\x04\xae\x06\x19\x27\x70\x17\x2f\x25\x97\xcb\xe1\xcc\
+\x99\x33\x78\xf9\xe5\x97\x25\xfb\x8f\xc8\xa6\x28\x3e\xe2\x91\x0a\
+\x67\xa2\x4b\xef\x4f\xc0\x31\x00\x3b\xe1\xd4\x46\x10\x38\xb2\x60\
+\x5d\x18\x9b\xf0\x2a\xa6\x99\x28\x34\xd5\x5b\x00\x02\x00\xa1\x50\
+\x88\xbb\x81\x3d\x0b\x40\x59\x3a\x9d\x0e\x53\x4a\x65\x39\xa8\xc7\
+\x8e\xcb\x0f\xa6\xcd\x64\x30\xc6\x08\x5c\x1d\x39\x09\xc3\x30\x62\
+\xbf\xf8\xc5\x2f\xe6\x7f\xe7\x3b\xdf\x21\x00\xe6\x02\xd0\xf2\xe2\
+\x03\xfd\x70\x94\x7e\xf6\xc1\x49\xff\xc9\xd4\x9f\x5f\x5d\xe7\xce\
+\x78\x00\x93\x07\xc1\x58\xe7\xe2\x20\xc6\x2a\x07\x09\x9c\x72\x70\
+\xa2\xaa\xaa\xa6\x28\x0a\x91\xb2\x6e\x53\x2d\x14\xca\x39\x17\xd2\
+\x90\x50\x4a\x61\xdb\xb6\xe8\xe9\xe9\x19\xed\xee\xee\xce\x36\x37\
+\x37\xa3\xa2\xa2\x22\xf4\xf8\xe3\x8f\x47\xaa\xab\xab\xc9\x9c\x39\
+\x73\x90\xcd\x66\x41\x29\x15\x9a\xa6\x91\xc9\xc4\x1f\x7c\xc6\x8c\
+\x00\x20\xd1\x68\x14\x96\x65\xa1\xad\xad\xcd\x4b\x2b\x02\x10\xaa\
+\xaa\x76\x03\x38\xcf\x18\xcb\x02\x98\x47\x29\x5d\x50\x50\x50\xa0\
+\xd4\xd5\xd5\xa9\x25\x25\x25\x22\x93\xc9\xd0\xf3\xe7\xcf\x07\xba\
+\xbb\xbb\x4b\x01\xc4\x18\x63\x69\x4a\x29\xf3\x9d\x3f\xbf\xe8\x6a\
+\xca\x31\xdd\x49\xf7\xac\xfb\x83\x6c\x36\x8b\x4c\x26\x83\x44\x22\
+\x31\xcd\x5f\x39\x3d\x10\x42\x50\xc6\x18\xf5\x1b\x80\x93\x27\x4f\
+\x2e\x7b\xed\xb5\xd7\xfe\x10\x4e\xda\xab\x0c\x0e\x03\xce\x6f\xd4\
+\x7a\xe0\x48\x7e\xbd\x0d\xc7\xb5\xcb\x62\x8c\xf4\x21\xcb\x7e\xef\
+\x36\x03\xe0\x17\x15\xb5\x7c\x3f\x0a\xdc\xc0\x28\x63\x8c\x73\xce\
+\x15\xd9\x3e\xcc\xb2\x2c\x4f\xa5\xf7\xa6\xbf\xdc\x95\x25\x73\x57\
+\x72\xe2\x4a\xce\xf1\xc3\x87\x0f\x0f\xbf\xfe\xfa\xeb\x7d\xc3\xc3\
+\xc3\x58\xb4\x68\x51\xe9\x53\x4f\x3d\x15\x2a\x2a\x2a\x52\xe6\xcd\
+\x9b\x07\x47\xa4\xc9\x89\x4a\xdf\xe8\x56\x54\x6a\x3f\x0c\x0f\x0f\
+\xcb\x67\x20\x34\x4d\x3b\x1b\x0e\x87\x5f\xec\xeb\xeb\xeb\xd6\x34\
+\xed\x41\x4a\xe9\x77\xe6\xce\x9d\x1b\x7a\xea\xa9\xa7\xc8\xba\x75\
+\xeb\x70\xe9\xd2\x25\xbc\xf8\xe2\x8b\x18\x18\x18\x00\x80\x6c\x34\
+\x1a\xcd\x64\x32\x19\x8f\x53\x70\x2b\x30\x95\x49\x77\x01\x40\xfc\
+\xd5\x5f\xfd\x15\xcd\x66\xb3\xfa\xc3\x0f\x3f\x1c\x0e\x85\x42\x65\
+\x91\x48\xc4\x2a\x2d\x2d\x65\xb1\x58\x8c\xbb\x82\x98\x9e\xa7\x70\
+\x3b\xd5\x60\xae\x17\x42\x08\x49\x58\xf2\x30\x38\x38\x58\x9b\xcb\
+\xe5\x1e\x55\x14\xe5\x4b\x94\xd2\xed\x70\x82\x5e\xfe\x43\x92\x00\
+\xce\xc0\x29\xfd\xed\x87\x33\x11\xfc\x56\xfd\x6e\x9b\xfc\x12\xd2\
+\xcd\x25\x70\xbc\x80\x20\x1c\xb7\x9f\xc0\xd1\x43\xe4\x72\xd5\x0f\
+\x06\x83\x08\x06\x83\x44\xd3\xb4\x29\x73\xfd\xa5\x67\xe9\xf7\x00\
+\x4e\x9e\x3c\x69\x3d\xff\xfc\xf3\x99\x37\xdf\x7c\x33\x53\x58\x58\
+\x68\x3d\xf2\xc8\x23\x62\xf3\xe6\xcd\x98\x3b\x77\xee\xb8\x15\x7f\
+\x32\x63\xd2\xe7\xe5\xd9\x00\x32\x99\x4c\x66\xc4\xb2\xac\x54\x41\
+\x41\x41\xc6\x67\xc8\x28\x21\xe4\xd2\x03\x0f\x3c\xf0\x3b\x00\xbf\
+\xb6\x2c\xeb\xe5\x5c\x2e\xf7\x69\x20\x10\x30\xd7\xad\x5b\xc7\x1f\
+\x7e\xf8\x61\xb2\x7d\xfb\x76\x51\x5a\x5a\xca\x0d\xc3\x48\x1b\x86\
+\xa1\x26\x93\xc9\xda\x3d\x7b\xf6\x84\x5c\xea\xb4\x2c\xa3\x9f\xd1\
+\x41\x40\x49\xfe\x60\x7f\xf4\x47\x7f\x84\x5c\x2e\x47\xfe\xc7\xff\
+\xf8\x1f\xc5\xff\xf0\x0f\xff\xb0\x3c\x93\xc9\x2c\x5a\xb5\x6a\xd5\
+\xb2\x45\x8b\x16\x95\x97\x94\x94\x58\xeb\xd7\xaf\x27\x91\x48\x44\
+\x37\x4d\x53\x51\x14\x85\x48\xba\xe5\x9d\x62\x00\x26\x82\x8c\x5d\
+\xa8\xaa\x2a\x79\x0c\xf9\xcf\xd3\xc6\xf8\xb6\x5e\xc0\x9d\x55\xf8\
+\x73\x3d\x98\xe8\xbe\x74\xb8\x1a\x01\xbe\x49\x23\xb7\x3f\x42\xd7\
+\x75\x92\xef\x11\x4e\x46\x7e\xeb\x5a\xe0\x9c\x13\x19\x67\x72\x75\
+\xf9\xc9\xc0\xc0\x40\x38\x93\xc9\x14\xb9\x87\x84\xdd\xf2\xec\x71\
+\x9f\xb9\xd6\x69\xdd\xeb\x56\x7c\x5e\x42\x0b\x80\x03\xba\xae\x0f\
+\x0e\x0c\x0c\x54\x65\xb3\xd9\xf5\xba\xae\xd7\x48\xa2\x91\x6d\xdb\
+\xa3\xbf\xfa\xd5\xaf\x2e\xb9\xc7\xee\x05\xf0\xbe\x61\x18\xd1\x92\
+\x92\x92\x1a\x00\x89\x82\x82\x02\x98\xa6\x29\xf7\xfb\x8b\x00\x3c\
+\xf3\xcc\x33\xcf\x34\x07\x02\x01\xa9\x17\x91\x4f\xb2\x9a\x72\xb7\
+\x60\x2a\x0c\x80\x0a\x80\xfd\xe8\x47\x3f\x12\x4d\x4d\x4d\xe2\x85\
+\x17\x5e\x28\x1c\x1c\x1c\xdc\x26\x84\x78\x2a\x1e\x8f\x17\xef\xda\
+\xb5\xab\x70\xc3\x86\x0d\x5a\x61\x61\x21\x0b\x87\xc3\x10\x42\x28\
+\xf9\x75\xd9\x77\x2a\xa4\xfa\x8f\x8c\x2a\xbb\x11\x7f\x7f\x54\x5b\
+\x85\x8f\x16\xeb\xe2\x4e\x65\xfd\x5d\x0b\x13\xdd\x93\xdc\x0e\x4c\
+\x34\xa9\xe5\x76\xe0\xb2\x0f\xdd\xec\x98\x90\xae\x84\x34\x00\x8c\
+\x31\x4a\x29\x2d\x0c\x87\xc3\x51\x57\xfb\x4f\xcb\xdb\xce\x4d\xc6\
+\xfb\x90\x59\x20\xbf\x01\x68\x03\xf0\xdb\x5f\xfe\xf2\x97\x17\x7e\
+\xf3\x9b\xdf\xac\xef\xe9\xe9\x69\x10\x42\xd4\xc8\x0f\x58\x96\x15\
+\x78\xea\xa9\xa7\xca\xe1\x50\xbf\x6d\x00\x8d\xba\xae\x2f\xe7\x9c\
+\x17\x02\x28\x48\x26\x93\x8a\x65\x59\xb2\x9c\x7a\x15\x80\xba\x54\
+\x2a\xd5\xa4\x69\xda\x2f\xe0\xa4\x06\x33\x18\xa3\x14\xcb\x8c\xc0\
+\x94\x8e\x9d\xa9\xf2\x00\x10\x08\x04\x6c\x4a\xa9\x6d\x3a\xb3\xa1\
+\x12\xc0\x3d\xb6\x6d\xa3\xb6\xb6\x16\x75\x75\x75\x72\x4f\x08\xc3\
+\x30\xbc\xfe\xf4\x77\xea\xe4\xf7\x0d\x66\x0e\x40\xb6\x28\x92\xaa\
+\x47\x52\xdd\x07\x70\x5e\x5a\x08\xce\x73\xbe\x1b\xf7\xfb\x7e\xe4\
+\xd3\x82\x05\x1c\x9e\xc4\x29\x00\xc5\x42\x88\x02\xce\x79\x02\x8e\
+\x6b\x4c\x85\x10\x18\x1a\x1a\xb2\x1b\x1b\x1b\xd9\xdc\xb9\x73\x45\
+\x34\x1a\xa5\xd1\x68\x54\xa5\x0e\x65\xd0\x39\xe1\x4d\x32\x43\x7d\
+\xba\xfc\x24\x1c\x0e\xeb\xaa\xaa\xea\xb6\x6d\x23\x99\x4c\x62\x70\
+\x70\x10\x89\x44\x62\xd2\xd9\x27\xb9\xad\x90\x93\x5f\xb8\x7d\x1f\
+\xfe\xe5\x5f\xfe\x05\xdf\xfe\xf6\xb7\x01\x37\x0b\xe6\xd2\xd9\x39\
+\x00\x61\x9a\x66\xf9\x9e\x3d\x7b\xb6\x45\x22\x91\xa3\x0f\x3d\xf4\
+\x90\x6e\x9a\x66\xbc\xa1\xa1\x01\x81\x40\x00\xa6\x69\xc2\xb2\x2c\
+\x31\x6f\xde\x3c\x51\x5f\x5f\xaf\xa4\x52\xa9\xc2\xe1\xe1\xe1\x42\
+\xdb\xb6\x23\x42\x88\x37\xe0\x90\xe6\xdc\xa1\x35\x7d\x1d\xa1\xa7\
+\xc2\x00\x78\x6f\xc8\x7d\x59\x49\x38\xf9\x6e\x8c\x8c\x8c\x48\x22\
+\x86\xb7\xea\xdd\x29\x51\xff\x2b\xc1\x5f\x4f\xee\x0a\x7c\xfa\xa3\
+\xfa\xc0\xd8\xaa\xc7\xe0\xec\xf9\x6f\x8b\xd8\xe3\x6d\x80\xbf\x59\
+\xa9\x5c\xad\x2e\x02\x78\x05\xc0\x29\x21\xc4\x46\xc6\xd8\xfd\x84\
+\x90\x12\x45\x51\x08\xe7\x1c\xed\xed\xed\xa3\x6f\xbc\xf1\xc6\xe8\
+\xf9\xf3\xe7\xd9\xc6\x8d\x1b\x43\xeb\xd7\xaf\x2f\x28\x28\x28\xd0\
+\xe5\xa4\xb7\x6d\x5b\x48\x9e\xc8\xf5\x60\xa2\xa2\x1f\x45\x51\x3c\
+\xaa\x76\x26\x93\xf1\xe2\x03\x72\x32\x5f\x6b\x5c\xba\x25\xcb\x84\
+\x52\xea\x79\x7e\x8d\x8d\x8d\x35\xbf\xf9\xcd\x6f\x1e\x81\xc3\xed\
+\x9f\x07\xa0\x04\x80\xad\x28\x4a\x86\x52\x9a\xe3\x9c\x97\x8c\x8c\
+\x8c\x3c\xa6\xeb\xfa\xe6\xf2\xf2\x72\x3c\xfe\xf8\xe3\x73\x4b\x4b\
+\x4b\xeb\x2a\x2a\x2a\x62\x84\x10\x52\x52\x52\x22\x1e\x7b\xec\x31\
+\xbb\xba\xba\x5a\xdf\xbf\x7f\x3f\xf6\xec\xd9\x83\x81\x81\x01\x22\
+\x84\xc8\xc2\xc9\x22\x48\x1e\xc1\xb4\x6d\x1b\x6f\xd6\x00\x78\x56\
+\xdf\xc7\xba\x2a\x80\xe3\xee\x18\xc1\x60\x30\xe8\x2a\xac\x7a\x9e\
+\xc2\x9d\x14\xf8\x9b\x08\xfe\x81\xe3\xd2\x39\xfd\xa3\xd3\xd3\x3e\
+\xf4\xfd\x7b\x37\xb1\xfe\xae\x06\xff\xea\x2f\x33\x1d\x1d\x70\x18\
+\x81\x1f\x33\xc6\x04\x80\x7b\x09\x21\x73\xe4\xfe\xfc\xd2\xa5\x4b\
+\x46\x6f\x6f\xef\xc8\xde\xbd\x7b\x6d\x00\x58\xba\x74\x69\xb4\xb0\
+\xb0\xd0\x3b\xa1\x24\xdc\x5c\x2f\xf2\xc7\x97\x69\x9a\x30\x4d\x13\
+\xa1\x50\x08\x42\x08\x8f\xab\xef\x5f\xfd\x27\xc1\xf9\xf7\xf4\x0a\
+\x08\x21\x50\x55\x15\xfd\xfd\xfd\x0b\x0c\xc3\x90\x02\x02\x52\xc5\
+\x3a\xab\x69\xda\x45\xd3\x34\x07\x00\x68\xb6\x6d\x6f\x0c\x04\x02\
+\x25\x94\x52\x32\x7f\xfe\x7c\x65\xe1\xc2\x85\x54\x55\x55\x05\x00\
+\x2d\x2d\x2d\x65\x3b\x77\xee\xe4\xf7\xdc\x73\x0f\x00\xa7\x7d\x5c\
+\x6f\x6f\xef\x30\x63\x4c\xf6\x8c\xe4\xbe\x05\x74\x5a\xc8\x40\x37\
+\x6a\x00\x28\x00\xf1\xbd\xef\x7d\x4f\x9c\x3e\x7d\x9a\xbf\xf8\xe2\
+\x8b\x4a\x49\x49\x49\xa5\x65\x59\xb5\xa5\xa5\xa5\xf5\xf3\xe6\xcd\
+\xab\x8c\x46\xa3\xc6\x9a\x35\x6b\x90\x48\x24\xb4\x5c\x2e\x47\x54\
+\x55\xa5\x92\x93\x7d\x27\x54\xfc\x4d\x04\xb9\x4a\xc8\xeb\x4f\x24\
+\x12\xe3\x7a\xc7\xc3\xe5\x37\x60\xcc\x28\x24\x30\xb1\xfa\xcf\xdd\
+\x0e\xaf\x0c\xd6\xfd\x91\xf4\x60\x13\x18\x9b\x6c\x8c\x31\x9a\xcd\
+\x66\xb5\x6c\x36\xab\x5c\xba\x74\x49\xcb\xe5\x72\xe3\x9e\xcd\xf5\
+\x78\x8b\x72\x15\xf7\x1b\xe8\xae\xae\x2e\xb4\xb6\xb6\xa2\xaf\xaf\
+\x0f\xa9\x54\x4a\xdc\x77\xdf\x7d\x22\x16\x8b\x61\xe9\xd2\xa5\x44\
+\xd3\x34\x22\x69\xc7\xd7\xcb\x41\xf0\xbd\x7f\x2d\x12\x89\x68\x81\
+\x40\xc0\xf3\x0a\x01\x0c\xeb\xba\x7e\xd4\x30\x8c\x26\xce\xf9\x7c\
+\x00\x4b\x54\x55\x8d\xc6\xe3\x71\x54\x55\x55\xe5\xeb\x0c\x10\x00\
+\xa4\xb4\xb4\x14\x95\x95\x95\x56\x38\x1c\xb6\x29\xa5\x54\x08\xb1\
+\x44\x08\xf1\xf8\xc2\x85\x0b\x3b\x72\xb9\x5c\xdb\xb9\x73\xe7\x06\
+\x31\x66\x00\xf2\x3d\xce\x9b\xc2\x8d\x18\x00\xaf\xde\xff\xfb\xdf\
+\xff\xbe\x80\x53\xe9\xa4\xf7\xf6\xf6\xde\x0b\xe0\xc9\x79\xf3\xe6\
+\x2d\xdc\xba\x75\x6b\xf5\x96\x2d\x5b\xc2\xd5\xd5\xd5\xdc\x4d\xb3\
+\x48\xc9\xa7\x1b\xce\xb3\xde\x6e\x4c\x34\x18\x03\x81\x80\x7f\x15\
+\xf1\x0e\xf0\xdd\x5f\x00\x13\x0b\x5d\xde\x79\x0f\xe0\xe6\x21\x9b\
+\x89\xf8\x11\xc0\x58\x7a\x50\x73\xd9\x72\x7e\x4c\xfa\x39\xc9\x6a\
+\x52\xb9\xb2\x13\x42\x70\xf6\xec\x59\xbc\xf0\xc2\x0b\x38\x7f\xfe\
+\x3c\xca\xca\xca\xc8\x17\xbe\xf0\x05\xd4\xd7\xd7\xa3\xba\xba\x9a\
+\xe8\xba\xee\xf5\x25\x90\xd9\x9c\xab\x8d\xcb\x89\xb6\x09\xb2\x03\
+\x94\x65\x59\xf2\x6f\x4c\x51\x94\x81\x70\x38\x7c\xd0\x34\xcd\xfd\
+\x42\x88\xe5\x84\x90\xd5\xaa\xaa\x16\xba\xcc\x57\xc4\x62\x31\xc0\
+\x2d\x17\xc7\x58\x10\x5d\xea\x24\x10\x55\x55\x4b\x19\x63\x3b\x19\
+\x63\x4b\x2f\x5e\xbc\x78\x10\xc0\xcb\x70\x38\x24\x92\x3d\xe8\xef\
+\x1c\x75\xd3\xb8\x19\x0f\x80\xab\xaa\xca\x35\x4d\x13\x00\x54\xc6\
+\x58\x1d\x80\x9d\xaa\xaa\xd6\xd4\xd6\xd6\xe2\x91\x47\x1e\x01\xa5\
+\x54\xb6\x8d\x22\xb6\x6d\x7b\xb9\xff\x3b\x11\x72\xa5\xf0\xeb\xfe\
+\xb7\xb7\xb7\xfb\x9b\x48\xc8\x0a\x40\xee\x66\x03\x6c\x38\xd1\xdf\
+\xfc\x2e\x13\x77\x6b\x16\xc0\x0f\xaf\x70\xca\xfd\x89\xc2\xd9\x1a\
+\x2a\xc0\x98\x31\x25\x84\x04\x08\x21\x7a\x34\x1a\x25\xe1\x70\xf8\
+\xb2\x09\x78\x3d\x0b\x85\xbf\xf0\x47\x8e\xb1\x4b\x97\x2e\xe1\x9d\
+\x77\xde\x41\x6b\x6b\x2b\x9e\x78\xe2\x09\xdc\x77\xdf\x7d\x64\xe9\
+\xd2\xa5\xde\x67\x0c\xc3\xf0\xa4\xc2\x27\x9b\xfb\xf7\xbf\xff\x4b\
+\x97\x2e\xd9\xa3\xa3\xa3\x26\xe7\x3c\x08\xb7\x8d\x3a\xe7\x1c\x91\
+\x48\xa4\xa5\xa3\xa3\xe3\x10\x63\xac\x0f\xc0\xe6\xd1\xd1\xd1\x45\
+\xc9\x64\x52\xe9\xef\xef\xa7\x25\x25\x25\x26\xc6\x82\x7a\x84\x73\
+\xae\x8c\x8c\x8c\x60\x60\x60\x00\xa9\x54\x8a\x98\xa6\x19\x03\xb0\
+\x14\xc0\x52\x37\x43\xf0\x21\xc6\x8f\x19\xb9\xad\x9c\x12\xdc\xa8\
+\x01\x70\x58\x10\xce\xa4\xa6\x84\x10\x4d\x55\xd5\x28\x80\xa2\x60\
+\x30\x88\x82\x82\x02\xaf\xfc\x52\x7e\xe0\x4e\x0c\xfe\xf9\xeb\xc9\
+\xe5\x20\x49\xa5\x52\x38\x7e\xfc\x38\xce\x9c\x39\x83\xe3\xc7\x8f\
+\x8b\x8e\x8e\x0e\x4e\x08\x51\x28\xa5\x94\x31\x46\x18\x63\x29\x21\
+\xc4\x71\x38\x04\xa0\xe3\x70\xf6\xc1\xfe\x3c\xee\xdd\xa2\xfc\x33\
+\x19\x48\x6f\x51\xc5\x04\xb4\x56\x97\x79\x47\x54\x55\x9d\x92\xd8\
+\x90\x5c\xa5\xa5\xcc\x57\x26\x93\xf1\x6b\x34\x5c\xc6\x42\x9d\x4c\
+\xe1\xcf\xd5\xde\xff\xc9\x93\x27\x79\x47\x47\x87\x4d\x08\x61\x84\
+\x10\xea\x1a\x87\x04\x63\x4c\x56\x7f\x5e\x00\x70\xd8\x30\x8c\x75\
+\xd9\x6c\xb6\x8a\x31\x16\xc5\xf8\xc0\xb9\xe0\x9c\x13\xcb\xb2\x30\
+\x32\x32\x82\xfe\xfe\xfe\x71\x17\x44\x08\x49\x70\xce\xf3\x15\x83\
+\xa6\xd4\x7b\xbc\x51\x03\xe0\xb7\xf0\xb2\xa4\x37\x27\x84\x48\x72\
+\xce\xa3\x6e\x2f\x3c\xf9\x77\xe7\x3f\xee\x40\xb7\x5f\x5a\x7b\xbf\
+\x3c\xf9\xf0\xf0\x30\xf6\xec\xd9\x83\x97\x5e\x7a\x09\xfd\xfd\xfd\
+\x7c\x78\x78\xd8\xa6\x94\x2a\x8a\xa2\x50\x37\xe7\x3c\x0c\xa7\x40\
+\xe8\x25\x38\xec\xbf\x61\xb8\xab\x03\x3e\x3b\x01\x41\x09\x99\x19\
+\x98\xb0\xe1\x09\xe7\x5c\x08\x21\x84\x69\x9a\xc4\xd7\x5c\xf4\x86\
+\xe1\x4f\x1f\x72\xce\xa1\xeb\x3a\x12\x89\x04\xfa\xfb\xfb\xa1\xaa\
+\xaa\xd7\x9a\x3d\xff\xf8\x2b\x5e\xfc\xb5\xdf\x3f\x1d\x1e\x1e\x56\
+\x29\xa5\x9a\xa2\x28\x30\x4d\x13\x8c\x31\x92\x4e\xa7\xfd\x82\x87\
+\x7d\x00\x3a\x03\x81\xc0\x1c\x4d\xd3\xe4\x38\x90\x5f\xcc\x55\x55\
+\xa5\xba\xae\x13\x4d\xd3\x64\xc9\xb2\x1f\x69\x38\x9e\xa4\x7f\x01\
+\x99\x39\x3c\x00\x77\x0b\xc0\x01\x0c\x9a\xa6\x39\x08\x60\x70\x70\
+\x70\xb0\x6c\x68\x68\x88\x0e\x0e\x0e\x2a\x45\x45\x45\xd7\x3a\xc5\
+\x8c\x87\x5f\x4b\x1e\x70\x6a\x1a\x5a\x5a\x5a\xa4\xee\x3f\x30\xa6\
+\xfb\x2f\xc9\x27\x59\x38\x0c\xb1\x63\xbe\xd3\xdc\x69\xba\xff\x53\
+\x09\x31\xc1\x8f\xb7\x02\x0a\x21\x98\x5b\x27\x0f\x4c\xc1\xea\x26\
+\x23\xf4\xaa\xaa\x4a\x89\x76\x01\x38\xa9\xbf\xa1\xa1\x21\x62\x9a\
+\xa6\x97\x16\x9c\x0c\xf2\xdf\x7f\x26\x93\x41\x4b\x4b\x8b\x38\x76\
+\xec\x98\x5c\xc9\x15\x45\x51\x38\xa5\x74\x88\x52\x9a\xe4\x9c\x37\
+\x65\x32\x99\xe2\xe2\xe2\xe2\x95\xf5\xf5\xf5\x54\xd7\xf5\x4a\x42\
+\x08\x16\x2d\x5a\x04\x97\x08\x47\xfd\xe7\x03\x1c\x49\xf2\xca\xca\
+\x4a\xac\x5d\xbb\x16\x8d\x8d\x8d\x62\x78\x78\x98\xa5\x52\x29\x2e\
+\x84\x18\x54\x14\x65\x10\x80\x29\xd3\x95\x53\x8d\x9b\xda\x02\x00\
+\xe3\x6e\x24\x03\x80\x27\x93\x49\x92\xcb\xe5\x3c\x32\x96\xfc\xe3\
+\x9d\xb8\x05\x98\x08\xfe\xbd\xe6\x95\x0e\xc1\x9d\xa9\xf0\x3b\xdd\
+\x90\xbc\x08\x59\x18\x34\xe5\xf5\xdf\xf9\x63\x2c\x18\x0c\x8a\x4c\
+\x26\xc3\x01\x20\x9d\x4e\x13\x37\xad\x48\xfc\x9e\xc2\x64\x21\xeb\
+\xfa\x4d\xd3\x14\xb6\x6d\x33\x8c\xf5\x44\x50\x01\x98\xba\xae\x1f\
+\xa4\x94\x7e\x64\x18\xc6\x20\x80\x44\x36\x9b\xfd\xc3\xe2\xe2\x62\
+\xed\xf1\xc7\x1f\xaf\xaa\xac\xac\xac\xad\xa8\xa8\x08\x14\x14\x14\
+\x50\x5f\x29\x31\x00\x10\xcb\xb2\xa0\xaa\x2a\xee\xb9\xe7\x1e\x7c\
+\xfb\xdb\xdf\x16\xa7\x4e\x9d\xc2\x9e\x3d\x7b\xe8\xfe\xfd\xfb\x85\
+\x69\x9a\x36\x21\x24\x2d\x33\x67\xae\x97\x34\xa3\xb6\x00\xfe\xb2\
+\xc5\x02\x00\xc1\xa2\xa2\x22\x35\x12\x89\xc8\x9e\x7e\x77\xf4\x16\
+\x00\xb8\xfc\xba\xa5\xf0\xa3\xab\xfb\x0f\xb8\xf7\xe8\x1b\x4c\x0a\
+\x1c\xc1\x07\xbf\xee\x3f\xf0\xd9\x5b\xf9\xf3\x21\xdd\xdf\x7c\x56\
+\xdb\x94\x91\x5c\xf2\xdf\xd5\xe8\xe8\xa8\x70\x3d\x00\x51\x50\x50\
+\x40\x83\xc1\xe0\x38\xd5\xe9\xc9\x8c\x49\x79\x8c\x8c\x01\x04\x02\
+\x01\x24\x12\x09\x16\x0c\x06\x89\x61\x18\xf2\x9e\x32\xa1\x50\xe8\
+\xe0\x3d\xf7\xdc\xf3\xd3\xb7\xde\x7a\x8b\x8f\x8e\x8e\x7e\x53\x08\
+\xb1\xdb\xb6\xed\x58\x75\x75\xb5\xb2\x6b\xd7\x2e\xa2\xaa\xaa\xe0\
+\x9c\x53\xcb\xb2\x3c\xbd\x41\xc6\x18\x65\x8c\x21\x18\x0c\x62\xe9\
+\xd2\xa5\x58\xb4\x68\x11\x59\xbc\x78\x31\xe9\xed\xed\x25\x87\x0f\
+\x1f\xa6\xa3\xa3\xa3\x21\x00\x09\xe9\xb1\xb8\x69\xc6\xdb\xb6\x05\
+\x90\x2f\x4a\xfc\xd1\x1f\xfd\x11\xaf\xa8\xa8\x10\x3f\xfe\xf1\x8f\
+\x4b\x34\x4d\xab\xed\xeb\xeb\xab\x5a\xba\x74\xe9\xca\x44\x22\x11\
+\xad\xad\xad\xe5\x75\x75\x75\xc4\xdd\xcf\xe4\x8b\x83\xde\xf1\xa0\
+\x94\x22\x10\x08\x20\x12\x89\x78\x7b\xc4\xfc\x43\xe0\xa4\xb7\x22\
+\x18\xeb\xf6\xfb\x59\x43\xfe\xcc\x22\x70\x28\xd1\x25\x18\xbf\xf2\
+\xdf\xd4\x60\x96\x41\x3f\x1f\x31\x0b\xa9\x54\x0a\xad\xad\xad\xbc\
+\xaf\xaf\x0f\x4d\x4d\x4d\x7c\xd1\xa2\x45\x58\xb0\x60\x01\xd9\xb0\
+\x61\x03\x12\x89\x04\xf2\x73\xff\x93\x5d\x98\xe4\x67\x4a\x4b\x4b\
+\x51\x58\x58\x28\x22\x91\x88\x60\x8c\x09\xdb\xb6\x05\x80\x5c\x34\
+\x1a\x6d\xdd\xbb\x77\x6f\x3b\x00\xd8\xb6\x6d\x00\x28\x37\x0c\x03\
+\x85\x85\x85\x32\xf7\x6f\x51\x4a\xfd\x3a\x91\xde\x3d\xc8\xaf\x50\
+\x14\x85\xd6\xd5\xd5\xa1\xb8\xb8\x98\xab\xaa\x4a\x08\x21\x73\x84\
+\x10\x9b\x83\xc1\xa0\xda\xd0\xd0\xd0\xd1\xd9\xd9\x79\xb1\xa7\xa7\
+\x47\xaa\x4a\x01\x53\xc0\x09\xb8\x1e\x03\xa0\x38\xcf\x81\x58\x3f\
+\xfa\xd1\x8f\x18\x00\xf1\xd7\x7f\xfd\xd7\xb5\x9c\xf3\x67\x02\x81\
+\xc0\xfa\x25\x4b\x96\x54\x3e\xfc\xf0\xc3\x89\xba\xba\x3a\x56\x53\
+\x53\x43\x34\x4d\x53\x2d\xcb\x52\x15\x45\x21\x93\xc9\xb3\xde\x29\
+\x90\x54\x60\x59\xf1\x35\x01\x5f\x5d\x52\x81\x2d\x38\x93\x7f\xca\
+\x23\xb7\x77\x28\x64\x37\xa4\x29\x83\x70\x45\x3f\x75\x5d\x97\xca\
+\xbf\xe8\xeb\xeb\x13\xaf\xbe\xfa\x2a\x3b\x70\xe0\x00\x57\x14\x85\
+\x6c\xdc\xb8\x91\xae\x5b\xb7\x8e\x96\x94\x94\x90\xd2\xd2\x52\x22\
+\x5d\x70\x19\x27\x98\x04\x03\x70\xdc\xff\x07\x02\x01\x10\x42\x64\
+\x2a\x90\x0b\x21\x18\x00\x4b\x55\x55\xbf\xa1\x37\x01\x27\x5e\xe4\
+\x17\x08\xc1\x04\x63\xc1\xf7\xfd\x0a\x00\x91\xcb\xe5\x04\x21\x84\
+\xa9\xaa\xaa\xa8\xaa\x5a\xcb\x18\x7b\x26\x97\xcb\xad\x3f\x7f\xfe\
+\xfc\x5b\xb9\x5c\xee\x15\x38\x8a\x41\xf2\xa2\x54\x8c\x8d\xb1\x1b\
+\xc2\xf5\x7a\x00\x14\x00\x82\xc1\xa0\x54\xfc\x99\x03\x60\x33\x21\
+\xe4\x81\x92\x92\x12\x6c\xdd\xba\x15\x35\x35\x35\x39\x79\x9c\x65\
+\x59\x54\xee\x5f\xee\x86\xc9\x2f\x21\x05\x1b\xae\x12\x0b\x90\xd1\
+\xfe\xcf\x6a\x2c\x20\x7f\x40\xca\xc2\xa0\x56\x38\xad\xc3\xa4\x2c\
+\xd8\x4d\x0d\x0a\x7f\x3c\x46\xae\xd0\xc3\xc3\xc3\xe4\xe3\x8f\x3f\
+\xd6\x7e\xf7\xbb\xdf\xa1\xa1\xa1\x01\x5f\xfb\xda\xd7\xb0\x6b\xd7\
+\x2e\xef\x33\xb9\x5c\xce\xf3\x46\x27\xe3\x95\xca\xe0\x9b\xcc\xfd\
+\xb7\xb6\xb6\xa2\xbf\xbf\x9f\xd8\xb6\x4d\x84\x10\x72\x4b\x13\x1f\
+\x1c\x1c\x5c\xb2\x65\xcb\x96\x9a\x4f\x3f\xfd\x94\x9b\xa6\x59\xc4\
+\x39\x1f\x2e\x2b\x2b\x8b\xb9\xa9\xf2\x71\xda\x88\x13\xcd\x05\xe1\
+\xf4\x8e\x20\x7d\x7d\x7d\x62\x78\x78\x98\x8f\x8e\x8e\x52\xcb\xb2\
+\x4a\x00\x94\x10\x42\x56\x59\x96\xd5\xcd\x18\x7b\x07\xe3\xc7\xd4\
+\x4d\x2b\x06\xdd\xc8\x16\xc0\x7f\x03\x1a\x80\x02\x42\x08\x42\xa1\
+\x10\x5c\x1e\xf7\x5d\x53\xf8\x33\x8b\x1b\x86\x3f\x67\x2d\x9b\x5f\
+\x9c\x81\x93\x1a\x6d\x20\x84\xac\x04\xb0\x04\x63\x29\x31\x21\x84\
+\x60\x72\x4f\x4c\x08\x21\x93\xed\x0b\x20\xc7\x98\xcc\xfd\x1b\x86\
+\xe1\xe5\xfe\x4d\xd3\x94\xed\xb9\x2f\x3b\xfe\xaa\x17\x3f\x56\x83\
+\x20\x28\xa5\x3c\x97\xcb\xe1\xec\xd9\xb3\xe4\xc4\x89\x13\xb4\xa9\
+\xa9\x09\xa7\x4e\x9d\x52\x2c\xcb\x22\x6e\x9c\x0b\x8c\xb1\x70\x3a\
+\x9d\xde\xb9\x6f\xdf\x3e\xbb\xa2\xa2\xc2\xda\xb4\x69\xd3\x9a\x92\
+\x92\x12\xb2\x78\xf1\x62\x36\x77\xee\x5c\xb9\xef\xa7\x13\x95\xc0\
+\xe7\x5f\x7f\x2e\x97\x43\x32\x99\x14\x7e\x75\x62\x38\x5c\x9b\x28\
+\x2e\x0f\x9c\xde\xf4\xaa\x7a\x3d\x06\x60\xa2\x89\x6d\x01\x48\x0b\
+\x21\x60\x18\x06\x92\xc9\x24\x62\xb1\xd8\x44\x86\x62\x16\x9f\x1d\
+\xc8\x2d\x90\xc0\x18\x09\xc8\x82\x43\x8a\xba\x48\x29\x6d\xa0\x94\
+\x7e\x1d\x8e\x1c\xb6\x5f\x33\x90\xb9\xab\x20\x70\x1d\x03\x3b\x3f\
+\xf7\x2f\x83\xb4\x00\x10\x0e\x87\x91\x37\x91\x26\xe5\xf2\xcb\x6d\
+\x82\x8c\x13\xe4\x72\x39\x71\xec\xd8\x31\xf2\xfc\xf3\xcf\xa3\xa9\
+\xa9\x89\x0c\x0f\x0f\x2b\xb6\x6d\x93\x40\x20\x00\x00\xb0\x2c\x0b\
+\xa6\x69\xae\x11\x42\x94\xab\xaa\x6a\xaf\x58\xb1\x22\xf1\xd8\x63\
+\x8f\x45\x0b\x0b\x0b\x95\xc2\xc2\x42\x10\xa7\x7f\x24\x24\x15\x7e\
+\x22\x48\xe3\xa0\xeb\x3a\x34\x4d\xbb\xec\x22\x09\x21\x19\x5c\xee\
+\x51\xde\xf4\x0a\x7b\x43\x59\x00\xb7\xeb\x2d\x08\x21\x36\x21\x64\
+\x84\x10\x62\x9a\xa6\x49\x87\x87\x87\x15\x7f\x77\xd5\x59\x7c\x66\
+\xe1\x1f\x98\x92\xba\x3a\x0c\x60\x38\x1c\x0e\xa7\x85\x10\x3b\x31\
+\x26\x19\x06\x00\x08\x06\x83\xb4\xa0\xa0\x40\xb9\x81\xde\x90\x02\
+\x4e\x00\x0d\x8a\xa2\x60\xce\x9c\x39\x46\x49\x49\x49\x1f\x80\x11\
+\x21\x44\xc0\x34\xcd\xe2\x5c\x2e\x17\xf7\xe5\xfe\xfd\x24\xb6\x09\
+\xe1\xab\xfd\x27\x94\x52\x25\x1a\x8d\x62\x78\x78\x18\x47\x8f\x1e\
+\x85\xdb\xf4\x93\x00\x80\xa2\x28\x69\x42\xc8\x20\x00\x9b\x73\x3e\
+\x07\xc0\x3c\x4d\xd3\x50\x51\x51\x81\x15\x2b\x56\xc0\xbd\x6f\xc2\
+\x18\xbb\xa2\x06\x86\xdc\x86\xc8\xbf\x87\xc3\x61\xd4\xd7\xd7\xe3\
+\x9e\x7b\xee\x91\x44\x33\x66\x18\xc6\x08\x63\x2c\x03\x80\xcb\x34\
+\x20\x21\x64\x4a\xdc\xeb\xeb\x0e\xcd\xbb\xb5\xc9\xca\x9f\xfd\xd9\
+\x9f\xe9\xba\xae\xeb\x9a\xa6\x69\xba\xae\x2b\xaa\xaa\x5e\xd1\xba\
+\xcd\x62\x16\x12\x94\x52\xa6\x28\xca\xb8\x95\x8c\x10\x42\x74\x5d\
+\xd7\xe2\xf1\xf8\xb8\x63\x27\xe1\xae\x0b\x45\x51\xc6\x65\x59\xe6\
+\xcf\x9f\xdf\xdf\xd0\xd0\xf0\x26\x80\x1f\x32\xc6\x5e\x98\x33\x67\
+\x4e\x93\x3f\x06\x45\x29\x65\xae\x60\xc7\x95\x4f\x9a\x17\xa9\x97\
+\x5b\xdc\xbc\xeb\x11\xaa\xaa\x9e\x0b\x85\x42\xbf\x04\xf0\x63\x4a\
+\xe9\x7b\x9a\xa6\xc9\x15\x5c\x1e\x73\xd5\x00\x9d\xec\x3e\x04\x8c\
+\xc5\x95\x12\x89\x04\xb6\x6f\xdf\x8e\xef\x7e\xf7\xbb\x78\xf2\xc9\
+\x27\x51\x53\x53\x43\x5c\xba\xb0\x62\x9a\xa6\xf6\xe2\x8b\x2f\x4e\
+\x54\x54\x75\xc3\xb8\xee\x13\x51\x4a\x05\x00\xfe\x77\x7f\xf7\x77\
+\x36\x63\x8c\xbb\xfd\xdf\x15\x21\x84\x92\xaf\xb3\x36\x8b\x59\x20\
+\x6f\x02\x18\x86\x51\xcc\x18\x0b\xc3\xb7\x02\x0b\x21\x44\x2e\x97\
+\xb3\xdc\xb6\x6a\x1e\x26\x51\xa0\x23\xf2\x8d\x09\xe7\x3c\xbd\x76\
+\xed\xda\x93\x00\xde\x7f\xe4\x91\x47\x0e\x36\x34\x34\xf4\xfa\x2b\
+\x04\xdd\x8e\xce\x57\xb5\x2c\xf9\x41\x6b\xb9\x3f\x4f\x24\x12\x7e\
+\x8d\x7e\x02\xa0\xa5\xa6\xa6\xe6\x25\x00\x3f\x06\xf0\x2b\xc6\x58\
+\xa3\xbb\x87\x97\x5b\x8f\x89\x1a\xa3\x8c\xbb\x3f\xb9\x68\x4a\x03\
+\x50\x50\x50\x80\x4d\x9b\x36\xe1\x1b\xdf\xf8\x06\x1e\x7a\xe8\x21\
+\x5a\x59\x59\xa9\x0a\x21\x34\xcb\xb2\x08\x9c\x8e\xdb\x53\x1a\x5c\
+\xbe\xa1\x2d\x40\x28\x14\xe2\x96\x65\x81\x31\xd6\x0f\x20\x99\x4a\
+\xa5\xcc\x74\x3a\xad\xbb\x44\x05\x2f\x06\x30\x1b\x04\x9c\x85\x0f\
+\x0a\x00\x95\x73\x1e\x72\x17\x0c\x6f\x9f\xcd\x18\xe3\x97\x2e\x5d\
+\xea\x3b\x75\xea\x54\x86\x10\x42\x0a\x0b\x0b\x13\xe1\x70\xb8\x50\
+\xca\x83\xb9\x2b\xb2\x90\x81\x41\x7f\xfb\x30\x21\x04\xc9\xe5\x72\
+\x68\x6b\x6b\x43\x67\x67\x27\x46\x47\x47\x03\x8c\xb1\x39\x6d\x6d\
+\x6d\x75\x85\x85\x85\x55\xe1\x70\x38\xe2\xe7\x0b\x50\x4a\xc9\x15\
+\x04\x40\x85\x7b\x5e\xaf\xf5\x1b\xe7\x7c\xc0\xb2\xac\x8e\x9e\x9e\
+\x9e\xec\xc0\xc0\x40\x04\x40\x45\x28\x14\x2a\xf6\xb5\x01\x1f\x3a\
+\x74\xe8\xd0\x71\x45\x51\x72\x9c\xf3\xb7\x01\xec\x1c\x18\x18\x88\
+\x8d\x8c\x8c\x14\x8e\x8e\x8e\x06\x83\xc1\xa0\xff\x7b\xae\x9a\x0e\
+\xf6\x5f\x23\x00\x11\x0c\x06\x51\x5d\x5d\x8d\x48\x24\x22\x3f\x9b\
+\x05\x30\x10\x0a\x85\x98\x2f\xfb\x74\x4b\x83\x80\x13\x7d\xd9\x28\
+\x9c\x82\x05\xc3\x34\x4d\xdd\x17\xc0\xf1\xb8\xde\x57\xf8\xdc\xdd\
+\x8c\xcf\x42\xb9\xef\x8d\x80\x03\xb0\x2c\xcb\xb2\x39\xe7\x4c\x08\
+\x21\x64\x3e\xde\xb2\x2c\x76\xe4\xc8\x91\x0e\x45\x51\xda\x36\x6e\
+\xdc\x48\x1e\x7a\xe8\xa1\x85\xf5\xf5\xf5\x05\xaa\xaa\x4a\x03\x20\
+\xdc\x32\x6b\xd9\x71\x09\x8a\xa2\x80\x73\x4e\x6c\xdb\x56\x33\x99\
+\x0c\xf6\xed\xdb\x87\x7f\xfd\xd7\x7f\x85\x61\x18\xc5\x5b\xb7\x6e\
+\x7d\xf8\xa1\x87\x1e\x5a\x15\x0c\x06\xa3\x00\xea\xe5\xea\xea\x1a\
+\x1c\x65\xa2\x0c\x03\x77\x2a\x93\xe0\x16\x76\x81\x10\x02\xd3\x34\
+\x3b\x9a\x9a\x9a\x3e\x78\xf3\xcd\x37\xfb\xde\x7b\xef\xbd\xf9\xbd\
+\xbd\xbd\xdb\x00\x14\x4b\x03\x41\x9c\xe6\xb6\xba\xaa\xaa\x39\x57\
+\x01\xa8\x35\x97\xcb\xf5\x51\x4a\xa3\xaa\xaa\x06\x31\x56\x05\x39\
+\x21\x07\xc0\x8f\x89\x3c\x84\x5c\x2e\xe7\x17\x4d\xb5\xe1\x32\x4b\
+\xa7\x72\x61\xbd\xde\x2c\x00\xfe\xea\xaf\xfe\x8a\x7e\xff\xfb\xdf\
+\x57\x9f\x78\xe2\x09\xf5\xdd\x77\xdf\xad\xa4\x94\x06\xc2\xe1\x30\
+\x9b\x33\x67\x8e\x54\xc7\xf9\xac\x67\x01\xa6\x8c\xda\x7a\x97\x41\
+\x4e\x02\xc6\x18\xe3\xc0\x98\x68\xa7\x69\x9a\xa2\xa9\xa9\x29\xdb\
+\xd4\xd4\x94\x3c\x73\xe6\x0c\x59\xb8\x70\x61\xb6\xae\xae\x4e\xf8\
+\xf7\xc7\x9c\x73\x2f\x60\x26\xff\x5b\x55\x55\xa2\xaa\x2a\x61\x8c\
+\xe1\xec\xd9\xb3\x78\xe9\xa5\x97\x40\x08\x89\x2f\x59\xb2\x64\xad\
+\x3f\xc7\x9f\x57\xbf\x31\xe1\xb6\x57\x7a\x19\xf2\xba\x00\x60\x70\
+\x70\x30\xfb\xd2\x4b\x2f\xf5\x7f\xff\xfb\xdf\xef\x06\x50\x08\x80\
+\xb9\xea\x3f\xdc\xb6\x6d\xf4\xf5\xf5\x25\x12\x89\xc4\x1a\xd3\x34\
+\x3f\x2d\x2c\x2c\xac\x26\x84\x90\x25\x4b\x96\x98\xa5\xa5\xa5\xf2\
+\xda\x65\x50\x4c\x4c\x66\x2e\xf8\x8e\x21\x80\x53\x79\xe8\x2a\x4e\
+\x13\xf7\xfb\xeb\xde\x7d\xf7\xdd\x73\x9b\x36\x6d\xb2\x09\x21\x16\
+\x6e\x41\x16\xc0\x2b\x43\xfc\xd5\xaf\x7e\xc5\x77\xef\xde\x8d\x44\
+\x22\x51\xf0\xb7\x7f\xfb\xb7\x2b\x47\x46\x46\x96\xac\x5a\xb5\x6a\
+\xf1\xca\x95\x2b\xeb\x4a\x4b\x4b\xd5\xb5\x6b\xd7\xb2\x82\x82\x02\
+\xc5\x15\xc9\xbc\x53\x1a\x7e\x4e\x1a\xb2\x74\xf5\x2a\x22\x8d\x9f\
+\x55\xd2\xcf\x8d\x20\xbf\x46\x84\xc2\x19\xe0\xd5\x6d\x6d\x6d\xa4\
+\xab\xab\xab\xd0\xd5\xc5\xf3\xe0\x38\x0c\xc4\x9b\xcc\xfe\x55\x30\
+\x12\x89\x20\x97\xcb\x79\x8d\x3e\xb3\xd9\xec\x38\xa9\xb6\x49\x14\
+\x70\x41\x08\xe1\x75\x73\x96\xa9\xc0\x4b\x97\x2e\x15\xee\xdf\xbf\
+\xbf\x01\x4e\xc7\xa7\x6a\x00\x11\xc6\x98\x6d\xdb\xf6\x28\x1c\xb6\
+\x5f\x49\x32\x99\x7c\x0c\xc0\x9a\x15\x2b\x56\x44\x77\xed\xda\xb5\
+\xbc\xb4\xb4\x34\xb1\x78\xf1\x62\x55\xd3\x34\xb8\xa9\x3f\x99\x4e\
+\xbc\x9e\x89\xa0\xb8\x25\xd2\x42\x08\xc1\xe1\xf0\x6d\x96\x00\x78\
+\xf6\x89\x27\x9e\x38\x17\x0c\x06\xa5\xde\x44\x3e\xdf\xe2\xba\x4b\
+\xcd\xaf\x65\x00\x64\xb5\x13\xdb\xbd\x7b\x37\x07\x80\x64\x32\x99\
+\xa0\x94\x6e\xe3\x9c\x3f\x5b\x50\x50\x50\xb4\x63\xc7\x8e\x82\xcd\
+\x9b\x37\x07\x0a\x0a\x0a\x58\x24\x12\xa1\xb6\x6d\x7b\xec\x3f\x97\
+\xcf\x7c\xbd\xd7\x34\x23\xe1\x17\x9a\xb8\x8a\x0b\xe6\x2f\x79\x9d\
+\xc5\xc4\x20\xb8\x3c\x4e\xa4\xc0\x91\x92\xaf\x88\xc5\x62\x24\x9b\
+\xcd\x06\x39\xe7\xfe\x94\x12\x11\x79\x51\xf9\xfc\x71\x15\x0a\x8d\
+\xb5\x5f\x90\x32\x5d\x32\x1a\x7f\x25\xf6\x9d\x1f\x92\x89\x07\x8c\
+\xa5\x01\x07\x06\x06\x2a\x4d\xd3\x8c\xc2\x71\xbf\x83\x00\xe2\x84\
+\x10\x1b\xce\xd6\x77\x04\x8e\x61\x78\x14\x80\x56\x53\x53\xa3\xec\
+\xda\xb5\x2b\x32\x7f\xfe\xfc\x68\x28\x14\x0a\xa8\xaa\x4a\x4c\xd3\
+\x94\x12\x65\x64\x32\xd7\xe0\x7b\x3e\x8a\xa6\x69\x44\xd7\x75\xe6\
+\x52\x8c\x35\x00\x2b\x01\xd4\x64\x32\x99\x73\xa6\x69\xfe\x1c\x4e\
+\xaf\x49\x03\x63\x7c\x8b\x1b\xea\x1b\x30\x99\x2d\x00\x05\x00\x5d\
+\xd7\x85\x1b\xb1\x0c\x71\xce\x17\x00\xb8\x27\x1c\x0e\xa3\xae\xae\
+\x0e\xb5\xb5\xb5\x02\x40\x0e\x70\x64\x96\xe4\x8d\xde\x2d\x93\x1f\
+\x00\xdc\x6e\x46\x24\x1e\x8f\x23\x18\x1c\x47\x69\x97\x37\x29\x57\
+\xac\x69\xd3\x70\xbf\x8b\x90\x3f\x30\xa8\xa2\x28\x85\x8a\xa2\x10\
+\x9f\x9a\xd4\x38\xc8\x15\xda\x5f\xc4\x93\x4e\xa7\x31\x30\x30\x80\
+\xa1\xa1\x21\x08\x21\xb0\x7a\xf5\x6a\xe8\xba\x2e\x6a\x6b\x6b\x99\
+\x61\x18\xdc\x2d\xfd\x55\x9c\xb8\xde\x35\x5f\x89\xb7\x6d\x95\x5b\
+\x8f\x68\x34\x1a\x89\xc7\xe3\x11\x29\xfa\xc9\x39\x47\x38\x1c\x36\
+\xca\xca\xca\x10\x0c\x06\x61\xdb\x76\xa9\x6d\xdb\x73\x22\x91\x08\
+\x56\xae\x5c\x89\x25\x4b\x96\xa0\xa0\xa0\x60\xe2\x93\x5f\xdf\x5c\
+\xf0\x1b\x0c\xa9\x1f\x98\x00\x90\xe0\x9c\xc7\x18\x63\x6f\x63\x4c\
+\x79\xd9\x7b\x86\xd7\xf3\x05\x12\x93\x8e\x01\xe4\xed\x4f\x3c\x51\
+\x83\x89\x72\xff\x77\x53\xf4\x3f\xff\x5e\xa4\x01\xf0\xb9\xae\xf9\
+\x02\x0f\x37\x55\x9c\xf1\x59\x85\x9c\xe0\x57\xf2\xb0\x64\x20\xcf\
+\x9f\xd2\x6b\x6c\x6c\xc4\xef\x7f\xff\x7b\x5c\xba\x74\x09\x96\x65\
+\xe1\xa9\xa7\x9e\x42\x65\x65\xa5\x54\xfd\xa5\x32\x58\x38\xd9\xed\
+\x68\xfe\xf7\x16\x14\x14\x20\x18\x0c\x7a\x31\x07\x45\x51\x50\x5a\
+\x5a\xaa\x3e\xf8\xe0\x83\x91\x35\x6b\xd6\x68\x8c\xb1\x98\xf4\x34\
+\x56\xad\x5a\x75\xd9\xe4\x9f\xa6\xd6\x77\x53\xba\xc0\x4c\xc6\x00\
+\x78\xf4\x5f\xf7\x01\x31\x8c\x45\xfe\x83\x6e\x37\x54\xa9\x87\x3f\
+\x29\x77\xeb\x4e\x42\xfe\xbd\x0c\x0d\x0d\x21\x9b\xcd\xfa\xdb\x43\
+\x3b\x79\x1b\xe7\xff\x4d\x00\xdd\x00\x52\x98\x06\xda\xe6\x5d\x0c\
+\xc1\x39\x37\x39\xe7\xba\xdb\x6c\xe5\xb2\x03\xf2\x0d\x00\x00\xb4\
+\xb6\xb6\xe2\xd7\xbf\xfe\x35\x1a\x1b\x1b\xb1\x73\xe7\x4e\x7c\xe7\
+\x3b\xdf\xc1\x3d\xf7\xdc\x43\x54\x55\x55\x34\x4d\x43\x2e\x97\xf3\
+\xe7\xff\xaf\x79\x11\xf9\xef\x3a\x99\x4c\x7a\xb1\x05\xe9\x79\x84\
+\xc3\x61\x75\xe5\xca\x95\xb1\xa7\x9f\x7e\x1a\xa1\x50\xc8\xdb\x32\
+\x4c\xe4\x61\xdc\x00\xab\x71\xc2\xcb\xca\xbb\xc6\x01\x97\x16\x3c\
+\x51\xc1\xd5\x75\xe3\x46\xae\x90\xc3\x71\xf7\x47\x39\xe7\x34\x97\
+\xcb\x29\xa6\x69\xe6\xeb\xe3\xdf\xd1\xc8\xef\x2f\xcf\x39\xe7\xe9\
+\x74\x3a\xd5\xdf\xdf\x9f\x3e\x75\xea\x14\xda\xdb\xdb\x23\x8c\xb1\
+\x84\xab\xe1\x4e\x84\x10\x9c\x73\x3e\x00\xa7\x57\xdc\x27\x70\x3a\
+\xe2\xe4\x07\x64\x66\x0d\xc0\xd5\xc1\xe0\xea\xdf\xb9\x81\xa3\xcb\
+\x66\x94\x5c\xa1\x65\x3c\x66\x78\x78\x18\x17\x2e\x5c\xc0\xc8\xc8\
+\x08\x2c\xcb\x42\x4d\x4d\x0d\xc2\xe1\xf0\x65\xc7\x5f\x09\x13\xe9\
+\x09\x8c\x8e\x8e\xe2\xe2\xc5\x8b\xe8\xe8\xe8\xc0\xe1\xc3\x87\x79\
+\x77\x77\x37\x77\x0e\x15\x84\x31\xa6\x24\x93\x49\x12\x0a\x85\x68\
+\x49\x49\x89\x3c\x8d\x54\x80\x26\x70\x82\x77\x54\x51\x14\x3a\x15\
+\xac\x58\x79\x4d\x6e\xa9\x33\xe3\x9c\xdb\x00\x32\x6e\x1c\x62\x4a\
+\x70\x33\x7d\x01\x34\x00\x2a\xa5\x94\xe8\xba\x7e\xd7\x44\xc0\xc5\
+\x04\xfd\xe5\x19\x63\xfc\xfc\xf9\xf3\xbd\x6f\xbe\xf9\xe6\xc5\x4f\
+\x3e\xf9\x04\xc7\x8f\x1f\x9f\x6b\x59\x56\xd4\xed\x35\x47\x85\x10\
+\x26\x63\xac\x59\x08\xb1\x07\x8e\x20\x68\x23\xc6\x0b\x81\xf8\x0b\
+\x64\x66\x31\x31\x3c\x01\x99\x2b\x4d\x5c\x7f\x69\xae\xcc\xeb\x47\
+\x22\x11\x0c\x0c\x0c\x40\xd3\x34\xaf\x49\xab\xff\xf8\xab\x61\x22\
+\x3d\x81\xa1\xa1\x21\xbc\xfb\xee\xbb\x78\xeb\xad\xb7\xd0\xd9\xd9\
+\x49\xda\xdb\xdb\xe5\x5e\x9b\x00\x20\xe9\x74\xda\x2f\x05\x0f\x8c\
+\x17\xf9\xa4\x53\xe9\xf6\xcb\x78\x84\xa6\x69\x60\x8c\x51\x21\x84\
+\x06\x40\x13\xae\xae\xe0\x54\xe0\x66\xfa\x02\x4c\x36\xb8\x72\xc7\
+\x21\x3f\xd8\x64\x59\x96\x68\x6d\x6d\xcd\xfd\xe2\x17\xbf\x18\x39\
+\x75\xea\x94\x64\x65\x09\x4d\xd3\x24\x63\x8c\x09\x21\x2e\x02\xd8\
+\x0f\xe0\x53\x38\x5d\x70\xfc\x98\x9d\xf8\xd7\xc6\xb8\xec\xc0\x15\
+\x0f\x22\x04\x9a\xa6\x41\xd3\x34\x14\x14\x14\x20\x16\x8b\x79\x02\
+\x1d\x03\x03\x03\xa8\xa9\xa9\x99\xb4\xfe\xc4\x44\x7a\x02\xa3\xa3\
+\xa3\x38\x71\xe2\x04\x5e\x7f\xfd\x75\xaf\x65\xb8\x5c\x08\x54\x55\
+\x45\x75\x75\x35\x14\x45\x41\x3a\x9d\x96\xde\x06\x61\x8c\x29\x9c\
+\x73\x04\x02\x81\x29\x55\xbe\x62\x8c\x21\x9b\xcd\xfa\xa5\xe7\x3c\
+\x23\x39\x55\xdf\x31\x25\x9b\x94\xbb\x0d\xb2\xbf\xbc\x04\x63\x8c\
+\xf6\xf5\xf5\x15\x74\x74\x74\x94\xc3\x99\xcc\x31\xb8\x91\x5a\xf9\
+\x11\x38\xd5\x6e\x6d\x18\x3f\xf9\xa7\xa5\xa5\xf3\x67\x11\xf9\x05\
+\x3a\x00\x10\x8d\x46\xbd\xe6\x1e\x72\xbf\x2e\x99\x73\x72\x45\x9f\
+\xcc\x79\x81\xf1\xf5\xf8\xf9\x4d\x6d\x35\x4d\xc3\xb2\x65\xcb\xc8\
+\xb2\x65\xcb\x48\x7d\x7d\x3d\x1a\x1a\x1a\x04\xe0\x64\xbc\xfc\xf5\
+\x2f\x13\xa8\x43\xdd\xd4\xfd\x99\xa6\x89\x89\xea\x23\xa6\xb2\xe8\
+\x6e\xd6\x00\x4c\x80\x7c\xf2\x82\x10\x82\x5a\x96\x55\x16\x8b\xc5\
+\xe2\xc3\xc3\xc3\x1e\xf1\x22\xef\x85\x59\x70\x94\x91\xfd\x90\x92\
+\x4d\x9f\xa5\x5e\x00\xb7\x0c\x72\x2b\x00\x38\xec\x3d\x59\x8d\x77\
+\x3d\xf0\xeb\x09\xc8\x09\x1c\x8b\xc5\x64\xec\x07\x80\x93\x02\x5f\
+\xb5\x6a\x15\xfe\xe0\x0f\xfe\x00\xf5\xf5\xf5\x24\x91\x48\x90\x70\
+\x38\x0c\xa9\xe8\x2b\x8d\xcd\xcd\xac\xfe\xd7\x2a\x16\xf2\xc3\x47\
+\x0f\xbe\x69\xcc\x1a\x80\xc9\x81\x28\x8a\x12\x8a\xc7\xe3\xa1\x9e\
+\x9e\x1e\x30\xc6\xf8\x55\x5e\x82\x1c\x05\x1c\xb3\x7c\x80\x29\x83\
+\x4c\xe7\xe5\x72\x39\x0c\x0c\x0c\x60\x74\x74\x14\xed\xed\xed\xa8\
+\xaa\xaa\x42\x20\x10\xc0\x92\x25\x4b\x10\x8d\x46\xfd\x6d\xc7\xae\
+\x6b\x42\x4a\xbd\x80\xe2\xe2\x62\x94\x96\x96\xa2\xb8\xb8\x18\xc3\
+\xc3\xc3\x84\x73\x4e\x54\x55\x45\x55\x55\x15\xd6\xac\x59\x03\x7f\
+\xaf\x0b\xd3\x34\xbd\xad\xc3\xcd\xee\xfb\xfd\xd7\x2b\x0d\x51\x61\
+\x61\x21\x56\xac\x58\x81\xfe\xfe\x7e\xa4\x52\x29\x0c\x0f\x0f\x8f\
+\xcb\x90\xc8\x98\xc8\xcd\x60\xd6\x00\x4c\x12\x79\x4c\x40\x82\x89\
+\xd3\x30\x1c\xb3\x13\x7f\xca\x21\x57\x77\x4a\x29\xba\xba\xba\xf0\
+\xdb\xdf\xfe\x96\x9f\x38\x71\x02\xc9\x64\x12\xeb\xd6\xad\x23\x0b\
+\x16\x2c\x20\xf3\xe6\xcd\x43\x69\x69\xa9\x17\x1c\x54\x14\x05\xb2\
+\xe5\xd8\xd5\x30\x11\xcf\x43\x2a\xfd\xc8\x20\x5c\x20\x10\x80\xae\
+\xeb\x53\x95\xd6\xbb\xe2\x3d\xca\x09\x2d\x25\xc9\x6a\x6a\x6a\xf0\
+\xf4\xd3\x4f\x63\xf1\xe2\xc5\xd8\xbf\x7f\x3f\xf6\xec\xd9\x83\x81\
+\x81\x01\xcf\xd8\xb8\x01\xea\x6b\xd2\x9c\xaf\x86\x59\x03\x30\x49\
+\xf8\x9b\x42\x62\xac\xb9\x85\x1f\xfe\x00\x96\x7c\x23\xb3\x7b\xff\
+\x29\x80\x9c\x88\x84\x10\x0c\x0c\x0c\xe0\xed\xb7\xdf\x26\xbf\xfd\
+\xed\x6f\x51\x57\x57\x87\x3f\xff\xf3\x3f\x27\x5f\xf8\xc2\x17\x3c\
+\x39\x2d\xbf\xee\xfe\x8d\xe4\xfe\x07\x07\x07\x91\x4e\xa7\x61\x9a\
+\xa6\x97\xff\x37\x4d\x13\xe9\x74\x1a\xfd\xfd\xfd\xe3\xc8\x3e\x53\
+\xc9\x77\xf1\xaf\xfe\xd2\x88\x55\x55\x55\xa1\xaa\xaa\x0a\x6b\xd7\
+\xae\x05\x00\x1c\x39\x72\x04\xbd\xbd\x63\x21\x26\xb7\x22\xf2\xa6\
+\xbe\xf7\xba\x0c\x80\x61\x18\xc4\xb7\x3f\xbe\x66\x89\xe3\x5d\x06\
+\xb9\xc2\xcb\x7f\x27\x32\x00\x9e\xc8\xe5\xad\xbd\xb4\xbb\x1f\x6e\
+\xb6\x05\x99\x4c\x06\x97\x2e\x5d\x22\xe9\x74\x1a\x43\x43\x43\x28\
+\x29\x29\x91\x35\xf3\x00\x26\x0e\xa6\xe5\xc3\xa7\x27\x20\x08\x21\
+\xc2\xb2\x2c\x74\x76\x76\xa2\xbd\xbd\x1d\xe7\xce\x9d\xa3\xcd\xcd\
+\xcd\xb2\xe5\x77\x4a\x08\x31\x38\x34\x34\x64\x65\x32\x99\x88\x61\
+\x18\xc5\xa6\x69\x06\xf2\xe4\xc5\xa6\x7c\xfc\xe7\x5f\x7f\x69\x69\
+\x29\x7c\xd5\xb6\x1e\xa6\xc2\x00\x4d\xda\x00\x98\xa6\xe9\x4f\xd3\
+\x7c\x56\xdd\x5d\x59\xdb\x3d\xa1\xa0\x84\xef\x67\x16\x53\x0c\xc6\
+\x18\x24\x4b\x50\xd6\x62\x84\x42\xa1\xcb\x02\x62\xd7\xda\x8f\xcb\
+\x15\xd6\x65\x08\x0a\x55\x55\xed\x5c\x2e\x27\x8e\x1e\x3d\x4a\x5e\
+\x79\xe5\x15\xda\xdc\xdc\x4c\xdb\xdb\xdb\x25\xa7\x60\x10\xc0\x69\
+\x00\xa9\x48\x24\x52\x19\x8b\xc5\x42\xaa\xaa\x06\x7c\xb5\x2e\x72\
+\xfc\x4f\xfb\x22\x68\x9a\xe6\xed\xed\x0d\xa8\xeb\xba\x70\xe5\xc0\
+\xa4\x98\xa3\x8a\x69\xe8\xef\x36\x83\x31\x99\x97\x3c\x3b\xf9\xa7\
+\x09\x72\xd5\x8d\xc5\x62\x22\x16\x8b\x71\x4a\xa9\x70\x3b\x01\x51\
+\xc6\x18\xbd\x9e\x40\x9c\x8f\xdb\x4f\x01\xe8\x94\x52\xb4\xb5\xb5\
+\xe1\xdd\x77\xdf\xe5\x6d\x6d\x6d\xde\x71\xaa\xaa\x9a\xc1\x60\x30\
+\x35\x67\xce\x9c\xe1\x86\x86\x86\x44\x24\x12\x61\xfe\x98\xc2\x74\
+\x51\xde\xf3\xcf\x9b\x4a\xa5\x90\x4e\xa7\x2f\x33\x76\x53\x61\x10\
+\x26\x63\x00\xf2\xef\x92\xc1\x99\xf8\x53\xda\xe5\x65\x16\xb3\x90\
+\xf0\x4d\x00\xe9\x51\x79\xb3\xae\xa2\xa2\x22\x17\x0e\x87\xfb\x38\
+\xe7\xe9\x54\x2a\x15\xe0\x9c\x97\xd8\xb6\xed\xa9\xfe\x8a\xb1\x59\
+\x71\xc5\xd9\x99\x5f\x70\x14\x0c\x06\x11\x08\x04\x30\x3a\x3a\xea\
+\x7d\x8f\xa2\x28\x68\x68\x68\x88\x3d\xf0\xc0\x03\x95\xeb\xd6\xad\
+\x8b\xaf\x5d\xbb\xb6\x34\x14\x0a\xe9\x72\x7f\x2e\xe5\xc5\x6e\x45\
+\xdd\x8b\xf4\x7c\x6e\xab\x07\x90\x07\x06\xa7\xf0\x65\xd6\x08\xcc\
+\x62\xba\x31\x6e\xd4\x13\x42\x4c\x4d\xd3\x7a\x00\xf4\xaa\xaa\x1a\
+\x89\xc5\x62\x21\x5d\xd7\xe3\x3e\xb7\x5c\xaa\xef\x5c\x55\x7e\x2b\
+\x7f\xe2\x06\x83\x41\x14\x15\x15\xa1\xbf\xbf\x1f\x80\x63\x00\xe6\
+\xcf\x9f\x5f\xf4\xe0\x83\x0f\x2e\xdf\xbe\x7d\x3b\x0b\x85\x42\xba\
+\xae\xeb\x61\x19\xa1\x97\x7a\x17\x57\xfb\x9e\xa9\x82\xa4\x2a\x4f\
+\x87\xb1\x99\x8c\x01\xe0\x00\x60\x9a\xa6\x02\x40\x25\x84\xe8\x00\
+\x92\x00\xda\x15\x45\x29\x57\x14\x25\x08\x5f\x59\x2c\x3e\x5b\x81\
+\xc1\x59\x4c\x03\xf2\x22\xdb\xc2\xb6\x6d\x31\x34\x34\x84\x54\x2a\
+\x45\xda\xda\xda\x10\x8d\x46\xb1\x76\xed\x5a\xac\x5c\xb9\x12\xe5\
+\xe5\xe5\x5e\xfa\xcc\x4f\xdf\x9e\x00\x9e\x67\xe0\x3b\x26\x09\xa0\
+\xcf\x34\x4d\x33\x93\xc9\xc4\x82\xc1\x60\xa9\xaa\xaa\x41\xdb\xb6\
+\x65\x8e\x3f\x50\x55\x55\x15\xf0\xe7\xfe\xa5\xea\x90\x3c\xd7\x94\
+\xde\xf8\x15\x30\x9d\x15\xb6\x57\x32\x00\xfe\x40\x9f\x0d\x80\x7c\
+\xe7\x3b\xdf\x09\x37\x35\x35\x25\x00\xc4\x01\xf4\x00\x38\x14\x8f\
+\xc7\x1b\x22\x91\xc8\x7c\x00\x45\xee\x67\x08\x21\x44\xca\x2e\x7f\
+\x96\x82\x83\xb3\x98\x42\xf8\xdc\x5d\x0e\x80\xe5\x72\x39\xfe\xe1\
+\x87\x1f\xd2\x43\x87\x0e\x29\xc3\xc3\xc3\x7a\x41\x41\xc1\x9c\xff\
+\xf8\x1f\xff\x63\x78\xce\x9c\x39\x81\x79\xf3\xe6\x45\x24\x3f\xc3\
+\x25\x0b\x5d\xc9\x2d\xe7\x70\xa2\xfe\xaa\x6f\x35\x3d\x0b\xe0\xb7\
+\xba\xae\x77\x37\x37\x37\xaf\x1c\x18\x18\x78\xc2\xb6\xed\x6a\xf9\
+\x81\x64\x32\x79\x59\xf7\xe7\xbb\x49\xeb\x02\xb8\xba\x01\x00\xc6\
+\xaa\xd8\x94\x03\x07\x0e\x24\x52\xa9\xd4\x3c\x38\xca\x24\xfd\x00\
+\x0e\x95\x97\x97\x9b\xf1\x78\xbc\x10\x40\xb1\xfc\x0c\xa5\x94\xdf\
+\x92\x8d\xd1\x2c\xee\x4a\xc8\x28\xbd\xeb\x05\x50\x00\x9a\x69\x9a\
+\x62\xff\xfe\xfd\xe4\xb9\xe7\x9e\x03\x80\xc0\x37\xbf\xf9\xcd\xb9\
+\x3b\x76\xec\x10\xf1\x78\x1c\x8a\xa2\x50\x7f\x64\xff\x4a\xbd\x29\
+\x38\xe7\x02\x00\x97\x1c\x01\x17\x3d\x00\xf6\xef\xda\xb5\xab\xf5\
+\xf0\xe1\xc3\x22\x99\x4c\x6e\xf3\x7f\x46\xd7\x75\x73\x74\x74\x54\
+\x2a\xfb\x02\xb8\xbc\x67\xc0\x9d\x8e\x6b\x79\x00\x12\x74\x68\x68\
+\xa8\xd8\x30\x8c\xf9\x70\xfa\xbc\xf7\x01\x68\xa9\xae\xae\x8e\x17\
+\x14\x14\xdc\x33\xee\x83\x63\x7b\xb0\x59\xcc\xe2\x7a\x41\xa4\x9e\
+\x9f\x5f\x62\x3e\x91\x48\x60\x70\x70\x10\x1d\x1d\x1d\x00\x9c\xed\
+\x68\x69\x69\xa9\xf7\x21\xd9\xa6\xfd\x6a\x90\x42\xae\x94\x52\x8f\
+\x2b\x30\x34\x34\x14\xfd\xfb\xbf\xff\xfb\xea\xb7\xdf\x7e\x1b\x00\
+\xca\x01\x04\xa2\xd1\x28\x6a\x6a\x6a\x30\x77\xee\x5c\xac\x5f\xbf\
+\x5e\x24\x12\x09\x66\x9a\xa6\x00\x40\x74\x5d\x27\x94\x52\x72\x37\
+\x55\xc0\x4e\x64\x00\xf2\xf3\xfd\x00\x40\x72\xb9\x5c\xa1\x6d\xdb\
+\x55\xee\x67\x06\x00\x24\x2b\x2b\x2b\xfb\x23\x91\x48\x76\x82\x73\
+\xcc\x62\x16\xd7\x0b\x4f\x24\x34\x3f\xe2\x4d\x08\xf1\xe8\xb9\x80\
+\xa3\x97\x7f\xbd\x10\x42\x48\xf1\x16\xc8\xc6\x1e\x67\xcf\x9e\x6d\
+\xf8\xe4\x93\x4f\xbe\x02\x47\xe1\x6a\x0e\x80\xd2\x92\x92\x12\xec\
+\xdc\xb9\x13\x0f\x3e\xf8\x20\xaa\xaa\xaa\xd4\x9a\x9a\x1a\x42\x08\
+\x91\x8a\xc1\xe4\x6e\x52\xba\x06\x26\x9f\x05\x20\x9c\xf3\xb0\x10\
+\x42\x36\x6f\xa3\x00\x72\x85\x85\x85\x99\x40\x20\x60\x5e\xed\x83\
+\xb3\x98\xc5\x24\x21\xe0\xf4\xfa\x23\xc1\x60\x50\xba\xe9\x16\x00\
+\x33\x99\x4c\xf2\x70\x38\xac\xce\x9d\x3b\x37\x40\x29\xa5\x85\x85\
+\x85\x62\x78\x78\x58\x56\xed\x91\x49\x06\xc9\x88\x94\x16\x97\xb5\
+\xfd\xa6\x69\x56\x29\x8a\x52\x25\xab\xf9\x84\x10\x88\xc7\xe3\xb8\
+\xf7\xde\x7b\xf1\xc4\x13\x4f\x80\x52\xea\x35\x22\x91\x81\xc9\xbb\
+\x69\xf5\x07\xae\x23\x0d\x28\x25\x93\xe1\xc4\x04\x2c\x00\x56\x38\
+\x1c\xb6\xf2\x7b\xb3\xcd\x62\x16\x37\x08\x06\x80\x69\x9a\xa6\x16\
+\x16\x16\x4a\x49\xef\x73\x00\x3e\x8e\xc7\xe3\x03\x35\x35\x35\xf5\
+\x5f\xfc\xe2\x17\xef\x8b\x44\x22\x73\xd6\xae\x5d\x2b\x5c\x57\xde\
+\xe6\x9c\xab\x84\x90\x49\x49\x70\xe5\x6f\x13\x8a\x8a\x8a\x10\x0e\
+\x87\xbd\x22\x1f\x21\x04\x82\xc1\x20\x26\x52\x26\xbe\xdb\x82\x7f\
+\x12\x57\x33\x00\xfe\x3b\x16\x94\x52\x83\x73\x3e\x82\xb1\xcc\x80\
+\x62\x18\x86\x9a\xdf\xc0\x61\x16\xb3\xb8\x41\x70\xb8\x06\xa0\xb8\
+\xb8\x58\xf2\xde\xcf\x03\x78\xf5\xe8\xd1\xa3\xad\x0b\x17\x2e\x7c\
+\xe0\x81\x07\x1e\x58\x1a\x0c\x06\xe7\xc4\xe3\x71\x1a\x89\x44\x40\
+\x08\x91\xec\xd4\x1b\x4a\x95\xc9\x74\x9f\x69\x9a\x5e\xb9\xb1\xac\
+\x37\xc8\xc7\xdd\xe4\xf6\xfb\x31\xe9\xc9\xab\x28\x8a\x41\x08\x19\
+\x81\xd3\x8c\x80\x02\x08\xf7\xf6\xf6\xc6\x72\xb9\xdc\xdd\xa3\x06\
+\x3a\x8b\xdb\x0e\x45\x51\x10\x0a\x85\xbc\x15\xf8\x87\x3f\xfc\x21\
+\x56\xad\x5a\x85\x9e\x9e\x1e\x2c\x5b\xb6\x0c\x0b\x16\x2c\x40\x49\
+\x49\xc9\x65\x8a\x3f\x57\x9a\xa0\xf9\xfa\x00\xa6\x69\xa2\xb7\xb7\
+\x17\xcd\xcd\xcd\x38\x79\xf2\x24\x1f\x18\x18\xb0\x84\x10\xa6\x6d\
+\xdb\xb6\x69\x9a\xa2\xbf\xbf\x1f\xfd\xfd\xfd\x18\x1c\x1c\x84\x65\
+\x59\x37\x5d\x6d\x37\xd3\x31\x91\x07\x30\x91\xaf\x23\x14\x45\x31\
+\x28\xa5\x19\x00\x61\x00\x11\x00\x4a\x67\x67\x67\xc9\xe8\xe8\x68\
+\xa8\xb0\xb0\x70\xec\x40\x77\x9f\x35\x8b\x59\x5c\x27\x28\x00\x45\
+\x0a\x75\x9a\xa6\x89\x4b\x97\x2e\xcd\x7f\xe3\x8d\x37\x3e\x0f\x60\
+\x60\xff\xfe\xfd\xf5\x5f\xfc\xe2\x17\x8b\xfc\xc1\x40\xc6\x98\x42\
+\x1c\x61\xca\x09\x4f\xe8\x97\x12\x97\xe9\xbb\x81\x81\x01\xec\xd9\
+\xb3\x07\xfb\xf7\xef\x47\x4b\x4b\x0b\x5a\x5a\x5a\xc6\x69\x11\x0e\
+\x0e\x0e\x22\x9b\xcd\x8e\x23\x15\x4d\xa6\xc2\xf0\x4e\xc5\x95\xb6\
+\x00\x97\x89\x5d\x04\x02\x81\x51\xc6\xd8\x20\xc6\xba\x94\x84\x3b\
+\x3b\x3b\xab\xd3\xe9\x74\x6c\xdc\x81\x6e\xa4\x75\x16\xb3\xb8\x4e\
+\xc8\xf6\x56\x10\x42\x40\x51\x14\x74\x76\x76\x36\x8c\x8c\x8c\xcc\
+\x03\xc0\xdb\xda\xda\xd4\xc6\xc6\xc6\xc0\xca\x95\x2b\xbd\x0f\x70\
+\xce\xd5\xab\x8d\x35\x19\xf1\x97\x06\x00\x70\x0a\x6b\xf6\xef\xdf\
+\x8f\x9f\xff\xfc\xe7\x48\xa7\xd3\xd4\xb2\xac\x71\xd6\x23\x91\x48\
+\x20\x1c\x0e\x8f\xeb\x3f\x00\xdc\xbd\x5b\x80\x6b\x19\x00\x2f\x1d\
+\x58\x54\x54\x94\x24\x84\x5c\xec\xeb\xeb\xe3\x00\x16\x03\x58\xd2\
+\xdb\xdb\x3b\x2f\x9d\x4e\x17\xc0\x57\xb4\x31\x6b\x00\x66\x71\x3d\
+\xf0\x4d\x2c\x02\x47\x7a\x0d\x2e\xc1\x07\xe1\x70\x58\xb3\x6d\x5b\
+\x03\x9c\x86\x2c\xa9\x54\xca\x6b\xf6\x31\x59\x75\x1e\x7f\x2f\x01\
+\x21\x04\x0c\xc3\x40\x6f\x6f\x2f\xfa\xfa\xfa\xbc\x63\xa4\xe4\x57\
+\x75\x75\x35\x16\x2e\x5c\x88\xf9\xf3\xe7\x43\x55\x55\x4f\x37\xe0\
+\x7a\xe5\xc5\xa6\x10\x02\x4e\xe7\x72\x7e\x85\x86\xb4\x37\x8d\xab\
+\x19\x00\x49\xe7\x55\x01\x58\x5f\xfb\xda\xd7\x86\x3e\xf9\xe4\x13\
+\xf3\xc2\x85\x0b\x00\xb0\x11\xc0\x9a\x64\x32\x59\x3c\x32\x32\x22\
+\x0d\x00\x83\x9b\x6a\x99\x35\x00\xb3\xb8\x01\x38\x5d\x42\x15\xc5\
+\xcb\xf9\xab\xaa\x8a\x6c\xd6\xa1\x99\xe4\x72\x39\x4f\x1a\xcc\x2f\
+\xe4\x79\x2d\xc8\x63\xe5\x76\x80\x31\x76\x99\xb0\x86\xae\xeb\x58\
+\xb3\x66\x0d\x1e\x7d\xf4\x51\x2c\x5c\xb8\x10\xb5\xb5\xb5\x90\xdd\
+\x7d\xa5\x12\xd1\x6d\xca\xff\x0b\x00\x4c\x08\x61\xbb\x3c\x06\x29\
+\x38\x33\xed\xb2\xe0\x7e\x0f\x80\x02\x10\x7f\xf1\x17\x7f\x91\xa5\
+\x94\x66\xe1\xb8\xff\x21\x00\xf3\x4d\xd3\x0c\xb8\xc5\x11\x0c\x63\
+\x32\x58\x77\xa7\xaf\x34\x8b\x69\x41\xde\x24\x16\x86\x61\x90\x4b\
+\x97\x2e\x61\xf1\xe2\xc5\xe8\xef\xef\x17\x85\x85\x85\x22\x12\x89\
+\x88\xaa\xaa\x2a\x12\x0e\x87\x89\xbf\xcd\xf6\xf5\x4c\x48\x9f\x9e\
+\x00\x4a\x4b\x4b\x51\x58\x58\x88\x64\x32\x09\x21\x04\x34\x4d\x43\
+\x7d\x7d\x3d\x76\xed\xda\x85\xea\x6a\xaf\x14\xc0\x63\x24\xde\x46\
+\xfa\xaf\x02\x20\xa0\xeb\xba\xee\xdb\xc6\x4c\xa9\xe8\xcc\x8d\xe8\
+\x01\x48\x3d\xbc\x40\xde\xef\xef\xea\x65\xdf\x55\x7f\x91\x0f\x7f\
+\xa2\xd0\xb0\x94\x04\xa3\x98\xe2\x97\x74\xb7\x42\xee\xd1\x01\x8c\
+\x0b\xd2\xbd\xf5\xd6\x5b\xa2\xbd\xbd\x1d\xb6\x6d\xf3\x55\xab\x56\
+\xb1\xe5\xcb\x97\x63\xc9\x92\x25\xb4\xb8\xb8\x58\xf1\xd7\xe3\xdf\
+\x48\xc3\xcf\x92\x92\x12\xc4\x62\x31\xe8\xba\x0e\x4d\xd3\x20\x84\
+\x80\xae\xeb\x88\xc5\x62\xe3\x14\x7f\x27\xfa\xec\xad\x82\xef\x7b\
+\x29\x00\x3d\x18\x0c\x22\x16\x8b\xc9\x98\x04\x73\x7f\x6e\x99\x24\
+\x58\xfe\x53\x50\xe1\x4c\x00\x13\x80\xdf\x97\xfa\x2c\xac\xfc\x57\
+\x9b\xd8\x13\x51\xa8\x67\x71\x15\xf8\x29\xbf\xb2\xc6\xbe\xb7\xb7\
+\x17\xaf\xbc\xf2\x0a\xde\x7e\xfb\x6d\xb1\x66\xcd\x1a\xf2\xc4\x13\
+\x4f\x68\x6b\xd6\xac\x41\x24\x12\x41\x49\x49\x09\xc9\xab\xc7\xbf\
+\xe1\xdc\x7f\x2e\x97\x83\x6d\xdb\xde\xde\x3e\x97\xcb\x21\x99\x4c\
+\x8e\xd3\x17\x9c\x49\x81\xbf\xdb\x2e\x08\x22\x35\x01\x09\x21\x1a\
+\x1c\x0b\x64\xb8\x9f\x9f\x39\x4f\x69\x1a\x21\x84\xa0\x84\x10\xea\
+\xa6\x85\x26\x8a\x08\xc9\xc6\x20\xb3\x4d\x40\xae\x03\xf9\x79\x7a\
+\xc3\x30\xd0\xd1\xd1\x41\x00\x90\x39\x73\xe6\xa0\xba\xba\x1a\x0d\
+\x0d\x0d\xde\xf1\x86\x61\x78\x13\xf3\x6a\xb9\x7f\xff\x31\x8c\x31\
+\x91\x4a\xa5\xc8\xf0\xf0\x30\x9a\x9b\x9b\x71\xe9\xd2\x25\xaf\xa9\
+\x08\x63\x0c\x03\x03\x03\xe8\xeb\xeb\xc3\xc0\xc0\x00\x4a\x4b\x4b\
+\x3d\xef\xe2\x16\x63\x9c\x5e\x81\x8b\x61\x00\xdd\x23\x23\x23\x4a\
+\x77\x77\x77\x3c\x9b\xcd\x16\x13\x42\x02\x84\x90\x20\xe7\x9c\x4c\
+\x05\x47\xe1\x46\x14\x81\xae\x29\xb9\x74\x37\x42\x51\x14\xaf\x27\
+\x1d\x63\x4c\x61\x8c\xf9\x9f\xbe\x80\xc3\x8e\xcc\xaf\x52\xf9\x4c\
+\x3d\xa3\x9b\xc4\x65\xcb\xdb\xf5\x44\xfb\xbd\x93\xf8\x74\xf5\xe1\
+\xd4\xff\x73\x29\xfa\xf9\xc1\x07\x1f\xd0\xe6\xe6\x66\x72\xea\xd4\
+\xa9\x71\x8d\x44\x39\xe7\x48\xa7\xd3\x9e\xe1\xb8\x9e\x20\xe3\x14\
+\x82\xbb\x5a\x85\x8a\x64\x25\x02\x68\x01\xf0\xbb\xce\xce\xce\xd1\
+\x63\xc7\x8e\x6d\x1c\x1e\x1e\xde\xa1\x28\x4a\x94\x52\x1a\x35\x4d\
+\x93\x5c\xa9\x95\xfa\xf5\xe0\x46\x44\x41\xbd\xd6\x58\xf8\x0c\x89\
+\x7e\xf8\xa3\xc8\x9c\xf3\xfc\x55\x9e\xc0\xe9\x96\x1c\xca\xfb\xfd\
+\xec\x56\x60\xf2\xb8\x2c\x7b\x14\x08\x04\x30\x32\x32\x32\xfe\xa0\
+\x49\xb8\xe5\xfe\xe6\x20\x84\x10\x6a\x59\x96\x38\x7b\xf6\x2c\x79\
+\xf9\xe5\x97\x49\x53\x53\x93\xbf\xbf\x03\x00\x67\xfb\x11\x8d\x46\
+\x11\x08\x04\xc6\x19\x9c\x5b\xb9\x05\xe0\x9c\x0b\x57\xcf\x50\xf1\
+\x79\x1f\xbd\x99\x4c\xe6\xd3\xa7\x9e\x7a\xaa\xbf\xad\xad\x6d\x8e\
+\x61\x18\x96\xa6\x69\x01\x4a\x69\x10\x4e\x53\xd2\x9b\xfe\xde\xd9\
+\xc6\x20\x13\x20\x5f\x58\x92\x10\xc2\x82\xc1\x60\x67\x32\x99\xec\
+\x65\x8c\x09\x00\x85\x00\xaa\x09\x21\x8a\xef\xb8\x62\x00\x75\x00\
+\x46\x01\xa4\xe0\x6c\x91\xfc\x8d\x41\x67\x63\x03\x57\x87\x5c\x4c\
+\x2c\x00\x23\x00\x72\x96\x65\x29\xb9\x5c\x2e\x66\x18\x46\xd0\xe7\
+\x0d\x5c\x53\x72\xce\xc7\xdc\x23\xee\xe4\x26\x9c\x73\x74\x74\x74\
+\x78\x69\x45\x42\x08\x2a\x2a\x2a\x50\x55\x55\x85\x8a\x8a\x0a\xac\
+\x58\xb1\x02\x91\x48\xe4\xb2\xdc\xff\xad\x32\x02\x9c\x73\x22\x09\
+\x50\x12\xdd\xdd\xdd\xd1\xff\xf5\xbf\xfe\xd7\xdc\x33\x67\xce\x44\
+\xe0\x8c\x39\x85\x10\x62\x52\x4a\xed\x2b\x9e\xe8\x3a\x31\x6b\x00\
+\xf2\xe0\x16\x98\x48\x55\x23\x02\x00\x9a\xa6\x59\x55\x55\x55\x8d\
+\x9c\xf3\x4f\xe0\x0c\xc0\x55\x00\xe6\xfa\x3e\xa6\x00\xa8\x86\xc3\
+\x8f\x00\x80\x46\x00\x1d\x70\xb6\x05\x7e\x8f\x69\xb6\x53\xf0\xc4\
+\x20\x84\x10\xd5\x7d\xe6\x26\x1c\xa5\x9e\x41\xce\x79\x38\x14\x0a\
+\x55\x69\x9a\x16\xf4\x4d\x46\x69\x9f\xaf\x6b\x66\x46\xa3\x51\xc4\
+\x62\x31\x0c\x0c\x0c\x00\x70\x72\xff\x8b\x16\x2d\xc2\xa3\x8f\x3e\
+\x8a\x55\xab\x56\x61\xee\xdc\xb9\x28\x2c\x2c\xf4\xb6\x0f\xd2\xe0\
+\xdc\x2a\x03\x20\x84\xa0\xae\x6a\x91\x87\x8b\x17\x2f\xce\x3f\x73\
+\xe6\xcc\x53\x70\xc6\x4d\x35\x80\x00\x21\x64\x48\x08\x21\x8b\xf2\
+\x6e\x1a\xb3\x06\x60\x02\xb8\x5b\x1d\xe2\xff\xff\x85\x0b\x17\x8e\
+\x3c\xfb\xec\xb3\x3d\xff\xfc\xcf\xff\x8c\x74\x3a\x3d\x9a\xcb\xe5\
+\x44\x5e\xba\xa6\x0a\xc0\x7a\x38\x2b\x58\x12\x40\x17\x1c\x03\x20\
+\xff\x3e\x1b\x0f\xb8\x0a\x24\x81\x8c\x52\xca\x35\x4d\x33\x74\x5d\
+\x1f\x6d\x68\x68\x40\x61\x61\xa1\x9d\x4f\xc9\xbd\xd6\xa4\xf4\x1d\
+\xc3\x18\x63\x6c\x64\x64\x44\x8c\x8e\x8e\xd2\x82\x82\x02\x95\x52\
+\x4a\x64\x1b\xf0\x78\x3c\x8e\x0d\x1b\x36\xe0\xfe\xfb\xef\xf7\x3e\
+\x2b\xc5\x46\x7c\xfb\xf0\x5b\x85\xcb\x08\x3e\xc3\xc3\xc3\x55\xb6\
+\x6d\x7b\x7a\x05\x6e\x26\x20\xeb\xd6\xe4\x4c\xc9\x42\x32\x6b\x00\
+\x26\x80\x4b\x36\x21\xf2\xa1\x2b\x8a\xa2\xcc\x9d\x3b\xb7\xfc\xbb\
+\xdf\xfd\xee\xb2\xe5\xcb\x97\xe3\xb9\xe7\x9e\x9b\x7b\xf0\xe0\x41\
+\x85\x31\x26\x84\x10\x9c\x10\xa2\x50\x4a\x4b\x18\x63\xcb\x00\x64\
+\xe1\x78\x00\xc7\x31\x66\x00\xa4\x07\x30\x9b\x21\xf0\x41\xba\xd9\
+\xee\x5e\x96\x13\x42\x68\x51\x51\x91\xba\x7e\xfd\xfa\xf8\xfa\xf5\
+\xeb\x71\xef\xbd\xf7\x06\xe7\xcc\x99\x13\xf0\xbd\x87\xab\x8a\x7e\
+\xba\xee\x3b\x95\xfc\x00\xd3\x34\x7b\x7b\x7b\x7b\xcf\xb7\xb6\xb6\
+\x8e\x36\x35\x35\x95\x8e\x8c\x8c\xd4\x01\xf0\x9a\xfb\xa5\xd3\x69\
+\x1e\x08\x04\xc6\x4d\x3c\x5f\xdb\xb0\xdb\x0e\x19\xc7\x90\x4d\x40\
+\xa5\x50\x2a\x21\x64\xca\xc6\xd1\xac\x01\xb8\x1c\x84\x3a\xa6\x9f\
+\xc8\x76\x54\x8a\xa2\xa8\xc1\x60\x70\xf1\xc2\x85\x0b\xab\x4c\xd3\
+\xc4\xa1\x43\x87\xa2\x9f\x7e\xfa\xa9\x66\x18\x06\x17\x42\xd8\x8a\
+\xa2\x04\x14\x45\x89\x70\xce\x03\x42\x88\x24\x80\x52\x4c\xdc\x3b\
+\x70\x16\x3e\x48\x75\x1e\xd7\x90\x32\x21\x84\x56\x54\x54\xa4\x6f\
+\xde\xbc\xb9\xfc\x4b\x5f\xfa\x52\x49\x71\x71\x31\x0d\x87\xc3\xba\
+\x3f\xb2\x7f\x35\xd1\x4f\x21\x84\xa0\x4e\x18\x1d\x84\x10\x24\x93\
+\xc9\x81\x0f\x3e\xf8\xe0\xf8\x4f\x7f\xfa\xd3\xfe\xe6\xe6\xe6\x86\
+\xce\xce\xce\x72\xce\xb9\x67\x00\x4c\xd3\xe4\x23\x23\x23\xe3\xbc\
+\xb3\x99\x32\xf9\x81\xb1\x86\xb4\x32\x63\xe1\x1a\x00\x49\x09\x9e\
+\x12\xdc\xa8\x01\xf0\xfa\xe0\xf9\x94\x82\xee\x26\x8c\x5b\x11\xe0\
+\x56\x40\x6a\x9a\x96\xa8\xae\xae\x46\x71\x71\xb1\xac\x47\xf7\x28\
+\xd0\xae\x7c\x94\x02\x27\x58\x13\xc1\x67\x28\x43\x72\xa3\xf0\x17\
+\xd9\xd8\xb6\xcd\xdd\xc1\xae\xcc\x99\x33\x27\x54\x5f\x5f\xef\x1d\
+\xe7\x97\xe4\xba\x5a\xee\x5f\x7a\x09\xb2\x84\xb7\xaf\xaf\x0f\xbf\
+\xff\xfd\xef\xf1\xd6\x5b\x6f\x79\xc7\x05\x02\x01\xc4\xe3\x71\x14\
+\x14\x14\xa0\xbe\xbe\x1e\x94\x52\xaf\xce\x40\xb6\x13\x9f\x29\xb2\
+\x5f\x8a\xa2\x58\x94\xd2\x9c\x10\x22\x00\xb7\x5c\x1a\x53\x9c\x7d\
+\xbb\x51\x1e\x00\x03\x60\x0a\x21\x74\xce\xb9\x62\xdb\xb6\x98\xce\
+\xde\xe9\x33\x09\x93\xd8\x1b\xca\x82\x8d\x59\x5c\x03\x13\xed\xe7\
+\x93\xc9\xe4\xb8\x1c\x3d\x30\xb9\x8e\xbf\x42\x08\x22\x23\xe9\x72\
+\xe5\xec\xed\xed\x2d\xee\xe9\xe9\x59\x09\x27\x33\x53\x0a\x20\x5c\
+\x5c\x5c\x8c\xad\x5b\xb7\x62\xfd\xfa\xf5\x58\xb0\x60\x01\xad\xad\
+\xad\x25\xc0\x58\x33\x92\x99\x24\xfa\xe9\x2e\xae\xe3\xf4\x0a\x70\
+\x1b\x6a\x01\xf2\x21\xf7\xb3\x2a\x9c\x4e\x41\x44\x55\xd5\xbb\x56\
+\x36\x25\x7f\x30\x0c\x0c\x0c\x20\x93\xc9\xf8\x07\xa4\xa7\x66\xeb\
+\xc2\xc0\x58\xf4\x7f\x16\x57\x81\x9c\xac\x2e\x08\x00\x14\x14\x14\
+\xc0\xb6\x6d\x18\x86\xe1\x75\x01\x9e\x4c\x39\xae\x64\x67\x4a\xa3\
+\xa2\xaa\x2a\x2c\xcb\x2a\xd3\x34\xad\x18\xbe\xca\xd6\xc2\xc2\x42\
+\x6c\xde\xbc\x19\x5f\xfe\xf2\x97\x11\x8b\xc5\xa8\xab\x3d\xe8\xf1\
+\x02\x6e\x03\x03\xf0\x6a\x20\xae\xbb\x3f\x6d\xab\xeb\x75\x15\x03\
+\xb9\x93\x41\x01\x10\x03\x50\xa0\xeb\x3a\x12\x89\x84\xfc\x9d\x0d\
+\xdc\xbd\xe2\x89\x70\x22\xca\xdc\x34\x4d\xb8\x3a\x88\xf9\x23\xc5\
+\xdf\x49\x69\x36\xd8\x77\x15\x28\x8a\xe2\x71\xdb\xa5\xdb\x5e\x59\
+\x59\x89\xda\xda\x5a\xd4\xd7\xd7\xa3\xaa\xaa\x8a\xe7\x72\x39\x39\
+\x91\xc9\xd5\x54\x7f\x26\x82\x3c\xb6\xa8\xa8\x48\x49\x24\x12\x4a\
+\x30\x18\x84\xec\x1e\x14\x0e\x87\x31\x77\xee\x5c\xf8\xfb\x0a\xf8\
+\x02\x6c\x33\x02\xfe\x67\xe3\xbb\x2e\x7f\x21\xda\xad\xf7\x00\xf2\
+\x84\x1b\x74\x60\x7c\xed\xb6\x1f\x33\xe9\x61\x4e\x21\xa8\xa2\x28\
+\xb2\xaf\xdc\x44\x3e\xa2\x9f\x1d\x39\x33\x7c\xc8\x19\x08\x5d\xd7\
+\x3d\x6d\x3e\x29\xff\xa5\xeb\x3a\x56\xaf\x5e\x8d\x27\x9e\x78\x02\
+\x0b\x17\x2e\x44\x75\x75\x35\x09\x85\x42\xd2\x3b\x20\x93\xa9\xc7\
+\x9f\x68\x9b\x20\xab\xfd\x2c\xcb\xf2\x72\xfb\x8a\xa2\x5c\xd6\x66\
+\xdb\xfd\x92\x29\xbe\xd3\x1b\x83\xbf\x6f\x41\x5e\xc3\x13\xb9\xb8\
+\xd8\x6e\x65\xea\x94\x60\xd2\xd5\x80\xbe\x07\x2c\x89\x1a\x7d\xd9\
+\x6c\x36\xda\xd9\xd9\xa9\x2e\x5f\xbe\x1c\xba\xae\x8f\x63\x51\xdd\
+\x85\x90\xc5\x50\x57\xbb\xbf\xfc\xfd\xda\x2c\x26\x80\xeb\x9e\x7b\
+\x2b\x9c\xaa\xaa\x58\xb0\x60\x01\x76\xee\xdc\x89\x9a\x9a\x1a\xc0\
+\x7d\x7e\x86\x61\x00\xb8\xbe\xdc\xbf\xdc\xff\xdb\xb6\x8d\x8b\x17\
+\x2f\x8a\x64\x32\x09\xc6\x98\x60\x8c\x11\x00\x24\x99\x4c\x62\x60\
+\x60\x00\xa9\x54\x0a\xd1\x68\x74\xc6\x8d\x55\x42\x88\x57\x73\x12\
+\x0a\x85\xfc\x5b\x12\x19\x64\x0e\x09\x21\xa6\x6c\x4b\x70\xad\x13\
+\xc9\x80\x1f\x4c\xd3\x94\x7b\xac\x54\x28\x14\xda\x6f\x18\x06\x0c\
+\xc3\x98\x7b\xfc\xf8\xf1\x05\xa3\xa3\xa3\x55\xb5\xb5\xb5\x85\x8b\
+\x17\x2f\x1e\xf7\x50\x19\x63\xc2\xbd\x81\x99\xf5\x94\x67\x71\x5b\
+\xe1\xaf\xd4\x93\x2a\x3f\xd1\x68\xf4\xba\xeb\xf1\xf3\xf8\x01\x20\
+\x84\x20\x95\x4a\xe1\xd8\xb1\x63\x38\x73\xe6\x0c\x4e\x9d\x3a\x85\
+\xb6\xb6\x36\xe9\x32\x13\x00\xb4\xb7\xb7\x97\xa4\x52\x29\xcf\x00\
+\xc9\xed\xc2\xed\xf6\x5a\x27\xf2\x60\x12\x89\xc4\x65\xea\x45\x00\
+\xe2\x94\xd2\x00\x2e\x9f\x53\x37\x34\xc7\xae\x65\x00\xbc\xfd\xc6\
+\x17\xbf\xf8\x45\xd2\xdb\xdb\x4b\x96\x2e\x5d\x3a\x5c\x59\x59\xb9\
+\xe7\xe8\xd1\xa3\x47\x3a\x3a\x3a\x96\xff\xf2\x97\xbf\x7c\x24\x12\
+\x89\x44\x3e\xff\xf9\xcf\x17\x96\x97\x97\x93\x78\x3c\xee\x7d\xd8\
+\xe5\xcd\x93\x19\x16\x58\x99\xc5\x6d\x46\x7e\x09\x30\x21\xc4\xab\
+\xc7\x8f\x46\xa3\xde\x71\xd7\x5a\x9d\xe5\x6a\xef\xcf\xcc\x0c\x0f\
+\x0f\x63\xcf\x9e\x3d\x78\xf9\xe5\x97\x31\x30\x30\x40\x86\x87\x87\
+\x15\xf8\xea\x07\xe4\x76\x42\xd7\x75\xaf\xf0\x67\x2a\x8a\x6a\x6e\
+\x16\x13\xdd\xab\x6d\xdb\x13\xc9\xeb\xe5\xdc\x62\xb4\x5b\xc6\x04\
+\x14\x00\xf0\xe2\x8b\x2f\x12\x00\x94\x10\x62\xb6\xb6\xb6\xf6\x5a\
+\x96\xd5\xdb\xd7\xd7\x47\x00\x6c\x02\x40\x96\x2c\x59\x42\x5d\x39\
+\x65\x0e\xd7\x0d\x96\xd6\x79\x16\xb3\x70\x31\x6e\x94\xcb\xc0\xdc\
+\xe0\xe0\x20\x06\x06\x06\x30\x38\x38\x88\xb2\xb2\xb2\xeb\xaa\xc7\
+\xcf\xe7\x07\x64\x32\x19\x9c\x3f\x7f\x1e\xc7\x8e\x1d\xf3\x8e\xa1\
+\x94\x92\x78\x3c\x8e\x78\x3c\x8e\x86\x86\x06\x54\x54\x54\x40\x55\
+\xd5\x71\xba\x01\xb7\x2b\xf7\xef\x2f\x41\x76\x63\x23\x22\x99\x4c\
+\x8a\x54\x2a\x85\x53\xa7\x4e\x61\x70\x70\x90\xc2\x29\x6b\x4e\x0a\
+\x21\x86\xe1\x30\x4c\x3b\xe1\x6a\x70\x62\xcc\x10\xdc\x50\x5c\xe0\
+\x7a\xf6\x12\x13\xed\x6d\x35\x38\xc4\x97\x22\xc6\x98\xe2\x5a\x2b\
+\x86\x31\x8d\xf7\x59\xd7\x7f\x16\x12\x0a\x9c\x31\xa1\x11\x42\x2e\
+\x9b\x6d\x99\x4c\xe6\xb2\x18\xd2\xf5\xb8\xe5\x92\x2c\x34\x51\x33\
+\x0f\x5d\xd7\xb1\x6a\xd5\x2a\xdc\x77\xdf\x7d\xa8\xaf\xaf\xc7\xca\
+\x95\x2b\xa1\xaa\xea\x65\xde\xc3\xad\x8e\x07\x4c\xd4\xb7\x60\x70\
+\x70\x50\x7c\xf8\xe1\x87\xe6\x47\x1f\x7d\x44\x1a\x1b\x1b\xf5\xb6\
+\xb6\x36\x85\x52\x6a\x29\x8a\x72\xdc\xb6\xed\x3d\x00\x4e\x03\x38\
+\x09\x27\x20\xa8\x62\xbc\x1e\xe7\x75\x7b\x05\x37\x14\x4c\xf0\xbd\
+\x98\x0a\x00\x95\xc1\x60\xb0\x34\x1a\x8d\xca\xfe\x6c\xf2\x62\x94\
+\x2b\x91\xb6\x67\xf1\x99\x84\x0c\xe9\x33\x91\x37\xb3\x29\xa5\x28\
+\x28\x28\x40\x30\x18\xbc\xee\x7a\x7c\xff\x0a\x4e\xdc\x2e\xc2\x85\
+\x85\x85\x08\x87\xc3\x5e\x8b\x2f\x4d\xd3\xb0\x7c\xf9\x72\x3c\xfb\
+\xec\xb3\x58\xb8\x70\x21\x54\x55\x85\xa6\x69\x30\x0c\xc3\x63\xfe\
+\xdd\x0e\x4f\x75\xa2\xbe\x05\xe9\x74\x5a\x1c\x38\x70\xc0\xfa\xc9\
+\x4f\x7e\x42\xd3\xe9\x74\xc0\xb2\x2c\x85\x10\x92\xd3\x75\xfd\x2c\
+\x80\x97\x0c\xc3\x38\x07\xa7\xe0\xcc\x06\x10\x84\xf3\x5c\x39\x6e\
+\x30\xf5\x7c\xdd\x06\xc0\xd5\x27\x57\xbf\xf5\xad\x6f\x29\x2f\xbc\
+\xf0\x42\x94\x52\x1a\x8e\x44\x22\x54\xd3\x34\xb9\xcf\x9a\x15\xc4\
+\x9c\xc5\x65\x20\x84\x08\x42\x08\x53\x55\x35\xc9\x18\xcb\x09\x21\
+\x50\x52\x52\x82\xda\xda\x5a\x54\x55\x55\xe1\xde\x7b\xef\x15\xd1\
+\x68\xf4\x86\xeb\xf1\xe5\x67\x4a\x4b\x4b\x51\x54\x54\x84\x58\x2c\
+\xe6\x79\x05\xba\xae\xa3\xa4\xa4\x04\x75\x75\x75\x08\x85\xc6\x34\
+\x5b\x6e\x77\xe0\x6f\xa2\x6b\x30\x4d\x13\x5d\x5d\x5d\x70\xb7\xd7\
+\x00\x00\x45\x51\xb8\xaa\xaa\x83\xc1\x60\xb0\x75\x60\x60\x20\xeb\
+\x3b\xfc\xa6\x17\xd8\xeb\xde\xf8\xb8\xa5\xb2\xec\x27\x3f\xf9\x89\
+\xc5\x18\x33\x4d\xd3\x34\x4c\xd3\xb4\x6d\xdb\x66\x96\x65\x49\x23\
+\x30\xbb\xf2\xcf\x62\x1c\x64\x0e\x3e\x93\xc9\xd8\xa6\x69\x72\x21\
+\x04\x6a\x6b\x6b\xf1\xcc\x33\xcf\xe0\xcf\xfe\xec\xcf\xb0\x63\xc7\
+\x0e\x24\x12\x09\x2f\x07\x0e\x60\x52\xf5\xf8\x13\xa9\x08\x11\x42\
+\x20\xe5\xb2\x24\xc7\x5f\x08\xe1\x95\xfa\x4a\xcc\x50\x07\x95\x68\
+\x9a\x96\xcf\xfe\x13\x42\x08\x25\x97\xcb\x05\xa7\xfa\xcb\x6e\x28\
+\xf2\x11\x0c\x06\xb9\xaa\xaa\x8c\x31\x26\x38\xe7\x0a\xe7\x5c\xa5\
+\x94\xaa\xa1\x50\x68\x46\x3e\xd1\x59\xdc\x36\x78\xde\xa0\x65\x59\
+\xda\x9e\x3d\x7b\x42\x00\x16\x30\xc6\x8a\x84\x10\x64\xce\x9c\x39\
+\xd8\xbc\x79\x33\x1e\x7c\xf0\x41\x2c\x58\xb0\x80\x48\x45\x1e\xbf\
+\x52\xf0\x64\xf2\xff\x92\xec\x93\xcd\x66\xd1\xda\xda\x8a\xfe\xfe\
+\x7e\x98\xa6\x09\xcb\xb2\x90\xcb\xe5\x90\x4e\xa7\x31\x38\x38\x88\
+\xbe\xbe\xbe\x69\x53\xd7\xbd\x51\xe4\xdf\x1f\xa5\x94\xc4\x62\x31\
+\xa5\xa0\xa0\x40\xf1\xdd\x3f\xe5\x9c\x87\x4d\xd3\x2c\xc1\x78\xa2\
+\xd9\x4d\xdf\xc8\xf5\x6e\x01\xbc\x54\x8a\x0b\x1d\x40\x82\x10\x82\
+\x70\x38\x8c\xe2\xe2\xe2\x71\x17\x35\x93\x1e\xf4\x14\x42\xb8\xf5\
+\xd8\x92\x96\x99\x1f\x7d\x25\x70\x02\x5e\xaa\xfb\xef\x5d\x5b\x27\
+\x71\x15\xc8\xfb\x96\x3c\x12\xad\xaa\xaa\x6a\x89\x65\x59\x2b\x09\
+\x21\xcb\x09\x21\x8b\x14\x45\x51\x43\xa1\x10\x4b\x24\x12\x72\x40\
+\x7b\x7d\x01\xaf\x05\x9f\xe8\x27\x00\x20\x9b\xcd\xa2\xb1\xb1\x11\
+\x27\x4e\x9c\x40\x4b\x4b\x0b\x4e\x9e\x3c\x09\xb7\x61\x0d\x00\x27\
+\xc0\x38\x34\x34\x84\x5c\x2e\x37\x4e\xf1\x67\x26\x8d\x4f\xbf\xe6\
+\xa4\x10\x82\xa8\xaa\x4a\x14\x45\x11\xcc\x71\x87\x84\xaf\x33\x90\
+\x0c\xfc\x4d\x49\xee\xf2\x66\x19\x45\x5e\x93\x0c\x79\x03\x9f\x05\
+\x10\x42\xae\x34\xf9\xbd\x43\xf0\xd9\xdd\x0a\x79\x93\x19\x63\x03\
+\x35\x98\x4a\xa5\x56\xda\xb6\xfd\x75\x00\x8b\x29\xa5\x71\x42\x88\
+\xc6\x39\x37\x47\x47\x47\xa5\xa1\xf4\x98\x96\x57\x83\x0c\x9c\xf9\
+\xe3\x04\x86\x61\xe0\xd8\xb1\x63\x78\xfe\xf9\xe7\xd1\xdc\xdc\x3c\
+\x61\x45\xa1\x24\x1c\xc9\xe2\x9f\x99\x06\x49\x04\x72\x29\xc0\xc2\
+\x34\x4d\xe1\x52\x81\x85\xa2\x28\x9c\x10\x62\x13\x42\x2c\x38\x01\
+\xc0\x29\xc3\xf5\x18\x00\x6f\xb2\x67\xb3\x59\xa2\xaa\xaa\x00\x30\
+\x44\x08\x39\xc5\x39\x2f\x1e\x1a\x1a\x2a\x38\x76\xec\x58\x62\xd1\
+\xa2\x45\xb4\xa0\xa0\x80\x44\x22\x91\x71\xd2\x5a\xfe\x9c\xeb\x1d\
+\x0e\xe2\xa6\xb2\xa4\xfb\x99\x2f\xd0\xc8\xe1\xf4\x07\x48\xe1\xb3\
+\xb9\xfa\x03\xe3\xd5\x8f\x04\x00\x85\x31\x56\xc1\x39\x5f\x23\x84\
+\x28\x96\x95\x77\x83\x83\x83\x7c\x70\x70\x10\xa6\x69\x82\x52\x3a\
+\x69\xc2\x98\x74\xe3\x25\xa1\x47\xd3\x34\xa4\x52\x29\x1c\x3f\x7e\
+\x1c\xbd\xbd\xbd\xf2\x3b\x11\x8d\x46\x91\x48\x24\x48\x71\x71\x31\
+\xe6\xcf\x9f\x8f\x70\x38\x7c\x19\x09\x69\xa6\x40\xc6\x48\x12\x89\
+\x04\x82\xc1\xa0\x34\x08\xb2\xb6\x84\xbb\xab\xff\x94\x07\xd8\xaf\
+\xc7\x00\x70\xb8\x02\x20\xef\xbf\xff\xbe\xf2\x97\x7f\xf9\x97\xfc\
+\xef\xfe\xee\xef\x2e\x0a\x21\x5e\xb1\x2c\xeb\x54\x5b\x5b\xdb\xc6\
+\x17\x5e\x78\x61\x5b\x6d\x6d\x6d\xf1\xb6\x6d\xdb\xc8\x86\x0d\x1b\
+\x10\x08\x04\x6c\x00\x0a\xe7\x9c\xfa\xc5\x1a\xee\x64\xf8\x99\x64\
+\xae\x4b\x99\xff\x0c\x19\x1c\x03\x30\xd1\xd6\xe0\xb3\x0c\x4a\xc6\
+\x54\x94\x01\x38\xad\xba\x6d\xdb\x1e\x37\x19\x27\xe3\x96\xe7\xd3\
+\x66\x09\x21\x88\x46\xa3\x32\x95\xe7\x79\x67\x75\x75\x75\xe4\xfe\
+\xfb\xef\xa7\xcb\x96\x2d\xa3\x4b\x96\x2c\xf1\x82\x8c\x7e\xa9\xad\
+\xdb\x6d\x04\xf2\xef\x37\x1e\x8f\x13\x5d\xd7\xf3\x53\xe8\xc4\x5d\
+\x4c\xa7\x1c\xd7\x6b\x00\x00\x80\x6c\xdf\xbe\x5d\x81\x63\x0c\x3a\
+\x00\xf4\x12\x42\x3e\xfe\xe8\xa3\x8f\xf0\xe1\x87\x1f\xae\x5a\xb8\
+\x70\x61\x59\x69\x69\x29\x56\xaf\x5e\x0d\x5d\xd7\x19\x1c\x09\x23\
+\x30\xc6\xee\x0a\x56\xa0\x5f\x70\xc2\xdd\xaf\xd9\x84\x10\xff\x73\
+\x54\xe0\x28\x02\xa9\x18\xd3\x04\x04\x3e\x5b\xa9\xd1\xfc\x7b\x15\
+\x84\x90\x0c\x80\x01\x38\xcd\x65\x01\x00\x85\x85\x85\x24\x14\x0a\
+\x8d\x73\xcb\x27\xb3\x40\xe4\x07\x07\xa5\x47\x50\x54\x54\x84\xae\
+\xae\x2e\x59\x95\x49\x6a\x6a\x6a\xf0\xb9\xcf\x7d\x8e\x3c\xf8\xe0\
+\x83\x50\x55\xd5\x2b\x42\xf2\x57\x06\xde\x6e\xf8\xee\x43\x00\xc0\
+\xd0\xd0\x10\xc9\x64\x32\x34\x8f\x44\x77\x11\x40\x3f\x21\xc4\xcc\
+\xfb\xf8\x4d\x7b\x04\x37\x1a\x03\x20\x00\xa0\xaa\x2a\x73\x27\xb9\
+\x31\x3a\x3a\xda\x0d\x20\xdb\xda\xda\xca\x07\x06\x06\x88\x6d\xdb\
+\xe3\x74\xf0\x67\x52\xc0\xe5\x3a\x20\x5c\x6a\xb3\x37\x52\xa2\xd1\
+\xe8\x50\x51\x51\xd1\x89\x54\x2a\xd5\x01\x20\x0a\x60\x11\x80\x06\
+\xdf\x8b\x0c\x03\x58\x0a\xe0\x3e\x00\x97\xe0\x54\x4e\x8e\xe2\xf2\
+\xee\xc9\x77\xe4\x03\xb9\x1e\xf8\x2b\xf4\x38\xe7\x36\xe7\x3c\x13\
+\x89\x44\x72\x35\x35\x35\x6a\x65\x65\xa5\xb2\x69\xd3\x26\xcc\x99\
+\x33\xc7\x5b\xd1\x25\x29\x67\x22\x23\x20\x8f\xf1\xf3\x03\xfa\xfb\
+\xfb\xd1\xd6\xd6\x86\x8e\x8e\x0e\x9c\x3e\x7d\x1a\x8c\x31\x04\x02\
+\x01\xb8\x6d\xb3\x48\x34\x1a\x45\x75\x75\x35\xc2\xe1\xf0\x65\xe7\
+\xb9\x9d\xc8\x17\x1e\x75\x73\xff\xe2\xd2\xa5\x4b\xa2\xb1\xb1\x51\
+\x69\x6d\x6d\x95\x3d\x10\xfb\x85\x10\x6d\x00\xf6\x13\x42\x4e\xab\
+\xaa\x9a\xc9\xe5\x72\xfe\xe6\xb3\x37\xad\x0d\x70\x33\x9a\x80\xce\
+\x7f\x8c\x3d\x4c\x05\x00\x0b\x04\x02\x36\xa5\x54\xb1\x6d\x7b\x9c\
+\x34\xd6\x9d\xe8\xfa\x2b\x8a\x22\x6b\xb0\x3d\x03\x50\x5e\x5e\xde\
+\xfd\x85\x2f\x7c\xe1\x5f\xbe\xff\xfd\xef\xbf\x0f\x60\x1e\x80\x3f\
+\x04\xd0\xe0\xfb\x58\x01\x9c\xc9\x1f\x00\x70\x10\xc0\x07\x70\x5a\
+\x3c\xc9\xcc\x81\x3f\x40\x76\x57\x43\x2a\xf3\xb8\xcd\x38\x29\x00\
+\xad\xb4\xb4\x54\xdb\xbe\x7d\x3b\x79\xe8\xa1\x87\x50\x57\x57\x87\
+\xca\xca\xca\x71\x81\xbd\x2b\x6d\x13\xa5\x68\x87\xa6\x69\xde\x31\
+\x6d\x6d\x6d\x78\xf9\xe5\x97\x71\xf0\xe0\x41\x74\x77\x77\xa3\xab\
+\xab\xcb\x8b\xf2\xbb\x2d\xdc\x26\xcc\xfd\xdf\xce\xb1\x38\x91\x37\
+\x9c\xc9\x64\xf0\xe9\xa7\x9f\xf2\xd7\x5f\x7f\x5d\x34\x35\x35\x29\
+\x6d\x6d\x6d\xc4\xb2\x2c\xae\x69\xda\x79\xc6\xd8\x6f\x00\xbc\x4b\
+\x08\xe9\x1e\x1d\x1d\x4d\xc1\x19\x3f\xb2\x15\xdd\x4d\x17\x05\xdd\
+\x54\x16\xc0\x5d\xe5\x09\x21\x24\x4a\x29\x2d\x02\x10\x2b\x2d\x2d\
+\xd5\xe3\xf1\xf8\xb8\x2e\xab\x77\x32\x14\x45\xc9\xa7\xad\x1a\xcb\
+\x96\x2d\xbb\x24\x84\x68\x5c\xb9\x72\x25\xce\x9c\x39\x33\x92\xb7\
+\xaa\x44\x00\x2c\x87\x53\x23\xc1\xe0\x70\xb7\x9b\x31\xf6\xa2\x28\
+\x3e\x03\xab\x3f\x30\x3e\xd0\xe6\x32\x48\x69\x34\x1a\xa5\x2b\x57\
+\xae\xc4\x13\x4f\x3c\xe1\xfd\xcd\x2f\xfa\x79\xa5\x3d\xb9\x5f\x3e\
+\x4c\x1e\xd3\xd3\xd3\x83\x8f\x3e\xfa\x08\xef\xbf\xff\xbe\xff\x50\
+\x0e\x27\x52\xce\x86\x87\x87\xe9\xe0\xe0\xa0\xca\x18\x53\x67\x52\
+\xd0\x4f\x12\x94\xfc\xdb\x90\x8e\x8e\x0e\xf1\xce\x3b\xef\xf0\xb6\
+\xb6\x36\x79\x18\x0d\x06\x83\xfd\xaa\xaa\x7e\x3c\x3a\x3a\xba\x3f\
+\x99\x4c\xca\xdf\x07\x30\xe6\x4d\xde\x74\x90\xf9\x46\x9f\x08\xf1\
+\xfd\x4b\x01\x68\xaa\xaa\x46\x15\x45\x29\x91\xaa\xab\xae\x9e\xdb\
+\x9d\xbe\x05\x90\xf7\xe7\x4f\x73\xc6\x01\xac\x03\xf0\xd8\xdf\xfc\
+\xcd\xdf\x6c\x5b\xb0\x60\x41\x95\x6b\xd5\x39\x00\xa6\x28\x8a\x4a\
+\x29\xd5\xe1\x78\x07\x95\x70\x0c\x42\xfe\x39\xef\x3c\x77\xe8\x06\
+\x60\xdb\x36\xc9\x66\xb3\x2a\x9c\xf1\xa1\xa8\xaa\x4a\x82\xc1\x20\
+\x0a\x0a\x0a\x2e\x9b\x8c\xd7\x13\xfc\x93\x45\x3f\xd9\x6c\x56\x0c\
+\x0d\x0d\xe5\x7b\x52\xc3\x00\x3e\x02\xf0\x12\x21\xe4\xad\x58\x2c\
+\xd6\x2e\x95\x75\xdc\x2d\x04\x9b\x4a\x45\x9d\x1b\x41\x3e\x19\x29\
+\x18\x0c\x42\xd3\x34\x91\x4a\xa5\xfc\xae\x3d\x14\x45\xb1\x42\xa1\
+\x50\x32\xef\xe3\x53\x3a\x7e\x6e\xca\x03\x50\x55\x95\xeb\xba\xce\
+\x01\x98\xa6\x69\x5a\x00\x6c\xc9\xc0\xba\x4b\x40\xe0\x3e\x23\x59\
+\xba\xaa\x28\x4a\x05\x80\x2f\x01\x78\x44\x51\x94\x40\x45\x45\x45\
+\x79\x63\x63\x23\x84\x10\x5c\x08\xc1\x15\x45\x51\xdc\x63\x09\x9c\
+\x62\x8d\xfc\x67\x3c\x2e\x36\x72\x97\xc3\xe3\x43\x50\x4a\x3d\xc5\
+\x5e\x59\xa4\x33\xee\xc0\xeb\x28\xfc\x91\x13\x48\xd3\x34\x51\x50\
+\x50\xc0\x30\x5e\x9f\x31\x05\xe0\x53\x00\x9f\xde\x7b\xef\xbd\x73\
+\xeb\xea\xea\x8a\x75\x5d\x9f\xef\x2b\x1a\xe2\x6e\xe3\x97\xdb\xe6\
+\x0e\x4c\xb4\x0d\x91\xfa\x9a\x43\x43\x43\x80\xbb\xc7\xe7\x9c\xab\
+\x86\x61\xc4\xf2\x3e\x7e\xdb\x55\x81\x01\x9f\xeb\x91\xc9\x64\x08\
+\x21\xc4\xa6\x94\x76\x0a\x21\x0e\x9b\xa6\xd9\xd0\xd1\xd1\x11\x3f\
+\x71\xe2\x44\x41\x79\x79\x39\x89\x46\xa3\xd0\x34\x4d\x92\x67\x3c\
+\x81\x83\x3b\x24\x26\xe0\x59\x5b\x9f\x0b\x1a\x82\xd3\x04\x14\xb1\
+\x58\x0c\xb1\x98\xf3\x7e\x84\x10\x1c\x00\xa7\x94\xca\x7e\x01\x77\
+\xc4\x0d\x4e\x27\x54\x55\xe5\x9a\xa6\x71\x00\x43\xa6\x69\x8e\x02\
+\x60\x83\x83\x83\x90\x3f\xf9\x0a\x40\x93\x81\x8c\x2b\x00\x40\x71\
+\x71\x31\x4a\x4b\x4b\x65\xe0\xcf\x0b\x02\xce\x9b\x37\x0f\x5b\xb7\
+\x6e\xc5\xb7\xbf\xfd\x6d\xcc\x99\x33\xc7\xa3\x0b\xcb\x6d\xc0\xed\
+\xd8\x0a\xf8\x57\x7c\xf9\xfd\xa3\xa3\xa3\x18\x1a\x1a\xc2\xc0\xc0\
+\x00\x2e\x5d\xba\x44\x35\x4d\x43\x20\x10\x20\x8c\x31\xc5\xcd\x32\
+\x69\x8c\xb1\x28\x9c\xb2\xfb\xab\x11\xcf\x6e\x18\x37\xd3\x17\x80\
+\xff\xe5\x5f\xfe\x25\x7d\xff\xfd\xf7\x29\x00\xbb\xa0\xa0\xe0\xb8\
+\x65\x59\x3f\xb7\x2c\x6b\xe1\xd1\xa3\x47\xef\xeb\xee\xee\x5e\xb7\
+\x6c\xd9\x32\x75\xcb\x96\x2d\x58\xb8\x70\x21\x77\xd9\x4c\x8a\x6d\
+\xdb\x44\x06\x7b\xee\x24\x4c\xe4\xa2\xfa\x02\x56\xe3\xac\xb2\x9b\
+\xc3\x95\x14\xd7\xcf\xa2\x21\x98\x28\xf8\x9b\x01\xc0\x93\xc9\x24\
+\xa4\xe2\x2f\xae\x73\x8b\x98\x7f\x4c\x2c\x16\x23\xc1\x60\x50\x91\
+\x51\x75\x4d\xd3\x30\x77\xee\xdc\x82\xa7\x9f\x7e\x7a\xf5\x77\xbe\
+\xf3\x9d\xb2\xba\xba\xba\x38\x80\xb9\x3e\xef\x0d\xb2\xeb\xd3\x4d\
+\xdf\xe1\x75\xc2\xa7\x7f\x28\x00\x08\xc6\x98\x38\x7f\xfe\x3c\xf6\
+\xec\xd9\x43\x4e\x9e\x3c\x49\x1b\x1b\x1b\xe9\xd0\xd0\x90\xdf\x3b\
+\xe0\x96\x65\x65\x84\x10\x16\xc6\x8f\xaf\xdb\x46\x04\xf2\x83\x01\
+\xc0\x0f\x7e\xf0\x03\xfa\x83\x1f\xfc\x40\x05\x60\x0c\x0d\x0d\x9d\
+\xf9\xf8\xe3\x8f\x9b\x76\xee\xdc\xd9\xf0\xc6\x1b\x6f\x94\x02\x58\
+\xb7\x73\xe7\xce\xc0\xfc\xf9\xf3\xc9\xf2\xe5\xcb\x65\xbd\xb2\xe2\
+\xe7\x62\xdf\x49\x98\xc8\x6d\x1b\x1e\x1e\xf6\x53\x4e\x25\x63\xcb\
+\xd3\xa8\xc7\x67\xb7\x34\x3a\x7f\x62\x53\x38\x29\x53\xa5\xa8\xa8\
+\x08\xd2\x2b\xc4\x75\x66\x89\xf2\x8f\x49\x26\x93\xc4\x30\x0c\xc5\
+\xb2\x2c\x6f\x75\x8f\x44\x22\x89\xea\xea\xea\xcd\x65\x65\x65\x52\
+\x98\x46\xcd\x8b\xbc\xdf\x96\x81\x27\x8d\x90\xaa\xaa\xc4\xad\x4e\
+\x24\x5d\x5d\x5d\xe2\xad\xb7\xde\xc2\xdb\x6f\xbf\x0d\xdb\xb6\xa9\
+\x6d\xdb\xc4\x7d\x2e\x1c\xc0\x79\xdb\xb6\xdb\xe1\x34\x9a\xcd\xe7\
+\x93\xdc\xf6\x2d\x80\x84\xb7\x97\x0a\x04\x02\x16\xa5\xd4\x32\x0c\
+\xa3\x0d\xce\x05\xc7\x7a\x7b\x7b\xe5\x8b\xf6\x2e\x7a\x26\xe4\x61\
+\x6f\x12\xd2\x98\x31\xcb\xb2\x14\x21\x84\xa6\x28\x0a\x11\x42\x28\
+\x79\xed\x9d\xfd\x51\x7f\x99\xba\xb9\x9b\xa9\xc1\xd2\xdb\x11\x7f\
+\xf4\x47\x7f\xc4\x87\x86\x86\x70\xec\xd8\xb1\x12\x4a\x69\x6d\x5f\
+\x5f\x5f\xd5\x82\x05\x0b\x56\x16\x14\x14\x44\x6b\x6a\x6a\x78\x5d\
+\x5d\x1d\x51\x55\xd5\xf3\x92\xae\x14\xa1\xf7\xf3\x03\xe4\x31\xa3\
+\xa3\xa3\xb8\x78\xf1\x22\x3a\x3a\x3a\xf0\xc9\x27\x9f\xa0\xbb\xbb\
+\xdb\x3b\x96\x31\x86\x54\x2a\x45\x43\xa1\x50\xc0\xaf\x2d\x38\x13\
+\xc6\x9c\xff\x1a\xdc\x18\x04\x54\x55\x25\xbd\xbd\xbd\x32\x26\x22\
+\xe0\xf0\x4e\x46\x28\xa5\x2d\x00\x3e\x06\x70\x18\x40\x3f\xc6\x9e\
+\xed\x94\x6f\x03\xa6\xa3\xe3\x48\x18\xce\x3e\x19\xa1\x50\x68\x9c\
+\x00\xc3\x5d\x02\x59\xec\x42\x29\xa5\x8a\x2c\x30\x61\x8c\xe5\xb3\
+\xb7\x80\xb1\x0e\x4a\x1a\xa6\x20\x67\x3b\xc3\x41\xe1\xd0\x7d\xad\
+\x1f\xfd\xe8\x47\x4e\xba\x24\x1e\x9f\x4f\x08\x79\x5a\xd7\xf5\x75\
+\xcb\x97\x2f\xaf\xdc\xb1\x63\x47\x62\xde\xbc\x79\xac\xb6\xb6\x96\
+\x68\x9a\xa6\x5a\x96\xa5\x2a\x8a\xe2\x6d\x09\xf3\x57\x78\xe1\xeb\
+\x1b\x20\xab\xf7\x86\x86\x86\xf0\xee\xbb\xef\xe2\xad\xb7\xde\x42\
+\x67\x67\x27\xda\xdb\xdb\xc7\x7d\x26\x9d\x4e\x63\x64\x64\xe4\x96\
+\xdd\xf4\xcd\xc0\x9d\x1f\xb2\x5e\x86\xc3\xd1\xfc\xef\xa3\x94\xbe\
+\x0f\xe0\x37\x00\x3a\x00\xf4\x62\x6c\xcc\x4d\xf9\x22\x32\x65\xd5\
+\x80\xb9\x5c\x4e\x8a\x86\xc6\x14\x45\x49\x03\xe8\x0b\x04\x02\xb1\
+\xfe\xfe\x7e\xcd\x30\x0c\x12\x0c\x06\xc9\x5d\xd2\x37\xc0\x1f\x18\
+\x14\x86\x61\x08\xc3\x30\x24\x31\x43\xc0\x99\xec\xf2\x38\x06\xa7\
+\x5d\xb8\x71\x3b\x2e\xf4\x16\xc3\x6b\x5a\x19\x0c\x06\xb9\x1b\xc4\
+\x2a\x01\xb0\x31\x18\x0c\x6e\x8f\x46\xa3\xd8\xb2\x65\x0b\x6a\x6b\
+\x6b\x73\xf2\x38\xcb\xb2\xe8\xb5\xd8\x7f\x7e\xd1\x4f\x42\x08\x46\
+\x47\x47\x71\xe2\xc4\x09\xbc\xfe\xfa\xeb\xe3\xfe\x26\xa9\xbe\x95\
+\x95\x95\xa0\x94\x8a\x91\x91\x11\xe1\x7a\x01\xc4\xc5\xad\x78\x06\
+\x57\x84\x8f\x15\x29\x84\x10\x8c\x73\xce\x87\x86\x86\x78\x20\x10\
+\xe0\x8a\xa2\x84\x5d\x0f\x52\x11\x42\x30\x45\x51\x1a\xe1\xa4\x32\
+\x65\x3a\x4d\x36\x05\x05\x66\x48\x0c\x40\x42\x0e\x7c\xfc\xf8\xc7\
+\x3f\x56\xcf\x9e\x3d\xab\x86\x42\xa1\xd1\x48\x24\x72\xd0\x34\x4d\
+\x61\x59\x56\xdd\x81\x03\x07\x56\x76\x77\x77\x57\x2e\x5e\xbc\x18\
+\x8b\x16\x2d\x42\x3c\x1e\x67\x32\x48\x26\xe3\x01\xb7\xfb\xe5\x4c\
+\x06\xc2\x01\x30\x7e\xdf\x9a\x1d\x1d\x1d\x4d\xc3\x79\x51\x0a\x80\
+\x28\x21\x24\xe8\xbb\x9f\x1c\x9c\xbc\xb4\x1f\x77\x6b\x60\x90\xc0\
+\x11\xae\x20\x00\xe0\x4a\xc4\xa9\x00\x0a\x0c\xc3\x80\x6d\xdb\x28\
+\x28\x28\x00\x7c\xdb\xc1\xc9\x88\x73\xc8\xbf\xcb\x3d\x74\x2e\x97\
+\xc3\xc8\xc8\x88\x9c\xfc\x02\x00\xd7\x34\x0d\xcb\x96\x2d\x23\xcb\
+\x96\x2d\x23\xf5\xf5\xf5\x58\xbc\x78\x31\x57\x14\x85\x9b\xa6\x49\
+\x54\x55\xa5\x84\x90\xdb\x25\x4d\x2f\x38\xe7\xc2\x0d\x3c\x42\x08\
+\x81\x6c\x36\x9b\xe9\xef\xef\xbf\xd4\xd6\xd6\x36\x74\xec\xd8\x31\
+\xad\xaf\xaf\xaf\x4c\xd3\xb4\xb0\x10\x02\xa6\x69\xc2\xb6\xed\xb8\
+\x9b\x51\xf2\xe7\xd2\xa7\x2d\x6d\x79\xb3\x06\xc0\xe3\x22\xff\xf8\
+\xc7\x3f\x46\x32\x99\xe4\x95\x95\x95\x7d\xf3\xe7\xcf\x7f\xf7\xe8\
+\xd1\xa3\x9f\x9c\x3b\x77\xee\xbe\x8b\x17\x2f\xc6\x23\x91\x48\xe5\
+\xd3\x4f\x3f\x4d\xcb\xca\xca\x50\x5c\x5c\xcc\xdc\x07\x42\x6d\xdb\
+\x96\x29\xc2\x9b\xbe\x91\xe9\xc6\x44\xd7\x18\x08\x04\x8c\x60\x30\
+\x38\x08\x67\x95\x0f\xc3\xc9\xfb\xe7\x0f\xea\x89\x5e\xdc\xdd\xba\
+\x15\x90\xf7\x45\xdc\xc0\x9c\x0d\x60\x04\x70\xf8\xee\xc9\x64\x12\
+\x85\x85\x85\x9e\x01\x9c\x8c\x37\x28\xff\xee\xaf\x05\x88\xc5\x62\
+\xa0\x94\x7a\x1e\x80\xae\xeb\x62\xf5\xea\xd5\xf8\xd2\x97\xbe\x44\
+\xea\xeb\xeb\x49\x22\x91\xa0\xba\xae\x53\xcb\xb2\x20\x84\x20\x72\
+\x7b\x71\xab\xc7\x99\x9b\x9a\x14\x72\x91\x23\x84\x20\x9b\xcd\x66\
+\x8f\x1c\x39\xd2\xf6\xff\xfe\xdf\xff\xbb\xd8\xd2\xd2\x12\x6d\x6f\
+\x6f\xd7\x2d\xcb\xaa\x96\x06\x8a\x31\xc6\x39\xe7\x01\xb8\xd4\x7a\
+\xf7\x54\xd3\x16\x4c\x9e\x8a\x18\x80\x00\x80\xc3\x87\x0f\x4b\x5a\
+\xb0\x71\xe9\xd2\xa5\x5e\xcb\xb2\x7a\x19\x63\x65\x70\x3c\x84\xc0\
+\xda\xb5\x6b\x65\x5f\x38\x6f\x0f\x33\xd3\xe4\x99\xae\x86\xfc\x92\
+\x55\x42\x08\x8a\x8a\x8a\xb0\x66\xcd\x1a\xf4\xf5\xf5\x61\x60\x60\
+\x80\x0c\x0e\x0e\x52\xf7\x7e\x84\xf3\x11\x52\x28\x84\x58\x06\x60\
+\x10\x0e\x41\x65\x18\xe3\x0b\x38\xee\x1a\x52\xd0\xb6\x6d\xdb\x78\
+\x5f\x5f\x1f\x28\xa5\x42\xd3\x34\x61\xdb\x36\x16\x2c\x58\xc0\x15\
+\x45\x19\x09\x85\x42\x66\x55\x55\x15\x35\x4d\x73\xdc\x32\x7c\x3d\
+\xde\x9f\xa4\xcd\xca\xdc\x7f\x71\x71\x31\x86\x87\x87\x09\xe7\x5c\
+\x91\xae\xff\x9a\x35\x6b\x24\xb7\x80\x00\x18\x27\x0a\x72\x3b\x16\
+\x19\xff\x16\x46\x6e\x51\x72\xb9\x1c\x9a\x9a\x9a\xc4\x6b\xaf\xbd\
+\x26\xf7\xfe\x54\x51\x14\x46\x29\x4d\x01\x48\x0a\x21\xce\x0a\x21\
+\x92\x70\xb2\x26\x19\x8c\xc5\x8e\xa6\x25\x80\x3c\xd5\x41\xc0\x7c\
+\xcb\x2e\xd3\x3f\xd0\x75\x1d\x6e\xd7\xa0\x71\x29\xa2\x3b\xc5\x00\
+\xc8\xc1\x2a\xa3\xcd\x94\x52\x54\x54\x54\x04\x3f\xff\xf9\xcf\x17\
+\x2d\x5d\xba\xd4\xfa\xe0\x83\x0f\xf4\xb7\xdf\x7e\x3b\x30\x30\x30\
+\x20\xdc\xce\x2d\x54\x51\x94\x5a\xce\xf9\x93\x9c\xf3\xe5\x00\xf6\
+\x03\xd8\x03\xa7\x24\x56\xde\x74\xbe\xae\xfb\x1d\x8b\xf7\xdf\x7f\
+\x9f\xc3\x89\x62\x83\x31\x86\xba\xba\xba\xc0\xb3\xcf\x3e\x1b\x2d\
+\x2a\x2a\x0a\x84\x42\x21\xb2\x64\xc9\x12\xea\xd6\xe3\x7b\xee\xf8\
+\x8d\x88\x7e\xc6\xe3\x71\xaf\x21\xad\xdc\xfb\x07\x02\x81\x71\x9d\
+\x7e\x66\x0a\x5c\x03\x30\xee\x06\x03\x81\x40\x68\x74\x74\xb4\x0a\
+\x4e\x87\xed\x00\x80\x38\x21\x24\xa3\xaa\xea\x91\x5c\x2e\xb7\x0f\
+\xc0\x39\x00\xa7\xe0\xf4\xe0\xa4\x18\x2f\xfb\x3d\xe5\x93\x65\x2a\
+\x9f\xd8\x38\x79\x30\xf7\xc5\x45\x00\x18\x52\xef\x3d\x95\x4a\xa1\
+\xb0\xb0\xd0\x23\x62\xdc\x29\xfb\x7f\x60\x2c\x75\xe3\xaf\x5c\x2b\
+\x2a\x2a\x0a\xad\x5f\xbf\x3e\xb8\x74\xe9\x52\x91\x4c\x26\xc9\xc7\
+\x1f\x7f\x4c\xba\xba\xba\xe0\x1a\x00\xa2\xaa\x6a\x95\x65\x59\x73\
+\x00\xa4\xdd\xd3\x1c\x81\x13\xd5\x95\xb8\xd3\x35\x03\xbd\xf4\x94\
+\xae\xeb\xdc\x57\xdc\x13\x68\x6e\x6e\x5e\x50\x53\x53\x53\xfb\xd0\
+\x43\x0f\xc5\xe7\xcc\x99\xa3\x69\x9a\x06\x5d\xd7\x21\x84\x20\x9c\
+\x73\x32\x59\x2e\x48\xfe\xf8\x18\x1c\x1c\x44\x3a\x9d\xf6\x44\x3f\
+\x09\x21\x30\x4d\x13\xe9\x74\x1a\xfd\xfd\xfd\x32\xce\x30\xe1\x67\
+\x6f\x35\x26\x8a\x3e\xf6\xf4\xf4\x84\xd2\xe9\xf4\xbc\x60\x30\x48\
+\x0d\xc3\x50\xe0\xb0\x63\x0d\x21\x44\xa3\xaa\xaa\x2f\x5b\x96\x75\
+\x0e\x6e\x17\x60\x38\x06\x02\x18\x23\xdf\x4d\x39\xa6\xd2\x00\xc8\
+\xc9\x4f\x4e\x9d\x3a\xa5\xfd\xe9\x9f\xfe\x29\xfd\xf4\xd3\x4f\x53\
+\x94\xd2\x03\xba\xae\xb3\xd1\xd1\xd1\xb9\x1f\x7d\xf4\x51\x75\x57\
+\x57\x97\x5e\x55\x55\x85\xb2\xb2\x32\xaf\x8d\x98\x10\x82\xc8\x7c\
+\xef\x9d\x00\xe9\xb9\xb8\xc2\x8d\x24\x10\x08\x20\x1a\x8d\x22\x9d\
+\x4e\xcb\x7e\x88\x0e\xfb\x85\x52\x85\x38\x2a\x38\x41\x00\xe5\x70\
+\xd2\xa3\xfe\x7a\xee\x3b\xc3\xfa\x5d\x19\x32\x38\xc5\x4d\xd3\x94\
+\x5b\xc0\x88\xaa\xaa\x8b\x00\x6c\x49\xa7\xd3\xab\xea\xeb\xeb\x65\
+\x55\x24\x00\xd0\x6c\x36\x4b\x15\x45\x11\xaa\xaa\x4a\x83\x71\x59\
+\x50\x34\xaf\x5e\x5e\xc8\x7a\xf9\xf6\xf6\x76\x9c\x3b\x77\x8e\x36\
+\x37\x37\xc3\xdd\xdf\x0f\x0a\x21\xba\x86\x86\x86\x0c\xd3\x34\x13\
+\x96\x65\x55\x98\xa6\x19\x96\xdb\x05\xe2\x6b\x53\x77\x0b\x9e\xc5\
+\x95\xae\x1f\xa6\x69\xa2\xb3\xb3\x53\xb4\xb7\xb7\xa3\xb9\xb9\x99\
+\xb6\xb5\xb5\x45\xdc\x62\x39\x79\x1f\x1a\x63\xcc\x0e\x87\xc3\x6d\
+\xc9\x64\xd2\xaf\xfb\x3f\xed\xac\xc5\xa9\x36\x00\x82\x10\x82\xdd\
+\xbb\x77\x63\x64\x64\x84\x95\x96\x96\xb6\x68\x9a\xf6\x52\x7f\x7f\
+\xff\xc7\xa7\x4e\x9d\xda\xd1\xde\xde\xfe\x78\x4d\x4d\x4d\xc5\x63\
+\x8f\x3d\x46\x1f\x78\xe0\x01\xc4\x62\x31\x9b\x10\xa2\x0a\x21\x88\
+\x5f\xe8\xf1\x4e\x44\x36\x9b\xf5\x17\xb9\x4c\x74\x13\xb2\x68\xc5\
+\xaf\xea\x7a\x67\xec\x7f\xae\x0e\xea\xfb\x57\x09\x04\x02\xa5\x84\
+\x90\xfb\x09\x21\x4f\xb7\xb5\xb5\x95\x0f\x0f\x0f\x17\x26\x12\x09\
+\xb9\x19\x0f\xe4\x72\x39\xea\x4e\x7e\xe6\x2b\xca\x19\x9b\xed\xe3\
+\x59\x7b\x82\x52\xca\x73\xb9\x9c\x38\x72\xe4\x88\x78\xf5\xd5\x57\
+\x49\x73\x73\x33\x6d\x6f\x6f\x97\xfb\xfb\x2e\x38\xe9\xb2\x81\xf2\
+\xf2\xf2\xfa\x78\x3c\x1e\x55\x55\x35\x2c\xc7\x10\x21\x84\x13\xa7\
+\x0d\xd9\x2d\x1b\x54\x57\xa9\xf7\x17\x6f\xbc\xf1\x86\x68\x6a\x6a\
+\x12\xed\xed\xed\xc8\x64\x32\xaa\x3f\xa6\x64\x59\x56\xc8\x30\x8c\
+\x30\x2e\xcf\x1a\x4d\x2b\xa6\x7a\x0b\x20\x00\x10\xb7\x91\x28\x53\
+\x14\xa5\x57\xd3\xb4\x5e\xc3\x30\xe8\xc0\xc0\xc0\x5c\x00\x8f\xd6\
+\xd6\xd6\x86\x56\xac\x58\x81\x60\x30\x28\x05\x37\x84\xbf\x1e\xfc\
+\x4e\x80\x34\x54\xae\x27\x20\x46\x47\x47\xa1\xaa\x2a\xa9\xad\xad\
+\x45\x2e\x97\x83\x6d\xdb\xb2\x47\x9d\xcc\x1d\x8e\xc0\x09\x04\xa6\
+\xe1\xec\xed\xee\x16\x78\xe9\x29\x5d\xd7\x19\xa5\x94\xb9\xc2\x1f\
+\xf5\x00\x36\x9c\x39\x73\x46\x7b\xf7\xdd\x77\xb1\x6b\xd7\x2e\x44\
+\x22\x11\xcb\xd5\xbc\x27\x3e\xcf\x68\x42\xf8\xea\xe5\x89\xac\xae\
+\x6c\x6f\x6f\xe7\xef\xbe\xfb\xae\xbf\x5e\x1e\x9a\xa6\x19\xe1\x70\
+\x78\x60\xde\xbc\x79\x3d\xab\x56\xad\x2a\x8d\xc7\xe3\x96\xdf\x8b\
+\x9c\x2e\x1d\xbd\x6b\xe1\x1a\xf5\xfe\x02\x6e\x8a\xcf\xf5\x02\x6c\
+\x21\x44\x9a\x31\x96\x86\x13\x17\xf0\x4b\xaa\xdf\xb4\xe2\xcf\xb5\
+\x30\x5d\x51\x93\x7c\x8a\xa7\x0c\x64\x24\x52\xa9\x14\x34\x4d\x93\
+\x37\xcf\xe1\xba\x78\xb2\x47\xda\x9d\xe0\x01\xc8\xb4\x12\xe7\x5c\
+\xc8\x48\xf3\xa2\x45\x8b\xc4\x33\xcf\x3c\x43\x9a\x9a\x9a\xc4\xc9\
+\x93\x27\xed\x53\xa7\x4e\x09\xdb\xb6\xa9\x9b\x31\xb0\x54\x55\x1d\
+\xb1\x2c\xab\x3f\xef\x54\x33\xff\x66\xaf\x0e\xcf\xbd\xf6\xc5\x7d\
+\x86\xdd\xdf\x69\x9f\x7e\xfa\x29\x5e\x79\xe5\x15\xf4\xf6\xf6\x62\
+\xfd\xfa\xf5\xda\xea\xd5\xab\x27\xdc\xf7\xfb\xcb\xc7\x85\xdb\xc1\
+\x87\x73\xee\xb1\x48\x83\xc1\x20\x74\x5d\xa7\xa3\xa3\xa3\xde\xec\
+\x56\x14\x05\x8b\x16\x2d\x4a\x3c\xfe\xf8\xe3\xf5\x3b\x76\xec\x28\
+\x59\xbe\x7c\x79\x8d\xa6\x69\x21\xe9\x49\xba\xf1\xa5\x5b\x5e\xf8\
+\x23\x84\x10\x8c\x31\x4e\x29\xe5\x8a\xa2\x10\x38\xc2\x1e\x54\xd7\
+\x75\x59\xef\x2f\xaf\xc7\x54\x14\xa5\x93\x31\x76\x82\x31\x76\x1e\
+\xc0\x21\x38\xd2\x71\x3a\x9c\xfd\xbf\xec\xff\x77\x47\x1a\x00\x01\
+\xe7\x59\xc8\x41\x41\xe0\xec\x7f\x45\x3c\x1e\xf7\x8b\x40\x12\xf8\
+\x4a\x84\xef\x04\xf8\x69\xab\x8c\x39\x9c\xa6\x70\x38\x8c\x55\xab\
+\x56\xa1\xae\xae\x0e\x4d\x4d\x4d\xf8\xc5\x2f\x7e\x21\x1a\x1b\x1b\
+\xb9\x61\x18\x8a\x10\x42\x51\x14\x45\xd7\x75\x5d\x0b\x06\x83\x6a\
+\x3a\x9d\xbe\xf6\x97\xdc\x39\xf0\x5e\x9c\xcf\x83\x23\x70\x08\x50\
+\x76\x2a\x95\x52\x7f\xfb\xdb\xdf\xe2\xec\xd9\xb3\x30\x4d\x13\xcb\
+\x96\x2d\xf3\x22\xf8\x7e\xf8\xbd\x3f\x39\x66\xf2\xc7\x44\x30\x18\
+\x44\x51\x51\x11\xfa\xfb\x1d\x1b\xaa\x28\x0a\x6a\x6b\x6b\xe7\x6e\
+\xdc\xb8\x31\xba\x65\xcb\x16\x4b\xd3\xb4\x10\xa5\xb4\xc0\xb6\x6d\
+\x7f\xc3\xcf\xdb\x52\xf9\xe7\x96\xbe\x8f\xbb\x01\x5d\xd7\x45\x3c\
+\x1e\x17\x43\x43\x43\x92\x1a\x2e\x08\x21\x17\x29\xa5\xaf\x02\xd8\
+\x07\x27\x4d\x9c\x2f\xfe\x31\xed\xdb\xc4\xe9\x32\x00\x1c\x80\xb0\
+\x6d\x9b\x02\x50\x09\x21\xe1\x70\x38\x9c\x14\x42\x1c\x8d\x44\x22\
+\x0b\x07\x07\x07\xe3\x27\x4e\x9c\x28\xa8\xac\xac\xa4\x45\x45\x45\
+\x52\xb4\xd1\x63\x87\xcd\x04\xea\xe6\xd5\xe0\xbf\x36\xe1\xea\xd3\
+\x17\x16\x16\xa2\xb0\xb0\x10\xb1\x58\x8c\xbe\xfd\xf6\xdb\x51\xd9\
+\x8f\xce\x85\x4a\x08\x99\x9b\xc9\x64\xd6\x00\x68\x82\xb3\x4a\xa6\
+\x30\xfe\xe5\xde\x49\x9c\x00\x02\x40\xec\xde\xbd\x1b\xe9\x74\x9a\
+\xff\xee\x77\xbf\xa3\x42\x88\x18\x80\xc4\xe2\xc5\x8b\x1b\x2a\x2a\
+\x2a\xe2\xd9\x6c\x76\xb4\xb7\xb7\xd7\x6c\x6d\x6d\x1d\xe8\xeb\xeb\
+\xcb\xcd\x99\x33\x27\x56\x5d\x5d\x5d\x35\x6f\xde\x3c\x2d\x1a\x8d\
+\xa6\x62\xb1\x58\x3a\x18\x0c\xd2\x44\x22\x11\x0f\x04\x02\xe3\x54\
+\x93\x64\x80\x0c\x80\x91\xcb\xe5\x32\x7d\x7d\x7d\xf6\xc0\xc0\x40\
+\x20\x10\x08\x44\x54\x55\x55\x6d\xdb\x86\x69\x9a\x20\x84\x84\xca\
+\xcb\xcb\x43\xfe\x7a\x93\xbc\xad\xe4\x2d\xdd\xfb\x03\x4e\xb6\x28\
+\x14\x0a\x79\x22\x32\xbd\xbd\xbd\xe8\xe9\xe9\x41\x47\x47\x87\x08\
+\x04\x02\x22\x10\x08\x50\xc6\x98\xee\x52\xa5\x19\x21\xe4\x1c\x1c\
+\xc9\x38\x89\xa0\xef\xba\xa7\x7d\x3c\x4c\x87\x01\x90\x29\x0b\xf1\
+\xc5\x2f\x7e\x91\x86\xc3\x61\x0a\xc0\x2c\x2d\x2d\x3d\x96\xcb\xe5\
+\x98\x6d\xdb\xf5\x87\x0f\x1f\xbe\xaf\xbd\xbd\x7d\xdd\xfa\xf5\xeb\
+\xb5\xc7\x1e\x7b\x8c\x14\x15\x15\x49\xf1\x4d\xb8\x16\x5c\x51\x55\
+\xf5\xce\xaa\x17\x76\x21\x5b\x4f\xcb\xbc\xb4\x3b\x20\x55\xc6\xd8\
+\x4a\xce\xf9\xd7\xe1\xbc\xec\x7d\x70\x04\x43\x65\x99\xa7\xe4\xd1\
+\xdf\x09\x81\x41\x59\x98\xc2\x7f\xf5\xab\x5f\xc9\x02\x16\x15\x8e\
+\x0e\xe2\xfd\x89\x44\x62\xc9\xb7\xbf\xfd\xed\xe5\x55\x55\x55\xba\
+\x61\x18\x87\xff\xd3\x7f\xfa\x4f\x6f\x9c\x3e\x7d\xba\xff\xb5\xd7\
+\x5e\xdb\x3c\x3c\x3c\xfc\x6c\x51\x51\x51\x51\x49\x49\xc9\xb9\xda\
+\xda\xda\x23\x9f\xff\xfc\xe7\xc3\x89\x44\x62\x1d\x1c\x65\xe5\x89\
+\xd0\xdf\xdc\xdc\xdc\xb4\x67\xcf\x9e\xf4\xfe\xfd\xfb\xcb\xfb\xfb\
+\xfb\x17\xd9\xb6\x1d\x97\x7f\x4c\x26\x93\x90\x4d\x46\x24\x6e\x97\
+\x37\x29\xa9\xca\x7e\x89\xf3\xa1\xa1\x21\xbc\xf9\xe6\x9b\x38\x78\
+\xf0\x20\x9a\x9a\x9a\xd8\xe0\xe0\xa0\x45\x29\x0d\xca\x6b\x34\x4d\
+\x33\x3a\x41\x2c\xe4\x96\xae\x7c\xd3\xe5\x01\x30\x00\x78\xf1\xc5\
+\x17\xe5\xff\x67\x2f\x5c\xb8\x70\xf2\xe3\x8f\x3f\x3e\xbb\x73\xe7\
+\xce\x86\xf6\xf6\xf6\x52\x00\xeb\x3a\x3a\x3a\xf4\x79\xf3\xe6\x91\
+\xad\x5b\xb7\xca\x18\x81\xe6\x12\x27\x66\xee\xf2\x9f\x87\x7c\x4f\
+\xa5\xbf\xbf\x1f\x23\x23\x23\x32\x08\x28\xfb\x06\x68\x9c\xf3\x25\
+\x00\x16\xc2\xf1\x00\x7a\xe1\x18\x80\x1c\x9c\x09\x2f\x4b\x86\xef\
+\x14\xa5\x60\x05\x80\x70\x15\x7f\x18\x9c\x55\x6b\x11\x80\xa7\x4d\
+\xd3\x5c\x5e\x5c\x5c\xac\x6e\xdf\xbe\x5d\x05\xd0\xf9\xc8\x23\x8f\
+\xec\x25\x84\x74\x00\x28\xda\xbb\x77\xaf\xe1\x06\xe6\x7a\x29\xa5\
+\x27\x2b\x2a\x2a\x0a\x16\x2d\x5a\x54\xef\x5b\xf1\xc7\xa1\xa7\xa7\
+\x67\xe4\xa5\x97\x5e\xba\xf4\xbf\xff\xf7\xff\x1e\xcc\xe5\x72\xc4\
+\x30\x8c\x79\xfe\xbf\x6b\x9a\xc6\x46\x46\x46\x6e\x98\x5d\x38\x95\
+\x90\x06\xc0\x8f\xd3\xa7\x4f\xe3\xf5\xd7\x5f\xc7\xef\x7f\xff\x7b\
+\xd8\xb6\xad\xd8\xb6\x2d\x34\x4d\x13\xb2\x6a\x94\x31\x66\xc0\xa1\
+\x90\x8f\x3b\x15\x6e\xe1\x22\x30\xdd\xd4\x29\x19\x25\x16\x9a\xa6\
+\x59\x94\x52\xcb\x34\x4d\x4f\x2f\xe0\xf0\xe1\xc3\x78\xeb\xad\xb7\
+\xc0\x39\x67\xf3\xe7\xcf\xd7\x6a\x6a\x6a\x14\xff\x60\xb8\x03\x8a\
+\x85\x84\x4b\x6d\x56\x64\x63\x47\x42\xc8\x50\x28\x14\x3a\x9d\x4a\
+\xa5\x3a\xe1\xc4\x3d\xea\x15\x45\x59\x4c\x29\xd5\xe0\xec\xfd\xaa\
+\xe0\x3c\x13\x7f\x30\x40\xc1\x58\x7f\xbc\x99\xee\x01\x00\x3e\x99\
+\xb4\x6c\x36\x4b\x08\x21\xaa\xaa\xaa\x25\x42\x88\x05\xe9\x74\x3a\
+\x74\xe4\xc8\x11\x84\xc3\x61\x3c\xf0\xc0\x03\x51\x00\xf3\x84\x10\
+\xe1\xff\xf3\x7f\xfe\xcf\x9c\x9f\xff\xfc\xe7\x6a\x32\x99\x44\x2c\
+\x16\x8b\xcc\x99\x33\x67\x4e\x4f\x4f\x4f\xf4\xf9\xe7\x9f\x0f\xe9\
+\xba\xee\x9d\xd8\xa7\x22\x8c\xe6\xe6\xe6\xc0\x0b\x2f\xbc\x50\x30\
+\x34\x34\x24\xe0\x0a\x8a\x84\xc3\x61\xd4\xd4\xd4\xa0\xaa\xaa\x0a\
+\xeb\xd6\xad\xe3\x85\x85\x85\xdc\x15\xfd\xa4\x9a\xa6\x51\x4a\x29\
+\xb9\x85\x7c\x12\xb9\xd7\xf7\x8a\x7d\xe0\x6c\xef\xce\x02\xe8\xec\
+\xed\xed\x8d\x1e\x3b\x76\xac\x21\x93\xc9\xcc\x83\x13\xdc\xd3\xdd\
+\xf8\x46\x0b\x80\x0b\x70\x16\x81\x14\x9c\x71\x22\x0b\x80\xa6\x45\
+\xfa\xeb\x4a\xb8\x65\xdc\x49\x9f\x85\x0c\xbb\x3f\xe8\xea\xea\xc2\
+\x2b\xaf\xbc\xc2\xcf\x9c\x39\x63\x3d\xf5\xd4\x53\xea\x97\xbf\xfc\
+\xe5\x71\x51\x62\xdb\xb6\xa1\xaa\xea\x8c\x55\x0f\xf2\xf7\x0d\x70\
+\xe5\xa6\x30\x77\xee\xdc\xde\xa7\x9f\x7e\xfa\xe5\xff\xf6\xdf\xfe\
+\xdb\x5e\x38\x93\xfd\xeb\x9a\xa6\x2d\xf6\xa5\x0e\xd3\x70\x0b\x64\
+\x7c\xd0\x70\x1b\x45\x2a\x6f\x00\x02\x00\xfe\xeb\x7f\xfd\xaf\xf4\
+\x8f\xff\xf8\x8f\x15\x00\xaa\xaa\xaa\x84\x73\x6e\x77\x76\x76\xe2\
+\xb9\xe7\x9e\xc3\xef\x7e\xf7\x3b\x3c\xf6\xd8\x63\x4b\xff\xe2\x2f\
+\xfe\xe2\x5b\x00\x72\xff\xee\xdf\xfd\xbb\x9a\xaa\xaa\xaa\xd8\xd0\
+\xd0\x10\x29\x2a\x2a\xaa\x2f\x2d\x2d\x8d\x9e\x3c\x79\x52\x7b\xf9\
+\xe5\x97\x2b\xcf\x9e\x3d\xeb\x19\x79\x4d\xd3\xbc\x76\xdf\x23\x23\
+\x23\xc5\x7d\x7d\x7d\x2b\xe1\x78\x4a\x51\x00\x91\x44\x22\x81\xed\
+\xdb\xb7\xe3\x73\x9f\xfb\x1c\x2a\x2b\x2b\x95\xda\xda\x5a\x00\x0e\
+\x01\xcd\x5f\xf8\x73\x8b\x20\x29\xba\x3a\xe0\x19\x80\x3e\x00\xaf\
+\x02\xf8\xf0\xf4\xe9\xd3\x55\x9d\x9d\x9d\x5f\x81\xa3\x10\x0d\x00\
+\xb0\x6d\xdb\x20\x84\xec\x01\xf0\x1a\x80\x76\x38\x5d\x7f\x64\xef\
+\x09\x6f\xfb\x7c\xab\x6e\x60\xba\x21\x59\x70\x80\xeb\xe6\xea\xba\
+\xbe\x28\x91\x48\xfc\x4f\x5d\xd7\x7b\xe1\xba\xc0\x94\x52\xf1\x6f\
+\xff\xed\xbf\xcd\xb8\x1a\xfb\x23\x42\x88\x9c\x10\x82\x67\xb3\x59\
+\x61\xdb\xb6\x98\xc1\xb0\x85\x10\xd9\xbc\xdf\x1d\x15\x42\x7c\x49\
+\x08\x11\x5f\xb0\x60\xc1\x6a\x00\x3f\x83\xe3\x01\x31\x38\x2f\xfa\
+\x38\x80\x7f\x0f\xa0\x14\x0e\xd5\x53\x8e\xd6\x99\xd9\xb6\xf6\x72\
+\x10\x38\xd7\xed\xb7\xca\xc1\x68\x34\xfa\x27\xc1\x60\xf0\x34\xc6\
+\x6a\x1b\xc4\xae\x5d\xbb\xac\x57\x5f\x7d\x55\x98\xa6\x39\xe1\xc3\
+\xdb\xb7\x6f\x9f\x78\xf2\xc9\x27\x85\xa6\x69\xde\x4f\x34\x1a\x15\
+\xe1\x70\x58\x68\x9a\x26\x82\xc1\xa0\x88\x46\xa3\x42\x51\x14\x41\
+\x29\x15\x84\x10\xb1\x78\xf1\x62\xf1\xa3\x1f\xfd\x48\x30\xc6\xc6\
+\x5e\x82\x6d\x0b\xc3\x30\x84\xe4\x5d\xdc\x42\xd8\x8c\x31\x23\xef\
+\x77\xc7\x85\x10\xdf\x2c\x29\x29\xa9\x00\xb0\x19\xc0\x2f\x74\x5d\
+\xe7\xa1\x50\xc8\x22\x4e\x7b\xb4\xfd\x00\xbe\x8e\xf1\x06\x5f\xc1\
+\xf8\xb1\x70\xcb\x30\xdd\x1e\x80\xa7\x17\xe0\x7e\x97\x1a\x8d\x46\
+\x47\x83\xc1\xe0\x01\x38\xf4\xd1\x75\x00\xee\xe7\x9c\xe3\xd3\x4f\
+\x3f\xed\xe9\xe9\xe9\xd9\xb3\x78\xf1\xe2\x11\x00\x2b\x2d\xcb\xda\
+\x20\x84\xd0\xc5\x58\x75\x1d\xc7\x2d\xa0\x46\x5e\x27\x3c\x22\x8c\
+\xec\x5c\xa3\xaa\x6a\x01\x80\x35\x00\xf0\x57\x7f\xf5\x57\x15\xff\
+\xe1\x3f\xfc\x87\xea\x54\x2a\x05\xcb\x49\x76\x5b\xaa\xaa\x46\x00\
+\x6c\xb0\x6d\x5b\x87\x53\xf4\xb1\x0f\x4e\xfe\x57\x26\xc3\x75\xb8\
+\xea\x30\xb7\xf8\x5e\x26\x0b\x19\x04\x24\xc4\xd1\xd8\x07\xe7\xdc\
+\xb0\x6d\x3b\xc5\x39\x37\xe3\xf1\x38\x5b\xba\x74\xa9\x92\x48\x24\
+\x48\x69\x69\xa9\xfa\xd1\x47\x1f\xa1\xab\xab\x0b\x6b\xd7\xae\xc5\
+\xea\xd5\xab\xc7\x9d\x68\xcb\x96\x2d\x68\x6f\x6f\x47\x4d\x4d\x8d\
+\xd7\x6b\x31\x10\x08\x78\x4a\x40\x3d\x3d\x3d\x38\x77\xee\x1c\x9a\
+\x9b\x9b\xbd\xe0\x5e\x24\x12\x41\x22\x91\xb8\xa1\xbe\x02\x53\x0d\
+\xdb\xb6\x89\x65\x59\x54\xd3\x34\x7f\x21\x52\xec\xf7\xbf\xff\xfd\
+\xca\xfe\xfe\x7e\x01\xa0\x0c\xc0\x1c\x55\x55\xb3\xba\xae\x9f\x33\
+\x4d\xf3\x24\x63\xec\x38\x1c\xa9\x2f\xbf\x9b\x7f\xdb\xe4\xe2\xa6\
+\xdb\x00\xf8\x03\x1a\x02\x8e\x2c\x74\x6f\x79\x79\xf9\xbb\x9c\xf3\
+\xc3\x70\x2a\xe3\x56\x02\x48\x9c\x3b\x77\xee\xc2\x3f\xfe\xe3\x3f\
+\xbe\xb1\x6d\xdb\xb6\x01\x38\x1c\x82\xd5\x8a\xa2\xe8\x52\x4b\x01\
+\xce\xca\x32\xd3\xdc\x64\x82\xbc\xbe\x01\xaa\xaa\x96\x03\xf8\x02\
+\x80\x87\x8a\x8a\x8a\x02\xf3\xe7\xcf\x2f\x3b\x76\xec\x98\x77\xbc\
+\xa2\x28\x73\x38\xe7\x3b\x01\x6c\x04\xf0\x36\x1c\xd9\xa7\x93\x79\
+\xe7\x9b\xa9\x93\x5f\x42\xaa\x3f\x79\xad\xbf\x4c\xd3\x54\x85\x10\
+\xda\x82\x05\x0b\xb4\x6f\x7e\xf3\x9b\x58\xbf\x7e\x3d\xce\x9e\x3d\
+\x6b\xfd\xc3\x3f\xfc\x83\xf6\xfc\xf3\xcf\xe3\xf3\x9f\xff\x3c\x16\
+\x2f\x5e\x3c\xae\x4f\x1f\x00\x3c\xf3\xcc\x33\xd8\xb9\x73\x27\x0c\
+\xc3\x80\x65\x59\x1e\x4f\x40\x08\x81\x7d\xfb\xf6\xe1\x27\x3f\xf9\
+\x09\x4e\x9f\x3e\x2d\x15\x7d\x41\x08\x81\x61\x5c\x2e\xb0\x74\x9b\
+\xca\x7d\x89\x2b\x6b\xe6\xfd\x2e\x9d\x4e\xcf\x39\x70\xe0\xc0\x13\
+\x84\x90\x1d\x42\x88\x00\x80\x22\xd3\x34\x4d\x55\x55\x8f\x02\xf8\
+\x05\x9c\xf8\x40\x3e\x21\xcc\xaf\x28\x75\x4b\x71\x2b\x62\x00\xf9\
+\x37\x65\x76\x77\x77\xf7\x01\xe8\x2b\x29\x29\xd9\x27\x84\xd8\x3c\
+\x32\x32\xb2\x28\x9d\x4e\x77\xfc\xfc\xe7\x3f\xa7\xbd\xbd\xbd\xa1\
+\x7f\xf9\x97\x7f\x51\x5d\x39\x27\x0e\x80\xb8\x54\x61\xe2\x4f\xb1\
+\xcc\x10\x4c\x94\xb1\x08\x01\x98\x0f\x00\xf3\xe6\xcd\xc3\xa6\x4d\
+\x9b\x30\x3a\x3a\x8a\x54\x2a\xa5\x0d\x0f\x0f\xeb\xee\xf1\x11\x00\
+\x20\x84\x18\x42\x88\x63\x70\x24\xc3\x06\xdd\x1f\xc3\x77\x5e\x19\
+\x14\x9c\x09\x7b\x42\xbf\x30\xe5\x28\x00\x30\xc6\xe8\xb7\xbe\xf5\
+\xad\xb2\x9f\xfe\xf4\xa7\x73\x38\xe7\x0b\x00\x84\x63\xb1\x98\x58\
+\xb9\x72\x25\x56\xad\x5a\x45\x8a\x8b\x8b\xed\x7f\xfe\xe7\x7f\x66\
+\x3d\x3d\x3d\xf4\x93\x4f\x3e\xe1\xbf\xfe\xf5\xaf\xb1\x78\xf1\x62\
+\x59\xfc\x45\x55\x55\x45\x61\x61\xa1\x12\x8d\x46\x49\x30\x18\x44\
+\x24\x12\x41\x20\x10\xf0\x26\x73\x2c\x16\x13\xae\xb2\x90\x90\x6d\
+\xe8\x06\x07\x07\x89\xec\x2b\x10\x8b\xc5\x6e\x4b\x7c\x48\x8a\xbf\
+\x6a\x9a\xe6\x8d\xc9\x4c\x26\x83\xbe\xbe\x3e\x9c\x3b\x77\x2e\x74\
+\xfe\xfc\xf9\x85\xf1\x78\x1c\x99\x4c\x06\xb6\x6d\x83\x73\x2e\x6c\
+\xdb\x4e\x86\x42\xa1\xa3\x23\x23\x23\x7d\xee\x69\x74\x38\xdb\xe3\
+\x2c\xc6\xab\xff\xdc\x52\xdc\xca\x02\xea\xcb\xd2\x1b\x8b\x17\x2f\
+\x3e\xdb\xdb\xdb\xfb\x9c\x5b\x1f\x5d\x01\x60\xe7\xd9\xb3\x67\x43\
+\x47\x8e\x1c\x59\xb8\x75\xeb\x56\x0d\x8e\x55\x54\x73\xb9\x1c\x11\
+\x42\x50\x45\x51\x6e\x65\x84\xf7\xba\x30\x51\xb6\x62\xfe\xfc\xf9\
+\x78\xea\xa9\xa7\xb0\x70\xe1\x42\x1c\x3c\x78\x90\x7e\xf8\xe1\x87\
+\x18\x1c\x1c\xf4\xdc\x55\x45\x51\xe6\x73\xce\x9f\xe2\x9c\xd7\x03\
+\x78\x1f\x8e\x47\x60\xc0\x6d\xb7\xe6\xfe\xe4\x30\x33\x3c\x02\x79\
+\x3d\x59\xb8\xee\xea\x92\x25\x4b\x0a\x87\x86\x86\x1e\x05\xb0\x1e\
+\x4e\x47\xe4\x84\x65\x59\xf6\xf0\xf0\x30\x01\xa0\x94\x97\x97\xab\
+\xcf\x3c\xf3\x0c\xaa\xab\xab\x45\x7b\x7b\x7b\xf6\xa5\x97\x5e\xca\
+\x0a\xa7\x1c\x38\xcc\x18\x8b\x44\x22\x11\x52\x50\x50\x80\x48\x24\
+\x82\x50\x28\x24\x22\x91\x08\xf1\x67\x81\xce\x9f\x3f\x8f\xee\xee\
+\x6e\x68\x9a\x46\x5c\xca\x35\x19\x18\x18\x40\x36\x9b\x1d\xd7\x25\
+\x58\xdc\x42\x5d\x09\x77\x32\x33\xb7\xc3\x90\x4c\xdf\x92\x96\x96\
+\x16\xbc\xfe\xfa\xeb\x38\x7d\xfa\x34\x4e\x9e\x3c\x09\xd3\x34\xa1\
+\x28\x8a\x54\x05\x22\x96\x65\x85\x2c\xcb\xf2\x5f\xe4\x2d\x4d\xf7\
+\x5d\x09\xb7\xd2\x00\xf8\x73\xdc\x1a\x00\x6b\xef\xde\xbd\x03\xed\
+\xed\xed\xaf\xd6\xd4\xd4\xc4\x00\x7c\x15\xc0\x23\xba\xae\x2f\x38\
+\x7b\xf6\x2c\xdd\xb2\x65\x8b\x4a\x29\xcd\xc1\xc9\x37\x53\xc6\x98\
+\x32\x83\xd3\x81\xe3\x56\x22\xcb\xb2\xa0\x69\x9a\x4c\x85\x61\xf5\
+\xea\xd5\x20\x84\xe0\xe8\xd1\xa3\xe8\xea\xea\x92\x5d\x84\xa8\xaa\
+\xaa\x11\xcb\xb2\x1e\x00\xb0\x0a\xce\x80\x38\x09\x27\x3d\x24\xb7\
+\x3c\x33\x4b\xe1\x22\x6f\xd0\x5e\xba\x74\x69\xa9\x10\xe2\x71\x00\
+\x9f\x83\x1b\xe3\xc9\x64\x32\x56\x4b\x4b\x0b\xc9\x64\x32\x4a\x28\
+\x14\xd2\xbe\xf0\x85\x2f\x60\xc7\x8e\x1d\xfc\x57\xbf\xfa\x15\xfb\
+\xbf\xff\xf7\xff\x66\x1a\x1b\x1b\x01\x37\xeb\x11\x0c\x06\xa9\x8c\
+\x9d\x28\x8a\x32\x91\x40\x08\x01\x40\xfc\x64\x9f\x44\x22\x81\x50\
+\x28\xe4\x75\x09\xf6\x0e\xbc\x45\x63\x83\x10\x42\x38\xe7\xd4\xad\
+\x33\x00\xe0\x6c\xff\x0e\x1d\x3a\x84\x17\x5f\x7c\x11\x67\xcf\x9e\
+\x15\x96\x65\x99\x8c\x31\x35\x10\x08\x28\xae\x71\xe2\x96\x65\x71\
+\x00\x09\x8c\xb9\xff\x92\xef\x7f\x5b\xab\xe0\x6e\xc7\x00\xa3\x70\
+\xdc\x1f\x4d\x51\x94\x8c\xaa\xaa\x59\x00\xd9\x78\x3c\x7e\xde\xb6\
+\xed\x34\x63\x4c\x3d\x71\xe2\x84\xf2\xfa\xeb\xaf\xf3\x45\x8b\x16\
+\x89\x05\x0b\x16\xc0\x9f\x27\xb6\x2c\x6b\xa6\x37\x16\xe1\x8c\x31\
+\x9b\x10\xc2\x55\x55\xa5\x81\x40\x40\x29\x2d\x2d\x25\x55\x55\x55\
+\xfd\xd9\x6c\x76\x90\x39\x1d\x46\x83\x94\xd2\x32\x55\x55\x63\xb6\
+\x6d\x07\xe0\x04\x8b\x96\x03\x58\x06\xc7\xbd\xee\x83\x63\x00\x64\
+\x7d\xb1\xbc\xd9\x5b\xbd\x6a\xf8\x09\x4a\xfe\x2a\xc6\x79\x00\x16\
+\x58\x96\xf5\x80\xaa\xaa\x6b\x5c\x55\x5b\x99\xbe\x23\xa9\x54\x8a\
+\xa4\xd3\x69\x84\xc3\x61\xef\x67\xc3\x86\x0d\xca\x27\x9f\x7c\xa2\
+\xeb\xba\x0e\xb7\x9f\x02\x74\x5d\x47\x26\x93\x41\x36\x9b\x45\x57\
+\x57\x17\xb2\x59\xaf\x14\x3e\x9f\x22\x8d\xe2\xe2\x62\x34\x34\x34\
+\x60\xc9\x92\x25\xa8\xab\xab\x83\xaa\xaa\xe3\x78\x22\xd3\xed\x19\
+\xfa\x3b\x13\x07\x83\x41\xa9\x6a\x8c\xb3\x67\xcf\xa2\xa5\xa5\x05\
+\x7b\xf6\xec\x61\xc7\x8f\x1f\xe7\x8c\x31\x15\xae\x90\x87\x10\x62\
+\x04\x0e\xf1\xeb\x22\x9c\x2e\xd1\x1c\xce\x16\xd1\x3f\xf9\x6f\xab\
+\x17\x70\x3b\x0c\x80\x2c\x87\x14\x32\xda\x0b\x00\x05\x05\x05\x4d\
+\xe9\x74\xfa\xf5\xe1\xe1\xe1\xe1\x0f\x3e\xf8\xa0\xe1\xec\xd9\xb3\
+\x73\xb6\x6f\xdf\x4e\xbe\xfe\xf5\xaf\xa3\xaa\xaa\x4a\xc0\x99\x58\
+\xd4\x30\x0c\x92\x6f\xfd\x67\x12\x38\xe7\x84\x10\x22\x57\x08\x99\
+\xb5\xb0\xe2\xf1\xf8\x05\xcb\xb2\xe4\x20\x58\xa8\xaa\x6a\xb9\x0c\
+\x6c\xb9\x28\x87\x93\x36\x32\x01\x1c\x80\x43\x10\x91\xd0\xe1\x3c\
+\x37\x13\xb7\x76\xc0\xc8\xc1\x9c\xc3\x98\x01\x50\x00\x6c\x05\xf0\
+\x0c\x80\x05\xaa\xaa\x56\xb8\x7d\x11\x60\xdb\x36\x08\x21\x6a\x20\
+\x10\x40\x20\x10\xf0\x2f\xc9\xa4\xae\xae\x2e\xfc\x87\x7f\xf8\x87\
+\xea\xe0\xe0\x20\x0c\xc3\xd0\x85\x10\x84\x52\xea\xa9\xfc\xbe\xf3\
+\xce\x3b\xe4\x8d\x37\xde\x80\x6d\xdb\xfe\x32\x58\x4f\x2f\x60\xe9\
+\xd2\xa5\xf8\xea\x57\xbf\x8a\x65\xcb\x96\xa1\xa6\xa6\x06\x9a\xa6\
+\x79\x3c\x11\xb9\x20\x4c\xa7\x17\x20\x83\xbc\xfe\xc5\xc8\xe5\xb1\
+\xe0\xfd\xf7\xdf\x47\x6b\x6b\xab\xc5\x18\xb3\xe0\x70\x5c\x14\x00\
+\xb0\x6d\xbb\x9f\x73\xfe\x1a\x80\x0f\x00\x74\xc2\x31\xec\xfe\xf7\
+\x77\x5b\x02\x7f\x7e\xdc\x2e\x03\x60\xc3\x31\x00\x44\xb8\x6d\xb4\
+\x96\x2c\x59\xd2\xd5\xd2\xd2\xf2\xdb\x96\x96\x96\xf4\xe0\xe0\x60\
+\x00\x40\x8d\x61\x18\xca\xe2\xc5\x8b\x51\x5c\x5c\xcc\x43\xa1\x10\
+\x57\x14\x85\xfa\x0b\x3f\x84\x2b\xce\x39\x93\xe0\x56\xa2\x11\x00\
+\xd4\xdd\xef\xc2\xb6\x6d\x91\x48\x24\x46\xef\xbb\xef\xbe\xc1\x7f\
+\xfd\xd7\x7f\x15\x23\x23\x23\xa6\x69\x9a\x8a\x70\xc5\x23\xe0\xf0\
+\xe9\x8b\x85\x10\x6b\xe1\x18\x47\x13\xc0\x31\x38\x1e\x80\x09\x67\
+\xdf\x2d\x95\x84\x6e\x05\x5b\x50\x7e\x87\x1c\xa0\x16\xc6\x3c\xb7\
+\x25\x00\x1e\x00\xf0\x79\xcb\xb2\xa8\xdb\xaa\xdb\x84\xe3\x25\x04\
+\x55\x55\xa5\x6e\xbb\x6b\x6f\x6f\xce\x18\x23\x25\x25\x25\x81\xed\
+\xdb\xb7\x5f\x5e\x0a\xe8\x22\x12\x89\xa0\xb9\xb9\x19\x67\xcf\x9e\
+\x95\x69\x46\xaf\x9e\x3e\x16\x8b\x61\xd3\xa6\x4d\x78\xf4\xd1\x47\
+\x51\x5d\x5d\xed\x7d\x46\x96\x11\xdf\x0a\x21\x19\x5f\x9c\x81\xc3\
+\x79\x27\xec\xe4\xc9\x93\xe4\xad\xb7\xde\xd2\xf7\xee\xdd\xab\x02\
+\xd0\x08\x21\x6a\x30\x18\x54\x18\x63\x96\x69\x9a\x16\x63\xec\x08\
+\x9c\xb8\xce\x5e\xdf\xa9\xfc\xcf\xe0\xb6\x8b\x60\xdc\xae\x3d\xa6\
+\xbc\x71\x15\x6e\xfd\xf3\xef\x7f\xff\xfb\xe4\x9f\xfe\xe9\x9f\x36\
+\xfe\xf0\x87\x3f\x2c\x02\xb0\x13\x80\x72\xfa\xf4\x69\xbc\xf6\xda\
+\x6b\x18\x1a\x1a\x32\x37\x6e\xdc\xc8\x97\x2e\x5d\xaa\xb8\x2d\xa5\
+\x60\xdb\x36\xa4\xac\xf8\x4c\xf3\x06\x28\xa5\x44\x8a\x63\xba\x83\
+\x94\x56\x55\x55\x95\xfc\xf1\x1f\xff\xf1\x82\x65\xcb\x96\x89\xe7\
+\x9f\x7f\xbe\xb4\xa9\xa9\x49\x91\x03\x38\x10\x08\xa8\x94\xd2\x0a\
+\x77\x3f\xac\x71\xce\x13\x8c\xb1\x55\x70\xdc\xc6\x0f\xe1\x6c\x0b\
+\xa4\xbc\x55\x10\x63\x31\x02\xf9\x1c\x05\x6e\x2c\x5b\xe0\xe5\xf4\
+\x27\xf8\x9d\x9c\xd4\xf2\x3b\xaa\x00\x6c\x22\x84\xdc\x4b\x29\x5d\
+\x4f\x29\xa5\xb2\xde\x01\x3e\xf9\x6a\x45\x51\x88\xdc\xcb\x4b\x03\
+\xc7\x18\xc3\x95\xf8\xfe\x12\xf3\xe6\xcd\x43\x41\x41\x01\x34\x4d\
+\xf3\xca\x79\x6b\x6b\x6b\xb1\x68\xd1\x22\xd4\xd5\xd5\x61\xfb\xf6\
+\xed\xe3\x26\x3f\x70\x4b\x78\xff\xd2\x1b\x51\xc4\x98\xc2\xef\x20\
+\x80\x4f\x00\x9c\xbf\x78\xf1\x62\xbc\xb1\xb1\xf1\x5e\x38\x01\x50\
+\x45\x6e\x45\x38\xe7\x47\xe1\xe8\x3f\xee\x87\xf3\x0e\xfd\xb8\xa5\
+\x54\xdf\x6b\xe1\x76\x07\x99\xe4\x03\xb6\x28\xa5\x82\x73\x3e\xfa\
+\xc3\x1f\xfe\xb0\x17\x6e\x5d\xb4\xac\xa6\x3a\x7a\xf4\x28\x1f\x1d\
+\x1d\x15\x35\x35\x35\x90\x3d\xdf\xdc\x95\x75\x9c\xea\xca\x0c\x81\
+\x54\xbd\x25\xd2\x43\xd1\x34\x4d\x2d\x2d\x2d\x9d\x1f\x8f\xc7\xe7\
+\x44\x22\x11\x9c\x38\x71\x22\xd4\xd4\xd4\xe4\x3d\x7b\xf7\x1e\x34\
+\x21\x44\x29\x63\x2c\x2e\x84\x58\x08\x67\xd5\x7f\x1b\x8e\xeb\x28\
+\x79\x02\xb2\xd5\x58\x3e\xbf\xe2\x46\x3d\x02\x99\xda\xa3\x79\xbf\
+\xf3\xcb\x96\x49\xac\x02\xf0\x0d\x00\xcb\x09\x21\xa5\x79\x13\x4f\
+\xae\x6a\x54\x4e\x14\x91\xd7\xd3\x4f\xaa\xe4\x5c\x09\x43\x43\x43\
+\x92\x4f\xe0\xbd\xd3\xda\xda\x5a\x3c\xf9\xe4\x93\xd8\xbc\x79\x33\
+\x8a\x8b\x8b\x2f\xfb\xcc\x64\x54\x85\x6f\x12\x82\x73\xce\x28\xa5\
+\x8a\xdb\xf6\x1d\x9c\xf3\x21\x4a\xe9\x47\xaf\xbd\xf6\xda\x47\xbf\
+\xfa\xd5\xaf\x2a\xfb\xfb\xfb\x13\x70\x0c\x00\x38\xe7\xc8\x66\xb3\
+\x83\x42\x88\x77\x01\xfc\x12\x8e\x64\xd9\x50\xde\x39\x67\x42\x46\
+\xc7\xc3\xed\x36\x00\x12\x42\x08\x41\x08\x21\xa2\xb0\xb0\x70\x50\
+\x51\x94\xd3\xd9\x6c\xf6\xe8\xe8\xe8\x68\x79\x4f\x4f\x4f\x59\x4f\
+\x4f\x4f\xb8\xa6\xa6\x06\x0b\x16\x2c\xc0\x8a\x15\x2b\x78\x49\x49\
+\x09\x09\x85\x42\x44\xee\xc7\xfc\x01\x9a\x19\x82\x71\xa3\xd2\x95\
+\xb6\x8a\x6a\x9a\x16\x5d\xb6\x6c\x19\x36\x6e\xdc\x88\x96\x96\x16\
+\x74\x77\x77\x67\x7a\x7b\x7b\xd3\x99\x4c\xc6\x86\xdb\x45\x07\x40\
+\x1c\x8e\x54\x34\x00\xe4\x08\x21\x27\x34\x4d\xcb\xe6\x72\xb9\x41\
+\x38\x83\xe9\x6a\x8a\x22\xd7\x3b\x1b\xae\xb4\x1a\x49\xa6\x4d\x10\
+\x40\x91\xa6\x69\x65\x9c\xf3\xfb\x84\x10\x5b\x39\xe7\x31\x37\x6e\
+\x63\x86\x42\x21\xb3\xba\xba\x3a\x00\x40\x4b\xa5\x52\x18\x18\x18\
+\x80\x61\x18\x30\x0c\xc3\x4b\xcb\xc9\x09\x9a\xc9\x64\x84\x9f\xcc\
+\xa3\xeb\x3a\xc9\x66\xb3\xe8\xed\xed\x15\x3d\x3d\x3d\xe4\xf8\xf1\
+\xe3\xb2\xe3\x8f\xc5\x39\x1f\xb1\x2c\x2b\x17\x0a\x85\xd4\x15\x2b\
+\x56\x44\xeb\xeb\xeb\x1d\xf9\x28\xce\x31\x32\x32\x22\x34\x4d\x43\
+\x28\x14\x9a\xf6\x94\xb0\x94\xaa\x93\x84\x27\xc9\xf6\x3b\x7a\xf4\
+\x28\xff\xfc\xe7\x3f\x2f\x0f\x13\xe1\x70\x98\x51\x4a\xd3\x99\x4c\
+\x66\x98\x73\x7e\x1c\x8e\xcb\x7f\xd4\x77\xaa\x10\x9c\x77\x63\x60\
+\x06\xad\xfe\xc0\xed\x37\x00\x7e\xaa\x30\x05\x20\x82\xc1\xe0\x80\
+\xa6\x69\xef\x33\xc6\x06\x46\x47\x47\xd7\x03\x78\x12\x40\xf1\x91\
+\x23\x47\xf0\xb3\x9f\xfd\x8c\xaf\x5f\xbf\x3e\xfb\xd8\x63\x8f\x69\
+\x8b\x16\x2d\xf2\xa2\x31\xb9\x5c\x0e\x00\x10\x08\x04\x66\x92\x11\
+\xf0\x06\x8e\x1f\xb1\x58\x0c\xdb\xb7\x6f\x47\x41\x41\x01\xce\x9c\
+\x39\xd3\xf5\xd2\x4b\x2f\x1d\x6b\x6f\x6f\x4f\xc2\x71\xb1\xd7\xc2\
+\x6d\xac\xea\x06\xb7\xe6\x53\x4a\x9f\xa4\x94\xd6\x29\x8a\xf2\x4e\
+\x36\x9b\xfd\xdd\x55\xf2\xdd\x04\x4e\x7a\xed\x4a\x46\xc0\xdf\x8c\
+\x44\x22\x77\xb5\xeb\x8f\x46\xa3\xf3\x19\x63\xdb\x29\xa5\xf7\x50\
+\x4a\xd7\x08\x21\x62\x99\x4c\x46\x1a\x5c\x5a\x55\x55\xa5\x7e\xe5\
+\x2b\x5f\xa1\x85\x85\x85\x38\x78\xf0\x20\xde\x7c\xf3\x4d\xa4\xd3\
+\x69\xa4\x52\xa9\x71\x79\x79\x99\x1d\xb0\x6d\x5b\x84\x42\x21\xe8\
+\xba\x4e\x00\x20\x99\x4c\x8a\xdf\xff\xfe\xf7\xfc\xe0\xc1\x83\x4a\
+\x6b\x6b\x2b\x52\xa9\x14\x28\xa5\x23\x9c\xf3\x53\x00\x3a\x29\xa5\
+\x05\x89\x44\x62\x29\x80\x1a\xc0\x8b\xaf\x08\x9f\x9a\xf0\xb4\x82\
+\x31\x46\x72\xb9\x9c\x22\xfb\x0e\xb8\x48\xec\xdf\xbf\x7f\x03\x1c\
+\xde\x4a\x1c\x40\x95\x10\x22\xa3\xaa\xea\xa7\x84\x90\x0f\xe1\x78\
+\x6b\xc7\xf3\x4e\xe5\xdf\xaa\xcd\x28\xdc\x6e\x03\xe0\x5f\x81\x28\
+\x00\xd2\xd5\xd5\x95\x81\xa3\x8f\x76\xd4\x2d\x18\x5a\x68\x9a\xe6\
+\xd6\x4b\x97\x2e\xe1\x95\x57\x5e\x21\x4d\x4d\x4d\xb4\xb8\xb8\x18\
+\x0b\x17\x2e\xf4\x26\xbb\xa2\x28\x9e\x56\xff\x4c\x82\xdc\xcb\x02\
+\x00\x77\x2a\x55\xa0\x28\x0a\x5d\xb9\x72\x25\x96\x2c\x59\x82\xf6\
+\xf6\xf6\x24\xa5\xb4\xe5\x7f\xfe\xcf\xff\x29\x7b\x05\x2c\x03\x50\
+\x28\xef\x87\x73\x1e\x81\x13\x70\x5b\xe5\x7e\xfe\x14\x9c\x0a\x32\
+\x89\xfc\x80\xe0\x54\xea\x09\x94\x64\x32\x99\xb5\x00\x9e\x26\x84\
+\x6c\xd6\x9c\x5a\x5b\x08\x21\xe4\x77\xa8\x2b\x57\xae\x54\x9e\x7d\
+\xf6\x59\x52\x5d\x5d\x0d\x42\x08\xde\x7b\xef\x3d\x0c\x0f\x0f\x63\
+\x74\x74\x74\x9c\x01\x90\x32\x6a\x8a\xa2\x10\x7f\x14\xfd\xdc\xb9\
+\x73\xf8\xfd\xef\x7f\x2f\x7e\xf7\xbb\xdf\x49\xc2\x0c\x84\x10\x39\
+\x38\xdb\x9e\xa6\x8a\x8a\x8a\x12\x38\x86\xd1\x43\x20\x10\x10\xb7\
+\xca\xc8\xbb\xa5\xc5\x8a\xdf\x88\xb7\xb7\xb7\x17\xb5\xb4\xb4\x6c\
+\x0b\x06\x83\x30\x0c\x43\x05\xa0\x98\xa6\x69\x52\x4a\x1b\x29\xa5\
+\x2f\x31\xc6\x1a\x31\x96\x31\x91\x5d\xa1\xaf\x6a\x68\x6f\x27\x6e\
+\xb7\x01\xc8\x87\x7c\xb3\x16\x00\xab\xbe\xbe\xfe\xf0\xe0\xe0\xe0\
+\x5b\xc3\xc3\xc3\xa6\x61\x18\x0b\x0c\xc3\x98\x77\xec\xd8\xb1\xd0\
+\x3b\xef\xbc\x83\x44\x22\xc1\x1b\x1a\x1a\xd8\xc2\x85\x0b\x15\x5d\
+\xd7\xbd\x11\x31\x53\x79\x02\x9c\x73\xc6\x18\xe3\x8a\xa2\x28\x9a\
+\xa6\x51\x4d\xd3\xe8\xa2\x45\x8b\x82\x5f\xff\xfa\xd7\x8b\xe2\xf1\
+\x38\x3a\x3b\x3b\xe3\x5d\x5d\x5d\x34\x95\x4a\xd9\x67\xcf\x9e\xe5\
+\xdd\xdd\xdd\x0c\x8e\x37\x20\x79\x02\x1b\x01\x34\x87\xc3\x61\x29\
+\x8b\x4b\x18\x63\x66\x2c\x16\xeb\x58\xb6\x6c\x59\xe7\xde\xbd\x7b\
+\x47\xdc\x86\x24\x93\xc6\xee\xdd\xbb\x95\x37\xdf\x7c\x73\x99\x10\
+\x42\x06\x20\xa9\xa6\x69\x16\x00\x30\xc6\x2a\x0d\xc3\xb8\x1f\xc0\
+\x6a\x00\x61\x37\x5b\xc1\x01\x64\x6b\x6b\x6b\xb5\x05\x0b\x16\x28\
+\xdb\xb7\x6f\x27\xcb\x97\x2f\x07\xe0\x44\xf1\xdd\xc2\x20\x99\xd9\
+\xf0\x40\x29\x1d\xd7\xb0\xe3\xc2\x85\x0b\x68\x69\x69\xc1\x07\x1f\
+\x7c\x80\x23\x47\x8e\x10\x9f\x9c\x3a\xe0\x18\x96\xd8\x8e\x1d\x3b\
+\x8a\x77\xec\xd8\x91\x08\x85\x42\x81\x6c\x36\x0b\x4a\xa9\x17\x20\
+\x9c\xce\x77\xeb\xcb\xcc\x8c\x73\xfb\x07\x06\x06\xd0\xd8\xd8\x88\
+\xb3\x67\xcf\x2a\xad\xad\xad\x05\xc1\x60\xd0\x6b\x4a\x22\x84\x08\
+\xf8\x74\xfd\xe5\xf6\x49\x87\xf3\xfe\xb2\x98\xc1\x4a\xd0\x33\xc9\
+\x00\x5c\xd6\x22\xeb\xbe\xfb\xee\xeb\x7a\xf3\xcd\x37\x5f\xe1\x9c\
+\x9f\x84\x93\x77\xae\x66\x8c\x29\x7b\xf7\xee\x45\x57\x57\x97\xbd\
+\x6b\xd7\x2e\xf3\x6b\x5f\xfb\x5a\x60\xee\xdc\xb9\x5e\x45\x9e\x61\
+\x18\x33\x35\x33\xa0\xf8\xb8\x01\x12\xe5\xf5\xf5\xf5\x9b\xbe\xf3\
+\x9d\xef\x18\xc9\x64\x32\xde\xdb\xdb\x5b\xd0\xd2\xd2\x42\x9f\x7b\
+\xee\x39\xda\xdd\xdd\x9d\x7f\x03\x4b\x14\x45\xf9\xba\x5b\x52\x0a\
+\x00\x50\x55\xb5\x13\xc0\xc7\x03\x03\x03\x07\x18\x63\x67\x28\xa5\
+\xd6\xf5\x50\x62\xdf\x7f\xff\xfd\x52\x42\xc8\xe3\x00\xee\xf7\xb9\
+\xd5\x39\x00\x84\x52\x1a\x07\x50\x09\xa0\xd0\x7f\x1b\x8a\xa2\x04\
+\xee\xbb\xef\x3e\xfa\xcc\x33\xcf\x40\x4e\x7e\x00\xe8\xed\xed\x45\
+\x2e\x97\x1b\x37\x69\x24\xfc\x9e\x19\x63\x0c\x7b\xf7\xee\xc5\xcb\
+\x2f\xbf\x8c\x0b\x17\x2e\x90\xbe\xbe\xbe\x71\xcb\xb9\xa2\x28\xd1\
+\xad\x5b\xb7\x2e\xfd\x37\xff\xe6\xdf\x54\x57\x56\x56\x06\xc2\xe1\
+\x70\x29\xa5\xd4\xef\xe1\x4d\xeb\xf2\x2f\xdc\x2e\xbd\x00\xc6\xdd\
+\xc7\xe9\xd3\xa7\xf1\xfc\xf3\xcf\xe3\xd4\xa9\x53\x68\x6f\x6f\x17\
+\x99\x4c\xc6\x6b\x71\xe6\x6e\x71\xc2\x79\xba\xfe\x36\xee\x80\xb6\
+\x6f\x33\xc9\x00\xc8\x07\x25\x53\x5d\xec\xc7\x3f\xfe\xb1\x09\xe0\
+\x04\x80\x53\xf1\x78\xbc\xc8\xb6\xed\xe5\x99\x4c\x66\xc9\x85\x0b\
+\x17\xfe\x7f\x7b\xd7\xd6\x1c\xc5\x75\x6e\xd7\xee\xee\xb9\x68\x46\
+\x17\x90\x04\x12\x08\x04\x48\x42\x80\x6c\x21\x30\x17\x1b\x73\x3b\
+\x8e\x31\x29\x57\x81\xeb\x38\x54\x9c\xf2\xa9\x38\x71\x5e\xf2\x90\
+\x54\xf2\x94\xb7\xfc\x80\xfc\x06\xa7\xca\x95\x9c\xd4\xc1\x55\x36\
+\xe5\x3a\xbe\x81\x6f\xc7\x92\x23\x04\x32\x06\x64\x3c\x16\x12\x12\
+\xc8\x92\x10\x06\xdd\x06\x8d\x2e\x3d\xd3\xd3\xbd\x7b\xef\xf3\xd0\
+\xbd\x7b\xf6\x8c\x46\x12\x60\x19\x46\x62\x56\x95\x4b\x58\x9a\xe9\
+\xe9\xe9\xee\xfd\xed\xef\xb2\xbe\xf5\xf9\x07\x06\x06\xfc\xa6\x69\
+\x92\xfa\xfa\x7a\xf5\xe8\xd1\xa3\x9e\x06\x5f\xae\xf2\x04\x14\xc9\
+\x6f\x95\x24\xb4\x4b\x43\xa1\x50\x69\x61\x61\x21\xaa\xaa\xaa\xd0\
+\xd0\xd0\x80\xda\xda\x5a\xf4\xf4\xf4\xa0\xab\xab\x0b\xba\xae\x73\
+\x38\x7a\x09\xe0\x9c\x97\xcf\xcc\xcc\x1c\xd4\x75\x5d\x3e\xec\x6d\
+\x5d\xd7\xfd\xe3\xe3\xe3\x9c\x10\xe2\x83\x43\x23\x96\x5b\xe5\x64\
+\x8d\x79\x21\x3a\x92\x74\x7f\x92\xb1\xb1\xb1\x03\x00\x5e\x04\x70\
+\x20\xdb\x39\xab\xaa\x8a\xc2\xc2\x42\x50\x4a\x6d\x38\x55\x0d\x65\
+\xf3\xe6\xcd\xbe\x67\x9f\x7d\x16\xc7\x8f\x1f\xf7\x6a\xfd\xd1\x68\
+\x14\xc3\xc3\xc3\x30\x4d\x33\xab\xf1\x15\x84\x2f\x4a\x29\xae\x5d\
+\xbb\x86\x2f\xbf\xfc\x12\x1f\x7c\xf0\x81\xc8\x25\x10\x20\xa5\xa5\
+\xb8\x75\xeb\xd6\xe0\x53\x4f\x3d\xb5\xa1\xa1\xa1\xc1\x0b\x9f\xe4\
+\xb9\x11\x62\x44\xdb\x4f\x01\xa9\x6a\xe3\x69\xfb\x25\x93\x49\x4c\
+\x4e\x4e\xa2\xbd\xbd\x1d\x67\xce\x9c\xc1\xd0\xd0\x90\xe0\x45\x68\
+\x6e\x69\xd3\xe4\x8e\xae\xff\x14\xd2\x75\xfd\x45\x4b\x77\xce\xc5\
+\xfd\x32\x72\xc9\x00\x08\x88\x1b\x2c\x3f\x45\xac\xac\xac\xec\x6b\
+\x5d\xd7\xdf\x31\x0c\x63\x87\x6d\xdb\xfb\x00\x54\x5f\xbd\x7a\xd5\
+\xf7\xc1\x07\x1f\xe0\xee\xdd\xbb\xc9\x3d\x7b\xf6\xa0\xb1\xb1\xd1\
+\x9f\xeb\x3c\x01\x51\x26\x13\xbd\xef\x99\x58\xbf\x7e\x3d\x0e\x1d\
+\x3a\x04\xdb\xb6\x61\x9a\x26\x57\x14\xc5\xa6\x94\xf2\x8e\x8e\x0e\
+\xff\x57\x5f\x7d\x95\xf9\xf2\xb5\x70\x5c\x74\x3f\x9c\x61\x1c\xa3\
+\xe1\x70\xd8\x73\x37\x19\x63\xaa\xab\xc1\xc7\x00\x68\xee\x4c\x3e\
+\xc2\x18\x2b\x01\x50\x90\x48\x24\x9e\x84\xab\x5d\x90\x0d\xa1\x50\
+\x08\x07\x0f\x1e\x44\x6d\x6d\x2d\xb5\x6d\x5b\xe5\x9c\x93\x8a\x8a\
+\x0a\xb2\x6b\xd7\x2e\x6f\x81\x88\xc5\x2d\x38\xfd\xe2\x77\xe2\x3f\
+\xc6\x18\x92\xc9\x24\xba\xbb\xbb\xd1\xd5\xd5\x85\xee\xee\x6e\x74\
+\x74\x74\xcc\xd2\xcf\xdb\xb0\x61\x03\xf6\xee\xdd\x8b\xed\xdb\xb7\
+\x63\xef\xde\xbd\x69\xc9\xdc\x9f\x8a\xea\x2b\xce\x4f\xca\x3f\x40\
+\x90\x98\x00\x40\xd7\x75\x9c\x3b\x77\x0e\x91\x48\x84\xb7\xb4\xb4\
+\xd0\xa1\xa1\x21\xa1\xfe\xe3\x07\x00\xc6\x58\x8c\x73\xde\x0e\xa7\
+\xd6\x2f\x74\xfd\x03\x70\x16\xbe\x89\xbc\x01\x78\x20\x30\x64\x49\
+\x9a\x98\xa6\xd9\x67\x9a\xe6\x5b\xae\xa0\x42\x10\x40\xb5\xcc\x13\
+\x78\xfd\xf5\xd7\xf9\xa6\x4d\x9b\x78\x61\x61\xa1\x37\xa8\x22\x17\
+\x79\x02\x52\x42\x6c\xce\xd7\xec\xde\xbd\x1b\xf5\xf5\xf5\x80\xbb\
+\x53\xc7\xe3\x71\xbc\xf5\xd6\x5b\xe8\xea\xea\xc2\xd4\xd4\x54\xe6\
+\xcb\x37\xc1\x51\x17\x7a\x5a\x51\x14\xd3\xb6\x6d\x6f\x65\x09\x26\
+\x22\x21\x44\xb0\x2e\x09\xe7\x5c\xe3\x8e\x84\x77\x01\x52\xe5\xa9\
+\xac\xd8\xb8\x71\x23\x8e\x1d\x3b\x86\xe7\x9e\x7b\x4e\x64\xee\x08\
+\x00\xac\x5c\x99\x8a\x0a\x5c\x6e\x3c\x42\xa1\x10\x44\xad\xdc\xd5\
+\xe8\x13\xe7\x00\xc3\x30\x70\xf9\xf2\x65\x9c\x3a\x75\x0a\x37\x6e\
+\xdc\x40\x34\x1a\x9d\xf5\x59\x8d\x8d\x8d\x78\xed\xb5\xd7\xf0\xc4\
+\x13\x4f\x60\xd5\xaa\x55\xb3\xae\xd9\x4f\x51\xf3\x97\x8d\x94\xf0\
+\x32\x64\xaf\xb1\xbf\xbf\x1f\xef\xbd\xf7\x1e\x3e\xfb\xec\x33\x44\
+\xa3\x51\xa1\xe8\xe4\xf5\xa4\x53\x4a\x87\xe0\xc8\x7f\xfd\x1f\x1c\
+\xee\xca\x24\xd2\x13\xb3\x39\x2f\xef\x95\x8b\x06\x00\x48\x85\x03\
+\x3e\x38\x16\xd5\xbc\x75\xeb\x56\x02\xc0\xcd\x2d\x5b\xb6\x4c\x4c\
+\x4c\x4c\x6c\xd3\x75\x7d\x83\xae\xeb\x6b\x46\x46\x46\x56\x8d\x8c\
+\x8c\x14\x54\x57\x57\xa3\xae\xae\x6e\x3e\x9e\x40\x66\xf6\xf8\x91\
+\xc5\x06\xe2\x01\x73\xfb\xca\xdd\x04\x3f\x27\x8c\x31\x45\xd3\x34\
+\x52\x59\x59\x89\xca\xca\xca\xb4\xf3\xbc\x79\xf3\xa6\x7d\xf5\xea\
+\x55\xd6\xd7\xd7\xc7\x44\x6d\x3a\x10\x08\x68\x94\xd2\xa0\x65\x59\
+\xc1\x68\x34\x8a\x89\x89\x89\xac\x62\x19\x59\x10\x07\x30\xa5\x28\
+\xca\x64\x45\x45\x45\xa8\xb8\xb8\x38\x28\x38\xf5\x86\x61\x88\xf3\
+\x23\x07\x0e\x1c\x50\xf6\xef\xdf\xaf\xd4\xd7\xd7\xa7\x5d\x38\xd3\
+\x34\x61\x18\x86\xa7\xd7\xa8\xaa\xaa\x97\xa0\x13\xec\x47\x11\xb3\
+\x6b\x9a\x86\xa2\xa2\x22\xc4\x62\x31\x44\x22\x11\x8c\x8e\xa6\x86\
+\x23\x17\x14\x14\xa0\xb4\xb4\x14\xab\x56\xad\xc2\x81\x03\x07\x70\
+\xe0\xc0\x01\x14\x15\x15\x89\xfe\x7f\xee\x86\x14\x8a\xcf\xe7\x5b\
+\xd4\x7b\x25\x8c\x93\xa8\xd2\x88\x11\xe3\x02\xb1\x58\x0c\xd1\x68\
+\x94\xb7\xb5\xb5\xf1\xb3\x67\xcf\xf2\xbe\xbe\x3e\x15\x40\x50\x55\
+\x55\x14\x14\x14\x80\x52\x1a\x33\x0c\x23\xca\x18\x6b\x83\xa3\xe8\
+\x24\xeb\xfa\xcb\x6e\x5d\x4e\x2f\x7e\x20\x77\x0d\x80\x80\x88\xa3\
+\xbc\x5d\xad\xb7\xb7\x77\xba\xa6\xa6\xa6\xc5\xb2\xac\x69\x5d\xd7\
+\x9f\x01\xf0\x12\x66\xf3\x04\xb4\x2d\x5b\xb6\x78\x37\xc2\xe5\x09\
+\xd8\x81\x40\xc0\x76\x8d\x80\x18\xd2\xf9\x48\xe1\x32\xe4\xc4\x10\
+\x14\x22\x97\x0d\x33\xd1\xd4\xd4\x44\x7e\xfb\xdb\xdf\x92\xb1\xb1\
+\x31\x45\x78\x36\x6e\x9b\x34\x12\x89\x04\xbe\xf8\xe2\x0b\x7c\xf2\
+\xc9\x27\xf7\xf2\xb1\x26\x80\xff\x05\x70\xb9\xa6\xa6\xa6\xf4\xd5\
+\x57\x5f\x3d\x52\x59\x59\xb9\x4b\xec\xb0\x86\x61\xd8\xae\xcb\xad\
+\x6c\xde\xbc\x99\x6c\xdc\xb8\x71\xd6\xe2\xf3\xf9\x7c\x62\x30\x87\
+\xf7\x3b\x79\x5e\xa2\x69\x9a\x48\x26\x93\xde\x90\x4c\x9f\xcf\x87\
+\xe2\xe2\xe2\x59\x21\x4f\x59\x59\x19\x5e\x7c\xf1\x45\xec\xde\xbd\
+\x1b\xbb\x77\xef\x46\x51\x51\x11\xe0\xee\xa0\x62\x36\xe0\x62\xbb\
+\xfe\x32\x3d\x39\x5b\x08\x06\x80\x7f\xfd\xf5\xd7\x76\x73\x73\xb3\
+\x1d\x89\x44\x58\x7f\x7f\x3f\x85\x23\xe0\xa2\x08\xaf\x92\x31\x76\
+\x01\xce\xae\x1f\x01\xd0\x9f\xf1\xfe\x9c\xdf\xf5\x65\x3c\xf2\x45\
+\xb0\x00\x3c\x81\x49\xb8\xe7\xca\x39\xa7\x7d\x7d\x7d\x11\x00\xd7\
+\xfc\x7e\xff\x18\x80\xba\x2c\x3c\x01\x92\x85\x27\x20\xeb\x09\xe6\
+\x46\x66\xd0\x59\xf4\xf7\x74\x2e\xeb\xd6\xad\x53\x56\xaf\x5e\xad\
+\xb8\xb9\x01\x2f\xdb\xce\x39\x87\xae\xeb\x60\x8c\x89\x0c\x75\xe6\
+\x5b\x05\xcb\x50\xe0\x3a\x80\x8f\x01\x7c\x7c\xfd\xfa\xf5\xcd\x00\
+\xb6\xb8\x86\x54\x8c\x3b\xe3\xee\x64\x26\x9f\xa6\x69\x69\xdd\x6f\
+\x02\x96\x65\xa5\xa9\x35\xcb\xf4\x5f\x97\xe5\x07\xbf\xdf\xef\x5d\
+\x7f\xb7\x54\x86\x92\x92\x92\xb4\xf3\xdb\xb6\x6d\x1b\x8e\x1d\x3b\
+\x86\x23\x47\x8e\x78\x9f\xe3\xb2\x0c\x15\xf1\xd9\x8b\xed\xf6\xcb\
+\x42\x22\xf2\x1c\x41\x81\xa1\xa1\x21\xf2\xc5\x17\x5f\x28\xff\xfc\
+\xe7\x3f\xc9\xe4\xe4\xa4\x9d\x4c\x26\x19\x00\x22\xba\x0f\x0d\xc3\
+\x18\x02\xd0\x0c\x47\xec\x35\x86\xf4\x9a\xbf\x98\xe7\xb7\x64\x90\
+\xeb\x06\x00\x48\x59\x53\x31\x53\x2d\x0e\xe7\x22\xd3\xb9\x78\x02\
+\xcd\xcd\xcd\x1e\x4f\xa0\xae\xae\x4e\xf0\x04\xd2\xb6\x12\x91\x84\
+\x7a\x18\x9d\x64\xf7\x03\x79\x87\x92\x5d\x55\xbf\xdf\x9f\x56\xe1\
+\x10\x2f\x07\xc0\xc2\xe1\x30\x3b\x74\xe8\x10\x1b\x1c\x1c\xe4\xfd\
+\xfd\xa9\x0d\x29\x18\x0c\x32\x4a\xa9\x45\x29\x0d\x08\x17\x3f\x18\
+\x0c\xd2\x13\x27\x4e\x94\xfc\xf2\x97\xbf\xac\x82\xd3\x82\x1c\x0e\
+\x87\xd3\x26\x73\xcd\x92\x39\x93\xc3\x0a\xb1\x70\x54\x55\x95\xbb\
+\xfd\x3c\xb7\xbf\xa0\xa0\x00\x6b\xd7\xae\x45\x79\x79\x39\x00\x27\
+\x8e\x8e\x44\x22\xb8\x72\xe5\x0a\x46\x47\x47\xa1\xaa\x2a\x6a\x6b\
+\x6b\xb1\x7e\xfd\x7a\xbc\xf0\xc2\x0b\x78\xea\xa9\xa7\x3c\x9d\x40\
+\xe1\xcd\x08\x91\xcd\xc5\xbc\x2f\x22\xc6\x17\xa1\x8a\xf8\x5e\x9d\
+\x9d\x9d\x22\x27\xc1\x55\x55\x65\x03\x03\x03\xea\x85\x0b\x17\x14\
+\x37\x54\x51\x01\xf8\x43\xa1\x10\x08\x21\xc3\xb6\x6d\x7f\xcf\x39\
+\xff\x0e\x40\x3b\x9c\xe1\x2e\x02\x42\xe8\x30\xe7\xcb\x7e\x99\x58\
+\x0a\x06\x40\xc0\x42\x46\x83\xca\x7c\x3c\x81\xdb\xb7\x6f\xd3\x23\
+\x47\x8e\x98\xbf\xfe\xf5\xaf\x03\x55\x55\x55\xb3\xfc\x48\xa1\x43\
+\xf0\x10\x1a\x4a\xee\x0b\x22\x49\x28\x12\x6a\xe2\x77\x73\xbd\x1c\
+\x6e\xa2\xb0\xbe\xbe\x5e\xfd\xcd\x6f\x7e\xc3\xe5\x24\xa1\xaa\xaa\
+\x1c\xce\x58\x32\x55\xec\x7a\xa1\x50\xa8\xaa\xb1\xb1\xf1\x15\x38\
+\xa5\xbf\x12\x38\xec\x43\x19\xb3\xb2\x93\x99\x5a\x8c\xe2\xbc\x84\
+\x4b\x6c\x59\x96\x77\x3d\xc3\xe1\xb0\x9c\xbf\x40\x6b\x6b\x2b\xde\
+\x79\xe7\x1d\x5c\xbb\x76\x0d\xa3\xa3\xa3\x08\x87\xc3\x38\x78\xf0\
+\x20\x8e\x1d\x3b\x86\xfa\xfa\xfa\xb4\xd7\xaa\xaa\x8a\x60\x30\xf8\
+\x93\x64\xfc\x2d\xcb\x82\x65\x59\xde\xb5\x05\x80\x91\x91\x11\x7c\
+\xf4\xd1\x47\x68\x6f\x6f\x07\x00\xa6\xaa\xaa\x15\x8f\xc7\xc9\xb5\
+\x6b\xd7\x66\xe5\x3c\x08\x21\x1d\x70\x42\xa7\xab\x00\x7a\x33\x0e\
+\x2f\xbc\x80\x25\xe3\xfa\x0b\x2c\x25\x03\x20\x16\xff\x82\x3c\x81\
+\xfe\xfe\x7e\x5f\x7f\x7f\xbf\xdf\xb2\x2c\xb2\x65\xcb\x16\x75\xc5\
+\x8a\x15\x3c\x10\x08\x24\x35\x4d\xb3\xdc\xd9\x83\x7e\xbf\xe3\x73\
+\xe6\xce\xca\x97\x90\xcd\x2b\x91\xda\x51\xb3\xbc\x9c\x90\xd2\xd2\
+\x52\x3c\xfd\xf4\xd3\xf7\x72\xf8\x72\x00\x87\xe5\x5f\x64\x30\xf7\
+\xbc\x87\x5f\x9c\x87\x5c\xb1\x90\xb3\xe4\x22\x01\x18\x0e\x87\xe1\
+\xf3\xf9\x90\x4c\x26\xa1\xeb\x3a\x26\x26\x26\x30\x39\x39\x89\x1f\
+\x7e\xf8\x01\x9f\x7e\xfa\x29\xce\x9c\x39\x03\xc0\xe9\xd5\x68\x6c\
+\x6c\xc4\xe1\xc3\x87\xf1\xd2\x4b\x2f\xa5\x85\x08\xa2\x65\x78\xb1\
+\x85\x5f\xc5\xf9\x8a\x90\x49\x51\x14\xcf\x18\x74\x74\x74\xa0\xa5\
+\xa5\x85\xb7\xb6\xb6\x8a\x16\x68\xa1\x43\x90\x50\x14\x45\x70\x1f\
+\x08\xa5\x74\x00\x4e\x5b\xf6\x69\x38\x1d\x7e\xe2\x3a\x05\xb0\x04\
+\xdd\x7e\x19\x4b\xc9\x00\x08\x2c\xc4\x13\x68\xb2\x6d\x7b\x2f\x80\
+\x9a\xae\xae\x2e\xdf\xc7\x1f\x7f\x8c\xf1\xf1\xf1\xa9\x7d\xfb\xf6\
+\xb5\x3c\xf1\xc4\x13\x97\x35\x4d\x53\xe0\xd0\x6a\xff\x03\xee\xd0\
+\x12\xd3\x34\x99\xa2\x28\xcc\x1d\x48\x9a\x93\x46\x41\xae\x55\x8b\
+\x64\x9b\x80\x88\xbb\x1f\x14\xb2\xe6\x9e\x58\xdc\xa2\x9d\x37\x9b\
+\xd2\x4e\x26\xdb\x30\x1c\x0e\xa3\xa8\xa8\xc8\x4e\x26\x93\x6c\x64\
+\x64\x04\xcd\xcd\xcd\x0a\x21\x44\x1d\x1d\x1d\x45\x4b\x4b\x0b\x00\
+\xa0\xb8\xb8\x18\x2f\xbc\xf0\x02\xf6\xed\xdb\x87\xdd\xbb\x77\xa7\
+\xed\xf2\xc2\x00\x2d\x06\x71\x4b\x0e\x4b\xe4\x81\x9d\x32\xab\x2f\
+\x12\x89\xe0\xf2\xe5\xcb\xb8\x70\xe1\x82\xdd\xd5\xd5\x65\xc1\xd5\
+\x33\x94\xce\xe7\xbb\x50\x28\xd4\xc1\x18\xb3\x2c\xcb\x52\x6c\xdb\
+\x1e\x85\xe3\xf6\xdf\x91\x3e\x4a\x43\x8e\x3e\x2b\xf7\x83\xa5\x68\
+\x00\x16\xe2\x09\x7c\x0b\xc7\x3a\xd7\xc4\x62\x31\x7c\xf6\xd9\x67\
+\x38\x7b\xf6\x6c\x62\xdb\xb6\x6d\xe7\xde\x7d\xf7\xdd\xff\x41\x4a\
+\xa6\x6b\x3f\x5c\x03\xc0\x9d\x27\xda\x76\x89\x33\x0f\xef\x9b\xdc\
+\x07\x32\xe4\xc3\x16\x15\xf3\x19\x8f\x7b\x5d\x90\x45\x45\x45\x3c\
+\x14\x0a\xf1\x78\x3c\x8e\xe6\xe6\x66\xde\xdd\xdd\x8d\x64\x32\x89\
+\xe1\xe1\x61\x00\xce\x10\x90\xdf\xfd\xee\x77\x68\x6a\x6a\xf2\xf2\
+\x03\x80\xb3\x60\x45\x36\x7e\xb1\xbe\x9f\x6c\x04\x84\x6c\x98\xc0\
+\xf4\xf4\x34\x5a\x5a\x5a\x70\xf2\xe4\x49\xdc\xb9\x73\x87\xdd\xbd\
+\x7b\x97\x22\x3d\x3f\x34\x0d\xa0\xd5\xb2\xac\x93\x84\x10\xdd\xb6\
+\x6d\x02\x67\x87\xcf\x6c\xc3\x16\x3b\xff\x92\x73\xfb\x65\x2c\x45\
+\x03\x00\xcc\xc3\x13\x58\xb5\x6a\xd5\xdd\x99\x99\x99\x3a\xc6\x58\
+\xad\x65\x59\xeb\x06\x06\x06\x56\x01\x28\xed\xee\xee\x2e\x25\x84\
+\x94\xfe\xea\x57\xbf\x62\x7f\xfb\xdb\xdf\x7c\xb6\x6d\xf3\xc2\xc2\
+\x42\xbe\x7a\xf5\x6a\xe2\x3e\x80\x1e\x81\x08\xc8\xbd\xe4\x20\x30\
+\xff\x62\xcc\x4c\x1c\xce\x03\xae\xaa\xaa\x90\xb5\x26\x70\x94\x6c\
+\x16\x5c\x79\xf2\x71\xc5\x42\x9d\x9c\x9c\x44\x34\x1a\xc5\xcc\xcc\
+\x0c\x7c\x3e\x9f\x76\xf4\xe8\x51\x5c\xbf\x7e\x1d\x7d\x7d\x7d\xb8\
+\x7e\xfd\x3a\x00\xa7\xd4\x57\x5b\x5b\x8b\xa3\x47\x8f\xe2\xf0\xe1\
+\xc3\x9e\xa0\x8b\x10\xff\x08\x04\x02\x3f\xda\xed\x9f\xa3\xf3\x30\
+\xcd\xb0\x25\x12\x09\x8c\x8d\x8d\xf1\xab\x57\xaf\xa2\xad\xad\x8d\
+\x5f\xb9\x72\x05\x70\xa5\xce\x43\xa1\x10\x54\x55\x4d\x50\x4a\xc7\
+\x18\x63\x9d\x9c\xf3\x36\xd3\x34\xaf\x64\xf9\x28\x0d\xa9\x31\xee\
+\x4b\xaa\xdc\x37\x17\x96\xaa\x01\x10\x98\xc5\x13\x18\x1f\x1f\x9f\
+\x29\x29\x29\x69\xa5\x94\x1a\xc9\x64\x72\x1f\x80\xe3\x70\xe2\xde\
+\x63\x00\xd6\xbc\xfd\xf6\xdb\xf1\x68\x34\xba\x75\xcb\x96\x2d\x64\
+\xcf\x9e\x3d\xf4\xf8\xf1\xe3\x6a\x69\x69\xa9\x02\x38\x82\x9e\xf1\
+\x78\xdc\x8b\x19\xc5\xae\x9b\xab\x5e\x81\x0c\x51\xce\xba\x97\x66\
+\x20\x42\x88\x28\x3f\xde\xb3\x85\x13\x65\x3e\xf9\xba\x74\x77\x77\
+\xe3\xf4\xe9\xd3\x98\x98\x98\x40\x6d\x6d\x2d\x7e\xff\xfb\xdf\x63\
+\x6c\x6c\x0c\xff\xf8\xc7\x3f\xf0\xe5\x97\x5f\x02\x00\x9e\x7f\xfe\
+\x79\xfc\xfc\xe7\x3f\xc7\xce\x9d\x3b\xbd\xc5\x0f\xc0\x23\xe0\xfc\
+\x98\x6b\x2b\xd3\x78\x05\xe4\x2c\xbf\x8c\xbe\xbe\x3e\x76\xe6\xcc\
+\x19\xfb\xdb\x6f\xbf\xb5\xbf\xfd\xf6\x5b\x31\x8c\xb3\x00\xf0\x42\
+\x90\x1b\x8a\xa2\x9c\x56\x14\xe5\x8a\xcf\xe7\xbb\x22\x1a\x82\x32\
+\x3f\xd2\xfd\xb9\xe4\x17\xfe\x72\x82\x78\x88\xe5\x38\x4e\x83\x53\
+\x9a\x79\x19\xc0\xbf\x01\x70\x42\x08\x57\x55\xd5\x02\x30\xa5\x69\
+\x9a\x1e\x0a\x85\xe8\xcb\x2f\xbf\x6c\xb7\xb6\xb6\x7a\x13\x25\x19\
+\x63\x5c\xd7\x75\x2e\x86\x92\xda\xb6\xfd\x28\x06\x4e\xe6\x24\x4c\
+\xd3\xe4\x86\x91\x3e\x07\xf3\xe4\xc9\x93\xbc\xa1\xa1\x81\x97\x94\
+\x94\xf0\xbf\xfc\xe5\x2f\x7c\x6c\x6c\x8c\x8f\x8e\x8e\xf2\x3f\xfd\
+\xe9\x4f\x5c\xd3\x34\x5e\x5d\x5d\xcd\xff\xfe\xf7\xbf\x73\x5d\xd7\
+\xbd\x01\xa1\x96\x65\x79\x03\x5f\x7f\xec\xb5\x65\x8c\x71\xdb\xb6\
+\x39\xa5\xd4\xfb\x4f\xfc\xbf\x0c\xdb\xb6\xf9\x9b\x6f\xbe\xc9\x76\
+\xee\xdc\x69\x17\x14\x14\x58\xaa\xaa\xea\x00\x92\x3e\x9f\x8f\xbb\
+\xbd\x12\x36\x21\xe4\x4d\x38\xb2\x67\x41\xa4\x42\x82\xa5\xbe\x41\
+\x2e\x88\xe5\xf0\x05\xe7\xe4\x09\xac\x58\xb1\xa2\x23\x99\x4c\xb6\
+\x10\x42\x4c\x9f\xcf\xb7\x92\x10\x52\x3c\x3d\x3d\x1d\xa4\x94\xae\
+\xa1\x94\xaa\x97\x2f\x5f\xc6\xe7\x9f\x7f\x0e\x4a\x29\xad\xab\xab\
+\xc3\xfa\xf5\xeb\x49\x28\x14\x92\xc7\x72\x01\x48\xcf\x92\x8b\xd0\
+\x20\xd7\xc2\x83\x9f\x1a\x3c\x7d\xfa\x0e\x03\x40\x0c\xc3\x20\xc3\
+\xc3\xc3\x98\x9c\x9c\xb4\xee\xdc\xb9\xd3\x55\x5e\x5e\x7e\x03\x00\
+\x28\xa5\x75\x94\xd2\x86\x70\x38\xec\xab\xae\xae\x46\x28\x14\xe2\
+\x70\xf4\xf5\x14\x5d\xd7\x3d\x4e\xc3\xfd\x5c\x43\xf1\xf9\xd2\x39\
+\xcc\x29\x05\xde\xd3\xd3\x83\x9b\x37\x6f\x0a\x9d\x39\x9e\x48\x24\
+\x70\xf6\xec\x59\x25\x12\x89\x10\x97\x10\xa6\xb9\x64\x25\xd3\x34\
+\xcd\x1e\xd3\x34\xfb\x38\xe7\xff\x86\xc3\xec\x13\x37\x5b\xf4\xf3\
+\x8b\xf2\xb3\xf0\x34\x97\xd5\xee\xbf\x1c\x0c\x80\xc0\x2c\x9e\x40\
+\x49\x49\xc9\xc8\x0f\x3f\xfc\xf0\x91\xdf\xef\xff\x0a\x40\x88\x31\
+\x56\x60\xdb\x76\x35\x80\x13\x00\x76\x0d\x0f\x0f\xe3\xfd\xf7\xdf\
+\x47\x57\x57\x97\xf9\xca\x2b\xaf\xd8\xeb\xd7\xaf\xd7\x90\x2a\x07\
+\x79\x55\x06\xa1\xde\x0b\xc0\xcb\x8c\xe7\x52\x83\xd1\xc3\x80\xb4\
+\xd0\x84\x8c\x9b\x5a\x54\x54\xa4\x56\x56\x56\xe2\xee\xdd\xbb\xc9\
+\x9e\x9e\x9e\x7f\x03\x78\x07\x00\xce\x9f\x3f\xff\x0a\x9c\x99\x01\
+\x3e\x9e\x92\xd2\xb6\x15\x45\xf1\x69\x9a\xf6\x40\xf4\x5e\xb9\x61\
+\x47\x20\xdb\x3d\xa0\x94\xe2\xfc\xf9\xf3\x78\xff\xfd\xf7\x61\x18\
+\x06\x57\x14\x85\xda\xb6\x8d\x81\x81\x01\xbf\x6c\xc8\xdd\x86\xa5\
+\x3b\x8c\xb1\xf7\xe0\x78\x89\xdf\x23\x5d\x51\x89\x22\x35\x06\x4d\
+\x2c\xfc\x65\xb5\xf8\x81\xe5\x65\x00\xe4\xc5\xaf\x00\x20\x83\x83\
+\x83\x16\x80\x0e\x4a\xa9\xf7\xd4\x14\x14\x14\xac\x0d\x04\x02\x25\
+\xf1\x78\x7c\xbd\x69\x9a\x25\x91\x48\xc4\xdf\xd9\xd9\x19\x5a\xb1\
+\x62\x05\xad\xaf\xaf\xd7\xea\xeb\xeb\xbd\x5d\x86\x52\x8a\x70\x38\
+\xbc\xa0\xa4\xf5\xe3\x82\x0c\x23\x80\x15\x2b\x56\xa0\xa6\xa6\x06\
+\x3d\x3d\x3d\xec\xd2\xa5\x4b\x63\x84\x90\xeb\xee\xdf\xc7\x42\xa1\
+\x10\xab\xad\xad\x95\x17\x29\x07\xf0\xc0\x71\x7f\x36\xa3\x4b\x29\
+\x85\xae\xeb\x69\x59\xfe\xeb\xd7\xaf\xe3\xdc\xb9\x73\xfc\xc3\x0f\
+\x3f\x24\x8c\x31\x31\xcb\x00\xaa\xaa\x1a\x8a\xa2\x18\x84\x10\x9f\
+\xc8\x1d\x30\xc6\x3a\xe0\x70\xfa\x5b\xc5\x57\x84\xcb\x31\x81\x43\
+\xee\xc9\x59\x25\x9f\xc5\xc2\x72\x32\x00\x02\x82\x1d\xa7\x22\x4b\
+\xb9\x30\x99\x4c\xde\xae\xac\xac\xfc\x02\x8e\x96\x5b\x23\x80\xfd\
+\x8c\xb1\xc2\x4b\x97\x2e\x69\xef\xbe\xfb\xae\xc7\x4c\x23\x84\xd0\
+\x8d\x1b\x37\xf2\xc3\x87\x0f\x13\x97\x3b\x90\xf6\xd4\xca\x2d\xaf\
+\x40\xca\x1d\x7d\x4c\x42\x03\x05\x00\x29\x28\x28\xc0\xca\x95\x2b\
+\x11\x0c\x06\x35\x5d\xd7\xb7\x02\x38\x0a\x00\xfb\xf7\xef\xdf\xda\
+\xd4\xd4\xa4\x35\x35\x35\xa1\xaa\xaa\x0a\xc9\x64\x92\xa8\xaa\xaa\
+\xdc\xcb\x04\x1f\x2e\x95\xf0\x04\xb2\x89\xab\x02\xce\x44\xde\xd6\
+\xd6\x56\x0c\x0e\x0e\x02\x4e\x03\x91\x3d\x32\x32\xc2\xbe\xf9\xe6\
+\x1b\xdb\x5d\xfc\x5e\xb7\x8f\x6d\xdb\xb7\x55\x55\x3d\x17\x08\x04\
+\x62\x96\x65\x11\xd7\xab\xfb\x0e\x40\xb7\x74\x48\xf1\xec\x2c\xa6\
+\xb6\x62\x4e\x63\x39\x1a\x00\x31\x34\x23\xeb\x4d\x74\x5d\xc9\x4b\
+\x8c\xb1\x7e\x38\x03\x48\xd6\x02\x68\xec\xef\xef\xc7\xdb\x6f\xbf\
+\x2d\x3f\x9c\xec\xf9\xe7\x9f\xc7\xc6\x8d\x1b\xd1\xd0\xd0\x20\xdc\
+\xbf\xd4\x16\x28\x31\xf3\x04\x31\xe7\x31\x59\xfc\x62\x6e\x80\x57\
+\x67\x77\xe7\x1b\xfe\x0c\xc0\xf6\x50\x28\x84\x23\x47\x8e\x94\xff\
+\xe2\x17\xbf\x08\xac\x5a\xb5\x0a\x25\x25\x25\x50\x55\x95\xd8\xb6\
+\xad\xb9\xf2\xe8\x0b\x7e\x40\x66\xbc\x3f\x97\xc7\x30\x30\x30\x80\
+\xd3\xa7\x4f\x0b\xb2\x91\xb8\x47\x6c\x78\x78\x58\x64\xf9\x65\x44\
+\x6c\xdb\x7e\x8b\x52\xda\x67\x59\x96\xb8\x51\x26\x52\x12\x5e\x80\
+\xab\x79\x88\x65\xe8\xea\xcf\x85\xe5\x68\x00\x80\xd4\x0d\x14\x3b\
+\xb7\x68\xff\x55\x00\xe8\x37\x6f\xde\x9c\x00\x30\x11\x0e\x87\x0b\
+\x6c\xdb\xde\xc1\x39\x0f\x4e\x4d\x4d\x61\x6a\x6a\x4a\x2c\xf2\x0a\
+\x00\xc5\xc1\x60\x10\x4d\x4d\x4d\xf2\xee\xc3\x09\x21\xa8\xa8\xa8\
+\x10\x22\x97\xb3\x56\x3c\x9f\xa7\x0c\xb7\x8c\x0c\x04\x01\x1c\x52\
+\xcd\x9d\x3b\x77\xe0\x4a\x67\xaf\x59\xb7\x6e\xdd\x9a\x5d\xbb\x76\
+\xe1\x99\x67\x9e\xc1\xf6\xed\xdb\xbd\x17\xbb\x64\x1a\xe7\x8d\x12\
+\xd3\x30\xeb\x81\xe7\x10\x4c\x99\x9a\x9a\xe2\x63\x63\x63\xcc\x35\
+\x0c\x84\x73\x4e\xda\xdb\xdb\xd1\xde\xde\x8e\xde\xde\x5e\x20\x75\
+\xaf\x7d\x00\x82\x6e\x39\xd0\x86\x33\x8f\x6f\x98\x73\x7e\xae\xb0\
+\xb0\xf0\xfc\xdd\xbb\x77\x33\x15\x55\x44\x98\xc0\xb0\x04\x9b\x79\
+\x7e\x2c\x96\xab\x01\x10\xf0\x76\x05\xa4\x6e\xae\x77\x83\x83\xc1\
+\xe0\x80\x69\x9a\x1f\x51\x4a\x3b\x91\x52\x72\xa9\x80\xc3\x19\xd8\
+\x21\x76\x98\xce\xce\x4e\x10\x42\x6c\x42\x88\x5d\x59\x59\xc9\x8f\
+\x1f\x3f\x8e\x27\x9f\x7c\x52\x0e\x35\x3c\x12\x91\x9c\x30\x94\x29\
+\xbb\xe2\xa1\x5e\xaa\x46\x20\x33\x03\x0f\x38\x44\x20\xd7\xfd\x46\
+\x59\x59\x19\x4e\x9c\x38\x81\x7d\xfb\xf6\xa5\x2d\x7e\x20\xb5\xa8\
+\x05\x84\x84\x98\xf8\x9b\x7c\xdc\x39\xea\xf8\x7c\x70\x70\x90\x9e\
+\x3e\x7d\x9a\x8e\x8c\x8c\x70\xee\xcc\x93\x24\x03\x03\x03\x18\x18\
+\x18\x00\x52\x0b\x3f\xed\x7c\x19\x63\x77\x55\x55\x3d\xa3\x69\xda\
+\x05\xdb\xb6\x3b\x26\x26\x26\x66\xc9\x29\x61\x19\x27\xf8\xee\x05\
+\x8f\x83\x01\x10\xe1\x80\x85\x8c\x1d\x3b\x1a\x8d\xc6\xe1\x4c\x71\
+\x69\x91\x7e\xbd\x19\x4e\x58\xb0\x3d\x1e\x8f\x2b\xad\xad\xad\x82\
+\x2b\x4f\x01\x68\x9b\x37\x6f\x46\x45\x45\x85\x50\xc4\x4d\x2b\x15\
+\xce\x15\xab\x02\xb9\xc9\x2c\xbc\x1f\xcc\xd5\xa0\x24\x16\x76\x43\
+\x43\x03\x5e\x7a\xe9\x25\xec\xda\xb5\xcb\x63\xe0\xc9\xdd\x77\xf2\
+\xa2\x5e\x68\xa6\x9f\x68\x37\x16\x60\x8c\xa1\xa3\xa3\x83\x9d\x3a\
+\x75\x8a\xf6\xf4\xf4\x00\xae\xe1\xd5\x34\x4d\x48\x8a\x0b\xba\xae\
+\x77\xf1\xdd\x7b\xd6\x6d\x59\xd6\x47\x00\x3e\x85\x73\xff\x81\x74\
+\xa1\x54\x01\x0b\x8f\x29\x96\xbb\x01\xc8\x84\x70\xf1\x45\xb9\xcf\
+\x80\x3b\x87\x50\xec\xd0\xc9\x64\xb2\x73\xf5\xea\xd5\xad\xf1\x78\
+\xbc\x54\xd7\xf5\x95\x93\x93\x93\x2b\x01\x94\x01\x28\x05\xa0\x76\
+\x76\x76\xa2\xad\xad\x0d\x65\x65\x65\x5e\x75\x40\xd3\x34\x7b\xc3\
+\x86\x0d\xa8\xab\xab\x03\x52\x1c\x82\xac\x4f\x78\x66\x72\x4b\xda\
+\xfd\x38\x21\x44\x9e\x7a\x93\x53\xd6\x22\x9b\x30\x67\x65\x65\x25\
+\x0e\x1e\x3c\x88\xcd\x9b\x37\xe3\xb9\xe7\x9e\xa3\x7b\xf6\xec\xb1\
+\xdd\xc5\xaf\x26\x12\x09\xcd\x34\xcd\xb4\x0e\x3f\x61\x30\x16\xaa\
+\x02\xf4\xf6\xf6\x62\x70\x70\x50\x48\xa6\xc1\x34\x4d\xbb\xad\xad\
+\x8d\x45\x22\x11\x4e\x29\x55\xe1\xf6\x70\x08\xb8\xf7\x61\x54\x51\
+\x94\x1e\xc6\x98\x41\x29\x25\xae\x01\x68\x87\x33\xa4\x53\x48\xa9\
+\x2b\x70\xd4\x7d\x04\x83\x54\x6c\x0e\x8f\x95\xdb\x2f\xe3\x71\x33\
+\x00\xc0\xec\xc9\xba\x00\xd2\xa8\xae\xb4\xbc\xbc\xbc\x15\xc0\x2d\
+\x38\xe1\xc0\x56\x00\x3b\xe0\xa8\xef\x56\x89\x3a\xf3\xad\x5b\xb7\
+\xc4\x83\xcc\x43\xa1\x90\x75\xe2\xc4\x09\x61\x00\x44\x58\x30\x2b\
+\xdb\x95\x2d\x44\x00\xbc\xce\x3b\xa6\x28\x8a\x37\x3d\x28\xdb\xfb\
+\x1f\x25\x84\x00\x88\x8c\x6d\xdb\xb6\xe1\xf5\xd7\x5f\x87\x61\x18\
+\xa8\xaa\xaa\x52\xc5\xc8\x2f\xb8\x43\x42\x55\x55\x05\x63\xcc\x93\
+\x0f\x93\xc3\xa1\xb9\x60\xdb\x36\xce\x9f\x3f\x8f\xf7\xde\x7b\x0f\
+\x86\x61\x70\x42\x88\xcd\x39\xb7\x07\x07\x07\x39\xa5\x54\xb4\xed\
+\xa6\xc1\xb2\x2c\x10\x42\xae\xa9\xaa\x7a\x12\xc0\x90\x74\x9e\x51\
+\x00\xc3\xd2\x4b\x45\x92\x4f\xfc\xfb\xb1\x5d\xf8\x02\x8f\xa3\x01\
+\x00\xd2\x67\x10\x10\xb8\x9a\xf7\x9c\x73\x02\xc0\x1a\x19\x19\xe9\
+\x07\xd0\x5f\x5a\x5a\x5a\x1c\x8f\xc7\x6f\x31\xc6\xe2\x8c\x31\xd5\
+\x4d\x3e\x95\xdc\xb8\x71\x03\x3d\x3d\x3d\x62\x1b\x0b\x28\x8a\x12\
+\x2c\x2d\x2d\x45\x43\x43\x03\xea\xeb\xeb\xbd\x87\x5d\x0c\x29\x11\
+\x9a\xf7\x3e\x9f\x6f\x3e\x4e\x41\x56\xa3\x91\x2b\xc8\x16\x02\x54\
+\x55\x55\xa1\xaa\xaa\xca\x7b\x09\xe7\x5c\x75\x8d\x99\xa7\xf2\x93\
+\x0d\xa2\x1f\x5f\x88\x89\x88\x29\x3b\x9c\x73\xf4\xf6\xf6\xa2\xad\
+\xad\x0d\x1f\x7e\xf8\x21\xdc\x52\x9e\x02\xc0\x27\x0f\x16\x85\x3b\
+\x2e\xdd\xbd\x67\xb0\x6d\x5b\x07\x70\x91\x52\xfa\x29\xd2\x47\xa7\
+\x89\xce\x4f\x15\xd2\x24\xea\x45\xb9\x20\xcb\x04\x8f\xab\x01\x10\
+\x90\x13\x79\xf2\x58\x32\x00\x40\x2c\x16\x9b\xda\xb9\x73\x67\xd7\
+\xe8\xe8\x28\x9f\x99\x99\x89\x59\x96\x75\x35\x91\x48\x14\xb8\x6e\
+\xfc\x0a\x00\xb5\x00\x76\x31\xc6\xfc\x17\x2f\x5e\xc4\xa9\x53\xa7\
+\xb0\x76\xed\x5a\xa1\xd5\x47\x93\xc9\x24\x17\xc3\x4a\x76\xed\xda\
+\x45\x76\xec\xd8\xc1\xa5\xcf\x9c\xd7\x0f\xce\xe4\x19\x64\x26\xcb\
+\xee\x11\x9c\x10\xc2\xdd\xf7\xa7\xfd\xf4\x5e\x90\x92\x0b\x5f\x30\
+\xec\xc8\x96\xb0\xcb\x76\xce\x0b\x69\x13\x88\x7e\x7c\xc3\x30\x38\
+\x63\xcc\x0e\x04\x02\x5c\xd3\x34\x58\x96\x45\x6e\xdf\xbe\xcd\x2f\
+\x5e\xbc\x28\x4a\xac\xde\x07\xd8\xb6\xed\x35\x10\x11\x42\xbe\x53\
+\x55\xf5\x8a\x65\x59\xd4\xed\x82\x34\xe1\xe4\x72\x32\x05\x11\x85\
+\xa1\x0f\x20\xd5\xbd\xf7\x58\x26\xfb\xe6\x42\x4e\xc5\x99\x8f\x10\
+\xb2\x58\x68\xa6\x5b\xa8\x96\x96\x96\x86\x13\x89\x44\xa1\x6d\xdb\
+\x61\xd3\x34\xc5\x6b\xd7\x01\x78\x1e\xc0\xab\x00\x36\x85\x42\x21\
+\x94\x97\x97\xa3\xa0\xa0\x00\x3e\x9f\x0f\xb6\x6d\x9b\x94\x52\x4e\
+\x08\x41\x38\x1c\x26\xaf\xbd\xf6\x1a\xfe\xf0\x87\x3f\xf0\x40\x20\
+\x20\x72\x10\xf3\x1a\x00\x21\xa4\x09\x2c\x5c\x3a\x9b\x07\x9c\x10\
+\xe2\xfd\xe7\x1e\x2b\xab\x01\x70\x77\xdb\xfb\x36\x00\x72\x3c\x7f\
+\x2f\x73\x19\xa7\xa7\xa7\xf1\xc6\x1b\x6f\xe0\xe4\xc9\x93\xd0\x75\
+\x9d\x71\xce\x6d\xbf\xdf\xcf\x54\x55\x25\xa6\x69\x22\x91\x48\xf0\
+\xf1\xf1\x71\xb8\xc9\x3d\x31\xcd\x48\x3e\x87\x29\x00\x6f\x68\x9a\
+\xf6\x96\x65\x59\xf2\x50\xc1\x29\xa4\xbb\xfb\x69\x6f\x13\x5f\x77\
+\xbe\xef\xf7\x38\xe2\x71\xf7\x00\x04\xb8\xf4\x53\xb8\x8c\x0a\xdc\
+\x64\x91\x5b\x3b\x9e\x02\x52\xc9\x30\x4a\xe9\x40\x65\x65\x65\x68\
+\x7a\x7a\x7a\xa3\x65\x59\x56\x3c\x1e\xc7\xcd\x9b\x37\xe1\xbe\xaf\
+\x02\xce\x98\x28\x0f\xd5\xd5\xd5\xd8\xba\x75\x2b\x6a\x6b\x6b\xbd\
+\xcf\x4c\x26\x93\xf0\xfb\xfd\x50\x55\x95\x15\x17\x17\x4f\x96\x94\
+\x94\x4c\xb9\xda\x04\x45\x7e\xbf\x7f\x05\x52\x2e\xac\x7c\x6e\xf7\
+\x83\x87\x9a\x4c\x14\x1e\xc1\xc4\xc4\x04\x8f\x46\xa3\x9e\x9b\x2f\
+\x5c\x7c\xc6\x18\xfa\xfa\xfa\xd0\xd6\xd6\x06\xb7\x1f\x7f\x4e\x4f\
+\xc8\x35\x2e\x16\x21\xe4\x26\xe7\xdc\x74\xe5\xb8\xc1\x39\xff\x1e\
+\x40\xbb\x65\x59\x57\xb2\xbc\x2d\x53\xee\x7d\x56\xe9\x37\x8f\x74\
+\xe4\x0d\x40\x76\xc8\xfc\x81\xd9\x7f\x74\xdc\x5c\xb3\xae\xae\xee\
+\x3b\xc3\x30\x82\x9c\xf3\x76\x29\xb9\x57\x01\x47\x83\xa0\x49\x7e\
+\xcf\x95\x2b\x57\xf0\xaf\x7f\xfd\xcb\x53\xc3\x51\x55\xd5\x14\xda\
+\xf4\x9c\xf3\x64\x4d\x4d\xcd\xa5\x67\x9e\x79\xa6\x63\xe7\xce\x9d\
+\x50\x14\x65\x27\x80\x67\xe1\x74\xa3\x89\xed\x94\x21\xdd\x20\xe4\
+\x2a\xf8\xc5\x8b\x17\xed\xe6\xe6\x66\x5b\xc8\x95\x07\x02\x01\x28\
+\x8a\x42\x28\xa5\x18\x1b\x1b\x13\x62\x1c\x40\xfa\x10\x8d\xf4\x83\
+\x38\x75\xfc\x98\xaa\xaa\x9f\x69\x9a\xf6\x9d\x28\xb3\x72\xce\x27\
+\xe1\x74\xed\x65\x43\xe6\x62\xcf\xbb\xfc\x0b\x20\x6f\x00\x66\x63\
+\x5e\x2a\xb1\x20\xc4\x30\xc6\xd0\xdd\xdd\x7d\x1b\x4e\x33\x89\x9c\
+\x58\x12\x3c\x82\x46\x48\xbb\x9b\x3b\xb7\x40\xb8\xcc\x36\x00\x55\
+\x51\x14\xe2\xf7\xfb\x61\x18\x86\xe9\xf7\xfb\x87\x8b\x8b\x8b\xbf\
+\xfb\xe3\x1f\xff\x88\x3f\xff\xf9\xcf\x6b\xdd\x50\x41\xbc\x5f\x18\
+\xa3\x9c\x57\x26\x91\x75\xf5\x75\x5d\xf7\x44\x44\x34\x4d\xf3\xc4\
+\x3f\xe7\x10\xdb\x48\x83\x54\xc7\xff\x04\xc0\x67\xd2\x9f\x7c\x48\
+\x1f\x80\x2a\x43\x0c\xee\xcc\xe3\x1e\x91\x37\x00\xf3\x43\xb8\xd0\
+\xc2\x55\x95\x5d\x6a\x0a\xe7\x61\x8b\x01\x10\x93\x7a\x60\x18\x46\
+\x67\x59\x59\x59\x6b\x32\x99\x2c\x05\x10\xe2\x9c\x2b\x8c\x31\xcb\
+\x30\x0c\x9a\x48\x24\x7c\x00\x8a\xe1\x24\x0f\x2b\xa4\xcf\x29\xd2\
+\x75\xbd\x66\x62\x62\x62\xc7\x5f\xff\xfa\x57\x4c\x4c\x4c\xd4\xed\
+\xdd\xbb\xb7\x50\xcc\x01\x20\x84\x50\xc6\x18\x73\xa9\xad\x4a\x66\
+\x1c\x9f\x0d\xaa\xaa\x5a\xc1\x60\x30\x5e\x5c\x5c\x3c\x59\x54\x54\
+\x34\x1d\x0e\x87\xe3\xc1\x60\xd0\x0c\x04\x02\xa6\xcf\xe7\xa3\x00\
+\x48\x22\x91\xf0\x4f\x4f\x4f\x87\x63\xb1\x58\x49\x2c\x16\x5b\x39\
+\x33\x33\x53\x62\xdb\xb6\xfc\x4c\xcc\x1b\x76\xb8\x25\x3e\x12\x0c\
+\x06\xbd\xf3\xf9\xfe\xfb\xef\xd5\xf6\xf6\x76\x45\x1e\x01\x96\x0d\
+\xee\xe0\x10\x93\x10\x72\x4d\x51\x94\x3b\x8c\x31\xaa\x28\x0a\x63\
+\x8c\x15\xb8\xa2\x21\x0c\x8e\x12\xef\x37\x70\xb2\xfe\xb3\x0e\x81\
+\x74\x03\xb9\x6c\x64\xba\x1e\x26\x72\xdd\x9d\xcc\x05\xc8\x09\x42\
+\xf9\x7a\xa5\x79\x08\xb2\x50\x48\x61\x61\xe1\x26\x4a\x69\x0d\xe7\
+\xdc\xcf\x39\xf7\x31\xc6\x0c\x77\xc2\x8c\x0a\x60\x03\x80\xff\x42\
+\x86\x34\x37\x1c\xb2\xca\x38\x00\xb2\x69\xd3\xa6\xca\x9a\x9a\x1a\
+\x9f\xcb\x2a\xe4\x84\x10\x83\x31\xc6\x5d\x7e\x40\x66\x42\x8b\x63\
+\x76\x9e\x80\x6b\x9a\xa6\x07\x83\xc1\xe1\x95\x2b\x57\x7e\xbf\x7a\
+\xf5\xea\x81\x8a\x8a\x8a\xd1\xf2\xf2\xf2\xc9\x35\x6b\xd6\x4c\x55\
+\x54\x54\xc4\x2d\xcb\x52\x86\x86\x86\x8a\x7b\x7b\x7b\xd7\x0e\x0c\
+\x0c\x6c\x1e\x1d\x1d\xdd\x3a\x3d\x3d\x5d\x63\xdb\xb6\x5c\xbf\x63\
+\x59\xbe\xb7\x07\xb7\x04\x47\x34\x4d\xf3\x16\x5d\x2c\x16\xf3\xf7\
+\xf6\xf6\x2a\xd9\x06\x80\xca\x70\x4b\x7a\x37\x15\x45\xf9\x6f\x9f\
+\xcf\x77\xce\xb6\x6d\xa6\x69\x1a\xb7\x2c\xab\xc0\xb6\x6d\x66\xdb\
+\x36\x85\xa3\xc2\x7b\x0d\xd9\xdb\x72\x33\xaf\x45\xde\xdd\x7f\x00\
+\xe4\x3d\x80\x85\xc1\x33\x7e\xca\x90\x79\x04\x22\x43\xce\x26\x27\
+\x27\xfb\x91\x31\x33\x4e\x24\x0f\x2b\x2a\x2a\xd6\x8f\x8d\x8d\xd5\
+\x32\xc6\xb6\xc1\x61\xa5\x01\xa9\xb8\x75\x2d\x63\x8c\xf4\xf7\xf7\
+\xdb\xfd\xfd\xfd\x06\x52\x32\x67\xb3\x46\x02\xdd\xe3\x79\xfb\xdc\
+\x63\x1b\x00\x66\xe0\xb0\x1e\x63\xee\xbf\x45\x92\xb3\x18\x8e\x27\
+\xa3\xc2\x91\x51\x5b\x0c\xf1\x03\xcb\x4d\xe0\xc9\xd7\x4c\x30\xef\
+\x02\xa2\x1f\x1f\xc0\x65\xdb\xb6\x3f\xb7\x2c\xeb\x2c\xe0\xcd\x70\
+\xcc\x06\xb9\xac\x30\x6f\x7e\x26\x8f\xfb\x43\xde\x00\x3c\x38\xe4\
+\xf0\x40\x7e\x40\xb3\x06\xb8\xa2\x3c\x16\x8d\x46\x87\xca\xca\xca\
+\xbe\x9c\x99\x99\x51\x19\x63\x01\x00\xc4\x65\x00\x16\x70\xce\x4b\
+\xdc\xa1\x9a\x16\x9c\x45\x5f\x0b\x27\x97\xf0\x20\x9e\x5a\xc8\x7d\
+\x7f\x00\xc0\x6a\x38\xac\xb8\x69\x38\xee\xb4\xe1\x1e\xb3\xd0\xfd\
+\x5b\x35\x9c\x31\xe3\x8b\xa5\x7c\x12\x09\x06\x83\x97\x15\x45\x11\
+\xd7\x82\x30\xc6\xb8\xa2\x28\x94\x31\xa6\x09\x22\x10\x1c\xf7\xbe\
+\xeb\x1e\x8e\x27\x3f\xa7\xa2\xb1\x2b\xbf\xdb\x2f\x02\xf2\x21\xc0\
+\xe2\x40\xbe\x8e\x73\x3e\x98\xa2\x9e\x5f\x5c\x5c\xbc\xd2\x30\x8c\
+\x32\xce\xb9\xe8\x24\x64\x00\x54\xce\xb9\xcf\x5d\x18\x7e\x38\xa1\
+\xc2\xcf\x00\xfc\x27\x9c\xa4\xe2\x8f\x01\x87\x63\x98\x32\xb9\xef\
+\xaa\xfb\x59\x0f\x3e\x55\x64\x36\xa6\x01\xbc\xe1\xf3\xf9\x4e\x12\
+\x42\x44\x9d\x5e\xe5\x9c\x2b\x84\x10\x13\x00\x91\x92\x80\x53\x70\
+\x66\xec\x2d\xb4\x9b\x67\x3e\xa7\xf9\xc5\xbf\x48\xc8\x7b\x00\x8b\
+\x03\xf9\x81\x94\x79\x04\xf2\xef\x44\x88\x60\x4d\x4e\x4e\x4e\x00\
+\x98\xc8\x76\x20\xd1\x3a\x7b\xe8\xd0\xa1\xa1\x48\x24\xe2\x8f\xc7\
+\xe3\xe5\x8c\xb1\x1d\xd2\x4b\xc4\x18\x9f\x85\xee\x9d\x02\xd7\xa8\
+\x20\xd5\xfc\x24\x27\x33\x01\xc7\x28\x24\x00\x58\xee\xe2\x4c\x93\
+\x58\x47\xaa\x45\x7a\x2e\x08\xb1\x4c\xb9\x9c\xd7\x47\x08\x69\x4b\
+\x24\x12\x57\x16\x38\x3f\x19\xf2\xfb\xc5\xe7\x09\xc3\xf8\x58\x37\
+\xeb\xfc\xd4\xc8\x7b\x00\x8b\x8f\x4c\xaa\x6f\x66\x26\x7d\xde\x32\
+\x95\xc8\x15\x28\x8a\x82\xea\xea\xea\xba\xf1\xf1\xf1\x46\x4a\x69\
+\x95\xf4\x77\x31\xb3\x6e\xa1\x92\xa0\x6c\x00\x7c\xee\xbf\x85\x11\
+\x10\xe7\xc3\x08\x21\x14\x29\x03\x60\xe1\xfe\x16\x9b\x68\xd6\x91\
+\x8d\xd1\xb8\xcf\xe7\x6b\x8f\xc5\x62\x83\xf7\x71\x1c\x99\x53\x9c\
+\x99\xd4\xcc\xbb\xfb\x3f\x21\xf2\x06\x20\xb7\xa1\xc2\x5d\xbc\x3f\
+\xe2\x18\xd9\xb2\xf8\xd9\x2a\x09\xf2\xcf\xfb\x41\xa6\x81\x63\x48\
+\x85\x1b\x79\xe4\x38\xf2\x06\xe0\xe1\x43\xd6\x23\x98\x0b\x22\x66\
+\x5f\xca\x3b\x9f\x5c\xa7\x07\xb2\x73\x0a\x66\x4d\x76\xca\xe3\xe1\
+\x22\x6f\x00\x1e\x0d\x16\xa2\xf4\x2e\x87\x32\x57\xe6\x77\xcc\x66\
+\x00\xf2\xf5\xfb\x47\x8c\xbc\x01\xc8\x5d\xcc\x45\x40\x5a\x0a\x58\
+\x76\x13\x74\x96\x2b\xf2\x55\x80\xdc\x46\x9a\xe8\xe8\x12\x81\x58\
+\xf8\xf9\x1c\xc0\x12\xc0\x52\x7a\xb0\x1e\x47\x2c\xd5\xfb\x93\xdf\
+\xfd\xf3\xc8\x23\x8f\x3c\xf2\xc8\x23\x8f\x3c\xf2\xc8\x23\x8f\x3c\
+\xf2\xc8\x23\x8f\x3c\x72\x08\xff\x0f\x39\x12\xe6\x8e\xc9\x2b\xcd\
+\xf5\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x04\xb7\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x60\x00\x00\x00\x60\x08\x06\x00\x00\x00\xe2\x98\x77\x38\
+\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x04\
+\x71\x49\x44\x41\x54\x78\x5e\xed\x9d\x39\x8e\x15\x31\x10\x86\xbf\
+\x89\x09\xd8\x77\x42\x62\x10\x22\x20\xe4\x08\x08\x02\x36\x01\x12\
+\x09\xdc\x00\x89\x13\x20\x21\x21\x72\x02\x12\xf6\x04\x71\x03\x22\
+\x44\x82\x90\x48\x10\x17\x60\x17\x20\x02\x62\x18\x4b\xf3\xa4\x99\
+\x9e\xd7\xcf\x55\xd5\xd5\x6d\xfb\x51\x9d\x4e\xb5\xcb\xfe\x3f\xdb\
+\x6d\x97\xeb\x79\x56\x88\xa7\xa8\x02\x2b\x45\xbd\x87\x73\x02\x40\
+\xe1\x4e\x10\x00\x02\x40\x61\x05\x0a\xbb\x8f\x11\x10\x00\x0a\x2b\
+\x50\xd8\x7d\x8c\x80\x06\x01\x6c\x05\x6e\x03\xa7\x80\xbd\x3d\xf5\
+\xff\x0a\x3c\x07\x6e\x02\xbf\x0b\xb7\xb1\x6a\xf7\x96\x11\x70\x1f\
+\xb8\x2a\x6c\xd5\x3d\xe0\xba\xd0\xf6\xbf\x34\xb3\x00\xf8\x06\xec\
+\x16\xaa\xf5\x19\x38\x20\xb4\xfd\x2f\xcd\x2c\x00\xbe\x03\xbb\x14\
+\x6a\x59\x7c\x28\x8a\x6f\xdb\xd4\x22\x8e\x66\x0a\x4a\xea\x58\x7c\
+\xb4\xad\xaa\xa2\xf6\x16\x71\xb6\x01\x2f\x80\x93\x42\x3f\x16\x1f\
+\xc2\xa2\xdb\x37\xf3\x14\xe7\x6f\x8f\x1c\x9e\x3e\xda\x57\xbc\xd3\
+\x02\x4f\x71\x02\x80\xa1\x7b\x04\x00\x83\x68\x9e\xaf\x04\x00\x4f\
+\x35\x0d\x65\x05\x00\x83\x68\x9e\xaf\x04\x00\x4f\x35\x0d\x65\xd5\
+\x0a\xe0\xe0\xea\x0e\x3a\x85\x31\x4e\x00\x3b\x0d\xed\x9a\xf2\x95\
+\x1f\xc0\xab\xb5\x90\xcb\x17\xad\xe3\x1a\x01\xec\x07\xde\x29\xc2\
+\x1d\xda\x36\x8f\x65\x9f\x42\x34\x47\x01\x15\x84\x1a\x01\x3c\x03\
+\xce\x8e\xa5\xd2\xc8\xe5\x3e\x02\x2e\x69\x7c\xd4\x08\xe0\x17\x90\
+\x76\xdb\x2d\x3e\x1f\x81\x43\x9a\x8a\xd7\x08\x20\x0d\xe1\xbe\x73\
+\x06\x4d\xdb\x4a\xd8\xaa\xa3\xbf\x35\x02\x78\x0a\x9c\x2b\xa1\x9e\
+\x83\xcf\x87\xc0\x65\x4d\x39\x35\x02\xd8\x07\xbc\x05\xd2\xc7\xb8\
+\xa5\x27\x4d\x3f\xc7\x80\x14\xae\x17\x3f\x35\x02\x48\x95\xdf\x02\
+\xdc\x00\x2e\x02\x87\xc5\xad\x29\x63\xf8\x01\x78\x02\xdc\x01\xfe\
+\x68\xab\x50\x2b\x00\x6d\x3b\x9a\xb5\xf7\x04\x30\xef\xa4\x2c\xad\
+\x8d\x5b\xfd\xa0\x4e\x02\xd5\x13\xc0\xbc\x93\xb2\x38\x94\xcf\x60\
+\xf4\x04\xd0\x3d\x29\x7b\xb9\xba\xa3\x3d\x1d\x69\x29\x8b\x09\x78\
+\x02\x98\x64\xc8\x2e\x9b\x93\x00\x50\x98\x68\x00\x08\x00\x85\x15\
+\x28\xec\xde\x32\x02\x24\xb9\xa1\xeb\x9b\x95\xe2\xe5\xaf\x81\x6b\
+\xab\x31\xf3\x14\x2b\x89\x67\x9d\x02\x16\x00\xda\xc4\xac\x99\xbb\
+\xb4\x27\x38\x02\xa4\xc4\xdd\x78\xd6\x14\xb0\x00\xd0\xa6\x26\xae\
+\x17\x5b\x1d\x2f\x5f\x76\x52\x53\x03\x50\xc7\xcb\x03\xc0\x66\x05\
+\xac\x53\xd0\xac\x24\x0b\xf4\xa5\xe5\x60\x11\x43\x9b\x1b\xda\x15\
+\xcf\xe2\x33\x00\x18\x14\x88\x54\x45\x81\x68\x63\xf6\xc6\x00\xd0\
+\x30\x80\xc8\x0b\xca\xc0\x1b\x22\x50\x6e\xd4\x45\x5e\x50\x46\xfc\
+\xa1\x02\xe5\x00\xc4\xa1\x7c\x06\xc0\x90\xc4\xa9\x4f\x40\x1a\x3d\
+\x8b\x9e\x14\xba\xd8\x21\x98\x3e\x6b\x34\x51\xef\x73\x72\xbd\x71\
+\x5e\x23\x53\x28\x61\x8f\xb1\xf5\x92\xb4\x8d\x96\xf3\x82\x24\x1d\
+\x6c\x83\x74\x16\x00\x7d\xab\x9b\x1c\x93\xd4\x3b\x8e\x0b\x62\x41\
+\x29\xc3\xe0\x7c\xae\xb0\x4a\xff\x2e\xe9\x60\x93\x03\x78\x0f\xa4\
+\x69\x4b\x9a\xb6\x91\x7e\x57\xfc\xa6\xd1\xbc\x20\x49\x07\x1b\x0d\
+\x80\x65\x34\xf5\x75\xe4\xc8\x0b\x5a\x30\xc4\x63\x83\xe5\x38\xff\
+\x59\x7a\x6d\x00\xa8\x14\xc0\xa2\x6a\xc5\xed\x29\x3d\xea\x78\x8e\
+\x00\x49\xbf\x88\x44\xad\x8e\x4a\x53\x03\x48\x6b\xfc\xd6\xb2\x9e\
+\x25\x1d\xcb\x6c\x63\x01\x30\xe4\x48\x32\x72\x45\x1d\x46\xc0\x90\
+\x13\xb1\x98\x82\x1c\x00\x58\x4f\xc4\x22\x57\x74\xce\x44\x65\x99\
+\x82\xcc\xf3\x5d\xbc\xb8\x59\x81\x00\x50\xb8\x57\x04\x80\x00\x50\
+\x58\x81\xc2\xee\x2d\x23\x20\x72\x43\x1d\xa1\x59\x00\x58\x97\xa1\
+\x91\x1b\xea\xb4\x0a\x1a\xb2\x11\x8b\xdc\x50\x87\x7d\xc0\x10\x00\
+\xea\x33\x53\xc7\xd1\x5e\x65\x51\x53\x4e\x41\x33\x01\x24\x3e\x87\
+\xa4\xbd\x4c\x2d\xf4\xe4\xf7\x05\x59\x77\xc2\x52\x00\x43\xd3\x5e\
+\xa6\x06\x30\xf3\x57\xfc\xbe\xa0\x6e\xc3\xad\x07\x37\x43\xd2\x5e\
+\x4a\x89\x3f\xf3\xab\xfe\xc6\x49\xa6\x03\x6b\xa3\xac\x00\xe2\xbe\
+\x20\xab\xe2\x9d\xf7\xe6\x01\x90\xdc\xa7\xd3\x72\x5e\x90\xa4\x7d\
+\x1b\x64\xf2\x18\x01\x69\x63\x76\x0b\x38\x23\xb8\x17\xe2\x01\x70\
+\x25\x03\xf8\x31\x70\xc1\xa9\x13\x4c\x5d\x8c\xa4\x7d\xee\x00\xa4\
+\x1b\x33\xe9\x7d\x3a\x71\x5f\x90\xb2\xdb\xfc\x04\xb6\x2f\x78\xc7\
+\x72\x9f\x4e\xe4\x05\x29\x20\xe4\xfe\xa3\xc6\xa0\x75\xb2\xa2\x1e\
+\x4d\x9a\x7a\x7c\x03\xa4\x53\x90\x69\x9d\xdc\xa4\xaa\x8a\x4a\x7b\
+\x00\xd0\x6c\xcc\xd4\xc9\xab\x8a\xb6\x34\x69\xea\x01\xa0\xaf\xe1\
+\xf3\x96\xa1\x11\x0b\x72\x08\xc6\x49\x7b\x9a\x75\x23\x26\x2d\x7f\
+\x29\xec\xa6\x1e\x01\x49\xb4\x31\x7d\x36\x07\xc5\x22\x86\xf6\x44\
+\xac\x2b\x8a\xc5\x67\x73\xc2\x4a\x2b\x6c\x11\x43\xba\xea\xe9\xab\
+\x83\xc5\xa7\xb4\x3d\xcd\xd9\x59\xc4\xc8\xad\xfb\x17\x89\xa0\xfe\
+\x0d\x55\x73\x8a\x2a\x2b\x3c\x35\x80\x58\x86\x3a\xac\x82\xac\x53\
+\x90\x34\x16\xa4\xec\x43\x6d\x9b\x5b\x46\x80\x66\xe3\x95\xd4\x49\
+\xb1\xa0\x74\x50\x71\xd7\x72\xb7\x72\xdb\xf2\xe6\x6b\x6f\x01\x90\
+\x2f\x35\x2c\xc4\x0a\x04\x00\xb1\x54\xe3\x18\x06\x80\x71\x74\x15\
+\x97\x1a\x00\xc4\x52\x8d\x63\x18\x00\xc6\xd1\x55\x5c\x6a\x00\x10\
+\x4b\x35\x8e\x61\x00\x18\x47\x57\x71\xa9\x01\x40\x2c\xd5\x38\x86\
+\xff\x00\x12\xde\xc6\x61\xaa\x55\x98\x41\x00\x00\x00\x00\x49\x45\
+\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x06\x12\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x60\x00\x00\x00\x60\x08\x06\x00\x00\x00\xe2\x98\x77\x38\
+\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x05\
+\xcc\x49\x44\x41\x54\x78\x5e\xed\x9d\x5d\x68\x1c\x55\x14\xc7\xff\
+\x67\x36\x11\x7c\x11\x1f\xd4\xd6\x0a\xf6\xc3\xdd\x0d\x6d\x41\xc1\
+\xfa\xf1\x50\x28\x95\x8a\x52\x25\x31\x99\xd8\x3e\x58\x9f\x44\x50\
+\x84\x64\x67\xc1\x8f\x17\xb1\xe9\x63\xfd\x60\x66\x1b\x44\x45\x04\
+\x85\x5a\xd4\xda\x49\x6d\xa5\xa2\x16\x14\x3f\x40\x93\x27\x2d\x2a\
+\xcd\xac\xc6\x8a\x54\x6b\x1e\xf5\x45\x92\xdd\xa3\x93\x34\xd5\x96\
+\x24\xb3\x67\x66\xee\xdc\xdd\xc9\xcd\xeb\x9c\x8f\x7b\xff\xbf\x7b\
+\x66\x76\x4f\xf6\xce\x25\x98\x3f\xad\x0a\x90\xd6\xec\x26\x39\x0c\
+\x00\xcd\x8b\xc0\x00\x30\x00\x34\x2b\xa0\x39\xbd\xa9\x00\x03\x40\
+\xb3\x02\x9a\xd3\x9b\x0a\x30\x00\x34\x2b\xa0\x39\xbd\xa9\x00\x03\
+\x40\xb3\x02\x9a\xd3\x9b\x0a\xe8\x74\x00\xe5\x7e\x77\x27\x5b\xd8\
+\x09\xb2\x7a\xc0\x7c\x13\x80\x55\x9a\xe7\x14\x27\xfd\x8f\x00\xbe\
+\x05\x38\x60\x14\x46\xeb\xfe\xf0\xaf\x71\x82\xc4\xf1\x49\x54\x01\
+\x25\xbb\x76\xf0\xdf\x41\xef\x89\x93\xb8\x5d\x7d\x08\x34\xd9\x64\
+\x7e\xba\x3e\xe6\x1c\xce\x62\x8c\xb1\x01\x94\x6c\x8f\xb3\x18\xa0\
+\xae\x1c\x0c\xde\x57\xf7\xab\x23\xaa\xf3\xc7\x02\x50\x1a\xf4\x86\
+\xc1\xa8\xa9\x1e\x9c\xee\xf8\x59\x40\x10\x03\xe8\xb1\x47\xb7\x36\
+\xd1\xf8\x42\xb7\x38\x59\xe5\x57\x0d\x41\x0c\xa0\x6c\x7b\x2f\x32\
+\xf0\x58\x56\x02\xb4\x43\x1e\x95\x10\xc4\x00\x4a\x03\xde\x27\x20\
+\x6c\x6f\x07\x61\xb2\x1c\x83\x2a\x08\x72\x00\xb6\xf7\x07\x80\xab\
+\xb3\x9c\x7c\xbb\xe4\x52\x01\x21\x0e\x80\x5c\x7f\xfa\x89\x82\x9d\
+\x36\x04\x03\x20\x4a\xf1\x45\xae\xa7\x09\xc1\x00\x88\x01\x20\x74\
+\x49\x0b\x82\x01\x10\x13\x40\x5a\x10\x32\x03\xc0\x8c\xdd\x8d\x06\
+\x3e\x9b\x3a\xe6\x9c\x4b\x30\x67\xb1\xeb\xfa\x3e\x6f\x55\xa1\x80\
+\x6d\x44\x78\x47\xec\xdc\x82\x43\xd2\x4a\xc8\x04\x40\xe0\x3b\xe2\
+\x3c\x2d\xcc\x5d\x6c\xa2\xaa\x7d\x92\x04\x82\x58\x18\xe9\x24\x18\
+\xb8\xaf\xee\x3b\xc7\xc4\x6a\x29\x70\x28\xda\x5e\x1f\x01\xef\x29\
+\x08\x8d\xb0\xc2\xe3\x34\xf0\x94\x03\xe8\x02\xaf\xf9\xc1\xaf\xfe\
+\xa6\x62\xd2\xd2\x98\x1b\x6d\xf7\xda\x59\xd0\x59\xa9\x5f\x2b\xf6\
+\x73\x5d\x54\xd0\x0e\x69\x2b\x5b\x39\x80\x76\xb9\xfd\x2c\x88\x28\
+\xad\xe0\x56\xc4\xbf\x60\xc3\x78\x2e\x18\x73\x9e\x94\xf8\x18\x00\
+\x12\xb5\xa2\x6d\x4f\x04\xbe\x73\x6f\xb4\xd9\x7f\x16\x06\x80\x44\
+\xad\x68\xdb\x9f\x03\xdf\x59\x1f\x6d\x66\x00\x48\x34\x12\xd9\x4a\
+\x6f\xb9\xa6\x02\x44\xf2\x46\x1b\x1b\x00\x11\x1a\x29\x7d\x08\x03\
+\x30\x00\x0c\x80\x8b\x15\x90\xae\x88\xe8\x22\x4f\x66\xb1\xe2\x2a\
+\x60\x76\x16\xab\xb3\xee\xff\x2c\x85\x28\xec\x0b\x75\x75\xe1\xf7\
+\x64\x08\x97\xf7\x96\x2e\x38\xe5\x0f\xe1\xb8\x5f\xd1\x55\x88\x54\
+\x1c\xf0\x76\xa9\x6a\xca\x2d\x8c\xb7\xed\x00\x84\x03\x93\x0e\x4a\
+\x85\xf8\x61\x4c\xd5\xb7\x9f\x38\x73\x55\x5e\x01\x0b\x62\x86\x4d\
+\xb9\x6e\xf0\x44\xd6\x7d\xa1\xb0\xff\x33\x03\xba\x55\x55\x13\xee\
+\xd2\xc5\x22\x5d\x6c\x99\x01\x50\xb5\xaa\xdb\x2d\xae\x01\xa0\x99\
+\x88\x01\x60\x00\x68\x56\x40\x73\x7a\x53\x01\x06\x80\x66\x05\x34\
+\xa7\x37\x15\x60\x00\x68\x56\x40\x73\xfa\x9c\x57\x00\xff\x09\xa6\
+\x71\x26\x1a\xb7\xd0\x98\x40\x01\xe3\x85\x06\x35\x67\x2d\xda\xc2\
+\x4d\xbe\x85\x60\xdd\x0c\x60\x0b\xc0\x6b\x74\x71\xc8\x2d\x00\x62\
+\x1c\xa4\xd9\x99\x67\x4e\x1f\x7f\x62\x2a\x4a\xdc\x92\xed\xee\x07\
+\x48\xf4\xcf\xf1\xa8\x98\xad\x5e\xcf\x23\x80\x69\x02\x86\x26\x7d\
+\xe7\xed\x56\x45\x08\xed\x8a\xfd\xee\x76\x58\x78\x9d\x40\x6b\x25\
+\x7e\x49\x6d\x73\x05\x80\x41\x23\x75\xbf\xb2\x2f\x89\x28\x45\xdb\
+\x1d\x21\xd0\xde\x24\x31\x24\xbe\x79\x02\x30\x15\xf8\xce\x06\xc9\
+\xe4\x97\xb2\x2d\xd9\xde\x57\x00\x6e\x4f\x23\x56\x54\x8c\xdc\x00\
+\x20\xe0\xb6\x49\xdf\x99\x88\x9a\x70\x2b\xd7\x37\xec\xf2\xae\x2f\
+\x34\x70\xa6\x15\xdb\xa4\x36\xb9\x00\xc0\xc0\x0b\x75\xdf\x79\x3c\
+\xa9\x18\xff\xf7\x2f\xd9\xde\x23\x00\x5e\x4e\x33\xe6\x62\xb1\xf2\
+\x00\xe0\x2f\x86\xb5\x51\xfa\x1b\xcb\x56\x84\x2d\xd9\xee\xc7\x00\
+\xdd\xd9\x8a\x6d\x5c\x9b\xce\x07\xc0\xf4\x79\x30\x56\xd9\x16\x57\
+\x80\xe5\xfc\xb2\xd8\x62\xdb\xf9\x00\xc0\xa3\x81\x5f\x1d\x56\x01\
+\xa0\x68\xbb\x0e\x81\x5c\x15\xb1\x17\x62\xe6\x00\x00\xed\x09\xfc\
+\xca\x21\x15\x22\x95\xef\xaf\xed\xe0\x26\x9f\x54\x11\x3b\x37\x00\
+\x1a\x05\xac\xfd\xe9\xb0\xf3\x8b\x0a\x91\x6e\x18\x78\xe9\x1a\x8b\
+\xfe\x56\xba\x45\xaa\xe3\x2b\x40\xe5\x86\x8e\x72\xef\xf3\x57\x71\
+\x77\xd7\xb4\x0a\xb8\xb9\xa9\x00\x58\xe8\x0d\xde\x75\xde\x57\x21\
+\x52\x8f\xed\x6e\x6d\x82\x94\xbe\x68\xa4\xe3\x2b\x20\xc9\x86\xb7\
+\x28\x68\xc5\x41\xf7\x21\x62\x7a\x2d\xca\x2e\xc9\xf5\x8e\x07\x00\
+\xd0\xf1\xc0\xaf\xf4\x25\x11\x61\xe9\x96\x44\x6d\x3f\xc0\x4a\xbb\
+\xa4\x79\x00\x70\x36\xf0\x2b\xd7\xa9\x01\xe0\x85\x3b\x24\x95\xc0\
+\xcd\xcf\x33\x60\x6e\x26\xfc\x6c\xe0\x57\x9f\x4a\x13\x42\xd9\xae\
+\x3d\xcc\xe0\x57\xd3\x8c\x99\xd7\x56\xc4\x3c\x82\x26\xdf\x51\x3f\
+\x5a\xfd\x34\x0d\xc1\xce\x6f\x4f\x0d\xdf\x8c\x78\x79\x1a\xf1\x96\
+\x8b\x91\x83\x5b\xd0\xfc\xf4\x18\x7c\xa6\xee\x57\xd7\xa5\x21\x58\
+\xc9\xf6\xbe\x01\x70\x63\x1a\xb1\xa2\x62\xe4\x06\xc0\x79\x08\x89\
+\xdf\x5c\x58\xb4\x6b\x7b\x09\xac\xfc\xed\x87\x39\x7b\x06\x5c\xb4\
+\xce\xbe\x6e\x14\xb0\x5b\xfa\xed\x78\x5d\xbf\x7b\x65\xb7\x45\x6f\
+\x01\xb8\x3b\x6a\xd5\xa6\x79\x3d\x57\x15\x70\x89\x30\x8f\x06\xbe\
+\xf3\x4a\x2b\x62\x95\x07\xdd\x7e\x6e\xd2\x1b\x20\x5c\xd1\x8a\x7d\
+\x9a\x36\x79\x06\x10\x3e\x19\x4e\xce\xbf\x93\x81\x03\xcb\xb2\x4e\
+\x35\x1a\x97\x9d\xa2\xae\x19\xc6\x4c\x63\x33\x2c\xda\x64\x11\x8a\
+\xcc\x5c\x04\xa8\x37\x4d\x51\x25\xb1\x72\x0e\x40\x22\x85\x1e\x5b\
+\x03\x40\x8f\xee\x17\xb2\x1a\x00\x06\x80\x66\x05\x34\xa7\xcf\xa2\
+\x02\xc2\x7d\xb6\x9d\x78\x46\x40\x16\x68\xce\x05\xbe\xb3\x5a\x92\
+\x48\xbe\x49\x6f\xb0\xf6\x21\x98\xef\x92\x24\x59\x31\xb6\x44\x1f\
+\x05\x47\x2a\xa2\xef\x1d\x72\x00\xb6\x7b\x00\xa0\xa1\x15\x23\xaa\
+\x68\xa2\xf2\x1f\x14\x88\x01\xcc\x1f\x59\x42\x27\x44\xe3\x5a\x21\
+\xc6\xd4\xe4\x7b\x26\x8f\x56\x3f\x90\x4c\x57\x0c\x20\x0c\x9e\xc7\
+\xa3\x4b\x24\xa2\x2d\x6e\x4b\x6f\x06\x7e\xe5\x41\x69\x9c\x58\x00\
+\xe6\x21\xe4\xfb\x08\x13\xa9\x90\xd2\x4f\x3f\x0b\xf1\x63\x03\x98\
+\x83\xb0\x42\x8e\x32\x59\x16\x06\xa1\x12\x1c\x71\x0e\x48\x81\xa5\
+\x02\x20\x0c\x12\x1e\x69\xc2\x68\x3c\xc0\x8c\x4d\x20\x6c\x5e\x01\
+\x67\x0b\x4c\x83\xf1\x1d\x11\xbe\x27\x14\x0e\x9d\xf6\x87\xbe\x8c\
+\x2b\x7e\xe8\x97\xa8\x02\x92\x24\x36\xbe\xf3\x0a\x18\x00\x9a\x57\
+\x82\x01\x60\x00\x68\x56\x40\x73\x7a\x53\x01\x06\x80\x66\x05\x34\
+\xa7\x37\x15\x60\x00\x68\x56\x40\x73\x7a\x53\x01\x06\x80\x66\x05\
+\x34\xa7\x37\x15\x60\x00\x68\x56\x40\x73\xfa\x7f\x00\x31\x95\x86\
+\x7f\x3e\x70\x9f\xcf\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\
+\x82\
+\x00\x00\x04\x74\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x60\x00\x00\x00\x60\x08\x06\x00\x00\x00\xe2\x98\x77\x38\
+\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x04\
+\x2e\x49\x44\x41\x54\x78\x5e\xed\x9c\xfb\x6e\x4d\x41\x14\xc6\xbf\
+\xef\x11\x90\x48\x05\x29\x8d\x26\x0d\x22\x44\xa3\x41\x08\x0f\x41\
+\xe2\x1d\x44\x5d\xe2\x52\x97\x56\xdd\x2f\x71\x09\xf1\x0c\x12\x1e\
+\x82\x50\x52\xa5\xa2\xa1\x84\xa8\x6b\x10\x7f\xe0\x11\x96\x4e\x7a\
+\xf8\x4f\x66\x9d\x1e\xfb\xac\x35\xd9\x6b\xfe\x9d\x6f\xef\x35\xf3\
+\xfd\xce\xda\x7b\xf6\xcc\x9c\x21\xa2\x98\x3a\x40\xd3\xe8\x11\x1c\
+\x01\xc0\xf8\x47\x10\x00\x02\x80\xb1\x03\xc6\xe1\x23\x03\x02\x80\
+\xb1\x03\xc6\xe1\x23\x03\x02\x80\xb1\x03\xc6\xe1\x23\x03\x02\x80\
+\xb1\x03\xc6\xe1\x23\x03\x02\x80\xb1\x03\xc6\xe1\x23\x03\x02\x80\
+\xb1\x03\xc6\xe1\x23\x03\x02\x80\xb1\x03\xc6\xe1\x23\x03\x02\x80\
+\xb1\x03\xc6\xe1\x23\x03\x02\xc0\x8c\x03\x22\xb2\x1b\xc0\x0e\x00\
+\xcb\x00\xcc\x35\xf2\xe5\x27\x80\xb7\x00\x6e\x92\xbc\xda\x8e\x36\
+\xb8\xc8\x00\x11\x39\x3e\xcd\x60\xa8\x1d\x1d\x6e\x22\xc6\x30\xc9\
+\xd4\xae\x4a\x8b\x39\x00\x11\xd9\x06\xe0\x56\xa5\xbd\x9c\xfd\xcd\
+\xb7\x93\xbc\x3d\xfb\xcb\xf3\x57\x7a\x00\xf0\x04\xc0\xda\x7c\x53\
+\x4d\x14\xe3\x24\x7b\xab\x8c\xec\x01\x40\x7a\xee\xce\xa9\xb2\x93\
+\x2d\xdc\xfb\x17\xc9\x4a\xdf\x47\x1e\x00\xfc\x30\x7c\xe9\xe6\xd8\
+\xfc\x24\x39\x2f\x27\x6a\xa5\xde\x03\x80\x47\x00\xd6\xb5\xd2\x89\
+\x0a\xaf\x1d\x23\xd9\x57\xe1\xfd\xed\x37\x66\x35\x86\x9f\x57\xaa\
+\xec\x64\x0b\xf7\xde\x53\xf5\x70\xd4\x3c\x03\x1a\xdf\x00\x31\x0c\
+\x6d\xe1\x57\xf2\x5f\x2e\x6d\x0c\x47\x0f\x02\xe8\x32\x7c\x29\xff\
+\x02\xf0\x0e\xc0\xf9\xaa\x87\x9f\x7f\x4c\x73\x91\x01\xb3\x25\x28\
+\x22\xe9\xf9\x3c\xaa\xb8\xfe\x0b\xc9\x45\x0a\x5d\xdb\x25\xa5\x03\
+\x18\x06\x30\xa8\x70\x6d\x90\xe4\x49\x85\xae\xed\x92\xd2\x01\x3c\
+\x06\xa0\xf9\x50\xea\x20\xf9\xbd\xed\xee\x2a\x02\x16\x0b\x40\x44\
+\x36\x00\x78\xa0\xe8\xe3\x47\x92\x4b\x14\x3a\x13\x49\xc9\x00\x4e\
+\x01\x38\xa2\x70\xed\x30\xc9\xb3\x0a\x9d\x89\xa4\x64\x00\x4f\x01\
+\xac\x51\xb8\xe6\xf6\xf1\x93\xda\x5e\x24\x00\x11\xd9\x04\xe0\x9e\
+\xc2\xfc\x29\x92\x69\x7d\xc1\x6d\x29\x15\x40\x7a\xa4\x1c\x52\xb8\
+\x7a\x80\xe4\x45\x85\xce\x4c\x52\x2a\x80\x09\x00\xab\x14\xae\x2d\
+\x24\xf9\x55\xa1\x33\x93\x14\x07\x40\x44\xb6\x00\xb8\xa3\x70\xec\
+\x35\xc9\x1e\x85\xce\x54\x52\x22\x80\x0b\x00\xf6\x2b\x5c\xdb\x4b\
+\xd2\xeb\x24\xdf\xdf\xe6\x97\x08\xe0\x05\x80\x15\x0a\x00\x9d\x24\
+\x3f\x29\x74\xa6\x92\xa2\x00\x88\xc8\x46\x00\x23\x0a\xc7\x26\x49\
+\xae\x54\xe8\xcc\x25\xa5\x01\xb8\x04\x60\xaf\xc2\xb5\x5d\xd3\x2b\
+\x59\xd7\x15\x3a\x73\x49\x69\x00\x5e\x01\xd0\xbc\x58\xbb\x48\xbe\
+\x37\x77\x57\xd1\x80\x62\x00\x34\x31\xf5\x3c\x41\x72\xb5\xa2\xef\
+\x2e\x24\x25\x01\x48\x3b\xd5\xfa\x15\xae\xed\x24\x79\x43\xa1\x73\
+\x21\x29\x09\xc0\x1b\x00\xdd\x0a\xd7\xba\x49\xa6\xed\x85\x45\x94\
+\x22\x00\x88\x48\xda\xb8\x95\x36\x70\xe5\x4a\xe5\x1b\xa9\x72\x0d\
+\x68\xb6\xbe\x14\x00\x69\x44\xb3\x53\xd1\xb9\xfe\xe9\x8d\x54\xd7\
+\x14\x3a\x37\x92\x52\x00\x4c\x35\x16\xeb\x73\xc6\xf5\x90\x7c\x9d\
+\x13\x79\xaa\x77\x0f\x40\x44\xd2\xa4\x5b\x9a\x7c\xcb\x95\x51\x92\
+\xeb\x73\x22\x6f\xf5\x25\x00\xd0\x3e\x7e\xf6\x91\xbc\xec\xcd\xe0\
+\x5c\x7b\x4a\x00\xf0\x01\x40\x67\xae\x23\x69\x7e\x88\xe4\x4b\x85\
+\xce\x95\xc4\x35\x00\x11\x59\x0e\x60\x52\xe1\xd8\x08\xc9\xb4\x4a\
+\x56\x5c\xf1\x0e\x20\x4d\x27\xa7\xbf\x2e\xe5\x8a\xfb\x95\xaf\x7f\
+\x75\xc0\x3b\x80\xcf\x00\x34\x3b\xda\x56\x91\x7c\x9e\xa3\xe4\xb1\
+\xde\x2d\x00\x11\x49\x5f\xbd\xe9\xeb\x37\x57\xee\x92\xdc\x9a\x13\
+\x79\xad\xf7\x0c\x40\xbb\xf2\x35\x40\xf2\x9c\x57\x83\x73\xed\xf2\
+\x0c\x20\x2d\xa6\x2f\xc8\x75\x20\xed\x0d\x22\xf9\x4c\xa1\x73\x29\
+\x71\x09\x40\x44\x96\x36\xb6\x89\xe7\x4c\xbb\x4f\x72\x73\x4e\xe4\
+\xb9\xde\x2b\x80\x33\x00\x06\x14\xc6\x1d\x25\x79\x5a\xa1\x73\x2b\
+\xf1\x0a\x20\xed\x64\x9e\xaf\x70\xad\x97\xe4\xb8\x42\xe7\x56\xe2\
+\x0e\x80\x88\x2c\x06\xa0\xd9\xcd\xf0\x90\x64\x5a\xa4\x2f\xba\x78\
+\x04\x70\x02\xc0\x31\x85\xab\x43\x24\x93\xb6\xe8\xe2\x11\xc0\x37\
+\x00\x1d\x0a\x57\xfb\x48\x8e\x29\x74\xae\x25\x95\x01\xa8\xeb\xe9\
+\x27\xcd\xd2\xae\x04\x40\x9d\x4f\x3f\x31\x07\x50\xf7\xd3\x4f\x3c\
+\x00\xa8\xf5\xe9\x27\x1e\x00\xd4\xfa\xf4\x13\x0f\x00\x6a\x7d\xfa\
+\x89\x07\x00\xb5\x3e\xfd\xc4\x03\x80\xb4\x82\xe5\xf5\x8f\x11\x95\
+\x9f\x7e\x62\x0e\x20\x35\x20\x86\xa1\x7a\x0c\x95\x7c\x07\x34\x20\
+\xa4\xc3\xf8\x6a\x77\xfa\x89\xde\xfa\x19\x65\x65\x00\x9a\x6d\x48\
+\x5d\xf5\x01\xc0\x98\x7c\x00\x08\x00\xc6\x0e\x18\x87\x8f\x0c\x08\
+\x00\xc6\x0e\x18\x87\x8f\x0c\x08\x00\xc6\x0e\x18\x87\x8f\x0c\x08\
+\x00\xc6\x0e\x18\x87\x8f\x0c\x08\x00\xc6\x0e\x18\x87\x8f\x0c\x08\
+\x00\xc6\x0e\x18\x87\x8f\x0c\x08\x00\xc6\x0e\x18\x87\x8f\x0c\x08\
+\x00\xc6\x0e\x18\x87\x8f\x0c\x08\x00\xc6\x0e\x18\x87\xff\x0d\x87\
+\xb1\x20\x70\x24\x30\x93\xad\x00\x00\x00\x00\x49\x45\x4e\x44\xae\
+\x42\x60\x82\
+\x00\x00\x05\x5a\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x60\x00\x00\x00\x60\x08\x06\x00\x00\x00\xe2\x98\x77\x38\
+\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x05\
+\x14\x49\x44\x41\x54\x78\x5e\xed\x9d\x4d\xa8\x56\x45\x18\xc7\x7f\
+\x16\xba\xa9\xd0\x16\x95\x25\x18\x68\x19\x46\x85\x62\xe5\x26\xc4\
+\x82\xcc\xa2\x12\x04\x5d\x59\x41\x99\x2e\x4a\xb0\x8f\x45\x2d\xa2\
+\xa0\x45\x82\xf6\x81\xe4\x22\xad\x85\xd5\x2a\x57\x7d\x60\x7e\x2c\
+\x0a\xc1\x85\x7d\x50\xa4\x18\x65\x09\x86\x9a\x4a\x90\xf6\xb1\xa8\
+\xb0\x3a\x7f\x38\x37\x5e\x2f\xaf\xde\xe7\x9c\x33\x33\xcf\x7b\xbb\
+\xcf\xc0\xcb\x7b\xb9\xf7\x3f\xf3\x3c\xf3\xff\xcf\x33\x73\x66\xce\
+\xcc\xdc\x71\x44\x72\x65\x60\x9c\xab\xf5\x30\x4e\x08\xe0\xdc\x08\
+\x42\x80\x10\xc0\x99\x01\x67\xf3\x11\x01\x21\x80\x33\x03\xce\xe6\
+\x23\x02\x42\x00\x67\x06\x9c\xcd\x47\x04\x84\x00\xce\x0c\x38\x9b\
+\x8f\x08\x18\xa3\x02\xdc\x01\x2c\x06\x6e\x03\xfe\x00\x76\x00\xaf\
+\x03\xfb\x0b\xf1\x71\x2d\xf0\x20\x70\x0b\x70\x35\xb0\x1d\xf8\x18\
+\xd8\x58\xc8\xfe\x7f\x66\x3c\x22\x40\x44\x3f\xd4\xa7\xa2\xbf\x00\
+\x2f\x57\xbf\x7f\x2e\x33\x09\xcf\x9e\xc3\x86\x1a\x82\x1a\x47\xb1\
+\x54\x5a\x80\x27\x81\xb5\x23\xd4\x4e\x04\x88\x88\x1c\x69\x0a\x70\
+\x78\x84\x82\x57\x96\x8c\x84\x92\x02\x4c\x02\x7e\x36\xb0\xba\xbb\
+\xee\x1a\x0c\xd0\xc6\x90\xf5\xc0\x2a\x43\xae\x8b\x81\x93\x06\x5c\
+\x67\x48\x49\x01\x66\x01\x5f\x18\x3c\xfe\x09\xb8\xc4\x80\x6b\x03\
+\x39\x00\x5c\x65\xc8\x38\x1b\xf8\xd2\x80\xeb\x0c\x29\x29\xc0\x7c\
+\xe0\x23\xa3\xc7\xb9\xfc\xfa\xc7\x68\xff\xd6\x7a\x50\x36\xc2\xdb\
+\xc3\x72\x55\xb4\x9f\x47\x21\x40\x1f\x56\x42\x80\xfe\x8d\x37\x22\
+\xa0\x7d\x50\x9f\x33\x67\x74\x41\x46\x62\x73\x45\x66\x08\x10\x02\
+\x9c\xc9\x40\xae\x96\x16\x83\xb0\x73\x4b\x0b\x01\x42\x80\xbe\x0c\
+\xc4\x18\xe0\xdc\x30\x42\x80\x10\x20\x06\x61\x4b\x1b\x88\x89\x98\
+\x85\xa5\x16\x98\xe8\x82\x8c\xa4\xe5\x7a\x3c\x0e\x01\x42\x80\x18\
+\x03\x2c\x6d\x20\xc6\x00\x0b\x4b\x2d\x30\xd1\x05\x19\x49\x8b\x31\
+\xc0\x48\x54\x13\x58\xbc\x90\x89\x17\x32\x44\x17\x64\x0c\x99\xe8\
+\x82\x8c\x44\x35\x81\x45\x17\x14\x5d\x50\x74\x41\xb1\x2d\x65\x58\
+\x14\xe4\xea\x6b\xe3\x85\x8c\xb1\x73\x0e\x01\xfa\x13\x15\x33\x61\
+\x63\x03\x6a\x0a\x8b\xc7\x50\x23\x63\xb9\x22\x73\x4c\x0b\x70\x33\
+\xb0\x67\x94\x08\x30\x17\xf8\xc4\xe8\x6b\x27\x58\xae\x96\xd6\xcf\
+\xa9\x69\xc0\xf7\x46\x6f\x75\x6a\xe5\x3b\x23\xd6\x0a\xd3\xae\x68\
+\xed\x8e\xb6\xa4\xe9\xc0\x41\x0b\xb0\x2b\xa6\xa4\x00\x13\x1b\xec\
+\xb9\x5f\x58\x1f\x1b\xea\x5a\xbf\xde\xfc\x3a\xf8\xb1\xcd\x58\xa0\
+\xce\x32\x9c\x32\x62\x3b\xc1\x4a\x0a\x20\x47\xff\x04\xc6\x1b\x3c\
+\x7e\xb4\x3a\x23\xb0\xc1\x80\x6b\x02\x79\x04\x78\xd5\x90\xe1\x2f\
+\x60\x82\x01\x97\x04\x52\x5a\x80\xa3\xc0\xe5\x06\xcf\x75\x56\xec\
+\x71\x03\xae\x09\xe4\xa5\xaa\x55\x3f\x66\xc8\xf0\x63\x75\x44\xe9\
+\x0a\x03\x2e\x09\xa4\xb4\x00\x7b\x81\xeb\x0c\x9e\xbf\x0f\xdc\x6b\
+\xc0\x35\x81\xbc\x07\xdc\x63\xc8\xb0\x0f\xb8\xde\x80\x4b\x02\x29\
+\x2d\x80\x96\x22\xb4\x28\x67\x49\x37\x56\x84\x7d\x6e\x01\x1a\x30\
+\x73\x80\xcf\x0c\x38\x41\x74\x5c\x55\x13\xb1\x22\xa9\xb4\x00\xf7\
+\x03\x9b\x8d\x35\xd3\x99\x5d\x9d\x58\x4c\x91\x5e\x03\x56\x18\x0b\
+\x7a\x00\x78\xd3\x88\xed\x0c\x2b\x2d\xc0\x85\xf5\x93\xd0\xf9\x46\
+\xcf\x53\x44\x41\x93\xd6\x7f\x1a\xd0\x13\xd0\x6f\x46\xff\x3a\xc3\
+\x4a\x0b\x20\x87\x37\x55\x67\x75\x97\x1b\x3d\x4f\x11\x05\x4d\x5a\
+\xbf\x0e\x91\x3f\x6c\xf4\x2d\x09\xcc\x43\x00\x0d\xae\xef\x36\xf0\
+\x5e\x4f\x2f\x4f\x34\xc0\xf7\x42\x5f\x6c\xf8\x34\xb5\x08\xd0\x60\
+\x5d\x2c\x79\x08\x70\x1e\xf0\x2d\xa0\xd9\xa6\x35\xa9\x4f\x7e\xbe\
+\xc1\xec\x58\xb3\xde\x67\xaa\xd9\xac\xc6\x1c\x6b\xd2\x2c\x7d\x06\
+\xf0\xb7\x35\x43\x0a\x9c\x87\x00\xf2\x5b\x2d\x7a\x5d\x8b\x0a\x7c\
+\x58\x09\xf7\x56\xbd\xa6\x34\x7c\xa9\x40\x4b\x1d\x5a\xc3\xb9\xaf\
+\xfa\xfb\x9d\x2d\xca\xd6\x35\x0a\x8a\x98\xa2\xc9\x4b\x00\x55\x52\
+\xf7\x41\xdc\xde\xa1\xb6\x9a\xb1\x7e\x53\xe7\xbf\xc6\x38\xc3\x3e\
+\x9b\xb9\x9d\xc0\x82\x0e\xbe\xb4\xce\xea\x29\x40\x93\x97\xf4\xad\
+\x2b\x68\xcc\x58\xec\x05\xcc\x70\x7f\x3c\x05\x90\x2f\x2f\x00\x4f\
+\x19\x49\xca\x05\x5b\x53\xdd\x59\xf4\x74\xae\xc2\x47\x2a\xd7\x5b\
+\x80\x8b\xaa\x4b\x9b\x76\x01\xba\xc8\xc3\x23\xe9\x42\x8e\x79\xd5\
+\x98\xf4\xab\x87\x71\xd9\xf4\x16\x40\x3e\x5c\x0a\xbc\x51\x2d\x15\
+\xdc\x5d\x98\x84\x0f\xea\x8b\xa3\x4e\x14\xb6\x7b\x86\xb9\x41\x10\
+\x60\xc8\x21\xad\x80\xae\x2e\x44\xc6\x2b\xc6\x95\xd1\xec\xee\x0c\
+\x92\x00\xaa\xac\x04\x90\x10\x39\x93\x96\xa4\x25\xc0\x40\xa4\x41\
+\x13\x40\xa4\xdc\x05\x2c\xa9\x3f\x17\x24\x62\xe9\x77\x60\x4b\xfd\
+\xd9\x9a\xa8\xcc\x24\xc5\x0c\xa2\x00\x43\x15\xd3\xb5\x61\x9a\x54\
+\x2d\x03\x6e\x6a\x59\xdb\x4f\xab\x1b\xb2\xde\xae\x27\x6f\x96\xeb\
+\xd2\x5a\x9a\x69\x9f\x6d\x90\x05\xe8\xad\xd5\x4c\xe0\x06\x60\x2a\
+\x70\x65\xcf\xb7\x7e\x56\x3a\x54\x7f\x7e\xe8\xf9\xfe\x0a\xf8\xba\
+\x3d\x35\x65\x72\x8e\x16\x01\xca\xb0\xe1\x60\x25\x04\x70\x20\xbd\
+\xd7\x64\x08\x10\x02\x38\x33\xe0\x6c\x3e\x22\x20\x04\x70\x66\xc0\
+\xd9\x7c\x44\x40\x08\xe0\xcc\x80\xb3\xf9\x9c\x11\xa0\x17\xef\xda\
+\x56\x52\x6c\x9b\x5f\x26\x2e\xb5\x9d\x52\x9b\xba\xf4\xc2\x3e\x79\
+\xca\x25\x80\xf5\x20\x44\xf2\x0a\x65\x2e\x30\x39\x5f\xc9\x0b\x04\
+\xde\xa9\x17\xd2\x32\x73\xe1\x52\xbc\x16\xf4\x96\xa6\xb4\x9c\x43\
+\x80\x63\xc0\x65\x29\x9d\x1c\xa0\xb2\x8e\x03\x93\x53\xfa\x93\x43\
+\x80\x23\xff\x83\x7e\xff\x6c\x1c\x6b\x3c\xd0\x7f\xe1\x48\x96\x72\
+\x08\xa0\xc1\x37\xf5\xd6\xf2\x64\x15\xee\x58\x90\x76\xcd\x25\x1d\
+\x8c\x73\x08\xa0\x3a\xc6\x20\x6c\x54\x3a\x97\x00\x32\xaf\xc1\x58\
+\x3b\x0e\x46\xfb\x78\xa0\x7e\x5f\x3b\x37\x92\x0e\xbe\x43\xfa\xe4\
+\x14\xc0\xd8\x06\xc6\x36\x2c\x04\x70\xd6\x3f\x04\x08\x01\x9c\x19\
+\x70\x36\x1f\x11\x10\x02\x38\x33\xe0\x6c\x3e\x22\x20\x04\x70\x66\
+\xc0\xd9\x7c\x44\x40\x08\xe0\xcc\x80\xb3\xf9\x88\x80\x10\xc0\x99\
+\x01\x67\xf3\xff\x02\xcc\x11\xd5\x61\x2c\xfd\x1e\x0b\x00\x00\x00\
+\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x05\x36\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x60\x00\x00\x00\x60\x08\x06\x00\x00\x00\xe2\x98\x77\x38\
+\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x04\
+\xf0\x49\x44\x41\x54\x78\x5e\xed\x9c\x5d\xc8\x15\x55\x14\x86\xdf\
+\xf7\xb2\x0b\xa9\x20\xcb\x8a\x44\xac\x24\x8a\xc2\x8a\xd4\x2b\xd1\
+\x14\xa1\x1f\x53\x28\x0a\x12\x8d\x28\x43\x90\x24\x33\x08\x7f\x2a\
+\x21\xc3\xb0\x6e\x42\xe9\xa2\x22\x28\xca\x82\xfe\xc8\x0a\x04\x8d\
+\xba\xe9\x42\xa4\x84\x20\x4c\x0a\xa2\x2c\x08\x0a\x82\xa8\xe8\x26\
+\x96\xb3\x72\x3e\x3c\x05\x1f\x33\x6b\x9f\x33\x7b\x0d\x7b\xd6\x82\
+\xc3\x77\x71\xd6\xda\x6b\xef\xf7\x99\x75\xe6\xdb\x7b\xf6\x1e\x22\
+\xcc\x55\x01\xba\x66\x8f\xe4\x08\x00\xce\x17\x41\x00\x08\x00\xce\
+\x0a\x38\xa7\x8f\x0a\x08\x00\xce\x0a\x38\xa7\x8f\x0a\x08\x00\xce\
+\x0a\x38\xa7\x8f\x0a\x08\x00\xce\x0a\x38\xa7\x8f\x0a\x08\x00\xce\
+\x0a\x38\xa7\x8f\x0a\x08\x00\xce\x0a\x38\xa7\x8f\x0a\x08\x00\xce\
+\x0a\x38\xa7\x8f\x0a\x08\x00\xce\x0a\x38\xa7\x8f\x0a\x18\x32\x00\
+\x11\xb9\x02\xc0\xbd\x00\x2e\x07\x70\x0d\x80\x4b\x13\xf5\xf8\x1b\
+\xc0\x0f\x23\x9f\x93\x55\x7b\xef\x92\xfc\x32\xb1\xbd\x6c\x61\x6e\
+\x15\x20\x22\x5b\x01\x3c\x06\xe0\xac\x0e\x47\xfb\x15\x80\x8f\x00\
+\x7c\x42\xf2\x60\x87\x79\x92\x9b\x76\x01\x20\x22\x6f\x03\xb8\x3d\
+\xb9\xd7\x69\x81\x2f\x03\xd8\x43\xf2\x44\x5a\x78\x37\x51\xd9\x01\
+\x88\xc8\x12\xbd\x22\xbb\x19\x4e\x63\xab\xbf\x02\x78\x86\xe4\x9e\
+\x46\xcf\x4c\x0e\x59\x01\x88\xc8\x0c\x00\x1f\x57\x3f\x0b\x37\x64\
+\x1a\xdf\x74\x69\xde\x22\x79\xa7\x73\x1f\xfe\x4d\x9f\x1b\xc0\xdd\
+\xd5\x0d\xf7\xf5\x3e\x0c\x1c\x40\x2f\x20\xe4\x06\xb0\x0b\xc0\xf6\
+\x9e\x00\xd0\x6e\xb8\x43\xc8\x0d\xc0\xe3\xe6\xdb\xc4\x7b\x17\x49\
+\xfd\x6f\xcc\xc5\x72\x03\xd0\x9b\xaf\xde\x84\xfb\x64\xbf\x01\x58\
+\x48\xf2\x1b\x8f\x4e\x05\x80\xd3\xaa\x3f\x47\xf2\xa1\x00\xe0\xa1\
+\xc0\xe9\x9c\xff\x00\x58\x40\xf2\x8b\xdc\x5d\xe8\x7b\x05\x2c\x25\
+\xf9\x69\x93\x28\x22\x32\x0f\xc0\xf5\xf5\xcf\xdb\x03\x4d\xfe\xd3\
+\x7c\xbf\x86\xe4\xfe\xc4\xd8\xe4\xb0\x22\x00\x8c\x8e\x5e\x44\x14\
+\xc4\x13\x00\x56\x1a\x55\xd9\x4a\xf2\x69\x63\xcc\xd8\xee\xc5\x01\
+\x50\x45\x44\x64\x0e\x80\xcf\x00\x5c\x64\x50\xe8\x79\x92\x1b\x0d\
+\xfe\x13\x71\x2d\x12\x40\x0d\xe1\x11\x5d\x76\x30\xa8\x74\x80\xe4\
+\x2a\x83\xff\x44\x5c\x4b\x06\x60\x5d\x73\x7a\x9f\xe4\xea\x89\xa8\
+\x6a\x68\xa4\x58\x00\x75\x15\x88\x41\x8b\xbd\x24\x37\x19\xfc\x27\
+\xe2\x5a\x2c\x80\x84\x55\xd7\x47\x3d\x56\x49\x4b\x06\xb0\xb3\xfe\
+\x6f\xa8\xed\x95\xba\x96\xe4\x6b\x6d\x9d\x27\xe5\x57\x24\x80\x7a\
+\xd9\xfb\x77\xa3\x48\xcb\x49\xea\x52\x79\x56\x2b\x0e\x80\x88\x5c\
+\x08\xe0\x3d\x5d\xdf\x31\x28\xf9\x41\x35\x0b\xbe\xcd\xe0\x3f\x31\
+\xd7\x22\x00\x88\x88\x3e\xd0\xbf\xba\x7e\xb8\xaf\x93\x30\xab\xad\
+\x24\xf9\xa1\x35\x68\x12\xfe\x7d\x07\x30\x89\x31\x36\xb5\xe1\x76\
+\xf5\x6b\xc7\x86\x0e\x40\xb7\xaf\xac\xaa\x26\x60\xc7\x9a\x28\x75\
+\xf5\xfd\x90\x01\xfc\x05\x60\x1e\xc9\x9f\xba\x12\xb7\x4d\xbb\x43\
+\x05\xf0\x23\xc9\x4b\xda\x08\xd4\xb5\xcf\x10\x01\xb8\x3f\x07\x1e\
+\x85\x3a\x44\x00\xba\x5b\xee\x1e\x92\x9f\x77\x7d\x75\xb7\x69\x7f\
+\x88\x00\xa6\x74\x79\x01\xc0\xc3\x24\xff\x6c\x23\x54\x57\x3e\x43\
+\x06\xa0\x9a\xea\xe6\xdd\xd5\x24\xbf\xeb\x4a\xe0\xa6\x76\x87\x0e\
+\x60\x4a\x9f\x45\x24\x8f\x34\x89\xd5\xc5\xf7\x01\xe0\x8c\xaa\xb3\
+\x49\xea\xbc\x20\xab\xf5\x1d\x40\xe3\x03\xf9\x11\xb5\x66\x02\x38\
+\x1f\x80\xfe\x4d\x31\xbd\x29\x2f\x26\xa9\xf3\x83\x6c\xd6\x77\x00\
+\xad\x76\x45\x8c\xaa\x55\xaf\x0b\xad\x05\xa0\x9f\x0b\x8c\x4a\xee\
+\x23\xf9\xa0\x31\x66\x2c\xf7\xe2\x00\x4c\xa9\x21\x22\xf3\xeb\x6d\
+\xf0\xe7\x18\x14\x3a\x49\x72\xb6\xc1\x7f\x6c\xd7\x62\x01\xa8\x32\
+\x22\xa2\xbb\x1c\xf6\x19\x55\x5a\x41\xf2\x90\x31\x26\xd9\xbd\x74\
+\x00\x17\x03\x38\x0e\x40\xcf\x25\xb4\xb5\xa7\x48\xee\x68\xeb\x3c\
+\xae\x5f\xd1\x00\xea\x2a\x38\x60\xdc\xa4\x95\x75\x7f\xd0\x10\x00\
+\x3c\x0b\x60\x8b\xe1\x4a\x7d\x83\xa4\x1e\x24\xc9\x62\x43\x00\xf0\
+\x22\x80\xfb\x0d\x6a\x1e\xac\x26\x65\x37\x19\xfc\xc7\x72\x1d\x02\
+\x00\x9d\xe1\x2e\x30\xa8\xf4\x0e\xc9\x3b\x0c\xfe\x63\xb9\x16\x0d\
+\x40\x44\x96\x01\x38\x6c\x54\x68\x37\xc9\x6d\xc6\x98\x64\xf7\xd2\
+\x01\xbc\x02\x60\x9d\x51\x9d\xfb\xaa\xb9\x80\x9e\x29\xce\x62\xc5\
+\x02\x10\x11\x9d\x09\xbf\x9a\xa0\xe2\x8d\x24\xb3\x9d\x63\xee\x3d\
+\x00\x83\x80\xe7\xd6\x4b\x0f\xb3\x00\xac\x01\x70\x99\x21\x76\xd4\
+\x75\x6e\xce\xe5\xe9\xbe\x03\x48\xd4\x30\x39\xec\x18\xc9\xeb\x92\
+\xa3\x13\x02\x03\xc0\x7f\x45\xdb\x44\x72\x6f\x82\x8e\xc9\x21\x01\
+\xe0\x8c\x74\xdf\x02\xb8\x96\xe4\x1f\xc9\x6a\x26\x04\xe6\x06\xf0\
+\x66\xb5\x36\x73\x57\x42\x3f\x73\x84\x6c\x23\xb9\x3b\x47\xa2\xd1\
+\x1c\xb9\x01\xe8\x6b\x0a\xf4\x75\x05\x7d\x33\x3d\x9e\x7a\x0b\xc9\
+\x9f\x73\x77\x2c\x37\x00\xbd\xfa\xb5\x0a\xfa\x64\x7a\x26\x60\x83\
+\xd7\xee\x88\xdc\x00\xce\xab\xae\xb4\xa3\x00\xf4\x14\x63\x1f\xec\
+\x71\x92\x4f\x7a\x76\x24\x2b\x00\x1d\xa8\x88\xac\xaf\x8e\x8f\xea\
+\x9e\x1c\x4f\xd3\x67\xcd\x2f\x91\x74\x7f\x75\x4e\x76\x00\x35\x04\
+\x7d\x8f\xdb\xcd\x99\x09\xfc\xa2\xaf\xa7\xa9\x5f\x51\x63\x79\xd8\
+\xdf\x69\x37\x5d\x00\xd4\x10\x6e\xad\x66\xab\xfa\xfb\x7b\x76\xa7\
+\x23\x04\x54\xec\x29\xe1\x15\x42\xaf\xcc\x0d\x40\x0d\x41\x8f\x13\
+\x6d\xae\x04\xba\x0a\xc0\x95\x63\xde\x1b\xf4\x7d\x70\xfa\xf8\x71\
+\xf4\xf3\x35\xc9\xef\x7b\xa5\xf8\xff\x3a\xe3\x0a\xa0\xcf\xc2\xe4\
+\xea\x5b\x00\xc8\xa5\xf4\x34\x79\x02\x40\x00\x70\x56\xc0\x39\x7d\
+\x54\x40\x00\x70\x56\xc0\x39\x7d\x54\x40\x00\x70\x56\xc0\x39\x7d\
+\x54\x40\x00\x70\x56\xc0\x39\x7d\x54\x40\x00\x70\x56\xc0\x39\x7d\
+\x54\x40\x00\x70\x56\xc0\x39\x7d\x54\x40\x00\x70\x56\xc0\x39\x7d\
+\x54\x40\x00\x70\x56\xc0\x39\x7d\x54\x40\x00\x70\x56\xc0\x39\xfd\
+\x29\x93\x84\xa6\x70\xd0\x52\x29\x80\x00\x00\x00\x00\x49\x45\x4e\
+\x44\xae\x42\x60\x82\
+\x00\x00\x04\x8d\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x60\x00\x00\x00\x60\x08\x06\x00\x00\x00\xe2\x98\x77\x38\
+\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x04\
+\x47\x49\x44\x41\x54\x78\x5e\xed\x9c\xbd\x8f\x8d\x41\x14\xc6\x9f\
+\xe7\x8f\xf0\x95\xe8\x48\x04\x85\xa8\x6d\x24\x0a\x12\x8d\xad\x88\
+\x20\x51\x88\x4a\xd0\x08\x25\x4a\x54\x14\x2a\x51\xd1\xd0\xf8\x48\
+\x88\x4e\xb3\x95\x44\x42\x42\x48\x74\x12\x21\xab\x10\x8d\xce\x71\
+\x67\x73\x49\x58\x7b\xe7\xcc\xc7\x99\xd9\xfb\xde\xf3\x26\x9b\x2d\
+\xee\xf9\x98\x79\x7e\x33\xef\x3b\x77\xce\x7b\x87\xf0\xab\xab\x02\
+\xec\x9a\xdd\x93\xc3\x01\x74\x1e\x04\x0e\xc0\x01\x74\x56\xa0\x73\
+\x7a\x9f\x01\x0e\xa0\xb3\x02\x9d\xd3\xfb\x0c\x70\x00\x9d\x15\xe8\
+\x9c\xde\x67\x80\x03\xe8\xac\x40\xe7\xf4\x3e\x03\x66\x0d\x80\x88\
+\xec\x02\x70\x04\xc0\x36\x00\xdb\x01\xac\xe9\xac\xc1\x17\x00\xaf\
+\x00\xbc\x07\xf0\x94\xe4\xd3\x96\xed\x69\x3a\x03\x44\xe4\x0c\x80\
+\xeb\x2d\x3b\x98\x91\xeb\x2e\xc9\x63\x19\x7e\x59\x2e\xcd\x00\x88\
+\x88\x64\xb5\xb0\x93\x13\xc9\x26\xda\x34\x49\x22\x22\x77\x00\x1c\
+\xed\xa4\x65\x6e\xda\xb3\x24\x6f\xe4\x3a\x6b\xfd\xcc\x01\x88\xc8\
+\x7e\x00\x4f\xb4\x0d\x5a\x65\x76\x73\x24\x17\x2c\xdb\xd4\x02\x40\
+\x18\x45\xa7\x2d\x3b\x61\x18\xfb\x26\xc9\x53\x86\xf1\xed\xeb\x01\
+\x22\xf2\x0c\xc0\x3e\xcb\x4e\x18\xc6\x7e\x4e\x72\x8f\x61\xfc\x26\
+\x00\x3e\x03\x58\x67\xd9\x09\xc3\xd8\x8b\x24\xd7\x1a\xc6\x6f\x02\
+\x60\xaa\x56\x3f\xff\x8a\x6d\xbd\x1a\x6a\xf1\x0c\x70\x00\x13\xa6\
+\x90\x03\x88\xdc\x5f\x7c\x06\x58\xde\x80\x15\xb1\x1d\x80\x42\x24\
+\x4b\x13\x07\x60\xa9\xae\x22\xb6\x03\x50\x88\x64\x69\xe2\x00\x2c\
+\xd5\x55\xc4\x9e\x7a\x00\x8a\x3e\xce\xb4\x89\xf9\x32\x74\xa6\xd5\
+\x55\x74\xde\x01\x28\x44\xb2\x34\x71\x00\x96\xea\x2a\x62\x17\x01\
+\x10\x91\xbd\x00\xb6\x8e\xeb\xbb\xe1\x7f\xf8\xeb\x5d\xe3\x55\x74\
+\xbb\xc8\x64\x11\xc0\x1b\x00\x6f\x01\x7c\x08\x7f\x24\x1f\xe7\x46\
+\xcc\x06\x30\xaa\x30\x5e\x02\x70\x31\x37\xf1\xc0\xfc\x1e\x00\x38\
+\x4e\xf2\x7b\x6a\xbf\x92\x01\x88\xc8\xa6\xd1\xdb\x0c\xf7\x01\xec\
+\x4c\x4d\x36\x70\xfb\x6f\x00\x0e\x93\x0c\xf5\x0f\xf5\x95\x04\xc0\
+\x47\xbd\x4a\xd7\xcb\xa3\x7a\x7e\xb8\x3b\xa8\x2e\x35\x00\x11\x09\
+\x23\xfe\xa5\x2a\xaa\x1b\xed\x20\xf9\x5a\x23\x43\x0a\x80\x77\x00\
+\xb6\x68\x82\xba\x0d\x3e\x01\xd8\x4c\xf2\x47\x4c\x0b\x15\x00\x11\
+\xb9\x02\xe0\x7c\x2c\x98\x7f\xfe\x97\x02\xb7\x48\x9e\x8c\x69\x12\
+\x05\x20\x22\xa1\x9e\x1b\xea\xba\x7e\xa5\x2b\x30\x4f\xf2\xd1\x24\
+\x37\x0d\x80\xf0\x46\x43\xd2\x93\x3d\xbd\x9d\x83\xf5\xb8\x40\xf2\
+\x6a\x29\x80\x73\x00\xae\x0d\x56\x22\xdb\x8e\xdd\x26\x79\xa2\x14\
+\xc0\xbd\xd1\x37\xbf\x83\xb6\xed\x5c\x95\xd1\xe7\x01\xbc\x00\xf0\
+\x13\xc0\xee\xd1\xb7\xfd\xa0\x43\xea\xb5\x40\x72\xae\x14\xc0\x47\
+\x00\x1b\x53\x33\x4f\xb3\xfd\x4a\x35\x80\x8c\x17\x8c\xbf\x92\x9c\
+\xb8\x35\xa3\x79\x06\x4c\xf5\x6b\x25\x19\x03\xe1\x10\xc9\xf0\x4d\
+\x7f\xd9\x25\x22\x07\x46\x3b\x00\x0f\x53\x62\xc6\x0a\x3a\x0e\x60\
+\xb9\x9a\xeb\x49\x86\x1f\x6d\xfc\x0f\xc0\x06\x60\x69\x8d\xaf\xbe\
+\x1c\x80\x5a\xaa\x3f\x86\x0e\x20\x5d\xb3\xaa\x1e\x7e\x0b\xaa\x2a\
+\x67\x46\xb0\x8a\x0f\x61\xf8\x2d\x28\x03\xc0\xd8\xa5\xc6\x32\xd4\
+\x01\xe4\xeb\x5f\xc7\xd3\x67\x40\x1d\x1d\xb3\xa3\x38\x80\x6c\xe9\
+\xea\x38\x3a\x80\x3a\x3a\x66\x47\x71\x00\xd9\xd2\xd5\x71\x74\x00\
+\x75\x74\xcc\x8e\xe2\x00\xb2\xa5\xab\xe3\xe8\x00\xea\xe8\x98\x1d\
+\xc5\x01\x64\x4b\x57\xc7\xd1\x01\xd4\xd1\x31\x3b\x4a\x0d\x00\xa6\
+\x3f\xb4\x8e\x35\x30\xbb\xe7\x4a\xc7\x8c\x22\x8b\x32\xf2\x92\x59\
+\xf4\x87\xde\x9a\x7a\x80\xe9\x51\x03\x03\x07\x10\x3d\xea\x40\x03\
+\xc0\xf4\xb0\x8d\x81\x03\x88\x1e\xf6\xa1\x01\x60\x7a\xdc\xcc\xc0\
+\x01\x44\x8f\xbb\x89\x02\x08\x37\x32\xcb\x03\x97\x06\x0c\x40\x75\
+\xe0\x93\x0a\xc0\x18\x82\x49\x71\x7e\xa8\x00\xb4\xfd\x52\x03\x18\
+\x43\xa8\x7e\xe8\x9e\xb6\xa1\x29\x4b\x8f\x14\x5b\x83\x55\x50\xd2\
+\xa1\x7f\x49\x00\xc6\x10\xaa\x1e\x3b\x39\x00\x00\x45\xc7\x5e\x26\
+\x03\x48\x19\x5d\x9a\x5b\xd7\x6a\x07\x60\xdd\x3e\x07\x10\x39\x4e\
+\xd3\x01\xa4\x4e\xb9\x44\xfb\xd8\x33\xc0\x01\x24\x0a\x9a\x6a\xee\
+\x00\x1a\x9d\x50\xbb\x12\x18\x07\xe0\x00\x52\x27\x6d\x9a\x7d\xef\
+\x11\x16\x6b\x6d\xef\xf6\xf9\x2a\x68\x06\x56\x41\xa6\xf5\x84\xd8\
+\x08\x2f\xfc\x3c\xba\x9f\x5f\x18\xbf\xc9\xc1\xad\xa6\xf5\x84\x52\
+\x01\x22\xfe\xd1\xfd\xfc\xd2\xfc\x2d\x6e\x41\xa6\xf5\x84\x52\x01\
+\x22\xfe\xd1\xfd\xfc\xd2\xfc\x2d\x00\x98\xd6\x13\x4a\x05\x88\xf8\
+\x47\xf7\xf3\x4b\xf3\x9b\x03\xb0\xae\x27\x94\x0a\x30\xc1\x5f\xb5\
+\x9f\x5f\x9a\xbf\x09\x00\xcd\xa6\x5c\x69\x47\x6a\xfb\x5b\x6f\x41\
+\xfc\x6e\x6f\x33\x00\x63\x08\xd5\xeb\x09\xb5\x85\x07\x90\xb4\x9f\
+\x5f\x9a\xbf\x29\x80\x31\x84\xaa\xf5\x84\x52\x01\x00\x14\xed\xe7\
+\x97\xe6\x6f\x0e\xa0\xb4\xc1\x43\xf3\x77\x00\x9d\x89\x3a\x00\x07\
+\xd0\x59\x81\xce\xe9\x7d\x06\x38\x80\xce\x0a\x74\x4e\xef\x33\xc0\
+\x01\x74\x56\xa0\x73\x7a\x9f\x01\x0e\xa0\xb3\x02\x9d\xd3\xfb\x0c\
+\x70\x00\x9d\x15\xe8\x9c\xfe\x17\xb3\x79\xa3\x70\x2e\x6d\x5c\x02\
+\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x0a\xb2\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x60\x00\x00\x00\x60\x08\x06\x00\x00\x00\xe2\x98\x77\x38\
+\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x0a\
+\x6c\x49\x44\x41\x54\x78\x5e\xed\x5d\x7d\x8c\x14\xe5\x19\xff\x3d\
+\x33\x77\x40\x45\x5b\x84\xdb\x39\x50\x90\x6a\x69\x35\x16\x25\x84\
+\x5a\xf0\x76\x16\xc4\x0f\xa0\xc5\xca\xed\xc0\x51\xd3\xd6\x46\xfa\
+\x07\x48\xa8\xc6\xf2\x47\x9b\x68\x9b\xd0\x0f\x63\xd2\x56\x63\x5a\
+\x45\x6b\x53\xb5\xa1\xc6\x9a\xbb\x9b\x03\xac\x1f\xa4\xd2\x93\xbb\
+\xd9\x13\xad\xb6\x96\x5a\x6b\xd4\x06\x1b\xe5\xb8\xdd\x3d\x04\xf5\
+\x90\xaf\x9d\x79\xda\xf7\xd8\x8b\x97\xbd\xdb\xf9\xb8\x7d\x67\xe6\
+\xb6\xdd\x37\xb9\xbf\xee\x79\x9f\x8f\xdf\x6f\xde\xd9\x77\xde\x79\
+\x9e\x67\x08\xb5\x11\x2b\x02\x14\xab\xf5\x9a\x71\xd4\x08\x88\xf9\
+\x22\xa8\x11\x50\x23\x20\x38\x02\xfd\x3d\x2d\xe7\x3a\x8e\xfd\x20\
+\x80\x85\x62\x36\x03\x19\x3a\xa5\x6e\xd0\x96\xb6\xf6\x05\xd7\x16\
+\xef\x8c\xaa\x5b\x01\xf9\x2e\x63\x06\x2b\xf8\x1b\x80\x44\x09\x74\
+\x39\x9c\x52\xe7\x55\x1b\x09\x55\x47\x40\xce\x4a\x3f\x0e\xd0\xda\
+\xd1\xae\x5b\x06\x1e\x6d\xd4\xcd\x6f\xc4\x7b\x4d\x07\xb3\x5e\x85\
+\x04\x18\x87\x01\x4c\x29\x13\xe6\x01\x4d\x37\x67\x06\x83\x20\x5e\
+\xe9\x6a\x24\x80\xdd\x20\xd3\x74\xb3\xaa\x62\xaa\x2a\x67\x05\xf0\
+\x39\xcb\xa8\x11\x10\xe7\xa2\xad\x11\x10\x27\xfa\xb5\x15\x10\x33\
+\xfa\x35\x02\x6a\x04\xc8\x46\xa0\xf6\x23\x2c\x1b\xd1\x80\xfa\x6a\
+\x04\x04\x04\x4c\xb6\x78\x35\x12\x20\xce\x7b\x1a\xcb\x00\x71\x50\
+\xd3\xcd\x73\x64\x83\x14\xa6\x3e\x69\x04\xe4\xad\xeb\xce\x62\x52\
+\xef\x01\xd3\xf2\xe2\x93\xea\x2b\xcc\xbc\xa9\x31\xd5\x21\xce\x6d\
+\xa4\x8d\x5c\xb7\xf1\x18\x08\xd7\x8f\xa6\x90\x08\xdb\x12\x49\xf3\
+\x9b\xd2\x8c\x01\x38\xb4\xd7\x98\x59\xb0\x71\x2b\x39\x98\xcb\x84\
+\x7e\x85\xd1\x95\x48\x99\xe2\x20\x50\xca\x90\x42\xc0\xfe\xce\x1b\
+\x27\x4d\xae\xff\xf0\x45\x80\x2f\x29\xf1\xea\x23\x06\x37\x37\xea\
+\x1d\x7f\x94\xe2\x2d\x80\xe2\x61\xdc\xcb\x00\x66\x94\xe8\x3c\xc0\
+\x75\x85\x05\x8d\x8b\x76\x66\x65\xd9\xca\x5a\xe9\x6b\x08\xb4\x1d\
+\xc0\x19\x25\x3a\xff\x7a\x42\x51\x93\xb3\x9a\x5a\x8f\x55\x6a\x4b\
+\x0a\x01\xb9\xcc\xea\xdb\xc1\xfc\x93\x72\xce\x28\xc4\x57\x35\x24\
+\x3b\xfe\x54\xa9\xb3\x43\xf3\xfb\x76\xdd\x30\x99\x26\x0f\x7c\x97\
+\x40\xd7\x33\xb8\xa0\x40\x79\xdc\x3e\x7a\xc6\x5d\xd3\x97\x6f\x3b\
+\x2a\xcd\x46\xd7\x9a\xab\x14\xc5\x79\xb6\xac\x3e\xe6\x3b\xb4\x54\
+\xc7\xf7\x2b\xb5\x27\x87\x00\x2b\xbd\x0b\xa0\x65\x2e\xce\x1c\x07\
+\xf3\x35\x5a\xaa\xc3\xaa\xd4\xe1\x28\xe6\xf7\x67\xd2\x57\x3a\x4c\
+\x4f\x02\x98\x54\xde\x1e\x77\x6b\x7a\xc7\xe2\x4a\xfd\x91\x44\x80\
+\xf1\x12\x80\x05\x1e\xce\x7c\x04\x28\x2b\x34\xbd\xad\xbb\x52\xa7\
+\xc3\x9c\x9f\xef\x4a\x2f\x61\x85\x9e\x1a\xe5\xb6\x53\x6a\xf6\x55\
+\x4d\x37\x4b\x6f\xb9\x81\x5d\x93\x43\x40\xb7\xf1\x10\x08\xeb\x7c\
+\x58\x3f\x06\x72\x9a\xb4\xe4\xf6\x57\x7c\xc8\x46\x2e\x92\xef\x6e\
+\x5e\xc0\xa4\x88\x0b\xe4\x13\x9e\xc6\x19\x0f\x6b\x29\xf3\x5b\x9e\
+\x72\x1e\x02\x52\x08\x38\xb4\x67\xd5\x2c\x5b\x55\xff\x01\xe0\x2c\
+\x1f\x0e\x49\xb9\x72\x7c\xd8\x09\x2c\x92\xcb\x18\x6f\x80\xf1\x59\
+\xcf\x89\x8c\xf7\xd5\x7a\xcc\x9d\xb6\xc8\x7c\xd7\x53\x36\x0a\x02\
+\x84\x8d\x5c\x77\x5a\x07\x91\xd8\xed\xb8\xdc\x37\x4f\x7b\xe3\xd8\
+\xea\x05\xd3\x97\xb4\xee\xaf\xd4\x79\x99\xf3\xfb\x7a\x56\x5d\xa2\
+\x38\xea\x3e\x1f\x3a\x8f\x82\x79\x85\xac\xdf\x33\x29\x2b\x60\xc8\
+\xe9\x6c\x97\x91\x24\x05\xbb\x00\x4c\x76\x0b\x84\x58\x59\x9a\x48\
+\xb5\x3d\xe7\x23\xd8\xc8\x44\xfa\x32\xe9\x55\x0a\x0f\x6e\x39\xdd\
+\xc6\x51\x56\x94\x65\x8d\x4d\x6d\x3d\xb2\x1c\x93\x4a\x80\x70\xaa\
+\x3f\x63\x5c\xe6\x30\xc4\x96\xf3\xcc\x72\x4e\xaa\x75\x98\x25\x63\
+\xf9\xca\x02\x41\xe8\xc9\x76\xa7\xe7\x11\x91\xcb\x6f\x13\x7f\xa0\
+\x10\x5d\xdd\x90\x34\xff\x2c\xd3\xae\x74\x02\xbc\x49\xa0\xa7\x35\
+\xbd\xfd\xcb\x32\x83\x90\xa1\x8b\x19\x94\xef\x31\x3a\xc1\x58\x32\
+\x52\x1f\x7f\x00\xe2\x25\x61\x6c\x1e\x42\x21\x40\x04\xd0\x97\x49\
+\xcf\x55\x98\xee\x07\xa0\x0f\x0b\xe8\x89\x93\xf5\xbc\x6e\xe6\xc2\
+\x8e\x43\x41\x41\x1b\xdc\x1e\xaa\xb4\x96\x18\x0b\x18\x3c\x05\x20\
+\xf1\x62\x7e\xe8\x4c\x28\x0b\xf0\x11\x80\x0e\x83\xe9\x45\x10\xb5\
+\x8d\x65\xbb\x7b\xb0\xab\x25\xa1\x28\xf6\x3d\x04\x7c\x6d\x98\x7f\
+\x96\xea\xa8\x1b\xa6\x2d\x6e\x7d\x2d\xa8\xcf\x7e\xe4\x43\x23\x60\
+\xc8\xb8\x38\x3a\xb0\x15\xcc\xa6\xba\xc2\xfe\xa0\xc7\x04\x22\x01\
+\xcb\xb6\x0b\x9b\x89\x48\x9c\xfd\x04\x3d\x64\x3b\x40\xa0\xc7\xe0\
+\xf0\xdd\x89\xc5\xe6\x41\x3f\x60\x0c\xc9\x1c\xee\x6c\x9e\x72\xa2\
+\x4e\xbd\x50\xa5\x53\xef\x24\xf4\x9d\xbd\x41\xe6\x06\x95\x0d\x9d\
+\x80\xa0\x0e\x15\x57\x8f\xa6\x38\xca\xed\x20\xde\x00\x60\xe2\x58\
+\x74\x0c\x9b\x73\x9c\x99\xb7\xda\x85\xc2\x9d\xe7\x2c\x7d\xa2\xbf\
+\x42\x5d\xd2\xa7\x8f\x3b\x02\x72\xdd\xe9\x4d\x20\xfa\xb9\x9f\xed\
+\x6c\x40\x34\xc4\xc1\xd9\xcd\x9a\x6e\xfe\x26\xe0\xbc\x50\xc5\xc7\
+\x0d\x01\xdc\x79\x45\x5d\xff\x84\xa9\x0f\x31\xe3\x86\x50\x23\x06\
+\xee\x4d\xf4\xaa\xb7\xd2\xda\x56\x3b\x64\x3b\xbe\xd4\x8f\x0b\x02\
+\x8e\x74\xaf\x3c\xfb\x24\x26\xfe\x01\x84\x26\x5f\x5e\x57\x2e\xd4\
+\x35\x81\x4f\x34\x4f\x49\x3d\x29\xb2\xec\x62\x1d\xb1\x13\xc0\x2f\
+\xad\xaf\xcf\x1f\xef\xdf\x03\xe0\xf2\x88\x91\xb0\x12\xbd\xea\x15\
+\x71\xaf\x84\xd8\x09\xc8\x5a\xc6\xa3\x25\xdb\xbe\xc8\x78\x60\xc2\
+\x83\x8d\x49\x53\xfc\xd0\xc7\x36\x62\x25\x20\x6f\xa5\xbf\xc3\xa0\
+\xbb\x63\x8b\x7e\xd0\x30\xdd\xac\xe9\xed\xf7\xc6\xe5\x43\x6c\x04\
+\xf4\xed\x69\x39\x5f\x51\xed\x37\x01\xa8\x71\x05\x2f\xec\x32\x70\
+\xb2\xce\xb6\xe7\x4c\x5b\xb2\xe3\x9d\x38\xfc\x88\x8d\x80\x38\x6f\
+\x3d\x23\x81\xe6\xdf\x6a\x7a\xc7\x8d\xff\x37\x04\x04\x38\xfa\x8d\
+\x0a\x13\x47\x51\xe8\xf3\x0d\x4d\xed\xaf\x47\x65\x70\xc8\x4e\x2c\
+\x2b\x20\x6f\xad\xbe\x9f\xc1\x37\x45\x1d\xac\x87\xbd\x5f\x6a\xba\
+\x79\x4b\xd4\x3e\xc5\x42\x40\xce\x32\xc4\xf9\x4a\x69\x5a\x49\xd4\
+\xb1\x97\xda\xeb\xd5\x74\xf3\xdc\xa8\x9d\x88\x9c\x80\xfe\x9e\xe6\
+\x2f\x3a\x8e\xf2\x42\xd4\x81\xfa\xb2\x47\xce\xfc\x30\x8e\x9c\xdd\
+\x6c\x47\x4e\x40\xce\x32\xee\x00\x70\x9b\x2f\x40\x22\x16\xfa\xef\
+\x3b\x81\x1f\x36\xa6\xcc\x2d\x51\x9a\x1d\x95\x80\x92\x3a\xdc\x69\
+\x1e\x0e\x1d\x0a\x52\xa7\x9b\xb3\x56\x3f\x05\xf0\x97\xa2\x0c\xd2\
+\xaf\x2d\x06\x76\x36\xea\xe6\x2a\x2f\x79\x99\xf8\x8c\x20\xc0\xa5\
+\x0e\xd7\xcb\x2f\x5f\x75\xba\x39\xcb\x10\xaf\xf4\xbe\xe0\xa5\x2c\
+\x8e\xff\x13\xf0\x42\x42\x37\x17\xb9\xd9\x96\x8d\xcf\x08\x02\xdc\
+\xea\x70\xbd\x40\xf1\x53\xa7\x9b\xb5\x8c\x7f\x13\x70\x9e\x97\xae\
+\x98\xfe\xbf\x5f\xd3\xcd\x0b\xdc\x6c\xcb\xc6\x67\x14\x02\x0c\xb7\
+\xf4\x6f\x77\x5c\x18\xef\x6a\x29\x73\x96\x7b\x00\xc6\x49\x00\xf5\
+\x31\x01\xec\x65\xf6\xa8\xa6\x9b\x65\x93\x09\xc4\xe4\x9c\xe5\x5a\
+\xa7\xec\xa5\x7f\x44\x1d\xb3\x5c\x02\x00\xcf\xfc\xfc\x9c\x65\x0c\
+\x78\xa5\xad\x78\x45\x11\xe2\xff\x07\x34\xdd\x74\x4d\x2e\xcb\x59\
+\x15\x5c\xa0\xa3\xe0\x33\x1a\x01\xbf\x07\xf0\xd5\xb1\x04\x49\xe0\
+\xdf\x25\xf4\x0e\xd7\x17\x2a\x39\xcb\x78\x0b\xc0\x67\xc6\xa2\x3f\
+\xf4\x39\x84\x37\xb5\xa4\xf9\x39\x8f\x15\x2c\x15\x9f\x91\x04\x74\
+\xb6\x4c\x47\xbd\xfd\x97\x31\x3c\x28\x1d\xb0\x1d\x75\xfe\x8c\xc5\
+\xad\x79\xd7\x00\xba\x8d\x4c\x84\x2f\x5e\x02\x72\xe6\x9d\xf1\x9c\
+\x93\x8c\xcf\xa8\xdb\xd0\x61\xf9\xf7\x22\x3d\x63\x8e\x47\x14\xaf\
+\x8b\xec\x03\xbf\xf9\xf9\x39\xcb\x30\x01\xa4\x03\x22\x13\x8d\x38\
+\x51\xab\x96\x6c\x1f\xb5\x11\xc8\x70\x07\x64\xe2\x13\xf9\x83\x58\
+\xde\x32\x7e\xc0\xc0\x8f\xa2\x41\x34\xb0\x95\xdb\x34\xdd\xbc\x33\
+\xf0\xac\x0a\x26\x44\x4e\x40\xae\x67\xf5\x7c\x38\x2c\x6e\x71\xe3\
+\x6e\x38\x8a\x7d\xe9\xf4\xa6\x1d\x7f\x8f\xd2\xb1\xc8\x09\x28\x6e\
+\xe5\x0e\x8c\x21\xd1\x2a\x6c\x5c\x3c\x77\x70\x61\x38\x10\x0b\x01\
+\x59\xcb\x78\x80\x80\x58\xdf\xc5\x8e\x04\x93\xee\xd3\xf4\xf6\x6f\
+\x87\x01\xb2\x9b\xce\x58\x08\x38\xd4\xd5\x72\xb1\xad\xd8\xaf\x8a\
+\x17\xb2\x51\x07\x5c\xc6\x9e\x0d\x45\xbd\x48\x6b\x6a\x15\x5b\xe4\
+\x48\x47\x6c\x00\x64\x33\xc6\xaf\x88\xb1\x3e\xd2\x68\xcb\x19\x23\
+\x6c\xd5\x92\xe6\xa6\x38\x7c\x89\x8d\x00\x91\x89\xac\x2a\x85\xb7\
+\x00\xfa\x64\x1c\x81\x0f\xb3\xf9\xe1\x04\x3e\x31\x3b\xae\x24\xad\
+\xd8\x08\x10\x00\x64\xad\xb4\x41\xa0\xf6\x38\x09\x60\x87\xd2\x8d\
+\x8b\xdb\xbd\x2a\x63\x42\x73\x31\x56\x02\x06\x49\xe8\x4e\xdf\x45\
+\x44\x9b\x43\x8b\xd0\x45\x31\x31\x7e\x9a\x48\x99\xdf\x8b\xc3\xf6\
+\x90\xcd\xd8\x09\x60\xde\xa2\xe4\x33\xfb\x3a\x01\x54\x5c\xf4\x1c\
+\x04\x48\x62\xde\xdd\xa0\xcf\x5b\x46\xb4\xc5\x09\x32\x4f\xb6\x6c\
+\xec\x04\x88\x80\x62\x48\xce\xcd\xd4\x9f\x72\xae\x3d\x7b\xe9\xf6\
+\x23\xb2\x01\x0d\xaa\x6f\x5c\x10\x20\x9c\x16\xe9\xe9\xb9\xfa\xa9\
+\x8f\x10\xf0\xf5\xa0\x41\x04\x92\x67\x3c\x9c\x28\xbc\xb7\x9e\x96\
+\x3e\x57\x08\x34\x2f\x24\xe1\x71\x43\xc0\x50\x7c\xc5\x7c\xd1\x9f\
+\x85\x90\xb2\x68\x83\x78\xb3\x96\xec\xf8\x45\x48\x58\x8e\x49\xed\
+\xb8\x23\x40\x44\x51\x2c\xf0\x7b\x00\x40\x72\x4c\x51\x95\x4e\x22\
+\xec\x51\x14\xde\xd8\x70\x79\xc7\x3f\xa5\xe8\x93\xa8\x24\x74\x02\
+\x06\x8b\xf4\x88\xce\x9b\x84\xe3\x6f\x04\xdd\x6b\xe7\x2d\xe3\x3a\
+\x06\x44\x4b\x98\xcb\xc6\x18\xf3\x5e\x80\x7e\xac\xe9\xed\xa2\xf9\
+\x86\xef\x21\xce\xfc\x79\x42\xe1\x7c\xc5\xa6\xb7\x83\x16\xf8\xf9\
+\x36\x52\x14\x0c\x8d\x80\xe2\x55\xfc\x6b\x00\x1f\x67\x19\x30\xda\
+\x0a\x85\x53\x1b\x83\x16\xcb\xbd\xdf\xd3\x32\xf5\x84\xe3\x5c\x4d\
+\xc4\xd7\x3a\x0e\x2e\x24\x1a\xec\x1d\x2d\xfe\xb4\x62\x1c\x1f\x97\
+\xa9\x12\xbf\x06\x07\xcf\x4c\x54\xeb\x76\x7f\xaa\xa9\xf5\xbd\x20\
+\x80\xf4\x76\x7e\xa5\xa1\xae\xbe\xfe\x11\x00\x2b\x87\xcd\xb3\x6c\
+\xd0\x4d\x33\xf4\x76\xd1\x0b\x43\xfa\x08\x85\x80\xd3\xd5\xf2\xfc\
+\xec\xa8\x4f\xb9\x8c\x5d\x5a\xca\x5c\x21\x3d\x12\x09\x0a\xcb\xe7\
+\x2c\x85\x53\x25\x2f\x5c\x96\x4e\x80\x9f\x56\x05\x8a\xca\x17\x8f\
+\xb7\xfb\xf1\xc1\xe7\x9b\x3f\xad\xda\x8a\x5b\x03\x91\x01\x85\x70\
+\xe5\xb8\x6e\x55\x90\xb3\xd6\xa4\x00\xe7\x69\xef\xac\x07\x5a\x19\
+\xf4\xbe\x2c\xe1\x02\x77\x55\x51\xec\x92\xb5\xdb\xc3\xce\xf8\x6d\
+\xd6\x91\xed\x59\xd3\x44\xce\x60\x8f\x35\xcf\x66\x47\x4c\xce\x9c\
+\xc6\xe4\xf6\x7f\x85\x0d\x6a\x10\xfd\xbd\x19\x63\x76\x1d\xe3\x6d\
+\x1f\x73\x06\x58\x51\x96\xcb\xea\x98\x22\xe5\x16\x74\xda\x79\xde\
+\xe7\xf3\x64\xb3\x4b\xd3\xcd\x51\x1a\x62\xf8\x08\x3d\x64\x91\x9c\
+\x95\xee\x02\x28\xe5\x69\x66\xbc\x35\x6c\xca\x5b\xe9\x6d\x0c\xf2\
+\xf3\xe9\x90\x63\x8e\x62\x2f\x8c\xfa\xbd\xab\x27\xa0\x43\x5b\xa9\
+\xd3\x2d\x6b\x9e\xf7\xb7\x8a\xe5\x54\x58\x4a\x59\x01\x39\xcb\x10\
+\x0f\x38\x17\x79\x04\x5a\x15\x4d\xfb\x8a\xbf\x63\xcf\xf8\x68\xda\
+\xb7\x57\xd3\xcd\x8a\x6b\x9b\x65\x11\x20\x0a\xad\xdd\x4e\x33\xff\
+\xe7\xda\x56\x32\x68\x47\xa3\xde\xde\xec\x77\x75\x95\x93\x93\x42\
+\x80\x57\xbd\xaf\xec\xc6\xad\x51\x7c\x47\xac\xcf\xab\x71\x2b\x61\
+\x9d\x96\x34\xc5\x43\x5b\x45\x43\x0a\x01\xc2\x83\x9c\x65\x88\x5c\
+\x9f\xf9\x25\xde\x0c\x38\x8e\xd2\x3c\x7d\x71\x9b\xd7\xf6\xce\x77\
+\x10\xc5\xd4\x40\xd1\x5c\x6f\xc4\x77\xc4\xb8\xae\x70\x69\xd0\x9e\
+\x44\x6e\x86\xb3\x99\x35\xcb\x88\x1d\xf1\xb6\xac\x74\x67\xf7\xb2\
+\xa6\x9b\x52\x6a\x1c\xa4\x11\x20\x02\xc9\x66\x56\x6f\x04\xb3\x4e\
+\x8c\x69\x44\x62\x57\x64\xdf\x23\xbb\xe1\x91\x5b\x7e\xbe\x9f\xe4\
+\x60\xdf\x4c\x17\x05\x8b\x89\x64\x5b\x01\x88\x26\xad\x47\x40\xbc\
+\xcb\x19\x38\xf3\x16\x59\x6d\x92\xa5\x12\x10\x34\xb8\xb1\xc8\x7b\
+\xe4\xe7\xd7\xbe\x23\x36\x16\x50\x83\xcc\xa9\x7d\x45\x29\x08\x5a\
+\x21\xc8\xd6\x08\x08\x01\xd4\x20\x2a\x6b\x04\x04\x41\x2b\x04\xd9\
+\x1a\x01\x21\x80\x1a\x44\x65\x8d\x80\x20\x68\x85\x20\x5b\x23\x20\
+\x04\x50\x83\xa8\xac\x11\x10\x04\xad\x10\x64\x6b\x04\x84\x00\x6a\
+\x10\x95\x1e\x75\xba\xb1\x54\xb9\x04\xf1\xbf\x54\xb6\x1a\x9f\x84\
+\xcb\xd6\xe9\x86\x71\x14\x51\x09\xb8\x7e\xe6\x56\x1f\x01\xe5\xeb\
+\x74\x7d\xd5\x29\xfb\x01\x25\x4a\x99\xaa\x23\x40\x80\x13\xc5\x77\
+\xc4\xa2\x22\xa1\x2a\x09\x88\x0a\x9c\x28\xec\xd4\x08\x88\x02\x65\
+\x17\x1b\x35\x02\x6a\x04\xc4\x8c\x40\xcc\xe6\xff\x03\x5b\x95\x0b\
+\x9d\x33\xbe\xff\x9f\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\
+\x82\
+\x00\x00\x05\x1c\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x60\x00\x00\x00\x60\x08\x06\x00\x00\x00\xe2\x98\x77\x38\
+\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x04\
+\xd6\x49\x44\x41\x54\x78\x5e\xed\x9c\x4d\x88\xdd\x54\x14\xc7\xff\
+\x37\x33\x45\xdc\xd4\x2f\x04\x17\xa2\xb3\xf0\x63\x29\xc8\xb8\xf0\
+\x63\x51\x57\xa5\x14\x15\x95\x19\x5e\x12\x2c\x22\xb8\x10\x14\x11\
+\xa1\x2f\x53\x28\x7d\x85\xc1\x66\x4a\x41\x11\x75\x27\x8a\x4c\x92\
+\xc7\x8c\x0a\x52\x8b\x82\x4b\x37\x2e\xec\xc6\xb5\xc8\x40\x41\x70\
+\xa3\xb8\xb2\xc5\x37\xef\xd8\x8c\x0a\x0a\xbe\x24\xcf\x9c\xfb\xce\
+\xbd\xc9\x09\x0c\xb3\xc8\xcd\x39\x37\xbf\x5f\x4e\x3e\xef\x7d\x06\
+\xba\x88\x12\x30\xa2\xd9\x35\x39\x54\x80\xf0\x41\xa0\x02\x54\x80\
+\x30\x01\xe1\xf4\x5a\x01\x2a\x40\x98\x80\x70\x7a\xad\x00\x15\x20\
+\x4c\x40\x38\xbd\x56\x80\x0a\x10\x26\x20\x9c\x5e\x2b\x40\x05\x08\
+\x13\x10\x4e\xaf\x15\xa0\x02\x84\x09\x08\xa7\xd7\x0a\x50\x01\xc2\
+\x04\x84\xd3\xf7\xa6\x02\x5e\xdb\x59\xbb\x71\x69\xb2\x7c\xef\xa1\
+\xe5\x60\x72\xc3\xed\x87\x7e\x18\x3d\xfe\xe1\x55\x61\xf6\x07\xe9\
+\x7b\x21\x60\x38\x8e\x8f\x19\xa2\xb7\x01\xdc\xf3\x17\xf4\x2b\x30\
+\x38\x9f\x0e\xf2\x77\xa4\x25\x74\x5e\x40\x32\x8e\xd6\x40\xd8\x99\
+\x01\x7a\x94\x86\xf9\x59\x49\x09\xdd\x17\x50\x44\x1f\x00\x78\xbe\
+\x02\xb2\xa8\x84\x3e\x08\xa0\x06\x47\xb8\x98\x84\x3e\x08\x28\x4f\
+\x3f\x6b\xae\x4a\xe8\x81\x80\xf8\x05\x80\xde\x6f\x20\xa0\x6c\xb2\
+\xf0\x4a\xe8\xbc\x80\x92\x6a\x52\x44\x4d\xab\x60\xe1\x12\x7a\x21\
+\xc0\x65\x09\xbd\x11\x30\xb7\x84\x29\xce\xa6\x71\x3e\x6a\x78\xea\
+\xfa\xdf\xcd\x7a\x25\xc0\x45\x09\xbd\x13\xe0\x9a\x84\x5e\x0a\x70\
+\x49\x42\x6f\x05\xb8\x22\xa1\xd7\x02\x5c\x90\xe0\x84\x80\xa4\x18\
+\x1c\x01\x82\x15\x4c\xb1\x82\x00\x77\x03\xb4\x02\x98\x15\x00\xe5\
+\x9f\x5b\x0b\xf3\xdd\x91\x98\x80\x64\x3b\x7e\xc8\x2c\xd3\x80\x08\
+\xeb\x00\xee\x74\x8b\x72\x4d\x6f\x0c\x5e\xe1\x7a\x95\xbd\x50\x01\
+\xa3\xed\xf8\xf0\xd5\x60\xfa\x22\x02\xf3\x34\x08\x8f\x7a\x05\xfd\
+\xdf\x9d\xbd\x72\x6d\xe9\xf7\xfb\xdf\x5c\xdf\xfd\xad\xed\x3e\x2c\
+\x4c\xc0\x30\x8b\x8e\x06\x01\x36\x09\x58\x6d\xdb\x69\x17\xb6\x9f\
+\x10\x3d\x70\x21\x2a\xbe\x6b\xdb\x97\x85\x08\x48\xb2\x68\x84\x00\
+\x67\xda\x76\xd6\xa5\xed\xbd\x10\x70\xb2\x18\xac\x2e\x99\x60\x93\
+\x08\x47\x5d\x82\xc7\xd0\x17\xf7\x4f\x41\xc3\x3c\x7c\xc2\x18\xb3\
+\x0d\xe0\x30\xc3\x0e\xbb\x15\xc2\xf5\x8b\xf0\xb0\x18\x3c\x12\x98\
+\xe0\x12\x11\x6e\x76\x8b\x1c\x43\x6f\x5c\xbf\x0d\xdd\x18\x9f\xb8\
+\x8f\x68\x72\xe9\x1f\x23\x10\x9a\xee\xf5\xf7\x98\x22\x43\x80\x3d\
+\x60\xba\x77\xfd\x3b\xee\x5e\x1a\x8e\xcb\xff\x56\x97\xb9\xbe\x15\
+\x30\xc3\x2f\x77\x8c\xf5\x22\xbc\xf1\xe9\x89\xdb\xe8\xda\xe4\x22\
+\x80\x87\x1b\x52\xfb\xd5\x10\x7d\xb4\x0f\x5c\x3c\x1f\x15\x5f\x35\
+\xdc\x86\xad\x99\x34\x7c\x76\x01\x49\x11\x7e\x06\x98\x27\x1b\x12\
+\xfa\x02\x53\x9c\x4e\xe3\xfc\x72\xc3\xf6\xac\xcd\x5c\x80\xcf\x2a\
+\x60\x58\xc4\x91\x01\x65\x4d\x28\x11\x70\x7a\x2b\xcc\x37\x9b\xb4\
+\xb5\xd1\xc6\x15\xf8\xac\x02\x92\x22\xfe\x1c\xa0\xe3\x75\xc0\x02\
+\x98\xf8\x8d\x30\xcb\xeb\xda\xd9\x5a\xef\x12\x7c\x36\x01\xc3\x3c\
+\x7c\xcc\x18\xf3\x75\x1d\x34\x82\x79\x79\x2b\xcc\xde\xad\x6b\x67\
+\x6b\xbd\x6b\xf0\xd9\x04\x6c\x14\xd1\x7b\x04\xbc\x54\x09\x8e\xcc\
+\xa9\x34\xca\xce\xd9\x82\x5b\x17\xd7\x45\xf8\x2c\x02\x86\x3b\xcf\
+\xdd\x65\xf6\xf7\xcb\x77\x22\x37\xcd\x86\x60\xbe\x4c\xc3\xec\x58\
+\x1d\x24\x5b\xeb\x5d\x85\xcf\x22\xe0\xe4\x38\x7a\x26\x20\x7c\x52\
+\x05\x8f\xa6\x08\xb7\xe2\x7c\x6c\x0b\x70\x55\xdc\xa4\x98\x63\x60\
+\x96\x85\xfb\xfc\xba\x7d\x6e\xfd\x1c\x30\xcc\xa2\x57\x4d\x80\xb7\
+\x2a\x12\x7d\x93\x86\x79\xd3\xe7\x82\xba\xfe\xce\xbd\xbe\xf1\xd1\
+\x2f\x00\x9f\xa5\x02\x92\x3c\xbc\x00\x63\x5e\xaf\x20\x93\xa4\x61\
+\xbe\x35\x37\x39\xa6\x0d\x92\x22\xaa\x1f\x9c\x2b\x04\x9f\x47\xc0\
+\x38\xfa\x18\x84\x67\x67\xf2\x32\x58\x4f\x07\xf9\x2e\x13\xcf\xb9\
+\xc3\x24\x75\xc3\xd3\x05\xe1\xb3\x08\xd8\x28\xa2\xcb\x04\x3c\x38\
+\x93\xcc\x14\xab\x52\x4f\xbb\x65\x9f\x2a\x27\x68\x08\xc3\x67\x11\
+\x90\x14\xd1\xcf\x00\x6e\xa9\x10\x70\x6b\x1a\xe7\xbf\xcc\x7d\xe8\
+\x32\x6e\xd0\xe9\x29\x4a\x3e\x08\x28\x5d\x76\x76\x92\x9e\xeb\xa7\
+\x20\xc6\x42\xb2\x12\xaa\xf5\x6d\x68\xe2\xf8\x45\xd8\x0a\x35\xc6\
+\xa0\xed\x05\x38\x7e\x1b\xca\xc8\xca\x4a\xa8\xd6\x02\x5c\x7f\x10\
+\xb3\x42\x8d\x31\x68\x6b\x01\xae\xbf\x8a\x60\x64\x65\x25\x54\x6b\
+\x01\x3e\xbc\x8c\xb3\x42\x8e\x29\x68\x6b\x01\x65\x3f\x7c\x78\x1d\
+\xcd\xc4\x8b\x3d\x0c\x8b\x00\x5f\x3e\xc8\xb0\xd3\x63\x08\xc8\x22\
+\xe0\xe0\x91\xdf\x93\x4f\x92\x0c\xcc\x58\x43\xb0\x09\xf0\xe9\xa3\
+\x3c\x2b\xc1\x96\xc1\xd8\x04\xfc\x59\x05\xfe\x0c\x4b\x69\xc9\x8d\
+\x6d\x73\x56\x01\xbe\x0d\xcc\x62\xa3\xd8\x22\x10\xab\x80\x83\x3b\
+\x22\xcf\x86\x26\xb6\x60\xc7\xb2\x29\xbb\x80\xb2\x57\x9e\x0d\xce\
+\xfd\x11\xa0\x6f\xd3\xb0\x78\x8a\x85\xe8\x9c\x41\xac\x08\x38\x90\
+\xe0\xe1\xf0\xf4\xeb\xbf\x9e\x65\x8d\xc7\x2c\x2f\x56\x13\x7a\x38\
+\x41\x63\x37\x0d\xf3\x72\xd2\xe0\xc2\x16\xab\x02\xfe\xde\x0b\x8f\
+\xa6\x28\xfd\x94\x86\xf9\x1d\x0b\xa3\xcf\x3d\x3c\xbd\xaa\xe3\x9e\
+\x4c\xd2\xeb\xae\x80\x52\x8e\x07\xd3\x54\xbb\x79\x0a\xfa\xaf\xca\
+\x70\x71\xa2\x76\xe7\x2e\xc2\x4d\xcf\xa5\xc2\x3f\x55\xd0\xcd\xdb\
+\xd0\xa6\xf0\xfb\xde\x6e\x21\x77\x41\x7d\x87\x5c\xb5\xff\x2a\x40\
+\xf8\xe8\x50\x01\x2a\x40\x98\x80\x70\x7a\xad\x00\x15\x20\x4c\x40\
+\x38\xbd\x56\x80\x0a\x10\x26\x20\x9c\x5e\x2b\x40\x05\x08\x13\x10\
+\x4e\xaf\x15\xa0\x02\x84\x09\x08\xa7\xd7\x0a\x50\x01\xc2\x04\x84\
+\xd3\x6b\x05\xa8\x00\x61\x02\xc2\xe9\xb5\x02\x54\x80\x30\x01\xe1\
+\xf4\x5a\x01\xc2\x02\xfe\x00\xfd\x92\x01\x7f\xf5\x42\xf0\xd7\x00\
+\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x06\xe6\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x60\x00\x00\x00\x60\x08\x06\x00\x00\x00\xe2\x98\x77\x38\
+\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x06\
+\xa0\x49\x44\x41\x54\x78\x5e\xed\x9d\x5d\x68\x1c\x55\x14\xc7\xcf\
+\x99\x64\xad\x82\x82\x82\x36\x9b\xd9\x42\xfd\xea\x4e\x0a\x82\xbe\
+\x14\x7c\xd0\x82\xc9\xee\xa2\xad\x69\xa1\x58\xf1\xdd\x2a\x0a\x7e\
+\x60\xfa\xa4\xe8\x93\xa2\x4f\x2a\x7e\x80\xe2\xc7\xbb\x58\x29\x34\
+\xb1\x55\x76\x37\x11\x6a\x1f\x84\xbe\x28\x08\xcd\x6c\xfd\x2a\x74\
+\x27\x1b\x15\x14\x14\xb4\x6e\x32\x47\xee\x9a\x2d\x31\xd9\xcd\xdc\
+\xb9\x73\xef\xde\x33\xcb\xec\xeb\xcc\x9c\x73\xee\xff\x77\xcf\xbd\
+\x77\xee\xcc\x9c\x45\xc8\x7e\x56\x15\x40\xab\xde\x33\xe7\x90\x01\
+\xb0\xdc\x09\x32\x00\x19\x00\xcb\x0a\x58\x76\x9f\x65\x40\x06\xc0\
+\xb2\x02\x96\xdd\x67\x19\x90\x01\xe8\xaf\xc0\x17\x45\xf7\xfa\x55\
+\x07\xef\x0c\xc3\x30\x8f\xe8\xe4\x01\x69\x0c\x89\xf2\x04\x98\x07\
+\x84\x3c\x10\xe4\x3b\x57\x23\xb4\x80\xa0\x85\x40\x2d\x42\x6c\x01\
+\xe1\x32\x51\xd8\x72\x1c\xa7\x35\x12\xd2\x57\xf7\x34\x82\x5f\x2d\
+\xeb\xdc\xd7\x3d\xbb\x0c\x98\x2b\xee\x28\x5c\x85\xe1\xbd\x84\xf0\
+\x10\x10\x94\xb4\x08\x87\x50\x47\x82\x8f\xfe\x22\xe7\xf3\xe9\xc6\
+\xc5\xa6\x16\x9b\x9a\x8c\xb0\x00\x50\xdf\x35\x76\x33\x3a\xa3\x15\
+\x02\xda\x47\x00\xd3\x9a\xda\xd6\xd3\x0c\x02\xcc\x21\xe0\x29\x0a\
+\x57\xaa\xa5\xf3\xcb\x3f\x98\xf4\x25\x63\xdb\x2a\x80\xfa\x44\xe1\
+\x7e\x20\x7a\xd4\xb4\xe8\xfd\x84\x10\x30\x00\xf1\xbd\xd2\x62\xf3\
+\x53\x19\xb1\x4c\x9c\x63\x05\x80\x6d\xe1\x37\x0a\x69\x13\xc4\x40\
+\x01\x70\x13\x9e\x03\x88\x81\x00\xe0\x2e\xbc\x4d\x10\xc6\x01\x54\
+\x8b\x85\x19\x44\x7a\xd5\xc4\xf8\x69\xda\x26\x11\x1e\xad\x34\x9a\
+\xaf\x99\xf4\x63\x14\x40\xd5\x73\xdf\x40\x80\xa7\x4c\x36\xc0\xb4\
+\x6d\x02\x78\xb3\xe2\x07\x4f\x9b\xf2\x63\x0c\x40\xd5\x73\x4f\x20\
+\xc0\x01\x53\x81\x0f\xd2\x2e\x01\xcc\x56\xfc\xe0\xa0\x09\x9f\x46\
+\x00\x54\x3d\xf7\x6b\x04\xb8\xdd\x44\xc0\xb6\x6c\x12\xc0\x37\x15\
+\x3f\xb8\x43\xb7\x7f\xed\x00\x6a\x9e\xfb\x1b\x00\x5c\xab\x3b\x50\
+\x26\xf6\x7e\x2f\xfb\xc1\x75\x3a\x63\xd1\x0a\xa0\xe6\xb9\x4b\x00\
+\x6b\xfb\x33\x3a\xa3\xe4\x65\xab\x55\xf6\x83\x71\x5d\x21\x69\x03\
+\x50\xf7\x0a\xa7\x08\xe8\x3e\x5d\x81\x71\xb6\x83\x80\x9f\x95\xfc\
+\xe6\x3e\x1d\x31\x6a\x01\x50\x2d\x16\x5e\x46\xa4\x67\x75\x04\x94\
+\x16\x1b\x44\xf8\x4a\xa5\xd1\x7c\x2e\x69\xbc\x89\x01\xd4\x8b\x85\
+\x19\x4a\xe9\x3a\x3f\xb1\x78\x84\x47\x4b\x09\xef\x13\x12\x01\xa8\
+\x7b\xee\xc3\x04\xf0\x41\xd2\x86\xa4\xf9\x7a\x04\x38\x52\xf2\x83\
+\x0f\x55\xdb\xa0\x0c\x40\x6c\x2f\x10\xd1\x9c\xaa\xe3\x61\xba\x0e\
+\x11\xa7\x55\x77\x54\xd5\x01\x78\xee\xac\xad\x6d\x64\x6e\xf0\xc4\
+\x6e\x6a\xc9\x0f\x94\x6e\x3a\x95\x00\x64\xbd\x7f\x73\x17\x50\xcd\
+\x02\x35\x00\x0c\x7a\x3f\x01\x3e\xe8\xe4\xda\xa7\x85\x14\x61\x3b\
+\xb7\x17\x81\x3e\xb6\x99\x19\xaa\x59\x10\x1b\x00\x87\xde\x5f\xf6\
+\x83\x9e\x71\xd7\x3c\x97\xac\x42\x50\x98\x0b\xe2\x03\xb0\xdc\xfb\
+\x47\x00\x0e\x4e\xfa\xc1\x6c\x2f\xa1\x17\x3c\xf7\xc0\x2a\xc0\x09\
+\x5b\x10\x54\xb2\x20\x16\x00\x0e\xbd\x7f\x9b\x93\x73\xf7\x9e\xbb\
+\x20\xb6\x3c\x36\xfd\x4e\xef\xde\x39\x7e\x29\x6c\x07\xb6\x00\x08\
+\xbf\x71\xe7\x82\x78\x00\x2c\xf7\xfe\x4e\x03\x73\x2b\xf9\xd2\xb7\
+\x3f\x2f\xf7\x12\xb9\x7e\xdb\xf6\x31\x6a\x8f\xb6\xac\x02\x88\xb9\
+\x22\x92\x06\xb0\xe0\xb9\xde\x2a\xc0\xa2\xcd\xc6\x09\xdf\x62\xf2\
+\xad\xf8\xcd\x63\xbd\xe2\xa8\x7a\x85\xc3\xb6\x27\x63\x11\xd7\x08\
+\xc0\xc4\xa4\x1f\xf8\x32\x5a\x49\x03\xe0\xb4\xe5\xc0\x75\x12\xee\
+\x0a\x8e\x31\xb6\x28\xe4\x01\x78\xee\x3c\x01\x4c\xca\x50\x1d\xc4\
+\x39\x62\x32\x1e\x75\x72\x67\x85\xaf\x95\xb0\xbd\xc7\xe6\xe4\xbb\
+\xb1\xbd\x08\xb0\x50\xf2\x83\x29\x19\x1d\xa4\x00\xcc\xef\x1e\xdf\
+\x19\x86\xf8\x93\x8c\xc1\xec\x9c\xff\x14\x70\x1c\xba\x71\xea\xdc\
+\xd2\x85\x28\x3d\xa4\x00\xd4\x8a\x85\x67\x00\xc9\xe8\xdb\x01\x51\
+\x81\xa6\xee\x38\xe1\x4c\xb9\xd1\x7c\x3d\x2a\x6e\x39\x00\x9e\xfb\
+\x25\x00\xdc\x15\x65\x2c\x3b\xfe\x3f\x05\xce\x94\xfd\xe0\xee\x28\
+\x4d\x22\x01\xd4\x6f\xda\x3e\x46\x57\xd8\x5d\xda\x45\x35\x82\xeb\
+\x71\xfc\x67\x25\x5f\xfa\xb1\xf7\x92\xf9\xf2\x84\x1d\x15\x3c\x87\
+\x9b\xaf\xa8\x18\xb9\x1e\x97\xb9\x29\x8b\xcc\x80\x6a\x71\xfc\x08\
+\x22\xbe\xcf\xb5\x91\x9c\xe3\x22\xa2\x47\x2a\x8d\xa5\x2d\x1f\x58\
+\x45\x02\xa8\x79\x85\xe7\x01\xe8\x45\xce\x0d\xe5\x1b\x1b\xbe\x50\
+\xf6\x9b\x2f\x6d\x15\x5f\x34\x80\x09\xf7\x2d\x20\x78\x82\x6f\x23\
+\x19\x47\x86\xf0\x76\x79\x31\x78\x32\x11\x80\xba\x37\x7e\x8c\x00\
+\x1f\xe0\xd6\x4c\x6e\xcf\x03\x7a\xe9\x83\x40\x9f\x94\xfc\xa5\xc3\
+\x89\x00\xd4\x18\x2e\x41\xb9\x6f\x45\xac\x13\x3c\x72\x29\x2a\x33\
+\x04\x9d\x07\x82\x5b\xb9\x64\x00\xe7\xe7\x01\x9b\x34\x42\xf8\xae\
+\xbc\x18\xec\x4a\x9a\x01\x7f\x00\xc0\xd5\x5c\x00\x70\x7f\x1e\xb0\
+\x41\xa7\x3f\xcb\x7e\x70\xcd\x50\x01\xe8\x37\xfc\x74\x1b\x69\xfb\
+\xb1\xa4\x7e\x00\x13\x2e\xab\x21\x28\x55\x00\x34\x0d\x41\xac\xf6\
+\x81\x52\x05\x00\x20\xf9\x24\xcc\x6d\x19\x9a\x26\x00\x7a\x96\xa1\
+\xcc\x6e\xc4\xd2\x04\x00\x74\xdc\x88\x71\xdb\x8a\x48\x15\x00\xd0\
+\xb0\x15\xc1\x6d\x33\x2e\x4d\x00\xb4\x6c\xc6\x71\xdb\x8e\x4e\x13\
+\x00\x2d\xdb\xd1\xa2\x66\xcf\x0a\xc2\x2f\x5c\x6e\xc4\xd2\x04\x60\
+\x94\xe0\x86\xa8\x5a\x45\x91\x5b\x11\x42\xf8\xda\x84\x5b\xd3\x56\
+\xbb\x27\x21\xc9\xd4\x00\x40\xa8\x97\x17\x83\x72\x54\x73\xa5\x00\
+\x70\xfa\x12\x26\x2d\x00\x64\xbf\x9c\x91\x02\x20\xaa\x58\x5d\x89\
+\xe1\xc5\x28\x9a\x83\x38\x9e\x16\x00\x7f\x93\xb3\x43\xa6\x3a\x97\
+\x14\x00\x21\x6c\x9d\xc1\x7b\xa1\x22\x8e\x34\x00\x88\xf3\x96\xb4\
+\x34\x80\x79\xaf\xf0\x58\x08\xf4\xce\x20\x7a\xf9\x56\x3e\xd2\x00\
+\xc0\x01\x7c\x7c\xca\x6f\xbe\x2b\xa3\x95\x34\x00\x51\xd7\x8d\x9c\
+\x91\xef\x65\x8c\x9a\x3c\x27\x0d\x00\x30\x5c\xbd\x45\xb6\x1e\x9d\
+\x34\x00\x2e\xc3\x10\x77\x00\x71\x86\x1f\xa1\x69\x3c\x00\x0c\x3e\
+\x4d\x65\xff\x7d\x40\xcc\xcf\x94\x62\x01\xe0\x90\x05\x9c\xbf\x0f\
+\x88\xdb\xfb\x63\x67\x40\x07\x00\x83\x2c\xe0\xfa\x50\x5e\x66\xeb\
+\x61\xe3\xfc\x18\x3b\x03\x38\x64\x81\x88\x81\xdb\xf7\x01\x2a\xbd\
+\x5f\x29\x03\xb8\x64\x81\xc9\x95\x96\x8a\x6d\x95\xde\xaf\x0c\x80\
+\x4b\x16\xa8\x08\x65\xe2\x1a\xd5\xde\x9f\x0c\x00\x83\xb9\xc0\x84\
+\x98\x2a\x36\x55\x7b\x7f\x22\x00\xe2\xe2\x34\xd7\x04\x55\x11\xba\
+\xd7\x35\x49\x6b\x8b\x2a\x4d\xc2\xeb\x03\x19\x86\xda\xa0\xaa\x30\
+\x74\xd4\x14\x4d\x0c\xa0\x93\x09\x43\x54\x23\x54\x16\x86\xae\x5a\
+\xa2\x5a\x00\xac\x41\x18\xba\x5a\xa1\xfd\x60\xe8\xac\x21\xaa\x0d\
+\x80\x08\x76\xc8\x6b\x86\x76\x79\x68\xad\x1d\xaa\x15\xc0\x1a\x84\
+\x61\xae\x1d\xaa\xb5\x66\x68\xe2\x55\x50\xbf\x14\x1d\xc6\x1a\xa2\
+\x3a\x6b\x85\xae\xd7\x4d\x7b\x06\x74\x8d\x0f\x53\x2d\x51\x5d\x35\
+\x42\x7b\x75\x58\x63\x00\x3a\x77\xcb\x43\x50\x53\x34\x4e\xe1\x0d\
+\xd9\x15\xd4\x40\x32\xa0\xeb\x84\xd3\x1b\x15\x71\x05\x92\x7d\xb3\
+\x21\xae\xdd\x81\x02\xe8\x64\x82\xe5\x7f\x4b\x8a\x2b\xd0\x20\xff\
+\xd4\xc7\xe8\x10\xb4\xb1\xe1\xdc\x41\x0c\x52\xf8\xae\x36\x03\x05\
+\x70\x79\x58\x62\x96\x11\x36\x84\xb7\x0a\x80\x0b\x08\x9b\xc2\xb3\
+\x00\xd0\x0d\x42\xd4\xa3\x0b\x09\xf7\x03\xd2\x7e\xd3\x55\xb9\x44\
+\x35\x2b\x20\x3c\xe9\x20\x9d\x94\xad\xeb\x16\x77\x0e\x89\x73\xbe\
+\x95\x21\x68\xab\x00\x3b\xd5\xb9\x56\x9d\x43\x80\x74\x48\x63\x8d\
+\xa2\x33\x40\x78\xdc\x19\x09\x8f\xcb\x54\xb1\x8a\x23\x60\xd2\x73\
+\xd9\x01\x58\xdf\x20\x51\xab\x08\xb6\xe5\xf6\x24\xf9\x3b\x5b\xb8\
+\xd4\x3e\x1b\x55\xb3\x27\xa9\x88\x49\xae\x67\x0d\x20\x49\xc3\xd2\
+\x72\x6d\x06\xc0\x32\xa9\x0c\x40\x06\xc0\xb2\x02\x96\xdd\x67\x19\
+\x90\x01\xb0\xac\x80\x65\xf7\x59\x06\x64\x00\x2c\x2b\x60\xd9\xfd\
+\xbf\x49\x9e\x12\x8e\x88\xd0\x17\x11\x00\x00\x00\x00\x49\x45\x4e\
+\x44\xae\x42\x60\x82\
+\x00\x00\x03\x25\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x60\x00\x00\x00\x60\x08\x06\x00\x00\x00\xe2\x98\x77\x38\
+\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x02\
+\xdf\x49\x44\x41\x54\x78\x5e\xed\x9b\x41\x6e\x54\x41\x0c\x44\xed\
+\x53\x80\xe0\x1a\xac\x39\x42\x58\xc1\x21\x61\x05\x47\x60\xcd\x35\
+\x12\x91\x53\x34\x8a\xc4\x24\x1b\x88\x64\x3f\xcd\x94\xfb\xff\xca\
+\x7a\x4a\xfe\xbf\x5e\x7b\x5a\xa9\xd2\x64\xf8\x4f\xea\x40\x4a\xa7\
+\x7b\x78\x18\x80\xf8\x10\x18\x80\x01\x88\x1d\x10\x8f\xf7\x06\x18\
+\x80\xd8\x01\xf1\x78\x6f\x80\x01\x88\x1d\x10\x8f\xf7\x06\x18\x80\
+\xd8\x01\xf1\x78\x6f\xc0\xae\x00\xd6\x5a\xdf\x23\xe2\x43\x44\xbc\
+\x13\xbf\x83\x7a\xfc\x43\x44\xfc\xca\xcc\x4f\x9d\x07\x69\x6d\xc0\
+\x5a\x6b\x75\x86\x1d\x5d\x93\x99\x65\x3f\xcb\x82\xb5\xd6\xd7\x88\
+\xf8\x7c\x74\x33\x9b\xef\xf7\x2d\x33\xbf\x54\xb4\x1d\x00\xbf\x23\
+\xe2\x4d\x65\xc8\x89\x3e\xfb\x98\x99\x6f\x2b\xef\xdb\x01\x70\xef\
+\xef\xfd\xff\x5a\xfc\x90\x99\xef\xaf\x0d\xe0\xe9\xf2\xbd\xab\x0c\
+\x39\xd1\x67\x7f\x54\x2f\xe3\xf2\x06\x3c\x99\xe9\x4b\xf8\xdf\x47\
+\xea\x26\x97\xf0\x65\xf4\xdf\xcb\xf8\xa3\xef\x83\x78\x8c\x88\x9f\
+\xd5\xcb\xf7\xe2\x63\x6b\x03\x4e\xf4\x95\x72\xf5\x57\x35\x80\xab\
+\x5b\xfc\xfa\x00\x03\x30\x00\xb1\x03\xe2\xf1\xde\x00\x03\x10\x3b\
+\x20\x1e\xef\x0d\x30\x00\xb1\x03\xe2\xf1\xb2\x0d\x18\xd4\x27\xa0\
+\x3c\x9f\xf2\x93\x00\x98\x1a\x65\x74\xa2\x84\xed\x00\x0c\xef\x13\
+\xca\x79\xfe\x8e\x00\x26\xf7\x09\xe5\x3c\x7f\x47\x00\x93\xfb\x84\
+\x72\x9e\xbf\x23\x80\xc9\x7d\x42\x39\xcf\xdf\x0e\xc0\xe4\x3e\xe1\
+\x14\x97\xf0\xc0\x3e\x01\xe5\xf9\x5b\x6e\x00\x7d\xe8\x23\xe9\x25\
+\xff\x07\x1c\xc9\x40\xfa\x2e\x06\x40\x1d\x84\x7a\x03\x80\x06\x52\
+\xb9\x01\x50\x07\xa1\xde\x00\xa0\x81\x54\x6e\x00\xd4\x41\xa8\x37\
+\x00\x68\x20\x95\xb7\x01\x0c\xca\xf3\xa9\x07\x54\x8f\xfa\x84\x16\
+\x80\xa9\x79\x3e\x75\x92\xea\x3b\x51\x46\x19\xc0\xf0\x3c\x9f\x7a\
+\x48\xf5\xe5\x3e\xa1\x03\x60\x72\x9e\x4f\x0d\xa4\xfa\x72\x9f\xd0\
+\x01\x30\x39\xcf\xa7\x06\x52\x7d\xb9\x4f\xe8\x00\x98\x9c\xe7\x53\
+\x03\xa9\xbe\xdc\x27\x94\x01\x4c\xce\xf3\xa9\x7b\x54\x7f\x93\x4b\
+\xf8\xf2\x90\xfe\x7d\xc0\x33\x2e\xd4\x27\xb4\x36\x80\x9e\x14\xeb\
+\x5f\x1c\x30\x00\xf1\x69\x30\x00\x03\x10\x3b\x20\x1e\xef\x0d\x30\
+\x00\xb1\x03\xe2\xf1\xde\x00\x03\x10\x3b\x20\x1e\x2f\xdb\x80\x41\
+\x7d\x02\xca\xf3\x29\x3f\x09\x80\xa9\x7d\x42\x27\x4a\xd8\x0e\xc0\
+\xf0\x3e\xa1\x9c\xe7\xef\x08\x60\x72\x9f\x50\xce\xf3\x77\x04\x30\
+\xb9\x4f\x28\xe7\xf9\x3b\x02\x98\xdc\x27\x94\xf3\xfc\xed\x00\x4c\
+\xee\x13\x4e\x71\x09\x0f\xec\x13\x50\x9e\xbf\xe5\x06\xd0\x87\x3e\
+\x92\x5e\xf2\x7f\xc0\x91\x0c\xa4\xef\x62\x00\xd4\x41\xa8\x37\x00\
+\x68\x20\x95\x1b\x00\x75\x10\xea\x0d\x00\x1a\x48\xe5\x06\x40\x1d\
+\x84\x7a\x03\x80\x06\x52\x79\x1b\xc0\xa0\x3c\x9f\x7a\x40\xf5\xa8\
+\x4f\x68\x01\x98\x9a\xe7\x53\x27\xa9\xbe\x13\x65\x94\x01\x0c\xcf\
+\xf3\xa9\x87\x54\x5f\xee\x13\x3a\x00\x26\xe7\xf9\xd4\x40\xaa\x2f\
+\xf7\x09\x1d\x00\x93\xf3\x7c\x6a\x20\xd5\x97\xfb\x84\x0e\x80\xc9\
+\x79\x3e\x35\x90\xea\xcb\x7d\x42\x19\xc0\xe4\x3c\x9f\xba\x47\xf5\
+\x37\xb9\x84\x2f\x0f\xe9\xdf\x07\x3c\xe3\x42\x7d\x42\x6b\x03\xe8\
+\x49\xb1\xfe\xc5\x01\x03\x10\x9f\x06\x03\x30\x00\xb1\x03\xe2\xf1\
+\xde\x00\x03\x10\x3b\x20\x1e\xef\x0d\x30\x00\xb1\x03\xe2\xf1\xde\
+\x00\x03\x10\x3b\x20\x1e\xef\x0d\x30\x00\xb1\x03\xe2\xf1\x7f\x00\
+\x26\xe7\xc8\x61\xa3\x60\xaf\x54\x00\x00\x00\x00\x49\x45\x4e\x44\
+\xae\x42\x60\x82\
+\x00\x00\x03\x0c\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x60\x00\x00\x00\x60\x08\x06\x00\x00\x00\xe2\x98\x77\x38\
+\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x02\
+\xc6\x49\x44\x41\x54\x78\x5e\xed\x9d\x41\x4e\xe4\x40\x0c\x45\xed\
+\x53\x80\x98\x6b\xb0\x9e\x23\x30\xab\xe1\x90\xcc\x6a\x38\x02\xeb\
+\xb9\x06\x08\x4e\x51\xa8\x25\x90\x7a\xd1\x93\x4e\xc5\xfa\x76\xdc\
+\xfd\xd8\x92\xb2\xa9\xff\xe2\x58\xf1\x57\x11\x37\x7e\x4a\x15\xf0\
+\xd2\xec\x24\x37\x00\x14\xdf\x04\x00\x00\x40\xb1\x02\xc5\xe9\xa9\
+\x00\x00\x14\x2b\x50\x9c\x9e\x0a\x00\x40\xb1\x02\xc5\xe9\xa9\x00\
+\x00\x14\x2b\x50\x9c\x9e\x0a\xe8\x0a\x60\x8c\xf1\xd7\xcc\xee\xcd\
+\xec\xae\x78\x0f\xd5\xe9\xdf\xcc\xec\x9f\xbb\xff\xda\xf2\x87\x6c\
+\xaa\x80\x31\xc6\xd8\x92\xec\xd2\xd7\xb8\xfb\xb4\x9e\xd3\x0b\xc6\
+\x18\x4f\x66\xf6\xfb\xd2\xc5\xdc\xb8\xbf\x3f\xee\xfe\x38\xb3\x76\
+\x0b\x80\x77\x33\xbb\x99\x49\x72\x45\xd7\x7e\xb8\xfb\xed\xcc\x7e\
+\xb7\x00\x78\xe5\xb9\xff\x5f\x89\xdf\xdc\xfd\x87\x1a\xc0\xa1\xf9\
+\x3e\xcc\x24\xb9\xa2\x6b\x9f\x67\x9b\xf1\x74\x05\x1c\xc4\xa4\x09\
+\x9f\xbe\xa5\x52\x9a\xf0\x77\xea\xaf\x66\xfc\x93\x7e\x60\x1f\x66\
+\xf6\x32\xdb\x7c\xbf\x75\xdc\x54\x01\x57\xf4\x48\x91\x6f\x15\x00\
+\x72\x89\x97\x13\x00\x00\x00\xc5\x0a\x14\xa7\xa7\x02\x00\x50\xac\
+\x40\x71\x7a\x2a\x00\x00\xc5\x0a\x14\xa7\xdf\x6d\x05\x34\xf2\x1b\
+\xf2\xfd\x00\xf5\x4d\xd3\x75\xd4\x91\x3a\x8a\x50\x41\x68\xee\x37\
+\xe8\xfd\x00\x95\xf0\x47\x33\xa6\xce\x7e\x83\xde\x0f\x48\x00\xd0\
+\xd9\x6f\xd0\xfb\x01\x09\x00\x3a\xfb\x0d\x39\x7e\x40\x02\x84\x96\
+\xa6\xff\x45\x34\xe1\x86\x7e\x03\x7e\x80\xba\x22\x95\xf1\x77\xfb\
+\x22\xa6\xdc\xf4\x9e\x62\x03\xa0\x98\x06\x00\x00\x50\xac\x40\x71\
+\x7a\x2a\x00\x00\xc5\x0a\x14\xa7\xa7\x02\xba\x02\x68\x34\xaf\x57\
+\x4b\x9c\xef\x07\x74\x9d\xd7\xab\x49\xa4\x8c\x22\x9a\xcf\xeb\xd5\
+\x0c\xf4\x7e\xc0\x18\xa3\xf3\xbc\x5e\x0d\x40\xef\x07\x8c\x31\x3a\
+\xcf\xeb\xd5\x00\xf4\x7e\xc0\x57\xf3\xe5\x7c\xc0\x69\x94\x39\x7e\
+\x00\x4d\xf8\xb4\xfa\x29\x4d\xb8\xe1\xbc\x5e\xfd\xd8\xc1\x0f\x50\
+\x2b\xac\x8c\xcf\x9b\xb0\x52\xdd\x15\xb1\x01\xb0\x42\x24\xe5\x25\
+\x00\x50\xaa\xbb\x22\x36\x00\x56\x88\xa4\xbc\x04\x00\x4a\x75\x57\
+\xc4\x06\xc0\x0a\x91\x94\x97\x00\x40\xa9\xee\x8a\xd8\xbb\x05\xd0\
+\xc8\x6f\xc8\xf7\x03\x56\x80\x0d\x5d\xd2\x75\xd4\x91\x3a\x8a\x08\
+\x29\xbc\xb0\xb8\xb9\xdf\xa0\xf7\x03\x54\xc2\x1f\xcd\x98\x3a\xfb\
+\x0d\x7a\x3f\x20\x01\x40\x67\xbf\x41\xef\x07\x24\x00\xe0\x7c\x80\
+\x5a\xe4\x73\xf1\x69\xc2\xe7\x14\x4a\xf8\x7d\xa3\xff\x47\x84\x1f\
+\x90\x70\x3f\xc8\x52\xec\xf6\x45\x4c\xb6\xe3\x9d\x05\x06\x40\x31\
+\x10\x00\x00\xa0\x58\x81\xe2\xf4\x54\x00\x00\x8a\x15\x28\x4e\x4f\
+\x05\x74\x05\xd0\x68\x5e\xaf\x96\x38\xdf\x0f\xe8\x3a\x2a\x50\x93\
+\x48\xf1\x03\x9a\xcf\xeb\xd5\x0c\xf4\x7e\x00\xe7\x03\x16\x19\xea\
+\xfd\x00\xce\x07\x2c\x02\xd0\xfb\x01\x9c\x0f\x58\x04\xc0\xf9\x00\
+\xf5\x43\x7e\x29\x7e\x4a\x13\x3e\xf2\x6e\x0f\x1f\xf3\xe1\xfb\x01\
+\xc6\xf7\x03\x2a\x6f\xfa\x70\x6e\xde\x84\xc3\x12\xc6\x02\x00\x20\
+\xa6\x5f\x78\x35\x00\xc2\x12\xc6\x02\x00\x20\xa6\x5f\x78\x35\x00\
+\xc2\x12\xc6\x02\x00\x20\xa6\x5f\x78\x35\x00\xc2\x12\xc6\x02\x00\
+\x20\xa6\x5f\x78\x35\x00\xc2\x12\xc6\x02\x00\x20\xa6\x5f\x78\x35\
+\x00\xc2\x12\xc6\x02\x7c\x02\x1e\x33\xc8\x61\xee\xf3\xad\xd8\x00\
+\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x02\xf2\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x60\x00\x00\x00\x60\x08\x06\x00\x00\x00\xe2\x98\x77\x38\
+\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x02\
+\xac\x49\x44\x41\x54\x78\x5e\xed\x99\xcd\x4d\x43\x41\x10\x83\x67\
+\xaa\x00\x41\x1b\x9c\x29\x01\x4e\x50\x24\x9c\xa0\x04\xce\xb4\x41\
+\x44\xaa\x58\x14\x89\xdc\xf8\xd1\xcc\x93\xe3\x75\xd6\x39\x27\xeb\
+\xb7\xfe\xe2\x8c\x32\xce\xf0\x8b\xea\x40\x52\xd5\x2d\x1e\x06\x40\
+\xfe\x12\x18\x80\x01\x90\x1d\x20\xcb\x3b\x01\x06\x40\x76\x80\x2c\
+\xef\x04\x18\x00\xd9\x01\xb2\xbc\x13\x60\x00\x64\x07\xc8\xf2\x4e\
+\x80\x2a\x80\x31\xc6\x4b\x44\xdc\x44\xc4\x15\xf9\x0e\x6c\xf9\x5d\
+\x44\xbc\x67\xe6\x7d\xe7\x41\x5a\x09\x18\x63\x8c\x8e\xd8\xb9\x7f\
+\x26\x33\xcb\x7e\x96\x3f\x30\xc6\x78\x8a\x88\x87\x73\x37\xb3\x79\
+\xbf\xe7\xcc\x7c\xac\x7c\xb6\x03\xe0\x33\x22\x2e\x2a\x22\x0b\xbd\
+\x77\x9f\x99\x97\x95\xfb\x76\x00\x7c\xf8\x77\xff\x57\x8b\x77\x99\
+\x79\x8d\x06\x70\x18\xbe\x77\x15\x91\x85\xde\xfb\x5a\x1d\xc6\xe5\
+\x04\x1c\xcc\xf4\x10\xfe\xf9\x2b\x75\x92\x21\x7c\x94\xfe\x1e\xc6\
+\xb7\x9e\x07\xb1\x8f\x88\xb7\xea\xf0\x3d\xfa\xd8\x4a\xc0\x42\x3f\
+\x29\xf0\xab\x1a\x00\xdc\xe2\xbf\x05\x0c\xc0\x00\xc8\x0e\x90\xe5\
+\x9d\x00\x03\x20\x3b\x40\x96\x77\x02\x0c\x80\xec\x00\x59\xbe\x9d\
+\x00\xa1\x3e\x60\xd3\xbe\x1e\xcd\xa7\x05\x40\x75\x15\xd1\x59\x15\
+\x4c\x07\x40\xbc\x0f\x28\xef\xeb\x67\x04\xa0\xdc\x07\x94\xf7\xf5\
+\x33\x02\x50\xee\x03\xca\xfb\xfa\x19\x01\x28\xf7\x01\xe5\x7d\xfd\
+\x74\x00\x94\xfb\x80\xb3\x18\xc2\x82\x7d\xc0\xa6\x7d\xfd\x94\x09\
+\x40\x3f\xd4\x4a\xe7\xb7\xfe\x07\xac\x64\x10\xfa\xae\x06\x80\x76\
+\xf8\x9f\xf3\x0d\xc0\x00\xc8\x0e\x90\xe5\x9d\x00\x03\x20\x3b\x40\
+\x96\x77\x02\x54\x01\x08\xf5\x01\x68\x8b\x37\xf5\x0d\xad\x04\xa8\
+\xf6\x01\x68\x12\x9d\x55\x47\x19\x80\x78\x1f\x80\x66\x50\xee\x1b\
+\x3a\x00\x94\xfb\x00\x34\x80\x72\xdf\xd0\x01\xa0\xdc\x07\xa0\x01\
+\x94\xfb\x86\x0e\x00\xe5\x3e\x00\x0d\xa0\xdc\x37\x94\x01\x28\xf7\
+\x01\x68\xf7\x4f\x32\x84\x05\xfb\x00\xb4\xef\x9b\xfa\x86\x56\x02\
+\xd0\x37\x5a\xe9\x7c\x03\x20\xd3\x36\x00\x03\x20\x3b\x40\x96\x77\
+\x02\x0c\x80\xec\x00\x59\xde\x09\x30\x00\xb2\x03\x64\xf9\x76\x02\
+\x84\xfa\x80\x4d\xfb\x7a\x34\x9f\x16\x00\xd5\x3e\xa0\xb3\x2a\x98\
+\x0e\x80\x78\x1f\x50\xde\xd7\xcf\x08\x40\xb9\x0f\x28\xef\xeb\x67\
+\x04\xa0\xdc\x07\x94\xf7\xf5\x33\x02\x50\xee\x03\xca\xfb\xfa\xe9\
+\x00\x28\xf7\x01\x67\x31\x84\x05\xfb\x80\x4d\xfb\xfa\x29\x13\x80\
+\x7e\xa8\x95\xce\x6f\xfd\x0f\x58\xc9\x20\xf4\x5d\x0d\x00\xed\xf0\
+\x3f\xe7\x1b\x80\x01\x90\x1d\x20\xcb\x3b\x01\x06\x40\x76\x80\x2c\
+\xef\x04\xa8\x02\x10\xea\x03\xd0\x16\x6f\xea\x1b\x5a\x09\x50\xed\
+\x03\xd0\x24\x3a\xab\x8e\x32\x00\xf1\x3e\x00\xcd\xa0\xdc\x37\x74\
+\x00\x28\xf7\x01\x68\x00\xe5\xbe\xa1\x03\x40\xb9\x0f\x40\x03\x28\
+\xf7\x0d\x1d\x00\xca\x7d\x00\x1a\x40\xb9\x6f\x28\x03\x50\xee\x03\
+\xd0\xee\x9f\x64\x08\x0b\xf6\x01\x68\xdf\x37\xf5\x0d\xad\x04\xa0\
+\x6f\xb4\xd2\xf9\x06\x40\xa6\x6d\x00\x06\x40\x76\x80\x2c\xef\x04\
+\x18\x00\xd9\x01\xb2\xbc\x13\x60\x00\x64\x07\xc8\xf2\x4e\x80\x01\
+\x90\x1d\x20\xcb\x3b\x01\x06\x40\x76\x80\x2c\xff\x05\x1f\xf5\xc8\
+\x61\x35\x79\xf2\x08\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\
+\x82\
+\x00\x00\x04\xc9\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x60\x00\x00\x00\x60\x08\x06\x00\x00\x00\xe2\x98\x77\x38\
+\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x04\
+\x83\x49\x44\x41\x54\x78\x5e\xed\x9d\xbb\x6e\x54\x31\x10\x86\xff\
+\xa9\x29\xb8\xdf\x29\xa9\x41\x88\x82\x92\x47\x40\x50\x70\x13\x20\
+\xd1\x90\x37\x40\xe2\x09\x90\x90\x10\x7d\x0a\x1a\x08\x97\x06\xf1\
+\x06\x54\x88\x06\x21\xd1\x20\x5e\x20\x24\x04\x01\xa2\xa0\x1e\xe2\
+\x28\x45\x76\xd9\xb3\x9e\xb1\xbd\xc7\x3e\x27\xff\x69\x99\xb5\x3d\
+\xf3\xf9\x3a\xfe\x63\x04\xfc\xaa\x46\x40\xaa\xd6\xce\xca\x41\x00\
+\x95\x3b\x01\x01\x10\x40\xe5\x08\x54\xae\x9e\x23\x80\x00\x2a\x47\
+\xa0\x72\xf5\x1c\x01\x43\x03\xa0\xaa\x7b\x01\x3c\x02\x70\x09\xc0\
+\xd1\x8e\xf6\x7f\x07\xf0\x06\xc0\x03\x11\xf9\x53\xd9\xc7\xa6\xab\
+\x77\x8f\x00\x55\x7d\x0a\xe0\xae\xd1\xab\x65\x11\x59\x32\xda\xee\
+\x4a\xb3\x14\x00\x1b\x00\x0e\x1b\xa3\xb5\x26\x22\x27\x8c\xb6\xbb\
+\xd2\x2c\x05\xc0\x0f\x00\x87\xac\xd1\x12\x11\x77\x1d\xd6\xb2\xc7\
+\x60\xe7\x0e\x8e\x73\x0a\x02\x01\xcc\xef\x26\x29\x00\xf6\x01\x78\
+\x0b\xe0\xa2\xa5\x07\x12\x40\x61\x00\x5d\xc5\xa9\xaa\xce\xfa\x37\
+\x02\x20\x00\xcb\x40\xad\x66\xe3\x9e\x82\x38\x02\xca\xb2\x22\x80\
+\xb2\xf1\x74\x97\x46\x00\xee\x90\x95\xfd\x01\x01\x94\x8d\xa7\xbb\
+\xb4\x26\x01\xa8\xea\x49\x00\xcb\x00\x2e\x00\x38\xe8\xf6\xaa\xdf\
+\x1f\xfc\x04\xf0\x1e\xc0\x92\x88\xac\x7b\xab\x6e\x0e\x80\xaa\x1e\
+\x07\xf0\xd9\x91\xee\xf0\xfa\xbc\x28\xfb\x90\xa2\x39\xeb\x85\xd0\
+\x22\x80\xd7\x00\xae\x2e\x2a\x4a\x0b\x2e\x77\x45\x44\x6e\x79\xea\
+\x68\x11\xc0\x6f\x00\xe1\xb4\x3d\xc4\x6f\x55\x44\x4e\x79\x1a\xde\
+\x22\x80\x30\x8f\x76\xdd\x33\x78\x7c\xab\x61\xeb\xce\xfe\xb6\x08\
+\xe0\x15\x80\x6b\x35\xa2\x57\xa0\xce\xe7\x22\x72\xdb\x53\x4e\x8b\
+\x00\x8e\x01\xf8\x04\x20\x2c\xc6\x43\xfa\x56\x01\x9c\x13\x91\x90\
+\xae\x37\x7f\xcd\x01\x08\x2d\x57\xd5\x3d\x00\xee\x03\xb8\x09\xe0\
+\xb4\xd9\x9b\x3a\x86\x5f\x01\xbc\x04\xf0\x58\x44\xfe\x7a\x9b\xd0\
+\x24\x00\xaf\x13\x43\xb6\x2f\x09\x60\xd6\x4d\xd9\x86\x88\x0c\x75\
+\x41\xed\x85\x6b\x49\x00\xb3\x2e\xeb\x79\x29\x1f\xc1\x58\x12\xc0\
+\xf4\x4d\xd9\xbb\xcd\x13\xed\x65\xca\x52\xe6\x13\x28\x06\xa0\x97\
+\xf1\x3a\xc2\x4a\x08\xa0\x32\x54\x02\x20\x80\xca\x11\xa8\x5c\xbd\
+\x7b\x04\x18\xb5\xa1\x3b\xdd\x0a\xf9\xf2\x0f\x00\xee\x6d\xca\x14\
+\xd7\x2a\xfb\xdb\x5c\xf5\x29\x00\x3c\xda\xd0\x9d\x0e\x87\x7c\xf9\
+\x19\x11\x09\xc2\x5d\x7e\xdb\x11\x48\x01\xe0\x92\x26\x4e\x45\xda\
+\x9d\x2f\x1f\x3b\xa9\xbe\x01\xb8\xf3\xe5\x04\x30\x15\x01\xaf\x36\
+\x74\x3a\x80\x54\xca\x4d\x46\x24\x65\x04\xb8\xb4\xa1\x04\x50\xe9\
+\x24\x4c\xad\xa8\x6d\xf2\x74\x8f\x00\x5b\xb1\x5b\x39\x7d\x8a\x75\
+\x0d\xc1\x6a\x12\x00\x75\x41\x11\x72\x39\x01\x8a\x2d\xc2\xd4\x05\
+\xc5\x83\x9f\x25\x9c\x32\x00\xe0\xa5\xfc\x3c\x06\xaa\x9a\x23\x9c\
+\xfa\x26\x22\x41\x76\xd8\xf9\xa9\x6a\x48\x5d\x1c\x30\x4c\x9f\x2d\
+\x9a\xb8\xcf\x39\xee\x35\x40\x55\x43\x2a\xe1\x48\xa2\xf7\x51\xd9\
+\x86\xaa\x0e\x59\x17\x14\xed\x60\xff\x6d\xcb\xbd\x81\xec\xda\xdd\
+\x18\xca\x09\xb2\x8d\xf3\xb1\x5c\x90\xaa\x06\x85\xc1\x75\x43\x79\
+\x2d\x9a\x44\x3b\x58\x0d\x00\x5f\x00\x84\x69\xcb\x24\xdb\x50\xd5\
+\xf0\x77\xc5\x1f\x07\xaa\x0b\x8a\x76\xb0\x85\x01\x88\x2d\xae\x9e\
+\xee\x4a\x5d\xd0\xfc\x45\x92\x07\x2c\x4f\x6f\x8a\xd8\xa6\x2c\xc2\
+\x04\xd0\x22\x80\x48\x9b\xf8\x7a\x4a\x47\x80\x8a\x8d\x00\x63\xa7\
+\xa0\x50\x6b\x2a\x50\x7d\x03\x58\x17\x91\xa1\xa9\x9e\x8d\x7d\x2b\
+\xcd\x2c\x05\x40\xce\x95\x24\xb5\xa2\x05\x46\x40\xea\xa5\x7c\xa8\
+\x9a\x53\x50\x01\x00\xa9\x37\x62\xd4\x8a\xce\x98\xa5\xdc\x53\x50\
+\xda\x4c\xc7\x5f\x75\x45\x80\x00\x2a\xf7\x0d\x02\x20\x80\xca\x11\
+\xa8\x5c\xbd\x7b\x04\x50\x1b\x5a\x96\x58\x0a\x80\xd4\x6d\x28\xb5\
+\xa1\x25\x76\x41\xaa\x9a\x73\x10\xa3\x36\xb4\xc0\x39\x20\x07\x80\
+\xfb\xce\xb4\xec\x80\x6f\xaf\xb4\x3e\xa7\xa0\x2d\xef\x2d\x17\x37\
+\x39\xb2\x97\x0a\x21\xee\xf7\xbd\x20\x55\x4d\x3d\x09\x9b\x00\x50\
+\x17\x54\xa8\x0b\xa5\x4a\x13\x33\x65\x2f\x85\x5a\x9f\x5c\x8c\x7b\
+\x8d\x73\x4f\x41\xd6\xa6\x65\x00\xe0\x7b\x41\xd6\x20\xcf\xb3\xeb\
+\x00\x10\x7d\x4f\x67\xe0\xba\xa0\xa8\x7f\xd3\x31\xcb\x1e\x01\xdb\
+\x07\xb3\x87\x00\xae\x18\x1e\x5a\x7a\x26\x22\x77\x22\xe0\x5e\x00\
+\xb8\x51\xa2\x13\x54\x28\x23\xea\xdf\x22\x00\x58\x0f\x66\xa6\xf7\
+\x74\x54\x95\xef\x05\x79\x7a\x8e\xaa\xfe\x02\xb0\x7f\xce\x6f\xdc\
+\xef\xe9\x50\x17\xe4\x20\xa0\xaa\xb1\xff\x51\x23\x6b\x9f\xec\x68\
+\xca\x20\x4d\x4b\xac\x01\xd6\x29\x28\xe9\x5d\xcd\x41\x46\xd5\xd1\
+\xe8\x12\x00\x3c\x07\x33\xb7\x78\xd5\xe1\xcb\x20\x4d\xb3\x01\x74\
+\x79\xdd\xb1\x0d\x65\x2e\x28\x37\x19\x67\xed\x66\xa9\x07\x31\x6b\
+\xf9\x63\xb1\xeb\x7b\x04\x98\x92\x71\x63\x09\xae\xc5\x0f\x37\x80\
+\x84\x1b\xb1\x89\x76\x58\xb2\xa1\x96\x86\x8f\xc5\x26\x05\x80\x75\
+\xd7\x33\x33\x46\x04\x30\x19\x96\x14\x00\xb1\x7d\xff\xbc\xce\xe9\
+\xfe\x1b\xaa\xb1\xf4\xf4\x2e\x3f\xfa\x06\xc0\x6d\x68\xee\x2e\x28\
+\xe3\xb5\x14\x53\x2e\x68\xec\x3d\x3e\x3b\x19\x97\x70\x23\x16\x72\
+\x41\x2b\x00\x9e\xa4\xbc\xad\x3c\x76\x20\xee\x29\x68\xec\x01\xe9\
+\xdb\x3f\x02\xe8\x3b\xe2\xb9\x6b\x40\xe5\xf6\x8e\xae\x7a\x8e\x80\
+\xca\x48\x09\x80\x00\x2a\x47\xa0\x72\xf5\x1c\x01\x04\x50\x39\x02\
+\x95\xab\xff\x07\x15\xad\xe6\x70\x04\x41\xa8\x49\x00\x00\x00\x00\
+\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x03\x4a\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x60\x00\x00\x00\x60\x08\x06\x00\x00\x00\xe2\x98\x77\x38\
+\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x03\
+\x04\x49\x44\x41\x54\x78\x5e\xed\x9b\x41\x4e\x1d\x41\x0c\x44\xeb\
+\x9f\x82\x28\x5c\x83\x75\x8e\x90\xac\xc2\x21\x61\x05\x47\x60\x9d\
+\x6b\x24\x4a\x4e\x11\x34\x02\xa4\xbf\x80\xdf\x2e\x9b\x92\xc7\x9a\
+\x62\x8b\xdb\x9e\x79\x6f\xfa\x8f\xd4\xa5\x39\xc1\x7f\xad\x04\x4e\
+\xad\xd3\x3d\x1c\x16\xd0\xfc\x10\x58\x80\x05\x34\x13\x68\x1e\xef\
+\x1d\x60\x01\xcd\x04\x9a\xc7\x7b\x07\x58\x40\x33\x81\xe6\xf1\xde\
+\x01\x16\xd0\x4c\xa0\x79\xbc\x77\xc0\x60\x01\x0f\x00\x6e\x00\x7c\
+\x6d\xbe\x87\xee\xf1\x7f\x00\xfc\x02\xf0\x23\x73\x21\xd9\x1d\xf0\
+\x3f\x33\xec\x00\x6b\x68\x9e\xf4\x02\x00\x77\x00\x7e\x1e\x00\x66\
+\xe6\x16\xef\x01\xdc\x32\x0b\x33\x02\xfe\x02\xb8\x62\x86\x1c\xa8\
+\xf6\x1f\x80\x2f\xcc\xfd\x66\x04\xfc\xf6\xef\xfe\x87\x88\xb7\xf7\
+\xc1\xb5\x5a\xc0\xf6\xf2\xfd\xce\x0c\x39\x50\xed\x23\xfb\x32\xce\
+\xec\x80\x8d\xa7\x5f\xc2\xef\x3f\x55\x34\x4f\x7a\xc1\xd9\xdc\xed\
+\x65\xfc\xcd\xef\x03\x6c\xbf\xfb\x4f\xec\xcb\xf7\x8d\x63\x45\xc0\
+\x81\x7e\x59\x74\xb7\x6a\x01\x3a\xb6\xa1\xce\x16\x10\xc2\xa4\x2b\
+\xb2\x00\x1d\xdb\x50\x67\x0b\x08\x61\xd2\x15\x59\x80\x8e\x6d\xa8\
+\xb3\x05\x84\x30\xe9\x8a\x2c\x40\xc7\x36\xd4\xb9\x22\x60\x4a\x1e\
+\x50\x3a\xaf\x0f\x51\x2c\x14\x65\x05\x4c\x3d\x8a\xc8\xde\x6f\x01\
+\xf1\xe5\xa5\x99\x0b\x9a\x9c\x07\xd0\xe7\xf5\x32\xf2\xaf\x8d\x33\
+\x02\x26\xe7\x01\xf4\x79\xfd\x1e\x05\x4c\xce\x03\xe8\xf3\xfa\x3d\
+\x0a\x98\x9c\x07\xd0\xe7\xf5\x7b\x14\x30\x39\x0f\xc8\xfc\xe4\x4a\
+\x1d\x54\x2e\x68\x4a\x1e\x50\x3a\xaf\x97\xd2\x07\xfc\x85\x8c\x1a\
+\xf0\xaa\x7f\x65\x07\xac\x7a\xfb\xff\x01\x02\x16\x10\x80\xa4\x2c\
+\xb1\x00\x25\xdd\x40\x6f\x0b\x08\x40\x52\x96\x58\x80\x92\x6e\xa0\
+\xb7\x05\x04\x20\x29\x4b\x2c\x40\x49\x37\xd0\xbb\x22\x60\x4a\x1e\
+\x10\xc0\x50\x2a\x29\xe5\x0d\x59\x01\x53\xf3\x80\x12\xe9\xc0\x62\
+\x9a\x27\xbd\xc0\xdf\x07\x5c\xd4\x40\xe7\x0d\x19\x01\x93\xf3\x80\
+\xc0\x43\x5c\x2a\xa1\xf3\x86\x8c\x80\xc9\x79\x40\x89\x6e\x60\x31\
+\x9d\x37\x64\x04\x4c\xce\x03\x02\x0c\x4b\x25\x74\xde\x90\x11\x30\
+\x39\x0f\x28\xd1\x0d\x2c\xa6\x79\xd2\x0b\xce\x2e\x62\x4a\x1e\x10\
+\xe0\x56\x2a\x29\xe5\x0d\x15\x01\xa5\xab\xf6\xe2\x17\x02\x16\xd0\
+\xfc\x24\x58\x80\x05\x34\x13\x68\x1e\xef\x1d\x60\x01\xcd\x04\x9a\
+\xc7\x7b\x07\x58\x40\x33\x81\xe6\xf1\x95\x1d\x30\x25\x0f\x28\x9d\
+\xd7\xab\xfd\x64\x05\x4c\xcd\x03\xb2\xf7\x2b\xf3\x90\xb9\x20\x7f\
+\x1f\xf0\x89\x3a\x32\x02\x26\xe7\x01\xf4\x79\xfd\x27\xb2\x7e\xb7\
+\x55\x46\xc0\xe4\x3c\x80\x3e\xaf\xdf\xa3\x80\xc9\x79\x00\x7d\x5e\
+\xbf\x47\x01\x93\xf3\x80\xcc\x8e\x97\x3a\xa8\x5c\xd0\x94\x3c\xa0\
+\x74\x5e\x2f\xa5\xef\xe3\x68\x35\xde\x75\xff\xca\x0e\x58\x77\x77\
+\xc5\x92\x80\x05\x2c\x11\x69\x0b\x2c\x40\xcb\x77\xd9\xdd\x02\x96\
+\x88\xb4\x05\x16\xa0\xe5\xbb\xec\x6e\x01\x4b\x44\xda\x02\x0b\xd0\
+\xf2\x5d\x76\xaf\x08\x98\x92\x07\x2c\x21\x14\x0b\x4a\x79\x43\x56\
+\xc0\xd4\x3c\xa0\xc8\x7a\xb9\x9c\xe6\x49\x2f\xf0\xf7\x01\x17\x25\
+\xf8\xfb\x80\xe5\x33\xaa\x2d\xa0\xf3\x86\xcc\x0e\x98\x9c\x07\x68\
+\xf1\x03\x74\xde\x90\x11\x30\x39\x0f\x50\x0b\xa0\xf3\x86\x8c\x80\
+\xc9\x79\x80\x5a\x00\xcd\x93\x5e\x70\x76\x07\x53\xf2\x00\x35\xf4\
+\x52\xde\x50\x11\xa0\xbe\xb1\x43\xf4\xb7\x80\x66\xcd\x16\x60\x01\
+\xcd\x04\x9a\xc7\x7b\x07\x58\x40\x33\x81\xe6\xf1\xde\x01\x16\xd0\
+\x4c\xa0\x79\xbc\x77\x80\x05\x34\x13\x68\x1e\xef\x1d\x60\x01\xcd\
+\x04\x9a\xc7\x3f\x03\xae\x9f\x50\x61\xb0\x8e\xd5\x1e\x00\x00\x00\
+\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x03\x68\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x60\x00\x00\x00\x60\x08\x06\x00\x00\x00\xe2\x98\x77\x38\
+\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x03\
+\x22\x49\x44\x41\x54\x78\x5e\xed\x9b\x31\x8e\x14\x41\x0c\x45\xbf\
+\x2f\x01\x88\x23\xc0\x11\x40\x48\x24\x48\x24\x90\x11\x00\x37\x40\
+\xc0\x59\x20\xe0\x04\x90\x40\x44\xc2\x8a\x8c\x84\x8c\x84\x90\x03\
+\x80\x40\xdc\x01\xa3\x91\x7a\x83\xd1\xaa\xe9\x29\xdb\x2a\xcf\xa0\
+\xb7\xe9\x96\xed\xae\xff\xda\xae\xea\x2a\x8f\x89\xbf\x56\x05\xac\
+\x35\x3a\xc1\x05\x80\xe6\x97\x00\x00\x00\x68\x56\xa0\x39\x3c\x19\
+\x00\x80\x66\x05\x9a\xc3\x93\x01\x00\x68\x56\xa0\x39\x3c\x19\x00\
+\x80\x66\x05\x9a\xc3\x93\x01\x00\x68\x56\xa0\x39\x3c\x19\x00\x80\
+\x66\x05\x9a\xc3\x93\x01\xa7\x0e\xc0\xdd\x6f\x48\x7a\x28\xe9\x9a\
+\xa4\xeb\x92\xfe\x48\xfa\x2a\xe9\x9b\xa4\x33\x33\x3b\x6b\x9e\xe3\
+\x51\x87\x4f\x65\x80\xbb\x3f\x93\xf4\x62\x63\x86\x6f\xcc\xec\xf1\
+\x51\xab\xd0\xf8\x70\x61\x00\xee\xee\x23\xcf\x6d\x66\xe1\x58\x23\
+\x71\x4e\x6d\x6c\x48\x14\x77\x7f\x2d\xe9\xd1\xe0\x64\x9f\x9b\xd9\
+\xcb\x41\x9b\xff\x7e\xf8\x30\x00\x77\xbf\x2b\xe9\x43\x50\x99\x9b\
+\x66\xf6\xf9\x10\x5b\x77\x7f\x2b\xe9\x96\xa4\xcb\x87\x8c\x6f\x1c\
+\xf3\x43\xd2\x17\x33\xbb\x1f\x79\x86\x08\x80\xdd\x5b\xfc\x34\x12\
+\x4c\xd2\x2b\x33\x7b\xb2\x65\x3b\x5a\xde\xb6\xfc\xcd\xfa\x7f\xa4\
+\xcc\x46\x00\x7c\x94\x74\x27\x38\xa9\x4f\x66\x76\xfb\x5f\xb6\xee\
+\xfe\x5e\xd2\xbd\xa0\xff\x6e\xb3\x77\x66\xf6\x60\xe4\x21\x22\x00\
+\x7e\x26\xca\xc2\x6f\x33\xbb\xb4\x01\xe0\xbb\xa4\xab\x23\x93\x38\
+\xa2\xb1\xbf\xcc\xec\xca\xc8\xf3\x00\x60\x44\xad\xed\xb1\x53\x00\
+\x50\x82\xd6\x41\x4c\x29\x41\x2c\xc2\x2b\x00\x66\x2d\xc2\x6c\x43\
+\xf7\x01\xcc\xdd\x86\xee\x62\xf3\x21\xb6\xbd\x18\x1c\x3a\x62\x78\
+\x11\x3e\x77\x3c\xba\x57\x8f\xa4\xe7\xa1\x93\x38\xe5\x71\x61\x00\
+\x4b\x26\x70\x18\x97\xa4\x9f\x02\xb0\x40\xe0\x38\x3a\x01\x21\x0d\
+\x20\x11\x1b\x53\x89\xf6\xf4\xee\xb7\x80\x0c\x68\x26\x00\x00\x00\
+\x34\x2b\xd0\x1c\x9e\x0c\x00\x40\xb3\x02\xcd\xe1\xc9\x80\x53\x07\
+\x40\x5f\x50\x8e\x60\x2a\x03\xe8\x0b\xca\x89\xbf\xb3\x0e\x03\xe0\
+\x30\x2e\x2f\x7e\x18\x00\xc7\xd1\x35\xe2\x87\x00\xd0\x17\x74\x41\
+\xfc\xb9\x17\x32\xee\xce\x95\x64\xf3\x95\x24\x97\xf2\xeb\x15\x68\
+\xca\xa5\x3c\x7d\x41\xeb\x00\xa6\xb4\xa5\x00\xa0\x19\x00\x25\xa8\
+\xb9\x04\xb1\x08\x37\x2f\xc2\xf4\x05\xed\x03\x98\xbb\x0d\x5d\x2e\
+\xe2\xf9\x81\x46\xd1\xb7\x18\x47\x11\x45\x42\x46\xdd\x84\x01\x2c\
+\x99\x40\x5f\x50\x54\xf9\xc5\x2e\x05\x60\x81\x40\x5f\x50\x02\x42\
+\x1a\x40\x22\x36\xa6\x99\xe3\x68\xd4\xab\x51\x80\x0c\xa8\xd1\x31\
+\xec\x05\x00\x61\xe9\x6a\x0c\x01\x50\xa3\x63\xd8\x0b\x00\xc2\xd2\
+\xd5\x18\x02\xa0\x46\xc7\xb0\x17\x00\x84\xa5\xab\x31\x4c\x03\xa0\
+\x2f\x28\x07\x22\x05\x80\xbe\xa0\x9c\xf8\x3b\xeb\x30\x00\xfa\x82\
+\xf2\xe2\x87\x01\xd0\x17\x54\x23\x7e\x08\x00\x7d\x41\x17\xc4\x9f\
+\x7b\x21\x43\x5f\xd0\xfa\xdb\x1f\xf9\x2d\xf4\xf0\x1a\xe0\xee\x5c\
+\xca\xaf\x33\xa0\x2f\xa8\xae\x3a\x87\x3c\xd1\x17\x14\x92\xad\xce\
+\x68\x0a\x00\x4a\x50\x73\x09\xa2\x2f\x68\x05\xc0\xac\x45\x98\xbe\
+\xa0\x7d\x00\x73\xb7\xa1\xbb\xd8\x7c\x88\xd5\x2d\x1a\xc3\xdb\xd0\
+\xf3\xd0\x1c\x45\xd4\x40\x08\x03\x58\x32\x81\xbe\xa0\x24\x87\x14\
+\x80\x05\x02\x7d\x41\x09\x08\x69\x00\x89\xd8\x98\x66\x8e\xa3\x51\
+\xaf\x46\x01\x32\xa0\x46\xc7\xb0\x17\x00\x84\xa5\xab\x31\x04\x40\
+\x8d\x8e\x61\x2f\x00\x08\x4b\x57\x63\x08\x80\x1a\x1d\xc3\x5e\x00\
+\x10\x96\xae\xc6\x10\x00\x35\x3a\x86\xbd\x00\x20\x2c\x5d\x8d\x21\
+\x00\x6a\x74\x0c\x7b\x01\x40\x58\xba\x1a\x43\x00\xd4\xe8\x18\xf6\
+\x02\x80\xb0\x74\x35\x86\x00\xa8\xd1\x31\xec\x05\x00\x61\xe9\x6a\
+\x0c\xff\x02\xb8\x8b\x74\x70\x1f\x6e\x14\x8e\x00\x00\x00\x00\x49\
+\x45\x4e\x44\xae\x42\x60\x82\
+"
+
+qt_resource_name = b"\
+\x00\x05\
+\x00\x6f\xa6\x53\
+\x00\x69\
+\x00\x63\x00\x6f\x00\x6e\x00\x73\
+\x00\x06\
+\x07\xac\x02\xc3\
+\x00\x73\
+\x00\x74\x00\x79\x00\x6c\x00\x65\x00\x73\
+\x00\x09\
+\x00\x28\xad\x23\
+\x00\x73\
+\x00\x74\x00\x79\x00\x6c\x00\x65\x00\x2e\x00\x71\x00\x73\x00\x73\
+\x00\x0e\
+\x01\x06\x97\x43\
+\x00\x64\
+\x00\x61\x00\x72\x00\x6b\x00\x5f\x00\x73\x00\x74\x00\x79\x00\x6c\x00\x65\x00\x2e\x00\x71\x00\x73\x00\x73\
+\x00\x08\
+\x00\x47\x5a\xe7\
+\x00\x66\
+\x00\x69\x00\x6e\x00\x64\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x09\
+\x00\x57\xb8\x67\
+\x00\x70\
+\x00\x72\x00\x69\x00\x6e\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0d\
+\x00\xb6\x79\x67\
+\x00\x64\
+\x00\x61\x00\x72\x00\x6b\x00\x5f\x00\x6d\x00\x6f\x00\x64\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0f\
+\x02\x3e\x26\x07\
+\x00\x61\
+\x00\x6c\x00\x69\x00\x67\x00\x6e\x00\x5f\x00\x72\x00\x69\x00\x67\x00\x68\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0d\
+\x02\x87\x1d\xa7\
+\x00\x66\
+\x00\x69\x00\x6e\x00\x64\x00\x5f\x00\x64\x00\x61\x00\x72\x00\x6b\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0a\
+\x02\xfc\x42\x47\
+\x00\x69\
+\x00\x74\x00\x61\x00\x6c\x00\x69\x00\x63\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x09\
+\x03\x65\x83\x87\
+\x00\x63\
+\x00\x6f\x00\x6c\x00\x6f\x00\x72\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x12\
+\x03\x99\x8e\x67\
+\x00\x75\
+\x00\x6e\x00\x64\x00\x65\x00\x72\x00\x6c\x00\x69\x00\x6e\x00\x65\x00\x5f\x00\x64\x00\x61\x00\x72\x00\x6b\x00\x2e\x00\x70\x00\x6e\
+\x00\x67\
+\x00\x08\
+\x04\xb2\x58\xc7\
+\x00\x75\
+\x00\x6e\x00\x64\x00\x6f\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0b\
+\x05\x03\x9b\x27\
+\x00\x7a\
+\x00\x6f\x00\x6f\x00\x6d\x00\x5f\x00\x69\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x08\
+\x05\xab\x5a\x27\
+\x00\x64\
+\x00\x6f\x00\x63\x00\x78\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x08\
+\x06\x27\x5a\x67\
+\x00\x62\
+\x00\x6f\x00\x6c\x00\x64\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x10\
+\x06\x54\x14\x07\
+\x00\x61\
+\x00\x6c\x00\x69\x00\x67\x00\x6e\x00\x5f\x00\x63\x00\x65\x00\x6e\x00\x74\x00\x65\x00\x72\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x07\
+\x06\xa9\x57\xa7\
+\x00\x70\
+\x00\x64\x00\x66\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x08\
+\x06\xc1\x59\x87\
+\x00\x6f\
+\x00\x70\x00\x65\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0c\
+\x06\xeb\x91\xa7\
+\x00\x7a\
+\x00\x6f\x00\x6f\x00\x6d\x00\x5f\x00\x6f\x00\x75\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0f\
+\x06\xff\xa4\x27\
+\x00\x62\
+\x00\x75\x00\x6c\x00\x6c\x00\x65\x00\x74\x00\x5f\x00\x6c\x00\x69\x00\x73\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0c\
+\x07\x6f\x9c\xa7\
+\x00\x61\
+\x00\x70\x00\x70\x00\x5f\x00\x69\x00\x63\x00\x6f\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x11\
+\x08\x67\x1d\x07\
+\x00\x6e\
+\x00\x75\x00\x6d\x00\x62\x00\x65\x00\x72\x00\x65\x00\x64\x00\x5f\x00\x6c\x00\x69\x00\x73\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\
+\x00\x08\
+\x08\xc8\x58\x67\
+\x00\x73\
+\x00\x61\x00\x76\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0f\
+\x08\xd4\xbe\xa7\
+\x00\x69\
+\x00\x74\x00\x61\x00\x6c\x00\x69\x00\x63\x00\x5f\x00\x64\x00\x61\x00\x72\x00\x6b\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0d\
+\x08\xd5\xc4\xe7\
+\x00\x75\
+\x00\x6e\x00\x64\x00\x65\x00\x72\x00\x6c\x00\x69\x00\x6e\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0d\
+\x0a\x4b\x1d\xa7\
+\x00\x62\
+\x00\x6f\x00\x6c\x00\x64\x00\x5f\x00\x64\x00\x61\x00\x72\x00\x6b\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0e\
+\x0a\x89\x01\xe7\
+\x00\x70\
+\x00\x72\x00\x69\x00\x6e\x00\x74\x00\x5f\x00\x64\x00\x61\x00\x72\x00\x6b\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x12\
+\x0a\x9d\x79\xc7\
+\x00\x64\
+\x00\x61\x00\x72\x00\x6b\x00\x5f\x00\x6d\x00\x6f\x00\x64\x00\x65\x00\x5f\x00\x64\x00\x61\x00\x72\x00\x6b\x00\x2e\x00\x70\x00\x6e\
+\x00\x67\
+\x00\x08\
+\x0b\xb2\x58\x47\
+\x00\x72\
+\x00\x65\x00\x64\x00\x6f\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x08\
+\x0c\x33\x5a\x87\
+\x00\x68\
+\x00\x65\x00\x6c\x00\x70\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x15\
+\x0c\x49\x74\x67\
+\x00\x61\
+\x00\x6c\x00\x69\x00\x67\x00\x6e\x00\x5f\x00\x63\x00\x65\x00\x6e\x00\x74\x00\x65\x00\x72\x00\x5f\x00\x64\x00\x61\x00\x72\x00\x6b\
+\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x14\
+\x0c\xcc\x32\x27\
+\x00\x61\
+\x00\x6c\x00\x69\x00\x67\x00\x6e\x00\x5f\x00\x72\x00\x69\x00\x67\x00\x68\x00\x74\x00\x5f\x00\x64\x00\x61\x00\x72\x00\x6b\x00\x2e\
+\x00\x70\x00\x6e\x00\x67\
+\x00\x13\
+\x0d\x4a\x8e\xc7\
+\x00\x61\
+\x00\x6c\x00\x69\x00\x67\x00\x6e\x00\x5f\x00\x6c\x00\x65\x00\x66\x00\x74\x00\x5f\x00\x64\x00\x61\x00\x72\x00\x6b\x00\x2e\x00\x70\
+\x00\x6e\x00\x67\
+\x00\x16\
+\x0d\x83\x15\x47\
+\x00\x6e\
+\x00\x75\x00\x6d\x00\x62\x00\x65\x00\x72\x00\x65\x00\x64\x00\x5f\x00\x6c\x00\x69\x00\x73\x00\x74\x00\x5f\x00\x64\x00\x61\x00\x72\
+\x00\x6b\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0e\
+\x0e\x2b\xc1\x07\
+\x00\x61\
+\x00\x6c\x00\x69\x00\x67\x00\x6e\x00\x5f\x00\x6c\x00\x65\x00\x66\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x14\
+\x0e\x54\x02\x67\
+\x00\x62\
+\x00\x75\x00\x6c\x00\x6c\x00\x65\x00\x74\x00\x5f\x00\x6c\x00\x69\x00\x73\x00\x74\x00\x5f\x00\x64\x00\x61\x00\x72\x00\x6b\x00\x2e\
+\x00\x70\x00\x6e\x00\x67\
+"
+
+qt_resource_struct_v1 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x21\x00\x00\x00\x05\
+\x00\x00\x00\x10\x00\x02\x00\x00\x00\x02\x00\x00\x00\x03\
+\x00\x00\x00\x22\x00\x01\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x00\x3a\x00\x01\x00\x00\x00\x01\x00\x00\x03\x47\
+\x00\x00\x00\x5c\x00\x00\x00\x00\x00\x01\x00\x00\x06\x9a\
+\x00\x00\x00\x72\x00\x00\x00\x00\x00\x01\x00\x00\x0f\x49\
+\x00\x00\x00\x8a\x00\x00\x00\x00\x00\x01\x00\x00\x13\xb8\
+\x00\x00\x00\xaa\x00\x00\x00\x00\x00\x01\x00\x00\x1c\x1c\
+\x00\x00\x00\xce\x00\x00\x00\x00\x00\x01\x00\x00\x1f\x21\
+\x00\x00\x00\xee\x00\x00\x00\x00\x00\x01\x00\x00\x27\x7e\
+\x00\x00\x01\x08\x00\x00\x00\x00\x00\x01\x00\x00\x2b\xb8\
+\x00\x00\x01\x20\x00\x00\x00\x00\x00\x01\x00\x00\x35\x8c\
+\x00\x00\x01\x4a\x00\x00\x00\x00\x00\x01\x00\x00\x3b\x29\
+\x00\x00\x01\x60\x00\x00\x00\x00\x00\x01\x00\x00\x40\xa8\
+\x00\x00\x01\x7c\x00\x00\x00\x00\x00\x01\x00\x00\x4b\xaf\
+\x00\x00\x01\x92\x00\x00\x00\x00\x00\x01\x00\x00\x50\x33\
+\x00\x00\x01\xa8\x00\x00\x00\x00\x00\x01\x00\x00\x55\x3e\
+\x00\x00\x01\xce\x00\x00\x00\x00\x00\x01\x00\x00\x58\x7f\
+\x00\x00\x01\xe2\x00\x00\x00\x00\x00\x01\x00\x00\x5d\x83\
+\x00\x00\x01\xf8\x00\x00\x00\x00\x00\x01\x00\x00\x63\x36\
+\x00\x00\x02\x16\x00\x00\x00\x00\x00\x01\x00\x00\x6e\x01\
+\x00\x00\x02\x3a\x00\x00\x00\x00\x00\x01\x00\x00\x71\x0d\
+\x00\x00\x02\x58\x00\x00\x00\x00\x00\x01\x00\x01\x18\x9f\
+\x00\x00\x02\x80\x00\x00\x00\x00\x00\x01\x00\x01\x1d\x5a\
+\x00\x00\x02\x96\x00\x00\x00\x00\x00\x01\x00\x01\x23\x70\
+\x00\x00\x02\xba\x00\x00\x00\x00\x00\x01\x00\x01\x27\xe8\
+\x00\x00\x02\xda\x00\x00\x00\x00\x00\x01\x00\x01\x2d\x46\
+\x00\x00\x02\xfa\x00\x00\x00\x00\x00\x01\x00\x01\x32\x80\
+\x00\x00\x03\x1c\x00\x00\x00\x00\x00\x01\x00\x01\x37\x11\
+\x00\x00\x03\x46\x00\x00\x00\x00\x00\x01\x00\x01\x41\xc7\
+\x00\x00\x03\x5c\x00\x00\x00\x00\x00\x01\x00\x01\x46\xe7\
+\x00\x00\x03\x72\x00\x00\x00\x00\x00\x01\x00\x01\x4d\xd1\
+\x00\x00\x03\xa2\x00\x00\x00\x00\x00\x01\x00\x01\x50\xfa\
+\x00\x00\x03\xd0\x00\x00\x00\x00\x00\x01\x00\x01\x54\x0a\
+\x00\x00\x03\xfc\x00\x00\x00\x00\x00\x01\x00\x01\x57\x00\
+\x00\x00\x04\x2e\x00\x00\x00\x00\x00\x01\x00\x01\x5b\xcd\
+\x00\x00\x04\x50\x00\x00\x00\x00\x00\x01\x00\x01\x5f\x1b\
+"
+
+qt_resource_struct_v2 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x21\x00\x00\x00\x05\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x10\x00\x02\x00\x00\x00\x02\x00\x00\x00\x03\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x22\x00\x01\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\xa1\x4f\x65\x0a\x68\
+\x00\x00\x00\x3a\x00\x01\x00\x00\x00\x01\x00\x00\x03\x47\
+\x00\x00\x01\xa1\x4f\x65\x0a\x68\
+\x00\x00\x00\x5c\x00\x00\x00\x00\x00\x01\x00\x00\x06\x9a\
+\x00\x00\x01\x91\xdb\x12\x3f\xe0\
+\x00\x00\x00\x72\x00\x00\x00\x00\x00\x01\x00\x00\x0f\x49\
+\x00\x00\x01\x91\xdb\x12\x3f\xe0\
+\x00\x00\x00\x8a\x00\x00\x00\x00\x00\x01\x00\x00\x13\xb8\
+\x00\x00\x01\x91\xdb\x12\x3f\xe0\
+\x00\x00\x00\xaa\x00\x00\x00\x00\x00\x01\x00\x00\x1c\x1c\
+\x00\x00\x01\x91\xdb\x12\x3f\xe0\
+\x00\x00\x00\xce\x00\x00\x00\x00\x00\x01\x00\x00\x1f\x21\
+\x00\x00\x01\x91\xdb\x12\x3f\xe0\
+\x00\x00\x00\xee\x00\x00\x00\x00\x00\x01\x00\x00\x27\x7e\
+\x00\x00\x01\x91\xdb\x12\x3f\xe0\
+\x00\x00\x01\x08\x00\x00\x00\x00\x00\x01\x00\x00\x2b\xb8\
+\x00\x00\x01\x91\xdb\x12\x3f\xe0\
+\x00\x00\x01\x20\x00\x00\x00\x00\x00\x01\x00\x00\x35\x8c\
+\x00\x00\x01\x91\xdb\x12\x3f\xe0\
+\x00\x00\x01\x4a\x00\x00\x00\x00\x00\x01\x00\x00\x3b\x29\
+\x00\x00\x01\x91\xdb\x12\x3f\xe0\
+\x00\x00\x01\x60\x00\x00\x00\x00\x00\x01\x00\x00\x40\xa8\
+\x00\x00\x01\x91\xdb\x12\x3f\xe0\
+\x00\x00\x01\x7c\x00\x00\x00\x00\x00\x01\x00\x00\x4b\xaf\
+\x00\x00\x01\x91\xdb\x12\x3f\xe0\
+\x00\x00\x01\x92\x00\x00\x00\x00\x00\x01\x00\x00\x50\x33\
+\x00\x00\x01\x91\xdb\x12\x3f\xe0\
+\x00\x00\x01\xa8\x00\x00\x00\x00\x00\x01\x00\x00\x55\x3e\
+\x00\x00\x01\x91\xdb\x12\x3f\xe0\
+\x00\x00\x01\xce\x00\x00\x00\x00\x00\x01\x00\x00\x58\x7f\
+\x00\x00\x01\x91\xdb\x12\x3f\xe0\
+\x00\x00\x01\xe2\x00\x00\x00\x00\x00\x01\x00\x00\x5d\x83\
+\x00\x00\x01\x91\xdb\x12\x3f\xe0\
+\x00\x00\x01\xf8\x00\x00\x00\x00\x00\x01\x00\x00\x63\x36\
+\x00\x00\x01\x91\xdb\x12\x3f\xe0\
+\x00\x00\x02\x16\x00\x00\x00\x00\x00\x01\x00\x00\x6e\x01\
+\x00\x00\x01\x91\xdb\x12\x3f\xe0\
+\x00\x00\x02\x3a\x00\x00\x00\x00\x00\x01\x00\x00\x71\x0d\
+\x00\x00\x01\x91\xdb\x12\x3f\xe0\
+\x00\x00\x02\x58\x00\x00\x00\x00\x00\x01\x00\x01\x18\x9f\
+\x00\x00\x01\x91\xdb\x12\x3f\xe0\
+\x00\x00\x02\x80\x00\x00\x00\x00\x00\x01\x00\x01\x1d\x5a\
+\x00\x00\x01\x91\xdb\x12\x3f\xe0\
+\x00\x00\x02\x96\x00\x00\x00\x00\x00\x01\x00\x01\x23\x70\
+\x00\x00\x01\x91\xdb\x12\x3f\xe0\
+\x00\x00\x02\xba\x00\x00\x00\x00\x00\x01\x00\x01\x27\xe8\
+\x00\x00\x01\x91\xdb\x12\x3f\xe0\
+\x00\x00\x02\xda\x00\x00\x00\x00\x00\x01\x00\x01\x2d\x46\
+\x00\x00\x01\x91\xdb\x12\x3f\xe0\
+\x00\x00\x02\xfa\x00\x00\x00\x00\x00\x01\x00\x01\x32\x80\
+\x00\x00\x01\x91\xdb\x12\x3f\xe0\
+\x00\x00\x03\x1c\x00\x00\x00\x00\x00\x01\x00\x01\x37\x11\
+\x00\x00\x01\x91\xdb\x12\x3f\xe0\
+\x00\x00\x03\x46\x00\x00\x00\x00\x00\x01\x00\x01\x41\xc7\
+\x00\x00\x01\x91\xdb\x12\x3f\xe0\
+\x00\x00\x03\x5c\x00\x00\x00\x00\x00\x01\x00\x01\x46\xe7\
+\x00\x00\x01\x91\xdb\x12\x3f\xe0\
+\x00\x00\x03\x72\x00\x00\x00\x00\x00\x01\x00\x01\x4d\xd1\
+\x00\x00\x01\x91\xdb\x12\x3f\xe0\
+\x00\x00\x03\xa2\x00\x00\x00\x00\x00\x01\x00\x01\x50\xfa\
+\x00\x00\x01\x91\xdb\x12\x3f\xe0\
+\x00\x00\x03\xd0\x00\x00\x00\x00\x00\x01\x00\x01\x54\x0a\
+\x00\x00\x01\x91\xdb\x12\x3f\xe0\
+\x00\x00\x03\xfc\x00\x00\x00\x00\x00\x01\x00\x01\x57\x00\
+\x00\x00\x01\x91\xdb\x12\x3f\xe0\
+\x00\x00\x04\x2e\x00\x00\x00\x00\x00\x01\x00\x01\x5b\xcd\
+\x00\x00\x01\x91\xdb\x12\x3f\xe0\
+\x00\x00\x04\x50\x00\x00\x00\x00\x00\x01\x00\x01\x5f\x1b\
+\x00\x00\x01\x91\xdb\x12\x3f\xe0\
+"
+
+qt_version = [int(v) for v in QtCore.qVersion().split('.')]
+if qt_version < [5, 8, 0]:
+    rcc_version = 1
+    qt_resource_struct = qt_resource_struct_v1
+else:
+    rcc_version = 2
+    qt_resource_struct = qt_resource_struct_v2
+
+def qInitResources():
+    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
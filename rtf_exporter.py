@@ -0,0 +1,214 @@
+import re
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QTextCharFormat, QTextDocument, QTextFormat, QTextListFormat
+from document_io import report
+
+PROGRESS_INTERVAL = 500  # blocks between progress reports
+TWIPS_PER_PIXEL = 15  # 1440 twips per inch at 96 dpi
+
+ESCAPES = {ord('\\'): '\\\\', ord('{'): '\\{', ord('}'): '\\}', ord('\t'): '\\tab ',
+           ord('\u2028'): '\\line ', ord('\u00a0'): '\\~', ord('\ufffc'): ''}
+NON_ASCII = re.compile('[^\x00-\x7f]')
+
+ALIGNMENTS = {Qt.AlignHCenter: '\\qc', Qt.AlignRight: '\\qr', Qt.AlignJustify: '\\qj'}
+
+# QTextListFormat style -> (\levelnfc, bullet character)
+LIST_STYLES = {
+    QTextListFormat.ListDisc: (23, '\u2022'),
+    QTextListFormat.ListCircle: (23, 'o'),
+    QTextListFormat.ListSquare: (23, '\u25aa'),
+    QTextListFormat.ListDecimal: (0, None),
+    QTextListFormat.ListLowerAlpha: (4, None),
+    QTextListFormat.ListUpperAlpha: (3, None),
+    QTextListFormat.ListLowerRoman: (2, None),
+    QTextListFormat.ListUpperRoman: (1, None),
+}
+
+
+def escape_char(match):
+    code = ord(match.group())
+    if code > 0xFFFF:
+        # \u takes a signed 16-bit value, so astral characters go as a surrogate pair
+        code -= 0x10000
+        return escape_char_code(0xD800 + (code >> 10)) + escape_char_code(0xDC00 + (code & 0x3FF))
+    return escape_char_code(code)
+
+
+def escape_char_code(code):
+    return f'\\u{code - 0x10000 if code > 0x7FFF else code}?'
+
+
+def escape(text):
+    return NON_ASCII.sub(escape_char, text.translate(ESCAPES))
+
+
+class RtfWriter:
+    """Builds compact RTF from a document's blocks and fragments.
+
+    The body is written first while fonts, colors and lists are numbered
+    on first sight; the header tables are assembled from those afterwards.
+    Control words for a character format are computed once per format index.
+    """
+
+    def __init__(self, document):
+        self.document = document
+        self.fonts = {document.defaultFont().family(): 0}
+        self.colors = {}
+        self.lists = {}  # list objectIndex -> (number, style, level)
+        self.charControls = {}
+
+    def fontNumber(self, family):
+        number = self.fonts.get(family)
+        if number is None:
+            number = self.fonts[family] = len(self.fonts)
+        return number
+
+    def colorNumber(self, color):
+        rgb = (color.red(), color.green(), color.blue())
+        number = self.colors.get(rgb)
+        if number is None:
+            number = self.colors[rgb] = len(self.colors) + 1  # Entry 0 is the automatic color
+        return number
+
+    def charControl(self, index, char_format):
+        controls = self.charControls.get(index)
+        if controls is None:
+            parts = ['\\plain']
+            family = char_format.fontFamily()
+            parts.append(f'\\f{self.fontNumber(family) if family else 0}')
+            size = char_format.fontPointSize()
+            parts.append(f'\\fs{round((size or self.document.defaultFont().pointSizeF()) * 2)}')
+            if char_format.fontWeight() > QTextCharFormat().fontWeight():
+                parts.append('\\b')
+            if char_format.fontItalic():
+                parts.append('\\i')
+            if char_format.fontUnderline():
+                parts.append('\\ul')
+            if char_format.fontStrikeOut():
+                parts.append('\\strike')
+            if char_format.hasProperty(QTextFormat.ForegroundBrush):
+                parts.append(f'\\cf{self.colorNumber(char_format.foreground().color())}')
+            if char_format.hasProperty(QTextFormat.BackgroundBrush):
+                parts.append(f'\\chcbpat{self.colorNumber(char_format.background().color())}')
+            valign = char_format.verticalAlignment()
+            if valign == QTextCharFormat.AlignSuperScript:
+                parts.append('\\super')
+            elif valign == QTextCharFormat.AlignSubScript:
+                parts.append('\\sub')
+            controls = self.charControls[index] = ''.join(parts) + ' '
+        return controls
+
+    def paragraphControl(self, block):
+        block_format = block.blockFormat()
+        parts = ['\\pard']
+        alignment = ALIGNMENTS.get(int(block_format.alignment() & Qt.AlignHorizontal_Mask))
+        if alignment:
+            parts.append(alignment)
+        text_list = block.textList()
+        if text_list is not None:
+            number = self.listNumber(text_list)
+            level = self.lists[text_list.objectIndex()][2]
+            parts.append(f'\\ls{number}\\ilvl{level}\\li{(level + 1) * 720}\\fi-360')
+        else:
+            left = block_format.leftMargin() + block_format.indent() * self.document.indentWidth()
+            if left:
+                parts.append(f'\\li{round(left * TWIPS_PER_PIXEL)}')
+            if block_format.textIndent():
+                parts.append(f'\\fi{round(block_format.textIndent() * TWIPS_PER_PIXEL)}')
+        if block_format.topMargin():
+            parts.append(f'\\sb{round(block_format.topMargin() * TWIPS_PER_PIXEL)}')
+        if block_format.bottomMargin():
+            parts.append(f'\\sa{round(block_format.bottomMargin() * TWIPS_PER_PIXEL)}')
+        return ''.join(parts) + ' '
+
+    def listNumber(self, text_list):
+        key = text_list.objectIndex()
+        entry = self.lists.get(key)
+        if entry is None:
+            list_format = text_list.format()
+            entry = self.lists[key] = (len(self.lists) + 1, list_format.style(), max(list_format.indent() - 1, 0))
+        return entry[0]
+
+    def listText(self, block):
+        """Plain rendering of the list marker, for readers without list support."""
+        text_list = block.textList()
+        bullet = LIST_STYLES.get(text_list.format().style(), (0, None))[1]
+        marker = bullet if bullet else f'{text_list.itemNumber(block) + 1}.'
+        return f'{{\\listtext\\pard\\plain {escape(marker)}\\tab}}'
+
+    def body(self, progress=None):
+        document = self.document
+        block_count = document.blockCount()
+        parts = []
+        previous = None
+        block = document.begin()
+        while block.isValid():
+            number = block.blockNumber()
+            if number % PROGRESS_INTERVAL == 0:
+                report(progress, number * 90 // block_count)
+            if number:
+                parts.append('\\par\n')
+            parts.append(self.paragraphControl(block))
+            if block.textList() is not None:
+                parts.append(self.listText(block))
+            it = block.begin()
+            while not it.atEnd():
+                fragment = it.fragment()
+                if fragment.isValid():
+                    # Character formatting carries across \par, so only changes are written
+                    controls = self.charControl(fragment.charFormatIndex(), fragment.charFormat())
+                    if controls != previous:
+                        parts.append(controls)
+                        previous = controls
+                    parts.append(escape(fragment.text()))
+                it += 1
+            block = block.next()
+        return ''.join(parts)
+
+    def fontTable(self):
+        entries = ''.join(f'{{\\f{number}\\fnil {escape(family)};}}' for family, number in self.fonts.items())
+        return f'{{\\fonttbl{entries}}}'
+
+    def colorTable(self):
+        entries = ''.join(f'\\red{r}\\green{g}\\blue{b};' for r, g, b in self.colors)
+        return f'{{\\colortbl;{entries}}}'
+
+    def listTables(self):
+        if not self.lists:
+            return ''
+        lists = []
+        overrides = []
+        for number, style, level in self.lists.values():
+            nfc, bullet = LIST_STYLES.get(style, (0, None))
+            if bullet:
+                text = f"{{\\leveltext\\'01{escape(bullet)};}}{{\\levelnumbers;}}"
+            else:
+                text = "{\\leveltext\\'02\\'00.;}{\\levelnumbers\\'01;}"
+            # Every level up to the one used has the same format
+            levels = ''.join(f'{{\\listlevel\\levelnfc{nfc}\\levelstartat1{text}\\li{(i + 1) * 720}\\fi-360}}'
+                             for i in range(level + 1))
+            lists.append(f'{{\\list\\listtemplateid{number}{levels}\\listid{number}}}')
+            overrides.append(f'{{\\listoverride\\listid{number}\\listoverridecount0\\ls{number}}}')
+        return f"{{\\*\\listtable{''.join(lists)}}}{{\\*\\listoverridetable{''.join(overrides)}}}"
+
+    def write(self, progress=None):
+        body = self.body(progress)
+        return ''.join([
+            '{\\rtf1\\ansi\\ansicpg1252\\deff0\\uc1',
+            self.fontTable(),
+            self.colorTable(),
+            self.listTables(),
+            '\n',
+            body,
+            '}',
+        ])
+
+
+def export_to_rtf(text_edit, filename, progress=None):
+    """Write the document as RTF; accepts a QTextEdit or a bare QTextDocument."""
+    document = text_edit if isinstance(text_edit, QTextDocument) else text_edit.document()
+    rtf = RtfWriter(document).write(progress)
+    with open(filename, 'w', encoding='ascii', newline='') as file:
+        file.write(rtf)
+    report(progress, 100)
+    return filename
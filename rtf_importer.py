@@ -0,0 +1,491 @@
+import codecs
+import re
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QColor, QFont, QTextCharFormat, QTextCursor, QTextListFormat
+import formats
+from document_io import new_document, report, to_gui_thread
+
+PROGRESS_INTERVAL = 1 << 16  # tokens between progress reports
+TWIPS_PER_PIXEL = 15  # 1440 twips per inch at 96 dpi
+
+# One alternative per token kind: control word (with optional numeric
+# parameter and the single space that delimits it), hex escape, control
+# symbol, group brace, line break (ignored in RTF) and a run of plain text.
+TOKEN = re.compile(rb"\\([a-zA-Z]{1,32})(-?\d{1,10})? ?|\\'([0-9a-fA-F]{2})|\\(.)|([{}])|[\r\n]+|([^\\{}\r\n]+)",
+                   re.DOTALL)
+
+# Destinations whose contents are never shown in the body
+SKIPPED = {
+    'stylesheet', 'info', 'pict', 'object', 'shp', 'shpinst', 'nonshppict', 'fldinst',
+    'header', 'headerl', 'headerr', 'headerf', 'footer', 'footerl', 'footerr', 'footerf',
+    'footnote', 'annotation', 'themedata', 'colorschememapping', 'latentstyles', 'datastore',
+    'xmlnsdecl', 'rsidtbl', 'generator', 'filetbl', 'revtbl', 'listtext', 'pntext',
+    'bkmkstart', 'bkmkend', 'pgdsctbl', 'mmathPr', 'listpicture', 'xe', 'tc',
+}
+
+SPECIAL_CHARACTERS = {
+    'line': '\u2028', 'tab': '\t', 'cell': '\t', 'emdash': '\u2014', 'endash': '\u2013',
+    'bullet': '\u2022', 'lquote': '\u2018', 'rquote': '\u2019', 'ldblquote': '\u201c',
+    'rdblquote': '\u201d', 'emspace': '\u2003', 'enspace': '\u2002', 'qmspace': '\u2005',
+}
+SPECIAL_SYMBOLS = {'~': '\u00a0', '_': '\u2011', '\\': '\\', '{': '{', '}': '}'}
+PARAGRAPH_BREAKS = {'par', 'row', 'page', 'sect'}
+
+ALIGNMENTS = {'ql': Qt.AlignLeft, 'qc': Qt.AlignHCenter, 'qr': Qt.AlignRight, 'qj': Qt.AlignJustify}
+
+# \levelnfc number formats
+NUMBER_FORMATS = {
+    0: QTextListFormat.ListDecimal,
+    1: QTextListFormat.ListUpperRoman,
+    2: QTextListFormat.ListLowerRoman,
+    3: QTextListFormat.ListUpperAlpha,
+    4: QTextListFormat.ListLowerAlpha,
+    23: QTextListFormat.ListDisc,
+}
+
+CHARSET_CODECS = {
+    0: 'cp1252', 77: 'mac_roman', 128: 'cp932', 129: 'cp949', 134: 'gbk', 136: 'big5',
+    161: 'cp1253', 162: 'cp1254', 163: 'cp1258', 177: 'cp1255', 178: 'cp1256',
+    186: 'cp1257', 204: 'cp1251', 222: 'cp874', 238: 'cp1250',
+}
+
+CODEPAGE_CODECS = {  # \ansicpg numbers that aren't Python's cpN
+    10000: 'mac_roman', 10001: 'shift_jis', 10002: 'big5', 10003: 'euc_kr', 10006: 'mac_greek',
+    10007: 'mac_cyrillic', 10008: 'gb2312', 10029: 'mac_latin2', 10079: 'mac_iceland',
+    10081: 'mac_turkish', 10082: 'mac_croatian', 65001: 'utf-8',
+}
+
+
+def codepage_codec(codepage):
+    """The codec for an \\ansicpg number, or cp1252 if Python doesn't have one."""
+    codec = CODEPAGE_CODECS.get(codepage, f'cp{codepage}')
+    try:
+        codecs.lookup(codec)
+    except LookupError:
+        return 'cp1252'
+    return codec
+
+
+class State:
+    """Formatting in effect inside one RTF group."""
+    __slots__ = ('destination', 'font', 'size', 'bold', 'italic', 'underline', 'strike',
+                 'color', 'background', 'valign', 'uc', 'align', 'left', 'first',
+                 'before', 'after', 'listId', 'level')
+
+    def __init__(self, font=0):
+        self.destination = None
+        self.uc = 1
+        self.plain(font)
+        self.pard()
+
+    def plain(self, font):
+        self.font = font
+        self.size = 24  # half-points
+        self.bold = self.italic = self.underline = self.strike = False
+        self.color = self.background = 0
+        self.valign = QTextCharFormat.AlignNormal
+
+    def pard(self):
+        self.align = None
+        self.left = self.first = self.before = self.after = 0
+        self.listId = None
+        self.level = 0
+
+    def copy(self):
+        state = State.__new__(State)
+        for name in State.__slots__:
+            setattr(state, name, getattr(self, name))
+        return state
+
+    def charKey(self):
+        return (self.font, self.size, self.bold, self.italic, self.underline, self.strike,
+                self.color, self.background, self.valign)
+
+    def blockKey(self):
+        return (self.align, self.left, self.first, self.before, self.after)
+
+
+class RtfReader:
+    """Streaming RTF parser that writes straight into a QTextDocument.
+
+    Tokens are consumed in a single pass. Text is collected into runs and
+    only inserted when the character formatting changes or a paragraph
+    ends; formats are interned so each distinct combination is built once.
+    """
+
+    def __init__(self, document):
+        self.document = document
+        self.cursor = QTextCursor(document)
+        self.state = State()
+        self.stack = []
+        self.codepage = 'cp1252'
+        self.defaultFont = 0
+        self.fonts = {}  # number -> (family, codec)
+        self.fontName = []
+        self.fontNumber = 0
+        self.fontCodec = None
+        self.colors = []  # Entry 0 is normally empty: the automatic color
+        self.rgb = None
+        self.lists = {}  # \listid -> [style per level]
+        self.listLevels = None
+        self.overrides = {}  # \ls -> \listid
+        self.overrideList = None
+        self.activeLists = {}
+        self.charFormats = {}
+        self.blockFormats = {}
+        self.run = []
+        self.runKey = None
+        self.hexBytes = bytearray()
+        self.skipChars = 0
+        self.highSurrogate = None
+        self.blockHasContent = False
+        self.finished = False
+
+    # Text handling
+
+    def codec(self):
+        font = self.fonts.get(self.state.font)
+        return font[1] if font and font[1] else self.codepage
+
+    def flushHex(self):
+        if self.hexBytes:
+            data = bytes(self.hexBytes)
+            self.hexBytes.clear()
+            self.text(data.decode(self.codec(), errors='replace'))
+
+    def text(self, text):
+        destination = self.state.destination
+        if destination is None:
+            key = self.state.charKey()
+            if key != self.runKey:
+                self.flushRun()
+                self.runKey = key
+            self.run.append(text)
+        elif destination == 'fonttbl':
+            self.fontText(text)
+
+    def flushRun(self):
+        if self.run:
+            self.cursor.insertText(''.join(self.run), self.charFormat(self.runKey))
+            self.run = []
+            self.blockHasContent = True
+
+    def charFormat(self, key):
+        char_format = self.charFormats.get(key)
+        if char_format is None:
+            font, size, bold, italic, underline, strike, color, background, valign = key
+            # Font and color numbers are local to the file; the shared key uses what they name
+            family = self.fonts[font][0] if font in self.fonts else None
+            foreground = self.color(color)
+            background = self.color(background)
+
+            def build(char_format):
+                if family is not None:
+                    char_format.setFontFamily(family)
+                char_format.setFontPointSize(size / 2)
+                char_format.setFontWeight(QFont.Bold if bold else QFont.Normal)
+                char_format.setFontItalic(italic)
+                char_format.setFontUnderline(underline)
+                char_format.setFontStrikeOut(strike)
+                if foreground is not None:
+                    char_format.setForeground(foreground)
+                if background is not None:
+                    char_format.setBackground(background)
+                char_format.setVerticalAlignment(valign)
+            colors = tuple(None if value is None else value.rgba() for value in (foreground, background))
+            shared_key = ('rtf', family, size, bold, italic, underline, strike, colors, valign)
+            char_format = self.charFormats[key] = formats.char_format(shared_key, build)
+        return char_format
+
+    def color(self, index):
+        if 0 < index < len(self.colors):
+            return self.colors[index]
+        return None
+
+    def blockFormat(self, state, listed):
+        # Lists indent their items themselves
+        key = state.blockKey() if not listed else (state.align, 0, 0, state.before, state.after)
+        block_format = self.blockFormats.get(key)
+        if block_format is None:
+            align, left, first, before, after = key
+
+            def build(block_format):
+                if align is not None:
+                    block_format.setAlignment(align)
+                block_format.setLeftMargin(left / TWIPS_PER_PIXEL)
+                block_format.setTextIndent(first / TWIPS_PER_PIXEL)
+                block_format.setTopMargin(before / TWIPS_PER_PIXEL)
+                block_format.setBottomMargin(after / TWIPS_PER_PIXEL)
+            block_format = self.blockFormats[key] = formats.block_format(('rtf',) + key, build)
+        return block_format
+
+    def listStyle(self, state):
+        if state.listId is None:
+            return None
+        if isinstance(state.listId, tuple):
+            return state.listId[1]  # Old-style \pn paragraphs carry their style directly
+        levels = self.lists.get(self.overrides.get(state.listId))
+        if not levels:
+            return QTextListFormat.ListDisc
+        return levels[min(state.level, len(levels) - 1)]
+
+    def endParagraph(self, last=False):
+        self.flushRun()
+        state = self.state
+        if last and not self.blockHasContent and self.cursor.block().blockNumber() > 0:
+            # Most writers finish with \par, which would leave an empty paragraph behind
+            cursor = self.cursor
+            cursor.deletePreviousChar()
+            return
+        cursor = self.cursor
+        style = self.listStyle(state)
+        cursor.setBlockFormat(self.blockFormat(state, style is not None))
+        block = cursor.block()
+        current = block.textList()
+        if style is None:
+            self.activeLists = {}
+            if current is not None:
+                current.remove(block)
+        else:
+            key = (state.listId, state.level)
+            text_list = self.activeLists.get(key)
+            if current is not text_list or text_list is None:
+                if current is not None:
+                    current.remove(block)
+                if text_list is None:
+                    list_format = QTextListFormat()
+                    list_format.setStyle(style)
+                    list_format.setIndent(state.level + 1)
+                    text_list = cursor.createList(list_format)
+                    self.activeLists[key] = text_list
+                else:
+                    text_list.add(block)
+        if not last:
+            cursor.insertBlock()
+            self.blockHasContent = False
+
+    # Destinations
+
+    def fontText(self, text):
+        name, _, rest = text.partition(';')
+        self.fontName.append(name)
+        if _:
+            self.fonts[self.fontNumber] = (''.join(self.fontName).strip(), self.fontCodec)
+            self.fontName = []
+            self.fontCodec = None
+
+    def colorText(self, text):
+        for _ in range(text.count(';')):
+            self.colors.append(QColor(*self.rgb) if self.rgb is not None else None)
+            self.rgb = None
+
+    def controlWord(self, word, param):
+        state = self.state
+        destination = state.destination
+
+        if destination == 'fonttbl':
+            if word == 'f':
+                self.fontNumber = param or 0
+            elif word == 'fcharset':
+                self.fontCodec = CHARSET_CODECS.get(param)
+            return
+        if destination == 'colortbl':
+            if self.rgb is None:
+                self.rgb = [0, 0, 0]
+            if word in ('red', 'green', 'blue'):
+                self.rgb[('red', 'green', 'blue').index(word)] = param or 0
+            return
+        if destination == 'listtable':
+            if word == 'list':
+                self.listLevels = []
+            elif word == 'levelnfc':
+                if self.listLevels is not None:
+                    self.listLevels.append(NUMBER_FORMATS.get(param, QTextListFormat.ListDecimal))
+            elif word == 'listid' and self.listLevels is not None:
+                self.lists[param] = self.listLevels
+                self.listLevels = None
+            return
+        if destination == 'listoverridetable':
+            if word == 'listid':
+                self.overrideList = param
+            elif word == 'ls':
+                self.overrides[param] = self.overrideList
+            return
+        if destination == 'pn':
+            parent = self.stack[-1] if self.stack else state
+            if word == 'pnlvlblt':
+                parent.listId = state.listId = ('pn', QTextListFormat.ListDisc)
+            elif word in ('pnlvlbody', 'pndec'):
+                parent.listId = state.listId = ('pn', QTextListFormat.ListDecimal)
+            elif word == 'pnlvl':
+                parent.level = state.level = max((param or 1) - 1, 0)
+            return
+        if destination is not None:
+            return  # Skipped destination, or one that only holds text
+
+        if word in PARAGRAPH_BREAKS:
+            self.flushHex()
+            self.endParagraph()
+        elif word in SPECIAL_CHARACTERS:
+            self.text(SPECIAL_CHARACTERS[word])
+        elif word == 'u' and param is not None:
+            code = param if param >= 0 else param + 0x10000
+            if 0xD800 <= code < 0xDC00:
+                self.highSurrogate = code
+            elif 0xDC00 <= code < 0xE000:
+                if self.highSurrogate is not None:
+                    self.text(chr(0x10000 + ((self.highSurrogate - 0xD800) << 10) + (code - 0xDC00)))
+                self.highSurrogate = None
+            else:
+                self.text(chr(code))
+            self.skipChars = state.uc
+        elif word == 'uc':
+            state.uc = param or 0
+        elif word == 'plain':
+            state.plain(self.defaultFont)
+        elif word == 'pard':
+            state.pard()
+        elif word == 'f':
+            state.font = param or 0
+        elif word == 'fs':
+            state.size = param or 24
+        elif word in ('b', 'i', 'strike'):
+            setattr(state, {'b': 'bold', 'i': 'italic', 'strike': 'strike'}[word], param != 0)
+        elif word == 'ul':
+            state.underline = param != 0
+        elif word == 'ulnone':
+            state.underline = False
+        elif word == 'cf':
+            state.color = param or 0
+        elif word in ('highlight', 'cb', 'chcbpat'):
+            state.background = param or 0
+        elif word == 'super':
+            state.valign = QTextCharFormat.AlignSuperScript
+        elif word == 'sub':
+            state.valign = QTextCharFormat.AlignSubScript
+        elif word == 'nosupersub':
+            state.valign = QTextCharFormat.AlignNormal
+        elif word in ALIGNMENTS:
+            state.align = ALIGNMENTS[word]
+        elif word == 'li':
+            state.left = param or 0
+        elif word == 'fi':
+            state.first = param or 0
+        elif word == 'sb':
+            state.before = param or 0
+        elif word == 'sa':
+            state.after = param or 0
+        elif word == 'ls':
+            state.listId = param
+        elif word == 'ilvl':
+            state.level = param or 0
+        elif word == 'ansicpg':
+            self.codepage = codepage_codec(param)
+        elif word == 'deff':
+            self.defaultFont = param or 0
+            state.font = self.defaultFont
+
+    def destinationWord(self, word):
+        """Switch the current group to a destination if word introduces one."""
+        if word in ('fonttbl', 'colortbl', 'listtable', 'listoverridetable'):
+            self.state.destination = word
+        elif word == 'pn':
+            self.state.destination = 'pn'
+        elif word in SKIPPED:
+            self.state.destination = 'skip'
+        else:
+            return False
+        return True
+
+    # Main loop
+
+    def parse(self, data, progress=None):
+        total = len(data) or 1
+        ignorable = False
+        for count, match in enumerate(TOKEN.finditer(data)):
+            if count % PROGRESS_INTERVAL == 0:
+                report(progress, min(match.start() * 100 // total, 99))
+            word, param, hexcode, symbol, brace, text = match.groups()
+
+            if self.skipChars:
+                # Fallback characters after \uN
+                if text is not None:
+                    skipped = min(self.skipChars, len(text))
+                    self.skipChars -= skipped
+                    text = text[skipped:]
+                    if not text:
+                        continue
+                elif brace is None:
+                    self.skipChars -= 1
+                    continue
+                else:
+                    self.skipChars = 0
+
+            if hexcode is not None:
+                if self.state.destination is None or self.state.destination == 'fonttbl':
+                    self.hexBytes.append(int(hexcode, 16))
+                continue
+            self.flushHex()
+
+            if word is not None:
+                word = word.decode('ascii')
+                if ignorable:
+                    ignorable = False
+                    if not self.destinationWord(word):
+                        self.state.destination = 'skip'
+                    continue
+                if self.destinationWord(word):
+                    continue
+                self.controlWord(word, int(param) if param is not None else None)
+            elif brace is not None:
+                if brace == b'{':
+                    self.stack.append(self.state)
+                    self.state = self.state.copy()
+                elif self.stack:
+                    if len(self.stack) == 1 and not self.finished:
+                        # End of the document group; its paragraph formatting is about to go
+                        self.endParagraph(last=True)
+                        self.finished = True
+                    elif self.state.destination is None:
+                        self.flushRun()
+                    self.state = self.stack.pop()
+            elif symbol is not None:
+                symbol = symbol.decode('latin-1')
+                if symbol == '*':
+                    ignorable = True
+                elif symbol in ('\n', '\r'):
+                    self.controlWord('par', None)
+                elif symbol in SPECIAL_SYMBOLS:
+                    self.text(SPECIAL_SYMBOLS[symbol])
+            elif text is not None:
+                destination = self.state.destination
+                if destination is None:
+                    self.text(text.decode(self.codec(), errors='replace'))
+                elif destination == 'fonttbl':
+                    self.fontText(text.decode(self.codepage, errors='replace'))
+                elif destination == 'colortbl':
+                    self.colorText(text.decode('latin-1'))
+        self.flushHex()
+        if not self.finished:
+            self.state.destination = None
+            self.endParagraph(last=True)
+
+
+def import_rtf(filename, progress=None):
+    """Load an RTF file into a new, detached QTextDocument.
+
+    Like import_docx, the document is built with undo disabled inside one
+    edit block and is safe to build on a worker thread.
+    """
+    with open(filename, 'rb') as file:
+        data = file.read()
+    document = new_document()
+    document.setUndoRedoEnabled(False)
+    reader = RtfReader(document)
+    reader.cursor.beginEditBlock()
+    reader.parse(data, progress)
+    reader.cursor.endEditBlock()
+    document.setUndoRedoEnabled(True)
+    document.setModified(False)
+    report(progress, 100)
+    return to_gui_thread(document)
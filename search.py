@@ -0,0 +1,186 @@
+import re
+from PyQt5 import sip
+from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtGui import QTextCursor
+
+
+class SearchIndex(QObject):
+    """Plain-text snapshot of a document's blocks with per-block match caches.
+
+    The snapshot is taken the first time a search runs and is then kept up to
+    date from QTextDocument.contentsChange, so after an edit only the touched
+    blocks are copied and searched again. Matches never span blocks, the same
+    as QTextDocument.find.
+    """
+    changed = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.document = None
+        self.pattern = None
+        self.blockTexts = None
+        self.blockMatches = None
+        self.total = 0
+
+    def setDocument(self, document):
+        if self.document is not None and self.blockTexts is not None and not sip.isdeleted(self.document):
+            self.document.contentsChange.disconnect(self.onContentsChange)
+        self.document = document
+        self.blockTexts = None
+        self.blockMatches = None
+        self.total = 0
+        self.changed.emit()
+
+    def setQuery(self, text, regex=False, wholeWord=False, caseSensitive=False):
+        """Compile a new query; raises re.error for an invalid regular expression."""
+        if not text:
+            self.pattern = None
+        else:
+            source = text if regex else re.escape(text)
+            if wholeWord:
+                source = rf'\b(?:{source})\b'
+            self.pattern = re.compile(source, 0 if caseSensitive else re.IGNORECASE)
+        self.blockMatches = None
+        self.changed.emit()
+
+    def ensureSnapshot(self):
+        if self.blockTexts is not None:
+            return
+        texts = []
+        block = self.document.begin()
+        while block.isValid():
+            texts.append(block.text())
+            block = block.next()
+        self.blockTexts = texts
+        self.document.contentsChange.connect(self.onContentsChange)
+
+    def matchBlock(self, text):
+        return [(m.start(), m.end()) for m in self.pattern.finditer(text) if m.end() > m.start()]
+
+    def ensureMatches(self):
+        self.ensureSnapshot()
+        if self.blockMatches is None:
+            if self.pattern is None:
+                self.blockMatches = [[] for _ in self.blockTexts]
+            else:
+                self.blockMatches = [self.matchBlock(text) for text in self.blockTexts]
+            self.total = sum(len(matches) for matches in self.blockMatches)
+
+    def onContentsChange(self, position, removed, added):
+        document = self.document
+        first = document.findBlock(position).blockNumber()
+        last = document.findBlock(min(position + added, document.characterCount() - 1)).blockNumber()
+        if first < 0 or last < first:
+            # Not something we can patch up; start over on the next search
+            self.setDocument(document)
+            return
+        oldCount = (last - first + 1) - (document.blockCount() - len(self.blockTexts))
+
+        block = document.findBlockByNumber(first)
+        texts = []
+        for _ in range(last - first + 1):
+            texts.append(block.text())
+            block = block.next()
+        self.blockTexts[first:first + oldCount] = texts
+
+        if self.blockMatches is not None:
+            old = self.blockMatches[first:first + oldCount]
+            new = [self.matchBlock(text) for text in texts] if self.pattern else [[] for _ in texts]
+            self.blockMatches[first:first + oldCount] = new
+            self.total += sum(len(m) for m in new) - sum(len(m) for m in old)
+        self.changed.emit()
+
+    def count(self):
+        self.ensureMatches()
+        return self.total
+
+    def matches(self, limit=None):
+        """Absolute (start, end) positions of matches in document order."""
+        self.ensureMatches()
+        result = []
+        for number, matches in enumerate(self.blockMatches):
+            if not matches:
+                continue
+            position = self.document.findBlockByNumber(number).position()
+            for start, end in matches:
+                result.append((position + start, position + end))
+                if limit is not None and len(result) >= limit:
+                    return result
+        return result
+
+    def find(self, position, backward=False):
+        """Find the match after (or before) position, wrapping around.
+
+        Returns (index, start, end) where index is the 0-based number of the
+        match among all matches, or None if there are none.
+        """
+        self.ensureMatches()
+        if not self.total:
+            return None
+        block = self.document.findBlock(position)
+        number = max(block.blockNumber(), 0)
+        offset = position - block.position()
+        before = sum(len(m) for m in self.blockMatches[:number])
+        matches = self.blockMatches[number]
+
+        if backward:
+            for i in range(len(matches) - 1, -1, -1):
+                if matches[i][0] < offset:
+                    return self.located(number, i, before + i)
+            for n in range(number - 1, -1, -1):
+                before -= len(self.blockMatches[n])
+                if self.blockMatches[n]:
+                    i = len(self.blockMatches[n]) - 1
+                    return self.located(n, i, before + i)
+            return self.located(*self.last())
+
+        for i, (start, end) in enumerate(matches):
+            if start >= offset:
+                return self.located(number, i, before + i)
+        before += len(matches)
+        for n in range(number + 1, len(self.blockMatches)):
+            if self.blockMatches[n]:
+                return self.located(n, 0, before)
+            before += len(self.blockMatches[n])
+        return self.located(*self.first())
+
+    def first(self):
+        for n, matches in enumerate(self.blockMatches):
+            if matches:
+                return n, 0, 0
+
+    def last(self):
+        for n in range(len(self.blockMatches) - 1, -1, -1):
+            if self.blockMatches[n]:
+                return n, len(self.blockMatches[n]) - 1, self.total - 1
+
+    def located(self, number, i, index):
+        position = self.document.findBlockByNumber(number).position()
+        start, end = self.blockMatches[number][i]
+        return index, position + start, position + end
+
+    def replacement(self, start, end, template, regex):
+        """Text to put in place of the match at [start, end)."""
+        if not regex:
+            return template
+        block = self.document.findBlock(start)
+        text = self.blockTexts[block.blockNumber()]
+        offset = start - block.position()
+        match = self.pattern.match(text, offset)
+        return match.expand(template) if match and match.end() == offset + end - start else template
+
+    def replaceAll(self, template, regex=False):
+        """Replace every match as a single undo step; returns the number replaced."""
+        spans = self.matches()
+        if not spans:
+            return 0
+        replacements = [(start, end, self.replacement(start, end, template, regex)) for start, end in spans]
+        cursor = QTextCursor(self.document)
+        cursor.beginEditBlock()
+        # Back to front, so earlier positions stay valid
+        for start, end, text in reversed(replacements):
+            cursor.setPosition(start)
+            cursor.setPosition(end, QTextCursor.KeepAnchor)
+            cursor.insertText(text)
+        cursor.endEditBlock()
+        return len(replacements)
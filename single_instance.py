@@ -0,0 +1,89 @@
+"""One editor process per user: later launches hand their files over and exit.
+
+The running editor listens on a local socket (a Unix domain socket, or a
+named pipe on Windows). A new launch first tries to connect; if that works
+it writes its file paths, one absolute path per line, and quits without
+ever creating a QApplication. Only QtCore and QtNetwork are imported on
+that path.
+"""
+import getpass
+import os
+import re
+from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtNetwork import QAbstractSocket, QLocalServer, QLocalSocket
+
+CONNECT_TIMEOUT = 200  # ms; the server is either there or not
+WRITE_TIMEOUT = 2000
+
+
+def server_name():
+    # Per user, so two people on one machine each get their own editor
+    try:
+        user = getpass.getuser()
+    except Exception:
+        user = str(os.getuid()) if hasattr(os, 'getuid') else ''
+    return 'OpenOPen-' + re.sub(r'\W', '_', user)
+
+
+def send_to_running(paths):
+    """Give paths to an editor that's already running; False if there's none.
+
+    An empty list just brings the running editor's window to the front.
+    """
+    socket = QLocalSocket()
+    socket.connectToServer(server_name())
+    if not socket.waitForConnected(CONNECT_TIMEOUT):
+        return False
+    socket.write(''.join(os.path.abspath(path) + '\n' for path in paths).encode('utf-8'))
+    socket.flush()
+    sent = socket.bytesToWrite() == 0 or socket.waitForBytesWritten(WRITE_TIMEOUT)
+    socket.disconnectFromServer()
+    if socket.state() != QLocalSocket.UnconnectedState:
+        socket.waitForDisconnected(WRITE_TIMEOUT)
+    return sent
+
+
+class InstanceServer(QObject):
+    """Receives the paths later launches send; emits them once each sender disconnects."""
+    filesReceived = pyqtSignal(list)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.server = QLocalServer(self)
+        self.server.newConnection.connect(self.acceptConnections)
+
+    def listen(self):
+        """Start listening; False if another editor got there first."""
+        name = server_name()
+        if self.server.listen(name):
+            return True
+        if self.server.serverError() == QAbstractSocket.AddressInUseError:
+            probe = QLocalSocket()
+            probe.connectToServer(name)
+            if probe.waitForConnected(CONNECT_TIMEOUT):
+                probe.disconnectFromServer()
+                return False
+            # Left behind by an editor that crashed
+            QLocalServer.removeServer(name)
+            return self.server.listen(name)
+        return False
+
+    def acceptConnections(self):
+        while self.server.hasPendingConnections():
+            self.receive(self.server.nextPendingConnection())
+
+    def receive(self, socket):
+        received = bytearray()
+
+        def read():
+            received.extend(bytes(socket.readAll()))
+
+        def finish():
+            read()
+            socket.deleteLater()
+            self.filesReceived.emit([line for line in received.decode('utf-8').splitlines() if line])
+        socket.readyRead.connect(read)
+        socket.disconnected.connect(finish)
+
+    def close(self):
+        self.server.close()
@@ -0,0 +1,541 @@
+"""Spell checking: a compiled word list shared by every view, and checking that keeps out of typing's way.
+
+The dictionary is compiled once from the first word list found, a plain
+list of one word per line or a hunspell .dic with its .aff, plus any lists
+in the app data dir's dictionaries folder:
+
+    header   magic, version and word count
+    offsets  where each word starts in the file, then where the last one ends
+    words    the words as UTF-8, sorted by their bytes
+
+Opening it memory-maps the file and looking a word up is a binary search
+over the mapping, so loading costs nothing whatever the dictionary's size,
+and every view, window and process shares the same pages of it.
+
+SpellChecker keeps a view's document underlined. Only blocks in view are
+ever checked, on a worker thread, and each block's result is cached by a
+revision stamped on the block, so a block is only checked again after an
+edit touches it.
+"""
+import mmap
+import os
+import re
+import struct
+import sys
+import threading
+from array import array
+from collections import OrderedDict
+from itertools import accumulate, count
+from PyQt5 import sip
+from PyQt5.QtCore import QObject, QStandardPaths, QThreadPool, QTimer, pyqtSignal
+from PyQt5.QtGui import QColor, QTextCharFormat, QTextLayout
+from constants import DICTIONARY_SOURCES
+from document_model import ASTRAL
+from jobs import Job
+
+MAGIC = b'OOPD'
+VERSION = 1
+HEADER = struct.Struct('<4sB3xI')
+CHECK_DELAY = 150  # ms after typing or scrolling stops before the blocks in view are checked
+CACHED_BLOCKS = 1 << 17  # block results kept across all views
+KNOWN_WORDS = 1 << 16  # lookups remembered by a dictionary before it starts over
+PROGRESS_INTERVAL = 64  # blocks checked between progress reports
+
+APOSTROPHE = '\u2019'  # As typed by word processors
+WORD = re.compile(r"\w+(?:['\u2019]\w+)*")
+NOT_A_WORD = re.compile(r'[\d_]')
+# Addresses, links and paths are left alone
+ADDRESS = re.compile(r'\S*(?:://|@|www\.|[\\/]\w)\S*')
+
+MISSPELLED = QTextCharFormat()
+MISSPELLED.setUnderlineStyle(QTextCharFormat.SpellCheckUnderline)
+MISSPELLED.setUnderlineColor(QColor('red'))
+
+
+def dictionary_root():
+    base = QStandardPaths.writableLocation(QStandardPaths.GenericDataLocation)
+    return os.path.join(base or os.path.expanduser('~'), 'OpenOPen')
+
+
+def decode(data, encoding='utf-8'):
+    try:
+        return data.decode(encoding)
+    except (UnicodeDecodeError, LookupError):
+        return data.decode('latin-1')
+
+
+def read_word_list(path):
+    with open(path, 'rb') as file:
+        text = decode(file.read())
+    for line in text.splitlines():
+        word = line.strip()
+        if word and not word.startswith('#'):
+            yield word
+
+
+class Affixes:
+    """The prefix and suffix rules of a hunspell .aff file.
+
+    Only what's needed to list the words a .dic stands for is read: each
+    stem with its affixes applied one level deep, prefixes and suffixes
+    crossed where the rules allow it.
+    """
+
+    def __init__(self, path):
+        with open(path, 'rb') as file:
+            data = file.read()
+        found = re.search(rb'^SET\s+(\S+)', data, re.MULTILINE)
+        self.encoding = found.group(1).decode('ascii', 'ignore') if found else 'utf-8'
+        self.flagType = None
+        self.needAffix = self.forbidden = None
+        self.cross = {}  # (kind, flag) -> whether the rules combine with the other kind
+        self.rules = {}  # flag -> [(kind, strip, add, condition)]
+        for line in decode(data, self.encoding).splitlines():
+            parts = line.split()
+            if len(parts) < 2:
+                continue
+            if parts[0] == 'FLAG':
+                self.flagType = parts[1]
+            elif parts[0] == 'NEEDAFFIX':
+                self.needAffix = parts[1]
+            elif parts[0] == 'FORBIDDENWORD':
+                self.forbidden = parts[1]
+            elif parts[0] in ('PFX', 'SFX') and len(parts) >= 4:
+                kind, flag = parts[0], parts[1]
+                if (kind, flag) not in self.cross:
+                    self.cross[(kind, flag)] = parts[2] == 'Y'
+                    continue
+                strip = '' if parts[2] == '0' else parts[2]
+                add = parts[3].split('/')[0]
+                add = '' if add == '0' else add
+                condition = parts[4] if len(parts) > 4 else '.'
+                try:
+                    condition = re.compile(condition if kind == 'PFX' else f'(?:{condition})$')
+                except re.error:
+                    continue
+                self.rules.setdefault(flag, []).append((kind, strip, add, condition))
+
+    def flags(self, text):
+        if self.flagType == 'long':
+            return [text[i:i + 2] for i in range(0, len(text), 2)]
+        if self.flagType == 'num':
+            return text.split(',')
+        return list(text)
+
+    def expand(self, stem, flags):
+        flags = self.flags(flags)
+        if self.forbidden in flags:
+            return
+        if self.needAffix not in flags:
+            yield stem
+        crossing = []
+        for flag in flags:
+            for kind, strip, add, condition in self.rules.get(flag, ()):
+                if kind == 'SFX' and stem.endswith(strip) and condition.search(stem):
+                    word = stem[:len(stem) - len(strip)] + add
+                    yield word
+                    if self.cross[(kind, flag)]:
+                        crossing.append(word)
+        for flag in flags:
+            for kind, strip, add, condition in self.rules.get(flag, ()):
+                if kind == 'PFX' and stem.startswith(strip) and condition.match(stem):
+                    yield add + stem[len(strip):]
+                    if self.cross[(kind, flag)]:
+                        for word in crossing:
+                            yield add + word[len(strip):]
+
+
+def read_hunspell(path):
+    """The words a hunspell .dic stands for, with the rules of the .aff beside it."""
+    aff = os.path.splitext(path)[0] + '.aff'
+    affixes = Affixes(aff) if os.path.exists(aff) else None
+    with open(path, 'rb') as file:
+        text = decode(file.read(), affixes.encoding if affixes else 'utf-8')
+    lines = text.splitlines()
+    if lines and lines[0].strip().isdigit():
+        lines = lines[1:]  # The word count
+    for line in lines:
+        entry = line.split()
+        if not entry or entry[0].startswith('#'):
+            continue
+        stem, _, flags = entry[0].partition('/')
+        if not stem:
+            continue
+        if affixes is None or not flags:
+            yield stem
+        else:
+            yield from affixes.expand(stem, flags)
+
+
+def read_words(path):
+    return read_hunspell(path) if path.lower().endswith('.dic') else read_word_list(path)
+
+
+def dictionary_sources():
+    """The word lists to compile: the first system one found, and any the user has added."""
+    sources = []
+    for path in DICTIONARY_SOURCES:
+        if os.path.isfile(path):
+            sources.append(path)
+            break
+    custom = os.path.join(dictionary_root(), 'dictionaries')
+    if os.path.isdir(custom):
+        sources.extend(os.path.join(custom, name) for name in sorted(os.listdir(custom))
+                       if name.lower().endswith(('.dic', '.txt')))
+    return sources
+
+
+def compile_dictionary(sources, target):
+    """Compile the words of sources into target; returns how many distinct words there are."""
+    words = set()
+    for path in sources:
+        words.update(word.encode('utf-8') for word in read_words(path))
+    words = sorted(words)
+    start = HEADER.size + 4 * (len(words) + 1)
+    offsets = array('I', [start])
+    for word in words:
+        start += len(word)
+        offsets.append(start)
+    if sys.byteorder == 'big':
+        offsets.byteswap()
+    os.makedirs(os.path.dirname(target) or '.', exist_ok=True)
+    tmp = target + '.tmp'
+    with open(tmp, 'wb') as file:
+        file.write(HEADER.pack(MAGIC, VERSION, len(words)))
+        file.write(offsets.tobytes())
+        file.write(b''.join(words))
+    os.replace(tmp, target)
+    return len(words)
+
+
+class DictionaryError(ValueError):
+    """The file isn't a compiled dictionary this version can read."""
+
+
+class Dictionary:
+    """A compiled word list, memory-mapped and searched where it lies.
+
+    Words are matched as written, or in lower case for capitalized words,
+    so "The" is found as "the" but "paris" isn't found as "Paris".
+    """
+
+    def __init__(self, filename):
+        with open(filename, 'rb') as file:
+            self.map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self.map) < HEADER.size:
+            raise DictionaryError(f"{filename} is not a compiled dictionary")
+        magic, version, self.count = HEADER.unpack_from(self.map)
+        if magic != MAGIC or version > VERSION or len(self.map) < HEADER.size + 4 * (self.count + 1):
+            raise DictionaryError(f"{filename} is not a compiled dictionary")
+        offsets = memoryview(self.map)[HEADER.size:HEADER.size + 4 * (self.count + 1)]
+        if sys.byteorder == 'big':
+            self.offsets = array('I', offsets)
+            self.offsets.byteswap()
+        else:
+            self.offsets = offsets.cast('I')
+        self.known = {}
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, word):
+        key = word.encode('utf-8')
+        data, offsets = self.map, self.offsets
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            found = data[offsets[middle]:offsets[middle + 1]]
+            if found < key:
+                low = middle + 1
+            elif found > key:
+                high = middle
+            else:
+                return True
+        return False
+
+    def check(self, word):
+        known = self.known.get(word)
+        if known is None:
+            plain = word.replace(APOSTROPHE, "'")
+            known = plain in self or (plain[0].isupper() and plain.lower() in self)
+            if len(self.known) >= KNOWN_WORDS:
+                self.known.clear()
+            self.known[word] = known
+        return known
+
+
+def check_text(dictionary, text):
+    """(start, length) of each misspelled word in text, in the UTF-16 code units Qt's layouts count."""
+    skipped = [match.span() for match in ADDRESS.finditer(text)] if ('@' in text or '/' in text
+                                                                    or '\\' in text or 'www.' in text) else ()
+    misspelled = []
+    for match in WORD.finditer(text):
+        word = match.group()
+        if len(word) < 2 or word.isupper() or NOT_A_WORD.search(word):
+            continue
+        if skipped and any(start <= match.start() < end for start, end in skipped):
+            continue
+        if not dictionary.check(word):
+            misspelled.append((match.start(), len(word)))
+    if misspelled and ASTRAL.search(text):
+        units = list(accumulate((2 if character >= '\U00010000' else 1 for character in text), initial=0))
+        misspelled = [(units[start], units[start + length] - units[start]) for start, length in misspelled]
+    return tuple(misspelled)
+
+
+def check_blocks(dictionary, blocks, progress=None):
+    """[(revision, misspellings)] for a batch of (revision, text); runs on a worker thread."""
+    results = []
+    for number, (revision, text) in enumerate(blocks):
+        if progress is not None and number % PROGRESS_INTERVAL == 0:
+            progress(100 * number // len(blocks))
+        results.append((revision, check_text(dictionary, text)))
+    return results
+
+
+_dictionary = None
+_dictionary_lock = threading.Lock()
+
+
+def shared_dictionary(progress=None):
+    """The process's Dictionary, compiled first if its word lists are newer; None if there are none."""
+    global _dictionary
+    with _dictionary_lock:
+        if _dictionary is None:
+            sources = dictionary_sources()
+            if not sources:
+                return None
+            target = os.path.join(dictionary_root(), 'dictionary.oopd')
+            newest = max(os.path.getmtime(path) for path in sources)
+            if not os.path.exists(target) or os.path.getmtime(target) < newest:
+                compile_dictionary(sources, target)
+            try:
+                _dictionary = Dictionary(target)
+            except DictionaryError:
+                compile_dictionary(sources, target)
+                _dictionary = Dictionary(target)
+        return _dictionary
+
+
+class ResultCache:
+    """Misspellings by block revision, least recently used first out."""
+
+    def __init__(self, limit=CACHED_BLOCKS):
+        self.limit = limit
+        self.results = OrderedDict()
+
+    def get(self, revision):
+        found = self.results.get(revision)
+        if found is not None:
+            self.results.move_to_end(revision)
+        return found
+
+    def put(self, revision, misspelled):
+        self.results[revision] = misspelled
+        if len(self.results) > self.limit:
+            self.results.popitem(last=False)
+
+
+results = ResultCache()
+# Revisions come from one counter for every document, so a revision names
+# the same text wherever it's found, cloned documents included
+_revisions = count()
+
+
+def mark_dirty(document, block):
+    # Relayout the block without the edit being announced to the model, statistics and autosave
+    document.blockSignals(True)
+    try:
+        document.markContentsDirty(block.position(), block.length())
+    finally:
+        document.blockSignals(False)
+
+
+class SpellChecker(QObject):
+    """Underlines misspelled words in the document a ZoomableTextEdit shows.
+
+    A block's revision is kept in its userState, since its user data holds
+    its statistics, and is renewed whenever contentsChange touches the block;
+    QTextBlock.revision() doesn't move for insertions while undo is off, as
+    it is under DocumentModel. A short while after typing or scrolling
+    stops, the blocks in view that have no result for their revision are
+    checked on a worker thread in one batch. Misspellings are drawn as extra
+    formats on the blocks' layouts, the way QSyntaxHighlighter draws, so they
+    never reach the document's formats, its undo history or saved files.
+    """
+    unavailable = pyqtSignal()
+    failed = pyqtSignal(str)  # A batch couldn't be checked; it's tried again on the next pass
+
+    def __init__(self, view, parent=None):
+        super().__init__(parent)
+        self.view = view
+        self.document = None
+        self.dictionary = None
+        self.enabled = False
+        self.loading = False
+        self.loader = None
+        self.job = None
+        self.pending = False
+        self.applied = set()  # revisions whose results are on the current layouts
+        self.underlined = set()  # revisions of those with any misspellings
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(CHECK_DELAY)
+        self.timer.timeout.connect(self.refresh)
+        view.documentChanged.connect(self.setDocument)
+        view.verticalScrollBar().valueChanged.connect(self.schedule)
+        view.zoomChanged.connect(self.schedule)
+        self.setDocument(view.document())
+
+    def setDocument(self, document):
+        if self.document is not None and not sip.isdeleted(self.document):
+            self.document.contentsChange.disconnect(self.onContentsChange)
+        self.document = document
+        # A document that's been in the background has new layouts without any formats
+        self.applied.clear()
+        self.underlined.clear()
+        document.contentsChange.connect(self.onContentsChange)
+        self.schedule()
+
+    def setEnabled(self, enabled):
+        self.enabled = enabled
+        if not enabled:
+            self.timer.stop()
+            self.clear()
+        elif self.dictionary is None:
+            self.load()
+        else:
+            self.schedule()
+
+    def load(self):
+        if self.loading:
+            return
+        self.loading = True
+        job = self.loader = Job(shared_dictionary)
+        job.signals.finished.connect(self.loaded)
+        job.signals.failed.connect(lambda error: self.loaded(None))
+        self.pool.start(job)
+
+    def loaded(self, dictionary):
+        self.loading = False
+        self.loader = None
+        self.dictionary = dictionary
+        if dictionary is None:
+            self.enabled = False
+            self.unavailable.emit()
+        elif self.enabled:
+            self.schedule()
+
+    def schedule(self, *args):
+        if self.enabled and self.dictionary is not None:
+            self.timer.start()
+
+    def onContentsChange(self, position, removed, added):
+        document = self.document
+        first = document.findBlock(position)
+        last = document.findBlock(min(position + added, document.characterCount() - 1))
+        if not first.isValid() or not last.isValid():
+            return
+        end = last.next()
+        block = first
+        while block.isValid() and block != end:
+            underlined = block.userState() in self.underlined
+            revision = next(_revisions)
+            block.setUserState(revision)
+            if underlined:
+                # Until the block's been checked again, keep the underlines clear of the edit
+                layout = block.layout()
+                if first == last:
+                    layout.setFormats(shift_formats(layout.formats(), position - block.position(), removed, added))
+                    if layout.formats():
+                        self.underlined.add(revision)
+                else:
+                    layout.clearFormats()
+            block = block.next()
+        self.schedule()
+
+    def refresh(self):
+        """Underline the blocks in view from the cache, and check the ones that aren't in it."""
+        if not self.enabled or self.dictionary is None or sip.isdeleted(self.document):
+            return
+        if self.job is not None:
+            self.pending = True
+            return
+        document = self.document
+        start, end = self.view.visibleRange()
+        block = document.findBlock(start)
+        batch = []
+        while block.isValid() and block.position() <= end:
+            revision = block.userState()
+            if revision < 0:
+                revision = next(_revisions)
+                block.setUserState(revision)
+            misspelled = results.get(revision)
+            if misspelled is None:
+                batch.append((revision, block.text()))
+            elif revision not in self.applied:
+                self.underline(block, misspelled)
+            block = block.next()
+        if batch:
+            job = self.job = Job(check_blocks, self.dictionary, batch)
+            job.signals.finished.connect(self.checked)
+            job.signals.failed.connect(self.checkFailed)
+            self.pool.start(job)
+
+    def checked(self, checked):
+        self.job = None
+        for revision, misspelled in checked:
+            results.put(revision, misspelled)
+        self.pending = False
+        # Underlines what came back, and checks anything that was edited in the meantime
+        self.refresh()
+
+    def checkFailed(self, error):
+        self.job = None
+        self.pending = False
+        self.failed.emit(error)
+        self.schedule()
+
+    def underline(self, block, misspelled):
+        revision = block.userState()
+        self.applied.add(revision)
+        layout = block.layout()
+        if not misspelled and not layout.formats():
+            return
+        ranges = []
+        for start, length in misspelled:
+            misspelling = QTextLayout.FormatRange()
+            misspelling.start = start
+            misspelling.length = length
+            misspelling.format = MISSPELLED
+            ranges.append(misspelling)
+        layout.setFormats(ranges)
+        if misspelled:
+            self.underlined.add(revision)
+        mark_dirty(self.document, block)
+
+    def clear(self):
+        """Take the underlines off the document."""
+        if self.document is not None and not sip.isdeleted(self.document) and self.underlined:
+            block = self.document.begin()
+            while block.isValid():
+                if block.userState() in self.underlined:
+                    block.layout().clearFormats()
+                    mark_dirty(self.document, block)
+                block = block.next()
+        self.applied.clear()
+        self.underlined.clear()
+
+
+def shift_formats(ranges, offset, removed, added):
+    """ranges of a block after an edit at offset, less any the edit touched."""
+    shifted = []
+    for format_range in ranges:
+        if format_range.start + format_range.length < offset:
+            shifted.append(format_range)
+        elif format_range.start > offset + removed:
+            format_range.start += added - removed
+            shifted.append(format_range)
+    return shifted
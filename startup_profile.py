@@ -0,0 +1,144 @@
+"""Startup timing behind main.py's --profile-startup flag.
+
+Times every module's first import, the way python -X importtime does, and
+named init phases, then prints both once the main window has painted:
+
+    python main.py --profile-startup
+"""
+import sys
+import time
+from contextlib import contextmanager
+
+TOP_IMPORTS = 15  # slowest imports listed in the report
+# Modules that should only be loaded once a feature that needs them is used
+DEFERRED_MODULES = ('docx', 'reportlab', 'PyQt5.QtPrintSupport', 'lxml')
+
+_profile = None
+
+
+class TimedLoader:
+    """Wraps a module's loader to time loading it; everything else is delegated."""
+
+    def __init__(self, loader, timer):
+        self.loader = loader
+        self.timer = timer
+
+    def __getattr__(self, name):
+        return getattr(self.loader, name)
+
+    def create_module(self, spec):
+        # Extension modules do their loading here rather than in exec_module
+        self.timer.enter()
+        try:
+            return self.loader.create_module(spec)
+        finally:
+            self.timer.exit(spec.name)
+
+    def exec_module(self, module):
+        # The module should see its real loader from here on
+        if getattr(module.__spec__, 'loader', None) is self:
+            module.__spec__.loader = self.loader
+        module.__loader__ = self.loader
+        self.timer.enter()
+        try:
+            self.loader.exec_module(module)
+        finally:
+            self.timer.exit(module.__name__)
+
+
+class ImportTimer:
+    """Meta path finder that times imports, keeping self and cumulative time per module."""
+
+    def __init__(self):
+        self.stack = []  # [start, time spent in nested imports]
+        self.times = {}  # name -> (self seconds, cumulative seconds)
+
+    def find_spec(self, name, path=None, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(name, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+                    spec.loader = TimedLoader(spec.loader, self)
+                return spec
+        return None
+
+    def enter(self):
+        self.stack.append([time.perf_counter(), 0.0])
+
+    def exit(self, name):
+        start, nested = self.stack.pop()
+        cumulative = time.perf_counter() - start
+        own, total = self.times.get(name, (0.0, 0.0))
+        self.times[name] = (own + cumulative - nested, total + cumulative)
+        if self.stack:
+            self.stack[-1][1] += cumulative
+
+
+class StartupProfile:
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.imports = ImportTimer()
+        self.phases = []  # (name, seconds)
+        sys.meta_path.insert(0, self.imports)
+
+    def stop(self):
+        if self.imports in sys.meta_path:
+            sys.meta_path.remove(self.imports)
+
+    def report(self, file=sys.stdout):
+        total = time.perf_counter() - self.start
+        print(f"Time to first paint: {total * 1000:.1f} ms", file=file)
+        print("\nInit phases:", file=file)
+        for name, seconds in self.phases:
+            print(f"  {seconds * 1000:8.1f} ms  {name}", file=file)
+        print(f"\nSlowest imports (self / cumulative), {len(self.imports.times)} modules in total:", file=file)
+        slowest = sorted(self.imports.times.items(), key=lambda item: item[1][1], reverse=True)
+        for name, (own, cumulative) in slowest[:TOP_IMPORTS]:
+            print(f"  {own * 1000:8.1f} / {cumulative * 1000:8.1f} ms  {name}", file=file)
+        loaded = [name for name in DEFERRED_MODULES if name in sys.modules]
+        print(f"\nDeferred modules loaded at startup: {', '.join(loaded) or 'none'}", file=file)
+
+
+def enable():
+    """Start timing imports; call before anything heavy is imported."""
+    global _profile
+    if _profile is None:
+        _profile = StartupProfile()
+    return _profile
+
+
+@contextmanager
+def phase(name):
+    """Time a block of init work; does nothing unless profiling is enabled."""
+    if _profile is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _profile.phases.append((name, time.perf_counter() - start))
+
+
+def report_on_first_paint(window):
+    """Print the report once window has painted for the first time."""
+    if _profile is None:
+        return
+    from PyQt5.QtCore import QEvent, QObject, QTimer
+
+    class FirstPaint(QObject):
+        def eventFilter(self, watched, event):
+            if event.type() == QEvent.Paint:
+                window.removeEventFilter(self)
+                # Let the paint finish before taking the time
+                QTimer.singleShot(0, finish)
+            return False
+
+    def finish():
+        _profile.stop()
+        _profile.report()
+
+    window._firstPaintFilter = FirstPaint(window)
+    window.installEventFilter(window._firstPaintFilter)
@@ -0,0 +1,99 @@
+import os
+from PyQt5.QtGui import QTextCursor
+
+# Rough per-item costs inside Qt, for the memory estimate
+CHAR_BYTES = 2  # QString stores UTF-16
+BLOCK_BYTES = 160  # block map node, QTextBlockData and an empty QTextLayout
+FORMAT_BYTES = 120
+LINE_BYTES = 100  # QTextLine data of a laid out block
+GLYPH_BYTES = 28  # glyph, advance, offset and attributes per laid out character
+
+
+class DocumentTab:
+    """An open document and what the view needs to pick it up again.
+
+    Only the active tab's document is attached to the view. A background
+    tab is just its QTextDocument with the line layouts released, its own
+    undo history (the DocumentModel child of the document) and its own
+    autosave session.
+    """
+
+    def __init__(self, document, autosave, fileName=None):
+        self.document = document
+        self.autosave = autosave
+        self.fileName = fileName
+        self.cursor = QTextCursor(document)
+        self.scroll = (0, 0)
+        self.largeView = None  # LargeFileView while a large plain-text file is open
+
+    def title(self):
+        name = os.path.basename(self.fileName) if self.fileName else 'Untitled'
+        return f"{name}*" if self.isModified() else name
+
+    def isModified(self):
+        if self.largeView is not None:
+            return self.largeView.modified
+        return self.document.isModified()
+
+    def isPristine(self):
+        """An untouched new document, which an opened file can take the place of."""
+        return (self.largeView is None and self.fileName is None
+                and not self.document.isModified() and self.document.isEmpty())
+
+    def memoryUsage(self, active):
+        """(document bytes, history bytes), both estimates."""
+        if self.largeView is not None:
+            return self.largeView.table.memoryUsage() if self.largeView.table is not None else 0, 0
+        from document_model import DocumentModel
+        model = self.document.findChild(DocumentModel)
+        return document_memory(self.document, active), model.memoryUsage() if model is not None else 0
+
+
+def release_layout(document):
+    """Drop the layout of a document that's going into the background.
+
+    Deleting the layout stops any layout work still running on its timer
+    and frees the line layouts of every block; restore_layout() makes a new
+    one before the document is shown again. The blocks' user data, and so
+    their cached statistics, go with the line layouts.
+    """
+    # Qt announces a layout change as the whole text being inserted, which
+    # the undo model, search index and autosave mustn't see
+    document.blockSignals(True)
+    try:
+        document.setDocumentLayout(None)
+    finally:
+        document.blockSignals(False)
+    from document_stats import DocumentStats
+    stats = document.findChild(DocumentStats)
+    if stats is not None:
+        stats.release()
+
+
+def restore_layout(document):
+    document.blockSignals(True)
+    try:
+        document.documentLayout()  # Creates one when there's none
+    finally:
+        document.blockSignals(False)
+
+
+def document_memory(document, laidOut=True):
+    """Estimate of what a QTextDocument holds: text, blocks, formats and any line layouts."""
+    total = (document.characterCount() * CHAR_BYTES + document.blockCount() * BLOCK_BYTES
+             + len(document.allFormats()) * FORMAT_BYTES)
+    # block.layout() would create the layouts a background document has let go of
+    block = document.begin() if laidOut else None
+    while block is not None and block.isValid():
+        lines = block.layout().lineCount()
+        if lines:
+            total += lines * LINE_BYTES + block.length() * GLYPH_BYTES
+        block = block.next()
+    return total
+
+
+def format_bytes(count):
+    for unit in ('bytes', 'KB', 'MB'):
+        if count < 1024 or unit == 'MB':
+            return f"{count:,.0f} {unit}" if unit == 'bytes' else f"{count:,.1f} {unit}"
+        count /= 1024
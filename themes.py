@@ -0,0 +1,111 @@
+"""Light and dark themes: palette, stylesheet and icons, built once and reused.
+
+Icons and stylesheets come from the compiled resource bundle. After
+changing anything under icons/ or styles/, regenerate it with:
+
+    pyrcc5 -o resources_rc.py resources.qrc
+"""
+import resources_rc  # noqa: F401  Registers the :/icons and :/styles resources
+from PyQt5.QtCore import QFile, QIODevice, Qt
+from PyQt5.QtGui import QColor, QIcon, QPalette
+from constants import DARK_STYLE_PATH, LIGHT_STYLE_PATH
+
+# Icons with a _dark variant that's used in dark mode
+THEMED_ICONS = (
+    'print', 'bold', 'italic', 'underline', 'dark_mode',
+    'align_left', 'align_right', 'align_center', 'bullet_list', 'numbered_list',
+)
+
+# Appended to both stylesheets; the object names are set in Editor
+CUSTOM_STYLES = """
+QMenuBar {
+    padding: 5px;
+    margin: 0px;
+}
+QToolBar {
+    padding: 5px;
+    margin: 0px;
+}
+QLabel#zoomLabel {
+    font-weight: bold;
+    font-size: 10pt;
+    color: %(text)s;
+}
+QFontComboBox#fontFamily, QComboBox#fontSize {
+    color: %(text)s;
+}
+"""
+
+PALETTES = {
+    False: {
+        QPalette.Window: Qt.white,
+        QPalette.WindowText: Qt.black,
+        QPalette.Base: Qt.white,
+        QPalette.AlternateBase: Qt.lightGray,
+        QPalette.ToolTipBase: Qt.white,
+        QPalette.ToolTipText: Qt.black,
+        QPalette.Text: Qt.black,
+        QPalette.Button: Qt.lightGray,
+        QPalette.ButtonText: Qt.black,
+        QPalette.BrightText: Qt.red,
+        QPalette.Link: QColor(0, 0, 255),
+        QPalette.Highlight: QColor(0, 120, 215),
+        QPalette.HighlightedText: Qt.white,
+    },
+    True: {
+        QPalette.Window: QColor(53, 53, 53),
+        QPalette.WindowText: Qt.white,
+        QPalette.Base: QColor(53, 53, 53),
+        QPalette.AlternateBase: QColor(53, 53, 53),
+        QPalette.ToolTipBase: Qt.white,
+        QPalette.ToolTipText: Qt.white,
+        QPalette.Text: Qt.white,
+        QPalette.Button: QColor(53, 53, 53),
+        QPalette.ButtonText: Qt.white,
+        QPalette.BrightText: Qt.red,
+        QPalette.Link: QColor(42, 130, 218),
+        QPalette.Highlight: QColor(42, 130, 218),
+        QPalette.HighlightedText: Qt.black,
+    },
+}
+
+_themes = {}
+
+
+def read_resource(path):
+    file = QFile(path)
+    if not file.open(QIODevice.ReadOnly | QIODevice.Text):
+        raise OSError(f"Can't read resource {path}")
+    try:
+        return bytes(file.readAll()).decode('utf-8')
+    finally:
+        file.close()
+
+
+class Theme:
+    def __init__(self, dark):
+        self.dark = dark
+        self.palette = QPalette()
+        for role, color in PALETTES[dark].items():
+            self.palette.setColor(role, color)
+        self.styleSheet = read_resource(DARK_STYLE_PATH if dark else LIGHT_STYLE_PATH) + \
+            CUSTOM_STYLES % {'text': 'white' if dark else 'black'}
+        self.icons = {}
+
+    def icon(self, name):
+        icon = self.icons.get(name)
+        if icon is None:
+            if self.dark and name not in THEMED_ICONS:
+                icon = theme(False).icon(name)  # Share the light icon and its pixmap cache
+            else:
+                icon = QIcon(f':/icons/{name}{"_dark" if self.dark else ""}.png')
+            self.icons[name] = icon
+        return icon
+
+
+def theme(dark=False):
+    """The light or dark theme, built on first use."""
+    found = _themes.get(dark)
+    if found is None:
+        found = _themes[dark] = Theme(dark)
+    return found
@@ -0,0 +1,35 @@
+class ToolbarState:
+    """Keeps the formatting buttons in step with the text at the cursor.
+
+    The action -> button mapping is looked up once, and apply() only touches
+    the actions whose state actually changed. Active buttons are marked with
+    the "active" dynamic property and styled by the shared stylesheet, so no
+    per-widget stylesheet is ever set.
+    """
+
+    def __init__(self, toolbar, actions):
+        self.buttons = {action: toolbar.widgetForAction(action) for action in actions}
+        self.state = {}
+
+    def apply(self, states):
+        """Apply a {action: is_active} mapping, skipping unchanged actions."""
+        for action, is_active in states.items():
+            if action.isChecked() != is_active:
+                action.setChecked(is_active)
+            if self.state.get(action) == is_active:
+                continue
+            self.state[action] = is_active
+            button = self.buttons.get(action)
+            if button is not None:
+                button.setProperty('active', is_active)
+                # Dynamic properties are only picked up by selectors on a re-polish
+                style = button.style()
+                style.unpolish(button)
+                style.polish(button)
+
+    def repolish(self):
+        """Restyle every button, e.g. after the stylesheet has been swapped."""
+        for button in self.buttons.values():
+            if button is not None:
+                button.style().unpolish(button)
+                button.style().polish(button)
@@ -1,40 +1,420 @@
-from PyQt5.QtWidgets import QGraphicsView, QTextEdit, QGraphicsScene
-from PyQt5.QtGui import QFont, QTransform, QWheelEvent
-from PyQt5.QtCore import Qt, pyqtSignal
-from constants import DEFAULT_FONT, DEFAULT_FONT_SIZE
+import math
+from collections import OrderedDict
+from PyQt5 import sip
+from PyQt5.QtWidgets import QGraphicsView, QTextEdit, QGraphicsScene, QGraphicsItem, QFrame
+from PyQt5.QtGui import (
+    QTransform, QWheelEvent, QPixmap, QPainter, QPalette, QColor, QImage,
+    QCursor, QAbstractTextDocumentLayout, QKeySequence
+)
+from PyQt5.QtCore import Qt, pyqtSignal, QEvent, QObject, QRectF, QSizeF, QSize, QTimer, QPointF
+from constants import DEFAULT_FONT, DEFAULT_FONT_SIZE, PAGE_WIDTH, PAGE_HEIGHT, PAGE_MARGIN, PAGE_GAP, USE_DOCUMENT_MODEL
+from document_model import DocumentModel
+from formats import font
+from images import install_handler
+from instrumentation import Span, timed
+
+MAX_CACHE_SCALE = 2.0  # Above this, pages are painted directly instead of cached
+ZOOM_DELAY = 80  # ms without further zoom steps before the document is relaid out
+PAGE_CACHE_BUDGET = 128 << 20  # bytes of page pixmaps a view keeps, about 14 A4 pages at 100%
+RELAYOUT_SETTLE = 250  # ms without a layout step before a relayout counts as done
+
+
+class RelayoutTiming(QObject):
+    """Records a relayout from the page size being set until the layout's last step.
+
+    Setting the page size only starts the layout, which goes on in steps on
+    a timer and reports the size now and then. As an event filter on the
+    layout it sees every step; the relayout is over once the layout has
+    been quiet for RELAYOUT_SETTLE.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.span = Span('PageTextEdit.relayout', 'relayout')
+        self.timer = QTimer(self, singleShot=True, interval=RELAYOUT_SETTLE)
+        self.timer.timeout.connect(self.span.finish)
+
+    def begin(self):
+        self.span.begin()
+        self.progressed()
+
+    def progressed(self):
+        if self.span.start is not None:
+            self.span.extend()
+            self.timer.start()
+
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Timer:
+            self.progressed()
+        return False
+
+
+class PageTextEdit(QTextEdit):
+    """The editing surface: exactly one page in size, scrolled to the active page.
+
+    The document is laid out with a page height, so QTextDocument paginates it
+    and page N occupies [N * pageHeight, (N + 1) * pageHeight) in document
+    coordinates. Zooming lays the document out again for a paint device with
+    a scaled DPI, so text is always rendered at its final size.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setFrameShape(QFrame.NoFrame)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.scale = 1.0
+        self.device = None
+        self.pageWidth = PAGE_WIDTH
+        self.pageHeight = PAGE_HEIGHT
+        self.relayout = RelayoutTiming(self)
+        self.setFixedSize(PAGE_WIDTH, PAGE_HEIGHT)
+        # Keeps the undo history instead of the document when set; see ZoomableTextEdit.connectDocument
+        self.model = None
+
+    def setScale(self, scale):
+        self.scale = scale
+        self.pageWidth = round(PAGE_WIDTH * scale)
+        self.pageHeight = round(PAGE_HEIGHT * scale)
+        if scale == 1.0:
+            device = None
+        else:
+            # The layout converts point sizes (and frame margins) with this
+            # device's DPI; the image itself is never painted on
+            dots_per_meter = round(self.logicalDpiY() * scale / 0.0254)
+            device = QImage(1, 1, QImage.Format_ARGB32)
+            device.setDotsPerMeterX(dots_per_meter)
+            device.setDotsPerMeterY(dots_per_meter)
+        # The layout only keeps a pointer, so switch it over before the old device goes
+        self.document().documentLayout().setPaintDevice(device)
+        self.device = device
+        self.setFixedSize(self.pageWidth, self.pageHeight)
+        self.applyPageSize()
+
+    def applyPageSize(self):
+        # QTextEdit resets the page size to (width, unlimited) whenever it relays out
+        self.relayout.begin()
+        document = self.document()
+        document.documentLayout().setPaintDevice(self.device)
+        if document.documentMargin() != PAGE_MARGIN:
+            # The margin lives in the root frame's format, so setting it counts as an edit
+            modified = document.isModified()
+            document.setDocumentMargin(PAGE_MARGIN)
+            document.setModified(modified)
+        document.setPageSize(QSizeF(self.pageWidth, self.pageHeight))
+        self.relayout.progressed()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.applyPageSize()
+
+    def wheelEvent(self, event):
+        # Let the page view scroll between pages instead of scrolling inside one
+        event.ignore()
+
+    @timed('PageTextEdit.keyPressEvent', 'input')
+    def keyPressEvent(self, event):
+        # QTextEdit handles these keys itself and would go to the document's (disabled) stack
+        if self.hasModelHistory() and event.matches(QKeySequence.Undo):
+            self.undo()
+        elif self.hasModelHistory() and event.matches(QKeySequence.Redo):
+            self.redo()
+        else:
+            super().keyPressEvent(event)
+
+    @timed('PageTextEdit.paintEvent', 'paint')
+    def paintEvent(self, event):
+        super().paintEvent(event)
+
+    def hasModelHistory(self):
+        return self.model is not None and self.model.isAvailable()
+
+    def undo(self):
+        if self.hasModelHistory():
+            self.restoreCursor(self.model.undo())
+        else:
+            super().undo()
+
+    def redo(self):
+        if self.hasModelHistory():
+            self.restoreCursor(self.model.redo())
+        else:
+            super().redo()
+
+    def restoreCursor(self, position):
+        if position is not None:
+            cursor = self.textCursor()
+            cursor.setPosition(min(position, self.document().characterCount() - 1))
+            self.setTextCursor(cursor)
+
+
+class PageCache:
+    """Pixmaps of a view's inactive pages, least recently painted first out and bounded in bytes."""
+
+    def __init__(self, budget=PAGE_CACHE_BUDGET):
+        self.budget = budget
+        self.used = 0
+        self.pixmaps = OrderedDict()  # PageItem -> QPixmap
+
+    @staticmethod
+    def size(pixmap):
+        return pixmap.width() * pixmap.height() * pixmap.depth() // 8
+
+    def get(self, page):
+        pixmap = self.pixmaps.get(page)
+        if pixmap is not None:
+            self.pixmaps.move_to_end(page)
+        return pixmap
+
+    def put(self, page, pixmap):
+        self.discard(page)
+        self.pixmaps[page] = pixmap
+        self.used += self.size(pixmap)
+        while self.used > self.budget and len(self.pixmaps) > 1:
+            _, dropped = self.pixmaps.popitem(last=False)
+            self.used -= self.size(dropped)
+
+    def discard(self, page):
+        pixmap = self.pixmaps.pop(page, None)
+        if pixmap is not None:
+            self.used -= self.size(pixmap)
+
+    def clear(self):
+        self.pixmaps.clear()
+        self.used = 0
+
+
+class PageItem(QGraphicsItem):
+    """One page of the document in the scene.
+
+    Inactive pages are painted from a pixmap of the document layout, kept in
+    the view's PageCache and dropped when the layout reports a change inside
+    the page.
+    """
+
+    def __init__(self, view, index):
+        super().__init__()
+        self.view = view
+        self.index = index
+        self.cacheScale = None
+        self.setPos(view.pagePosition(index))
+        self.setFlag(QGraphicsItem.ItemUsesExtendedStyleOption)
+
+    def boundingRect(self):
+        return QRectF(0, 0, self.view.textEdit.pageWidth, self.view.textEdit.pageHeight)
+
+    def invalidate(self):
+        self.view.pageCache.discard(self)
+        self.update()
+
+    def paintContents(self, painter, clip):
+        palette = self.view.textEdit.palette()
+        offset = self.index * self.view.textEdit.pageHeight
+        painter.translate(0, -offset)
+        context = QAbstractTextDocumentLayout.PaintContext()
+        context.palette = palette
+        context.clip = clip.translated(0, offset)
+        context.selections = self.view.layoutSelections
+        self.view.document().documentLayout().draw(painter, context)
+
+    def renderCache(self, scale):
+        rect = self.boundingRect()
+        size = QSize(math.ceil(rect.width() * scale), math.ceil(rect.height() * scale))
+        pixmap = QPixmap(size)
+        pixmap.fill(self.view.textEdit.palette().color(QPalette.Base))
+        painter = QPainter(pixmap)
+        painter.setRenderHints(QPainter.Antialiasing | QPainter.TextAntialiasing)
+        painter.scale(scale, scale)
+        self.paintContents(painter, self.boundingRect())
+        painter.end()
+        return pixmap
+
+    @timed('PageItem.paint', 'paint')
+    def paint(self, painter, option, widget=None):
+        rect = self.boundingRect()
+        if self.index != self.view.activePage:
+            scale = painter.worldTransform().m11()
+            if widget is not None:
+                scale *= widget.devicePixelRatioF()
+            if scale * self.view.textEdit.scale > MAX_CACHE_SCALE:
+                painter.fillRect(option.exposedRect, self.view.textEdit.palette().color(QPalette.Base))
+                painter.save()
+                painter.setClipRect(option.exposedRect)
+                self.paintContents(painter, option.exposedRect)
+                painter.restore()
+            else:
+                # While a zoom is pending, stretch the old pixmap rather than
+                # rendering one per zoom step
+                cache = self.view.pageCache.get(self)
+                if cache is None or (self.cacheScale != scale and not self.view.zoomTimer.isActive()):
+                    cache = self.renderCache(scale)
+                    self.cacheScale = scale
+                    self.view.pageCache.put(self, cache)
+                painter.drawPixmap(rect, cache, QRectF(cache.rect()))
+        # The active page is covered by the editing widget; just frame it
+        painter.setPen(QColor('#ccc'))
+        painter.drawRect(rect)
+
+    def mousePressEvent(self, event):
+        self.view.showPage(self.index)
+        self.view.placeCursorAt(event.pos())
+        event.accept()
+
 
 class ZoomableTextEdit(QGraphicsView):
     zoomChanged = pyqtSignal(int)
+    documentChanged = pyqtSignal(object)
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.textEdit = QTextEdit()
-        self.textEdit.setFont(QFont(DEFAULT_FONT, DEFAULT_FONT_SIZE))
-        self.textEdit.setFixedSize(1240, 1754)  # A4 size at 96 DPI
-        
-        self.textEdit.setStyleSheet("""
-            QTextEdit {
-                padding: 50px;
-                margin: 20px;
-                border: 1px solid #ccc;
-                border-radius: 5px;
-            }
-        """)
-        
+        self.textEdit = PageTextEdit()
+        self.textEdit.setFont(font(DEFAULT_FONT, DEFAULT_FONT_SIZE))
+
         self.scene = QGraphicsScene(self)
         self.setScene(self.scene)
-        self.scene.addWidget(self.textEdit)
-        
+        self.proxy = self.scene.addWidget(self.textEdit)
+        self.proxy.setZValue(1)
+
+        self.pages = []
+        self.pageCache = PageCache()
+        self.activePage = 0
+        self.layoutSelections = []
+        self.pageLayout = None
+        self.zoomTimer = QTimer(self)
+        self.zoomTimer.setSingleShot(True)
+        self.zoomTimer.setInterval(ZOOM_DELAY)
+        self.zoomTimer.timeout.connect(self.applyZoom)
+        self.textEdit.cursorPositionChanged.connect(self.followCursor)
+        self.textEdit.verticalScrollBar().valueChanged.connect(self.scheduleSnap)
+        self.connectDocument()
+
         self.zoomFactor = 100
         self.zoomStep = 5
         self.maxZoom = 1000  # 1000%
-        
+
         self.setTransformationAnchor(QGraphicsView.AnchorUnderMouse)
         self.setResizeAnchor(QGraphicsView.AnchorUnderMouse)
         self.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         self.setFrameShape(QGraphicsView.NoFrame)
 
+    def connectDocument(self):
+        self.textEdit.applyPageSize()
+        if USE_DOCUMENT_MODEL:
+            document = self.textEdit.document()
+            # The model is a child of its document, so the history stays with the
+            # document while another one is in the view
+            model = document.findChild(DocumentModel)
+            if model is None:
+                model = DocumentModel(document)
+                model.setDocument(document)
+            self.textEdit.model = model
+        if self.pageLayout is not None and not sip.isdeleted(self.pageLayout):
+            self.pageLayout.setPaintDevice(None)
+            self.pageLayout.documentSizeChanged.disconnect(self.documentSizeChanged)
+            self.pageLayout.update.disconnect(self.invalidatePages)
+            self.pageLayout.removeEventFilter(self.textEdit.relayout)
+        layout = self.pageLayout = self.textEdit.document().documentLayout()
+        layout.installEventFilter(self.textEdit.relayout)
+        install_handler(layout)
+        layout.documentSizeChanged.connect(self.documentSizeChanged)
+        layout.update.connect(self.invalidatePages)
+        # The layout goes on in steps on a timer and reports the size as it grows;
+        # asking for documentSize() here would lay out the whole document first
+        self.setPageCount(1)
+        self.invalidatePages()
+        self.showPage(0)
+
+    def pagePosition(self, index):
+        return QPointF(0, index * (self.textEdit.pageHeight + PAGE_GAP))
+
+    @timed('ZoomableTextEdit.documentSizeChanged', 'layout')
+    def documentSizeChanged(self, size):
+        self.setPageCount(math.ceil(size.height() / self.textEdit.pageHeight))
+        self.textEdit.relayout.progressed()
+
+    def setPageCount(self, count):
+        count = max(count, 1)
+        while len(self.pages) < count:
+            page = PageItem(self, len(self.pages))
+            self.scene.addItem(page)
+            self.pages.append(page)
+        while len(self.pages) > count:
+            page = self.pages.pop()
+            self.pageCache.discard(page)
+            self.scene.removeItem(page)
+        self.scene.setSceneRect(0, 0, self.textEdit.pageWidth, self.pagePosition(count).y() - PAGE_GAP)
+        if self.activePage >= count:
+            self.showPage(count - 1)
+
+    def invalidatePages(self, rect=None):
+        if rect is None or rect.isNull():
+            first, last = 0, len(self.pages) - 1
+        else:
+            pageHeight = self.textEdit.pageHeight
+            first = max(int(rect.top() // pageHeight), 0)
+            last = min(int(rect.bottom() // pageHeight), len(self.pages) - 1)
+        for page in self.pages[first:last + 1]:
+            page.invalidate()
+
+    def showPage(self, index):
+        """Move the editing widget over page index and scroll it to that page."""
+        if index >= len(self.pages):
+            # Past the part laid out so far; pageCount() finishes the layout
+            self.setPageCount(self.pageLayout.pageCount())
+        index = max(min(index, len(self.pages) - 1), 0)
+        if index != self.activePage and self.activePage < len(self.pages):
+            self.pages[self.activePage].update()
+        self.activePage = index
+        self.proxy.setPos(self.pagePosition(index))
+        offset = index * self.textEdit.pageHeight
+        scrollBar = self.textEdit.verticalScrollBar()
+        # QTextEdit only catches its scroll range up with the layout later on
+        scrollBar.setMaximum(max(scrollBar.maximum(), offset))
+        scrollBar.setValue(offset)
+
+    def visibleRange(self):
+        """(first, last) document positions of the text in the viewport, to the nearest line."""
+        rect = self.mapToScene(self.viewport().rect()).boundingRect()
+        pageHeight = self.textEdit.pageHeight
+        step = pageHeight + PAGE_GAP
+        first = max(int(rect.top() // step), 0)
+        last = max(int(rect.bottom() // step), first)
+        # Scene y to document y: pages sit PAGE_GAP apart in the scene but touch in the document
+        top = first * pageHeight + min(max(rect.top() - first * step, 0), pageHeight)
+        bottom = last * pageHeight + min(max(rect.bottom() - last * step, 0), pageHeight)
+        start = self.pageLayout.hitTest(QPointF(0, top), Qt.FuzzyHit)
+        end = self.pageLayout.hitTest(QPointF(self.textEdit.pageWidth, bottom), Qt.FuzzyHit)
+        lastPosition = self.document().characterCount() - 1
+        return max(start, 0), lastPosition if end < 0 else end
+
+    def cursorPage(self):
+        rect = self.textEdit.cursorRect()
+        y = rect.center().y() + self.textEdit.verticalScrollBar().value()
+        return int(y // self.textEdit.pageHeight)
+
+    def followCursor(self):
+        page = self.cursorPage()
+        if page != self.activePage or self.textEdit.verticalScrollBar().value() != page * self.textEdit.pageHeight:
+            self.showPage(page)
+        self.ensureVisible(self.proxy.mapRectToScene(QRectF(self.textEdit.cursorRect())), 0, 50)
+
+    def scheduleSnap(self, value):
+        # QTextEdit scrolls itself to keep the cursor visible; bring it back to
+        # a page boundary once it's done
+        if value != self.activePage * self.textEdit.pageHeight:
+            QTimer.singleShot(0, self.followCursor)
+
+    def placeCursorAt(self, pos):
+        self.textEdit.setTextCursor(self.textEdit.cursorForPosition(pos.toPoint()))
+        self.textEdit.setFocus()
+        self.scene.setFocusItem(self.proxy)
+
+    @timed('frame', 'frame')
+    def paintEvent(self, event):
+        # Everything in the view, pages and editing widget alike, is painted in here
+        super().paintEvent(event)
+
     def wheelEvent(self, event: QWheelEvent):
         if event.modifiers() & Qt.ControlModifier:
             if event.angleDelta().y() > 0:
@@ -51,12 +431,49 @@ class ZoomableTextEdit(QGraphicsView):
     def zoomOut(self):
         self.zoom(self.zoomFactor - self.zoomStep)
 
+    @timed('ZoomableTextEdit.zoom', 'zoom')
     def zoom(self, factor: int):
         self.zoomFactor = max(min(factor, self.maxZoom), self.zoomStep)
-        scaleFactor = self.zoomFactor / 100.0
-        self.setTransform(QTransform().scale(scaleFactor, scaleFactor))
+        # Preview the step by scaling what's already laid out, and relayout
+        # once the steps stop coming
+        previewScale = self.zoomFactor / 100.0 / self.textEdit.scale
+        self.setTransform(QTransform().scale(previewScale, previewScale))
+        self.zoomTimer.start()
         self.zoomChanged.emit(self.zoomFactor)
-    
+
+    @timed('ZoomableTextEdit.applyZoom', 'zoom')
+    def applyZoom(self):
+        """Lay the document out again at the current zoom factor."""
+        scale = self.zoomFactor / 100.0
+        if scale == self.textEdit.scale:
+            return
+        viewportRect = self.viewport().rect()
+        anchor = self.viewport().mapFromGlobal(QCursor.pos())
+        if not viewportRect.contains(anchor):
+            anchor = viewportRect.center()
+        sceneRect = self.scene.sceneRect()
+        scenePoint = self.mapToScene(anchor)
+        fx = scenePoint.x() / sceneRect.width()
+        fy = scenePoint.y() / sceneRect.height()
+
+        for page in self.pages:
+            self.scene.removeItem(page)
+        self.pages = []
+        self.pageCache.clear()
+        self.textEdit.setScale(scale)
+        size = QSizeF(self.textEdit.size())
+        self.proxy.setMinimumSize(size)
+        self.proxy.setMaximumSize(size)
+        self.proxy.resize(size)
+        self.resetTransform()
+        self.documentSizeChanged(self.pageLayout.documentSize())
+        self.showPage(self.cursorPage())
+
+        # Keep the point that was under the mouse where it was
+        sceneRect = self.scene.sceneRect()
+        target = QPointF(fx * sceneRect.width(), fy * sceneRect.height())
+        self.centerOn(target + QPointF(viewportRect.center() - anchor))
+
     def setZoomFactor(self, factor):
         self.zoom(factor)
 
@@ -65,6 +482,25 @@ class ZoomableTextEdit(QGraphicsView):
 
     def setDocument(self, document):
         self.textEdit.setDocument(document)
+        self.connectDocument()
+        self.documentChanged.emit(document)
+
+    def setExtraSelections(self, selections):
+        """Show selections on the editing widget and on the cached pages alike."""
+        self.textEdit.setExtraSelections(selections)
+        self.layoutSelections = []
+        for selection in selections:
+            layoutSelection = QAbstractTextDocumentLayout.Selection()
+            layoutSelection.cursor = selection.cursor
+            layoutSelection.format = selection.format
+            self.layoutSelections.append(layoutSelection)
+        self.invalidatePages()
+
+    def snapshot(self):
+        """Copy of the document with the 100% page size, for saving and exporting."""
+        document = self.document().clone()
+        document.setPageSize(QSizeF(PAGE_WIDTH, PAGE_HEIGHT))
+        return document
 
     # Proxy methods for QTextEdit functionality
     def setFont(self, font):
@@ -104,4 +540,4 @@ class ZoomableTextEdit(QGraphicsView):
         return self.textEdit.toPlainText()
 
     def print_(self, printer):
-        self.textEdit.print_(printer)
\ No newline at end of file
+        self.textEdit.print_(printer)